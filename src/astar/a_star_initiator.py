@@ -13,12 +13,17 @@
 # ==================================================================================================================== #
 
 import math
+import json
+import time
+import tracemalloc
 
 from astar.a_star import astar_start
+from astar.a_star_stats import AstarStats, AstarLimits
 from traces.generate_astar_path_traces import segment_path
 from circuit.circuit_components import CircuitCell, Pin, Capacitor
 from logger.logger import get_a_logger
-import tomllib
+from config.config_loader import get_config
+from instrumentation.instrumentation import timer, count
 import re
 from copy import deepcopy
 from grid.generate_grid import get_obj_id_and_types, check_ignorable_port
@@ -31,11 +36,18 @@ class AstarInitiator:
     def __init__(self, components, grid, connections, scaled_port_coordinates, port_coordinates, net_list,
                  routing_parameters, component_ports):
 
-        self.config = self.__load_config()
+        self.config = get_config()
         self.RUN_MULTIPLE_ASTAR = self.config["a_star_initiator"]["RUN_MULTIPLE_ASTAR"]
         self.CUSTOM_NET_ORDER = self.config["a_star_initiator"]["CUSTOM_NET_ORDER"]
         self.TSP_NODE_ORDER = self.config["a_star_initiator"]["TSP_NODE_ORDER"]
         self.REMOVE_LOOPS = self.config["a_star_initiator"]["REMOVE_LOOPS"]
+        self.SAVE_STATS = self.config["a_star_initiator"]["SAVE_STATS"]
+        self.STATS_FILE = self.config["a_star_initiator"]["STATS_FILE"]
+        self.STATS_TRACE_MEMORY = self.config["a_star_initiator"]["STATS_TRACE_MEMORY"]
+        self.MAX_EXPANSIONS = self.config["a_star_initiator"]["MAX_EXPANSIONS"]
+        self.MAX_OPEN_SET = self.config["a_star_initiator"]["MAX_OPEN_SET"]
+        self.MAX_SECONDS_PER_NET = self.config["a_star_initiator"]["MAX_SECONDS_PER_NET"]
+        self.LIMIT_FALLBACK_RETRIES = self.config["a_star_initiator"]["LIMIT_FALLBACK_RETRIES"]
         self.component_ports = component_ports
         self.routing_parameters = routing_parameters
         self.components = components
@@ -50,17 +62,11 @@ class AstarInitiator:
         self.path = {}
         self.seg_list = {}
         self.special_goals = []
+        self.stats = {}
 
         if self.CUSTOM_NET_ORDER:
             self.NET_ORDER = self.config["a_star_initiator"]["custom_net_order"][self.components[0].cell]
 
-    def __load_config(self, path="pyproject.toml"):
-        try:
-            with open(path, "rb") as f:
-                return tomllib.load(f)
-        except (FileNotFoundError, tomllib.TOMLDecodeError) as e:
-            self.logger.error(f"Error loading config: {e}")
-
     def __extract_goal_nodes(self, connection_list, net):
         self.goal_nodes = []
         self.real_goal_nodes = []
@@ -209,7 +215,7 @@ class AstarInitiator:
                             if y + i < len(self.grid_horizontal)-1 and x + p < len(self.grid_horizontal[0])-1:
                                 self.grid_horizontal[y + i][x + p] = self.TRACE_ON_GRID
 
-    def __run_multiple_astar_multiple_times(self, net):
+    def __run_multiple_astar_multiple_times(self, net, stats, minimum_segment_length, limits):
 
         best_path = None
         best_length = float('inf')
@@ -219,9 +225,10 @@ class AstarInitiator:
             self.logger.info(f"Running A* multiple times for net: {net}")
             for start in self.goal_nodes:
                 self.logger.info(f"Starting A* with start node: {start}")
+                count("astar.runs")
                 path, length = astar_start(self.grid_vertical, self.grid_horizontal, start, self.goal_nodes,
-                                           self.routing_parameters.minimum_segment_length, self.TSP_NODE_ORDER,
-                                           self.routing_parameters.trace_width_scaled)
+                                           minimum_segment_length, self.TSP_NODE_ORDER,
+                                           self.routing_parameters.trace_width_scaled, stats, limits)
                 self.logger.info(f"Finished running A* with start node: {start}")
 
                 if path is not None and length < best_length:
@@ -234,9 +241,10 @@ class AstarInitiator:
             self.logger.info(f"Running A* for net: {net}")
             for start in self.goal_nodes:
 
+                count("astar.runs")
                 path, _ = astar_start(self.grid_vertical, self.grid_horizontal, start, self.goal_nodes,
-                                      self.routing_parameters.minimum_segment_length, self.TSP_NODE_ORDER,
-                                      self.routing_parameters.trace_width_scaled)
+                                      minimum_segment_length, self.TSP_NODE_ORDER,
+                                      self.routing_parameters.trace_width_scaled, stats, limits)
 
                 if path:
                     break
@@ -250,6 +258,72 @@ class AstarInitiator:
 
             return path
 
+    def __run_astar_with_fallback(self, net, stats):
+        """Routes a net, retrying with a halved minimum segment length when a search limit was reached. A shorter
+        minimum segment length gives A* fewer states to tell apart, so the retry is both cheaper and more likely to
+        find a path. The deadline is set once and covers the retries too, so a net out of time is not retried"""
+        minimum_segment_length = self.routing_parameters.minimum_segment_length
+        limits = AstarLimits(max_expansions=self.MAX_EXPANSIONS, max_open_set=self.MAX_OPEN_SET,
+                             deadline=time.perf_counter() + self.MAX_SECONDS_PER_NET if self.MAX_SECONDS_PER_NET else 0)
+
+        for retry in range(self.LIMIT_FALLBACK_RETRIES + 1):
+            limits_reached = stats.limits_reached
+            path = self.__run_multiple_astar_multiple_times(net=net, stats=stats,
+                                                            minimum_segment_length=minimum_segment_length,
+                                                            limits=limits)
+            stats.minimum_segment_length = minimum_segment_length
+
+            if path or stats.limits_reached == limits_reached or minimum_segment_length <= 1:
+                break
+
+            if limits.deadline and time.perf_counter() > limits.deadline:
+                self.logger.warning(f"A* of net '{net}' ran out of time and is not retried")
+                break
+
+            if retry < self.LIMIT_FALLBACK_RETRIES:
+                minimum_segment_length = max(1, minimum_segment_length // 2)
+                self.logger.warning(f"A* of net '{net}' reached the {stats.limit} limit. Retrying with minimum "
+                                    f"segment length {minimum_segment_length}")
+        return path
+
+    def __run_astar_with_stats(self, net):
+        stats = AstarStats(net=net)
+
+        # Tracing every allocation slows A* down, so it is only done when asked for
+        if self.STATS_TRACE_MEMORY:
+            tracemalloc.start()
+        try:
+            path = self.__run_astar_with_fallback(net=net, stats=stats)
+        finally:
+            if self.STATS_TRACE_MEMORY:
+                stats.set_traced_memory(peak_memory=tracemalloc.get_traced_memory()[1])
+                tracemalloc.stop()
+
+        stats.routed = bool(path)
+        stats.relaxed = stats.routed and stats.minimum_segment_length < self.routing_parameters.minimum_segment_length
+        self.stats[net] = stats
+        count("astar.expansions", stats.nodes_expanded)
+
+        if stats.relaxed:
+            self.logger.warning(f"{stats.summary()} | Relaxed minimum segment length: "
+                                f"{stats.minimum_segment_length} < {self.routing_parameters.minimum_segment_length}")
+        elif stats.routed:
+            self.logger.info(stats.summary())
+        else:
+            self.logger.warning(stats.summary())
+        return path
+
+    def __save_stats(self):
+        cell = self.components[0].cell
+        file_name = self.STATS_FILE.format(cell=cell)
+        try:
+            with open(file_name, "w") as file:
+                json.dump({"cell": cell, "nets": {net: stats.to_dict() for net, stats in self.stats.items()}},
+                          file, indent=4)
+            self.logger.info(f"A* stats of {len(self.stats)} nets saved to '{file_name}'")
+        except OSError as e:
+            self.logger.error(f"Could not save A* stats '{file_name}': {e}")
+
     @staticmethod
     def __check_vdd_vss(net):
         return re.search(".*VSS.*", net, re.IGNORECASE) or re.search(".*VDD.*", net, re.IGNORECASE)
@@ -275,7 +349,8 @@ class AstarInitiator:
             self.__lock_or_unlock_port(lock=0)
 
             if len(self.goal_nodes) > 1:
-                p = self.__run_multiple_astar_multiple_times(net=net)
+                with timer("astar net", net=net):
+                    p = self.__run_astar_with_stats(net=net)
             elif len(self.goal_nodes) == 0:
                 self.logger.error(f"No goal nodes found in net: {net}")
                 p = []
@@ -285,6 +360,8 @@ class AstarInitiator:
 
             self.path.setdefault(net, {})["goal_nodes"] = self.goal_nodes
             self.path.setdefault(net, {})["real_goal_nodes"] = self.real_goal_nodes
+            self.path.setdefault(net, {})["relaxed_minimum_segment_length"] = (
+                self.stats[net].minimum_segment_length if net in self.stats and self.stats[net].relaxed else 0)
             # Make goal nodes non-walkable
             self.__lock_or_unlock_port(lock=1)
             if self.REMOVE_LOOPS:
@@ -295,6 +372,9 @@ class AstarInitiator:
 
             self.__update_grid(net=net)
 
+        if self.SAVE_STATS and self.stats:
+            self.__save_stats()
+
         self.logger.info("Finished A*")
 
     def get(self):
@@ -1496,8 +1496,22 @@ static const char *__pyx_f[] = {
 struct __pyx_obj_6a_star_PriorityQueue;
 struct __pyx_obj_6a_star___pyx_scope_struct____pyx_f_6a_star__heuristic;
 struct __pyx_obj_6a_star___pyx_scope_struct_1_genexpr;
+struct __pyx_opt_args_6a_star_a_star;
 
-/* "a_star.pyx":11
+/* "a_star.pyx":194
+ *     return path, cost
+ * 
+ * cdef a_star(grid_vertical, grid_horizontal, start, goal_nodes, minimum_segment_length, stats=None, limits=None):             # <<<<<<<<<<<<<<
+ * 
+ *     #Parameters
+ */
+struct __pyx_opt_args_6a_star_a_star {
+  int __pyx_n;
+  PyObject *stats;
+  PyObject *limits;
+};
+
+/* "a_star.pyx":15
  * 
  * 
  * cdef class PriorityQueue:             # <<<<<<<<<<<<<<
@@ -1511,7 +1525,7 @@ struct __pyx_obj_6a_star_PriorityQueue {
 };
 
 
-/* "a_star.pyx":321
+/* "a_star.pyx":420
  * 
  * 
  * cdef _heuristic(current, mask, goals):             # <<<<<<<<<<<<<<
@@ -1524,7 +1538,7 @@ struct __pyx_obj_6a_star___pyx_scope_struct____pyx_f_6a_star__heuristic {
 };
 
 
-/* "a_star.pyx":327
+/* "a_star.pyx":426
  *         return 0
  * 
  *     return min(_manhattan(current, goal) for goal in unvisited)             # <<<<<<<<<<<<<<
@@ -1542,7 +1556,7 @@ struct __pyx_obj_6a_star___pyx_scope_struct_1_genexpr {
 
 
 
-/* "a_star.pyx":11
+/* "a_star.pyx":15
  * 
  * 
  * cdef class PriorityQueue:             # <<<<<<<<<<<<<<
@@ -1552,6 +1566,7 @@ struct __pyx_obj_6a_star___pyx_scope_struct_1_genexpr {
 
 struct __pyx_vtabstruct_6a_star_PriorityQueue {
   int (*is_empty)(struct __pyx_obj_6a_star_PriorityQueue *);
+  int (*size)(struct __pyx_obj_6a_star_PriorityQueue *);
   void (*push)(struct __pyx_obj_6a_star_PriorityQueue *, PyObject *, double);
   PyObject *(*pop)(struct __pyx_obj_6a_star_PriorityQueue *);
   void (*_sift_up)(struct __pyx_obj_6a_star_PriorityQueue *, int);
@@ -2556,6 +2571,12 @@ static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value);
 /* CIntToPy.proto */
 static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value);
 
+/* CIntFromPy.proto */
+static CYTHON_INLINE PY_LONG_LONG __Pyx_PyInt_As_PY_LONG_LONG(PyObject *);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_PY_LONG_LONG(PY_LONG_LONG value);
+
 /* FormatTypeName.proto */
 #if CYTHON_COMPILING_IN_LIMITED_API
 typedef PyObject *__Pyx_TypeName;
@@ -2704,6 +2725,7 @@ static int __Pyx_InitStrings(__Pyx_StringTabEntry *t);
 
 /* #### Code section: module_declarations ### */
 static int __pyx_f_6a_star_13PriorityQueue_is_empty(struct __pyx_obj_6a_star_PriorityQueue *__pyx_v_self); /* proto*/
+static int __pyx_f_6a_star_13PriorityQueue_size(struct __pyx_obj_6a_star_PriorityQueue *__pyx_v_self); /* proto*/
 static void __pyx_f_6a_star_13PriorityQueue_push(struct __pyx_obj_6a_star_PriorityQueue *__pyx_v_self, PyObject *__pyx_v_item, double __pyx_v_priority); /* proto*/
 static PyObject *__pyx_f_6a_star_13PriorityQueue_pop(struct __pyx_obj_6a_star_PriorityQueue *__pyx_v_self); /* proto*/
 static void __pyx_f_6a_star_13PriorityQueue__sift_up(struct __pyx_obj_6a_star_PriorityQueue *__pyx_v_self, int __pyx_v_idx); /* proto*/
@@ -2714,7 +2736,8 @@ static PyObject *__pyx_f_6a_star_tsp_ordering(PyObject *); /*proto*/
 static PyObject *__pyx_f_6a_star_in_bounds(PyObject *, PyObject *, PyObject *); /*proto*/
 static PyObject *__pyx_f_6a_star_is_walkable(PyObject *, PyObject *, PyObject *, PyObject *); /*proto*/
 static PyObject *__pyx_f_6a_star_cap_seg(PyObject *, PyObject *); /*proto*/
-static PyObject *__pyx_f_6a_star_a_star(PyObject *, PyObject *, PyObject *, PyObject *, PyObject *); /*proto*/
+static PyObject *__pyx_f_6a_star_a_star(PyObject *, PyObject *, PyObject *, PyObject *, PyObject *, struct __pyx_opt_args_6a_star_a_star *__pyx_optional_args); /*proto*/
+static PyObject *__pyx_f_6a_star_blocked_ports(PyObject *, PyObject *, PyObject *, PyObject *, PyObject *, PyObject *); /*proto*/
 static PyObject *__pyx_f_6a_star__manhattan(PyObject *, PyObject *); /*proto*/
 static PyObject *__pyx_f_6a_star__heuristic(PyObject *, PyObject *, PyObject *); /*proto*/
 static PyObject *__pyx_f_6a_star_direction(PyObject *, PyObject *); /*proto*/
@@ -2757,22 +2780,28 @@ static const char __pyx_k_self[] = "self";
 static const char __pyx_k_send[] = "send";
 static const char __pyx_k_spec[] = "__spec__";
 static const char __pyx_k_test[] = "__test__";
+static const char __pyx_k_time[] = "time";
 static const char __pyx_k_close[] = "close";
+static const char __pyx_k_limit[] = "limit";
 static const char __pyx_k_order[] = "order";
 static const char __pyx_k_range[] = "range";
 static const char __pyx_k_start[] = "start";
 static const char __pyx_k_state[] = "state";
+static const char __pyx_k_stats[] = "stats";
 static const char __pyx_k_throw[] = "throw";
 static const char __pyx_k_a_star[] = "a_star";
 static const char __pyx_k_dict_2[] = "_dict";
 static const char __pyx_k_enable[] = "enable";
 static const char __pyx_k_extend[] = "extend";
 static const char __pyx_k_import[] = "__import__";
+static const char __pyx_k_limits[] = "limits";
 static const char __pyx_k_pickle[] = "pickle";
 static const char __pyx_k_reduce[] = "__reduce__";
 static const char __pyx_k_update[] = "update";
 static const char __pyx_k_disable[] = "disable";
 static const char __pyx_k_genexpr[] = "genexpr";
+static const char __pyx_k_seconds[] = "seconds";
+static const char __pyx_k_deadline[] = "deadline";
 static const char __pyx_k_getstate[] = "__getstate__";
 static const char __pyx_k_pyx_type[] = "__pyx_type";
 static const char __pyx_k_segments[] = "segments";
@@ -2783,33 +2812,53 @@ static const char __pyx_k_itertools[] = "itertools";
 static const char __pyx_k_pyx_state[] = "__pyx_state";
 static const char __pyx_k_reduce_ex[] = "__reduce_ex__";
 static const char __pyx_k_IndexError[] = "IndexError";
+static const char __pyx_k_LIMIT_TIME[] = "LIMIT_TIME";
 static const char __pyx_k_a_star_pyx[] = "a_star.pyx";
+static const char __pyx_k_add_search[] = "add_search";
 static const char __pyx_k_goal_nodes[] = "goal_nodes";
 static const char __pyx_k_pyx_result[] = "__pyx_result";
 static const char __pyx_k_pyx_vtable[] = "__pyx_vtable__";
 static const char __pyx_k_PickleError[] = "PickleError";
 static const char __pyx_k_astar_start[] = "astar_start";
+static const char __pyx_k_peak_memory[] = "peak_memory";
 static const char __pyx_k_combinations[] = "combinations";
 static const char __pyx_k_failed_nodes[] = "failed_nodes";
 static const char __pyx_k_get_a_logger[] = "get_a_logger";
 static const char __pyx_k_initializing[] = "_initializing";
 static const char __pyx_k_is_coroutine[] = "_is_coroutine";
+static const char __pyx_k_max_open_set[] = "max_open_set";
 static const char __pyx_k_partial_cost[] = "partial_cost";
 static const char __pyx_k_partial_path[] = "partial_path";
+static const char __pyx_k_perf_counter[] = "perf_counter";
 static const char __pyx_k_pyx_checksum[] = "__pyx_checksum";
 static const char __pyx_k_stringsource[] = "<stringsource>";
 static const char __pyx_k_use_setstate[] = "use_setstate";
 static const char __pyx_k_PriorityQueue[] = "PriorityQueue";
+static const char __pyx_k_blocked_ports[] = "blocked_ports";
 static const char __pyx_k_class_getitem[] = "__class_getitem__";
 static const char __pyx_k_grid_vertical[] = "grid_vertical";
 static const char __pyx_k_logger_logger[] = "logger.logger";
 static const char __pyx_k_reduce_cython[] = "__reduce_cython__";
+static const char __pyx_k_LIMIT_OPEN_SET[] = "LIMIT_OPEN_SET";
+static const char __pyx_k_failure_reason[] = "failure_reason";
+static const char __pyx_k_max_expansions[] = "max_expansions";
+static const char __pyx_k_nodes_expanded[] = "nodes_expanded";
+static const char __pyx_k_visited_states[] = "visited_states";
 static const char __pyx_k_grid_horizontal[] = "grid_horizontal";
+static const char __pyx_k_nodes_generated[] = "nodes_generated";
 static const char __pyx_k_pyx_PickleError[] = "__pyx_PickleError";
 static const char __pyx_k_setstate_cython[] = "__setstate_cython__";
+static const char __pyx_k_LIMIT_EXPANSIONS[] = "LIMIT_EXPANSIONS";
+static const char __pyx_k_FAILURE_EXHAUSTED[] = "FAILURE_EXHAUSTED";
+static const char __pyx_k_astar_a_star_stats[] = "astar.a_star_stats";
 static const char __pyx_k_asyncio_coroutines[] = "asyncio.coroutines";
 static const char __pyx_k_cline_in_traceback[] = "cline_in_traceback";
 static const char __pyx_k_trace_width_scaled[] = "trace_width_scaled";
+static const char __pyx_k_FAILURE_BLOCKED_PORTS[] = "FAILURE_BLOCKED_PORTS";
+static const char __pyx_k_FAILURE_LIMIT_REACHED[] = "FAILURE_LIMIT_REACHED";
+static const char __pyx_k_segment_length_prunes[] = "segment_length_prunes";
+static const char __pyx_k_FAILURE_SEGMENT_LENGTH[] = "FAILURE_SEGMENT_LENGTH";
+static const char __pyx_k_estimate_search_memory[] = "estimate_search_memory";
 static const char __pyx_k_minimum_segment_length[] = "minimum_segment_length";
 static const char __pyx_k_heuristic_locals_genexpr[] = "_heuristic.<locals>.genexpr";
 static const char __pyx_k_pyx_unpickle_PriorityQueue[] = "__pyx_unpickle_PriorityQueue";
@@ -2821,7 +2870,7 @@ static const char __pyx_k_Incompatible_checksums_0x_x_vs_0[] = "Incompatible che
 static int __pyx_pf_6a_star_13PriorityQueue___init__(struct __pyx_obj_6a_star_PriorityQueue *__pyx_v_self); /* proto */
 static PyObject *__pyx_pf_6a_star_13PriorityQueue_2__reduce_cython__(struct __pyx_obj_6a_star_PriorityQueue *__pyx_v_self); /* proto */
 static PyObject *__pyx_pf_6a_star_13PriorityQueue_4__setstate_cython__(struct __pyx_obj_6a_star_PriorityQueue *__pyx_v_self, PyObject *__pyx_v___pyx_state); /* proto */
-static PyObject *__pyx_pf_6a_star_astar_start(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_grid_vertical, PyObject *__pyx_v_grid_horizontal, PyObject *__pyx_v_start, PyObject *__pyx_v_goal_nodes, PyObject *__pyx_v_minimum_segment_length, PyObject *__pyx_v_tsp, CYTHON_UNUSED PyObject *__pyx_v_trace_width_scaled); /* proto */
+static PyObject *__pyx_pf_6a_star_astar_start(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_grid_vertical, PyObject *__pyx_v_grid_horizontal, PyObject *__pyx_v_start, PyObject *__pyx_v_goal_nodes, PyObject *__pyx_v_minimum_segment_length, PyObject *__pyx_v_tsp, CYTHON_UNUSED PyObject *__pyx_v_trace_width_scaled, PyObject *__pyx_v_stats, PyObject *__pyx_v_limits); /* proto */
 static PyObject *__pyx_pf_6a_star_10_heuristic_genexpr(PyObject *__pyx_self, PyObject *__pyx_genexpr_arg_0); /* proto */
 static PyObject *__pyx_pf_6a_star_2__pyx_unpickle_PriorityQueue(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v___pyx_type, long __pyx_v___pyx_checksum, PyObject *__pyx_v___pyx_state); /* proto */
 static PyObject *__pyx_tp_new_6a_star_PriorityQueue(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
@@ -2864,8 +2913,15 @@ typedef struct {
   PyTypeObject *__pyx_ptype_6a_star_PriorityQueue;
   PyTypeObject *__pyx_ptype_6a_star___pyx_scope_struct____pyx_f_6a_star__heuristic;
   PyTypeObject *__pyx_ptype_6a_star___pyx_scope_struct_1_genexpr;
+  PyObject *__pyx_n_s_FAILURE_BLOCKED_PORTS;
+  PyObject *__pyx_n_s_FAILURE_EXHAUSTED;
+  PyObject *__pyx_n_s_FAILURE_LIMIT_REACHED;
+  PyObject *__pyx_n_s_FAILURE_SEGMENT_LENGTH;
   PyObject *__pyx_kp_s_Incompatible_checksums_0x_x_vs_0;
   PyObject *__pyx_n_s_IndexError;
+  PyObject *__pyx_n_s_LIMIT_EXPANSIONS;
+  PyObject *__pyx_n_s_LIMIT_OPEN_SET;
+  PyObject *__pyx_n_s_LIMIT_TIME;
   PyObject *__pyx_n_s_PickleError;
   PyObject *__pyx_n_s_PriorityQueue;
   PyObject *__pyx_n_s_PriorityQueue___reduce_cython;
@@ -2875,21 +2931,27 @@ typedef struct {
   PyObject *__pyx_kp_u__9;
   PyObject *__pyx_n_s_a_star;
   PyObject *__pyx_kp_s_a_star_pyx;
+  PyObject *__pyx_n_s_add_search;
   PyObject *__pyx_n_s_args;
+  PyObject *__pyx_n_s_astar_a_star_stats;
   PyObject *__pyx_n_s_astar_start;
   PyObject *__pyx_n_s_asyncio_coroutines;
+  PyObject *__pyx_n_s_blocked_ports;
   PyObject *__pyx_n_s_class_getitem;
   PyObject *__pyx_n_s_cline_in_traceback;
   PyObject *__pyx_n_s_close;
   PyObject *__pyx_n_s_combinations;
   PyObject *__pyx_n_s_cost;
+  PyObject *__pyx_n_s_deadline;
   PyObject *__pyx_n_s_dict;
   PyObject *__pyx_n_s_dict_2;
   PyObject *__pyx_kp_u_disable;
   PyObject *__pyx_kp_u_enable;
   PyObject *__pyx_n_s_enumerate;
+  PyObject *__pyx_n_s_estimate_search_memory;
   PyObject *__pyx_n_s_extend;
   PyObject *__pyx_n_s_failed_nodes;
+  PyObject *__pyx_n_s_failure_reason;
   PyObject *__pyx_kp_u_gc;
   PyObject *__pyx_n_s_genexpr;
   PyObject *__pyx_n_s_get;
@@ -2906,16 +2968,24 @@ typedef struct {
   PyObject *__pyx_n_s_is_coroutine;
   PyObject *__pyx_kp_u_isenabled;
   PyObject *__pyx_n_s_itertools;
+  PyObject *__pyx_n_s_limit;
+  PyObject *__pyx_n_s_limits;
   PyObject *__pyx_n_s_logger_logger;
   PyObject *__pyx_n_s_main;
+  PyObject *__pyx_n_s_max_expansions;
+  PyObject *__pyx_n_s_max_open_set;
   PyObject *__pyx_n_s_min;
   PyObject *__pyx_n_s_minimum_segment_length;
   PyObject *__pyx_n_s_name;
   PyObject *__pyx_n_s_new;
+  PyObject *__pyx_n_s_nodes_expanded;
+  PyObject *__pyx_n_s_nodes_generated;
   PyObject *__pyx_n_s_order;
   PyObject *__pyx_n_s_partial_cost;
   PyObject *__pyx_n_s_partial_path;
   PyObject *__pyx_n_s_path;
+  PyObject *__pyx_n_s_peak_memory;
+  PyObject *__pyx_n_s_perf_counter;
   PyObject *__pyx_n_s_pickle;
   PyObject *__pyx_n_s_pop;
   PyObject *__pyx_kp_s_pop_from_empty_priority_queue;
@@ -2930,6 +3000,8 @@ typedef struct {
   PyObject *__pyx_n_s_reduce;
   PyObject *__pyx_n_s_reduce_cython;
   PyObject *__pyx_n_s_reduce_ex;
+  PyObject *__pyx_n_s_seconds;
+  PyObject *__pyx_n_s_segment_length_prunes;
   PyObject *__pyx_n_s_segments;
   PyObject *__pyx_n_s_self;
   PyObject *__pyx_n_s_send;
@@ -2938,14 +3010,17 @@ typedef struct {
   PyObject *__pyx_n_s_spec;
   PyObject *__pyx_n_s_start;
   PyObject *__pyx_n_s_state;
+  PyObject *__pyx_n_s_stats;
   PyObject *__pyx_kp_s_stringsource;
   PyObject *__pyx_n_s_sys;
   PyObject *__pyx_n_s_test;
   PyObject *__pyx_n_s_throw;
+  PyObject *__pyx_n_s_time;
   PyObject *__pyx_n_s_trace_width_scaled;
   PyObject *__pyx_n_s_tsp;
   PyObject *__pyx_n_s_update;
   PyObject *__pyx_n_s_use_setstate;
+  PyObject *__pyx_n_s_visited_states;
   PyObject *__pyx_n_s_zip;
   PyObject *__pyx_float_0_9;
   PyObject *__pyx_int_0;
@@ -3021,8 +3096,15 @@ static int __pyx_m_clear(PyObject *m) {
   Py_CLEAR(clear_module_state->__pyx_type_6a_star___pyx_scope_struct____pyx_f_6a_star__heuristic);
   Py_CLEAR(clear_module_state->__pyx_ptype_6a_star___pyx_scope_struct_1_genexpr);
   Py_CLEAR(clear_module_state->__pyx_type_6a_star___pyx_scope_struct_1_genexpr);
+  Py_CLEAR(clear_module_state->__pyx_n_s_FAILURE_BLOCKED_PORTS);
+  Py_CLEAR(clear_module_state->__pyx_n_s_FAILURE_EXHAUSTED);
+  Py_CLEAR(clear_module_state->__pyx_n_s_FAILURE_LIMIT_REACHED);
+  Py_CLEAR(clear_module_state->__pyx_n_s_FAILURE_SEGMENT_LENGTH);
   Py_CLEAR(clear_module_state->__pyx_kp_s_Incompatible_checksums_0x_x_vs_0);
   Py_CLEAR(clear_module_state->__pyx_n_s_IndexError);
+  Py_CLEAR(clear_module_state->__pyx_n_s_LIMIT_EXPANSIONS);
+  Py_CLEAR(clear_module_state->__pyx_n_s_LIMIT_OPEN_SET);
+  Py_CLEAR(clear_module_state->__pyx_n_s_LIMIT_TIME);
   Py_CLEAR(clear_module_state->__pyx_n_s_PickleError);
   Py_CLEAR(clear_module_state->__pyx_n_s_PriorityQueue);
   Py_CLEAR(clear_module_state->__pyx_n_s_PriorityQueue___reduce_cython);
@@ -3032,21 +3114,27 @@ static int __pyx_m_clear(PyObject *m) {
   Py_CLEAR(clear_module_state->__pyx_kp_u__9);
   Py_CLEAR(clear_module_state->__pyx_n_s_a_star);
   Py_CLEAR(clear_module_state->__pyx_kp_s_a_star_pyx);
+  Py_CLEAR(clear_module_state->__pyx_n_s_add_search);
   Py_CLEAR(clear_module_state->__pyx_n_s_args);
+  Py_CLEAR(clear_module_state->__pyx_n_s_astar_a_star_stats);
   Py_CLEAR(clear_module_state->__pyx_n_s_astar_start);
   Py_CLEAR(clear_module_state->__pyx_n_s_asyncio_coroutines);
+  Py_CLEAR(clear_module_state->__pyx_n_s_blocked_ports);
   Py_CLEAR(clear_module_state->__pyx_n_s_class_getitem);
   Py_CLEAR(clear_module_state->__pyx_n_s_cline_in_traceback);
   Py_CLEAR(clear_module_state->__pyx_n_s_close);
   Py_CLEAR(clear_module_state->__pyx_n_s_combinations);
   Py_CLEAR(clear_module_state->__pyx_n_s_cost);
+  Py_CLEAR(clear_module_state->__pyx_n_s_deadline);
   Py_CLEAR(clear_module_state->__pyx_n_s_dict);
   Py_CLEAR(clear_module_state->__pyx_n_s_dict_2);
   Py_CLEAR(clear_module_state->__pyx_kp_u_disable);
   Py_CLEAR(clear_module_state->__pyx_kp_u_enable);
   Py_CLEAR(clear_module_state->__pyx_n_s_enumerate);
+  Py_CLEAR(clear_module_state->__pyx_n_s_estimate_search_memory);
   Py_CLEAR(clear_module_state->__pyx_n_s_extend);
   Py_CLEAR(clear_module_state->__pyx_n_s_failed_nodes);
+  Py_CLEAR(clear_module_state->__pyx_n_s_failure_reason);
   Py_CLEAR(clear_module_state->__pyx_kp_u_gc);
   Py_CLEAR(clear_module_state->__pyx_n_s_genexpr);
   Py_CLEAR(clear_module_state->__pyx_n_s_get);
@@ -3063,16 +3151,24 @@ static int __pyx_m_clear(PyObject *m) {
   Py_CLEAR(clear_module_state->__pyx_n_s_is_coroutine);
   Py_CLEAR(clear_module_state->__pyx_kp_u_isenabled);
   Py_CLEAR(clear_module_state->__pyx_n_s_itertools);
+  Py_CLEAR(clear_module_state->__pyx_n_s_limit);
+  Py_CLEAR(clear_module_state->__pyx_n_s_limits);
   Py_CLEAR(clear_module_state->__pyx_n_s_logger_logger);
   Py_CLEAR(clear_module_state->__pyx_n_s_main);
+  Py_CLEAR(clear_module_state->__pyx_n_s_max_expansions);
+  Py_CLEAR(clear_module_state->__pyx_n_s_max_open_set);
   Py_CLEAR(clear_module_state->__pyx_n_s_min);
   Py_CLEAR(clear_module_state->__pyx_n_s_minimum_segment_length);
   Py_CLEAR(clear_module_state->__pyx_n_s_name);
   Py_CLEAR(clear_module_state->__pyx_n_s_new);
+  Py_CLEAR(clear_module_state->__pyx_n_s_nodes_expanded);
+  Py_CLEAR(clear_module_state->__pyx_n_s_nodes_generated);
   Py_CLEAR(clear_module_state->__pyx_n_s_order);
   Py_CLEAR(clear_module_state->__pyx_n_s_partial_cost);
   Py_CLEAR(clear_module_state->__pyx_n_s_partial_path);
   Py_CLEAR(clear_module_state->__pyx_n_s_path);
+  Py_CLEAR(clear_module_state->__pyx_n_s_peak_memory);
+  Py_CLEAR(clear_module_state->__pyx_n_s_perf_counter);
   Py_CLEAR(clear_module_state->__pyx_n_s_pickle);
   Py_CLEAR(clear_module_state->__pyx_n_s_pop);
   Py_CLEAR(clear_module_state->__pyx_kp_s_pop_from_empty_priority_queue);
@@ -3087,6 +3183,8 @@ static int __pyx_m_clear(PyObject *m) {
   Py_CLEAR(clear_module_state->__pyx_n_s_reduce);
   Py_CLEAR(clear_module_state->__pyx_n_s_reduce_cython);
   Py_CLEAR(clear_module_state->__pyx_n_s_reduce_ex);
+  Py_CLEAR(clear_module_state->__pyx_n_s_seconds);
+  Py_CLEAR(clear_module_state->__pyx_n_s_segment_length_prunes);
   Py_CLEAR(clear_module_state->__pyx_n_s_segments);
   Py_CLEAR(clear_module_state->__pyx_n_s_self);
   Py_CLEAR(clear_module_state->__pyx_n_s_send);
@@ -3095,14 +3193,17 @@ static int __pyx_m_clear(PyObject *m) {
   Py_CLEAR(clear_module_state->__pyx_n_s_spec);
   Py_CLEAR(clear_module_state->__pyx_n_s_start);
   Py_CLEAR(clear_module_state->__pyx_n_s_state);
+  Py_CLEAR(clear_module_state->__pyx_n_s_stats);
   Py_CLEAR(clear_module_state->__pyx_kp_s_stringsource);
   Py_CLEAR(clear_module_state->__pyx_n_s_sys);
   Py_CLEAR(clear_module_state->__pyx_n_s_test);
   Py_CLEAR(clear_module_state->__pyx_n_s_throw);
+  Py_CLEAR(clear_module_state->__pyx_n_s_time);
   Py_CLEAR(clear_module_state->__pyx_n_s_trace_width_scaled);
   Py_CLEAR(clear_module_state->__pyx_n_s_tsp);
   Py_CLEAR(clear_module_state->__pyx_n_s_update);
   Py_CLEAR(clear_module_state->__pyx_n_s_use_setstate);
+  Py_CLEAR(clear_module_state->__pyx_n_s_visited_states);
   Py_CLEAR(clear_module_state->__pyx_n_s_zip);
   Py_CLEAR(clear_module_state->__pyx_float_0_9);
   Py_CLEAR(clear_module_state->__pyx_int_0);
@@ -3156,8 +3257,15 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
   Py_VISIT(traverse_module_state->__pyx_type_6a_star___pyx_scope_struct____pyx_f_6a_star__heuristic);
   Py_VISIT(traverse_module_state->__pyx_ptype_6a_star___pyx_scope_struct_1_genexpr);
   Py_VISIT(traverse_module_state->__pyx_type_6a_star___pyx_scope_struct_1_genexpr);
+  Py_VISIT(traverse_module_state->__pyx_n_s_FAILURE_BLOCKED_PORTS);
+  Py_VISIT(traverse_module_state->__pyx_n_s_FAILURE_EXHAUSTED);
+  Py_VISIT(traverse_module_state->__pyx_n_s_FAILURE_LIMIT_REACHED);
+  Py_VISIT(traverse_module_state->__pyx_n_s_FAILURE_SEGMENT_LENGTH);
   Py_VISIT(traverse_module_state->__pyx_kp_s_Incompatible_checksums_0x_x_vs_0);
   Py_VISIT(traverse_module_state->__pyx_n_s_IndexError);
+  Py_VISIT(traverse_module_state->__pyx_n_s_LIMIT_EXPANSIONS);
+  Py_VISIT(traverse_module_state->__pyx_n_s_LIMIT_OPEN_SET);
+  Py_VISIT(traverse_module_state->__pyx_n_s_LIMIT_TIME);
   Py_VISIT(traverse_module_state->__pyx_n_s_PickleError);
   Py_VISIT(traverse_module_state->__pyx_n_s_PriorityQueue);
   Py_VISIT(traverse_module_state->__pyx_n_s_PriorityQueue___reduce_cython);
@@ -3167,21 +3275,27 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
   Py_VISIT(traverse_module_state->__pyx_kp_u__9);
   Py_VISIT(traverse_module_state->__pyx_n_s_a_star);
   Py_VISIT(traverse_module_state->__pyx_kp_s_a_star_pyx);
+  Py_VISIT(traverse_module_state->__pyx_n_s_add_search);
   Py_VISIT(traverse_module_state->__pyx_n_s_args);
+  Py_VISIT(traverse_module_state->__pyx_n_s_astar_a_star_stats);
   Py_VISIT(traverse_module_state->__pyx_n_s_astar_start);
   Py_VISIT(traverse_module_state->__pyx_n_s_asyncio_coroutines);
+  Py_VISIT(traverse_module_state->__pyx_n_s_blocked_ports);
   Py_VISIT(traverse_module_state->__pyx_n_s_class_getitem);
   Py_VISIT(traverse_module_state->__pyx_n_s_cline_in_traceback);
   Py_VISIT(traverse_module_state->__pyx_n_s_close);
   Py_VISIT(traverse_module_state->__pyx_n_s_combinations);
   Py_VISIT(traverse_module_state->__pyx_n_s_cost);
+  Py_VISIT(traverse_module_state->__pyx_n_s_deadline);
   Py_VISIT(traverse_module_state->__pyx_n_s_dict);
   Py_VISIT(traverse_module_state->__pyx_n_s_dict_2);
   Py_VISIT(traverse_module_state->__pyx_kp_u_disable);
   Py_VISIT(traverse_module_state->__pyx_kp_u_enable);
   Py_VISIT(traverse_module_state->__pyx_n_s_enumerate);
+  Py_VISIT(traverse_module_state->__pyx_n_s_estimate_search_memory);
   Py_VISIT(traverse_module_state->__pyx_n_s_extend);
   Py_VISIT(traverse_module_state->__pyx_n_s_failed_nodes);
+  Py_VISIT(traverse_module_state->__pyx_n_s_failure_reason);
   Py_VISIT(traverse_module_state->__pyx_kp_u_gc);
   Py_VISIT(traverse_module_state->__pyx_n_s_genexpr);
   Py_VISIT(traverse_module_state->__pyx_n_s_get);
@@ -3198,16 +3312,24 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
   Py_VISIT(traverse_module_state->__pyx_n_s_is_coroutine);
   Py_VISIT(traverse_module_state->__pyx_kp_u_isenabled);
   Py_VISIT(traverse_module_state->__pyx_n_s_itertools);
+  Py_VISIT(traverse_module_state->__pyx_n_s_limit);
+  Py_VISIT(traverse_module_state->__pyx_n_s_limits);
   Py_VISIT(traverse_module_state->__pyx_n_s_logger_logger);
   Py_VISIT(traverse_module_state->__pyx_n_s_main);
+  Py_VISIT(traverse_module_state->__pyx_n_s_max_expansions);
+  Py_VISIT(traverse_module_state->__pyx_n_s_max_open_set);
   Py_VISIT(traverse_module_state->__pyx_n_s_min);
   Py_VISIT(traverse_module_state->__pyx_n_s_minimum_segment_length);
   Py_VISIT(traverse_module_state->__pyx_n_s_name);
   Py_VISIT(traverse_module_state->__pyx_n_s_new);
+  Py_VISIT(traverse_module_state->__pyx_n_s_nodes_expanded);
+  Py_VISIT(traverse_module_state->__pyx_n_s_nodes_generated);
   Py_VISIT(traverse_module_state->__pyx_n_s_order);
   Py_VISIT(traverse_module_state->__pyx_n_s_partial_cost);
   Py_VISIT(traverse_module_state->__pyx_n_s_partial_path);
   Py_VISIT(traverse_module_state->__pyx_n_s_path);
+  Py_VISIT(traverse_module_state->__pyx_n_s_peak_memory);
+  Py_VISIT(traverse_module_state->__pyx_n_s_perf_counter);
   Py_VISIT(traverse_module_state->__pyx_n_s_pickle);
   Py_VISIT(traverse_module_state->__pyx_n_s_pop);
   Py_VISIT(traverse_module_state->__pyx_kp_s_pop_from_empty_priority_queue);
@@ -3222,6 +3344,8 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
   Py_VISIT(traverse_module_state->__pyx_n_s_reduce);
   Py_VISIT(traverse_module_state->__pyx_n_s_reduce_cython);
   Py_VISIT(traverse_module_state->__pyx_n_s_reduce_ex);
+  Py_VISIT(traverse_module_state->__pyx_n_s_seconds);
+  Py_VISIT(traverse_module_state->__pyx_n_s_segment_length_prunes);
   Py_VISIT(traverse_module_state->__pyx_n_s_segments);
   Py_VISIT(traverse_module_state->__pyx_n_s_self);
   Py_VISIT(traverse_module_state->__pyx_n_s_send);
@@ -3230,14 +3354,17 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
   Py_VISIT(traverse_module_state->__pyx_n_s_spec);
   Py_VISIT(traverse_module_state->__pyx_n_s_start);
   Py_VISIT(traverse_module_state->__pyx_n_s_state);
+  Py_VISIT(traverse_module_state->__pyx_n_s_stats);
   Py_VISIT(traverse_module_state->__pyx_kp_s_stringsource);
   Py_VISIT(traverse_module_state->__pyx_n_s_sys);
   Py_VISIT(traverse_module_state->__pyx_n_s_test);
   Py_VISIT(traverse_module_state->__pyx_n_s_throw);
+  Py_VISIT(traverse_module_state->__pyx_n_s_time);
   Py_VISIT(traverse_module_state->__pyx_n_s_trace_width_scaled);
   Py_VISIT(traverse_module_state->__pyx_n_s_tsp);
   Py_VISIT(traverse_module_state->__pyx_n_s_update);
   Py_VISIT(traverse_module_state->__pyx_n_s_use_setstate);
+  Py_VISIT(traverse_module_state->__pyx_n_s_visited_states);
   Py_VISIT(traverse_module_state->__pyx_n_s_zip);
   Py_VISIT(traverse_module_state->__pyx_float_0_9);
   Py_VISIT(traverse_module_state->__pyx_int_0);
@@ -3301,8 +3428,15 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
 #define __pyx_ptype_6a_star_PriorityQueue __pyx_mstate_global->__pyx_ptype_6a_star_PriorityQueue
 #define __pyx_ptype_6a_star___pyx_scope_struct____pyx_f_6a_star__heuristic __pyx_mstate_global->__pyx_ptype_6a_star___pyx_scope_struct____pyx_f_6a_star__heuristic
 #define __pyx_ptype_6a_star___pyx_scope_struct_1_genexpr __pyx_mstate_global->__pyx_ptype_6a_star___pyx_scope_struct_1_genexpr
+#define __pyx_n_s_FAILURE_BLOCKED_PORTS __pyx_mstate_global->__pyx_n_s_FAILURE_BLOCKED_PORTS
+#define __pyx_n_s_FAILURE_EXHAUSTED __pyx_mstate_global->__pyx_n_s_FAILURE_EXHAUSTED
+#define __pyx_n_s_FAILURE_LIMIT_REACHED __pyx_mstate_global->__pyx_n_s_FAILURE_LIMIT_REACHED
+#define __pyx_n_s_FAILURE_SEGMENT_LENGTH __pyx_mstate_global->__pyx_n_s_FAILURE_SEGMENT_LENGTH
 #define __pyx_kp_s_Incompatible_checksums_0x_x_vs_0 __pyx_mstate_global->__pyx_kp_s_Incompatible_checksums_0x_x_vs_0
 #define __pyx_n_s_IndexError __pyx_mstate_global->__pyx_n_s_IndexError
+#define __pyx_n_s_LIMIT_EXPANSIONS __pyx_mstate_global->__pyx_n_s_LIMIT_EXPANSIONS
+#define __pyx_n_s_LIMIT_OPEN_SET __pyx_mstate_global->__pyx_n_s_LIMIT_OPEN_SET
+#define __pyx_n_s_LIMIT_TIME __pyx_mstate_global->__pyx_n_s_LIMIT_TIME
 #define __pyx_n_s_PickleError __pyx_mstate_global->__pyx_n_s_PickleError
 #define __pyx_n_s_PriorityQueue __pyx_mstate_global->__pyx_n_s_PriorityQueue
 #define __pyx_n_s_PriorityQueue___reduce_cython __pyx_mstate_global->__pyx_n_s_PriorityQueue___reduce_cython
@@ -3312,21 +3446,27 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
 #define __pyx_kp_u__9 __pyx_mstate_global->__pyx_kp_u__9
 #define __pyx_n_s_a_star __pyx_mstate_global->__pyx_n_s_a_star
 #define __pyx_kp_s_a_star_pyx __pyx_mstate_global->__pyx_kp_s_a_star_pyx
+#define __pyx_n_s_add_search __pyx_mstate_global->__pyx_n_s_add_search
 #define __pyx_n_s_args __pyx_mstate_global->__pyx_n_s_args
+#define __pyx_n_s_astar_a_star_stats __pyx_mstate_global->__pyx_n_s_astar_a_star_stats
 #define __pyx_n_s_astar_start __pyx_mstate_global->__pyx_n_s_astar_start
 #define __pyx_n_s_asyncio_coroutines __pyx_mstate_global->__pyx_n_s_asyncio_coroutines
+#define __pyx_n_s_blocked_ports __pyx_mstate_global->__pyx_n_s_blocked_ports
 #define __pyx_n_s_class_getitem __pyx_mstate_global->__pyx_n_s_class_getitem
 #define __pyx_n_s_cline_in_traceback __pyx_mstate_global->__pyx_n_s_cline_in_traceback
 #define __pyx_n_s_close __pyx_mstate_global->__pyx_n_s_close
 #define __pyx_n_s_combinations __pyx_mstate_global->__pyx_n_s_combinations
 #define __pyx_n_s_cost __pyx_mstate_global->__pyx_n_s_cost
+#define __pyx_n_s_deadline __pyx_mstate_global->__pyx_n_s_deadline
 #define __pyx_n_s_dict __pyx_mstate_global->__pyx_n_s_dict
 #define __pyx_n_s_dict_2 __pyx_mstate_global->__pyx_n_s_dict_2
 #define __pyx_kp_u_disable __pyx_mstate_global->__pyx_kp_u_disable
 #define __pyx_kp_u_enable __pyx_mstate_global->__pyx_kp_u_enable
 #define __pyx_n_s_enumerate __pyx_mstate_global->__pyx_n_s_enumerate
+#define __pyx_n_s_estimate_search_memory __pyx_mstate_global->__pyx_n_s_estimate_search_memory
 #define __pyx_n_s_extend __pyx_mstate_global->__pyx_n_s_extend
 #define __pyx_n_s_failed_nodes __pyx_mstate_global->__pyx_n_s_failed_nodes
+#define __pyx_n_s_failure_reason __pyx_mstate_global->__pyx_n_s_failure_reason
 #define __pyx_kp_u_gc __pyx_mstate_global->__pyx_kp_u_gc
 #define __pyx_n_s_genexpr __pyx_mstate_global->__pyx_n_s_genexpr
 #define __pyx_n_s_get __pyx_mstate_global->__pyx_n_s_get
@@ -3343,16 +3483,24 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
 #define __pyx_n_s_is_coroutine __pyx_mstate_global->__pyx_n_s_is_coroutine
 #define __pyx_kp_u_isenabled __pyx_mstate_global->__pyx_kp_u_isenabled
 #define __pyx_n_s_itertools __pyx_mstate_global->__pyx_n_s_itertools
+#define __pyx_n_s_limit __pyx_mstate_global->__pyx_n_s_limit
+#define __pyx_n_s_limits __pyx_mstate_global->__pyx_n_s_limits
 #define __pyx_n_s_logger_logger __pyx_mstate_global->__pyx_n_s_logger_logger
 #define __pyx_n_s_main __pyx_mstate_global->__pyx_n_s_main
+#define __pyx_n_s_max_expansions __pyx_mstate_global->__pyx_n_s_max_expansions
+#define __pyx_n_s_max_open_set __pyx_mstate_global->__pyx_n_s_max_open_set
 #define __pyx_n_s_min __pyx_mstate_global->__pyx_n_s_min
 #define __pyx_n_s_minimum_segment_length __pyx_mstate_global->__pyx_n_s_minimum_segment_length
 #define __pyx_n_s_name __pyx_mstate_global->__pyx_n_s_name
 #define __pyx_n_s_new __pyx_mstate_global->__pyx_n_s_new
+#define __pyx_n_s_nodes_expanded __pyx_mstate_global->__pyx_n_s_nodes_expanded
+#define __pyx_n_s_nodes_generated __pyx_mstate_global->__pyx_n_s_nodes_generated
 #define __pyx_n_s_order __pyx_mstate_global->__pyx_n_s_order
 #define __pyx_n_s_partial_cost __pyx_mstate_global->__pyx_n_s_partial_cost
 #define __pyx_n_s_partial_path __pyx_mstate_global->__pyx_n_s_partial_path
 #define __pyx_n_s_path __pyx_mstate_global->__pyx_n_s_path
+#define __pyx_n_s_peak_memory __pyx_mstate_global->__pyx_n_s_peak_memory
+#define __pyx_n_s_perf_counter __pyx_mstate_global->__pyx_n_s_perf_counter
 #define __pyx_n_s_pickle __pyx_mstate_global->__pyx_n_s_pickle
 #define __pyx_n_s_pop __pyx_mstate_global->__pyx_n_s_pop
 #define __pyx_kp_s_pop_from_empty_priority_queue __pyx_mstate_global->__pyx_kp_s_pop_from_empty_priority_queue
@@ -3367,6 +3515,8 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
 #define __pyx_n_s_reduce __pyx_mstate_global->__pyx_n_s_reduce
 #define __pyx_n_s_reduce_cython __pyx_mstate_global->__pyx_n_s_reduce_cython
 #define __pyx_n_s_reduce_ex __pyx_mstate_global->__pyx_n_s_reduce_ex
+#define __pyx_n_s_seconds __pyx_mstate_global->__pyx_n_s_seconds
+#define __pyx_n_s_segment_length_prunes __pyx_mstate_global->__pyx_n_s_segment_length_prunes
 #define __pyx_n_s_segments __pyx_mstate_global->__pyx_n_s_segments
 #define __pyx_n_s_self __pyx_mstate_global->__pyx_n_s_self
 #define __pyx_n_s_send __pyx_mstate_global->__pyx_n_s_send
@@ -3375,14 +3525,17 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
 #define __pyx_n_s_spec __pyx_mstate_global->__pyx_n_s_spec
 #define __pyx_n_s_start __pyx_mstate_global->__pyx_n_s_start
 #define __pyx_n_s_state __pyx_mstate_global->__pyx_n_s_state
+#define __pyx_n_s_stats __pyx_mstate_global->__pyx_n_s_stats
 #define __pyx_kp_s_stringsource __pyx_mstate_global->__pyx_kp_s_stringsource
 #define __pyx_n_s_sys __pyx_mstate_global->__pyx_n_s_sys
 #define __pyx_n_s_test __pyx_mstate_global->__pyx_n_s_test
 #define __pyx_n_s_throw __pyx_mstate_global->__pyx_n_s_throw
+#define __pyx_n_s_time __pyx_mstate_global->__pyx_n_s_time
 #define __pyx_n_s_trace_width_scaled __pyx_mstate_global->__pyx_n_s_trace_width_scaled
 #define __pyx_n_s_tsp __pyx_mstate_global->__pyx_n_s_tsp
 #define __pyx_n_s_update __pyx_mstate_global->__pyx_n_s_update
 #define __pyx_n_s_use_setstate __pyx_mstate_global->__pyx_n_s_use_setstate
+#define __pyx_n_s_visited_states __pyx_mstate_global->__pyx_n_s_visited_states
 #define __pyx_n_s_zip __pyx_mstate_global->__pyx_n_s_zip
 #define __pyx_float_0_9 __pyx_mstate_global->__pyx_float_0_9
 #define __pyx_int_0 __pyx_mstate_global->__pyx_int_0
@@ -3412,7 +3565,7 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
 #define __pyx_codeobj__18 __pyx_mstate_global->__pyx_codeobj__18
 /* #### Code section: module_code ### */
 
-/* "a_star.pyx":14
+/* "a_star.pyx":18
  *     cdef list elements  # holds tuples: (priority, item)
  * 
  *     def __init__(self):             # <<<<<<<<<<<<<<
@@ -3453,14 +3606,14 @@ static int __pyx_pf_6a_star_13PriorityQueue___init__(struct __pyx_obj_6a_star_Pr
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__init__", 1);
 
-  /* "a_star.pyx":15
+  /* "a_star.pyx":19
  * 
  *     def __init__(self):
  *         self.elements = []             # <<<<<<<<<<<<<<
  * 
  *     cdef bint is_empty(self):
  */
-  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 15, __pyx_L1_error)
+  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 19, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_GIVEREF(__pyx_t_1);
   __Pyx_GOTREF(__pyx_v_self->elements);
@@ -3468,7 +3621,7 @@ static int __pyx_pf_6a_star_13PriorityQueue___init__(struct __pyx_obj_6a_star_Pr
   __pyx_v_self->elements = ((PyObject*)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "a_star.pyx":14
+  /* "a_star.pyx":18
  *     cdef list elements  # holds tuples: (priority, item)
  * 
  *     def __init__(self):             # <<<<<<<<<<<<<<
@@ -3488,7 +3641,7 @@ static int __pyx_pf_6a_star_13PriorityQueue___init__(struct __pyx_obj_6a_star_Pr
   return __pyx_r;
 }
 
-/* "a_star.pyx":17
+/* "a_star.pyx":21
  *         self.elements = []
  * 
  *     cdef bint is_empty(self):             # <<<<<<<<<<<<<<
@@ -3500,18 +3653,18 @@ static int __pyx_f_6a_star_13PriorityQueue_is_empty(struct __pyx_obj_6a_star_Pri
   int __pyx_r;
   int __pyx_t_1;
 
-  /* "a_star.pyx":18
+  /* "a_star.pyx":22
  * 
  *     cdef bint is_empty(self):
  *         return not self.elements             # <<<<<<<<<<<<<<
  * 
- *     cdef void push(self, object item, double priority):
+ *     cdef int size(self):
  */
   __pyx_t_1 = (__pyx_v_self->elements != Py_None)&&(PyList_GET_SIZE(__pyx_v_self->elements) != 0);
   __pyx_r = (!__pyx_t_1);
   goto __pyx_L0;
 
-  /* "a_star.pyx":17
+  /* "a_star.pyx":21
  *         self.elements = []
  * 
  *     cdef bint is_empty(self):             # <<<<<<<<<<<<<<
@@ -3524,9 +3677,63 @@ static int __pyx_f_6a_star_13PriorityQueue_is_empty(struct __pyx_obj_6a_star_Pri
   return __pyx_r;
 }
 
-/* "a_star.pyx":20
+/* "a_star.pyx":24
+ *         return not self.elements
+ * 
+ *     cdef int size(self):             # <<<<<<<<<<<<<<
+ *         return len(self.elements)
+ * 
+ */
+
+static int __pyx_f_6a_star_13PriorityQueue_size(struct __pyx_obj_6a_star_PriorityQueue *__pyx_v_self) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  Py_ssize_t __pyx_t_2;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("size", 1);
+
+  /* "a_star.pyx":25
+ * 
+ *     cdef int size(self):
+ *         return len(self.elements)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef void push(self, object item, double priority):
+ */
+  __pyx_t_1 = __pyx_v_self->elements;
+  __Pyx_INCREF(__pyx_t_1);
+  if (unlikely(__pyx_t_1 == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(0, 25, __pyx_L1_error)
+  }
+  __pyx_t_2 = __Pyx_PyList_GET_SIZE(__pyx_t_1); if (unlikely(__pyx_t_2 == ((Py_ssize_t)-1))) __PYX_ERR(0, 25, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_r = __pyx_t_2;
+  goto __pyx_L0;
+
+  /* "a_star.pyx":24
  *         return not self.elements
  * 
+ *     cdef int size(self):             # <<<<<<<<<<<<<<
+ *         return len(self.elements)
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("a_star.PriorityQueue.size", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "a_star.pyx":27
+ *         return len(self.elements)
+ * 
  *     cdef void push(self, object item, double priority):             # <<<<<<<<<<<<<<
  *         cdef int idx
  *         self.elements.append((priority, item))
@@ -3544,7 +3751,7 @@ static void __pyx_f_6a_star_13PriorityQueue_push(struct __pyx_obj_6a_star_Priori
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("push", 1);
 
-  /* "a_star.pyx":22
+  /* "a_star.pyx":29
  *     cdef void push(self, object item, double priority):
  *         cdef int idx
  *         self.elements.append((priority, item))             # <<<<<<<<<<<<<<
@@ -3553,22 +3760,22 @@ static void __pyx_f_6a_star_13PriorityQueue_push(struct __pyx_obj_6a_star_Priori
  */
   if (unlikely(__pyx_v_self->elements == Py_None)) {
     PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "append");
-    __PYX_ERR(0, 22, __pyx_L1_error)
+    __PYX_ERR(0, 29, __pyx_L1_error)
   }
-  __pyx_t_1 = PyFloat_FromDouble(__pyx_v_priority); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 22, __pyx_L1_error)
+  __pyx_t_1 = PyFloat_FromDouble(__pyx_v_priority); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 29, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 22, __pyx_L1_error)
+  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 29, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_GIVEREF(__pyx_t_1);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_1)) __PYX_ERR(0, 22, __pyx_L1_error);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_1)) __PYX_ERR(0, 29, __pyx_L1_error);
   __Pyx_INCREF(__pyx_v_item);
   __Pyx_GIVEREF(__pyx_v_item);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_v_item)) __PYX_ERR(0, 22, __pyx_L1_error);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_v_item)) __PYX_ERR(0, 29, __pyx_L1_error);
   __pyx_t_1 = 0;
-  __pyx_t_3 = __Pyx_PyList_Append(__pyx_v_self->elements, __pyx_t_2); if (unlikely(__pyx_t_3 == ((int)-1))) __PYX_ERR(0, 22, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyList_Append(__pyx_v_self->elements, __pyx_t_2); if (unlikely(__pyx_t_3 == ((int)-1))) __PYX_ERR(0, 29, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "a_star.pyx":23
+  /* "a_star.pyx":30
  *         cdef int idx
  *         self.elements.append((priority, item))
  *         idx = len(self.elements) - 1             # <<<<<<<<<<<<<<
@@ -3579,23 +3786,23 @@ static void __pyx_f_6a_star_13PriorityQueue_push(struct __pyx_obj_6a_star_Priori
   __Pyx_INCREF(__pyx_t_2);
   if (unlikely(__pyx_t_2 == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
-    __PYX_ERR(0, 23, __pyx_L1_error)
+    __PYX_ERR(0, 30, __pyx_L1_error)
   }
-  __pyx_t_4 = __Pyx_PyList_GET_SIZE(__pyx_t_2); if (unlikely(__pyx_t_4 == ((Py_ssize_t)-1))) __PYX_ERR(0, 23, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyList_GET_SIZE(__pyx_t_2); if (unlikely(__pyx_t_4 == ((Py_ssize_t)-1))) __PYX_ERR(0, 30, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_v_idx = (__pyx_t_4 - 1);
 
-  /* "a_star.pyx":24
+  /* "a_star.pyx":31
  *         self.elements.append((priority, item))
  *         idx = len(self.elements) - 1
  *         self._sift_up(idx)             # <<<<<<<<<<<<<<
  * 
  *     cdef object pop(self):
  */
-  ((struct __pyx_vtabstruct_6a_star_PriorityQueue *)__pyx_v_self->__pyx_vtab)->_sift_up(__pyx_v_self, __pyx_v_idx); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 24, __pyx_L1_error)
+  ((struct __pyx_vtabstruct_6a_star_PriorityQueue *)__pyx_v_self->__pyx_vtab)->_sift_up(__pyx_v_self, __pyx_v_idx); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 31, __pyx_L1_error)
 
-  /* "a_star.pyx":20
- *         return not self.elements
+  /* "a_star.pyx":27
+ *         return len(self.elements)
  * 
  *     cdef void push(self, object item, double priority):             # <<<<<<<<<<<<<<
  *         cdef int idx
@@ -3612,7 +3819,7 @@ static void __pyx_f_6a_star_13PriorityQueue_push(struct __pyx_obj_6a_star_Priori
   __Pyx_RefNannyFinishContext();
 }
 
-/* "a_star.pyx":26
+/* "a_star.pyx":33
  *         self._sift_up(idx)
  * 
  *     cdef object pop(self):             # <<<<<<<<<<<<<<
@@ -3633,7 +3840,7 @@ static PyObject *__pyx_f_6a_star_13PriorityQueue_pop(struct __pyx_obj_6a_star_Pr
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("pop", 1);
 
-  /* "a_star.pyx":27
+  /* "a_star.pyx":34
  * 
  *     cdef object pop(self):
  *         if not self.elements:             # <<<<<<<<<<<<<<
@@ -3644,20 +3851,20 @@ static PyObject *__pyx_f_6a_star_13PriorityQueue_pop(struct __pyx_obj_6a_star_Pr
   __pyx_t_2 = (!__pyx_t_1);
   if (unlikely(__pyx_t_2)) {
 
-    /* "a_star.pyx":28
+    /* "a_star.pyx":35
  *     cdef object pop(self):
  *         if not self.elements:
  *             raise IndexError("pop from empty priority queue")             # <<<<<<<<<<<<<<
  * 
  *         cdef object last_item = self.elements.pop()
  */
-    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_IndexError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 28, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_IndexError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 35, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_Raise(__pyx_t_3, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __PYX_ERR(0, 28, __pyx_L1_error)
+    __PYX_ERR(0, 35, __pyx_L1_error)
 
-    /* "a_star.pyx":27
+    /* "a_star.pyx":34
  * 
  *     cdef object pop(self):
  *         if not self.elements:             # <<<<<<<<<<<<<<
@@ -3666,7 +3873,7 @@ static PyObject *__pyx_f_6a_star_13PriorityQueue_pop(struct __pyx_obj_6a_star_Pr
  */
   }
 
-  /* "a_star.pyx":30
+  /* "a_star.pyx":37
  *             raise IndexError("pop from empty priority queue")
  * 
  *         cdef object last_item = self.elements.pop()             # <<<<<<<<<<<<<<
@@ -3675,14 +3882,14 @@ static PyObject *__pyx_f_6a_star_13PriorityQueue_pop(struct __pyx_obj_6a_star_Pr
  */
   if (unlikely(__pyx_v_self->elements == Py_None)) {
     PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "pop");
-    __PYX_ERR(0, 30, __pyx_L1_error)
+    __PYX_ERR(0, 37, __pyx_L1_error)
   }
-  __pyx_t_3 = __Pyx_PyList_Pop(__pyx_v_self->elements); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 30, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyList_Pop(__pyx_v_self->elements); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 37, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __pyx_v_last_item = __pyx_t_3;
   __pyx_t_3 = 0;
 
-  /* "a_star.pyx":31
+  /* "a_star.pyx":38
  * 
  *         cdef object last_item = self.elements.pop()
  *         if not self.elements:             # <<<<<<<<<<<<<<
@@ -3693,7 +3900,7 @@ static PyObject *__pyx_f_6a_star_13PriorityQueue_pop(struct __pyx_obj_6a_star_Pr
   __pyx_t_1 = (!__pyx_t_2);
   if (__pyx_t_1) {
 
-    /* "a_star.pyx":32
+    /* "a_star.pyx":39
  *         cdef object last_item = self.elements.pop()
  *         if not self.elements:
  *             return last_item[1]             # <<<<<<<<<<<<<<
@@ -3701,13 +3908,13 @@ static PyObject *__pyx_f_6a_star_13PriorityQueue_pop(struct __pyx_obj_6a_star_Pr
  *         top = self.elements[0]
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_3 = __Pyx_GetItemInt(__pyx_v_last_item, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 32, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_GetItemInt(__pyx_v_last_item, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 39, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __pyx_r = __pyx_t_3;
     __pyx_t_3 = 0;
     goto __pyx_L0;
 
-    /* "a_star.pyx":31
+    /* "a_star.pyx":38
  * 
  *         cdef object last_item = self.elements.pop()
  *         if not self.elements:             # <<<<<<<<<<<<<<
@@ -3716,7 +3923,7 @@ static PyObject *__pyx_f_6a_star_13PriorityQueue_pop(struct __pyx_obj_6a_star_Pr
  */
   }
 
-  /* "a_star.pyx":34
+  /* "a_star.pyx":41
  *             return last_item[1]
  * 
  *         top = self.elements[0]             # <<<<<<<<<<<<<<
@@ -3725,14 +3932,14 @@ static PyObject *__pyx_f_6a_star_13PriorityQueue_pop(struct __pyx_obj_6a_star_Pr
  */
   if (unlikely(__pyx_v_self->elements == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-    __PYX_ERR(0, 34, __pyx_L1_error)
+    __PYX_ERR(0, 41, __pyx_L1_error)
   }
-  __pyx_t_3 = __Pyx_GetItemInt_List(__pyx_v_self->elements, 0, long, 1, __Pyx_PyInt_From_long, 1, 0, 1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 34, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_GetItemInt_List(__pyx_v_self->elements, 0, long, 1, __Pyx_PyInt_From_long, 1, 0, 1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 41, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __pyx_v_top = __pyx_t_3;
   __pyx_t_3 = 0;
 
-  /* "a_star.pyx":35
+  /* "a_star.pyx":42
  * 
  *         top = self.elements[0]
  *         self.elements[0] = last_item             # <<<<<<<<<<<<<<
@@ -3741,20 +3948,20 @@ static PyObject *__pyx_f_6a_star_13PriorityQueue_pop(struct __pyx_obj_6a_star_Pr
  */
   if (unlikely(__pyx_v_self->elements == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-    __PYX_ERR(0, 35, __pyx_L1_error)
+    __PYX_ERR(0, 42, __pyx_L1_error)
   }
-  if (unlikely((__Pyx_SetItemInt(__pyx_v_self->elements, 0, __pyx_v_last_item, long, 1, __Pyx_PyInt_From_long, 1, 0, 1) < 0))) __PYX_ERR(0, 35, __pyx_L1_error)
+  if (unlikely((__Pyx_SetItemInt(__pyx_v_self->elements, 0, __pyx_v_last_item, long, 1, __Pyx_PyInt_From_long, 1, 0, 1) < 0))) __PYX_ERR(0, 42, __pyx_L1_error)
 
-  /* "a_star.pyx":36
+  /* "a_star.pyx":43
  *         top = self.elements[0]
  *         self.elements[0] = last_item
  *         self._sift_down(0)             # <<<<<<<<<<<<<<
  *         return top[1]
  * 
  */
-  ((struct __pyx_vtabstruct_6a_star_PriorityQueue *)__pyx_v_self->__pyx_vtab)->_sift_down(__pyx_v_self, 0); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 36, __pyx_L1_error)
+  ((struct __pyx_vtabstruct_6a_star_PriorityQueue *)__pyx_v_self->__pyx_vtab)->_sift_down(__pyx_v_self, 0); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 43, __pyx_L1_error)
 
-  /* "a_star.pyx":37
+  /* "a_star.pyx":44
  *         self.elements[0] = last_item
  *         self._sift_down(0)
  *         return top[1]             # <<<<<<<<<<<<<<
@@ -3762,13 +3969,13 @@ static PyObject *__pyx_f_6a_star_13PriorityQueue_pop(struct __pyx_obj_6a_star_Pr
  *     cdef void _sift_up(self, int idx):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_3 = __Pyx_GetItemInt(__pyx_v_top, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 37, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_GetItemInt(__pyx_v_top, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 44, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __pyx_r = __pyx_t_3;
   __pyx_t_3 = 0;
   goto __pyx_L0;
 
-  /* "a_star.pyx":26
+  /* "a_star.pyx":33
  *         self._sift_up(idx)
  * 
  *     cdef object pop(self):             # <<<<<<<<<<<<<<
@@ -3789,7 +3996,7 @@ static PyObject *__pyx_f_6a_star_13PriorityQueue_pop(struct __pyx_obj_6a_star_Pr
   return __pyx_r;
 }
 
-/* "a_star.pyx":39
+/* "a_star.pyx":46
  *         return top[1]
  * 
  *     cdef void _sift_up(self, int idx):             # <<<<<<<<<<<<<<
@@ -3810,7 +4017,7 @@ static void __pyx_f_6a_star_13PriorityQueue__sift_up(struct __pyx_obj_6a_star_Pr
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("_sift_up", 1);
 
-  /* "a_star.pyx":42
+  /* "a_star.pyx":49
  *         cdef int parent
  *         cdef object tmp
  *         while idx > 0:             # <<<<<<<<<<<<<<
@@ -3821,7 +4028,7 @@ static void __pyx_f_6a_star_13PriorityQueue__sift_up(struct __pyx_obj_6a_star_Pr
     __pyx_t_1 = (__pyx_v_idx > 0);
     if (!__pyx_t_1) break;
 
-    /* "a_star.pyx":43
+    /* "a_star.pyx":50
  *         cdef object tmp
  *         while idx > 0:
  *             parent = (idx - 1) >> 1             # <<<<<<<<<<<<<<
@@ -3830,7 +4037,7 @@ static void __pyx_f_6a_star_13PriorityQueue__sift_up(struct __pyx_obj_6a_star_Pr
  */
     __pyx_v_parent = ((__pyx_v_idx - 1) >> 1);
 
-    /* "a_star.pyx":44
+    /* "a_star.pyx":51
  *         while idx > 0:
  *             parent = (idx - 1) >> 1
  *             if self.elements[idx][0] < self.elements[parent][0]:             # <<<<<<<<<<<<<<
@@ -3839,30 +4046,30 @@ static void __pyx_f_6a_star_13PriorityQueue__sift_up(struct __pyx_obj_6a_star_Pr
  */
     if (unlikely(__pyx_v_self->elements == Py_None)) {
       PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-      __PYX_ERR(0, 44, __pyx_L1_error)
+      __PYX_ERR(0, 51, __pyx_L1_error)
     }
-    __pyx_t_2 = __Pyx_GetItemInt_List(__pyx_v_self->elements, __pyx_v_idx, int, 1, __Pyx_PyInt_From_int, 1, 1, 1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 44, __pyx_L1_error)
+    __pyx_t_2 = __Pyx_GetItemInt_List(__pyx_v_self->elements, __pyx_v_idx, int, 1, __Pyx_PyInt_From_int, 1, 1, 1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 51, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_3 = __Pyx_GetItemInt(__pyx_t_2, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 44, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_GetItemInt(__pyx_t_2, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 51, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     if (unlikely(__pyx_v_self->elements == Py_None)) {
       PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-      __PYX_ERR(0, 44, __pyx_L1_error)
+      __PYX_ERR(0, 51, __pyx_L1_error)
     }
-    __pyx_t_2 = __Pyx_GetItemInt_List(__pyx_v_self->elements, __pyx_v_parent, int, 1, __Pyx_PyInt_From_int, 1, 1, 1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 44, __pyx_L1_error)
+    __pyx_t_2 = __Pyx_GetItemInt_List(__pyx_v_self->elements, __pyx_v_parent, int, 1, __Pyx_PyInt_From_int, 1, 1, 1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 51, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_4 = __Pyx_GetItemInt(__pyx_t_2, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 44, __pyx_L1_error)
+    __pyx_t_4 = __Pyx_GetItemInt(__pyx_t_2, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 51, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __pyx_t_2 = PyObject_RichCompare(__pyx_t_3, __pyx_t_4, Py_LT); __Pyx_XGOTREF(__pyx_t_2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 44, __pyx_L1_error)
+    __pyx_t_2 = PyObject_RichCompare(__pyx_t_3, __pyx_t_4, Py_LT); __Pyx_XGOTREF(__pyx_t_2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 51, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely((__pyx_t_1 < 0))) __PYX_ERR(0, 44, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely((__pyx_t_1 < 0))) __PYX_ERR(0, 51, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     if (__pyx_t_1) {
 
-      /* "a_star.pyx":45
+      /* "a_star.pyx":52
  *             parent = (idx - 1) >> 1
  *             if self.elements[idx][0] < self.elements[parent][0]:
  *                 tmp = self.elements[idx]             # <<<<<<<<<<<<<<
@@ -3871,14 +4078,14 @@ static void __pyx_f_6a_star_13PriorityQueue__sift_up(struct __pyx_obj_6a_star_Pr
  */
       if (unlikely(__pyx_v_self->elements == Py_None)) {
         PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-        __PYX_ERR(0, 45, __pyx_L1_error)
+        __PYX_ERR(0, 52, __pyx_L1_error)
       }
-      __pyx_t_2 = __Pyx_GetItemInt_List(__pyx_v_self->elements, __pyx_v_idx, int, 1, __Pyx_PyInt_From_int, 1, 1, 1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 45, __pyx_L1_error)
+      __pyx_t_2 = __Pyx_GetItemInt_List(__pyx_v_self->elements, __pyx_v_idx, int, 1, __Pyx_PyInt_From_int, 1, 1, 1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 52, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_2);
       __Pyx_XDECREF_SET(__pyx_v_tmp, __pyx_t_2);
       __pyx_t_2 = 0;
 
-      /* "a_star.pyx":46
+      /* "a_star.pyx":53
  *             if self.elements[idx][0] < self.elements[parent][0]:
  *                 tmp = self.elements[idx]
  *                 self.elements[idx] = self.elements[parent]             # <<<<<<<<<<<<<<
@@ -3887,18 +4094,18 @@ static void __pyx_f_6a_star_13PriorityQueue__sift_up(struct __pyx_obj_6a_star_Pr
  */
       if (unlikely(__pyx_v_self->elements == Py_None)) {
         PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-        __PYX_ERR(0, 46, __pyx_L1_error)
+        __PYX_ERR(0, 53, __pyx_L1_error)
       }
-      __pyx_t_2 = __Pyx_GetItemInt_List(__pyx_v_self->elements, __pyx_v_parent, int, 1, __Pyx_PyInt_From_int, 1, 1, 1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 46, __pyx_L1_error)
+      __pyx_t_2 = __Pyx_GetItemInt_List(__pyx_v_self->elements, __pyx_v_parent, int, 1, __Pyx_PyInt_From_int, 1, 1, 1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 53, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_2);
       if (unlikely(__pyx_v_self->elements == Py_None)) {
         PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-        __PYX_ERR(0, 46, __pyx_L1_error)
+        __PYX_ERR(0, 53, __pyx_L1_error)
       }
-      if (unlikely((__Pyx_SetItemInt(__pyx_v_self->elements, __pyx_v_idx, __pyx_t_2, int, 1, __Pyx_PyInt_From_int, 1, 1, 1) < 0))) __PYX_ERR(0, 46, __pyx_L1_error)
+      if (unlikely((__Pyx_SetItemInt(__pyx_v_self->elements, __pyx_v_idx, __pyx_t_2, int, 1, __Pyx_PyInt_From_int, 1, 1, 1) < 0))) __PYX_ERR(0, 53, __pyx_L1_error)
       __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-      /* "a_star.pyx":47
+      /* "a_star.pyx":54
  *                 tmp = self.elements[idx]
  *                 self.elements[idx] = self.elements[parent]
  *                 self.elements[parent] = tmp             # <<<<<<<<<<<<<<
@@ -3907,11 +4114,11 @@ static void __pyx_f_6a_star_13PriorityQueue__sift_up(struct __pyx_obj_6a_star_Pr
  */
       if (unlikely(__pyx_v_self->elements == Py_None)) {
         PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-        __PYX_ERR(0, 47, __pyx_L1_error)
+        __PYX_ERR(0, 54, __pyx_L1_error)
       }
-      if (unlikely((__Pyx_SetItemInt(__pyx_v_self->elements, __pyx_v_parent, __pyx_v_tmp, int, 1, __Pyx_PyInt_From_int, 1, 1, 1) < 0))) __PYX_ERR(0, 47, __pyx_L1_error)
+      if (unlikely((__Pyx_SetItemInt(__pyx_v_self->elements, __pyx_v_parent, __pyx_v_tmp, int, 1, __Pyx_PyInt_From_int, 1, 1, 1) < 0))) __PYX_ERR(0, 54, __pyx_L1_error)
 
-      /* "a_star.pyx":48
+      /* "a_star.pyx":55
  *                 self.elements[idx] = self.elements[parent]
  *                 self.elements[parent] = tmp
  *                 idx = parent             # <<<<<<<<<<<<<<
@@ -3920,7 +4127,7 @@ static void __pyx_f_6a_star_13PriorityQueue__sift_up(struct __pyx_obj_6a_star_Pr
  */
       __pyx_v_idx = __pyx_v_parent;
 
-      /* "a_star.pyx":44
+      /* "a_star.pyx":51
  *         while idx > 0:
  *             parent = (idx - 1) >> 1
  *             if self.elements[idx][0] < self.elements[parent][0]:             # <<<<<<<<<<<<<<
@@ -3930,7 +4137,7 @@ static void __pyx_f_6a_star_13PriorityQueue__sift_up(struct __pyx_obj_6a_star_Pr
       goto __pyx_L5;
     }
 
-    /* "a_star.pyx":50
+    /* "a_star.pyx":57
  *                 idx = parent
  *             else:
  *                 break             # <<<<<<<<<<<<<<
@@ -3944,7 +4151,7 @@ static void __pyx_f_6a_star_13PriorityQueue__sift_up(struct __pyx_obj_6a_star_Pr
   }
   __pyx_L4_break:;
 
-  /* "a_star.pyx":39
+  /* "a_star.pyx":46
  *         return top[1]
  * 
  *     cdef void _sift_up(self, int idx):             # <<<<<<<<<<<<<<
@@ -3964,7 +4171,7 @@ static void __pyx_f_6a_star_13PriorityQueue__sift_up(struct __pyx_obj_6a_star_Pr
   __Pyx_RefNannyFinishContext();
 }
 
-/* "a_star.pyx":52
+/* "a_star.pyx":59
  *                 break
  * 
  *     cdef void _sift_down(self, int idx):             # <<<<<<<<<<<<<<
@@ -3990,7 +4197,7 @@ static void __pyx_f_6a_star_13PriorityQueue__sift_down(struct __pyx_obj_6a_star_
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("_sift_down", 1);
 
-  /* "a_star.pyx":53
+  /* "a_star.pyx":60
  * 
  *     cdef void _sift_down(self, int idx):
  *         cdef int size = len(self.elements)             # <<<<<<<<<<<<<<
@@ -4001,13 +4208,13 @@ static void __pyx_f_6a_star_13PriorityQueue__sift_down(struct __pyx_obj_6a_star_
   __Pyx_INCREF(__pyx_t_1);
   if (unlikely(__pyx_t_1 == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
-    __PYX_ERR(0, 53, __pyx_L1_error)
+    __PYX_ERR(0, 60, __pyx_L1_error)
   }
-  __pyx_t_2 = __Pyx_PyList_GET_SIZE(__pyx_t_1); if (unlikely(__pyx_t_2 == ((Py_ssize_t)-1))) __PYX_ERR(0, 53, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyList_GET_SIZE(__pyx_t_1); if (unlikely(__pyx_t_2 == ((Py_ssize_t)-1))) __PYX_ERR(0, 60, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __pyx_v_size = __pyx_t_2;
 
-  /* "a_star.pyx":57
+  /* "a_star.pyx":64
  *         cdef object tmp
  * 
  *         while True:             # <<<<<<<<<<<<<<
@@ -4016,7 +4223,7 @@ static void __pyx_f_6a_star_13PriorityQueue__sift_down(struct __pyx_obj_6a_star_
  */
   while (1) {
 
-    /* "a_star.pyx":58
+    /* "a_star.pyx":65
  * 
  *         while True:
  *             left = (idx << 1) + 1             # <<<<<<<<<<<<<<
@@ -4025,7 +4232,7 @@ static void __pyx_f_6a_star_13PriorityQueue__sift_down(struct __pyx_obj_6a_star_
  */
     __pyx_v_left = ((__pyx_v_idx << 1) + 1);
 
-    /* "a_star.pyx":59
+    /* "a_star.pyx":66
  *         while True:
  *             left = (idx << 1) + 1
  *             right = (idx << 1) + 2             # <<<<<<<<<<<<<<
@@ -4034,7 +4241,7 @@ static void __pyx_f_6a_star_13PriorityQueue__sift_down(struct __pyx_obj_6a_star_
  */
     __pyx_v_right = ((__pyx_v_idx << 1) + 2);
 
-    /* "a_star.pyx":60
+    /* "a_star.pyx":67
  *             left = (idx << 1) + 1
  *             right = (idx << 1) + 2
  *             smallest = idx             # <<<<<<<<<<<<<<
@@ -4043,7 +4250,7 @@ static void __pyx_f_6a_star_13PriorityQueue__sift_down(struct __pyx_obj_6a_star_
  */
     __pyx_v_smallest = __pyx_v_idx;
 
-    /* "a_star.pyx":62
+    /* "a_star.pyx":69
  *             smallest = idx
  * 
  *             if left < size and self.elements[left][0] < self.elements[smallest][0]:             # <<<<<<<<<<<<<<
@@ -4058,32 +4265,32 @@ static void __pyx_f_6a_star_13PriorityQueue__sift_down(struct __pyx_obj_6a_star_
     }
     if (unlikely(__pyx_v_self->elements == Py_None)) {
       PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-      __PYX_ERR(0, 62, __pyx_L1_error)
+      __PYX_ERR(0, 69, __pyx_L1_error)
     }
-    __pyx_t_1 = __Pyx_GetItemInt_List(__pyx_v_self->elements, __pyx_v_left, int, 1, __Pyx_PyInt_From_int, 1, 1, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 62, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_GetItemInt_List(__pyx_v_self->elements, __pyx_v_left, int, 1, __Pyx_PyInt_From_int, 1, 1, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 69, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_5 = __Pyx_GetItemInt(__pyx_t_1, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 62, __pyx_L1_error)
+    __pyx_t_5 = __Pyx_GetItemInt(__pyx_t_1, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 69, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
     if (unlikely(__pyx_v_self->elements == Py_None)) {
       PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-      __PYX_ERR(0, 62, __pyx_L1_error)
+      __PYX_ERR(0, 69, __pyx_L1_error)
     }
-    __pyx_t_1 = __Pyx_GetItemInt_List(__pyx_v_self->elements, __pyx_v_smallest, int, 1, __Pyx_PyInt_From_int, 1, 1, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 62, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_GetItemInt_List(__pyx_v_self->elements, __pyx_v_smallest, int, 1, __Pyx_PyInt_From_int, 1, 1, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 69, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_6 = __Pyx_GetItemInt(__pyx_t_1, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 62, __pyx_L1_error)
+    __pyx_t_6 = __Pyx_GetItemInt(__pyx_t_1, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 69, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_6);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __pyx_t_1 = PyObject_RichCompare(__pyx_t_5, __pyx_t_6, Py_LT); __Pyx_XGOTREF(__pyx_t_1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 62, __pyx_L1_error)
+    __pyx_t_1 = PyObject_RichCompare(__pyx_t_5, __pyx_t_6, Py_LT); __Pyx_XGOTREF(__pyx_t_1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 69, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
     __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely((__pyx_t_4 < 0))) __PYX_ERR(0, 62, __pyx_L1_error)
+    __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely((__pyx_t_4 < 0))) __PYX_ERR(0, 69, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
     __pyx_t_3 = __pyx_t_4;
     __pyx_L6_bool_binop_done:;
     if (__pyx_t_3) {
 
-      /* "a_star.pyx":63
+      /* "a_star.pyx":70
  * 
  *             if left < size and self.elements[left][0] < self.elements[smallest][0]:
  *                 smallest = left             # <<<<<<<<<<<<<<
@@ -4092,7 +4299,7 @@ static void __pyx_f_6a_star_13PriorityQueue__sift_down(struct __pyx_obj_6a_star_
  */
       __pyx_v_smallest = __pyx_v_left;
 
-      /* "a_star.pyx":62
+      /* "a_star.pyx":69
  *             smallest = idx
  * 
  *             if left < size and self.elements[left][0] < self.elements[smallest][0]:             # <<<<<<<<<<<<<<
@@ -4101,7 +4308,7 @@ static void __pyx_f_6a_star_13PriorityQueue__sift_down(struct __pyx_obj_6a_star_
  */
     }
 
-    /* "a_star.pyx":64
+    /* "a_star.pyx":71
  *             if left < size and self.elements[left][0] < self.elements[smallest][0]:
  *                 smallest = left
  *             if right < size and self.elements[right][0] < self.elements[smallest][0]:             # <<<<<<<<<<<<<<
@@ -4116,32 +4323,32 @@ static void __pyx_f_6a_star_13PriorityQueue__sift_down(struct __pyx_obj_6a_star_
     }
     if (unlikely(__pyx_v_self->elements == Py_None)) {
       PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-      __PYX_ERR(0, 64, __pyx_L1_error)
+      __PYX_ERR(0, 71, __pyx_L1_error)
     }
-    __pyx_t_1 = __Pyx_GetItemInt_List(__pyx_v_self->elements, __pyx_v_right, int, 1, __Pyx_PyInt_From_int, 1, 1, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 64, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_GetItemInt_List(__pyx_v_self->elements, __pyx_v_right, int, 1, __Pyx_PyInt_From_int, 1, 1, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 71, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_6 = __Pyx_GetItemInt(__pyx_t_1, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 64, __pyx_L1_error)
+    __pyx_t_6 = __Pyx_GetItemInt(__pyx_t_1, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 71, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_6);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
     if (unlikely(__pyx_v_self->elements == Py_None)) {
       PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-      __PYX_ERR(0, 64, __pyx_L1_error)
+      __PYX_ERR(0, 71, __pyx_L1_error)
     }
-    __pyx_t_1 = __Pyx_GetItemInt_List(__pyx_v_self->elements, __pyx_v_smallest, int, 1, __Pyx_PyInt_From_int, 1, 1, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 64, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_GetItemInt_List(__pyx_v_self->elements, __pyx_v_smallest, int, 1, __Pyx_PyInt_From_int, 1, 1, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 71, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_5 = __Pyx_GetItemInt(__pyx_t_1, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 64, __pyx_L1_error)
+    __pyx_t_5 = __Pyx_GetItemInt(__pyx_t_1, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 71, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __pyx_t_1 = PyObject_RichCompare(__pyx_t_6, __pyx_t_5, Py_LT); __Pyx_XGOTREF(__pyx_t_1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 64, __pyx_L1_error)
+    __pyx_t_1 = PyObject_RichCompare(__pyx_t_6, __pyx_t_5, Py_LT); __Pyx_XGOTREF(__pyx_t_1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 71, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely((__pyx_t_4 < 0))) __PYX_ERR(0, 64, __pyx_L1_error)
+    __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely((__pyx_t_4 < 0))) __PYX_ERR(0, 71, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
     __pyx_t_3 = __pyx_t_4;
     __pyx_L9_bool_binop_done:;
     if (__pyx_t_3) {
 
-      /* "a_star.pyx":65
+      /* "a_star.pyx":72
  *                 smallest = left
  *             if right < size and self.elements[right][0] < self.elements[smallest][0]:
  *                 smallest = right             # <<<<<<<<<<<<<<
@@ -4150,7 +4357,7 @@ static void __pyx_f_6a_star_13PriorityQueue__sift_down(struct __pyx_obj_6a_star_
  */
       __pyx_v_smallest = __pyx_v_right;
 
-      /* "a_star.pyx":64
+      /* "a_star.pyx":71
  *             if left < size and self.elements[left][0] < self.elements[smallest][0]:
  *                 smallest = left
  *             if right < size and self.elements[right][0] < self.elements[smallest][0]:             # <<<<<<<<<<<<<<
@@ -4159,7 +4366,7 @@ static void __pyx_f_6a_star_13PriorityQueue__sift_down(struct __pyx_obj_6a_star_
  */
     }
 
-    /* "a_star.pyx":67
+    /* "a_star.pyx":74
  *                 smallest = right
  * 
  *             if smallest != idx:             # <<<<<<<<<<<<<<
@@ -4169,7 +4376,7 @@ static void __pyx_f_6a_star_13PriorityQueue__sift_down(struct __pyx_obj_6a_star_
     __pyx_t_3 = (__pyx_v_smallest != __pyx_v_idx);
     if (__pyx_t_3) {
 
-      /* "a_star.pyx":68
+      /* "a_star.pyx":75
  * 
  *             if smallest != idx:
  *                 tmp = self.elements[idx]             # <<<<<<<<<<<<<<
@@ -4178,14 +4385,14 @@ static void __pyx_f_6a_star_13PriorityQueue__sift_down(struct __pyx_obj_6a_star_
  */
       if (unlikely(__pyx_v_self->elements == Py_None)) {
         PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-        __PYX_ERR(0, 68, __pyx_L1_error)
+        __PYX_ERR(0, 75, __pyx_L1_error)
       }
-      __pyx_t_1 = __Pyx_GetItemInt_List(__pyx_v_self->elements, __pyx_v_idx, int, 1, __Pyx_PyInt_From_int, 1, 1, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 68, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_GetItemInt_List(__pyx_v_self->elements, __pyx_v_idx, int, 1, __Pyx_PyInt_From_int, 1, 1, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 75, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
       __Pyx_XDECREF_SET(__pyx_v_tmp, __pyx_t_1);
       __pyx_t_1 = 0;
 
-      /* "a_star.pyx":69
+      /* "a_star.pyx":76
  *             if smallest != idx:
  *                 tmp = self.elements[idx]
  *                 self.elements[idx] = self.elements[smallest]             # <<<<<<<<<<<<<<
@@ -4194,18 +4401,18 @@ static void __pyx_f_6a_star_13PriorityQueue__sift_down(struct __pyx_obj_6a_star_
  */
       if (unlikely(__pyx_v_self->elements == Py_None)) {
         PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-        __PYX_ERR(0, 69, __pyx_L1_error)
+        __PYX_ERR(0, 76, __pyx_L1_error)
       }
-      __pyx_t_1 = __Pyx_GetItemInt_List(__pyx_v_self->elements, __pyx_v_smallest, int, 1, __Pyx_PyInt_From_int, 1, 1, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 69, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_GetItemInt_List(__pyx_v_self->elements, __pyx_v_smallest, int, 1, __Pyx_PyInt_From_int, 1, 1, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 76, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
       if (unlikely(__pyx_v_self->elements == Py_None)) {
         PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-        __PYX_ERR(0, 69, __pyx_L1_error)
+        __PYX_ERR(0, 76, __pyx_L1_error)
       }
-      if (unlikely((__Pyx_SetItemInt(__pyx_v_self->elements, __pyx_v_idx, __pyx_t_1, int, 1, __Pyx_PyInt_From_int, 1, 1, 1) < 0))) __PYX_ERR(0, 69, __pyx_L1_error)
+      if (unlikely((__Pyx_SetItemInt(__pyx_v_self->elements, __pyx_v_idx, __pyx_t_1, int, 1, __Pyx_PyInt_From_int, 1, 1, 1) < 0))) __PYX_ERR(0, 76, __pyx_L1_error)
       __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-      /* "a_star.pyx":70
+      /* "a_star.pyx":77
  *                 tmp = self.elements[idx]
  *                 self.elements[idx] = self.elements[smallest]
  *                 self.elements[smallest] = tmp             # <<<<<<<<<<<<<<
@@ -4214,11 +4421,11 @@ static void __pyx_f_6a_star_13PriorityQueue__sift_down(struct __pyx_obj_6a_star_
  */
       if (unlikely(__pyx_v_self->elements == Py_None)) {
         PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-        __PYX_ERR(0, 70, __pyx_L1_error)
+        __PYX_ERR(0, 77, __pyx_L1_error)
       }
-      if (unlikely((__Pyx_SetItemInt(__pyx_v_self->elements, __pyx_v_smallest, __pyx_v_tmp, int, 1, __Pyx_PyInt_From_int, 1, 1, 1) < 0))) __PYX_ERR(0, 70, __pyx_L1_error)
+      if (unlikely((__Pyx_SetItemInt(__pyx_v_self->elements, __pyx_v_smallest, __pyx_v_tmp, int, 1, __Pyx_PyInt_From_int, 1, 1, 1) < 0))) __PYX_ERR(0, 77, __pyx_L1_error)
 
-      /* "a_star.pyx":71
+      /* "a_star.pyx":78
  *                 self.elements[idx] = self.elements[smallest]
  *                 self.elements[smallest] = tmp
  *                 idx = smallest             # <<<<<<<<<<<<<<
@@ -4227,7 +4434,7 @@ static void __pyx_f_6a_star_13PriorityQueue__sift_down(struct __pyx_obj_6a_star_
  */
       __pyx_v_idx = __pyx_v_smallest;
 
-      /* "a_star.pyx":67
+      /* "a_star.pyx":74
  *                 smallest = right
  * 
  *             if smallest != idx:             # <<<<<<<<<<<<<<
@@ -4237,7 +4444,7 @@ static void __pyx_f_6a_star_13PriorityQueue__sift_down(struct __pyx_obj_6a_star_
       goto __pyx_L11;
     }
 
-    /* "a_star.pyx":73
+    /* "a_star.pyx":80
  *                 idx = smallest
  *             else:
  *                 break             # <<<<<<<<<<<<<<
@@ -4251,7 +4458,7 @@ static void __pyx_f_6a_star_13PriorityQueue__sift_down(struct __pyx_obj_6a_star_
   }
   __pyx_L4_break:;
 
-  /* "a_star.pyx":52
+  /* "a_star.pyx":59
  *                 break
  * 
  *     cdef void _sift_down(self, int idx):             # <<<<<<<<<<<<<<
@@ -4672,7 +4879,7 @@ static PyObject *__pyx_pf_6a_star_13PriorityQueue_4__setstate_cython__(struct __
   return __pyx_r;
 }
 
-/* "a_star.pyx":76
+/* "a_star.pyx":83
  * 
  * 
  * cdef tsp_ordering(goals):             # <<<<<<<<<<<<<<
@@ -4725,7 +4932,7 @@ static PyObject *__pyx_f_6a_star_tsp_ordering(PyObject *__pyx_v_goals) {
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("tsp_ordering", 1);
 
-  /* "a_star.pyx":77
+  /* "a_star.pyx":84
  * 
  * cdef tsp_ordering(goals):
  *     penalty = 10000             # <<<<<<<<<<<<<<
@@ -4735,20 +4942,20 @@ static PyObject *__pyx_f_6a_star_tsp_ordering(PyObject *__pyx_v_goals) {
   __Pyx_INCREF(__pyx_int_10000);
   __pyx_v_penalty = __pyx_int_10000;
 
-  /* "a_star.pyx":78
+  /* "a_star.pyx":85
  * cdef tsp_ordering(goals):
  *     penalty = 10000
  *     n = len(goals)             # <<<<<<<<<<<<<<
  *     dist = [[0] * n for _ in range(n)]
  *     for i in range(n):
  */
-  __pyx_t_1 = PyObject_Length(__pyx_v_goals); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-1))) __PYX_ERR(0, 78, __pyx_L1_error)
-  __pyx_t_2 = PyInt_FromSsize_t(__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 78, __pyx_L1_error)
+  __pyx_t_1 = PyObject_Length(__pyx_v_goals); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-1))) __PYX_ERR(0, 85, __pyx_L1_error)
+  __pyx_t_2 = PyInt_FromSsize_t(__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 85, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __pyx_v_n = __pyx_t_2;
   __pyx_t_2 = 0;
 
-  /* "a_star.pyx":79
+  /* "a_star.pyx":86
  *     penalty = 10000
  *     n = len(goals)
  *     dist = [[0] * n for _ in range(n)]             # <<<<<<<<<<<<<<
@@ -4756,18 +4963,18 @@ static PyObject *__pyx_f_6a_star_tsp_ordering(PyObject *__pyx_v_goals) {
  *         for j in range(n):
  */
   { /* enter inner scope */
-    __pyx_t_2 = PyList_New(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 79, __pyx_L5_error)
+    __pyx_t_2 = PyList_New(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 86, __pyx_L5_error)
     __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_3 = __Pyx_PyObject_CallOneArg(__pyx_builtin_range, __pyx_v_n); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 79, __pyx_L5_error)
+    __pyx_t_3 = __Pyx_PyObject_CallOneArg(__pyx_builtin_range, __pyx_v_n); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 86, __pyx_L5_error)
     __Pyx_GOTREF(__pyx_t_3);
     if (likely(PyList_CheckExact(__pyx_t_3)) || PyTuple_CheckExact(__pyx_t_3)) {
       __pyx_t_4 = __pyx_t_3; __Pyx_INCREF(__pyx_t_4);
       __pyx_t_1 = 0;
       __pyx_t_5 = NULL;
     } else {
-      __pyx_t_1 = -1; __pyx_t_4 = PyObject_GetIter(__pyx_t_3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 79, __pyx_L5_error)
+      __pyx_t_1 = -1; __pyx_t_4 = PyObject_GetIter(__pyx_t_3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 86, __pyx_L5_error)
       __Pyx_GOTREF(__pyx_t_4);
-      __pyx_t_5 = __Pyx_PyObject_GetIterNextFunc(__pyx_t_4); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 79, __pyx_L5_error)
+      __pyx_t_5 = __Pyx_PyObject_GetIterNextFunc(__pyx_t_4); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 86, __pyx_L5_error)
     }
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     for (;;) {
@@ -4776,28 +4983,28 @@ static PyObject *__pyx_f_6a_star_tsp_ordering(PyObject *__pyx_v_goals) {
           {
             Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_4);
             #if !CYTHON_ASSUME_SAFE_MACROS
-            if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 79, __pyx_L5_error)
+            if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 86, __pyx_L5_error)
             #endif
             if (__pyx_t_1 >= __pyx_temp) break;
           }
           #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-          __pyx_t_3 = PyList_GET_ITEM(__pyx_t_4, __pyx_t_1); __Pyx_INCREF(__pyx_t_3); __pyx_t_1++; if (unlikely((0 < 0))) __PYX_ERR(0, 79, __pyx_L5_error)
+          __pyx_t_3 = PyList_GET_ITEM(__pyx_t_4, __pyx_t_1); __Pyx_INCREF(__pyx_t_3); __pyx_t_1++; if (unlikely((0 < 0))) __PYX_ERR(0, 86, __pyx_L5_error)
           #else
-          __pyx_t_3 = __Pyx_PySequence_ITEM(__pyx_t_4, __pyx_t_1); __pyx_t_1++; if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 79, __pyx_L5_error)
+          __pyx_t_3 = __Pyx_PySequence_ITEM(__pyx_t_4, __pyx_t_1); __pyx_t_1++; if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 86, __pyx_L5_error)
           __Pyx_GOTREF(__pyx_t_3);
           #endif
         } else {
           {
             Py_ssize_t __pyx_temp = __Pyx_PyTuple_GET_SIZE(__pyx_t_4);
             #if !CYTHON_ASSUME_SAFE_MACROS
-            if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 79, __pyx_L5_error)
+            if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 86, __pyx_L5_error)
             #endif
             if (__pyx_t_1 >= __pyx_temp) break;
           }
           #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-          __pyx_t_3 = PyTuple_GET_ITEM(__pyx_t_4, __pyx_t_1); __Pyx_INCREF(__pyx_t_3); __pyx_t_1++; if (unlikely((0 < 0))) __PYX_ERR(0, 79, __pyx_L5_error)
+          __pyx_t_3 = PyTuple_GET_ITEM(__pyx_t_4, __pyx_t_1); __Pyx_INCREF(__pyx_t_3); __pyx_t_1++; if (unlikely((0 < 0))) __PYX_ERR(0, 86, __pyx_L5_error)
           #else
-          __pyx_t_3 = __Pyx_PySequence_ITEM(__pyx_t_4, __pyx_t_1); __pyx_t_1++; if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 79, __pyx_L5_error)
+          __pyx_t_3 = __Pyx_PySequence_ITEM(__pyx_t_4, __pyx_t_1); __pyx_t_1++; if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 86, __pyx_L5_error)
           __Pyx_GOTREF(__pyx_t_3);
           #endif
         }
@@ -4807,7 +5014,7 @@ static PyObject *__pyx_f_6a_star_tsp_ordering(PyObject *__pyx_v_goals) {
           PyObject* exc_type = PyErr_Occurred();
           if (exc_type) {
             if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
-            else __PYX_ERR(0, 79, __pyx_L5_error)
+            else __PYX_ERR(0, 86, __pyx_L5_error)
           }
           break;
         }
@@ -4815,17 +5022,17 @@ static PyObject *__pyx_f_6a_star_tsp_ordering(PyObject *__pyx_v_goals) {
       }
       __Pyx_XDECREF_SET(__pyx_7genexpr__pyx_v__, __pyx_t_3);
       __pyx_t_3 = 0;
-      __pyx_t_3 = PyList_New(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 79, __pyx_L5_error)
+      __pyx_t_3 = PyList_New(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 86, __pyx_L5_error)
       __Pyx_GOTREF(__pyx_t_3);
       __Pyx_INCREF(__pyx_int_0);
       __Pyx_GIVEREF(__pyx_int_0);
-      if (__Pyx_PyList_SET_ITEM(__pyx_t_3, 0, __pyx_int_0)) __PYX_ERR(0, 79, __pyx_L5_error);
-      { PyObject* __pyx_temp = PyNumber_InPlaceMultiply(__pyx_t_3, __pyx_v_n); if (unlikely(!__pyx_temp)) __PYX_ERR(0, 79, __pyx_L5_error)
+      if (__Pyx_PyList_SET_ITEM(__pyx_t_3, 0, __pyx_int_0)) __PYX_ERR(0, 86, __pyx_L5_error);
+      { PyObject* __pyx_temp = PyNumber_InPlaceMultiply(__pyx_t_3, __pyx_v_n); if (unlikely(!__pyx_temp)) __PYX_ERR(0, 86, __pyx_L5_error)
         __Pyx_GOTREF(__pyx_temp);
         __Pyx_DECREF(__pyx_t_3);
         __pyx_t_3 = __pyx_temp;
       }
-      if (unlikely(__Pyx_ListComp_Append(__pyx_t_2, (PyObject*)__pyx_t_3))) __PYX_ERR(0, 79, __pyx_L5_error)
+      if (unlikely(__Pyx_ListComp_Append(__pyx_t_2, (PyObject*)__pyx_t_3))) __PYX_ERR(0, 86, __pyx_L5_error)
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     }
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
@@ -4839,23 +5046,23 @@ static PyObject *__pyx_f_6a_star_tsp_ordering(PyObject *__pyx_v_goals) {
   __pyx_v_dist = ((PyObject*)__pyx_t_2);
   __pyx_t_2 = 0;
 
-  /* "a_star.pyx":80
+  /* "a_star.pyx":87
  *     n = len(goals)
  *     dist = [[0] * n for _ in range(n)]
  *     for i in range(n):             # <<<<<<<<<<<<<<
  *         for j in range(n):
  *             dx = abs(goals[i][0] - goals[j][0])
  */
-  __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_builtin_range, __pyx_v_n); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 80, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_builtin_range, __pyx_v_n); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 87, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   if (likely(PyList_CheckExact(__pyx_t_2)) || PyTuple_CheckExact(__pyx_t_2)) {
     __pyx_t_4 = __pyx_t_2; __Pyx_INCREF(__pyx_t_4);
     __pyx_t_1 = 0;
     __pyx_t_5 = NULL;
   } else {
-    __pyx_t_1 = -1; __pyx_t_4 = PyObject_GetIter(__pyx_t_2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 80, __pyx_L1_error)
+    __pyx_t_1 = -1; __pyx_t_4 = PyObject_GetIter(__pyx_t_2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 87, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_5 = __Pyx_PyObject_GetIterNextFunc(__pyx_t_4); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 80, __pyx_L1_error)
+    __pyx_t_5 = __Pyx_PyObject_GetIterNextFunc(__pyx_t_4); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 87, __pyx_L1_error)
   }
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   for (;;) {
@@ -4864,28 +5071,28 @@ static PyObject *__pyx_f_6a_star_tsp_ordering(PyObject *__pyx_v_goals) {
         {
           Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_4);
           #if !CYTHON_ASSUME_SAFE_MACROS
-          if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 80, __pyx_L1_error)
+          if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 87, __pyx_L1_error)
           #endif
           if (__pyx_t_1 >= __pyx_temp) break;
         }
         #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-        __pyx_t_2 = PyList_GET_ITEM(__pyx_t_4, __pyx_t_1); __Pyx_INCREF(__pyx_t_2); __pyx_t_1++; if (unlikely((0 < 0))) __PYX_ERR(0, 80, __pyx_L1_error)
+        __pyx_t_2 = PyList_GET_ITEM(__pyx_t_4, __pyx_t_1); __Pyx_INCREF(__pyx_t_2); __pyx_t_1++; if (unlikely((0 < 0))) __PYX_ERR(0, 87, __pyx_L1_error)
         #else
-        __pyx_t_2 = __Pyx_PySequence_ITEM(__pyx_t_4, __pyx_t_1); __pyx_t_1++; if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 80, __pyx_L1_error)
+        __pyx_t_2 = __Pyx_PySequence_ITEM(__pyx_t_4, __pyx_t_1); __pyx_t_1++; if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 87, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_2);
         #endif
       } else {
         {
           Py_ssize_t __pyx_temp = __Pyx_PyTuple_GET_SIZE(__pyx_t_4);
           #if !CYTHON_ASSUME_SAFE_MACROS
-          if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 80, __pyx_L1_error)
+          if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 87, __pyx_L1_error)
           #endif
           if (__pyx_t_1 >= __pyx_temp) break;
         }
         #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-        __pyx_t_2 = PyTuple_GET_ITEM(__pyx_t_4, __pyx_t_1); __Pyx_INCREF(__pyx_t_2); __pyx_t_1++; if (unlikely((0 < 0))) __PYX_ERR(0, 80, __pyx_L1_error)
+        __pyx_t_2 = PyTuple_GET_ITEM(__pyx_t_4, __pyx_t_1); __Pyx_INCREF(__pyx_t_2); __pyx_t_1++; if (unlikely((0 < 0))) __PYX_ERR(0, 87, __pyx_L1_error)
         #else
-        __pyx_t_2 = __Pyx_PySequence_ITEM(__pyx_t_4, __pyx_t_1); __pyx_t_1++; if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 80, __pyx_L1_error)
+        __pyx_t_2 = __Pyx_PySequence_ITEM(__pyx_t_4, __pyx_t_1); __pyx_t_1++; if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 87, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_2);
         #endif
       }
@@ -4895,7 +5102,7 @@ static PyObject *__pyx_f_6a_star_tsp_ordering(PyObject *__pyx_v_goals) {
         PyObject* exc_type = PyErr_Occurred();
         if (exc_type) {
           if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
-          else __PYX_ERR(0, 80, __pyx_L1_error)
+          else __PYX_ERR(0, 87, __pyx_L1_error)
         }
         break;
       }
@@ -4904,23 +5111,23 @@ static PyObject *__pyx_f_6a_star_tsp_ordering(PyObject *__pyx_v_goals) {
     __Pyx_XDECREF_SET(__pyx_v_i, __pyx_t_2);
     __pyx_t_2 = 0;
 
-    /* "a_star.pyx":81
+    /* "a_star.pyx":88
  *     dist = [[0] * n for _ in range(n)]
  *     for i in range(n):
  *         for j in range(n):             # <<<<<<<<<<<<<<
  *             dx = abs(goals[i][0] - goals[j][0])
  *             dy = abs(goals[i][1] - goals[j][1])
  */
-    __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_builtin_range, __pyx_v_n); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 81, __pyx_L1_error)
+    __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_builtin_range, __pyx_v_n); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 88, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     if (likely(PyList_CheckExact(__pyx_t_2)) || PyTuple_CheckExact(__pyx_t_2)) {
       __pyx_t_3 = __pyx_t_2; __Pyx_INCREF(__pyx_t_3);
       __pyx_t_6 = 0;
       __pyx_t_7 = NULL;
     } else {
-      __pyx_t_6 = -1; __pyx_t_3 = PyObject_GetIter(__pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 81, __pyx_L1_error)
+      __pyx_t_6 = -1; __pyx_t_3 = PyObject_GetIter(__pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 88, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_7 = __Pyx_PyObject_GetIterNextFunc(__pyx_t_3); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 81, __pyx_L1_error)
+      __pyx_t_7 = __Pyx_PyObject_GetIterNextFunc(__pyx_t_3); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 88, __pyx_L1_error)
     }
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     for (;;) {
@@ -4929,28 +5136,28 @@ static PyObject *__pyx_f_6a_star_tsp_ordering(PyObject *__pyx_v_goals) {
           {
             Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_3);
             #if !CYTHON_ASSUME_SAFE_MACROS
-            if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 81, __pyx_L1_error)
+            if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 88, __pyx_L1_error)
             #endif
             if (__pyx_t_6 >= __pyx_temp) break;
           }
           #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-          __pyx_t_2 = PyList_GET_ITEM(__pyx_t_3, __pyx_t_6); __Pyx_INCREF(__pyx_t_2); __pyx_t_6++; if (unlikely((0 < 0))) __PYX_ERR(0, 81, __pyx_L1_error)
+          __pyx_t_2 = PyList_GET_ITEM(__pyx_t_3, __pyx_t_6); __Pyx_INCREF(__pyx_t_2); __pyx_t_6++; if (unlikely((0 < 0))) __PYX_ERR(0, 88, __pyx_L1_error)
           #else
-          __pyx_t_2 = __Pyx_PySequence_ITEM(__pyx_t_3, __pyx_t_6); __pyx_t_6++; if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 81, __pyx_L1_error)
+          __pyx_t_2 = __Pyx_PySequence_ITEM(__pyx_t_3, __pyx_t_6); __pyx_t_6++; if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 88, __pyx_L1_error)
           __Pyx_GOTREF(__pyx_t_2);
           #endif
         } else {
           {
             Py_ssize_t __pyx_temp = __Pyx_PyTuple_GET_SIZE(__pyx_t_3);
             #if !CYTHON_ASSUME_SAFE_MACROS
-            if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 81, __pyx_L1_error)
+            if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 88, __pyx_L1_error)
             #endif
             if (__pyx_t_6 >= __pyx_temp) break;
           }
           #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-          __pyx_t_2 = PyTuple_GET_ITEM(__pyx_t_3, __pyx_t_6); __Pyx_INCREF(__pyx_t_2); __pyx_t_6++; if (unlikely((0 < 0))) __PYX_ERR(0, 81, __pyx_L1_error)
+          __pyx_t_2 = PyTuple_GET_ITEM(__pyx_t_3, __pyx_t_6); __Pyx_INCREF(__pyx_t_2); __pyx_t_6++; if (unlikely((0 < 0))) __PYX_ERR(0, 88, __pyx_L1_error)
           #else
-          __pyx_t_2 = __Pyx_PySequence_ITEM(__pyx_t_3, __pyx_t_6); __pyx_t_6++; if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 81, __pyx_L1_error)
+          __pyx_t_2 = __Pyx_PySequence_ITEM(__pyx_t_3, __pyx_t_6); __pyx_t_6++; if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 88, __pyx_L1_error)
           __Pyx_GOTREF(__pyx_t_2);
           #endif
         }
@@ -4960,7 +5167,7 @@ static PyObject *__pyx_f_6a_star_tsp_ordering(PyObject *__pyx_v_goals) {
           PyObject* exc_type = PyErr_Occurred();
           if (exc_type) {
             if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
-            else __PYX_ERR(0, 81, __pyx_L1_error)
+            else __PYX_ERR(0, 88, __pyx_L1_error)
           }
           break;
         }
@@ -4969,115 +5176,115 @@ static PyObject *__pyx_f_6a_star_tsp_ordering(PyObject *__pyx_v_goals) {
       __Pyx_XDECREF_SET(__pyx_v_j, __pyx_t_2);
       __pyx_t_2 = 0;
 
-      /* "a_star.pyx":82
+      /* "a_star.pyx":89
  *     for i in range(n):
  *         for j in range(n):
  *             dx = abs(goals[i][0] - goals[j][0])             # <<<<<<<<<<<<<<
  *             dy = abs(goals[i][1] - goals[j][1])
  *             cost = dx + dy
  */
-      __pyx_t_2 = __Pyx_PyObject_GetItem(__pyx_v_goals, __pyx_v_i); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 82, __pyx_L1_error)
+      __pyx_t_2 = __Pyx_PyObject_GetItem(__pyx_v_goals, __pyx_v_i); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 89, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_2);
-      __pyx_t_8 = __Pyx_GetItemInt(__pyx_t_2, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 82, __pyx_L1_error)
+      __pyx_t_8 = __Pyx_GetItemInt(__pyx_t_2, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 89, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_8);
       __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __pyx_t_2 = __Pyx_PyObject_GetItem(__pyx_v_goals, __pyx_v_j); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 82, __pyx_L1_error)
+      __pyx_t_2 = __Pyx_PyObject_GetItem(__pyx_v_goals, __pyx_v_j); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 89, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_2);
-      __pyx_t_9 = __Pyx_GetItemInt(__pyx_t_2, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 82, __pyx_L1_error)
+      __pyx_t_9 = __Pyx_GetItemInt(__pyx_t_2, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 89, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_9);
       __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __pyx_t_2 = PyNumber_Subtract(__pyx_t_8, __pyx_t_9); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 82, __pyx_L1_error)
+      __pyx_t_2 = PyNumber_Subtract(__pyx_t_8, __pyx_t_9); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 89, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_2);
       __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
       __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-      __pyx_t_9 = __Pyx_PyNumber_Absolute(__pyx_t_2); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 82, __pyx_L1_error)
+      __pyx_t_9 = __Pyx_PyNumber_Absolute(__pyx_t_2); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 89, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_9);
       __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
       __Pyx_XDECREF_SET(__pyx_v_dx, __pyx_t_9);
       __pyx_t_9 = 0;
 
-      /* "a_star.pyx":83
+      /* "a_star.pyx":90
  *         for j in range(n):
  *             dx = abs(goals[i][0] - goals[j][0])
  *             dy = abs(goals[i][1] - goals[j][1])             # <<<<<<<<<<<<<<
  *             cost = dx + dy
  *             if (1 <= dx <= 8) or (1 <= dy <= 8):
  */
-      __pyx_t_9 = __Pyx_PyObject_GetItem(__pyx_v_goals, __pyx_v_i); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 83, __pyx_L1_error)
+      __pyx_t_9 = __Pyx_PyObject_GetItem(__pyx_v_goals, __pyx_v_i); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 90, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_9);
-      __pyx_t_2 = __Pyx_GetItemInt(__pyx_t_9, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 83, __pyx_L1_error)
+      __pyx_t_2 = __Pyx_GetItemInt(__pyx_t_9, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 90, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_2);
       __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-      __pyx_t_9 = __Pyx_PyObject_GetItem(__pyx_v_goals, __pyx_v_j); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 83, __pyx_L1_error)
+      __pyx_t_9 = __Pyx_PyObject_GetItem(__pyx_v_goals, __pyx_v_j); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 90, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_9);
-      __pyx_t_8 = __Pyx_GetItemInt(__pyx_t_9, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 83, __pyx_L1_error)
+      __pyx_t_8 = __Pyx_GetItemInt(__pyx_t_9, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 90, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_8);
       __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-      __pyx_t_9 = PyNumber_Subtract(__pyx_t_2, __pyx_t_8); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 83, __pyx_L1_error)
+      __pyx_t_9 = PyNumber_Subtract(__pyx_t_2, __pyx_t_8); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 90, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_9);
       __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
       __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-      __pyx_t_8 = __Pyx_PyNumber_Absolute(__pyx_t_9); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 83, __pyx_L1_error)
+      __pyx_t_8 = __Pyx_PyNumber_Absolute(__pyx_t_9); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 90, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_8);
       __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
       __Pyx_XDECREF_SET(__pyx_v_dy, __pyx_t_8);
       __pyx_t_8 = 0;
 
-      /* "a_star.pyx":84
+      /* "a_star.pyx":91
  *             dx = abs(goals[i][0] - goals[j][0])
  *             dy = abs(goals[i][1] - goals[j][1])
  *             cost = dx + dy             # <<<<<<<<<<<<<<
  *             if (1 <= dx <= 8) or (1 <= dy <= 8):
  *                 cost += penalty
  */
-      __pyx_t_8 = PyNumber_Add(__pyx_v_dx, __pyx_v_dy); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 84, __pyx_L1_error)
+      __pyx_t_8 = PyNumber_Add(__pyx_v_dx, __pyx_v_dy); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 91, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_8);
       __Pyx_XDECREF_SET(__pyx_v_cost, __pyx_t_8);
       __pyx_t_8 = 0;
 
-      /* "a_star.pyx":85
+      /* "a_star.pyx":92
  *             dy = abs(goals[i][1] - goals[j][1])
  *             cost = dx + dy
  *             if (1 <= dx <= 8) or (1 <= dy <= 8):             # <<<<<<<<<<<<<<
  *                 cost += penalty
  *             dist[i][j] = cost
  */
-      __pyx_t_8 = PyObject_RichCompare(__pyx_int_1, __pyx_v_dx, Py_LE); __Pyx_XGOTREF(__pyx_t_8); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 85, __pyx_L1_error)
+      __pyx_t_8 = PyObject_RichCompare(__pyx_int_1, __pyx_v_dx, Py_LE); __Pyx_XGOTREF(__pyx_t_8); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 92, __pyx_L1_error)
       if (__Pyx_PyObject_IsTrue(__pyx_t_8)) {
         __Pyx_DECREF(__pyx_t_8);
-        __pyx_t_8 = PyObject_RichCompare(__pyx_v_dx, __pyx_int_8, Py_LE); __Pyx_XGOTREF(__pyx_t_8); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 85, __pyx_L1_error)
+        __pyx_t_8 = PyObject_RichCompare(__pyx_v_dx, __pyx_int_8, Py_LE); __Pyx_XGOTREF(__pyx_t_8); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 92, __pyx_L1_error)
       }
-      __pyx_t_11 = __Pyx_PyObject_IsTrue(__pyx_t_8); if (unlikely((__pyx_t_11 < 0))) __PYX_ERR(0, 85, __pyx_L1_error)
+      __pyx_t_11 = __Pyx_PyObject_IsTrue(__pyx_t_8); if (unlikely((__pyx_t_11 < 0))) __PYX_ERR(0, 92, __pyx_L1_error)
       __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
       if (!__pyx_t_11) {
       } else {
         __pyx_t_10 = __pyx_t_11;
         goto __pyx_L15_bool_binop_done;
       }
-      __pyx_t_8 = PyObject_RichCompare(__pyx_int_1, __pyx_v_dy, Py_LE); __Pyx_XGOTREF(__pyx_t_8); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 85, __pyx_L1_error)
+      __pyx_t_8 = PyObject_RichCompare(__pyx_int_1, __pyx_v_dy, Py_LE); __Pyx_XGOTREF(__pyx_t_8); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 92, __pyx_L1_error)
       if (__Pyx_PyObject_IsTrue(__pyx_t_8)) {
         __Pyx_DECREF(__pyx_t_8);
-        __pyx_t_8 = PyObject_RichCompare(__pyx_v_dy, __pyx_int_8, Py_LE); __Pyx_XGOTREF(__pyx_t_8); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 85, __pyx_L1_error)
+        __pyx_t_8 = PyObject_RichCompare(__pyx_v_dy, __pyx_int_8, Py_LE); __Pyx_XGOTREF(__pyx_t_8); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 92, __pyx_L1_error)
       }
-      __pyx_t_11 = __Pyx_PyObject_IsTrue(__pyx_t_8); if (unlikely((__pyx_t_11 < 0))) __PYX_ERR(0, 85, __pyx_L1_error)
+      __pyx_t_11 = __Pyx_PyObject_IsTrue(__pyx_t_8); if (unlikely((__pyx_t_11 < 0))) __PYX_ERR(0, 92, __pyx_L1_error)
       __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
       __pyx_t_10 = __pyx_t_11;
       __pyx_L15_bool_binop_done:;
       if (__pyx_t_10) {
 
-        /* "a_star.pyx":86
+        /* "a_star.pyx":93
  *             cost = dx + dy
  *             if (1 <= dx <= 8) or (1 <= dy <= 8):
  *                 cost += penalty             # <<<<<<<<<<<<<<
  *             dist[i][j] = cost
  *     dp = {}
  */
-        __pyx_t_8 = PyNumber_InPlaceAdd(__pyx_v_cost, __pyx_v_penalty); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 86, __pyx_L1_error)
+        __pyx_t_8 = PyNumber_InPlaceAdd(__pyx_v_cost, __pyx_v_penalty); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 93, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_8);
         __Pyx_DECREF_SET(__pyx_v_cost, __pyx_t_8);
         __pyx_t_8 = 0;
 
-        /* "a_star.pyx":85
+        /* "a_star.pyx":92
  *             dy = abs(goals[i][1] - goals[j][1])
  *             cost = dx + dy
  *             if (1 <= dx <= 8) or (1 <= dy <= 8):             # <<<<<<<<<<<<<<
@@ -5086,19 +5293,19 @@ static PyObject *__pyx_f_6a_star_tsp_ordering(PyObject *__pyx_v_goals) {
  */
       }
 
-      /* "a_star.pyx":87
+      /* "a_star.pyx":94
  *             if (1 <= dx <= 8) or (1 <= dy <= 8):
  *                 cost += penalty
  *             dist[i][j] = cost             # <<<<<<<<<<<<<<
  *     dp = {}
  *     parent = {}
  */
-      __pyx_t_8 = __Pyx_PyObject_GetItem(__pyx_v_dist, __pyx_v_i); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 87, __pyx_L1_error)
+      __pyx_t_8 = __Pyx_PyObject_GetItem(__pyx_v_dist, __pyx_v_i); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 94, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_8);
-      if (unlikely((PyObject_SetItem(__pyx_t_8, __pyx_v_j, __pyx_v_cost) < 0))) __PYX_ERR(0, 87, __pyx_L1_error)
+      if (unlikely((PyObject_SetItem(__pyx_t_8, __pyx_v_j, __pyx_v_cost) < 0))) __PYX_ERR(0, 94, __pyx_L1_error)
       __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
 
-      /* "a_star.pyx":81
+      /* "a_star.pyx":88
  *     dist = [[0] * n for _ in range(n)]
  *     for i in range(n):
  *         for j in range(n):             # <<<<<<<<<<<<<<
@@ -5108,7 +5315,7 @@ static PyObject *__pyx_f_6a_star_tsp_ordering(PyObject *__pyx_v_goals) {
     }
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-    /* "a_star.pyx":80
+    /* "a_star.pyx":87
  *     n = len(goals)
  *     dist = [[0] * n for _ in range(n)]
  *     for i in range(n):             # <<<<<<<<<<<<<<
@@ -5118,47 +5325,47 @@ static PyObject *__pyx_f_6a_star_tsp_ordering(PyObject *__pyx_v_goals) {
   }
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
 
-  /* "a_star.pyx":88
+  /* "a_star.pyx":95
  *                 cost += penalty
  *             dist[i][j] = cost
  *     dp = {}             # <<<<<<<<<<<<<<
  *     parent = {}
  *     for j in range(n):
  */
-  __pyx_t_4 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 88, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 95, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __pyx_v_dp = ((PyObject*)__pyx_t_4);
   __pyx_t_4 = 0;
 
-  /* "a_star.pyx":89
+  /* "a_star.pyx":96
  *             dist[i][j] = cost
  *     dp = {}
  *     parent = {}             # <<<<<<<<<<<<<<
  *     for j in range(n):
  *         dp[(1 << j, j)] = 0
  */
-  __pyx_t_4 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 89, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 96, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __pyx_v_parent = ((PyObject*)__pyx_t_4);
   __pyx_t_4 = 0;
 
-  /* "a_star.pyx":90
+  /* "a_star.pyx":97
  *     dp = {}
  *     parent = {}
  *     for j in range(n):             # <<<<<<<<<<<<<<
  *         dp[(1 << j, j)] = 0
  *     for mask in range(1 << n):
  */
-  __pyx_t_4 = __Pyx_PyObject_CallOneArg(__pyx_builtin_range, __pyx_v_n); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 90, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyObject_CallOneArg(__pyx_builtin_range, __pyx_v_n); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 97, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   if (likely(PyList_CheckExact(__pyx_t_4)) || PyTuple_CheckExact(__pyx_t_4)) {
     __pyx_t_3 = __pyx_t_4; __Pyx_INCREF(__pyx_t_3);
     __pyx_t_1 = 0;
     __pyx_t_5 = NULL;
   } else {
-    __pyx_t_1 = -1; __pyx_t_3 = PyObject_GetIter(__pyx_t_4); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 90, __pyx_L1_error)
+    __pyx_t_1 = -1; __pyx_t_3 = PyObject_GetIter(__pyx_t_4); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 97, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_5 = __Pyx_PyObject_GetIterNextFunc(__pyx_t_3); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 90, __pyx_L1_error)
+    __pyx_t_5 = __Pyx_PyObject_GetIterNextFunc(__pyx_t_3); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 97, __pyx_L1_error)
   }
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
   for (;;) {
@@ -5167,28 +5374,28 @@ static PyObject *__pyx_f_6a_star_tsp_ordering(PyObject *__pyx_v_goals) {
         {
           Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_3);
           #if !CYTHON_ASSUME_SAFE_MACROS
-          if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 90, __pyx_L1_error)
+          if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 97, __pyx_L1_error)
           #endif
           if (__pyx_t_1 >= __pyx_temp) break;
         }
         #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-        __pyx_t_4 = PyList_GET_ITEM(__pyx_t_3, __pyx_t_1); __Pyx_INCREF(__pyx_t_4); __pyx_t_1++; if (unlikely((0 < 0))) __PYX_ERR(0, 90, __pyx_L1_error)
+        __pyx_t_4 = PyList_GET_ITEM(__pyx_t_3, __pyx_t_1); __Pyx_INCREF(__pyx_t_4); __pyx_t_1++; if (unlikely((0 < 0))) __PYX_ERR(0, 97, __pyx_L1_error)
         #else
-        __pyx_t_4 = __Pyx_PySequence_ITEM(__pyx_t_3, __pyx_t_1); __pyx_t_1++; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 90, __pyx_L1_error)
+        __pyx_t_4 = __Pyx_PySequence_ITEM(__pyx_t_3, __pyx_t_1); __pyx_t_1++; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 97, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_4);
         #endif
       } else {
         {
           Py_ssize_t __pyx_temp = __Pyx_PyTuple_GET_SIZE(__pyx_t_3);
           #if !CYTHON_ASSUME_SAFE_MACROS
-          if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 90, __pyx_L1_error)
+          if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 97, __pyx_L1_error)
           #endif
           if (__pyx_t_1 >= __pyx_temp) break;
         }
         #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-        __pyx_t_4 = PyTuple_GET_ITEM(__pyx_t_3, __pyx_t_1); __Pyx_INCREF(__pyx_t_4); __pyx_t_1++; if (unlikely((0 < 0))) __PYX_ERR(0, 90, __pyx_L1_error)
+        __pyx_t_4 = PyTuple_GET_ITEM(__pyx_t_3, __pyx_t_1); __Pyx_INCREF(__pyx_t_4); __pyx_t_1++; if (unlikely((0 < 0))) __PYX_ERR(0, 97, __pyx_L1_error)
         #else
-        __pyx_t_4 = __Pyx_PySequence_ITEM(__pyx_t_3, __pyx_t_1); __pyx_t_1++; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 90, __pyx_L1_error)
+        __pyx_t_4 = __Pyx_PySequence_ITEM(__pyx_t_3, __pyx_t_1); __pyx_t_1++; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 97, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_4);
         #endif
       }
@@ -5198,7 +5405,7 @@ static PyObject *__pyx_f_6a_star_tsp_ordering(PyObject *__pyx_v_goals) {
         PyObject* exc_type = PyErr_Occurred();
         if (exc_type) {
           if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
-          else __PYX_ERR(0, 90, __pyx_L1_error)
+          else __PYX_ERR(0, 97, __pyx_L1_error)
         }
         break;
       }
@@ -5207,27 +5414,27 @@ static PyObject *__pyx_f_6a_star_tsp_ordering(PyObject *__pyx_v_goals) {
     __Pyx_XDECREF_SET(__pyx_v_j, __pyx_t_4);
     __pyx_t_4 = 0;
 
-    /* "a_star.pyx":91
+    /* "a_star.pyx":98
  *     parent = {}
  *     for j in range(n):
  *         dp[(1 << j, j)] = 0             # <<<<<<<<<<<<<<
  *     for mask in range(1 << n):
  *         for j in range(n):
  */
-    __pyx_t_4 = PyNumber_Lshift(__pyx_int_1, __pyx_v_j); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 91, __pyx_L1_error)
+    __pyx_t_4 = PyNumber_Lshift(__pyx_int_1, __pyx_v_j); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 98, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_8 = PyTuple_New(2); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 91, __pyx_L1_error)
+    __pyx_t_8 = PyTuple_New(2); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 98, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_8);
     __Pyx_GIVEREF(__pyx_t_4);
-    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_4)) __PYX_ERR(0, 91, __pyx_L1_error);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_4)) __PYX_ERR(0, 98, __pyx_L1_error);
     __Pyx_INCREF(__pyx_v_j);
     __Pyx_GIVEREF(__pyx_v_j);
-    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_8, 1, __pyx_v_j)) __PYX_ERR(0, 91, __pyx_L1_error);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_8, 1, __pyx_v_j)) __PYX_ERR(0, 98, __pyx_L1_error);
     __pyx_t_4 = 0;
-    if (unlikely((PyDict_SetItem(__pyx_v_dp, __pyx_t_8, __pyx_int_0) < 0))) __PYX_ERR(0, 91, __pyx_L1_error)
+    if (unlikely((PyDict_SetItem(__pyx_v_dp, __pyx_t_8, __pyx_int_0) < 0))) __PYX_ERR(0, 98, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
 
-    /* "a_star.pyx":90
+    /* "a_star.pyx":97
  *     dp = {}
  *     parent = {}
  *     for j in range(n):             # <<<<<<<<<<<<<<
@@ -5237,16 +5444,16 @@ static PyObject *__pyx_f_6a_star_tsp_ordering(PyObject *__pyx_v_goals) {
   }
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-  /* "a_star.pyx":92
+  /* "a_star.pyx":99
  *     for j in range(n):
  *         dp[(1 << j, j)] = 0
  *     for mask in range(1 << n):             # <<<<<<<<<<<<<<
  *         for j in range(n):
  *             if (mask & (1 << j)) == 0:
  */
-  __pyx_t_3 = PyNumber_Lshift(__pyx_int_1, __pyx_v_n); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 92, __pyx_L1_error)
+  __pyx_t_3 = PyNumber_Lshift(__pyx_int_1, __pyx_v_n); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 99, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_8 = __Pyx_PyObject_CallOneArg(__pyx_builtin_range, __pyx_t_3); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 92, __pyx_L1_error)
+  __pyx_t_8 = __Pyx_PyObject_CallOneArg(__pyx_builtin_range, __pyx_t_3); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 99, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_8);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   if (likely(PyList_CheckExact(__pyx_t_8)) || PyTuple_CheckExact(__pyx_t_8)) {
@@ -5254,9 +5461,9 @@ static PyObject *__pyx_f_6a_star_tsp_ordering(PyObject *__pyx_v_goals) {
     __pyx_t_1 = 0;
     __pyx_t_5 = NULL;
   } else {
-    __pyx_t_1 = -1; __pyx_t_3 = PyObject_GetIter(__pyx_t_8); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 92, __pyx_L1_error)
+    __pyx_t_1 = -1; __pyx_t_3 = PyObject_GetIter(__pyx_t_8); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 99, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_5 = __Pyx_PyObject_GetIterNextFunc(__pyx_t_3); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 92, __pyx_L1_error)
+    __pyx_t_5 = __Pyx_PyObject_GetIterNextFunc(__pyx_t_3); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 99, __pyx_L1_error)
   }
   __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
   for (;;) {
@@ -5265,28 +5472,28 @@ static PyObject *__pyx_f_6a_star_tsp_ordering(PyObject *__pyx_v_goals) {
         {
           Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_3);
           #if !CYTHON_ASSUME_SAFE_MACROS
-          if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 92, __pyx_L1_error)
+          if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 99, __pyx_L1_error)
           #endif
           if (__pyx_t_1 >= __pyx_temp) break;
         }
         #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-        __pyx_t_8 = PyList_GET_ITEM(__pyx_t_3, __pyx_t_1); __Pyx_INCREF(__pyx_t_8); __pyx_t_1++; if (unlikely((0 < 0))) __PYX_ERR(0, 92, __pyx_L1_error)
+        __pyx_t_8 = PyList_GET_ITEM(__pyx_t_3, __pyx_t_1); __Pyx_INCREF(__pyx_t_8); __pyx_t_1++; if (unlikely((0 < 0))) __PYX_ERR(0, 99, __pyx_L1_error)
         #else
-        __pyx_t_8 = __Pyx_PySequence_ITEM(__pyx_t_3, __pyx_t_1); __pyx_t_1++; if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 92, __pyx_L1_error)
+        __pyx_t_8 = __Pyx_PySequence_ITEM(__pyx_t_3, __pyx_t_1); __pyx_t_1++; if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 99, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_8);
         #endif
       } else {
         {
           Py_ssize_t __pyx_temp = __Pyx_PyTuple_GET_SIZE(__pyx_t_3);
           #if !CYTHON_ASSUME_SAFE_MACROS
-          if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 92, __pyx_L1_error)
+          if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 99, __pyx_L1_error)
           #endif
           if (__pyx_t_1 >= __pyx_temp) break;
         }
         #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-        __pyx_t_8 = PyTuple_GET_ITEM(__pyx_t_3, __pyx_t_1); __Pyx_INCREF(__pyx_t_8); __pyx_t_1++; if (unlikely((0 < 0))) __PYX_ERR(0, 92, __pyx_L1_error)
+        __pyx_t_8 = PyTuple_GET_ITEM(__pyx_t_3, __pyx_t_1); __Pyx_INCREF(__pyx_t_8); __pyx_t_1++; if (unlikely((0 < 0))) __PYX_ERR(0, 99, __pyx_L1_error)
         #else
-        __pyx_t_8 = __Pyx_PySequence_ITEM(__pyx_t_3, __pyx_t_1); __pyx_t_1++; if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 92, __pyx_L1_error)
+        __pyx_t_8 = __Pyx_PySequence_ITEM(__pyx_t_3, __pyx_t_1); __pyx_t_1++; if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 99, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_8);
         #endif
       }
@@ -5296,7 +5503,7 @@ static PyObject *__pyx_f_6a_star_tsp_ordering(PyObject *__pyx_v_goals) {
         PyObject* exc_type = PyErr_Occurred();
         if (exc_type) {
           if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
-          else __PYX_ERR(0, 92, __pyx_L1_error)
+          else __PYX_ERR(0, 99, __pyx_L1_error)
         }
         break;
       }
@@ -5305,23 +5512,23 @@ static PyObject *__pyx_f_6a_star_tsp_ordering(PyObject *__pyx_v_goals) {
     __Pyx_XDECREF_SET(__pyx_v_mask, __pyx_t_8);
     __pyx_t_8 = 0;
 
-    /* "a_star.pyx":93
+    /* "a_star.pyx":100
  *         dp[(1 << j, j)] = 0
  *     for mask in range(1 << n):
  *         for j in range(n):             # <<<<<<<<<<<<<<
  *             if (mask & (1 << j)) == 0:
  *                 continue
  */
-    __pyx_t_8 = __Pyx_PyObject_CallOneArg(__pyx_builtin_range, __pyx_v_n); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 93, __pyx_L1_error)
+    __pyx_t_8 = __Pyx_PyObject_CallOneArg(__pyx_builtin_range, __pyx_v_n); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 100, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_8);
     if (likely(PyList_CheckExact(__pyx_t_8)) || PyTuple_CheckExact(__pyx_t_8)) {
       __pyx_t_4 = __pyx_t_8; __Pyx_INCREF(__pyx_t_4);
       __pyx_t_6 = 0;
       __pyx_t_7 = NULL;
     } else {
-      __pyx_t_6 = -1; __pyx_t_4 = PyObject_GetIter(__pyx_t_8); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 93, __pyx_L1_error)
+      __pyx_t_6 = -1; __pyx_t_4 = PyObject_GetIter(__pyx_t_8); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 100, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_4);
-      __pyx_t_7 = __Pyx_PyObject_GetIterNextFunc(__pyx_t_4); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 93, __pyx_L1_error)
+      __pyx_t_7 = __Pyx_PyObject_GetIterNextFunc(__pyx_t_4); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 100, __pyx_L1_error)
     }
     __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
     for (;;) {
@@ -5330,28 +5537,28 @@ static PyObject *__pyx_f_6a_star_tsp_ordering(PyObject *__pyx_v_goals) {
           {
             Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_4);
             #if !CYTHON_ASSUME_SAFE_MACROS
-            if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 93, __pyx_L1_error)
+            if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 100, __pyx_L1_error)
             #endif
             if (__pyx_t_6 >= __pyx_temp) break;
           }
           #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-          __pyx_t_8 = PyList_GET_ITEM(__pyx_t_4, __pyx_t_6); __Pyx_INCREF(__pyx_t_8); __pyx_t_6++; if (unlikely((0 < 0))) __PYX_ERR(0, 93, __pyx_L1_error)
+          __pyx_t_8 = PyList_GET_ITEM(__pyx_t_4, __pyx_t_6); __Pyx_INCREF(__pyx_t_8); __pyx_t_6++; if (unlikely((0 < 0))) __PYX_ERR(0, 100, __pyx_L1_error)
           #else
-          __pyx_t_8 = __Pyx_PySequence_ITEM(__pyx_t_4, __pyx_t_6); __pyx_t_6++; if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 93, __pyx_L1_error)
+          __pyx_t_8 = __Pyx_PySequence_ITEM(__pyx_t_4, __pyx_t_6); __pyx_t_6++; if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 100, __pyx_L1_error)
           __Pyx_GOTREF(__pyx_t_8);
           #endif
         } else {
           {
             Py_ssize_t __pyx_temp = __Pyx_PyTuple_GET_SIZE(__pyx_t_4);
             #if !CYTHON_ASSUME_SAFE_MACROS
-            if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 93, __pyx_L1_error)
+            if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 100, __pyx_L1_error)
             #endif
             if (__pyx_t_6 >= __pyx_temp) break;
           }
           #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-          __pyx_t_8 = PyTuple_GET_ITEM(__pyx_t_4, __pyx_t_6); __Pyx_INCREF(__pyx_t_8); __pyx_t_6++; if (unlikely((0 < 0))) __PYX_ERR(0, 93, __pyx_L1_error)
+          __pyx_t_8 = PyTuple_GET_ITEM(__pyx_t_4, __pyx_t_6); __Pyx_INCREF(__pyx_t_8); __pyx_t_6++; if (unlikely((0 < 0))) __PYX_ERR(0, 100, __pyx_L1_error)
           #else
-          __pyx_t_8 = __Pyx_PySequence_ITEM(__pyx_t_4, __pyx_t_6); __pyx_t_6++; if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 93, __pyx_L1_error)
+          __pyx_t_8 = __Pyx_PySequence_ITEM(__pyx_t_4, __pyx_t_6); __pyx_t_6++; if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 100, __pyx_L1_error)
           __Pyx_GOTREF(__pyx_t_8);
           #endif
         }
@@ -5361,7 +5568,7 @@ static PyObject *__pyx_f_6a_star_tsp_ordering(PyObject *__pyx_v_goals) {
           PyObject* exc_type = PyErr_Occurred();
           if (exc_type) {
             if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
-            else __PYX_ERR(0, 93, __pyx_L1_error)
+            else __PYX_ERR(0, 100, __pyx_L1_error)
           }
           break;
         }
@@ -5370,23 +5577,23 @@ static PyObject *__pyx_f_6a_star_tsp_ordering(PyObject *__pyx_v_goals) {
       __Pyx_XDECREF_SET(__pyx_v_j, __pyx_t_8);
       __pyx_t_8 = 0;
 
-      /* "a_star.pyx":94
+      /* "a_star.pyx":101
  *     for mask in range(1 << n):
  *         for j in range(n):
  *             if (mask & (1 << j)) == 0:             # <<<<<<<<<<<<<<
  *                 continue
  *             if (mask, j) not in dp:
  */
-      __pyx_t_8 = PyNumber_Lshift(__pyx_int_1, __pyx_v_j); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 94, __pyx_L1_error)
+      __pyx_t_8 = PyNumber_Lshift(__pyx_int_1, __pyx_v_j); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 101, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_8);
-      __pyx_t_9 = PyNumber_And(__pyx_v_mask, __pyx_t_8); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 94, __pyx_L1_error)
+      __pyx_t_9 = PyNumber_And(__pyx_v_mask, __pyx_t_8); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 101, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_9);
       __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-      __pyx_t_10 = (__Pyx_PyInt_BoolEqObjC(__pyx_t_9, __pyx_int_0, 0, 0)); if (unlikely((__pyx_t_10 < 0))) __PYX_ERR(0, 94, __pyx_L1_error)
+      __pyx_t_10 = (__Pyx_PyInt_BoolEqObjC(__pyx_t_9, __pyx_int_0, 0, 0)); if (unlikely((__pyx_t_10 < 0))) __PYX_ERR(0, 101, __pyx_L1_error)
       __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
       if (__pyx_t_10) {
 
-        /* "a_star.pyx":95
+        /* "a_star.pyx":102
  *         for j in range(n):
  *             if (mask & (1 << j)) == 0:
  *                 continue             # <<<<<<<<<<<<<<
@@ -5395,7 +5602,7 @@ static PyObject *__pyx_f_6a_star_tsp_ordering(PyObject *__pyx_v_goals) {
  */
         goto __pyx_L24_continue;
 
-        /* "a_star.pyx":94
+        /* "a_star.pyx":101
  *     for mask in range(1 << n):
  *         for j in range(n):
  *             if (mask & (1 << j)) == 0:             # <<<<<<<<<<<<<<
@@ -5404,26 +5611,26 @@ static PyObject *__pyx_f_6a_star_tsp_ordering(PyObject *__pyx_v_goals) {
  */
       }
 
-      /* "a_star.pyx":96
+      /* "a_star.pyx":103
  *             if (mask & (1 << j)) == 0:
  *                 continue
  *             if (mask, j) not in dp:             # <<<<<<<<<<<<<<
  *                 continue
  *             base = dp[(mask, j)]
  */
-      __pyx_t_9 = PyTuple_New(2); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 96, __pyx_L1_error)
+      __pyx_t_9 = PyTuple_New(2); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 103, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_9);
       __Pyx_INCREF(__pyx_v_mask);
       __Pyx_GIVEREF(__pyx_v_mask);
-      if (__Pyx_PyTuple_SET_ITEM(__pyx_t_9, 0, __pyx_v_mask)) __PYX_ERR(0, 96, __pyx_L1_error);
+      if (__Pyx_PyTuple_SET_ITEM(__pyx_t_9, 0, __pyx_v_mask)) __PYX_ERR(0, 103, __pyx_L1_error);
       __Pyx_INCREF(__pyx_v_j);
       __Pyx_GIVEREF(__pyx_v_j);
-      if (__Pyx_PyTuple_SET_ITEM(__pyx_t_9, 1, __pyx_v_j)) __PYX_ERR(0, 96, __pyx_L1_error);
-      __pyx_t_10 = (__Pyx_PyDict_ContainsTF(__pyx_t_9, __pyx_v_dp, Py_NE)); if (unlikely((__pyx_t_10 < 0))) __PYX_ERR(0, 96, __pyx_L1_error)
+      if (__Pyx_PyTuple_SET_ITEM(__pyx_t_9, 1, __pyx_v_j)) __PYX_ERR(0, 103, __pyx_L1_error);
+      __pyx_t_10 = (__Pyx_PyDict_ContainsTF(__pyx_t_9, __pyx_v_dp, Py_NE)); if (unlikely((__pyx_t_10 < 0))) __PYX_ERR(0, 103, __pyx_L1_error)
       __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
       if (__pyx_t_10) {
 
-        /* "a_star.pyx":97
+        /* "a_star.pyx":104
  *                 continue
  *             if (mask, j) not in dp:
  *                 continue             # <<<<<<<<<<<<<<
@@ -5432,7 +5639,7 @@ static PyObject *__pyx_f_6a_star_tsp_ordering(PyObject *__pyx_v_goals) {
  */
         goto __pyx_L24_continue;
 
-        /* "a_star.pyx":96
+        /* "a_star.pyx":103
  *             if (mask & (1 << j)) == 0:
  *                 continue
  *             if (mask, j) not in dp:             # <<<<<<<<<<<<<<
@@ -5441,44 +5648,44 @@ static PyObject *__pyx_f_6a_star_tsp_ordering(PyObject *__pyx_v_goals) {
  */
       }
 
-      /* "a_star.pyx":98
+      /* "a_star.pyx":105
  *             if (mask, j) not in dp:
  *                 continue
  *             base = dp[(mask, j)]             # <<<<<<<<<<<<<<
  *             for k in range(n):
  *                 if mask & (1 << k):
  */
-      __pyx_t_9 = PyTuple_New(2); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 98, __pyx_L1_error)
+      __pyx_t_9 = PyTuple_New(2); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 105, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_9);
       __Pyx_INCREF(__pyx_v_mask);
       __Pyx_GIVEREF(__pyx_v_mask);
-      if (__Pyx_PyTuple_SET_ITEM(__pyx_t_9, 0, __pyx_v_mask)) __PYX_ERR(0, 98, __pyx_L1_error);
+      if (__Pyx_PyTuple_SET_ITEM(__pyx_t_9, 0, __pyx_v_mask)) __PYX_ERR(0, 105, __pyx_L1_error);
       __Pyx_INCREF(__pyx_v_j);
       __Pyx_GIVEREF(__pyx_v_j);
-      if (__Pyx_PyTuple_SET_ITEM(__pyx_t_9, 1, __pyx_v_j)) __PYX_ERR(0, 98, __pyx_L1_error);
-      __pyx_t_8 = __Pyx_PyDict_GetItem(__pyx_v_dp, __pyx_t_9); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 98, __pyx_L1_error)
+      if (__Pyx_PyTuple_SET_ITEM(__pyx_t_9, 1, __pyx_v_j)) __PYX_ERR(0, 105, __pyx_L1_error);
+      __pyx_t_8 = __Pyx_PyDict_GetItem(__pyx_v_dp, __pyx_t_9); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 105, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_8);
       __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
       __Pyx_XDECREF_SET(__pyx_v_base, __pyx_t_8);
       __pyx_t_8 = 0;
 
-      /* "a_star.pyx":99
+      /* "a_star.pyx":106
  *                 continue
  *             base = dp[(mask, j)]
  *             for k in range(n):             # <<<<<<<<<<<<<<
  *                 if mask & (1 << k):
  *                     continue
  */
-      __pyx_t_8 = __Pyx_PyObject_CallOneArg(__pyx_builtin_range, __pyx_v_n); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 99, __pyx_L1_error)
+      __pyx_t_8 = __Pyx_PyObject_CallOneArg(__pyx_builtin_range, __pyx_v_n); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 106, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_8);
       if (likely(PyList_CheckExact(__pyx_t_8)) || PyTuple_CheckExact(__pyx_t_8)) {
         __pyx_t_9 = __pyx_t_8; __Pyx_INCREF(__pyx_t_9);
         __pyx_t_12 = 0;
         __pyx_t_13 = NULL;
       } else {
-        __pyx_t_12 = -1; __pyx_t_9 = PyObject_GetIter(__pyx_t_8); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 99, __pyx_L1_error)
+        __pyx_t_12 = -1; __pyx_t_9 = PyObject_GetIter(__pyx_t_8); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 106, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_9);
-        __pyx_t_13 = __Pyx_PyObject_GetIterNextFunc(__pyx_t_9); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 99, __pyx_L1_error)
+        __pyx_t_13 = __Pyx_PyObject_GetIterNextFunc(__pyx_t_9); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 106, __pyx_L1_error)
       }
       __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
       for (;;) {
@@ -5487,28 +5694,28 @@ static PyObject *__pyx_f_6a_star_tsp_ordering(PyObject *__pyx_v_goals) {
             {
               Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_9);
               #if !CYTHON_ASSUME_SAFE_MACROS
-              if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 99, __pyx_L1_error)
+              if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 106, __pyx_L1_error)
               #endif
               if (__pyx_t_12 >= __pyx_temp) break;
             }
             #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-            __pyx_t_8 = PyList_GET_ITEM(__pyx_t_9, __pyx_t_12); __Pyx_INCREF(__pyx_t_8); __pyx_t_12++; if (unlikely((0 < 0))) __PYX_ERR(0, 99, __pyx_L1_error)
+            __pyx_t_8 = PyList_GET_ITEM(__pyx_t_9, __pyx_t_12); __Pyx_INCREF(__pyx_t_8); __pyx_t_12++; if (unlikely((0 < 0))) __PYX_ERR(0, 106, __pyx_L1_error)
             #else
-            __pyx_t_8 = __Pyx_PySequence_ITEM(__pyx_t_9, __pyx_t_12); __pyx_t_12++; if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 99, __pyx_L1_error)
+            __pyx_t_8 = __Pyx_PySequence_ITEM(__pyx_t_9, __pyx_t_12); __pyx_t_12++; if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 106, __pyx_L1_error)
             __Pyx_GOTREF(__pyx_t_8);
             #endif
           } else {
             {
               Py_ssize_t __pyx_temp = __Pyx_PyTuple_GET_SIZE(__pyx_t_9);
               #if !CYTHON_ASSUME_SAFE_MACROS
-              if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 99, __pyx_L1_error)
+              if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 106, __pyx_L1_error)
               #endif
               if (__pyx_t_12 >= __pyx_temp) break;
             }
             #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-            __pyx_t_8 = PyTuple_GET_ITEM(__pyx_t_9, __pyx_t_12); __Pyx_INCREF(__pyx_t_8); __pyx_t_12++; if (unlikely((0 < 0))) __PYX_ERR(0, 99, __pyx_L1_error)
+            __pyx_t_8 = PyTuple_GET_ITEM(__pyx_t_9, __pyx_t_12); __Pyx_INCREF(__pyx_t_8); __pyx_t_12++; if (unlikely((0 < 0))) __PYX_ERR(0, 106, __pyx_L1_error)
             #else
-            __pyx_t_8 = __Pyx_PySequence_ITEM(__pyx_t_9, __pyx_t_12); __pyx_t_12++; if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 99, __pyx_L1_error)
+            __pyx_t_8 = __Pyx_PySequence_ITEM(__pyx_t_9, __pyx_t_12); __pyx_t_12++; if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 106, __pyx_L1_error)
             __Pyx_GOTREF(__pyx_t_8);
             #endif
           }
@@ -5518,7 +5725,7 @@ static PyObject *__pyx_f_6a_star_tsp_ordering(PyObject *__pyx_v_goals) {
             PyObject* exc_type = PyErr_Occurred();
             if (exc_type) {
               if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
-              else __PYX_ERR(0, 99, __pyx_L1_error)
+              else __PYX_ERR(0, 106, __pyx_L1_error)
             }
             break;
           }
@@ -5527,23 +5734,23 @@ static PyObject *__pyx_f_6a_star_tsp_ordering(PyObject *__pyx_v_goals) {
         __Pyx_XDECREF_SET(__pyx_v_k, __pyx_t_8);
         __pyx_t_8 = 0;
 
-        /* "a_star.pyx":100
+        /* "a_star.pyx":107
  *             base = dp[(mask, j)]
  *             for k in range(n):
  *                 if mask & (1 << k):             # <<<<<<<<<<<<<<
  *                     continue
  *                 new_mask = mask | (1 << k)
  */
-        __pyx_t_8 = PyNumber_Lshift(__pyx_int_1, __pyx_v_k); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 100, __pyx_L1_error)
+        __pyx_t_8 = PyNumber_Lshift(__pyx_int_1, __pyx_v_k); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 107, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_8);
-        __pyx_t_2 = PyNumber_And(__pyx_v_mask, __pyx_t_8); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 100, __pyx_L1_error)
+        __pyx_t_2 = PyNumber_And(__pyx_v_mask, __pyx_t_8); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 107, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_2);
         __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-        __pyx_t_10 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely((__pyx_t_10 < 0))) __PYX_ERR(0, 100, __pyx_L1_error)
+        __pyx_t_10 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely((__pyx_t_10 < 0))) __PYX_ERR(0, 107, __pyx_L1_error)
         __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
         if (__pyx_t_10) {
 
-          /* "a_star.pyx":101
+          /* "a_star.pyx":108
  *             for k in range(n):
  *                 if mask & (1 << k):
  *                     continue             # <<<<<<<<<<<<<<
@@ -5552,7 +5759,7 @@ static PyObject *__pyx_f_6a_star_tsp_ordering(PyObject *__pyx_v_goals) {
  */
           goto __pyx_L28_continue;
 
-          /* "a_star.pyx":100
+          /* "a_star.pyx":107
  *             base = dp[(mask, j)]
  *             for k in range(n):
  *                 if mask & (1 << k):             # <<<<<<<<<<<<<<
@@ -5561,113 +5768,113 @@ static PyObject *__pyx_f_6a_star_tsp_ordering(PyObject *__pyx_v_goals) {
  */
         }
 
-        /* "a_star.pyx":102
+        /* "a_star.pyx":109
  *                 if mask & (1 << k):
  *                     continue
  *                 new_mask = mask | (1 << k)             # <<<<<<<<<<<<<<
  *                 new_cost = base + dist[j][k]
  *                 if new_cost < dp.get((new_mask, k), float('inf')):
  */
-        __pyx_t_2 = PyNumber_Lshift(__pyx_int_1, __pyx_v_k); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 102, __pyx_L1_error)
+        __pyx_t_2 = PyNumber_Lshift(__pyx_int_1, __pyx_v_k); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 109, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_2);
-        __pyx_t_8 = PyNumber_Or(__pyx_v_mask, __pyx_t_2); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 102, __pyx_L1_error)
+        __pyx_t_8 = PyNumber_Or(__pyx_v_mask, __pyx_t_2); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 109, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_8);
         __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
         __Pyx_XDECREF_SET(__pyx_v_new_mask, __pyx_t_8);
         __pyx_t_8 = 0;
 
-        /* "a_star.pyx":103
+        /* "a_star.pyx":110
  *                     continue
  *                 new_mask = mask | (1 << k)
  *                 new_cost = base + dist[j][k]             # <<<<<<<<<<<<<<
  *                 if new_cost < dp.get((new_mask, k), float('inf')):
  *                     dp[(new_mask, k)] = new_cost
  */
-        __pyx_t_8 = __Pyx_PyObject_GetItem(__pyx_v_dist, __pyx_v_j); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 103, __pyx_L1_error)
+        __pyx_t_8 = __Pyx_PyObject_GetItem(__pyx_v_dist, __pyx_v_j); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 110, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_8);
-        __pyx_t_2 = __Pyx_PyObject_GetItem(__pyx_t_8, __pyx_v_k); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 103, __pyx_L1_error)
+        __pyx_t_2 = __Pyx_PyObject_GetItem(__pyx_t_8, __pyx_v_k); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 110, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_2);
         __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-        __pyx_t_8 = PyNumber_Add(__pyx_v_base, __pyx_t_2); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 103, __pyx_L1_error)
+        __pyx_t_8 = PyNumber_Add(__pyx_v_base, __pyx_t_2); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 110, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_8);
         __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
         __Pyx_XDECREF_SET(__pyx_v_new_cost, __pyx_t_8);
         __pyx_t_8 = 0;
 
-        /* "a_star.pyx":104
+        /* "a_star.pyx":111
  *                 new_mask = mask | (1 << k)
  *                 new_cost = base + dist[j][k]
  *                 if new_cost < dp.get((new_mask, k), float('inf')):             # <<<<<<<<<<<<<<
  *                     dp[(new_mask, k)] = new_cost
  *                     parent[(new_mask, k)] = (mask, j)
  */
-        __pyx_t_8 = PyTuple_New(2); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 104, __pyx_L1_error)
+        __pyx_t_8 = PyTuple_New(2); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 111, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_8);
         __Pyx_INCREF(__pyx_v_new_mask);
         __Pyx_GIVEREF(__pyx_v_new_mask);
-        if (__Pyx_PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_v_new_mask)) __PYX_ERR(0, 104, __pyx_L1_error);
+        if (__Pyx_PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_v_new_mask)) __PYX_ERR(0, 111, __pyx_L1_error);
         __Pyx_INCREF(__pyx_v_k);
         __Pyx_GIVEREF(__pyx_v_k);
-        if (__Pyx_PyTuple_SET_ITEM(__pyx_t_8, 1, __pyx_v_k)) __PYX_ERR(0, 104, __pyx_L1_error);
-        __pyx_t_14 = __Pyx_PyString_AsDouble(__pyx_n_s_inf); if (unlikely(__pyx_t_14 == ((double)((double)-1)) && PyErr_Occurred())) __PYX_ERR(0, 104, __pyx_L1_error)
-        __pyx_t_2 = PyFloat_FromDouble(__pyx_t_14); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 104, __pyx_L1_error)
+        if (__Pyx_PyTuple_SET_ITEM(__pyx_t_8, 1, __pyx_v_k)) __PYX_ERR(0, 111, __pyx_L1_error);
+        __pyx_t_14 = __Pyx_PyString_AsDouble(__pyx_n_s_inf); if (unlikely(__pyx_t_14 == ((double)((double)-1)) && PyErr_Occurred())) __PYX_ERR(0, 111, __pyx_L1_error)
+        __pyx_t_2 = PyFloat_FromDouble(__pyx_t_14); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 111, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_2);
-        __pyx_t_15 = __Pyx_PyDict_GetItemDefault(__pyx_v_dp, __pyx_t_8, __pyx_t_2); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 104, __pyx_L1_error)
+        __pyx_t_15 = __Pyx_PyDict_GetItemDefault(__pyx_v_dp, __pyx_t_8, __pyx_t_2); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 111, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_15);
         __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
         __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-        __pyx_t_2 = PyObject_RichCompare(__pyx_v_new_cost, __pyx_t_15, Py_LT); __Pyx_XGOTREF(__pyx_t_2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 104, __pyx_L1_error)
+        __pyx_t_2 = PyObject_RichCompare(__pyx_v_new_cost, __pyx_t_15, Py_LT); __Pyx_XGOTREF(__pyx_t_2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 111, __pyx_L1_error)
         __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
-        __pyx_t_10 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely((__pyx_t_10 < 0))) __PYX_ERR(0, 104, __pyx_L1_error)
+        __pyx_t_10 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely((__pyx_t_10 < 0))) __PYX_ERR(0, 111, __pyx_L1_error)
         __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
         if (__pyx_t_10) {
 
-          /* "a_star.pyx":105
+          /* "a_star.pyx":112
  *                 new_cost = base + dist[j][k]
  *                 if new_cost < dp.get((new_mask, k), float('inf')):
  *                     dp[(new_mask, k)] = new_cost             # <<<<<<<<<<<<<<
  *                     parent[(new_mask, k)] = (mask, j)
  *     full_mask = (1 << n) - 1
  */
-          __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 105, __pyx_L1_error)
+          __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 112, __pyx_L1_error)
           __Pyx_GOTREF(__pyx_t_2);
           __Pyx_INCREF(__pyx_v_new_mask);
           __Pyx_GIVEREF(__pyx_v_new_mask);
-          if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v_new_mask)) __PYX_ERR(0, 105, __pyx_L1_error);
+          if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v_new_mask)) __PYX_ERR(0, 112, __pyx_L1_error);
           __Pyx_INCREF(__pyx_v_k);
           __Pyx_GIVEREF(__pyx_v_k);
-          if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_v_k)) __PYX_ERR(0, 105, __pyx_L1_error);
-          if (unlikely((PyDict_SetItem(__pyx_v_dp, __pyx_t_2, __pyx_v_new_cost) < 0))) __PYX_ERR(0, 105, __pyx_L1_error)
+          if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_v_k)) __PYX_ERR(0, 112, __pyx_L1_error);
+          if (unlikely((PyDict_SetItem(__pyx_v_dp, __pyx_t_2, __pyx_v_new_cost) < 0))) __PYX_ERR(0, 112, __pyx_L1_error)
           __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-          /* "a_star.pyx":106
+          /* "a_star.pyx":113
  *                 if new_cost < dp.get((new_mask, k), float('inf')):
  *                     dp[(new_mask, k)] = new_cost
  *                     parent[(new_mask, k)] = (mask, j)             # <<<<<<<<<<<<<<
  *     full_mask = (1 << n) - 1
  *     best = float('inf')
  */
-          __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 106, __pyx_L1_error)
+          __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 113, __pyx_L1_error)
           __Pyx_GOTREF(__pyx_t_2);
           __Pyx_INCREF(__pyx_v_mask);
           __Pyx_GIVEREF(__pyx_v_mask);
-          if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v_mask)) __PYX_ERR(0, 106, __pyx_L1_error);
+          if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v_mask)) __PYX_ERR(0, 113, __pyx_L1_error);
           __Pyx_INCREF(__pyx_v_j);
           __Pyx_GIVEREF(__pyx_v_j);
-          if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_v_j)) __PYX_ERR(0, 106, __pyx_L1_error);
-          __pyx_t_15 = PyTuple_New(2); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 106, __pyx_L1_error)
+          if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_v_j)) __PYX_ERR(0, 113, __pyx_L1_error);
+          __pyx_t_15 = PyTuple_New(2); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 113, __pyx_L1_error)
           __Pyx_GOTREF(__pyx_t_15);
           __Pyx_INCREF(__pyx_v_new_mask);
           __Pyx_GIVEREF(__pyx_v_new_mask);
-          if (__Pyx_PyTuple_SET_ITEM(__pyx_t_15, 0, __pyx_v_new_mask)) __PYX_ERR(0, 106, __pyx_L1_error);
+          if (__Pyx_PyTuple_SET_ITEM(__pyx_t_15, 0, __pyx_v_new_mask)) __PYX_ERR(0, 113, __pyx_L1_error);
           __Pyx_INCREF(__pyx_v_k);
           __Pyx_GIVEREF(__pyx_v_k);
-          if (__Pyx_PyTuple_SET_ITEM(__pyx_t_15, 1, __pyx_v_k)) __PYX_ERR(0, 106, __pyx_L1_error);
-          if (unlikely((PyDict_SetItem(__pyx_v_parent, __pyx_t_15, __pyx_t_2) < 0))) __PYX_ERR(0, 106, __pyx_L1_error)
+          if (__Pyx_PyTuple_SET_ITEM(__pyx_t_15, 1, __pyx_v_k)) __PYX_ERR(0, 113, __pyx_L1_error);
+          if (unlikely((PyDict_SetItem(__pyx_v_parent, __pyx_t_15, __pyx_t_2) < 0))) __PYX_ERR(0, 113, __pyx_L1_error)
           __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
           __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-          /* "a_star.pyx":104
+          /* "a_star.pyx":111
  *                 new_mask = mask | (1 << k)
  *                 new_cost = base + dist[j][k]
  *                 if new_cost < dp.get((new_mask, k), float('inf')):             # <<<<<<<<<<<<<<
@@ -5676,7 +5883,7 @@ static PyObject *__pyx_f_6a_star_tsp_ordering(PyObject *__pyx_v_goals) {
  */
         }
 
-        /* "a_star.pyx":99
+        /* "a_star.pyx":106
  *                 continue
  *             base = dp[(mask, j)]
  *             for k in range(n):             # <<<<<<<<<<<<<<
@@ -5687,7 +5894,7 @@ static PyObject *__pyx_f_6a_star_tsp_ordering(PyObject *__pyx_v_goals) {
       }
       __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
 
-      /* "a_star.pyx":93
+      /* "a_star.pyx":100
  *         dp[(1 << j, j)] = 0
  *     for mask in range(1 << n):
  *         for j in range(n):             # <<<<<<<<<<<<<<
@@ -5698,7 +5905,7 @@ static PyObject *__pyx_f_6a_star_tsp_ordering(PyObject *__pyx_v_goals) {
     }
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
 
-    /* "a_star.pyx":92
+    /* "a_star.pyx":99
  *     for j in range(n):
  *         dp[(1 << j, j)] = 0
  *     for mask in range(1 << n):             # <<<<<<<<<<<<<<
@@ -5708,35 +5915,35 @@ static PyObject *__pyx_f_6a_star_tsp_ordering(PyObject *__pyx_v_goals) {
   }
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-  /* "a_star.pyx":107
+  /* "a_star.pyx":114
  *                     dp[(new_mask, k)] = new_cost
  *                     parent[(new_mask, k)] = (mask, j)
  *     full_mask = (1 << n) - 1             # <<<<<<<<<<<<<<
  *     best = float('inf')
  *     best_end = None
  */
-  __pyx_t_3 = PyNumber_Lshift(__pyx_int_1, __pyx_v_n); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 107, __pyx_L1_error)
+  __pyx_t_3 = PyNumber_Lshift(__pyx_int_1, __pyx_v_n); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 114, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_4 = __Pyx_PyInt_SubtractObjC(__pyx_t_3, __pyx_int_1, 1, 0, 0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 107, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyInt_SubtractObjC(__pyx_t_3, __pyx_int_1, 1, 0, 0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 114, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __pyx_v_full_mask = __pyx_t_4;
   __pyx_t_4 = 0;
 
-  /* "a_star.pyx":108
+  /* "a_star.pyx":115
  *                     parent[(new_mask, k)] = (mask, j)
  *     full_mask = (1 << n) - 1
  *     best = float('inf')             # <<<<<<<<<<<<<<
  *     best_end = None
  *     for j in range(n):
  */
-  __pyx_t_14 = __Pyx_PyString_AsDouble(__pyx_n_s_inf); if (unlikely(__pyx_t_14 == ((double)((double)-1)) && PyErr_Occurred())) __PYX_ERR(0, 108, __pyx_L1_error)
-  __pyx_t_4 = PyFloat_FromDouble(__pyx_t_14); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 108, __pyx_L1_error)
+  __pyx_t_14 = __Pyx_PyString_AsDouble(__pyx_n_s_inf); if (unlikely(__pyx_t_14 == ((double)((double)-1)) && PyErr_Occurred())) __PYX_ERR(0, 115, __pyx_L1_error)
+  __pyx_t_4 = PyFloat_FromDouble(__pyx_t_14); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 115, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __pyx_v_best = __pyx_t_4;
   __pyx_t_4 = 0;
 
-  /* "a_star.pyx":109
+  /* "a_star.pyx":116
  *     full_mask = (1 << n) - 1
  *     best = float('inf')
  *     best_end = None             # <<<<<<<<<<<<<<
@@ -5746,23 +5953,23 @@ static PyObject *__pyx_f_6a_star_tsp_ordering(PyObject *__pyx_v_goals) {
   __Pyx_INCREF(Py_None);
   __pyx_v_best_end = Py_None;
 
-  /* "a_star.pyx":110
+  /* "a_star.pyx":117
  *     best = float('inf')
  *     best_end = None
  *     for j in range(n):             # <<<<<<<<<<<<<<
  *         if dp.get((full_mask, j), float('inf')) < best:
  *             best = dp[(full_mask, j)]
  */
-  __pyx_t_4 = __Pyx_PyObject_CallOneArg(__pyx_builtin_range, __pyx_v_n); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 110, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyObject_CallOneArg(__pyx_builtin_range, __pyx_v_n); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 117, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   if (likely(PyList_CheckExact(__pyx_t_4)) || PyTuple_CheckExact(__pyx_t_4)) {
     __pyx_t_3 = __pyx_t_4; __Pyx_INCREF(__pyx_t_3);
     __pyx_t_1 = 0;
     __pyx_t_5 = NULL;
   } else {
-    __pyx_t_1 = -1; __pyx_t_3 = PyObject_GetIter(__pyx_t_4); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 110, __pyx_L1_error)
+    __pyx_t_1 = -1; __pyx_t_3 = PyObject_GetIter(__pyx_t_4); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 117, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_5 = __Pyx_PyObject_GetIterNextFunc(__pyx_t_3); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 110, __pyx_L1_error)
+    __pyx_t_5 = __Pyx_PyObject_GetIterNextFunc(__pyx_t_3); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 117, __pyx_L1_error)
   }
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
   for (;;) {
@@ -5771,28 +5978,28 @@ static PyObject *__pyx_f_6a_star_tsp_ordering(PyObject *__pyx_v_goals) {
         {
           Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_3);
           #if !CYTHON_ASSUME_SAFE_MACROS
-          if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 110, __pyx_L1_error)
+          if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 117, __pyx_L1_error)
           #endif
           if (__pyx_t_1 >= __pyx_temp) break;
         }
         #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-        __pyx_t_4 = PyList_GET_ITEM(__pyx_t_3, __pyx_t_1); __Pyx_INCREF(__pyx_t_4); __pyx_t_1++; if (unlikely((0 < 0))) __PYX_ERR(0, 110, __pyx_L1_error)
+        __pyx_t_4 = PyList_GET_ITEM(__pyx_t_3, __pyx_t_1); __Pyx_INCREF(__pyx_t_4); __pyx_t_1++; if (unlikely((0 < 0))) __PYX_ERR(0, 117, __pyx_L1_error)
         #else
-        __pyx_t_4 = __Pyx_PySequence_ITEM(__pyx_t_3, __pyx_t_1); __pyx_t_1++; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 110, __pyx_L1_error)
+        __pyx_t_4 = __Pyx_PySequence_ITEM(__pyx_t_3, __pyx_t_1); __pyx_t_1++; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 117, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_4);
         #endif
       } else {
         {
           Py_ssize_t __pyx_temp = __Pyx_PyTuple_GET_SIZE(__pyx_t_3);
           #if !CYTHON_ASSUME_SAFE_MACROS
-          if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 110, __pyx_L1_error)
+          if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 117, __pyx_L1_error)
           #endif
           if (__pyx_t_1 >= __pyx_temp) break;
         }
         #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-        __pyx_t_4 = PyTuple_GET_ITEM(__pyx_t_3, __pyx_t_1); __Pyx_INCREF(__pyx_t_4); __pyx_t_1++; if (unlikely((0 < 0))) __PYX_ERR(0, 110, __pyx_L1_error)
+        __pyx_t_4 = PyTuple_GET_ITEM(__pyx_t_3, __pyx_t_1); __Pyx_INCREF(__pyx_t_4); __pyx_t_1++; if (unlikely((0 < 0))) __PYX_ERR(0, 117, __pyx_L1_error)
         #else
-        __pyx_t_4 = __Pyx_PySequence_ITEM(__pyx_t_3, __pyx_t_1); __pyx_t_1++; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 110, __pyx_L1_error)
+        __pyx_t_4 = __Pyx_PySequence_ITEM(__pyx_t_3, __pyx_t_1); __pyx_t_1++; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 117, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_4);
         #endif
       }
@@ -5802,7 +6009,7 @@ static PyObject *__pyx_f_6a_star_tsp_ordering(PyObject *__pyx_v_goals) {
         PyObject* exc_type = PyErr_Occurred();
         if (exc_type) {
           if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
-          else __PYX_ERR(0, 110, __pyx_L1_error)
+          else __PYX_ERR(0, 117, __pyx_L1_error)
         }
         break;
       }
@@ -5811,56 +6018,56 @@ static PyObject *__pyx_f_6a_star_tsp_ordering(PyObject *__pyx_v_goals) {
     __Pyx_XDECREF_SET(__pyx_v_j, __pyx_t_4);
     __pyx_t_4 = 0;
 
-    /* "a_star.pyx":111
+    /* "a_star.pyx":118
  *     best_end = None
  *     for j in range(n):
  *         if dp.get((full_mask, j), float('inf')) < best:             # <<<<<<<<<<<<<<
  *             best = dp[(full_mask, j)]
  *             best_end = j
  */
-    __pyx_t_4 = PyTuple_New(2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 111, __pyx_L1_error)
+    __pyx_t_4 = PyTuple_New(2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 118, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
     __Pyx_INCREF(__pyx_v_full_mask);
     __Pyx_GIVEREF(__pyx_v_full_mask);
-    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_v_full_mask)) __PYX_ERR(0, 111, __pyx_L1_error);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_v_full_mask)) __PYX_ERR(0, 118, __pyx_L1_error);
     __Pyx_INCREF(__pyx_v_j);
     __Pyx_GIVEREF(__pyx_v_j);
-    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_v_j)) __PYX_ERR(0, 111, __pyx_L1_error);
-    __pyx_t_14 = __Pyx_PyString_AsDouble(__pyx_n_s_inf); if (unlikely(__pyx_t_14 == ((double)((double)-1)) && PyErr_Occurred())) __PYX_ERR(0, 111, __pyx_L1_error)
-    __pyx_t_9 = PyFloat_FromDouble(__pyx_t_14); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 111, __pyx_L1_error)
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_v_j)) __PYX_ERR(0, 118, __pyx_L1_error);
+    __pyx_t_14 = __Pyx_PyString_AsDouble(__pyx_n_s_inf); if (unlikely(__pyx_t_14 == ((double)((double)-1)) && PyErr_Occurred())) __PYX_ERR(0, 118, __pyx_L1_error)
+    __pyx_t_9 = PyFloat_FromDouble(__pyx_t_14); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 118, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_9);
-    __pyx_t_2 = __Pyx_PyDict_GetItemDefault(__pyx_v_dp, __pyx_t_4, __pyx_t_9); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 111, __pyx_L1_error)
+    __pyx_t_2 = __Pyx_PyDict_GetItemDefault(__pyx_v_dp, __pyx_t_4, __pyx_t_9); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 118, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-    __pyx_t_9 = PyObject_RichCompare(__pyx_t_2, __pyx_v_best, Py_LT); __Pyx_XGOTREF(__pyx_t_9); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 111, __pyx_L1_error)
+    __pyx_t_9 = PyObject_RichCompare(__pyx_t_2, __pyx_v_best, Py_LT); __Pyx_XGOTREF(__pyx_t_9); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 118, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __pyx_t_10 = __Pyx_PyObject_IsTrue(__pyx_t_9); if (unlikely((__pyx_t_10 < 0))) __PYX_ERR(0, 111, __pyx_L1_error)
+    __pyx_t_10 = __Pyx_PyObject_IsTrue(__pyx_t_9); if (unlikely((__pyx_t_10 < 0))) __PYX_ERR(0, 118, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
     if (__pyx_t_10) {
 
-      /* "a_star.pyx":112
+      /* "a_star.pyx":119
  *     for j in range(n):
  *         if dp.get((full_mask, j), float('inf')) < best:
  *             best = dp[(full_mask, j)]             # <<<<<<<<<<<<<<
  *             best_end = j
  *     order = []
  */
-      __pyx_t_9 = PyTuple_New(2); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 112, __pyx_L1_error)
+      __pyx_t_9 = PyTuple_New(2); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 119, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_9);
       __Pyx_INCREF(__pyx_v_full_mask);
       __Pyx_GIVEREF(__pyx_v_full_mask);
-      if (__Pyx_PyTuple_SET_ITEM(__pyx_t_9, 0, __pyx_v_full_mask)) __PYX_ERR(0, 112, __pyx_L1_error);
+      if (__Pyx_PyTuple_SET_ITEM(__pyx_t_9, 0, __pyx_v_full_mask)) __PYX_ERR(0, 119, __pyx_L1_error);
       __Pyx_INCREF(__pyx_v_j);
       __Pyx_GIVEREF(__pyx_v_j);
-      if (__Pyx_PyTuple_SET_ITEM(__pyx_t_9, 1, __pyx_v_j)) __PYX_ERR(0, 112, __pyx_L1_error);
-      __pyx_t_2 = __Pyx_PyDict_GetItem(__pyx_v_dp, __pyx_t_9); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 112, __pyx_L1_error)
+      if (__Pyx_PyTuple_SET_ITEM(__pyx_t_9, 1, __pyx_v_j)) __PYX_ERR(0, 119, __pyx_L1_error);
+      __pyx_t_2 = __Pyx_PyDict_GetItem(__pyx_v_dp, __pyx_t_9); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 119, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_2);
       __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
       __Pyx_DECREF_SET(__pyx_v_best, __pyx_t_2);
       __pyx_t_2 = 0;
 
-      /* "a_star.pyx":113
+      /* "a_star.pyx":120
  *         if dp.get((full_mask, j), float('inf')) < best:
  *             best = dp[(full_mask, j)]
  *             best_end = j             # <<<<<<<<<<<<<<
@@ -5870,7 +6077,7 @@ static PyObject *__pyx_f_6a_star_tsp_ordering(PyObject *__pyx_v_goals) {
       __Pyx_INCREF(__pyx_v_j);
       __Pyx_DECREF_SET(__pyx_v_best_end, __pyx_v_j);
 
-      /* "a_star.pyx":111
+      /* "a_star.pyx":118
  *     best_end = None
  *     for j in range(n):
  *         if dp.get((full_mask, j), float('inf')) < best:             # <<<<<<<<<<<<<<
@@ -5879,7 +6086,7 @@ static PyObject *__pyx_f_6a_star_tsp_ordering(PyObject *__pyx_v_goals) {
  */
     }
 
-    /* "a_star.pyx":110
+    /* "a_star.pyx":117
  *     best = float('inf')
  *     best_end = None
  *     for j in range(n):             # <<<<<<<<<<<<<<
@@ -5889,37 +6096,37 @@ static PyObject *__pyx_f_6a_star_tsp_ordering(PyObject *__pyx_v_goals) {
   }
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-  /* "a_star.pyx":114
+  /* "a_star.pyx":121
  *             best = dp[(full_mask, j)]
  *             best_end = j
  *     order = []             # <<<<<<<<<<<<<<
  *     state = (full_mask, best_end)
  *     while state in parent:
  */
-  __pyx_t_3 = PyList_New(0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 114, __pyx_L1_error)
+  __pyx_t_3 = PyList_New(0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 121, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __pyx_v_order = ((PyObject*)__pyx_t_3);
   __pyx_t_3 = 0;
 
-  /* "a_star.pyx":115
+  /* "a_star.pyx":122
  *             best_end = j
  *     order = []
  *     state = (full_mask, best_end)             # <<<<<<<<<<<<<<
  *     while state in parent:
  *         order.append(state[1])
  */
-  __pyx_t_3 = PyTuple_New(2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 115, __pyx_L1_error)
+  __pyx_t_3 = PyTuple_New(2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 122, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_INCREF(__pyx_v_full_mask);
   __Pyx_GIVEREF(__pyx_v_full_mask);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_v_full_mask)) __PYX_ERR(0, 115, __pyx_L1_error);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_v_full_mask)) __PYX_ERR(0, 122, __pyx_L1_error);
   __Pyx_INCREF(__pyx_v_best_end);
   __Pyx_GIVEREF(__pyx_v_best_end);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_v_best_end)) __PYX_ERR(0, 115, __pyx_L1_error);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_v_best_end)) __PYX_ERR(0, 122, __pyx_L1_error);
   __pyx_v_state = __pyx_t_3;
   __pyx_t_3 = 0;
 
-  /* "a_star.pyx":116
+  /* "a_star.pyx":123
  *     order = []
  *     state = (full_mask, best_end)
  *     while state in parent:             # <<<<<<<<<<<<<<
@@ -5927,56 +6134,56 @@ static PyObject *__pyx_f_6a_star_tsp_ordering(PyObject *__pyx_v_goals) {
  *         state = parent[state]
  */
   while (1) {
-    __pyx_t_10 = (__Pyx_PyDict_ContainsTF(__pyx_v_state, __pyx_v_parent, Py_EQ)); if (unlikely((__pyx_t_10 < 0))) __PYX_ERR(0, 116, __pyx_L1_error)
+    __pyx_t_10 = (__Pyx_PyDict_ContainsTF(__pyx_v_state, __pyx_v_parent, Py_EQ)); if (unlikely((__pyx_t_10 < 0))) __PYX_ERR(0, 123, __pyx_L1_error)
     if (!__pyx_t_10) break;
 
-    /* "a_star.pyx":117
+    /* "a_star.pyx":124
  *     state = (full_mask, best_end)
  *     while state in parent:
  *         order.append(state[1])             # <<<<<<<<<<<<<<
  *         state = parent[state]
  *     order.append(state[1])
  */
-    __pyx_t_3 = __Pyx_GetItemInt(__pyx_v_state, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 117, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_GetItemInt(__pyx_v_state, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 124, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_16 = __Pyx_PyList_Append(__pyx_v_order, __pyx_t_3); if (unlikely(__pyx_t_16 == ((int)-1))) __PYX_ERR(0, 117, __pyx_L1_error)
+    __pyx_t_16 = __Pyx_PyList_Append(__pyx_v_order, __pyx_t_3); if (unlikely(__pyx_t_16 == ((int)-1))) __PYX_ERR(0, 124, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-    /* "a_star.pyx":118
+    /* "a_star.pyx":125
  *     while state in parent:
  *         order.append(state[1])
  *         state = parent[state]             # <<<<<<<<<<<<<<
  *     order.append(state[1])
  *     order.reverse()
  */
-    __pyx_t_3 = __Pyx_PyDict_GetItem(__pyx_v_parent, __pyx_v_state); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 118, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyDict_GetItem(__pyx_v_parent, __pyx_v_state); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 125, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF_SET(__pyx_v_state, __pyx_t_3);
     __pyx_t_3 = 0;
   }
 
-  /* "a_star.pyx":119
+  /* "a_star.pyx":126
  *         order.append(state[1])
  *         state = parent[state]
  *     order.append(state[1])             # <<<<<<<<<<<<<<
  *     order.reverse()
  *     return order
  */
-  __pyx_t_3 = __Pyx_GetItemInt(__pyx_v_state, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 119, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_GetItemInt(__pyx_v_state, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 126, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_16 = __Pyx_PyList_Append(__pyx_v_order, __pyx_t_3); if (unlikely(__pyx_t_16 == ((int)-1))) __PYX_ERR(0, 119, __pyx_L1_error)
+  __pyx_t_16 = __Pyx_PyList_Append(__pyx_v_order, __pyx_t_3); if (unlikely(__pyx_t_16 == ((int)-1))) __PYX_ERR(0, 126, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-  /* "a_star.pyx":120
+  /* "a_star.pyx":127
  *         state = parent[state]
  *     order.append(state[1])
  *     order.reverse()             # <<<<<<<<<<<<<<
  *     return order
  * 
  */
-  __pyx_t_16 = PyList_Reverse(__pyx_v_order); if (unlikely(__pyx_t_16 == ((int)-1))) __PYX_ERR(0, 120, __pyx_L1_error)
+  __pyx_t_16 = PyList_Reverse(__pyx_v_order); if (unlikely(__pyx_t_16 == ((int)-1))) __PYX_ERR(0, 127, __pyx_L1_error)
 
-  /* "a_star.pyx":121
+  /* "a_star.pyx":128
  *     order.append(state[1])
  *     order.reverse()
  *     return order             # <<<<<<<<<<<<<<
@@ -5988,7 +6195,7 @@ static PyObject *__pyx_f_6a_star_tsp_ordering(PyObject *__pyx_v_goals) {
   __pyx_r = __pyx_v_order;
   goto __pyx_L0;
 
-  /* "a_star.pyx":76
+  /* "a_star.pyx":83
  * 
  * 
  * cdef tsp_ordering(goals):             # <<<<<<<<<<<<<<
@@ -6033,7 +6240,7 @@ static PyObject *__pyx_f_6a_star_tsp_ordering(PyObject *__pyx_v_goals) {
   return __pyx_r;
 }
 
-/* "a_star.pyx":123
+/* "a_star.pyx":130
  *     return order
  * 
  * cdef in_bounds( pos, width, height):             # <<<<<<<<<<<<<<
@@ -6056,7 +6263,7 @@ static PyObject *__pyx_f_6a_star_in_bounds(PyObject *__pyx_v_pos, PyObject *__py
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("in_bounds", 1);
 
-  /* "a_star.pyx":124
+  /* "a_star.pyx":131
  * 
  * cdef in_bounds( pos, width, height):
  *     x, y = pos             # <<<<<<<<<<<<<<
@@ -6069,7 +6276,7 @@ static PyObject *__pyx_f_6a_star_in_bounds(PyObject *__pyx_v_pos, PyObject *__py
     if (unlikely(size != 2)) {
       if (size > 2) __Pyx_RaiseTooManyValuesError(2);
       else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
-      __PYX_ERR(0, 124, __pyx_L1_error)
+      __PYX_ERR(0, 131, __pyx_L1_error)
     }
     #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
     if (likely(PyTuple_CheckExact(sequence))) {
@@ -6082,21 +6289,21 @@ static PyObject *__pyx_f_6a_star_in_bounds(PyObject *__pyx_v_pos, PyObject *__py
     __Pyx_INCREF(__pyx_t_1);
     __Pyx_INCREF(__pyx_t_2);
     #else
-    __pyx_t_1 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 124, __pyx_L1_error)
+    __pyx_t_1 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 131, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_2 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 124, __pyx_L1_error)
+    __pyx_t_2 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 131, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     #endif
   } else {
     Py_ssize_t index = -1;
-    __pyx_t_3 = PyObject_GetIter(__pyx_v_pos); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 124, __pyx_L1_error)
+    __pyx_t_3 = PyObject_GetIter(__pyx_v_pos); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 131, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __pyx_t_4 = __Pyx_PyObject_GetIterNextFunc(__pyx_t_3);
     index = 0; __pyx_t_1 = __pyx_t_4(__pyx_t_3); if (unlikely(!__pyx_t_1)) goto __pyx_L3_unpacking_failed;
     __Pyx_GOTREF(__pyx_t_1);
     index = 1; __pyx_t_2 = __pyx_t_4(__pyx_t_3); if (unlikely(!__pyx_t_2)) goto __pyx_L3_unpacking_failed;
     __Pyx_GOTREF(__pyx_t_2);
-    if (__Pyx_IternextUnpackEndCheck(__pyx_t_4(__pyx_t_3), 2) < 0) __PYX_ERR(0, 124, __pyx_L1_error)
+    if (__Pyx_IternextUnpackEndCheck(__pyx_t_4(__pyx_t_3), 2) < 0) __PYX_ERR(0, 131, __pyx_L1_error)
     __pyx_t_4 = NULL;
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     goto __pyx_L4_unpacking_done;
@@ -6104,7 +6311,7 @@ static PyObject *__pyx_f_6a_star_in_bounds(PyObject *__pyx_v_pos, PyObject *__py
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __pyx_t_4 = NULL;
     if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
-    __PYX_ERR(0, 124, __pyx_L1_error)
+    __PYX_ERR(0, 131, __pyx_L1_error)
     __pyx_L4_unpacking_done:;
   }
   __pyx_v_x = __pyx_t_1;
@@ -6112,7 +6319,7 @@ static PyObject *__pyx_f_6a_star_in_bounds(PyObject *__pyx_v_pos, PyObject *__py
   __pyx_v_y = __pyx_t_2;
   __pyx_t_2 = 0;
 
-  /* "a_star.pyx":125
+  /* "a_star.pyx":132
  * cdef in_bounds( pos, width, height):
  *     x, y = pos
  *     return 0 <= x < width and 0 <= y < height             # <<<<<<<<<<<<<<
@@ -6120,12 +6327,12 @@ static PyObject *__pyx_f_6a_star_in_bounds(PyObject *__pyx_v_pos, PyObject *__py
  * 
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyObject_RichCompare(__pyx_int_0, __pyx_v_x, Py_LE); __Pyx_XGOTREF(__pyx_t_1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 125, __pyx_L1_error)
+  __pyx_t_1 = PyObject_RichCompare(__pyx_int_0, __pyx_v_x, Py_LE); __Pyx_XGOTREF(__pyx_t_1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 132, __pyx_L1_error)
   if (__Pyx_PyObject_IsTrue(__pyx_t_1)) {
     __Pyx_DECREF(__pyx_t_1);
-    __pyx_t_1 = PyObject_RichCompare(__pyx_v_x, __pyx_v_width, Py_LT); __Pyx_XGOTREF(__pyx_t_1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 125, __pyx_L1_error)
+    __pyx_t_1 = PyObject_RichCompare(__pyx_v_x, __pyx_v_width, Py_LT); __Pyx_XGOTREF(__pyx_t_1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 132, __pyx_L1_error)
   }
-  __pyx_t_5 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely((__pyx_t_5 < 0))) __PYX_ERR(0, 125, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely((__pyx_t_5 < 0))) __PYX_ERR(0, 132, __pyx_L1_error)
   if (__pyx_t_5) {
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   } else {
@@ -6134,10 +6341,10 @@ static PyObject *__pyx_f_6a_star_in_bounds(PyObject *__pyx_v_pos, PyObject *__py
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
     goto __pyx_L5_bool_binop_done;
   }
-  __pyx_t_1 = PyObject_RichCompare(__pyx_int_0, __pyx_v_y, Py_LE); __Pyx_XGOTREF(__pyx_t_1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 125, __pyx_L1_error)
+  __pyx_t_1 = PyObject_RichCompare(__pyx_int_0, __pyx_v_y, Py_LE); __Pyx_XGOTREF(__pyx_t_1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 132, __pyx_L1_error)
   if (__Pyx_PyObject_IsTrue(__pyx_t_1)) {
     __Pyx_DECREF(__pyx_t_1);
-    __pyx_t_1 = PyObject_RichCompare(__pyx_v_y, __pyx_v_height, Py_LT); __Pyx_XGOTREF(__pyx_t_1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 125, __pyx_L1_error)
+    __pyx_t_1 = PyObject_RichCompare(__pyx_v_y, __pyx_v_height, Py_LT); __Pyx_XGOTREF(__pyx_t_1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 132, __pyx_L1_error)
   }
   __Pyx_INCREF(__pyx_t_1);
   __pyx_t_2 = __pyx_t_1;
@@ -6147,7 +6354,7 @@ static PyObject *__pyx_f_6a_star_in_bounds(PyObject *__pyx_v_pos, PyObject *__py
   __pyx_t_2 = 0;
   goto __pyx_L0;
 
-  /* "a_star.pyx":123
+  /* "a_star.pyx":130
  *     return order
  * 
  * cdef in_bounds( pos, width, height):             # <<<<<<<<<<<<<<
@@ -6170,7 +6377,7 @@ static PyObject *__pyx_f_6a_star_in_bounds(PyObject *__pyx_v_pos, PyObject *__py
   return __pyx_r;
 }
 
-/* "a_star.pyx":128
+/* "a_star.pyx":135
  * 
  * 
  * cdef is_walkable( pos, current_position, grid_vertical, grid_horizontal):             # <<<<<<<<<<<<<<
@@ -6195,7 +6402,7 @@ static PyObject *__pyx_f_6a_star_is_walkable(PyObject *__pyx_v_pos, PyObject *__
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("is_walkable", 1);
 
-  /* "a_star.pyx":129
+  /* "a_star.pyx":136
  * 
  * cdef is_walkable( pos, current_position, grid_vertical, grid_horizontal):
  *     x, y = pos             # <<<<<<<<<<<<<<
@@ -6208,7 +6415,7 @@ static PyObject *__pyx_f_6a_star_is_walkable(PyObject *__pyx_v_pos, PyObject *__
     if (unlikely(size != 2)) {
       if (size > 2) __Pyx_RaiseTooManyValuesError(2);
       else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
-      __PYX_ERR(0, 129, __pyx_L1_error)
+      __PYX_ERR(0, 136, __pyx_L1_error)
     }
     #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
     if (likely(PyTuple_CheckExact(sequence))) {
@@ -6221,21 +6428,21 @@ static PyObject *__pyx_f_6a_star_is_walkable(PyObject *__pyx_v_pos, PyObject *__
     __Pyx_INCREF(__pyx_t_1);
     __Pyx_INCREF(__pyx_t_2);
     #else
-    __pyx_t_1 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 129, __pyx_L1_error)
+    __pyx_t_1 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 136, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_2 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 129, __pyx_L1_error)
+    __pyx_t_2 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 136, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     #endif
   } else {
     Py_ssize_t index = -1;
-    __pyx_t_3 = PyObject_GetIter(__pyx_v_pos); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 129, __pyx_L1_error)
+    __pyx_t_3 = PyObject_GetIter(__pyx_v_pos); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 136, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __pyx_t_4 = __Pyx_PyObject_GetIterNextFunc(__pyx_t_3);
     index = 0; __pyx_t_1 = __pyx_t_4(__pyx_t_3); if (unlikely(!__pyx_t_1)) goto __pyx_L3_unpacking_failed;
     __Pyx_GOTREF(__pyx_t_1);
     index = 1; __pyx_t_2 = __pyx_t_4(__pyx_t_3); if (unlikely(!__pyx_t_2)) goto __pyx_L3_unpacking_failed;
     __Pyx_GOTREF(__pyx_t_2);
-    if (__Pyx_IternextUnpackEndCheck(__pyx_t_4(__pyx_t_3), 2) < 0) __PYX_ERR(0, 129, __pyx_L1_error)
+    if (__Pyx_IternextUnpackEndCheck(__pyx_t_4(__pyx_t_3), 2) < 0) __PYX_ERR(0, 136, __pyx_L1_error)
     __pyx_t_4 = NULL;
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     goto __pyx_L4_unpacking_done;
@@ -6243,7 +6450,7 @@ static PyObject *__pyx_f_6a_star_is_walkable(PyObject *__pyx_v_pos, PyObject *__
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __pyx_t_4 = NULL;
     if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
-    __PYX_ERR(0, 129, __pyx_L1_error)
+    __PYX_ERR(0, 136, __pyx_L1_error)
     __pyx_L4_unpacking_done:;
   }
   __pyx_v_x = __pyx_t_1;
@@ -6251,7 +6458,7 @@ static PyObject *__pyx_f_6a_star_is_walkable(PyObject *__pyx_v_pos, PyObject *__
   __pyx_v_y = __pyx_t_2;
   __pyx_t_2 = 0;
 
-  /* "a_star.pyx":130
+  /* "a_star.pyx":137
  * cdef is_walkable( pos, current_position, grid_vertical, grid_horizontal):
  *     x, y = pos
  *     old_x, old_y = current_position             # <<<<<<<<<<<<<<
@@ -6264,7 +6471,7 @@ static PyObject *__pyx_f_6a_star_is_walkable(PyObject *__pyx_v_pos, PyObject *__
     if (unlikely(size != 2)) {
       if (size > 2) __Pyx_RaiseTooManyValuesError(2);
       else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
-      __PYX_ERR(0, 130, __pyx_L1_error)
+      __PYX_ERR(0, 137, __pyx_L1_error)
     }
     #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
     if (likely(PyTuple_CheckExact(sequence))) {
@@ -6277,21 +6484,21 @@ static PyObject *__pyx_f_6a_star_is_walkable(PyObject *__pyx_v_pos, PyObject *__
     __Pyx_INCREF(__pyx_t_2);
     __Pyx_INCREF(__pyx_t_1);
     #else
-    __pyx_t_2 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 130, __pyx_L1_error)
+    __pyx_t_2 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 137, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_1 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 130, __pyx_L1_error)
+    __pyx_t_1 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 137, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     #endif
   } else {
     Py_ssize_t index = -1;
-    __pyx_t_3 = PyObject_GetIter(__pyx_v_current_position); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 130, __pyx_L1_error)
+    __pyx_t_3 = PyObject_GetIter(__pyx_v_current_position); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 137, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __pyx_t_4 = __Pyx_PyObject_GetIterNextFunc(__pyx_t_3);
     index = 0; __pyx_t_2 = __pyx_t_4(__pyx_t_3); if (unlikely(!__pyx_t_2)) goto __pyx_L5_unpacking_failed;
     __Pyx_GOTREF(__pyx_t_2);
     index = 1; __pyx_t_1 = __pyx_t_4(__pyx_t_3); if (unlikely(!__pyx_t_1)) goto __pyx_L5_unpacking_failed;
     __Pyx_GOTREF(__pyx_t_1);
-    if (__Pyx_IternextUnpackEndCheck(__pyx_t_4(__pyx_t_3), 2) < 0) __PYX_ERR(0, 130, __pyx_L1_error)
+    if (__Pyx_IternextUnpackEndCheck(__pyx_t_4(__pyx_t_3), 2) < 0) __PYX_ERR(0, 137, __pyx_L1_error)
     __pyx_t_4 = NULL;
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     goto __pyx_L6_unpacking_done;
@@ -6299,7 +6506,7 @@ static PyObject *__pyx_f_6a_star_is_walkable(PyObject *__pyx_v_pos, PyObject *__
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __pyx_t_4 = NULL;
     if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
-    __PYX_ERR(0, 130, __pyx_L1_error)
+    __PYX_ERR(0, 137, __pyx_L1_error)
     __pyx_L6_unpacking_done:;
   }
   __pyx_v_old_x = __pyx_t_2;
@@ -6307,20 +6514,20 @@ static PyObject *__pyx_f_6a_star_is_walkable(PyObject *__pyx_v_pos, PyObject *__
   __pyx_v_old_y = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "a_star.pyx":131
+  /* "a_star.pyx":138
  *     x, y = pos
  *     old_x, old_y = current_position
  *     if x - old_x == 0:             # <<<<<<<<<<<<<<
  *         return grid_vertical[y][x] == 0
  *     else:
  */
-  __pyx_t_1 = PyNumber_Subtract(__pyx_v_x, __pyx_v_old_x); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 131, __pyx_L1_error)
+  __pyx_t_1 = PyNumber_Subtract(__pyx_v_x, __pyx_v_old_x); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 138, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_5 = (__Pyx_PyInt_BoolEqObjC(__pyx_t_1, __pyx_int_0, 0, 0)); if (unlikely((__pyx_t_5 < 0))) __PYX_ERR(0, 131, __pyx_L1_error)
+  __pyx_t_5 = (__Pyx_PyInt_BoolEqObjC(__pyx_t_1, __pyx_int_0, 0, 0)); if (unlikely((__pyx_t_5 < 0))) __PYX_ERR(0, 138, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   if (__pyx_t_5) {
 
-    /* "a_star.pyx":132
+    /* "a_star.pyx":139
  *     old_x, old_y = current_position
  *     if x - old_x == 0:
  *         return grid_vertical[y][x] == 0             # <<<<<<<<<<<<<<
@@ -6328,19 +6535,19 @@ static PyObject *__pyx_f_6a_star_is_walkable(PyObject *__pyx_v_pos, PyObject *__
  *         return grid_horizontal[y][x] == 0
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_1 = __Pyx_PyObject_GetItem(__pyx_v_grid_vertical, __pyx_v_y); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 132, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_GetItem(__pyx_v_grid_vertical, __pyx_v_y); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 139, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_2 = __Pyx_PyObject_GetItem(__pyx_t_1, __pyx_v_x); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 132, __pyx_L1_error)
+    __pyx_t_2 = __Pyx_PyObject_GetItem(__pyx_t_1, __pyx_v_x); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 139, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __pyx_t_1 = __Pyx_PyInt_EqObjC(__pyx_t_2, __pyx_int_0, 0, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 132, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyInt_EqObjC(__pyx_t_2, __pyx_int_0, 0, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 139, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     __pyx_r = __pyx_t_1;
     __pyx_t_1 = 0;
     goto __pyx_L0;
 
-    /* "a_star.pyx":131
+    /* "a_star.pyx":138
  *     x, y = pos
  *     old_x, old_y = current_position
  *     if x - old_x == 0:             # <<<<<<<<<<<<<<
@@ -6349,7 +6556,7 @@ static PyObject *__pyx_f_6a_star_is_walkable(PyObject *__pyx_v_pos, PyObject *__
  */
   }
 
-  /* "a_star.pyx":134
+  /* "a_star.pyx":141
  *         return grid_vertical[y][x] == 0
  *     else:
  *         return grid_horizontal[y][x] == 0             # <<<<<<<<<<<<<<
@@ -6358,12 +6565,12 @@ static PyObject *__pyx_f_6a_star_is_walkable(PyObject *__pyx_v_pos, PyObject *__
  */
   /*else*/ {
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_1 = __Pyx_PyObject_GetItem(__pyx_v_grid_horizontal, __pyx_v_y); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 134, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_GetItem(__pyx_v_grid_horizontal, __pyx_v_y); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 141, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_2 = __Pyx_PyObject_GetItem(__pyx_t_1, __pyx_v_x); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 134, __pyx_L1_error)
+    __pyx_t_2 = __Pyx_PyObject_GetItem(__pyx_t_1, __pyx_v_x); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 141, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __pyx_t_1 = __Pyx_PyInt_EqObjC(__pyx_t_2, __pyx_int_0, 0, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 134, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyInt_EqObjC(__pyx_t_2, __pyx_int_0, 0, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 141, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     __pyx_r = __pyx_t_1;
@@ -6371,7 +6578,7 @@ static PyObject *__pyx_f_6a_star_is_walkable(PyObject *__pyx_v_pos, PyObject *__
     goto __pyx_L0;
   }
 
-  /* "a_star.pyx":128
+  /* "a_star.pyx":135
  * 
  * 
  * cdef is_walkable( pos, current_position, grid_vertical, grid_horizontal):             # <<<<<<<<<<<<<<
@@ -6396,7 +6603,7 @@ static PyObject *__pyx_f_6a_star_is_walkable(PyObject *__pyx_v_pos, PyObject *__
   return __pyx_r;
 }
 
-/* "a_star.pyx":137
+/* "a_star.pyx":144
  * 
  * 
  * cdef cap_seg(seg, minimum_segment_length):             # <<<<<<<<<<<<<<
@@ -6415,16 +6622,16 @@ static PyObject *__pyx_f_6a_star_cap_seg(PyObject *__pyx_v_seg, PyObject *__pyx_
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("cap_seg", 1);
 
-  /* "a_star.pyx":138
+  /* "a_star.pyx":145
  * 
  * cdef cap_seg(seg, minimum_segment_length):
  *     return seg if seg < minimum_segment_length else minimum_segment_length             # <<<<<<<<<<<<<<
  * 
- * def astar_start(grid_vertical, grid_horizontal, start, goal_nodes, minimum_segment_length, tsp, trace_width_scaled):
+ * def astar_start(grid_vertical, grid_horizontal, start, goal_nodes, minimum_segment_length, tsp, trace_width_scaled,
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_2 = PyObject_RichCompare(__pyx_v_seg, __pyx_v_minimum_segment_length, Py_LT); __Pyx_XGOTREF(__pyx_t_2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 138, __pyx_L1_error)
-  __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely((__pyx_t_3 < 0))) __PYX_ERR(0, 138, __pyx_L1_error)
+  __pyx_t_2 = PyObject_RichCompare(__pyx_v_seg, __pyx_v_minimum_segment_length, Py_LT); __Pyx_XGOTREF(__pyx_t_2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 145, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely((__pyx_t_3 < 0))) __PYX_ERR(0, 145, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   if (__pyx_t_3) {
     __Pyx_INCREF(__pyx_v_seg);
@@ -6437,7 +6644,7 @@ static PyObject *__pyx_f_6a_star_cap_seg(PyObject *__pyx_v_seg, PyObject *__pyx_
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "a_star.pyx":137
+  /* "a_star.pyx":144
  * 
  * 
  * cdef cap_seg(seg, minimum_segment_length):             # <<<<<<<<<<<<<<
@@ -6457,12 +6664,12 @@ static PyObject *__pyx_f_6a_star_cap_seg(PyObject *__pyx_v_seg, PyObject *__pyx_
   return __pyx_r;
 }
 
-/* "a_star.pyx":140
+/* "a_star.pyx":147
  *     return seg if seg < minimum_segment_length else minimum_segment_length
  * 
- * def astar_start(grid_vertical, grid_horizontal, start, goal_nodes, minimum_segment_length, tsp, trace_width_scaled):             # <<<<<<<<<<<<<<
+ * def astar_start(grid_vertical, grid_horizontal, start, goal_nodes, minimum_segment_length, tsp, trace_width_scaled,             # <<<<<<<<<<<<<<
+ *                 stats=None, limits=None):
  * 
- *     path = []
  */
 
 /* Python wrapper */
@@ -6488,11 +6695,13 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   PyObject *__pyx_v_minimum_segment_length = 0;
   PyObject *__pyx_v_tsp = 0;
   CYTHON_UNUSED PyObject *__pyx_v_trace_width_scaled = 0;
+  PyObject *__pyx_v_stats = 0;
+  PyObject *__pyx_v_limits = 0;
   #if !CYTHON_METH_FASTCALL
   CYTHON_UNUSED Py_ssize_t __pyx_nargs;
   #endif
   CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
-  PyObject* values[7] = {0,0,0,0,0,0,0};
+  PyObject* values[9] = {0,0,0,0,0,0,0,0,0};
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
@@ -6508,10 +6717,24 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   #endif
   __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
   {
-    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_grid_vertical,&__pyx_n_s_grid_horizontal,&__pyx_n_s_start,&__pyx_n_s_goal_nodes,&__pyx_n_s_minimum_segment_length,&__pyx_n_s_tsp,&__pyx_n_s_trace_width_scaled,0};
+    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_grid_vertical,&__pyx_n_s_grid_horizontal,&__pyx_n_s_start,&__pyx_n_s_goal_nodes,&__pyx_n_s_minimum_segment_length,&__pyx_n_s_tsp,&__pyx_n_s_trace_width_scaled,&__pyx_n_s_stats,&__pyx_n_s_limits,0};
+
+    /* "a_star.pyx":148
+ * 
+ * def astar_start(grid_vertical, grid_horizontal, start, goal_nodes, minimum_segment_length, tsp, trace_width_scaled,
+ *                 stats=None, limits=None):             # <<<<<<<<<<<<<<
+ * 
+ *     path = []
+ */
+    values[7] = __Pyx_Arg_NewRef_FASTCALL(((PyObject *)Py_None));
+    values[8] = __Pyx_Arg_NewRef_FASTCALL(((PyObject *)Py_None));
     if (__pyx_kwds) {
       Py_ssize_t kw_args;
       switch (__pyx_nargs) {
+        case  9: values[8] = __Pyx_Arg_FASTCALL(__pyx_args, 8);
+        CYTHON_FALLTHROUGH;
+        case  8: values[7] = __Pyx_Arg_FASTCALL(__pyx_args, 7);
+        CYTHON_FALLTHROUGH;
         case  7: values[6] = __Pyx_Arg_FASTCALL(__pyx_args, 6);
         CYTHON_FALLTHROUGH;
         case  6: values[5] = __Pyx_Arg_FASTCALL(__pyx_args, 5);
@@ -6536,7 +6759,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
           (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
           kw_args--;
         }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 140, __pyx_L3_error)
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 147, __pyx_L3_error)
         else goto __pyx_L5_argtuple_error;
         CYTHON_FALLTHROUGH;
         case  1:
@@ -6544,9 +6767,9 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
           (void)__Pyx_Arg_NewRef_FASTCALL(values[1]);
           kw_args--;
         }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 140, __pyx_L3_error)
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 147, __pyx_L3_error)
         else {
-          __Pyx_RaiseArgtupleInvalid("astar_start", 1, 7, 7, 1); __PYX_ERR(0, 140, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("astar_start", 0, 7, 9, 1); __PYX_ERR(0, 147, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  2:
@@ -6554,9 +6777,9 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
           (void)__Pyx_Arg_NewRef_FASTCALL(values[2]);
           kw_args--;
         }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 140, __pyx_L3_error)
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 147, __pyx_L3_error)
         else {
-          __Pyx_RaiseArgtupleInvalid("astar_start", 1, 7, 7, 2); __PYX_ERR(0, 140, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("astar_start", 0, 7, 9, 2); __PYX_ERR(0, 147, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  3:
@@ -6564,9 +6787,9 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
           (void)__Pyx_Arg_NewRef_FASTCALL(values[3]);
           kw_args--;
         }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 140, __pyx_L3_error)
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 147, __pyx_L3_error)
         else {
-          __Pyx_RaiseArgtupleInvalid("astar_start", 1, 7, 7, 3); __PYX_ERR(0, 140, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("astar_start", 0, 7, 9, 3); __PYX_ERR(0, 147, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  4:
@@ -6574,9 +6797,9 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
           (void)__Pyx_Arg_NewRef_FASTCALL(values[4]);
           kw_args--;
         }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 140, __pyx_L3_error)
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 147, __pyx_L3_error)
         else {
-          __Pyx_RaiseArgtupleInvalid("astar_start", 1, 7, 7, 4); __PYX_ERR(0, 140, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("astar_start", 0, 7, 9, 4); __PYX_ERR(0, 147, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  5:
@@ -6584,9 +6807,9 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
           (void)__Pyx_Arg_NewRef_FASTCALL(values[5]);
           kw_args--;
         }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 140, __pyx_L3_error)
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 147, __pyx_L3_error)
         else {
-          __Pyx_RaiseArgtupleInvalid("astar_start", 1, 7, 7, 5); __PYX_ERR(0, 140, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("astar_start", 0, 7, 9, 5); __PYX_ERR(0, 147, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  6:
@@ -6594,25 +6817,45 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
           (void)__Pyx_Arg_NewRef_FASTCALL(values[6]);
           kw_args--;
         }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 140, __pyx_L3_error)
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 147, __pyx_L3_error)
         else {
-          __Pyx_RaiseArgtupleInvalid("astar_start", 1, 7, 7, 6); __PYX_ERR(0, 140, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("astar_start", 0, 7, 9, 6); __PYX_ERR(0, 147, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  7:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_stats);
+          if (value) { values[7] = __Pyx_Arg_NewRef_FASTCALL(value); kw_args--; }
+          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 147, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  8:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_limits);
+          if (value) { values[8] = __Pyx_Arg_NewRef_FASTCALL(value); kw_args--; }
+          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 147, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
         const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "astar_start") < 0)) __PYX_ERR(0, 140, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "astar_start") < 0)) __PYX_ERR(0, 147, __pyx_L3_error)
       }
-    } else if (unlikely(__pyx_nargs != 7)) {
-      goto __pyx_L5_argtuple_error;
     } else {
-      values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
-      values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
-      values[2] = __Pyx_Arg_FASTCALL(__pyx_args, 2);
-      values[3] = __Pyx_Arg_FASTCALL(__pyx_args, 3);
-      values[4] = __Pyx_Arg_FASTCALL(__pyx_args, 4);
-      values[5] = __Pyx_Arg_FASTCALL(__pyx_args, 5);
-      values[6] = __Pyx_Arg_FASTCALL(__pyx_args, 6);
+      switch (__pyx_nargs) {
+        case  9: values[8] = __Pyx_Arg_FASTCALL(__pyx_args, 8);
+        CYTHON_FALLTHROUGH;
+        case  8: values[7] = __Pyx_Arg_FASTCALL(__pyx_args, 7);
+        CYTHON_FALLTHROUGH;
+        case  7: values[6] = __Pyx_Arg_FASTCALL(__pyx_args, 6);
+        values[5] = __Pyx_Arg_FASTCALL(__pyx_args, 5);
+        values[4] = __Pyx_Arg_FASTCALL(__pyx_args, 4);
+        values[3] = __Pyx_Arg_FASTCALL(__pyx_args, 3);
+        values[2] = __Pyx_Arg_FASTCALL(__pyx_args, 2);
+        values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
+        values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
     }
     __pyx_v_grid_vertical = values[0];
     __pyx_v_grid_horizontal = values[1];
@@ -6621,10 +6864,12 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
     __pyx_v_minimum_segment_length = values[4];
     __pyx_v_tsp = values[5];
     __pyx_v_trace_width_scaled = values[6];
+    __pyx_v_stats = values[7];
+    __pyx_v_limits = values[8];
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("astar_start", 1, 7, 7, __pyx_nargs); __PYX_ERR(0, 140, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("astar_start", 0, 7, 9, __pyx_nargs); __PYX_ERR(0, 147, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -6638,7 +6883,15 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_6a_star_astar_start(__pyx_self, __pyx_v_grid_vertical, __pyx_v_grid_horizontal, __pyx_v_start, __pyx_v_goal_nodes, __pyx_v_minimum_segment_length, __pyx_v_tsp, __pyx_v_trace_width_scaled);
+  __pyx_r = __pyx_pf_6a_star_astar_start(__pyx_self, __pyx_v_grid_vertical, __pyx_v_grid_horizontal, __pyx_v_start, __pyx_v_goal_nodes, __pyx_v_minimum_segment_length, __pyx_v_tsp, __pyx_v_trace_width_scaled, __pyx_v_stats, __pyx_v_limits);
+
+  /* "a_star.pyx":147
+ *     return seg if seg < minimum_segment_length else minimum_segment_length
+ * 
+ * def astar_start(grid_vertical, grid_horizontal, start, goal_nodes, minimum_segment_length, tsp, trace_width_scaled,             # <<<<<<<<<<<<<<
+ *                 stats=None, limits=None):
+ * 
+ */
 
   /* function exit code */
   {
@@ -6651,7 +6904,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_6a_star_astar_start(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_grid_vertical, PyObject *__pyx_v_grid_horizontal, PyObject *__pyx_v_start, PyObject *__pyx_v_goal_nodes, PyObject *__pyx_v_minimum_segment_length, PyObject *__pyx_v_tsp, CYTHON_UNUSED PyObject *__pyx_v_trace_width_scaled) {
+static PyObject *__pyx_pf_6a_star_astar_start(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_grid_vertical, PyObject *__pyx_v_grid_horizontal, PyObject *__pyx_v_start, PyObject *__pyx_v_goal_nodes, PyObject *__pyx_v_minimum_segment_length, PyObject *__pyx_v_tsp, CYTHON_UNUSED PyObject *__pyx_v_trace_width_scaled, PyObject *__pyx_v_stats, PyObject *__pyx_v_limits) {
   PyObject *__pyx_v_path = NULL;
   PyObject *__pyx_v_cost = NULL;
   CYTHON_UNUSED PyObject *__pyx_v_failed_nodes = NULL;
@@ -6666,32 +6919,33 @@ static PyObject *__pyx_pf_6a_star_astar_start(CYTHON_UNUSED PyObject *__pyx_self
   int __pyx_t_2;
   Py_ssize_t __pyx_t_3;
   PyObject *__pyx_t_4 = NULL;
-  PyObject *__pyx_t_5 = NULL;
+  struct __pyx_opt_args_6a_star_a_star __pyx_t_5;
   PyObject *__pyx_t_6 = NULL;
-  PyObject *(*__pyx_t_7)(PyObject *);
+  PyObject *__pyx_t_7 = NULL;
   PyObject *(*__pyx_t_8)(PyObject *);
-  PyObject *__pyx_t_9 = NULL;
-  int __pyx_t_10;
-  Py_ssize_t __pyx_t_11;
-  unsigned int __pyx_t_12;
+  PyObject *(*__pyx_t_9)(PyObject *);
+  PyObject *__pyx_t_10 = NULL;
+  int __pyx_t_11;
+  Py_ssize_t __pyx_t_12;
+  unsigned int __pyx_t_13;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("astar_start", 1);
 
-  /* "a_star.pyx":142
- * def astar_start(grid_vertical, grid_horizontal, start, goal_nodes, minimum_segment_length, tsp, trace_width_scaled):
+  /* "a_star.pyx":150
+ *                 stats=None, limits=None):
  * 
  *     path = []             # <<<<<<<<<<<<<<
  *     cost = 0
  *     failed_nodes = []
  */
-  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 142, __pyx_L1_error)
+  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 150, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_v_path = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "a_star.pyx":143
+  /* "a_star.pyx":151
  * 
  *     path = []
  *     cost = 0             # <<<<<<<<<<<<<<
@@ -6701,49 +6955,52 @@ static PyObject *__pyx_pf_6a_star_astar_start(CYTHON_UNUSED PyObject *__pyx_self
   __Pyx_INCREF(__pyx_int_0);
   __pyx_v_cost = __pyx_int_0;
 
-  /* "a_star.pyx":144
+  /* "a_star.pyx":152
  *     path = []
  *     cost = 0
  *     failed_nodes = []             # <<<<<<<<<<<<<<
  * 
  *     if tsp:
  */
-  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 144, __pyx_L1_error)
+  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 152, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_v_failed_nodes = ((PyObject*)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "a_star.pyx":146
+  /* "a_star.pyx":154
  *     failed_nodes = []
  * 
  *     if tsp:             # <<<<<<<<<<<<<<
  * 
  * 
  */
-  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_v_tsp); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(0, 146, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_v_tsp); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(0, 154, __pyx_L1_error)
   if (__pyx_t_2) {
 
-    /* "a_star.pyx":150
+    /* "a_star.pyx":158
  * 
  * 
  *         if len(goal_nodes) <= 2:             # <<<<<<<<<<<<<<
- *             path, cost = a_star(grid_vertical, grid_horizontal, goal_nodes[0], goal_nodes, minimum_segment_length)
+ *             path, cost = a_star(grid_vertical, grid_horizontal, goal_nodes[0], goal_nodes, minimum_segment_length, stats, limits)
  *         else:
  */
-    __pyx_t_3 = PyObject_Length(__pyx_v_goal_nodes); if (unlikely(__pyx_t_3 == ((Py_ssize_t)-1))) __PYX_ERR(0, 150, __pyx_L1_error)
+    __pyx_t_3 = PyObject_Length(__pyx_v_goal_nodes); if (unlikely(__pyx_t_3 == ((Py_ssize_t)-1))) __PYX_ERR(0, 158, __pyx_L1_error)
     __pyx_t_2 = (__pyx_t_3 <= 2);
     if (__pyx_t_2) {
 
-      /* "a_star.pyx":151
+      /* "a_star.pyx":159
  * 
  *         if len(goal_nodes) <= 2:
- *             path, cost = a_star(grid_vertical, grid_horizontal, goal_nodes[0], goal_nodes, minimum_segment_length)             # <<<<<<<<<<<<<<
+ *             path, cost = a_star(grid_vertical, grid_horizontal, goal_nodes[0], goal_nodes, minimum_segment_length, stats, limits)             # <<<<<<<<<<<<<<
  *         else:
  *             order = tsp_ordering(goal_nodes)
  */
-      __pyx_t_1 = __Pyx_GetItemInt(__pyx_v_goal_nodes, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 151, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_GetItemInt(__pyx_v_goal_nodes, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 159, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
-      __pyx_t_4 = __pyx_f_6a_star_a_star(__pyx_v_grid_vertical, __pyx_v_grid_horizontal, __pyx_t_1, __pyx_v_goal_nodes, __pyx_v_minimum_segment_length); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 151, __pyx_L1_error)
+      __pyx_t_5.__pyx_n = 2;
+      __pyx_t_5.stats = __pyx_v_stats;
+      __pyx_t_5.limits = __pyx_v_limits;
+      __pyx_t_4 = __pyx_f_6a_star_a_star(__pyx_v_grid_vertical, __pyx_v_grid_horizontal, __pyx_t_1, __pyx_v_goal_nodes, __pyx_v_minimum_segment_length, &__pyx_t_5); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 159, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_4);
       __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
       if ((likely(PyTuple_CheckExact(__pyx_t_4))) || (PyList_CheckExact(__pyx_t_4))) {
@@ -6752,143 +7009,143 @@ static PyObject *__pyx_pf_6a_star_astar_start(CYTHON_UNUSED PyObject *__pyx_self
         if (unlikely(size != 2)) {
           if (size > 2) __Pyx_RaiseTooManyValuesError(2);
           else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
-          __PYX_ERR(0, 151, __pyx_L1_error)
+          __PYX_ERR(0, 159, __pyx_L1_error)
         }
         #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
         if (likely(PyTuple_CheckExact(sequence))) {
           __pyx_t_1 = PyTuple_GET_ITEM(sequence, 0); 
-          __pyx_t_5 = PyTuple_GET_ITEM(sequence, 1); 
+          __pyx_t_6 = PyTuple_GET_ITEM(sequence, 1); 
         } else {
           __pyx_t_1 = PyList_GET_ITEM(sequence, 0); 
-          __pyx_t_5 = PyList_GET_ITEM(sequence, 1); 
+          __pyx_t_6 = PyList_GET_ITEM(sequence, 1); 
         }
         __Pyx_INCREF(__pyx_t_1);
-        __Pyx_INCREF(__pyx_t_5);
+        __Pyx_INCREF(__pyx_t_6);
         #else
-        __pyx_t_1 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 151, __pyx_L1_error)
+        __pyx_t_1 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 159, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_1);
-        __pyx_t_5 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 151, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_5);
+        __pyx_t_6 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 159, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_6);
         #endif
         __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
       } else {
         Py_ssize_t index = -1;
-        __pyx_t_6 = PyObject_GetIter(__pyx_t_4); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 151, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_6);
+        __pyx_t_7 = PyObject_GetIter(__pyx_t_4); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 159, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_7);
         __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-        __pyx_t_7 = __Pyx_PyObject_GetIterNextFunc(__pyx_t_6);
-        index = 0; __pyx_t_1 = __pyx_t_7(__pyx_t_6); if (unlikely(!__pyx_t_1)) goto __pyx_L5_unpacking_failed;
+        __pyx_t_8 = __Pyx_PyObject_GetIterNextFunc(__pyx_t_7);
+        index = 0; __pyx_t_1 = __pyx_t_8(__pyx_t_7); if (unlikely(!__pyx_t_1)) goto __pyx_L5_unpacking_failed;
         __Pyx_GOTREF(__pyx_t_1);
-        index = 1; __pyx_t_5 = __pyx_t_7(__pyx_t_6); if (unlikely(!__pyx_t_5)) goto __pyx_L5_unpacking_failed;
-        __Pyx_GOTREF(__pyx_t_5);
-        if (__Pyx_IternextUnpackEndCheck(__pyx_t_7(__pyx_t_6), 2) < 0) __PYX_ERR(0, 151, __pyx_L1_error)
-        __pyx_t_7 = NULL;
-        __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+        index = 1; __pyx_t_6 = __pyx_t_8(__pyx_t_7); if (unlikely(!__pyx_t_6)) goto __pyx_L5_unpacking_failed;
+        __Pyx_GOTREF(__pyx_t_6);
+        if (__Pyx_IternextUnpackEndCheck(__pyx_t_8(__pyx_t_7), 2) < 0) __PYX_ERR(0, 159, __pyx_L1_error)
+        __pyx_t_8 = NULL;
+        __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
         goto __pyx_L6_unpacking_done;
         __pyx_L5_unpacking_failed:;
-        __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-        __pyx_t_7 = NULL;
+        __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+        __pyx_t_8 = NULL;
         if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
-        __PYX_ERR(0, 151, __pyx_L1_error)
+        __PYX_ERR(0, 159, __pyx_L1_error)
         __pyx_L6_unpacking_done:;
       }
       __Pyx_DECREF_SET(__pyx_v_path, __pyx_t_1);
       __pyx_t_1 = 0;
-      __Pyx_DECREF_SET(__pyx_v_cost, __pyx_t_5);
-      __pyx_t_5 = 0;
+      __Pyx_DECREF_SET(__pyx_v_cost, __pyx_t_6);
+      __pyx_t_6 = 0;
 
-      /* "a_star.pyx":150
+      /* "a_star.pyx":158
  * 
  * 
  *         if len(goal_nodes) <= 2:             # <<<<<<<<<<<<<<
- *             path, cost = a_star(grid_vertical, grid_horizontal, goal_nodes[0], goal_nodes, minimum_segment_length)
+ *             path, cost = a_star(grid_vertical, grid_horizontal, goal_nodes[0], goal_nodes, minimum_segment_length, stats, limits)
  *         else:
  */
       goto __pyx_L4;
     }
 
-    /* "a_star.pyx":153
- *             path, cost = a_star(grid_vertical, grid_horizontal, goal_nodes[0], goal_nodes, minimum_segment_length)
+    /* "a_star.pyx":161
+ *             path, cost = a_star(grid_vertical, grid_horizontal, goal_nodes[0], goal_nodes, minimum_segment_length, stats, limits)
  *         else:
  *             order = tsp_ordering(goal_nodes)             # <<<<<<<<<<<<<<
  *             for i in range(1, len(order)):
  * 
  */
     /*else*/ {
-      __pyx_t_4 = __pyx_f_6a_star_tsp_ordering(__pyx_v_goal_nodes); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 153, __pyx_L1_error)
+      __pyx_t_4 = __pyx_f_6a_star_tsp_ordering(__pyx_v_goal_nodes); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 161, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_4);
       __pyx_v_order = __pyx_t_4;
       __pyx_t_4 = 0;
 
-      /* "a_star.pyx":154
+      /* "a_star.pyx":162
  *         else:
  *             order = tsp_ordering(goal_nodes)
  *             for i in range(1, len(order)):             # <<<<<<<<<<<<<<
  * 
- *                 partial_path, partial_cost = a_star(grid_vertical, grid_horizontal, goal_nodes[order[i-1]], [goal_nodes[order[i]]], minimum_segment_length)
+ *                 partial_path, partial_cost = a_star(grid_vertical, grid_horizontal, goal_nodes[order[i-1]], [goal_nodes[order[i]]], minimum_segment_length, stats, limits)
  */
-      __pyx_t_3 = PyObject_Length(__pyx_v_order); if (unlikely(__pyx_t_3 == ((Py_ssize_t)-1))) __PYX_ERR(0, 154, __pyx_L1_error)
-      __pyx_t_4 = PyInt_FromSsize_t(__pyx_t_3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 154, __pyx_L1_error)
+      __pyx_t_3 = PyObject_Length(__pyx_v_order); if (unlikely(__pyx_t_3 == ((Py_ssize_t)-1))) __PYX_ERR(0, 162, __pyx_L1_error)
+      __pyx_t_4 = PyInt_FromSsize_t(__pyx_t_3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 162, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_4);
-      __pyx_t_5 = PyTuple_New(2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 154, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_5);
+      __pyx_t_6 = PyTuple_New(2); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 162, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_6);
       __Pyx_INCREF(__pyx_int_1);
       __Pyx_GIVEREF(__pyx_int_1);
-      if (__Pyx_PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_int_1)) __PYX_ERR(0, 154, __pyx_L1_error);
+      if (__Pyx_PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_int_1)) __PYX_ERR(0, 162, __pyx_L1_error);
       __Pyx_GIVEREF(__pyx_t_4);
-      if (__Pyx_PyTuple_SET_ITEM(__pyx_t_5, 1, __pyx_t_4)) __PYX_ERR(0, 154, __pyx_L1_error);
+      if (__Pyx_PyTuple_SET_ITEM(__pyx_t_6, 1, __pyx_t_4)) __PYX_ERR(0, 162, __pyx_L1_error);
       __pyx_t_4 = 0;
-      __pyx_t_4 = __Pyx_PyObject_Call(__pyx_builtin_range, __pyx_t_5, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 154, __pyx_L1_error)
+      __pyx_t_4 = __Pyx_PyObject_Call(__pyx_builtin_range, __pyx_t_6, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 162, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_4);
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
       if (likely(PyList_CheckExact(__pyx_t_4)) || PyTuple_CheckExact(__pyx_t_4)) {
-        __pyx_t_5 = __pyx_t_4; __Pyx_INCREF(__pyx_t_5);
+        __pyx_t_6 = __pyx_t_4; __Pyx_INCREF(__pyx_t_6);
         __pyx_t_3 = 0;
-        __pyx_t_8 = NULL;
+        __pyx_t_9 = NULL;
       } else {
-        __pyx_t_3 = -1; __pyx_t_5 = PyObject_GetIter(__pyx_t_4); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 154, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_5);
-        __pyx_t_8 = __Pyx_PyObject_GetIterNextFunc(__pyx_t_5); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 154, __pyx_L1_error)
+        __pyx_t_3 = -1; __pyx_t_6 = PyObject_GetIter(__pyx_t_4); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 162, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_6);
+        __pyx_t_9 = __Pyx_PyObject_GetIterNextFunc(__pyx_t_6); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 162, __pyx_L1_error)
       }
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
       for (;;) {
-        if (likely(!__pyx_t_8)) {
-          if (likely(PyList_CheckExact(__pyx_t_5))) {
+        if (likely(!__pyx_t_9)) {
+          if (likely(PyList_CheckExact(__pyx_t_6))) {
             {
-              Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_5);
+              Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_6);
               #if !CYTHON_ASSUME_SAFE_MACROS
-              if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 154, __pyx_L1_error)
+              if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 162, __pyx_L1_error)
               #endif
               if (__pyx_t_3 >= __pyx_temp) break;
             }
             #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-            __pyx_t_4 = PyList_GET_ITEM(__pyx_t_5, __pyx_t_3); __Pyx_INCREF(__pyx_t_4); __pyx_t_3++; if (unlikely((0 < 0))) __PYX_ERR(0, 154, __pyx_L1_error)
+            __pyx_t_4 = PyList_GET_ITEM(__pyx_t_6, __pyx_t_3); __Pyx_INCREF(__pyx_t_4); __pyx_t_3++; if (unlikely((0 < 0))) __PYX_ERR(0, 162, __pyx_L1_error)
             #else
-            __pyx_t_4 = __Pyx_PySequence_ITEM(__pyx_t_5, __pyx_t_3); __pyx_t_3++; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 154, __pyx_L1_error)
+            __pyx_t_4 = __Pyx_PySequence_ITEM(__pyx_t_6, __pyx_t_3); __pyx_t_3++; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 162, __pyx_L1_error)
             __Pyx_GOTREF(__pyx_t_4);
             #endif
           } else {
             {
-              Py_ssize_t __pyx_temp = __Pyx_PyTuple_GET_SIZE(__pyx_t_5);
+              Py_ssize_t __pyx_temp = __Pyx_PyTuple_GET_SIZE(__pyx_t_6);
               #if !CYTHON_ASSUME_SAFE_MACROS
-              if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 154, __pyx_L1_error)
+              if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 162, __pyx_L1_error)
               #endif
               if (__pyx_t_3 >= __pyx_temp) break;
             }
             #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-            __pyx_t_4 = PyTuple_GET_ITEM(__pyx_t_5, __pyx_t_3); __Pyx_INCREF(__pyx_t_4); __pyx_t_3++; if (unlikely((0 < 0))) __PYX_ERR(0, 154, __pyx_L1_error)
+            __pyx_t_4 = PyTuple_GET_ITEM(__pyx_t_6, __pyx_t_3); __Pyx_INCREF(__pyx_t_4); __pyx_t_3++; if (unlikely((0 < 0))) __PYX_ERR(0, 162, __pyx_L1_error)
             #else
-            __pyx_t_4 = __Pyx_PySequence_ITEM(__pyx_t_5, __pyx_t_3); __pyx_t_3++; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 154, __pyx_L1_error)
+            __pyx_t_4 = __Pyx_PySequence_ITEM(__pyx_t_6, __pyx_t_3); __pyx_t_3++; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 162, __pyx_L1_error)
             __Pyx_GOTREF(__pyx_t_4);
             #endif
           }
         } else {
-          __pyx_t_4 = __pyx_t_8(__pyx_t_5);
+          __pyx_t_4 = __pyx_t_9(__pyx_t_6);
           if (unlikely(!__pyx_t_4)) {
             PyObject* exc_type = PyErr_Occurred();
             if (exc_type) {
               if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
-              else __PYX_ERR(0, 154, __pyx_L1_error)
+              else __PYX_ERR(0, 162, __pyx_L1_error)
             }
             break;
           }
@@ -6897,42 +7154,45 @@ static PyObject *__pyx_pf_6a_star_astar_start(CYTHON_UNUSED PyObject *__pyx_self
         __Pyx_XDECREF_SET(__pyx_v_i, __pyx_t_4);
         __pyx_t_4 = 0;
 
-        /* "a_star.pyx":156
+        /* "a_star.pyx":164
  *             for i in range(1, len(order)):
  * 
- *                 partial_path, partial_cost = a_star(grid_vertical, grid_horizontal, goal_nodes[order[i-1]], [goal_nodes[order[i]]], minimum_segment_length)             # <<<<<<<<<<<<<<
+ *                 partial_path, partial_cost = a_star(grid_vertical, grid_horizontal, goal_nodes[order[i-1]], [goal_nodes[order[i]]], minimum_segment_length, stats, limits)             # <<<<<<<<<<<<<<
  *                 segments = segmentation(partial_path)
  * 
  */
-        __pyx_t_4 = __Pyx_PyInt_SubtractObjC(__pyx_v_i, __pyx_int_1, 1, 0, 0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 156, __pyx_L1_error)
+        __pyx_t_4 = __Pyx_PyInt_SubtractObjC(__pyx_v_i, __pyx_int_1, 1, 0, 0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 164, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_4);
-        __pyx_t_1 = __Pyx_PyObject_GetItem(__pyx_v_order, __pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 156, __pyx_L1_error)
+        __pyx_t_1 = __Pyx_PyObject_GetItem(__pyx_v_order, __pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 164, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_1);
         __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-        __pyx_t_4 = __Pyx_PyObject_GetItem(__pyx_v_goal_nodes, __pyx_t_1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 156, __pyx_L1_error)
+        __pyx_t_4 = __Pyx_PyObject_GetItem(__pyx_v_goal_nodes, __pyx_t_1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 164, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_4);
         __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-        __pyx_t_1 = __Pyx_PyObject_GetItem(__pyx_v_order, __pyx_v_i); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 156, __pyx_L1_error)
+        __pyx_t_1 = __Pyx_PyObject_GetItem(__pyx_v_order, __pyx_v_i); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 164, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_1);
-        __pyx_t_6 = __Pyx_PyObject_GetItem(__pyx_v_goal_nodes, __pyx_t_1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 156, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_6);
+        __pyx_t_7 = __Pyx_PyObject_GetItem(__pyx_v_goal_nodes, __pyx_t_1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 164, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_7);
         __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-        __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 156, __pyx_L1_error)
+        __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 164, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_1);
-        __Pyx_GIVEREF(__pyx_t_6);
-        if (__Pyx_PyList_SET_ITEM(__pyx_t_1, 0, __pyx_t_6)) __PYX_ERR(0, 156, __pyx_L1_error);
-        __pyx_t_6 = 0;
-        __pyx_t_6 = __pyx_f_6a_star_a_star(__pyx_v_grid_vertical, __pyx_v_grid_horizontal, __pyx_t_4, __pyx_t_1, __pyx_v_minimum_segment_length); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 156, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_6);
+        __Pyx_GIVEREF(__pyx_t_7);
+        if (__Pyx_PyList_SET_ITEM(__pyx_t_1, 0, __pyx_t_7)) __PYX_ERR(0, 164, __pyx_L1_error);
+        __pyx_t_7 = 0;
+        __pyx_t_5.__pyx_n = 2;
+        __pyx_t_5.stats = __pyx_v_stats;
+        __pyx_t_5.limits = __pyx_v_limits;
+        __pyx_t_7 = __pyx_f_6a_star_a_star(__pyx_v_grid_vertical, __pyx_v_grid_horizontal, __pyx_t_4, __pyx_t_1, __pyx_v_minimum_segment_length, &__pyx_t_5); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 164, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_7);
         __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
         __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-        if ((likely(PyTuple_CheckExact(__pyx_t_6))) || (PyList_CheckExact(__pyx_t_6))) {
-          PyObject* sequence = __pyx_t_6;
+        if ((likely(PyTuple_CheckExact(__pyx_t_7))) || (PyList_CheckExact(__pyx_t_7))) {
+          PyObject* sequence = __pyx_t_7;
           Py_ssize_t size = __Pyx_PySequence_SIZE(sequence);
           if (unlikely(size != 2)) {
             if (size > 2) __Pyx_RaiseTooManyValuesError(2);
             else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
-            __PYX_ERR(0, 156, __pyx_L1_error)
+            __PYX_ERR(0, 164, __pyx_L1_error)
           }
           #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
           if (likely(PyTuple_CheckExact(sequence))) {
@@ -6945,31 +7205,31 @@ static PyObject *__pyx_pf_6a_star_astar_start(CYTHON_UNUSED PyObject *__pyx_self
           __Pyx_INCREF(__pyx_t_1);
           __Pyx_INCREF(__pyx_t_4);
           #else
-          __pyx_t_1 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 156, __pyx_L1_error)
+          __pyx_t_1 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 164, __pyx_L1_error)
           __Pyx_GOTREF(__pyx_t_1);
-          __pyx_t_4 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 156, __pyx_L1_error)
+          __pyx_t_4 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 164, __pyx_L1_error)
           __Pyx_GOTREF(__pyx_t_4);
           #endif
-          __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+          __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
         } else {
           Py_ssize_t index = -1;
-          __pyx_t_9 = PyObject_GetIter(__pyx_t_6); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 156, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_9);
-          __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-          __pyx_t_7 = __Pyx_PyObject_GetIterNextFunc(__pyx_t_9);
-          index = 0; __pyx_t_1 = __pyx_t_7(__pyx_t_9); if (unlikely(!__pyx_t_1)) goto __pyx_L9_unpacking_failed;
+          __pyx_t_10 = PyObject_GetIter(__pyx_t_7); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 164, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_10);
+          __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+          __pyx_t_8 = __Pyx_PyObject_GetIterNextFunc(__pyx_t_10);
+          index = 0; __pyx_t_1 = __pyx_t_8(__pyx_t_10); if (unlikely(!__pyx_t_1)) goto __pyx_L9_unpacking_failed;
           __Pyx_GOTREF(__pyx_t_1);
-          index = 1; __pyx_t_4 = __pyx_t_7(__pyx_t_9); if (unlikely(!__pyx_t_4)) goto __pyx_L9_unpacking_failed;
+          index = 1; __pyx_t_4 = __pyx_t_8(__pyx_t_10); if (unlikely(!__pyx_t_4)) goto __pyx_L9_unpacking_failed;
           __Pyx_GOTREF(__pyx_t_4);
-          if (__Pyx_IternextUnpackEndCheck(__pyx_t_7(__pyx_t_9), 2) < 0) __PYX_ERR(0, 156, __pyx_L1_error)
-          __pyx_t_7 = NULL;
-          __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+          if (__Pyx_IternextUnpackEndCheck(__pyx_t_8(__pyx_t_10), 2) < 0) __PYX_ERR(0, 164, __pyx_L1_error)
+          __pyx_t_8 = NULL;
+          __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
           goto __pyx_L10_unpacking_done;
           __pyx_L9_unpacking_failed:;
-          __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-          __pyx_t_7 = NULL;
+          __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+          __pyx_t_8 = NULL;
           if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
-          __PYX_ERR(0, 156, __pyx_L1_error)
+          __PYX_ERR(0, 164, __pyx_L1_error)
           __pyx_L10_unpacking_done:;
         }
         __Pyx_XDECREF_SET(__pyx_v_partial_path, __pyx_t_1);
@@ -6977,68 +7237,71 @@ static PyObject *__pyx_pf_6a_star_astar_start(CYTHON_UNUSED PyObject *__pyx_self
         __Pyx_XDECREF_SET(__pyx_v_partial_cost, __pyx_t_4);
         __pyx_t_4 = 0;
 
-        /* "a_star.pyx":157
+        /* "a_star.pyx":165
  * 
- *                 partial_path, partial_cost = a_star(grid_vertical, grid_horizontal, goal_nodes[order[i-1]], [goal_nodes[order[i]]], minimum_segment_length)
+ *                 partial_path, partial_cost = a_star(grid_vertical, grid_horizontal, goal_nodes[order[i-1]], [goal_nodes[order[i]]], minimum_segment_length, stats, limits)
  *                 segments = segmentation(partial_path)             # <<<<<<<<<<<<<<
  * 
  *                 if partial_path == None  and i>1:
  */
-        __pyx_t_6 = __pyx_f_6a_star_segmentation(__pyx_v_partial_path); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 157, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_6);
-        __Pyx_XDECREF_SET(__pyx_v_segments, __pyx_t_6);
-        __pyx_t_6 = 0;
+        __pyx_t_7 = __pyx_f_6a_star_segmentation(__pyx_v_partial_path); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 165, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_7);
+        __Pyx_XDECREF_SET(__pyx_v_segments, __pyx_t_7);
+        __pyx_t_7 = 0;
 
-        /* "a_star.pyx":159
+        /* "a_star.pyx":167
  *                 segments = segmentation(partial_path)
  * 
  *                 if partial_path == None  and i>1:             # <<<<<<<<<<<<<<
- *                     partial_path, partial_cost = a_star(grid_vertical, grid_horizontal, goal_nodes[order[i-2]], [goal_nodes[order[i]]], minimum_segment_length)
+ *                     partial_path, partial_cost = a_star(grid_vertical, grid_horizontal, goal_nodes[order[i-2]], [goal_nodes[order[i]]], minimum_segment_length, stats, limits)
  * 
  */
-        __pyx_t_6 = PyObject_RichCompare(__pyx_v_partial_path, Py_None, Py_EQ); __Pyx_XGOTREF(__pyx_t_6); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 159, __pyx_L1_error)
-        __pyx_t_10 = __Pyx_PyObject_IsTrue(__pyx_t_6); if (unlikely((__pyx_t_10 < 0))) __PYX_ERR(0, 159, __pyx_L1_error)
-        __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-        if (__pyx_t_10) {
+        __pyx_t_7 = PyObject_RichCompare(__pyx_v_partial_path, Py_None, Py_EQ); __Pyx_XGOTREF(__pyx_t_7); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 167, __pyx_L1_error)
+        __pyx_t_11 = __Pyx_PyObject_IsTrue(__pyx_t_7); if (unlikely((__pyx_t_11 < 0))) __PYX_ERR(0, 167, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+        if (__pyx_t_11) {
         } else {
-          __pyx_t_2 = __pyx_t_10;
+          __pyx_t_2 = __pyx_t_11;
           goto __pyx_L12_bool_binop_done;
         }
-        __pyx_t_6 = PyObject_RichCompare(__pyx_v_i, __pyx_int_1, Py_GT); __Pyx_XGOTREF(__pyx_t_6); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 159, __pyx_L1_error)
-        __pyx_t_10 = __Pyx_PyObject_IsTrue(__pyx_t_6); if (unlikely((__pyx_t_10 < 0))) __PYX_ERR(0, 159, __pyx_L1_error)
-        __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-        __pyx_t_2 = __pyx_t_10;
+        __pyx_t_7 = PyObject_RichCompare(__pyx_v_i, __pyx_int_1, Py_GT); __Pyx_XGOTREF(__pyx_t_7); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 167, __pyx_L1_error)
+        __pyx_t_11 = __Pyx_PyObject_IsTrue(__pyx_t_7); if (unlikely((__pyx_t_11 < 0))) __PYX_ERR(0, 167, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+        __pyx_t_2 = __pyx_t_11;
         __pyx_L12_bool_binop_done:;
         if (__pyx_t_2) {
 
-          /* "a_star.pyx":160
+          /* "a_star.pyx":168
  * 
  *                 if partial_path == None  and i>1:
- *                     partial_path, partial_cost = a_star(grid_vertical, grid_horizontal, goal_nodes[order[i-2]], [goal_nodes[order[i]]], minimum_segment_length)             # <<<<<<<<<<<<<<
+ *                     partial_path, partial_cost = a_star(grid_vertical, grid_horizontal, goal_nodes[order[i-2]], [goal_nodes[order[i]]], minimum_segment_length, stats, limits)             # <<<<<<<<<<<<<<
  * 
  *                 if partial_path == None and i < len(order)-1:
  */
-          __pyx_t_6 = __Pyx_PyInt_SubtractObjC(__pyx_v_i, __pyx_int_2, 2, 0, 0); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 160, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_6);
-          __pyx_t_4 = __Pyx_PyObject_GetItem(__pyx_v_order, __pyx_t_6); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 160, __pyx_L1_error)
+          __pyx_t_7 = __Pyx_PyInt_SubtractObjC(__pyx_v_i, __pyx_int_2, 2, 0, 0); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 168, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_7);
+          __pyx_t_4 = __Pyx_PyObject_GetItem(__pyx_v_order, __pyx_t_7); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 168, __pyx_L1_error)
           __Pyx_GOTREF(__pyx_t_4);
-          __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-          __pyx_t_6 = __Pyx_PyObject_GetItem(__pyx_v_goal_nodes, __pyx_t_4); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 160, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_6);
+          __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+          __pyx_t_7 = __Pyx_PyObject_GetItem(__pyx_v_goal_nodes, __pyx_t_4); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 168, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_7);
           __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-          __pyx_t_4 = __Pyx_PyObject_GetItem(__pyx_v_order, __pyx_v_i); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 160, __pyx_L1_error)
+          __pyx_t_4 = __Pyx_PyObject_GetItem(__pyx_v_order, __pyx_v_i); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 168, __pyx_L1_error)
           __Pyx_GOTREF(__pyx_t_4);
-          __pyx_t_1 = __Pyx_PyObject_GetItem(__pyx_v_goal_nodes, __pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 160, __pyx_L1_error)
+          __pyx_t_1 = __Pyx_PyObject_GetItem(__pyx_v_goal_nodes, __pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 168, __pyx_L1_error)
           __Pyx_GOTREF(__pyx_t_1);
           __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-          __pyx_t_4 = PyList_New(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 160, __pyx_L1_error)
+          __pyx_t_4 = PyList_New(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 168, __pyx_L1_error)
           __Pyx_GOTREF(__pyx_t_4);
           __Pyx_GIVEREF(__pyx_t_1);
-          if (__Pyx_PyList_SET_ITEM(__pyx_t_4, 0, __pyx_t_1)) __PYX_ERR(0, 160, __pyx_L1_error);
+          if (__Pyx_PyList_SET_ITEM(__pyx_t_4, 0, __pyx_t_1)) __PYX_ERR(0, 168, __pyx_L1_error);
           __pyx_t_1 = 0;
-          __pyx_t_1 = __pyx_f_6a_star_a_star(__pyx_v_grid_vertical, __pyx_v_grid_horizontal, __pyx_t_6, __pyx_t_4, __pyx_v_minimum_segment_length); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 160, __pyx_L1_error)
+          __pyx_t_5.__pyx_n = 2;
+          __pyx_t_5.stats = __pyx_v_stats;
+          __pyx_t_5.limits = __pyx_v_limits;
+          __pyx_t_1 = __pyx_f_6a_star_a_star(__pyx_v_grid_vertical, __pyx_v_grid_horizontal, __pyx_t_7, __pyx_t_4, __pyx_v_minimum_segment_length, &__pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 168, __pyx_L1_error)
           __Pyx_GOTREF(__pyx_t_1);
-          __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+          __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
           __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
           if ((likely(PyTuple_CheckExact(__pyx_t_1))) || (PyList_CheckExact(__pyx_t_1))) {
             PyObject* sequence = __pyx_t_1;
@@ -7046,117 +7309,120 @@ static PyObject *__pyx_pf_6a_star_astar_start(CYTHON_UNUSED PyObject *__pyx_self
             if (unlikely(size != 2)) {
               if (size > 2) __Pyx_RaiseTooManyValuesError(2);
               else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
-              __PYX_ERR(0, 160, __pyx_L1_error)
+              __PYX_ERR(0, 168, __pyx_L1_error)
             }
             #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
             if (likely(PyTuple_CheckExact(sequence))) {
               __pyx_t_4 = PyTuple_GET_ITEM(sequence, 0); 
-              __pyx_t_6 = PyTuple_GET_ITEM(sequence, 1); 
+              __pyx_t_7 = PyTuple_GET_ITEM(sequence, 1); 
             } else {
               __pyx_t_4 = PyList_GET_ITEM(sequence, 0); 
-              __pyx_t_6 = PyList_GET_ITEM(sequence, 1); 
+              __pyx_t_7 = PyList_GET_ITEM(sequence, 1); 
             }
             __Pyx_INCREF(__pyx_t_4);
-            __Pyx_INCREF(__pyx_t_6);
+            __Pyx_INCREF(__pyx_t_7);
             #else
-            __pyx_t_4 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 160, __pyx_L1_error)
+            __pyx_t_4 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 168, __pyx_L1_error)
             __Pyx_GOTREF(__pyx_t_4);
-            __pyx_t_6 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 160, __pyx_L1_error)
-            __Pyx_GOTREF(__pyx_t_6);
+            __pyx_t_7 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 168, __pyx_L1_error)
+            __Pyx_GOTREF(__pyx_t_7);
             #endif
             __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
           } else {
             Py_ssize_t index = -1;
-            __pyx_t_9 = PyObject_GetIter(__pyx_t_1); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 160, __pyx_L1_error)
-            __Pyx_GOTREF(__pyx_t_9);
+            __pyx_t_10 = PyObject_GetIter(__pyx_t_1); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 168, __pyx_L1_error)
+            __Pyx_GOTREF(__pyx_t_10);
             __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-            __pyx_t_7 = __Pyx_PyObject_GetIterNextFunc(__pyx_t_9);
-            index = 0; __pyx_t_4 = __pyx_t_7(__pyx_t_9); if (unlikely(!__pyx_t_4)) goto __pyx_L14_unpacking_failed;
+            __pyx_t_8 = __Pyx_PyObject_GetIterNextFunc(__pyx_t_10);
+            index = 0; __pyx_t_4 = __pyx_t_8(__pyx_t_10); if (unlikely(!__pyx_t_4)) goto __pyx_L14_unpacking_failed;
             __Pyx_GOTREF(__pyx_t_4);
-            index = 1; __pyx_t_6 = __pyx_t_7(__pyx_t_9); if (unlikely(!__pyx_t_6)) goto __pyx_L14_unpacking_failed;
-            __Pyx_GOTREF(__pyx_t_6);
-            if (__Pyx_IternextUnpackEndCheck(__pyx_t_7(__pyx_t_9), 2) < 0) __PYX_ERR(0, 160, __pyx_L1_error)
-            __pyx_t_7 = NULL;
-            __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+            index = 1; __pyx_t_7 = __pyx_t_8(__pyx_t_10); if (unlikely(!__pyx_t_7)) goto __pyx_L14_unpacking_failed;
+            __Pyx_GOTREF(__pyx_t_7);
+            if (__Pyx_IternextUnpackEndCheck(__pyx_t_8(__pyx_t_10), 2) < 0) __PYX_ERR(0, 168, __pyx_L1_error)
+            __pyx_t_8 = NULL;
+            __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
             goto __pyx_L15_unpacking_done;
             __pyx_L14_unpacking_failed:;
-            __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-            __pyx_t_7 = NULL;
+            __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+            __pyx_t_8 = NULL;
             if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
-            __PYX_ERR(0, 160, __pyx_L1_error)
+            __PYX_ERR(0, 168, __pyx_L1_error)
             __pyx_L15_unpacking_done:;
           }
           __Pyx_DECREF_SET(__pyx_v_partial_path, __pyx_t_4);
           __pyx_t_4 = 0;
-          __Pyx_DECREF_SET(__pyx_v_partial_cost, __pyx_t_6);
-          __pyx_t_6 = 0;
+          __Pyx_DECREF_SET(__pyx_v_partial_cost, __pyx_t_7);
+          __pyx_t_7 = 0;
 
-          /* "a_star.pyx":159
+          /* "a_star.pyx":167
  *                 segments = segmentation(partial_path)
  * 
  *                 if partial_path == None  and i>1:             # <<<<<<<<<<<<<<
- *                     partial_path, partial_cost = a_star(grid_vertical, grid_horizontal, goal_nodes[order[i-2]], [goal_nodes[order[i]]], minimum_segment_length)
+ *                     partial_path, partial_cost = a_star(grid_vertical, grid_horizontal, goal_nodes[order[i-2]], [goal_nodes[order[i]]], minimum_segment_length, stats, limits)
  * 
  */
         }
 
-        /* "a_star.pyx":162
- *                     partial_path, partial_cost = a_star(grid_vertical, grid_horizontal, goal_nodes[order[i-2]], [goal_nodes[order[i]]], minimum_segment_length)
+        /* "a_star.pyx":170
+ *                     partial_path, partial_cost = a_star(grid_vertical, grid_horizontal, goal_nodes[order[i-2]], [goal_nodes[order[i]]], minimum_segment_length, stats, limits)
  * 
  *                 if partial_path == None and i < len(order)-1:             # <<<<<<<<<<<<<<
  * 
- *                     partial_path, partial_cost = a_star(grid_vertical, grid_horizontal, goal_nodes[order[i-1]], [goal_nodes[order[i+1]]], minimum_segment_length)
+ *                     partial_path, partial_cost = a_star(grid_vertical, grid_horizontal, goal_nodes[order[i-1]], [goal_nodes[order[i+1]]], minimum_segment_length, stats, limits)
  */
-        __pyx_t_1 = PyObject_RichCompare(__pyx_v_partial_path, Py_None, Py_EQ); __Pyx_XGOTREF(__pyx_t_1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 162, __pyx_L1_error)
-        __pyx_t_10 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely((__pyx_t_10 < 0))) __PYX_ERR(0, 162, __pyx_L1_error)
+        __pyx_t_1 = PyObject_RichCompare(__pyx_v_partial_path, Py_None, Py_EQ); __Pyx_XGOTREF(__pyx_t_1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 170, __pyx_L1_error)
+        __pyx_t_11 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely((__pyx_t_11 < 0))) __PYX_ERR(0, 170, __pyx_L1_error)
         __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-        if (__pyx_t_10) {
+        if (__pyx_t_11) {
         } else {
-          __pyx_t_2 = __pyx_t_10;
+          __pyx_t_2 = __pyx_t_11;
           goto __pyx_L17_bool_binop_done;
         }
-        __pyx_t_11 = PyObject_Length(__pyx_v_order); if (unlikely(__pyx_t_11 == ((Py_ssize_t)-1))) __PYX_ERR(0, 162, __pyx_L1_error)
-        __pyx_t_1 = PyInt_FromSsize_t((__pyx_t_11 - 1)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 162, __pyx_L1_error)
+        __pyx_t_12 = PyObject_Length(__pyx_v_order); if (unlikely(__pyx_t_12 == ((Py_ssize_t)-1))) __PYX_ERR(0, 170, __pyx_L1_error)
+        __pyx_t_1 = PyInt_FromSsize_t((__pyx_t_12 - 1)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 170, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_1);
-        __pyx_t_6 = PyObject_RichCompare(__pyx_v_i, __pyx_t_1, Py_LT); __Pyx_XGOTREF(__pyx_t_6); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 162, __pyx_L1_error)
+        __pyx_t_7 = PyObject_RichCompare(__pyx_v_i, __pyx_t_1, Py_LT); __Pyx_XGOTREF(__pyx_t_7); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 170, __pyx_L1_error)
         __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-        __pyx_t_10 = __Pyx_PyObject_IsTrue(__pyx_t_6); if (unlikely((__pyx_t_10 < 0))) __PYX_ERR(0, 162, __pyx_L1_error)
-        __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-        __pyx_t_2 = __pyx_t_10;
+        __pyx_t_11 = __Pyx_PyObject_IsTrue(__pyx_t_7); if (unlikely((__pyx_t_11 < 0))) __PYX_ERR(0, 170, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+        __pyx_t_2 = __pyx_t_11;
         __pyx_L17_bool_binop_done:;
         if (__pyx_t_2) {
 
-          /* "a_star.pyx":164
+          /* "a_star.pyx":172
  *                 if partial_path == None and i < len(order)-1:
  * 
- *                     partial_path, partial_cost = a_star(grid_vertical, grid_horizontal, goal_nodes[order[i-1]], [goal_nodes[order[i+1]]], minimum_segment_length)             # <<<<<<<<<<<<<<
+ *                     partial_path, partial_cost = a_star(grid_vertical, grid_horizontal, goal_nodes[order[i-1]], [goal_nodes[order[i+1]]], minimum_segment_length, stats, limits)             # <<<<<<<<<<<<<<
  * 
  *                 if partial_path :
  */
-          __pyx_t_6 = __Pyx_PyInt_SubtractObjC(__pyx_v_i, __pyx_int_1, 1, 0, 0); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 164, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_6);
-          __pyx_t_1 = __Pyx_PyObject_GetItem(__pyx_v_order, __pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 164, __pyx_L1_error)
+          __pyx_t_7 = __Pyx_PyInt_SubtractObjC(__pyx_v_i, __pyx_int_1, 1, 0, 0); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 172, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_7);
+          __pyx_t_1 = __Pyx_PyObject_GetItem(__pyx_v_order, __pyx_t_7); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 172, __pyx_L1_error)
           __Pyx_GOTREF(__pyx_t_1);
-          __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-          __pyx_t_6 = __Pyx_PyObject_GetItem(__pyx_v_goal_nodes, __pyx_t_1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 164, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_6);
+          __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+          __pyx_t_7 = __Pyx_PyObject_GetItem(__pyx_v_goal_nodes, __pyx_t_1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 172, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_7);
           __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-          __pyx_t_1 = __Pyx_PyInt_AddObjC(__pyx_v_i, __pyx_int_1, 1, 0, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 164, __pyx_L1_error)
+          __pyx_t_1 = __Pyx_PyInt_AddObjC(__pyx_v_i, __pyx_int_1, 1, 0, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 172, __pyx_L1_error)
           __Pyx_GOTREF(__pyx_t_1);
-          __pyx_t_4 = __Pyx_PyObject_GetItem(__pyx_v_order, __pyx_t_1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 164, __pyx_L1_error)
+          __pyx_t_4 = __Pyx_PyObject_GetItem(__pyx_v_order, __pyx_t_1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 172, __pyx_L1_error)
           __Pyx_GOTREF(__pyx_t_4);
           __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-          __pyx_t_1 = __Pyx_PyObject_GetItem(__pyx_v_goal_nodes, __pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 164, __pyx_L1_error)
+          __pyx_t_1 = __Pyx_PyObject_GetItem(__pyx_v_goal_nodes, __pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 172, __pyx_L1_error)
           __Pyx_GOTREF(__pyx_t_1);
           __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-          __pyx_t_4 = PyList_New(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 164, __pyx_L1_error)
+          __pyx_t_4 = PyList_New(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 172, __pyx_L1_error)
           __Pyx_GOTREF(__pyx_t_4);
           __Pyx_GIVEREF(__pyx_t_1);
-          if (__Pyx_PyList_SET_ITEM(__pyx_t_4, 0, __pyx_t_1)) __PYX_ERR(0, 164, __pyx_L1_error);
+          if (__Pyx_PyList_SET_ITEM(__pyx_t_4, 0, __pyx_t_1)) __PYX_ERR(0, 172, __pyx_L1_error);
           __pyx_t_1 = 0;
-          __pyx_t_1 = __pyx_f_6a_star_a_star(__pyx_v_grid_vertical, __pyx_v_grid_horizontal, __pyx_t_6, __pyx_t_4, __pyx_v_minimum_segment_length); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 164, __pyx_L1_error)
+          __pyx_t_5.__pyx_n = 2;
+          __pyx_t_5.stats = __pyx_v_stats;
+          __pyx_t_5.limits = __pyx_v_limits;
+          __pyx_t_1 = __pyx_f_6a_star_a_star(__pyx_v_grid_vertical, __pyx_v_grid_horizontal, __pyx_t_7, __pyx_t_4, __pyx_v_minimum_segment_length, &__pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 172, __pyx_L1_error)
           __Pyx_GOTREF(__pyx_t_1);
-          __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+          __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
           __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
           if ((likely(PyTuple_CheckExact(__pyx_t_1))) || (PyList_CheckExact(__pyx_t_1))) {
             PyObject* sequence = __pyx_t_1;
@@ -7164,117 +7430,117 @@ static PyObject *__pyx_pf_6a_star_astar_start(CYTHON_UNUSED PyObject *__pyx_self
             if (unlikely(size != 2)) {
               if (size > 2) __Pyx_RaiseTooManyValuesError(2);
               else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
-              __PYX_ERR(0, 164, __pyx_L1_error)
+              __PYX_ERR(0, 172, __pyx_L1_error)
             }
             #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
             if (likely(PyTuple_CheckExact(sequence))) {
               __pyx_t_4 = PyTuple_GET_ITEM(sequence, 0); 
-              __pyx_t_6 = PyTuple_GET_ITEM(sequence, 1); 
+              __pyx_t_7 = PyTuple_GET_ITEM(sequence, 1); 
             } else {
               __pyx_t_4 = PyList_GET_ITEM(sequence, 0); 
-              __pyx_t_6 = PyList_GET_ITEM(sequence, 1); 
+              __pyx_t_7 = PyList_GET_ITEM(sequence, 1); 
             }
             __Pyx_INCREF(__pyx_t_4);
-            __Pyx_INCREF(__pyx_t_6);
+            __Pyx_INCREF(__pyx_t_7);
             #else
-            __pyx_t_4 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 164, __pyx_L1_error)
+            __pyx_t_4 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 172, __pyx_L1_error)
             __Pyx_GOTREF(__pyx_t_4);
-            __pyx_t_6 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 164, __pyx_L1_error)
-            __Pyx_GOTREF(__pyx_t_6);
+            __pyx_t_7 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 172, __pyx_L1_error)
+            __Pyx_GOTREF(__pyx_t_7);
             #endif
             __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
           } else {
             Py_ssize_t index = -1;
-            __pyx_t_9 = PyObject_GetIter(__pyx_t_1); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 164, __pyx_L1_error)
-            __Pyx_GOTREF(__pyx_t_9);
+            __pyx_t_10 = PyObject_GetIter(__pyx_t_1); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 172, __pyx_L1_error)
+            __Pyx_GOTREF(__pyx_t_10);
             __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-            __pyx_t_7 = __Pyx_PyObject_GetIterNextFunc(__pyx_t_9);
-            index = 0; __pyx_t_4 = __pyx_t_7(__pyx_t_9); if (unlikely(!__pyx_t_4)) goto __pyx_L19_unpacking_failed;
+            __pyx_t_8 = __Pyx_PyObject_GetIterNextFunc(__pyx_t_10);
+            index = 0; __pyx_t_4 = __pyx_t_8(__pyx_t_10); if (unlikely(!__pyx_t_4)) goto __pyx_L19_unpacking_failed;
             __Pyx_GOTREF(__pyx_t_4);
-            index = 1; __pyx_t_6 = __pyx_t_7(__pyx_t_9); if (unlikely(!__pyx_t_6)) goto __pyx_L19_unpacking_failed;
-            __Pyx_GOTREF(__pyx_t_6);
-            if (__Pyx_IternextUnpackEndCheck(__pyx_t_7(__pyx_t_9), 2) < 0) __PYX_ERR(0, 164, __pyx_L1_error)
-            __pyx_t_7 = NULL;
-            __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+            index = 1; __pyx_t_7 = __pyx_t_8(__pyx_t_10); if (unlikely(!__pyx_t_7)) goto __pyx_L19_unpacking_failed;
+            __Pyx_GOTREF(__pyx_t_7);
+            if (__Pyx_IternextUnpackEndCheck(__pyx_t_8(__pyx_t_10), 2) < 0) __PYX_ERR(0, 172, __pyx_L1_error)
+            __pyx_t_8 = NULL;
+            __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
             goto __pyx_L20_unpacking_done;
             __pyx_L19_unpacking_failed:;
-            __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-            __pyx_t_7 = NULL;
+            __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+            __pyx_t_8 = NULL;
             if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
-            __PYX_ERR(0, 164, __pyx_L1_error)
+            __PYX_ERR(0, 172, __pyx_L1_error)
             __pyx_L20_unpacking_done:;
           }
           __Pyx_DECREF_SET(__pyx_v_partial_path, __pyx_t_4);
           __pyx_t_4 = 0;
-          __Pyx_DECREF_SET(__pyx_v_partial_cost, __pyx_t_6);
-          __pyx_t_6 = 0;
+          __Pyx_DECREF_SET(__pyx_v_partial_cost, __pyx_t_7);
+          __pyx_t_7 = 0;
 
-          /* "a_star.pyx":162
- *                     partial_path, partial_cost = a_star(grid_vertical, grid_horizontal, goal_nodes[order[i-2]], [goal_nodes[order[i]]], minimum_segment_length)
+          /* "a_star.pyx":170
+ *                     partial_path, partial_cost = a_star(grid_vertical, grid_horizontal, goal_nodes[order[i-2]], [goal_nodes[order[i]]], minimum_segment_length, stats, limits)
  * 
  *                 if partial_path == None and i < len(order)-1:             # <<<<<<<<<<<<<<
  * 
- *                     partial_path, partial_cost = a_star(grid_vertical, grid_horizontal, goal_nodes[order[i-1]], [goal_nodes[order[i+1]]], minimum_segment_length)
+ *                     partial_path, partial_cost = a_star(grid_vertical, grid_horizontal, goal_nodes[order[i-1]], [goal_nodes[order[i+1]]], minimum_segment_length, stats, limits)
  */
         }
 
-        /* "a_star.pyx":166
- *                     partial_path, partial_cost = a_star(grid_vertical, grid_horizontal, goal_nodes[order[i-1]], [goal_nodes[order[i+1]]], minimum_segment_length)
+        /* "a_star.pyx":174
+ *                     partial_path, partial_cost = a_star(grid_vertical, grid_horizontal, goal_nodes[order[i-1]], [goal_nodes[order[i+1]]], minimum_segment_length, stats, limits)
  * 
  *                 if partial_path :             # <<<<<<<<<<<<<<
  *                    # grid_vertical, grid_horizontal = lock_trace(grid_vertical, grid_horizontal, segments, trace_width_scaled)
  *                     path.extend(partial_path)
  */
-        __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_v_partial_path); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(0, 166, __pyx_L1_error)
+        __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_v_partial_path); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(0, 174, __pyx_L1_error)
         if (__pyx_t_2) {
 
-          /* "a_star.pyx":168
+          /* "a_star.pyx":176
  *                 if partial_path :
  *                    # grid_vertical, grid_horizontal = lock_trace(grid_vertical, grid_horizontal, segments, trace_width_scaled)
  *                     path.extend(partial_path)             # <<<<<<<<<<<<<<
  *                     cost += partial_cost
  *                 else:
  */
-          __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_path, __pyx_n_s_extend); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 168, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_6);
+          __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_v_path, __pyx_n_s_extend); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 176, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_7);
           __pyx_t_4 = NULL;
-          __pyx_t_12 = 0;
+          __pyx_t_13 = 0;
           #if CYTHON_UNPACK_METHODS
-          if (likely(PyMethod_Check(__pyx_t_6))) {
-            __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_6);
+          if (likely(PyMethod_Check(__pyx_t_7))) {
+            __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_7);
             if (likely(__pyx_t_4)) {
-              PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
+              PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_7);
               __Pyx_INCREF(__pyx_t_4);
               __Pyx_INCREF(function);
-              __Pyx_DECREF_SET(__pyx_t_6, function);
-              __pyx_t_12 = 1;
+              __Pyx_DECREF_SET(__pyx_t_7, function);
+              __pyx_t_13 = 1;
             }
           }
           #endif
           {
             PyObject *__pyx_callargs[2] = {__pyx_t_4, __pyx_v_partial_path};
-            __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_6, __pyx_callargs+1-__pyx_t_12, 1+__pyx_t_12);
+            __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_7, __pyx_callargs+1-__pyx_t_13, 1+__pyx_t_13);
             __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-            if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 168, __pyx_L1_error)
+            if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 176, __pyx_L1_error)
             __Pyx_GOTREF(__pyx_t_1);
-            __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+            __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
           }
           __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-          /* "a_star.pyx":169
+          /* "a_star.pyx":177
  *                    # grid_vertical, grid_horizontal = lock_trace(grid_vertical, grid_horizontal, segments, trace_width_scaled)
  *                     path.extend(partial_path)
  *                     cost += partial_cost             # <<<<<<<<<<<<<<
  *                 else:
  * 
  */
-          __pyx_t_1 = PyNumber_InPlaceAdd(__pyx_v_cost, __pyx_v_partial_cost); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 169, __pyx_L1_error)
+          __pyx_t_1 = PyNumber_InPlaceAdd(__pyx_v_cost, __pyx_v_partial_cost); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 177, __pyx_L1_error)
           __Pyx_GOTREF(__pyx_t_1);
           __Pyx_DECREF_SET(__pyx_v_cost, __pyx_t_1);
           __pyx_t_1 = 0;
 
-          /* "a_star.pyx":166
- *                     partial_path, partial_cost = a_star(grid_vertical, grid_horizontal, goal_nodes[order[i-1]], [goal_nodes[order[i+1]]], minimum_segment_length)
+          /* "a_star.pyx":174
+ *                     partial_path, partial_cost = a_star(grid_vertical, grid_horizontal, goal_nodes[order[i-1]], [goal_nodes[order[i+1]]], minimum_segment_length, stats, limits)
  * 
  *                 if partial_path :             # <<<<<<<<<<<<<<
  *                    # grid_vertical, grid_horizontal = lock_trace(grid_vertical, grid_horizontal, segments, trace_width_scaled)
@@ -7283,7 +7549,7 @@ static PyObject *__pyx_pf_6a_star_astar_start(CYTHON_UNUSED PyObject *__pyx_self
           goto __pyx_L21;
         }
 
-        /* "a_star.pyx":172
+        /* "a_star.pyx":180
  *                 else:
  * 
  *                     return None, None             # <<<<<<<<<<<<<<
@@ -7294,24 +7560,24 @@ static PyObject *__pyx_pf_6a_star_astar_start(CYTHON_UNUSED PyObject *__pyx_self
           __Pyx_XDECREF(__pyx_r);
           __Pyx_INCREF(__pyx_tuple__2);
           __pyx_r = __pyx_tuple__2;
-          __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+          __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
           goto __pyx_L0;
         }
         __pyx_L21:;
 
-        /* "a_star.pyx":154
+        /* "a_star.pyx":162
  *         else:
  *             order = tsp_ordering(goal_nodes)
  *             for i in range(1, len(order)):             # <<<<<<<<<<<<<<
  * 
- *                 partial_path, partial_cost = a_star(grid_vertical, grid_horizontal, goal_nodes[order[i-1]], [goal_nodes[order[i]]], minimum_segment_length)
+ *                 partial_path, partial_cost = a_star(grid_vertical, grid_horizontal, goal_nodes[order[i-1]], [goal_nodes[order[i]]], minimum_segment_length, stats, limits)
  */
       }
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
     }
     __pyx_L4:;
 
-    /* "a_star.pyx":146
+    /* "a_star.pyx":154
  *     failed_nodes = []
  * 
  *     if tsp:             # <<<<<<<<<<<<<<
@@ -7321,104 +7587,107 @@ static PyObject *__pyx_pf_6a_star_astar_start(CYTHON_UNUSED PyObject *__pyx_self
     goto __pyx_L3;
   }
 
-  /* "a_star.pyx":180
+  /* "a_star.pyx":188
  * 
  * 
- *         path, cost = a_star(grid_vertical, grid_horizontal, start, goal_nodes, minimum_segment_length)             # <<<<<<<<<<<<<<
+ *         path, cost = a_star(grid_vertical, grid_horizontal, start, goal_nodes, minimum_segment_length, stats, limits)             # <<<<<<<<<<<<<<
  * 
  * 
  */
   /*else*/ {
-    __pyx_t_5 = __pyx_f_6a_star_a_star(__pyx_v_grid_vertical, __pyx_v_grid_horizontal, __pyx_v_start, __pyx_v_goal_nodes, __pyx_v_minimum_segment_length); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 180, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_5);
-    if ((likely(PyTuple_CheckExact(__pyx_t_5))) || (PyList_CheckExact(__pyx_t_5))) {
-      PyObject* sequence = __pyx_t_5;
+    __pyx_t_5.__pyx_n = 2;
+    __pyx_t_5.stats = __pyx_v_stats;
+    __pyx_t_5.limits = __pyx_v_limits;
+    __pyx_t_6 = __pyx_f_6a_star_a_star(__pyx_v_grid_vertical, __pyx_v_grid_horizontal, __pyx_v_start, __pyx_v_goal_nodes, __pyx_v_minimum_segment_length, &__pyx_t_5); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 188, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    if ((likely(PyTuple_CheckExact(__pyx_t_6))) || (PyList_CheckExact(__pyx_t_6))) {
+      PyObject* sequence = __pyx_t_6;
       Py_ssize_t size = __Pyx_PySequence_SIZE(sequence);
       if (unlikely(size != 2)) {
         if (size > 2) __Pyx_RaiseTooManyValuesError(2);
         else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
-        __PYX_ERR(0, 180, __pyx_L1_error)
+        __PYX_ERR(0, 188, __pyx_L1_error)
       }
       #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
       if (likely(PyTuple_CheckExact(sequence))) {
         __pyx_t_1 = PyTuple_GET_ITEM(sequence, 0); 
-        __pyx_t_6 = PyTuple_GET_ITEM(sequence, 1); 
+        __pyx_t_7 = PyTuple_GET_ITEM(sequence, 1); 
       } else {
         __pyx_t_1 = PyList_GET_ITEM(sequence, 0); 
-        __pyx_t_6 = PyList_GET_ITEM(sequence, 1); 
+        __pyx_t_7 = PyList_GET_ITEM(sequence, 1); 
       }
       __Pyx_INCREF(__pyx_t_1);
-      __Pyx_INCREF(__pyx_t_6);
+      __Pyx_INCREF(__pyx_t_7);
       #else
-      __pyx_t_1 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 180, __pyx_L1_error)
+      __pyx_t_1 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 188, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
-      __pyx_t_6 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 180, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_6);
+      __pyx_t_7 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 188, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_7);
       #endif
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
     } else {
       Py_ssize_t index = -1;
-      __pyx_t_4 = PyObject_GetIter(__pyx_t_5); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 180, __pyx_L1_error)
+      __pyx_t_4 = PyObject_GetIter(__pyx_t_6); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 188, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_4);
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-      __pyx_t_7 = __Pyx_PyObject_GetIterNextFunc(__pyx_t_4);
-      index = 0; __pyx_t_1 = __pyx_t_7(__pyx_t_4); if (unlikely(!__pyx_t_1)) goto __pyx_L23_unpacking_failed;
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __pyx_t_8 = __Pyx_PyObject_GetIterNextFunc(__pyx_t_4);
+      index = 0; __pyx_t_1 = __pyx_t_8(__pyx_t_4); if (unlikely(!__pyx_t_1)) goto __pyx_L23_unpacking_failed;
       __Pyx_GOTREF(__pyx_t_1);
-      index = 1; __pyx_t_6 = __pyx_t_7(__pyx_t_4); if (unlikely(!__pyx_t_6)) goto __pyx_L23_unpacking_failed;
-      __Pyx_GOTREF(__pyx_t_6);
-      if (__Pyx_IternextUnpackEndCheck(__pyx_t_7(__pyx_t_4), 2) < 0) __PYX_ERR(0, 180, __pyx_L1_error)
-      __pyx_t_7 = NULL;
+      index = 1; __pyx_t_7 = __pyx_t_8(__pyx_t_4); if (unlikely(!__pyx_t_7)) goto __pyx_L23_unpacking_failed;
+      __Pyx_GOTREF(__pyx_t_7);
+      if (__Pyx_IternextUnpackEndCheck(__pyx_t_8(__pyx_t_4), 2) < 0) __PYX_ERR(0, 188, __pyx_L1_error)
+      __pyx_t_8 = NULL;
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
       goto __pyx_L24_unpacking_done;
       __pyx_L23_unpacking_failed:;
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __pyx_t_7 = NULL;
+      __pyx_t_8 = NULL;
       if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
-      __PYX_ERR(0, 180, __pyx_L1_error)
+      __PYX_ERR(0, 188, __pyx_L1_error)
       __pyx_L24_unpacking_done:;
     }
     __Pyx_DECREF_SET(__pyx_v_path, __pyx_t_1);
     __pyx_t_1 = 0;
-    __Pyx_DECREF_SET(__pyx_v_cost, __pyx_t_6);
-    __pyx_t_6 = 0;
+    __Pyx_DECREF_SET(__pyx_v_cost, __pyx_t_7);
+    __pyx_t_7 = 0;
   }
   __pyx_L3:;
 
-  /* "a_star.pyx":184
+  /* "a_star.pyx":192
  * 
  * 
  *     return path, cost             # <<<<<<<<<<<<<<
  * 
- * cdef a_star(grid_vertical, grid_horizontal, start, goal_nodes, minimum_segment_length):
+ * cdef a_star(grid_vertical, grid_horizontal, start, goal_nodes, minimum_segment_length, stats=None, limits=None):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_5 = PyTuple_New(2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 184, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_6 = PyTuple_New(2); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 192, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
   __Pyx_INCREF(__pyx_v_path);
   __Pyx_GIVEREF(__pyx_v_path);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_v_path)) __PYX_ERR(0, 184, __pyx_L1_error);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_v_path)) __PYX_ERR(0, 192, __pyx_L1_error);
   __Pyx_INCREF(__pyx_v_cost);
   __Pyx_GIVEREF(__pyx_v_cost);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_5, 1, __pyx_v_cost)) __PYX_ERR(0, 184, __pyx_L1_error);
-  __pyx_r = __pyx_t_5;
-  __pyx_t_5 = 0;
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_6, 1, __pyx_v_cost)) __PYX_ERR(0, 192, __pyx_L1_error);
+  __pyx_r = __pyx_t_6;
+  __pyx_t_6 = 0;
   goto __pyx_L0;
 
-  /* "a_star.pyx":140
+  /* "a_star.pyx":147
  *     return seg if seg < minimum_segment_length else minimum_segment_length
  * 
- * def astar_start(grid_vertical, grid_horizontal, start, goal_nodes, minimum_segment_length, tsp, trace_width_scaled):             # <<<<<<<<<<<<<<
+ * def astar_start(grid_vertical, grid_horizontal, start, goal_nodes, minimum_segment_length, tsp, trace_width_scaled,             # <<<<<<<<<<<<<<
+ *                 stats=None, limits=None):
  * 
- *     path = []
  */
 
   /* function exit code */
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_5);
   __Pyx_XDECREF(__pyx_t_6);
-  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_10);
   __Pyx_AddTraceback("a_star.astar_start", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
@@ -7435,15 +7704,17 @@ static PyObject *__pyx_pf_6a_star_astar_start(CYTHON_UNUSED PyObject *__pyx_self
   return __pyx_r;
 }
 
-/* "a_star.pyx":186
+/* "a_star.pyx":194
  *     return path, cost
  * 
- * cdef a_star(grid_vertical, grid_horizontal, start, goal_nodes, minimum_segment_length):             # <<<<<<<<<<<<<<
+ * cdef a_star(grid_vertical, grid_horizontal, start, goal_nodes, minimum_segment_length, stats=None, limits=None):             # <<<<<<<<<<<<<<
  * 
  *     #Parameters
  */
 
-static PyObject *__pyx_f_6a_star_a_star(PyObject *__pyx_v_grid_vertical, PyObject *__pyx_v_grid_horizontal, PyObject *__pyx_v_start, PyObject *__pyx_v_goal_nodes, PyObject *__pyx_v_minimum_segment_length) {
+static PyObject *__pyx_f_6a_star_a_star(PyObject *__pyx_v_grid_vertical, PyObject *__pyx_v_grid_horizontal, PyObject *__pyx_v_start, PyObject *__pyx_v_goal_nodes, PyObject *__pyx_v_minimum_segment_length, struct __pyx_opt_args_6a_star_a_star *__pyx_optional_args) {
+  PyObject *__pyx_v_stats = ((PyObject *)Py_None);
+  PyObject *__pyx_v_limits = ((PyObject *)Py_None);
   Py_ssize_t __pyx_v_height;
   Py_ssize_t __pyx_v_width;
   PyObject *__pyx_v_goal_indices = NULL;
@@ -7455,6 +7726,18 @@ static PyObject *__pyx_f_6a_star_a_star(PyObject *__pyx_v_grid_vertical, PyObjec
   PyObject *__pyx_v_g_start = NULL;
   PyObject *__pyx_v_f_start = NULL;
   PyObject *__pyx_v_visited_states = NULL;
+  PyObject *__pyx_v_start_time = NULL;
+  PY_LONG_LONG __pyx_v_nodes_expanded;
+  PY_LONG_LONG __pyx_v_nodes_generated;
+  PY_LONG_LONG __pyx_v_segment_length_prunes;
+  PY_LONG_LONG __pyx_v_goal_segment_length_prunes;
+  PY_LONG_LONG __pyx_v_max_open_set;
+  PY_LONG_LONG __pyx_v_max_expansions;
+  PY_LONG_LONG __pyx_v_open_set_limit;
+  double __pyx_v_deadline;
+  PyObject *__pyx_v_limit = NULL;
+  PyObject *__pyx_v_state_key = NULL;
+  PyObject *__pyx_v_item = NULL;
   PyObject *__pyx_v_g = NULL;
   PyObject *__pyx_v_current = NULL;
   PyObject *__pyx_v_mask = NULL;
@@ -7463,7 +7746,6 @@ static PyObject *__pyx_f_6a_star_a_star(PyObject *__pyx_v_grid_vertical, PyObjec
   PyObject *__pyx_v_seg_len = NULL;
   PyObject *__pyx_v_after_goal = NULL;
   PyObject *__pyx_v_last_was_reversal = NULL;
-  PyObject *__pyx_v_state_key = NULL;
   PyObject *__pyx_v_x = NULL;
   PyObject *__pyx_v_y = NULL;
   PyObject *__pyx_v_edge_set = NULL;
@@ -7482,6 +7764,8 @@ static PyObject *__pyx_f_6a_star_a_star(PyObject *__pyx_v_grid_vertical, PyObjec
   PyObject *__pyx_v_cost_increment = NULL;
   PyObject *__pyx_v_new_g = NULL;
   PyObject *__pyx_v_new_f = NULL;
+  PyObject *__pyx_v_blocked = NULL;
+  PyObject *__pyx_v_failure_reason = NULL;
   PyObject *__pyx_8genexpr1__pyx_v_i = NULL;
   PyObject *__pyx_8genexpr1__pyx_v_goal = NULL;
   PyObject *__pyx_r = NULL;
@@ -7495,32 +7779,44 @@ static PyObject *__pyx_f_6a_star_a_star(PyObject *__pyx_v_grid_vertical, PyObjec
   PyObject *(*__pyx_t_7)(PyObject *);
   PyObject *__pyx_t_8 = NULL;
   double __pyx_t_9;
-  int __pyx_t_10;
-  PyObject *__pyx_t_11 = NULL;
-  PyObject *__pyx_t_12 = NULL;
-  PyObject *__pyx_t_13 = NULL;
-  PyObject *__pyx_t_14 = NULL;
+  unsigned int __pyx_t_10;
+  PY_LONG_LONG __pyx_t_11;
+  PY_LONG_LONG __pyx_t_12;
+  double __pyx_t_13;
+  int __pyx_t_14;
   PyObject *__pyx_t_15 = NULL;
   PyObject *__pyx_t_16 = NULL;
-  PyObject *(*__pyx_t_17)(PyObject *);
-  int __pyx_t_18;
-  int __pyx_t_19;
+  PyObject *__pyx_t_17 = NULL;
+  PyObject *__pyx_t_18 = NULL;
+  PyObject *__pyx_t_19 = NULL;
+  PyObject *(*__pyx_t_20)(PyObject *);
+  int __pyx_t_21;
+  int __pyx_t_22;
+  int __pyx_t_23;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("a_star", 1);
+  if (__pyx_optional_args) {
+    if (__pyx_optional_args->__pyx_n > 0) {
+      __pyx_v_stats = __pyx_optional_args->stats;
+      if (__pyx_optional_args->__pyx_n > 1) {
+        __pyx_v_limits = __pyx_optional_args->limits;
+      }
+    }
+  }
 
-  /* "a_star.pyx":189
+  /* "a_star.pyx":197
  * 
  *     #Parameters
  *     height = len(grid_vertical)             # <<<<<<<<<<<<<<
  *     width = len(grid_vertical[0]) if height > 0 else 0
  * 
  */
-  __pyx_t_1 = PyObject_Length(__pyx_v_grid_vertical); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-1))) __PYX_ERR(0, 189, __pyx_L1_error)
+  __pyx_t_1 = PyObject_Length(__pyx_v_grid_vertical); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-1))) __PYX_ERR(0, 197, __pyx_L1_error)
   __pyx_v_height = __pyx_t_1;
 
-  /* "a_star.pyx":190
+  /* "a_star.pyx":198
  *     #Parameters
  *     height = len(grid_vertical)
  *     width = len(grid_vertical[0]) if height > 0 else 0             # <<<<<<<<<<<<<<
@@ -7529,9 +7825,9 @@ static PyObject *__pyx_f_6a_star_a_star(PyObject *__pyx_v_grid_vertical, PyObjec
  */
   __pyx_t_2 = (__pyx_v_height > 0);
   if (__pyx_t_2) {
-    __pyx_t_3 = __Pyx_GetItemInt(__pyx_v_grid_vertical, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 190, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_GetItemInt(__pyx_v_grid_vertical, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 198, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_4 = PyObject_Length(__pyx_t_3); if (unlikely(__pyx_t_4 == ((Py_ssize_t)-1))) __PYX_ERR(0, 190, __pyx_L1_error)
+    __pyx_t_4 = PyObject_Length(__pyx_t_3); if (unlikely(__pyx_t_4 == ((Py_ssize_t)-1))) __PYX_ERR(0, 198, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __pyx_t_1 = __pyx_t_4;
   } else {
@@ -7539,7 +7835,7 @@ static PyObject *__pyx_f_6a_star_a_star(PyObject *__pyx_v_grid_vertical, PyObjec
   }
   __pyx_v_width = __pyx_t_1;
 
-  /* "a_star.pyx":193
+  /* "a_star.pyx":201
  * 
  * 
  *     goal_indices = {goal: i for i, goal in enumerate(goal_nodes)}             # <<<<<<<<<<<<<<
@@ -7547,7 +7843,7 @@ static PyObject *__pyx_f_6a_star_a_star(PyObject *__pyx_v_grid_vertical, PyObjec
  * 
  */
   { /* enter inner scope */
-    __pyx_t_3 = PyDict_New(); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 193, __pyx_L5_error)
+    __pyx_t_3 = PyDict_New(); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 201, __pyx_L5_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_INCREF(__pyx_int_0);
     __pyx_t_5 = __pyx_int_0;
@@ -7556,9 +7852,9 @@ static PyObject *__pyx_f_6a_star_a_star(PyObject *__pyx_v_grid_vertical, PyObjec
       __pyx_t_1 = 0;
       __pyx_t_7 = NULL;
     } else {
-      __pyx_t_1 = -1; __pyx_t_6 = PyObject_GetIter(__pyx_v_goal_nodes); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 193, __pyx_L5_error)
+      __pyx_t_1 = -1; __pyx_t_6 = PyObject_GetIter(__pyx_v_goal_nodes); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 201, __pyx_L5_error)
       __Pyx_GOTREF(__pyx_t_6);
-      __pyx_t_7 = __Pyx_PyObject_GetIterNextFunc(__pyx_t_6); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 193, __pyx_L5_error)
+      __pyx_t_7 = __Pyx_PyObject_GetIterNextFunc(__pyx_t_6); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 201, __pyx_L5_error)
     }
     for (;;) {
       if (likely(!__pyx_t_7)) {
@@ -7566,28 +7862,28 @@ static PyObject *__pyx_f_6a_star_a_star(PyObject *__pyx_v_grid_vertical, PyObjec
           {
             Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_6);
             #if !CYTHON_ASSUME_SAFE_MACROS
-            if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 193, __pyx_L5_error)
+            if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 201, __pyx_L5_error)
             #endif
             if (__pyx_t_1 >= __pyx_temp) break;
           }
           #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-          __pyx_t_8 = PyList_GET_ITEM(__pyx_t_6, __pyx_t_1); __Pyx_INCREF(__pyx_t_8); __pyx_t_1++; if (unlikely((0 < 0))) __PYX_ERR(0, 193, __pyx_L5_error)
+          __pyx_t_8 = PyList_GET_ITEM(__pyx_t_6, __pyx_t_1); __Pyx_INCREF(__pyx_t_8); __pyx_t_1++; if (unlikely((0 < 0))) __PYX_ERR(0, 201, __pyx_L5_error)
           #else
-          __pyx_t_8 = __Pyx_PySequence_ITEM(__pyx_t_6, __pyx_t_1); __pyx_t_1++; if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 193, __pyx_L5_error)
+          __pyx_t_8 = __Pyx_PySequence_ITEM(__pyx_t_6, __pyx_t_1); __pyx_t_1++; if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 201, __pyx_L5_error)
           __Pyx_GOTREF(__pyx_t_8);
           #endif
         } else {
           {
             Py_ssize_t __pyx_temp = __Pyx_PyTuple_GET_SIZE(__pyx_t_6);
             #if !CYTHON_ASSUME_SAFE_MACROS
-            if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 193, __pyx_L5_error)
+            if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 201, __pyx_L5_error)
             #endif
             if (__pyx_t_1 >= __pyx_temp) break;
           }
           #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-          __pyx_t_8 = PyTuple_GET_ITEM(__pyx_t_6, __pyx_t_1); __Pyx_INCREF(__pyx_t_8); __pyx_t_1++; if (unlikely((0 < 0))) __PYX_ERR(0, 193, __pyx_L5_error)
+          __pyx_t_8 = PyTuple_GET_ITEM(__pyx_t_6, __pyx_t_1); __Pyx_INCREF(__pyx_t_8); __pyx_t_1++; if (unlikely((0 < 0))) __PYX_ERR(0, 201, __pyx_L5_error)
           #else
-          __pyx_t_8 = __Pyx_PySequence_ITEM(__pyx_t_6, __pyx_t_1); __pyx_t_1++; if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 193, __pyx_L5_error)
+          __pyx_t_8 = __Pyx_PySequence_ITEM(__pyx_t_6, __pyx_t_1); __pyx_t_1++; if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 201, __pyx_L5_error)
           __Pyx_GOTREF(__pyx_t_8);
           #endif
         }
@@ -7597,7 +7893,7 @@ static PyObject *__pyx_f_6a_star_a_star(PyObject *__pyx_v_grid_vertical, PyObjec
           PyObject* exc_type = PyErr_Occurred();
           if (exc_type) {
             if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
-            else __PYX_ERR(0, 193, __pyx_L5_error)
+            else __PYX_ERR(0, 201, __pyx_L5_error)
           }
           break;
         }
@@ -7607,12 +7903,12 @@ static PyObject *__pyx_f_6a_star_a_star(PyObject *__pyx_v_grid_vertical, PyObjec
       __pyx_t_8 = 0;
       __Pyx_INCREF(__pyx_t_5);
       __Pyx_XDECREF_SET(__pyx_8genexpr1__pyx_v_i, __pyx_t_5);
-      __pyx_t_8 = __Pyx_PyInt_AddObjC(__pyx_t_5, __pyx_int_1, 1, 0, 0); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 193, __pyx_L5_error)
+      __pyx_t_8 = __Pyx_PyInt_AddObjC(__pyx_t_5, __pyx_int_1, 1, 0, 0); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 201, __pyx_L5_error)
       __Pyx_GOTREF(__pyx_t_8);
       __Pyx_DECREF(__pyx_t_5);
       __pyx_t_5 = __pyx_t_8;
       __pyx_t_8 = 0;
-      if (unlikely(PyDict_SetItem(__pyx_t_3, (PyObject*)__pyx_8genexpr1__pyx_v_goal, (PyObject*)__pyx_8genexpr1__pyx_v_i))) __PYX_ERR(0, 193, __pyx_L5_error)
+      if (unlikely(PyDict_SetItem(__pyx_t_3, (PyObject*)__pyx_8genexpr1__pyx_v_goal, (PyObject*)__pyx_8genexpr1__pyx_v_i))) __PYX_ERR(0, 201, __pyx_L5_error)
     }
     __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
@@ -7628,53 +7924,53 @@ static PyObject *__pyx_f_6a_star_a_star(PyObject *__pyx_v_grid_vertical, PyObjec
   __pyx_v_goal_indices = ((PyObject*)__pyx_t_3);
   __pyx_t_3 = 0;
 
-  /* "a_star.pyx":194
+  /* "a_star.pyx":202
  * 
  *     goal_indices = {goal: i for i, goal in enumerate(goal_nodes)}
  *     all_visited = (1 << len(goal_nodes)) - 1             # <<<<<<<<<<<<<<
  * 
  * 
  */
-  __pyx_t_1 = PyObject_Length(__pyx_v_goal_nodes); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-1))) __PYX_ERR(0, 194, __pyx_L1_error)
+  __pyx_t_1 = PyObject_Length(__pyx_v_goal_nodes); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-1))) __PYX_ERR(0, 202, __pyx_L1_error)
   __pyx_v_all_visited = ((1 << __pyx_t_1) - 1);
 
-  /* "a_star.pyx":198
+  /* "a_star.pyx":206
  * 
  * 
  *     directions = [(0, -1), (0, 1), (-1, 0), (1, 0)]             # <<<<<<<<<<<<<<
  * 
  *     open_set = PriorityQueue()
  */
-  __pyx_t_3 = PyList_New(4); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 198, __pyx_L1_error)
+  __pyx_t_3 = PyList_New(4); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 206, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_INCREF(__pyx_tuple__3);
   __Pyx_GIVEREF(__pyx_tuple__3);
-  if (__Pyx_PyList_SET_ITEM(__pyx_t_3, 0, __pyx_tuple__3)) __PYX_ERR(0, 198, __pyx_L1_error);
+  if (__Pyx_PyList_SET_ITEM(__pyx_t_3, 0, __pyx_tuple__3)) __PYX_ERR(0, 206, __pyx_L1_error);
   __Pyx_INCREF(__pyx_tuple__4);
   __Pyx_GIVEREF(__pyx_tuple__4);
-  if (__Pyx_PyList_SET_ITEM(__pyx_t_3, 1, __pyx_tuple__4)) __PYX_ERR(0, 198, __pyx_L1_error);
+  if (__Pyx_PyList_SET_ITEM(__pyx_t_3, 1, __pyx_tuple__4)) __PYX_ERR(0, 206, __pyx_L1_error);
   __Pyx_INCREF(__pyx_tuple__5);
   __Pyx_GIVEREF(__pyx_tuple__5);
-  if (__Pyx_PyList_SET_ITEM(__pyx_t_3, 2, __pyx_tuple__5)) __PYX_ERR(0, 198, __pyx_L1_error);
+  if (__Pyx_PyList_SET_ITEM(__pyx_t_3, 2, __pyx_tuple__5)) __PYX_ERR(0, 206, __pyx_L1_error);
   __Pyx_INCREF(__pyx_tuple__6);
   __Pyx_GIVEREF(__pyx_tuple__6);
-  if (__Pyx_PyList_SET_ITEM(__pyx_t_3, 3, __pyx_tuple__6)) __PYX_ERR(0, 198, __pyx_L1_error);
+  if (__Pyx_PyList_SET_ITEM(__pyx_t_3, 3, __pyx_tuple__6)) __PYX_ERR(0, 206, __pyx_L1_error);
   __pyx_v_directions = ((PyObject*)__pyx_t_3);
   __pyx_t_3 = 0;
 
-  /* "a_star.pyx":200
+  /* "a_star.pyx":208
  *     directions = [(0, -1), (0, 1), (-1, 0), (1, 0)]
  * 
  *     open_set = PriorityQueue()             # <<<<<<<<<<<<<<
  *     init_mask = 0
  *     init_after_goal = start in goal_indices
  */
-  __pyx_t_3 = __Pyx_PyObject_CallNoArg(((PyObject *)__pyx_ptype_6a_star_PriorityQueue)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 200, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_CallNoArg(((PyObject *)__pyx_ptype_6a_star_PriorityQueue)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 208, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __pyx_v_open_set = ((struct __pyx_obj_6a_star_PriorityQueue *)__pyx_t_3);
   __pyx_t_3 = 0;
 
-  /* "a_star.pyx":201
+  /* "a_star.pyx":209
  * 
  *     open_set = PriorityQueue()
  *     init_mask = 0             # <<<<<<<<<<<<<<
@@ -7684,48 +7980,48 @@ static PyObject *__pyx_f_6a_star_a_star(PyObject *__pyx_v_grid_vertical, PyObjec
   __Pyx_INCREF(__pyx_int_0);
   __pyx_v_init_mask = __pyx_int_0;
 
-  /* "a_star.pyx":202
+  /* "a_star.pyx":210
  *     open_set = PriorityQueue()
  *     init_mask = 0
  *     init_after_goal = start in goal_indices             # <<<<<<<<<<<<<<
  *     if init_after_goal:
  *         init_mask |= (1 << goal_indices[start])
  */
-  __pyx_t_2 = (__Pyx_PyDict_ContainsTF(__pyx_v_start, __pyx_v_goal_indices, Py_EQ)); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(0, 202, __pyx_L1_error)
-  __pyx_t_3 = __Pyx_PyBool_FromLong(__pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 202, __pyx_L1_error)
+  __pyx_t_2 = (__Pyx_PyDict_ContainsTF(__pyx_v_start, __pyx_v_goal_indices, Py_EQ)); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(0, 210, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyBool_FromLong(__pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 210, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __pyx_v_init_after_goal = __pyx_t_3;
   __pyx_t_3 = 0;
 
-  /* "a_star.pyx":203
+  /* "a_star.pyx":211
  *     init_mask = 0
  *     init_after_goal = start in goal_indices
  *     if init_after_goal:             # <<<<<<<<<<<<<<
  *         init_mask |= (1 << goal_indices[start])
  *     g_start = 0
  */
-  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_v_init_after_goal); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(0, 203, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_v_init_after_goal); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(0, 211, __pyx_L1_error)
   if (__pyx_t_2) {
 
-    /* "a_star.pyx":204
+    /* "a_star.pyx":212
  *     init_after_goal = start in goal_indices
  *     if init_after_goal:
  *         init_mask |= (1 << goal_indices[start])             # <<<<<<<<<<<<<<
  *     g_start = 0
  *     f_start = g_start + _heuristic(start, init_mask, goal_nodes)
  */
-    __pyx_t_3 = __Pyx_PyDict_GetItem(__pyx_v_goal_indices, __pyx_v_start); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 204, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyDict_GetItem(__pyx_v_goal_indices, __pyx_v_start); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 212, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_5 = PyNumber_Lshift(__pyx_int_1, __pyx_t_3); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 204, __pyx_L1_error)
+    __pyx_t_5 = PyNumber_Lshift(__pyx_int_1, __pyx_t_3); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 212, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __pyx_t_3 = PyNumber_InPlaceOr(__pyx_v_init_mask, __pyx_t_5); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 204, __pyx_L1_error)
+    __pyx_t_3 = PyNumber_InPlaceOr(__pyx_v_init_mask, __pyx_t_5); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 212, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
     __Pyx_DECREF_SET(__pyx_v_init_mask, __pyx_t_3);
     __pyx_t_3 = 0;
 
-    /* "a_star.pyx":203
+    /* "a_star.pyx":211
  *     init_mask = 0
  *     init_after_goal = start in goal_indices
  *     if init_after_goal:             # <<<<<<<<<<<<<<
@@ -7734,7 +8030,7 @@ static PyObject *__pyx_f_6a_star_a_star(PyObject *__pyx_v_grid_vertical, PyObjec
  */
   }
 
-  /* "a_star.pyx":205
+  /* "a_star.pyx":213
  *     if init_after_goal:
  *         init_mask |= (1 << goal_indices[start])
  *     g_start = 0             # <<<<<<<<<<<<<<
@@ -7744,227 +8040,404 @@ static PyObject *__pyx_f_6a_star_a_star(PyObject *__pyx_v_grid_vertical, PyObjec
   __Pyx_INCREF(__pyx_int_0);
   __pyx_v_g_start = __pyx_int_0;
 
-  /* "a_star.pyx":206
+  /* "a_star.pyx":214
  *         init_mask |= (1 << goal_indices[start])
  *     g_start = 0
  *     f_start = g_start + _heuristic(start, init_mask, goal_nodes)             # <<<<<<<<<<<<<<
  * 
  *     open_set.push((g_start, start, init_mask, [start], None, 0, init_after_goal, False), f_start)
  */
-  __pyx_t_3 = __pyx_f_6a_star__heuristic(__pyx_v_start, __pyx_v_init_mask, __pyx_v_goal_nodes); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 206, __pyx_L1_error)
+  __pyx_t_3 = __pyx_f_6a_star__heuristic(__pyx_v_start, __pyx_v_init_mask, __pyx_v_goal_nodes); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 214, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_5 = PyNumber_Add(__pyx_v_g_start, __pyx_t_3); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 206, __pyx_L1_error)
+  __pyx_t_5 = PyNumber_Add(__pyx_v_g_start, __pyx_t_3); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 214, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __pyx_v_f_start = __pyx_t_5;
   __pyx_t_5 = 0;
 
-  /* "a_star.pyx":208
+  /* "a_star.pyx":216
  *     f_start = g_start + _heuristic(start, init_mask, goal_nodes)
  * 
  *     open_set.push((g_start, start, init_mask, [start], None, 0, init_after_goal, False), f_start)             # <<<<<<<<<<<<<<
  * 
  *     visited_states = set()
  */
-  __pyx_t_5 = PyList_New(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 208, __pyx_L1_error)
+  __pyx_t_5 = PyList_New(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 216, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_INCREF(__pyx_v_start);
   __Pyx_GIVEREF(__pyx_v_start);
-  if (__Pyx_PyList_SET_ITEM(__pyx_t_5, 0, __pyx_v_start)) __PYX_ERR(0, 208, __pyx_L1_error);
-  __pyx_t_3 = PyTuple_New(8); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 208, __pyx_L1_error)
+  if (__Pyx_PyList_SET_ITEM(__pyx_t_5, 0, __pyx_v_start)) __PYX_ERR(0, 216, __pyx_L1_error);
+  __pyx_t_3 = PyTuple_New(8); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 216, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_INCREF(__pyx_v_g_start);
   __Pyx_GIVEREF(__pyx_v_g_start);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_v_g_start)) __PYX_ERR(0, 208, __pyx_L1_error);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_v_g_start)) __PYX_ERR(0, 216, __pyx_L1_error);
   __Pyx_INCREF(__pyx_v_start);
   __Pyx_GIVEREF(__pyx_v_start);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_v_start)) __PYX_ERR(0, 208, __pyx_L1_error);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_v_start)) __PYX_ERR(0, 216, __pyx_L1_error);
   __Pyx_INCREF(__pyx_v_init_mask);
   __Pyx_GIVEREF(__pyx_v_init_mask);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_3, 2, __pyx_v_init_mask)) __PYX_ERR(0, 208, __pyx_L1_error);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_3, 2, __pyx_v_init_mask)) __PYX_ERR(0, 216, __pyx_L1_error);
   __Pyx_GIVEREF(__pyx_t_5);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_3, 3, __pyx_t_5)) __PYX_ERR(0, 208, __pyx_L1_error);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_3, 3, __pyx_t_5)) __PYX_ERR(0, 216, __pyx_L1_error);
   __Pyx_INCREF(Py_None);
   __Pyx_GIVEREF(Py_None);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_3, 4, Py_None)) __PYX_ERR(0, 208, __pyx_L1_error);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_3, 4, Py_None)) __PYX_ERR(0, 216, __pyx_L1_error);
   __Pyx_INCREF(__pyx_int_0);
   __Pyx_GIVEREF(__pyx_int_0);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_3, 5, __pyx_int_0)) __PYX_ERR(0, 208, __pyx_L1_error);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_3, 5, __pyx_int_0)) __PYX_ERR(0, 216, __pyx_L1_error);
   __Pyx_INCREF(__pyx_v_init_after_goal);
   __Pyx_GIVEREF(__pyx_v_init_after_goal);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_3, 6, __pyx_v_init_after_goal)) __PYX_ERR(0, 208, __pyx_L1_error);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_3, 6, __pyx_v_init_after_goal)) __PYX_ERR(0, 216, __pyx_L1_error);
   __Pyx_INCREF(Py_False);
   __Pyx_GIVEREF(Py_False);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_3, 7, Py_False)) __PYX_ERR(0, 208, __pyx_L1_error);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_3, 7, Py_False)) __PYX_ERR(0, 216, __pyx_L1_error);
   __pyx_t_5 = 0;
-  __pyx_t_9 = __pyx_PyFloat_AsDouble(__pyx_v_f_start); if (unlikely((__pyx_t_9 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 208, __pyx_L1_error)
-  ((struct __pyx_vtabstruct_6a_star_PriorityQueue *)__pyx_v_open_set->__pyx_vtab)->push(__pyx_v_open_set, __pyx_t_3, __pyx_t_9); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 208, __pyx_L1_error)
+  __pyx_t_9 = __pyx_PyFloat_AsDouble(__pyx_v_f_start); if (unlikely((__pyx_t_9 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 216, __pyx_L1_error)
+  ((struct __pyx_vtabstruct_6a_star_PriorityQueue *)__pyx_v_open_set->__pyx_vtab)->push(__pyx_v_open_set, __pyx_t_3, __pyx_t_9); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 216, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-  /* "a_star.pyx":210
+  /* "a_star.pyx":218
  *     open_set.push((g_start, start, init_mask, [start], None, 0, init_after_goal, False), f_start)
  * 
  *     visited_states = set()             # <<<<<<<<<<<<<<
  * 
- *     while not open_set.is_empty():
+ *     # Search statistics, only handed over when a stats object is given
  */
-  __pyx_t_3 = PySet_New(0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 210, __pyx_L1_error)
+  __pyx_t_3 = PySet_New(0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 218, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __pyx_v_visited_states = ((PyObject*)__pyx_t_3);
   __pyx_t_3 = 0;
 
-  /* "a_star.pyx":212
- *     visited_states = set()
+  /* "a_star.pyx":221
+ * 
+ *     # Search statistics, only handed over when a stats object is given
+ *     start_time = time.perf_counter()             # <<<<<<<<<<<<<<
+ *     cdef long long nodes_expanded = 0
+ *     cdef long long nodes_generated = 0
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_time); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 221, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_perf_counter); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 221, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_5 = NULL;
+  __pyx_t_10 = 0;
+  #if CYTHON_UNPACK_METHODS
+  if (unlikely(PyMethod_Check(__pyx_t_6))) {
+    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_6);
+    if (likely(__pyx_t_5)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
+      __Pyx_INCREF(__pyx_t_5);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_6, function);
+      __pyx_t_10 = 1;
+    }
+  }
+  #endif
+  {
+    PyObject *__pyx_callargs[2] = {__pyx_t_5, NULL};
+    __pyx_t_3 = __Pyx_PyObject_FastCall(__pyx_t_6, __pyx_callargs+1-__pyx_t_10, 0+__pyx_t_10);
+    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 221, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  }
+  __pyx_v_start_time = __pyx_t_3;
+  __pyx_t_3 = 0;
+
+  /* "a_star.pyx":222
+ *     # Search statistics, only handed over when a stats object is given
+ *     start_time = time.perf_counter()
+ *     cdef long long nodes_expanded = 0             # <<<<<<<<<<<<<<
+ *     cdef long long nodes_generated = 0
+ *     cdef long long segment_length_prunes = 0
+ */
+  __pyx_v_nodes_expanded = 0;
+
+  /* "a_star.pyx":223
+ *     start_time = time.perf_counter()
+ *     cdef long long nodes_expanded = 0
+ *     cdef long long nodes_generated = 0             # <<<<<<<<<<<<<<
+ *     cdef long long segment_length_prunes = 0
+ *     cdef long long goal_segment_length_prunes = 0
+ */
+  __pyx_v_nodes_generated = 0;
+
+  /* "a_star.pyx":224
+ *     cdef long long nodes_expanded = 0
+ *     cdef long long nodes_generated = 0
+ *     cdef long long segment_length_prunes = 0             # <<<<<<<<<<<<<<
+ *     cdef long long goal_segment_length_prunes = 0
+ *     cdef long long max_open_set = 1
+ */
+  __pyx_v_segment_length_prunes = 0;
+
+  /* "a_star.pyx":225
+ *     cdef long long nodes_generated = 0
+ *     cdef long long segment_length_prunes = 0
+ *     cdef long long goal_segment_length_prunes = 0             # <<<<<<<<<<<<<<
+ *     cdef long long max_open_set = 1
+ *     cdef long long max_expansions = limits.max_expansions if limits is not None else 0
+ */
+  __pyx_v_goal_segment_length_prunes = 0;
+
+  /* "a_star.pyx":226
+ *     cdef long long segment_length_prunes = 0
+ *     cdef long long goal_segment_length_prunes = 0
+ *     cdef long long max_open_set = 1             # <<<<<<<<<<<<<<
+ *     cdef long long max_expansions = limits.max_expansions if limits is not None else 0
+ *     cdef long long open_set_limit = limits.max_open_set if limits is not None else 0
+ */
+  __pyx_v_max_open_set = 1;
+
+  /* "a_star.pyx":227
+ *     cdef long long goal_segment_length_prunes = 0
+ *     cdef long long max_open_set = 1
+ *     cdef long long max_expansions = limits.max_expansions if limits is not None else 0             # <<<<<<<<<<<<<<
+ *     cdef long long open_set_limit = limits.max_open_set if limits is not None else 0
+ *     cdef double deadline = limits.deadline if limits is not None else 0
+ */
+  __pyx_t_2 = (__pyx_v_limits != Py_None);
+  if (__pyx_t_2) {
+    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_limits, __pyx_n_s_max_expansions); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 227, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_12 = __Pyx_PyInt_As_PY_LONG_LONG(__pyx_t_3); if (unlikely((__pyx_t_12 == (PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(0, 227, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_t_11 = __pyx_t_12;
+  } else {
+    __pyx_t_11 = 0;
+  }
+  __pyx_v_max_expansions = __pyx_t_11;
+
+  /* "a_star.pyx":228
+ *     cdef long long max_open_set = 1
+ *     cdef long long max_expansions = limits.max_expansions if limits is not None else 0
+ *     cdef long long open_set_limit = limits.max_open_set if limits is not None else 0             # <<<<<<<<<<<<<<
+ *     cdef double deadline = limits.deadline if limits is not None else 0
+ *     limit = None
+ */
+  __pyx_t_2 = (__pyx_v_limits != Py_None);
+  if (__pyx_t_2) {
+    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_limits, __pyx_n_s_max_open_set); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 228, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_12 = __Pyx_PyInt_As_PY_LONG_LONG(__pyx_t_3); if (unlikely((__pyx_t_12 == (PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(0, 228, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_t_11 = __pyx_t_12;
+  } else {
+    __pyx_t_11 = 0;
+  }
+  __pyx_v_open_set_limit = __pyx_t_11;
+
+  /* "a_star.pyx":229
+ *     cdef long long max_expansions = limits.max_expansions if limits is not None else 0
+ *     cdef long long open_set_limit = limits.max_open_set if limits is not None else 0
+ *     cdef double deadline = limits.deadline if limits is not None else 0             # <<<<<<<<<<<<<<
+ *     limit = None
+ *     state_key = None
+ */
+  __pyx_t_2 = (__pyx_v_limits != Py_None);
+  if (__pyx_t_2) {
+    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_limits, __pyx_n_s_deadline); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 229, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_13 = __pyx_PyFloat_AsDouble(__pyx_t_3); if (unlikely((__pyx_t_13 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 229, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_t_9 = __pyx_t_13;
+  } else {
+    __pyx_t_9 = 0.0;
+  }
+  __pyx_v_deadline = __pyx_t_9;
+
+  /* "a_star.pyx":230
+ *     cdef long long open_set_limit = limits.max_open_set if limits is not None else 0
+ *     cdef double deadline = limits.deadline if limits is not None else 0
+ *     limit = None             # <<<<<<<<<<<<<<
+ *     state_key = None
+ *     item = None
+ */
+  __Pyx_INCREF(Py_None);
+  __pyx_v_limit = Py_None;
+
+  /* "a_star.pyx":231
+ *     cdef double deadline = limits.deadline if limits is not None else 0
+ *     limit = None
+ *     state_key = None             # <<<<<<<<<<<<<<
+ *     item = None
+ * 
+ */
+  __Pyx_INCREF(Py_None);
+  __pyx_v_state_key = ((PyObject*)Py_None);
+
+  /* "a_star.pyx":232
+ *     limit = None
+ *     state_key = None
+ *     item = None             # <<<<<<<<<<<<<<
+ * 
+ *     while not open_set.is_empty():
+ */
+  __Pyx_INCREF(Py_None);
+  __pyx_v_item = Py_None;
+
+  /* "a_star.pyx":234
+ *     item = None
  * 
  *     while not open_set.is_empty():             # <<<<<<<<<<<<<<
- *         g, current, mask, path, last_dir, seg_len, after_goal, last_was_reversal = open_set.pop()
- *         state_key = (current, mask, last_dir, cap_seg(seg_len, minimum_segment_length), after_goal, last_was_reversal)
+ *         item = open_set.pop()
+ *         g, current, mask, path, last_dir, seg_len, after_goal, last_was_reversal = item
  */
   while (1) {
-    __pyx_t_2 = ((struct __pyx_vtabstruct_6a_star_PriorityQueue *)__pyx_v_open_set->__pyx_vtab)->is_empty(__pyx_v_open_set); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 212, __pyx_L1_error)
-    __pyx_t_10 = (!__pyx_t_2);
-    if (!__pyx_t_10) break;
+    __pyx_t_2 = ((struct __pyx_vtabstruct_6a_star_PriorityQueue *)__pyx_v_open_set->__pyx_vtab)->is_empty(__pyx_v_open_set); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 234, __pyx_L1_error)
+    __pyx_t_14 = (!__pyx_t_2);
+    if (!__pyx_t_14) break;
 
-    /* "a_star.pyx":213
+    /* "a_star.pyx":235
  * 
  *     while not open_set.is_empty():
- *         g, current, mask, path, last_dir, seg_len, after_goal, last_was_reversal = open_set.pop()             # <<<<<<<<<<<<<<
+ *         item = open_set.pop()             # <<<<<<<<<<<<<<
+ *         g, current, mask, path, last_dir, seg_len, after_goal, last_was_reversal = item
  *         state_key = (current, mask, last_dir, cap_seg(seg_len, minimum_segment_length), after_goal, last_was_reversal)
- *         if state_key in visited_states:
  */
-    __pyx_t_3 = ((struct __pyx_vtabstruct_6a_star_PriorityQueue *)__pyx_v_open_set->__pyx_vtab)->pop(__pyx_v_open_set); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 213, __pyx_L1_error)
+    __pyx_t_3 = ((struct __pyx_vtabstruct_6a_star_PriorityQueue *)__pyx_v_open_set->__pyx_vtab)->pop(__pyx_v_open_set); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 235, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
-    if ((likely(PyTuple_CheckExact(__pyx_t_3))) || (PyList_CheckExact(__pyx_t_3))) {
-      PyObject* sequence = __pyx_t_3;
+    __Pyx_DECREF_SET(__pyx_v_item, __pyx_t_3);
+    __pyx_t_3 = 0;
+
+    /* "a_star.pyx":236
+ *     while not open_set.is_empty():
+ *         item = open_set.pop()
+ *         g, current, mask, path, last_dir, seg_len, after_goal, last_was_reversal = item             # <<<<<<<<<<<<<<
+ *         state_key = (current, mask, last_dir, cap_seg(seg_len, minimum_segment_length), after_goal, last_was_reversal)
+ *         if state_key in visited_states:
+ */
+    if ((likely(PyTuple_CheckExact(__pyx_v_item))) || (PyList_CheckExact(__pyx_v_item))) {
+      PyObject* sequence = __pyx_v_item;
       Py_ssize_t size = __Pyx_PySequence_SIZE(sequence);
       if (unlikely(size != 8)) {
         if (size > 8) __Pyx_RaiseTooManyValuesError(8);
         else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
-        __PYX_ERR(0, 213, __pyx_L1_error)
+        __PYX_ERR(0, 236, __pyx_L1_error)
       }
       #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
       if (likely(PyTuple_CheckExact(sequence))) {
-        __pyx_t_5 = PyTuple_GET_ITEM(sequence, 0); 
+        __pyx_t_3 = PyTuple_GET_ITEM(sequence, 0); 
         __pyx_t_6 = PyTuple_GET_ITEM(sequence, 1); 
-        __pyx_t_8 = PyTuple_GET_ITEM(sequence, 2); 
-        __pyx_t_11 = PyTuple_GET_ITEM(sequence, 3); 
-        __pyx_t_12 = PyTuple_GET_ITEM(sequence, 4); 
-        __pyx_t_13 = PyTuple_GET_ITEM(sequence, 5); 
-        __pyx_t_14 = PyTuple_GET_ITEM(sequence, 6); 
-        __pyx_t_15 = PyTuple_GET_ITEM(sequence, 7); 
+        __pyx_t_5 = PyTuple_GET_ITEM(sequence, 2); 
+        __pyx_t_8 = PyTuple_GET_ITEM(sequence, 3); 
+        __pyx_t_15 = PyTuple_GET_ITEM(sequence, 4); 
+        __pyx_t_16 = PyTuple_GET_ITEM(sequence, 5); 
+        __pyx_t_17 = PyTuple_GET_ITEM(sequence, 6); 
+        __pyx_t_18 = PyTuple_GET_ITEM(sequence, 7); 
       } else {
-        __pyx_t_5 = PyList_GET_ITEM(sequence, 0); 
+        __pyx_t_3 = PyList_GET_ITEM(sequence, 0); 
         __pyx_t_6 = PyList_GET_ITEM(sequence, 1); 
-        __pyx_t_8 = PyList_GET_ITEM(sequence, 2); 
-        __pyx_t_11 = PyList_GET_ITEM(sequence, 3); 
-        __pyx_t_12 = PyList_GET_ITEM(sequence, 4); 
-        __pyx_t_13 = PyList_GET_ITEM(sequence, 5); 
-        __pyx_t_14 = PyList_GET_ITEM(sequence, 6); 
-        __pyx_t_15 = PyList_GET_ITEM(sequence, 7); 
+        __pyx_t_5 = PyList_GET_ITEM(sequence, 2); 
+        __pyx_t_8 = PyList_GET_ITEM(sequence, 3); 
+        __pyx_t_15 = PyList_GET_ITEM(sequence, 4); 
+        __pyx_t_16 = PyList_GET_ITEM(sequence, 5); 
+        __pyx_t_17 = PyList_GET_ITEM(sequence, 6); 
+        __pyx_t_18 = PyList_GET_ITEM(sequence, 7); 
       }
-      __Pyx_INCREF(__pyx_t_5);
+      __Pyx_INCREF(__pyx_t_3);
       __Pyx_INCREF(__pyx_t_6);
+      __Pyx_INCREF(__pyx_t_5);
       __Pyx_INCREF(__pyx_t_8);
-      __Pyx_INCREF(__pyx_t_11);
-      __Pyx_INCREF(__pyx_t_12);
-      __Pyx_INCREF(__pyx_t_13);
-      __Pyx_INCREF(__pyx_t_14);
       __Pyx_INCREF(__pyx_t_15);
+      __Pyx_INCREF(__pyx_t_16);
+      __Pyx_INCREF(__pyx_t_17);
+      __Pyx_INCREF(__pyx_t_18);
       #else
       {
         Py_ssize_t i;
-        PyObject** temps[8] = {&__pyx_t_5,&__pyx_t_6,&__pyx_t_8,&__pyx_t_11,&__pyx_t_12,&__pyx_t_13,&__pyx_t_14,&__pyx_t_15};
+        PyObject** temps[8] = {&__pyx_t_3,&__pyx_t_6,&__pyx_t_5,&__pyx_t_8,&__pyx_t_15,&__pyx_t_16,&__pyx_t_17,&__pyx_t_18};
         for (i=0; i < 8; i++) {
-          PyObject* item = PySequence_ITEM(sequence, i); if (unlikely(!item)) __PYX_ERR(0, 213, __pyx_L1_error)
+          PyObject* item = PySequence_ITEM(sequence, i); if (unlikely(!item)) __PYX_ERR(0, 236, __pyx_L1_error)
           __Pyx_GOTREF(item);
           *(temps[i]) = item;
         }
       }
       #endif
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     } else {
       Py_ssize_t index = -1;
-      PyObject** temps[8] = {&__pyx_t_5,&__pyx_t_6,&__pyx_t_8,&__pyx_t_11,&__pyx_t_12,&__pyx_t_13,&__pyx_t_14,&__pyx_t_15};
-      __pyx_t_16 = PyObject_GetIter(__pyx_t_3); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 213, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_16);
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_t_17 = __Pyx_PyObject_GetIterNextFunc(__pyx_t_16);
+      PyObject** temps[8] = {&__pyx_t_3,&__pyx_t_6,&__pyx_t_5,&__pyx_t_8,&__pyx_t_15,&__pyx_t_16,&__pyx_t_17,&__pyx_t_18};
+      __pyx_t_19 = PyObject_GetIter(__pyx_v_item); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 236, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_19);
+      __pyx_t_20 = __Pyx_PyObject_GetIterNextFunc(__pyx_t_19);
       for (index=0; index < 8; index++) {
-        PyObject* item = __pyx_t_17(__pyx_t_16); if (unlikely(!item)) goto __pyx_L13_unpacking_failed;
+        PyObject* item = __pyx_t_20(__pyx_t_19); if (unlikely(!item)) goto __pyx_L13_unpacking_failed;
         __Pyx_GOTREF(item);
         *(temps[index]) = item;
       }
-      if (__Pyx_IternextUnpackEndCheck(__pyx_t_17(__pyx_t_16), 8) < 0) __PYX_ERR(0, 213, __pyx_L1_error)
-      __pyx_t_17 = NULL;
-      __Pyx_DECREF(__pyx_t_16); __pyx_t_16 = 0;
+      if (__Pyx_IternextUnpackEndCheck(__pyx_t_20(__pyx_t_19), 8) < 0) __PYX_ERR(0, 236, __pyx_L1_error)
+      __pyx_t_20 = NULL;
+      __Pyx_DECREF(__pyx_t_19); __pyx_t_19 = 0;
       goto __pyx_L14_unpacking_done;
       __pyx_L13_unpacking_failed:;
-      __Pyx_DECREF(__pyx_t_16); __pyx_t_16 = 0;
-      __pyx_t_17 = NULL;
+      __Pyx_DECREF(__pyx_t_19); __pyx_t_19 = 0;
+      __pyx_t_20 = NULL;
       if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
-      __PYX_ERR(0, 213, __pyx_L1_error)
+      __PYX_ERR(0, 236, __pyx_L1_error)
       __pyx_L14_unpacking_done:;
     }
-    __Pyx_XDECREF_SET(__pyx_v_g, __pyx_t_5);
-    __pyx_t_5 = 0;
+    __Pyx_XDECREF_SET(__pyx_v_g, __pyx_t_3);
+    __pyx_t_3 = 0;
     __Pyx_XDECREF_SET(__pyx_v_current, __pyx_t_6);
     __pyx_t_6 = 0;
-    __Pyx_XDECREF_SET(__pyx_v_mask, __pyx_t_8);
+    __Pyx_XDECREF_SET(__pyx_v_mask, __pyx_t_5);
+    __pyx_t_5 = 0;
+    __Pyx_XDECREF_SET(__pyx_v_path, __pyx_t_8);
     __pyx_t_8 = 0;
-    __Pyx_XDECREF_SET(__pyx_v_path, __pyx_t_11);
-    __pyx_t_11 = 0;
-    __Pyx_XDECREF_SET(__pyx_v_last_dir, __pyx_t_12);
-    __pyx_t_12 = 0;
-    __Pyx_XDECREF_SET(__pyx_v_seg_len, __pyx_t_13);
-    __pyx_t_13 = 0;
-    __Pyx_XDECREF_SET(__pyx_v_after_goal, __pyx_t_14);
-    __pyx_t_14 = 0;
-    __Pyx_XDECREF_SET(__pyx_v_last_was_reversal, __pyx_t_15);
+    __Pyx_XDECREF_SET(__pyx_v_last_dir, __pyx_t_15);
     __pyx_t_15 = 0;
-
-    /* "a_star.pyx":214
- *     while not open_set.is_empty():
- *         g, current, mask, path, last_dir, seg_len, after_goal, last_was_reversal = open_set.pop()
+    __Pyx_XDECREF_SET(__pyx_v_seg_len, __pyx_t_16);
+    __pyx_t_16 = 0;
+    __Pyx_XDECREF_SET(__pyx_v_after_goal, __pyx_t_17);
+    __pyx_t_17 = 0;
+    __Pyx_XDECREF_SET(__pyx_v_last_was_reversal, __pyx_t_18);
+    __pyx_t_18 = 0;
+
+    /* "a_star.pyx":237
+ *         item = open_set.pop()
+ *         g, current, mask, path, last_dir, seg_len, after_goal, last_was_reversal = item
  *         state_key = (current, mask, last_dir, cap_seg(seg_len, minimum_segment_length), after_goal, last_was_reversal)             # <<<<<<<<<<<<<<
  *         if state_key in visited_states:
  *             continue
  */
-    __pyx_t_3 = __pyx_f_6a_star_cap_seg(__pyx_v_seg_len, __pyx_v_minimum_segment_length); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 214, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_15 = PyTuple_New(6); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 214, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_15);
+    __pyx_t_18 = __pyx_f_6a_star_cap_seg(__pyx_v_seg_len, __pyx_v_minimum_segment_length); if (unlikely(!__pyx_t_18)) __PYX_ERR(0, 237, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_18);
+    __pyx_t_17 = PyTuple_New(6); if (unlikely(!__pyx_t_17)) __PYX_ERR(0, 237, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_17);
     __Pyx_INCREF(__pyx_v_current);
     __Pyx_GIVEREF(__pyx_v_current);
-    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_15, 0, __pyx_v_current)) __PYX_ERR(0, 214, __pyx_L1_error);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_17, 0, __pyx_v_current)) __PYX_ERR(0, 237, __pyx_L1_error);
     __Pyx_INCREF(__pyx_v_mask);
     __Pyx_GIVEREF(__pyx_v_mask);
-    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_15, 1, __pyx_v_mask)) __PYX_ERR(0, 214, __pyx_L1_error);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_17, 1, __pyx_v_mask)) __PYX_ERR(0, 237, __pyx_L1_error);
     __Pyx_INCREF(__pyx_v_last_dir);
     __Pyx_GIVEREF(__pyx_v_last_dir);
-    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_15, 2, __pyx_v_last_dir)) __PYX_ERR(0, 214, __pyx_L1_error);
-    __Pyx_GIVEREF(__pyx_t_3);
-    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_15, 3, __pyx_t_3)) __PYX_ERR(0, 214, __pyx_L1_error);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_17, 2, __pyx_v_last_dir)) __PYX_ERR(0, 237, __pyx_L1_error);
+    __Pyx_GIVEREF(__pyx_t_18);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_17, 3, __pyx_t_18)) __PYX_ERR(0, 237, __pyx_L1_error);
     __Pyx_INCREF(__pyx_v_after_goal);
     __Pyx_GIVEREF(__pyx_v_after_goal);
-    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_15, 4, __pyx_v_after_goal)) __PYX_ERR(0, 214, __pyx_L1_error);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_17, 4, __pyx_v_after_goal)) __PYX_ERR(0, 237, __pyx_L1_error);
     __Pyx_INCREF(__pyx_v_last_was_reversal);
     __Pyx_GIVEREF(__pyx_v_last_was_reversal);
-    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_15, 5, __pyx_v_last_was_reversal)) __PYX_ERR(0, 214, __pyx_L1_error);
-    __pyx_t_3 = 0;
-    __Pyx_XDECREF_SET(__pyx_v_state_key, ((PyObject*)__pyx_t_15));
-    __pyx_t_15 = 0;
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_17, 5, __pyx_v_last_was_reversal)) __PYX_ERR(0, 237, __pyx_L1_error);
+    __pyx_t_18 = 0;
+    __Pyx_DECREF_SET(__pyx_v_state_key, ((PyObject*)__pyx_t_17));
+    __pyx_t_17 = 0;
 
-    /* "a_star.pyx":215
- *         g, current, mask, path, last_dir, seg_len, after_goal, last_was_reversal = open_set.pop()
+    /* "a_star.pyx":238
+ *         g, current, mask, path, last_dir, seg_len, after_goal, last_was_reversal = item
  *         state_key = (current, mask, last_dir, cap_seg(seg_len, minimum_segment_length), after_goal, last_was_reversal)
  *         if state_key in visited_states:             # <<<<<<<<<<<<<<
  *             continue
  *         visited_states.add(state_key)
  */
-    __pyx_t_10 = (__Pyx_PySet_ContainsTF(__pyx_v_state_key, __pyx_v_visited_states, Py_EQ)); if (unlikely((__pyx_t_10 < 0))) __PYX_ERR(0, 215, __pyx_L1_error)
-    if (__pyx_t_10) {
+    __pyx_t_14 = (__Pyx_PySet_ContainsTF(__pyx_v_state_key, __pyx_v_visited_states, Py_EQ)); if (unlikely((__pyx_t_14 < 0))) __PYX_ERR(0, 238, __pyx_L1_error)
+    if (__pyx_t_14) {
 
-      /* "a_star.pyx":216
+      /* "a_star.pyx":239
  *         state_key = (current, mask, last_dir, cap_seg(seg_len, minimum_segment_length), after_goal, last_was_reversal)
  *         if state_key in visited_states:
  *             continue             # <<<<<<<<<<<<<<
@@ -7973,8 +8446,8 @@ static PyObject *__pyx_f_6a_star_a_star(PyObject *__pyx_v_grid_vertical, PyObjec
  */
       goto __pyx_L11_continue;
 
-      /* "a_star.pyx":215
- *         g, current, mask, path, last_dir, seg_len, after_goal, last_was_reversal = open_set.pop()
+      /* "a_star.pyx":238
+ *         g, current, mask, path, last_dir, seg_len, after_goal, last_was_reversal = item
  *         state_key = (current, mask, last_dir, cap_seg(seg_len, minimum_segment_length), after_goal, last_was_reversal)
  *         if state_key in visited_states:             # <<<<<<<<<<<<<<
  *             continue
@@ -7982,61 +8455,371 @@ static PyObject *__pyx_f_6a_star_a_star(PyObject *__pyx_v_grid_vertical, PyObjec
  */
     }
 
-    /* "a_star.pyx":217
+    /* "a_star.pyx":240
  *         if state_key in visited_states:
  *             continue
  *         visited_states.add(state_key)             # <<<<<<<<<<<<<<
  * 
  *         # If all goals have been visited, return the path.
  */
-    __pyx_t_18 = PySet_Add(__pyx_v_visited_states, __pyx_v_state_key); if (unlikely(__pyx_t_18 == ((int)-1))) __PYX_ERR(0, 217, __pyx_L1_error)
+    __pyx_t_21 = PySet_Add(__pyx_v_visited_states, __pyx_v_state_key); if (unlikely(__pyx_t_21 == ((int)-1))) __PYX_ERR(0, 240, __pyx_L1_error)
 
-    /* "a_star.pyx":220
+    /* "a_star.pyx":243
  * 
  *         # If all goals have been visited, return the path.
  *         if mask == all_visited:             # <<<<<<<<<<<<<<
+ *             if stats is not None:
+ *                 stats.add_search(nodes_expanded=nodes_expanded, nodes_generated=nodes_generated,
+ */
+    __pyx_t_17 = PyInt_FromSsize_t(__pyx_v_all_visited); if (unlikely(!__pyx_t_17)) __PYX_ERR(0, 243, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_17);
+    __pyx_t_18 = PyObject_RichCompare(__pyx_v_mask, __pyx_t_17, Py_EQ); __Pyx_XGOTREF(__pyx_t_18); if (unlikely(!__pyx_t_18)) __PYX_ERR(0, 243, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_17); __pyx_t_17 = 0;
+    __pyx_t_14 = __Pyx_PyObject_IsTrue(__pyx_t_18); if (unlikely((__pyx_t_14 < 0))) __PYX_ERR(0, 243, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_18); __pyx_t_18 = 0;
+    if (__pyx_t_14) {
+
+      /* "a_star.pyx":244
+ *         # If all goals have been visited, return the path.
+ *         if mask == all_visited:
+ *             if stats is not None:             # <<<<<<<<<<<<<<
+ *                 stats.add_search(nodes_expanded=nodes_expanded, nodes_generated=nodes_generated,
+ *                                  segment_length_prunes=segment_length_prunes, max_open_set=max_open_set,
+ */
+      __pyx_t_14 = (__pyx_v_stats != Py_None);
+      if (__pyx_t_14) {
+
+        /* "a_star.pyx":245
+ *         if mask == all_visited:
+ *             if stats is not None:
+ *                 stats.add_search(nodes_expanded=nodes_expanded, nodes_generated=nodes_generated,             # <<<<<<<<<<<<<<
+ *                                  segment_length_prunes=segment_length_prunes, max_open_set=max_open_set,
+ *                                  visited_states=len(visited_states),
+ */
+        __pyx_t_18 = __Pyx_PyObject_GetAttrStr(__pyx_v_stats, __pyx_n_s_add_search); if (unlikely(!__pyx_t_18)) __PYX_ERR(0, 245, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_18);
+        __pyx_t_17 = __Pyx_PyDict_NewPresized(7); if (unlikely(!__pyx_t_17)) __PYX_ERR(0, 245, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_17);
+        __pyx_t_16 = __Pyx_PyInt_From_PY_LONG_LONG(__pyx_v_nodes_expanded); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 245, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_16);
+        if (PyDict_SetItem(__pyx_t_17, __pyx_n_s_nodes_expanded, __pyx_t_16) < 0) __PYX_ERR(0, 245, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_16); __pyx_t_16 = 0;
+        __pyx_t_16 = __Pyx_PyInt_From_PY_LONG_LONG(__pyx_v_nodes_generated); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 245, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_16);
+        if (PyDict_SetItem(__pyx_t_17, __pyx_n_s_nodes_generated, __pyx_t_16) < 0) __PYX_ERR(0, 245, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_16); __pyx_t_16 = 0;
+
+        /* "a_star.pyx":246
+ *             if stats is not None:
+ *                 stats.add_search(nodes_expanded=nodes_expanded, nodes_generated=nodes_generated,
+ *                                  segment_length_prunes=segment_length_prunes, max_open_set=max_open_set,             # <<<<<<<<<<<<<<
+ *                                  visited_states=len(visited_states),
+ *                                  peak_memory=estimate_search_memory(visited_states, state_key, max_open_set, item,
+ */
+        __pyx_t_16 = __Pyx_PyInt_From_PY_LONG_LONG(__pyx_v_segment_length_prunes); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 246, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_16);
+        if (PyDict_SetItem(__pyx_t_17, __pyx_n_s_segment_length_prunes, __pyx_t_16) < 0) __PYX_ERR(0, 245, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_16); __pyx_t_16 = 0;
+        __pyx_t_16 = __Pyx_PyInt_From_PY_LONG_LONG(__pyx_v_max_open_set); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 246, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_16);
+        if (PyDict_SetItem(__pyx_t_17, __pyx_n_s_max_open_set, __pyx_t_16) < 0) __PYX_ERR(0, 245, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_16); __pyx_t_16 = 0;
+
+        /* "a_star.pyx":247
+ *                 stats.add_search(nodes_expanded=nodes_expanded, nodes_generated=nodes_generated,
+ *                                  segment_length_prunes=segment_length_prunes, max_open_set=max_open_set,
+ *                                  visited_states=len(visited_states),             # <<<<<<<<<<<<<<
+ *                                  peak_memory=estimate_search_memory(visited_states, state_key, max_open_set, item,
+ *                                                                     path),
+ */
+        __pyx_t_1 = __Pyx_PySet_GET_SIZE(__pyx_v_visited_states); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-1))) __PYX_ERR(0, 247, __pyx_L1_error)
+        __pyx_t_16 = PyInt_FromSsize_t(__pyx_t_1); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 247, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_16);
+        if (PyDict_SetItem(__pyx_t_17, __pyx_n_s_visited_states, __pyx_t_16) < 0) __PYX_ERR(0, 245, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_16); __pyx_t_16 = 0;
+
+        /* "a_star.pyx":248
+ *                                  segment_length_prunes=segment_length_prunes, max_open_set=max_open_set,
+ *                                  visited_states=len(visited_states),
+ *                                  peak_memory=estimate_search_memory(visited_states, state_key, max_open_set, item,             # <<<<<<<<<<<<<<
+ *                                                                     path),
+ *                                  seconds=time.perf_counter() - start_time)
+ */
+        __Pyx_GetModuleGlobalName(__pyx_t_15, __pyx_n_s_estimate_search_memory); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 248, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_15);
+        __pyx_t_8 = __Pyx_PyInt_From_PY_LONG_LONG(__pyx_v_max_open_set); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 248, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_8);
+
+        /* "a_star.pyx":249
+ *                                  visited_states=len(visited_states),
+ *                                  peak_memory=estimate_search_memory(visited_states, state_key, max_open_set, item,
+ *                                                                     path),             # <<<<<<<<<<<<<<
+ *                                  seconds=time.perf_counter() - start_time)
+ *             return path, g
+ */
+        __pyx_t_5 = NULL;
+        __pyx_t_10 = 0;
+        #if CYTHON_UNPACK_METHODS
+        if (unlikely(PyMethod_Check(__pyx_t_15))) {
+          __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_15);
+          if (likely(__pyx_t_5)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_15);
+            __Pyx_INCREF(__pyx_t_5);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_15, function);
+            __pyx_t_10 = 1;
+          }
+        }
+        #endif
+        {
+          PyObject *__pyx_callargs[6] = {__pyx_t_5, __pyx_v_visited_states, __pyx_v_state_key, __pyx_t_8, __pyx_v_item, __pyx_v_path};
+          __pyx_t_16 = __Pyx_PyObject_FastCall(__pyx_t_15, __pyx_callargs+1-__pyx_t_10, 5+__pyx_t_10);
+          __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+          __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+          if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 248, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_16);
+          __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
+        }
+        if (PyDict_SetItem(__pyx_t_17, __pyx_n_s_peak_memory, __pyx_t_16) < 0) __PYX_ERR(0, 245, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_16); __pyx_t_16 = 0;
+
+        /* "a_star.pyx":250
+ *                                  peak_memory=estimate_search_memory(visited_states, state_key, max_open_set, item,
+ *                                                                     path),
+ *                                  seconds=time.perf_counter() - start_time)             # <<<<<<<<<<<<<<
  *             return path, g
  * 
  */
-    __pyx_t_15 = PyInt_FromSsize_t(__pyx_v_all_visited); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 220, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_15);
-    __pyx_t_3 = PyObject_RichCompare(__pyx_v_mask, __pyx_t_15, Py_EQ); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 220, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
-    __pyx_t_10 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely((__pyx_t_10 < 0))) __PYX_ERR(0, 220, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    if (__pyx_t_10) {
+        __Pyx_GetModuleGlobalName(__pyx_t_15, __pyx_n_s_time); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 250, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_15);
+        __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_t_15, __pyx_n_s_perf_counter); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 250, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_8);
+        __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
+        __pyx_t_15 = NULL;
+        __pyx_t_10 = 0;
+        #if CYTHON_UNPACK_METHODS
+        if (unlikely(PyMethod_Check(__pyx_t_8))) {
+          __pyx_t_15 = PyMethod_GET_SELF(__pyx_t_8);
+          if (likely(__pyx_t_15)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_8);
+            __Pyx_INCREF(__pyx_t_15);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_8, function);
+            __pyx_t_10 = 1;
+          }
+        }
+        #endif
+        {
+          PyObject *__pyx_callargs[2] = {__pyx_t_15, NULL};
+          __pyx_t_16 = __Pyx_PyObject_FastCall(__pyx_t_8, __pyx_callargs+1-__pyx_t_10, 0+__pyx_t_10);
+          __Pyx_XDECREF(__pyx_t_15); __pyx_t_15 = 0;
+          if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 250, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_16);
+          __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+        }
+        __pyx_t_8 = PyNumber_Subtract(__pyx_t_16, __pyx_v_start_time); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 250, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_8);
+        __Pyx_DECREF(__pyx_t_16); __pyx_t_16 = 0;
+        if (PyDict_SetItem(__pyx_t_17, __pyx_n_s_seconds, __pyx_t_8) < 0) __PYX_ERR(0, 245, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+
+        /* "a_star.pyx":245
+ *         if mask == all_visited:
+ *             if stats is not None:
+ *                 stats.add_search(nodes_expanded=nodes_expanded, nodes_generated=nodes_generated,             # <<<<<<<<<<<<<<
+ *                                  segment_length_prunes=segment_length_prunes, max_open_set=max_open_set,
+ *                                  visited_states=len(visited_states),
+ */
+        __pyx_t_8 = __Pyx_PyObject_Call(__pyx_t_18, __pyx_empty_tuple, __pyx_t_17); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 245, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_8);
+        __Pyx_DECREF(__pyx_t_18); __pyx_t_18 = 0;
+        __Pyx_DECREF(__pyx_t_17); __pyx_t_17 = 0;
+        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
 
-      /* "a_star.pyx":221
+        /* "a_star.pyx":244
  *         # If all goals have been visited, return the path.
  *         if mask == all_visited:
+ *             if stats is not None:             # <<<<<<<<<<<<<<
+ *                 stats.add_search(nodes_expanded=nodes_expanded, nodes_generated=nodes_generated,
+ *                                  segment_length_prunes=segment_length_prunes, max_open_set=max_open_set,
+ */
+      }
+
+      /* "a_star.pyx":251
+ *                                                                     path),
+ *                                  seconds=time.perf_counter() - start_time)
  *             return path, g             # <<<<<<<<<<<<<<
  * 
- *         x, y = current
+ *         # Stop before the search grows any further, only looking at the clock every 1024 expansions
  */
       __Pyx_XDECREF(__pyx_r);
-      __pyx_t_3 = PyTuple_New(2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 221, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_8 = PyTuple_New(2); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 251, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_8);
       __Pyx_INCREF(__pyx_v_path);
       __Pyx_GIVEREF(__pyx_v_path);
-      if (__Pyx_PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_v_path)) __PYX_ERR(0, 221, __pyx_L1_error);
+      if (__Pyx_PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_v_path)) __PYX_ERR(0, 251, __pyx_L1_error);
       __Pyx_INCREF(__pyx_v_g);
       __Pyx_GIVEREF(__pyx_v_g);
-      if (__Pyx_PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_v_g)) __PYX_ERR(0, 221, __pyx_L1_error);
-      __pyx_r = __pyx_t_3;
-      __pyx_t_3 = 0;
+      if (__Pyx_PyTuple_SET_ITEM(__pyx_t_8, 1, __pyx_v_g)) __PYX_ERR(0, 251, __pyx_L1_error);
+      __pyx_r = __pyx_t_8;
+      __pyx_t_8 = 0;
       goto __pyx_L0;
 
-      /* "a_star.pyx":220
+      /* "a_star.pyx":243
  * 
  *         # If all goals have been visited, return the path.
  *         if mask == all_visited:             # <<<<<<<<<<<<<<
- *             return path, g
+ *             if stats is not None:
+ *                 stats.add_search(nodes_expanded=nodes_expanded, nodes_generated=nodes_generated,
+ */
+    }
+
+    /* "a_star.pyx":254
+ * 
+ *         # Stop before the search grows any further, only looking at the clock every 1024 expansions
+ *         if max_expansions and nodes_expanded >= max_expansions:             # <<<<<<<<<<<<<<
+ *             limit = LIMIT_EXPANSIONS
+ *             break
+ */
+    __pyx_t_2 = (__pyx_v_max_expansions != 0);
+    if (__pyx_t_2) {
+    } else {
+      __pyx_t_14 = __pyx_t_2;
+      goto __pyx_L19_bool_binop_done;
+    }
+    __pyx_t_2 = (__pyx_v_nodes_expanded >= __pyx_v_max_expansions);
+    __pyx_t_14 = __pyx_t_2;
+    __pyx_L19_bool_binop_done:;
+    if (__pyx_t_14) {
+
+      /* "a_star.pyx":255
+ *         # Stop before the search grows any further, only looking at the clock every 1024 expansions
+ *         if max_expansions and nodes_expanded >= max_expansions:
+ *             limit = LIMIT_EXPANSIONS             # <<<<<<<<<<<<<<
+ *             break
+ *         if deadline and not nodes_expanded & 1023 and time.perf_counter() > deadline:
+ */
+      __Pyx_GetModuleGlobalName(__pyx_t_8, __pyx_n_s_LIMIT_EXPANSIONS); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 255, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      __Pyx_DECREF_SET(__pyx_v_limit, __pyx_t_8);
+      __pyx_t_8 = 0;
+
+      /* "a_star.pyx":256
+ *         if max_expansions and nodes_expanded >= max_expansions:
+ *             limit = LIMIT_EXPANSIONS
+ *             break             # <<<<<<<<<<<<<<
+ *         if deadline and not nodes_expanded & 1023 and time.perf_counter() > deadline:
+ *             limit = LIMIT_TIME
+ */
+      goto __pyx_L12_break;
+
+      /* "a_star.pyx":254
  * 
+ *         # Stop before the search grows any further, only looking at the clock every 1024 expansions
+ *         if max_expansions and nodes_expanded >= max_expansions:             # <<<<<<<<<<<<<<
+ *             limit = LIMIT_EXPANSIONS
+ *             break
  */
     }
 
-    /* "a_star.pyx":223
- *             return path, g
+    /* "a_star.pyx":257
+ *             limit = LIMIT_EXPANSIONS
+ *             break
+ *         if deadline and not nodes_expanded & 1023 and time.perf_counter() > deadline:             # <<<<<<<<<<<<<<
+ *             limit = LIMIT_TIME
+ *             break
+ */
+    __pyx_t_2 = (__pyx_v_deadline != 0);
+    if (__pyx_t_2) {
+    } else {
+      __pyx_t_14 = __pyx_t_2;
+      goto __pyx_L22_bool_binop_done;
+    }
+    __pyx_t_2 = (!((__pyx_v_nodes_expanded & 0x3FF) != 0));
+    if (__pyx_t_2) {
+    } else {
+      __pyx_t_14 = __pyx_t_2;
+      goto __pyx_L22_bool_binop_done;
+    }
+    __Pyx_GetModuleGlobalName(__pyx_t_17, __pyx_n_s_time); if (unlikely(!__pyx_t_17)) __PYX_ERR(0, 257, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_17);
+    __pyx_t_18 = __Pyx_PyObject_GetAttrStr(__pyx_t_17, __pyx_n_s_perf_counter); if (unlikely(!__pyx_t_18)) __PYX_ERR(0, 257, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_18);
+    __Pyx_DECREF(__pyx_t_17); __pyx_t_17 = 0;
+    __pyx_t_17 = NULL;
+    __pyx_t_10 = 0;
+    #if CYTHON_UNPACK_METHODS
+    if (unlikely(PyMethod_Check(__pyx_t_18))) {
+      __pyx_t_17 = PyMethod_GET_SELF(__pyx_t_18);
+      if (likely(__pyx_t_17)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_18);
+        __Pyx_INCREF(__pyx_t_17);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_18, function);
+        __pyx_t_10 = 1;
+      }
+    }
+    #endif
+    {
+      PyObject *__pyx_callargs[2] = {__pyx_t_17, NULL};
+      __pyx_t_8 = __Pyx_PyObject_FastCall(__pyx_t_18, __pyx_callargs+1-__pyx_t_10, 0+__pyx_t_10);
+      __Pyx_XDECREF(__pyx_t_17); __pyx_t_17 = 0;
+      if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 257, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      __Pyx_DECREF(__pyx_t_18); __pyx_t_18 = 0;
+    }
+    __pyx_t_18 = PyFloat_FromDouble(__pyx_v_deadline); if (unlikely(!__pyx_t_18)) __PYX_ERR(0, 257, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_18);
+    __pyx_t_17 = PyObject_RichCompare(__pyx_t_8, __pyx_t_18, Py_GT); __Pyx_XGOTREF(__pyx_t_17); if (unlikely(!__pyx_t_17)) __PYX_ERR(0, 257, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __Pyx_DECREF(__pyx_t_18); __pyx_t_18 = 0;
+    __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_17); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(0, 257, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_17); __pyx_t_17 = 0;
+    __pyx_t_14 = __pyx_t_2;
+    __pyx_L22_bool_binop_done:;
+    if (__pyx_t_14) {
+
+      /* "a_star.pyx":258
+ *             break
+ *         if deadline and not nodes_expanded & 1023 and time.perf_counter() > deadline:
+ *             limit = LIMIT_TIME             # <<<<<<<<<<<<<<
+ *             break
+ * 
+ */
+      __Pyx_GetModuleGlobalName(__pyx_t_17, __pyx_n_s_LIMIT_TIME); if (unlikely(!__pyx_t_17)) __PYX_ERR(0, 258, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_17);
+      __Pyx_DECREF_SET(__pyx_v_limit, __pyx_t_17);
+      __pyx_t_17 = 0;
+
+      /* "a_star.pyx":259
+ *         if deadline and not nodes_expanded & 1023 and time.perf_counter() > deadline:
+ *             limit = LIMIT_TIME
+ *             break             # <<<<<<<<<<<<<<
+ * 
+ *         nodes_expanded += 1
+ */
+      goto __pyx_L12_break;
+
+      /* "a_star.pyx":257
+ *             limit = LIMIT_EXPANSIONS
+ *             break
+ *         if deadline and not nodes_expanded & 1023 and time.perf_counter() > deadline:             # <<<<<<<<<<<<<<
+ *             limit = LIMIT_TIME
+ *             break
+ */
+    }
+
+    /* "a_star.pyx":261
+ *             break
+ * 
+ *         nodes_expanded += 1             # <<<<<<<<<<<<<<
+ * 
+ *         x, y = current
+ */
+    __pyx_v_nodes_expanded = (__pyx_v_nodes_expanded + 1);
+
+    /* "a_star.pyx":263
+ *         nodes_expanded += 1
  * 
  *         x, y = current             # <<<<<<<<<<<<<<
  *         # Determine edges traversed so far.
@@ -8048,102 +8831,102 @@ static PyObject *__pyx_f_6a_star_a_star(PyObject *__pyx_v_grid_vertical, PyObjec
       if (unlikely(size != 2)) {
         if (size > 2) __Pyx_RaiseTooManyValuesError(2);
         else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
-        __PYX_ERR(0, 223, __pyx_L1_error)
+        __PYX_ERR(0, 263, __pyx_L1_error)
       }
       #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
       if (likely(PyTuple_CheckExact(sequence))) {
-        __pyx_t_3 = PyTuple_GET_ITEM(sequence, 0); 
-        __pyx_t_15 = PyTuple_GET_ITEM(sequence, 1); 
+        __pyx_t_17 = PyTuple_GET_ITEM(sequence, 0); 
+        __pyx_t_18 = PyTuple_GET_ITEM(sequence, 1); 
       } else {
-        __pyx_t_3 = PyList_GET_ITEM(sequence, 0); 
-        __pyx_t_15 = PyList_GET_ITEM(sequence, 1); 
+        __pyx_t_17 = PyList_GET_ITEM(sequence, 0); 
+        __pyx_t_18 = PyList_GET_ITEM(sequence, 1); 
       }
-      __Pyx_INCREF(__pyx_t_3);
-      __Pyx_INCREF(__pyx_t_15);
+      __Pyx_INCREF(__pyx_t_17);
+      __Pyx_INCREF(__pyx_t_18);
       #else
-      __pyx_t_3 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 223, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_15 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 223, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_15);
+      __pyx_t_17 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_17)) __PYX_ERR(0, 263, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_17);
+      __pyx_t_18 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_18)) __PYX_ERR(0, 263, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_18);
       #endif
     } else {
       Py_ssize_t index = -1;
-      __pyx_t_14 = PyObject_GetIter(__pyx_v_current); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 223, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_14);
-      __pyx_t_17 = __Pyx_PyObject_GetIterNextFunc(__pyx_t_14);
-      index = 0; __pyx_t_3 = __pyx_t_17(__pyx_t_14); if (unlikely(!__pyx_t_3)) goto __pyx_L17_unpacking_failed;
-      __Pyx_GOTREF(__pyx_t_3);
-      index = 1; __pyx_t_15 = __pyx_t_17(__pyx_t_14); if (unlikely(!__pyx_t_15)) goto __pyx_L17_unpacking_failed;
-      __Pyx_GOTREF(__pyx_t_15);
-      if (__Pyx_IternextUnpackEndCheck(__pyx_t_17(__pyx_t_14), 2) < 0) __PYX_ERR(0, 223, __pyx_L1_error)
-      __pyx_t_17 = NULL;
-      __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
-      goto __pyx_L18_unpacking_done;
-      __pyx_L17_unpacking_failed:;
-      __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
-      __pyx_t_17 = NULL;
+      __pyx_t_8 = PyObject_GetIter(__pyx_v_current); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 263, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      __pyx_t_20 = __Pyx_PyObject_GetIterNextFunc(__pyx_t_8);
+      index = 0; __pyx_t_17 = __pyx_t_20(__pyx_t_8); if (unlikely(!__pyx_t_17)) goto __pyx_L25_unpacking_failed;
+      __Pyx_GOTREF(__pyx_t_17);
+      index = 1; __pyx_t_18 = __pyx_t_20(__pyx_t_8); if (unlikely(!__pyx_t_18)) goto __pyx_L25_unpacking_failed;
+      __Pyx_GOTREF(__pyx_t_18);
+      if (__Pyx_IternextUnpackEndCheck(__pyx_t_20(__pyx_t_8), 2) < 0) __PYX_ERR(0, 263, __pyx_L1_error)
+      __pyx_t_20 = NULL;
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+      goto __pyx_L26_unpacking_done;
+      __pyx_L25_unpacking_failed:;
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+      __pyx_t_20 = NULL;
       if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
-      __PYX_ERR(0, 223, __pyx_L1_error)
-      __pyx_L18_unpacking_done:;
+      __PYX_ERR(0, 263, __pyx_L1_error)
+      __pyx_L26_unpacking_done:;
     }
-    __Pyx_XDECREF_SET(__pyx_v_x, __pyx_t_3);
-    __pyx_t_3 = 0;
-    __Pyx_XDECREF_SET(__pyx_v_y, __pyx_t_15);
-    __pyx_t_15 = 0;
+    __Pyx_XDECREF_SET(__pyx_v_x, __pyx_t_17);
+    __pyx_t_17 = 0;
+    __Pyx_XDECREF_SET(__pyx_v_y, __pyx_t_18);
+    __pyx_t_18 = 0;
 
-    /* "a_star.pyx":225
+    /* "a_star.pyx":265
  *         x, y = current
  *         # Determine edges traversed so far.
  *         edge_set = set(zip(path, path[1:]))             # <<<<<<<<<<<<<<
  * 
  *         for d in directions:
  */
-    __pyx_t_15 = __Pyx_PyObject_GetSlice(__pyx_v_path, 1, 0, NULL, NULL, &__pyx_slice__7, 1, 0, 1); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 225, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_15);
-    __pyx_t_3 = PyTuple_New(2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 225, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_18 = __Pyx_PyObject_GetSlice(__pyx_v_path, 1, 0, NULL, NULL, &__pyx_slice__7, 1, 0, 1); if (unlikely(!__pyx_t_18)) __PYX_ERR(0, 265, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_18);
+    __pyx_t_17 = PyTuple_New(2); if (unlikely(!__pyx_t_17)) __PYX_ERR(0, 265, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_17);
     __Pyx_INCREF(__pyx_v_path);
     __Pyx_GIVEREF(__pyx_v_path);
-    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_v_path)) __PYX_ERR(0, 225, __pyx_L1_error);
-    __Pyx_GIVEREF(__pyx_t_15);
-    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_t_15)) __PYX_ERR(0, 225, __pyx_L1_error);
-    __pyx_t_15 = 0;
-    __pyx_t_15 = __Pyx_PyObject_Call(__pyx_builtin_zip, __pyx_t_3, NULL); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 225, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_15);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __pyx_t_3 = PySet_New(__pyx_t_15); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 225, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
-    __Pyx_XDECREF_SET(__pyx_v_edge_set, ((PyObject*)__pyx_t_3));
-    __pyx_t_3 = 0;
-
-    /* "a_star.pyx":227
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_17, 0, __pyx_v_path)) __PYX_ERR(0, 265, __pyx_L1_error);
+    __Pyx_GIVEREF(__pyx_t_18);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_17, 1, __pyx_t_18)) __PYX_ERR(0, 265, __pyx_L1_error);
+    __pyx_t_18 = 0;
+    __pyx_t_18 = __Pyx_PyObject_Call(__pyx_builtin_zip, __pyx_t_17, NULL); if (unlikely(!__pyx_t_18)) __PYX_ERR(0, 265, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_18);
+    __Pyx_DECREF(__pyx_t_17); __pyx_t_17 = 0;
+    __pyx_t_17 = PySet_New(__pyx_t_18); if (unlikely(!__pyx_t_17)) __PYX_ERR(0, 265, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_17);
+    __Pyx_DECREF(__pyx_t_18); __pyx_t_18 = 0;
+    __Pyx_XDECREF_SET(__pyx_v_edge_set, ((PyObject*)__pyx_t_17));
+    __pyx_t_17 = 0;
+
+    /* "a_star.pyx":267
  *         edge_set = set(zip(path, path[1:]))
  * 
  *         for d in directions:             # <<<<<<<<<<<<<<
  *             dx, dy = d
  *             neighbor = (x + dx, y + dy)
  */
-    __pyx_t_3 = __pyx_v_directions; __Pyx_INCREF(__pyx_t_3);
+    __pyx_t_17 = __pyx_v_directions; __Pyx_INCREF(__pyx_t_17);
     __pyx_t_1 = 0;
     for (;;) {
       {
-        Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_3);
+        Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_17);
         #if !CYTHON_ASSUME_SAFE_MACROS
-        if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 227, __pyx_L1_error)
+        if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 267, __pyx_L1_error)
         #endif
         if (__pyx_t_1 >= __pyx_temp) break;
       }
       #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-      __pyx_t_15 = PyList_GET_ITEM(__pyx_t_3, __pyx_t_1); __Pyx_INCREF(__pyx_t_15); __pyx_t_1++; if (unlikely((0 < 0))) __PYX_ERR(0, 227, __pyx_L1_error)
+      __pyx_t_18 = PyList_GET_ITEM(__pyx_t_17, __pyx_t_1); __Pyx_INCREF(__pyx_t_18); __pyx_t_1++; if (unlikely((0 < 0))) __PYX_ERR(0, 267, __pyx_L1_error)
       #else
-      __pyx_t_15 = __Pyx_PySequence_ITEM(__pyx_t_3, __pyx_t_1); __pyx_t_1++; if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 227, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_15);
+      __pyx_t_18 = __Pyx_PySequence_ITEM(__pyx_t_17, __pyx_t_1); __pyx_t_1++; if (unlikely(!__pyx_t_18)) __PYX_ERR(0, 267, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_18);
       #endif
-      __Pyx_XDECREF_SET(__pyx_v_d, __pyx_t_15);
-      __pyx_t_15 = 0;
+      __Pyx_XDECREF_SET(__pyx_v_d, __pyx_t_18);
+      __pyx_t_18 = 0;
 
-      /* "a_star.pyx":228
+      /* "a_star.pyx":268
  * 
  *         for d in directions:
  *             dx, dy = d             # <<<<<<<<<<<<<<
@@ -8156,112 +8939,112 @@ static PyObject *__pyx_f_6a_star_a_star(PyObject *__pyx_v_grid_vertical, PyObjec
         if (unlikely(size != 2)) {
           if (size > 2) __Pyx_RaiseTooManyValuesError(2);
           else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
-          __PYX_ERR(0, 228, __pyx_L1_error)
+          __PYX_ERR(0, 268, __pyx_L1_error)
         }
         #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
         if (likely(PyTuple_CheckExact(sequence))) {
-          __pyx_t_15 = PyTuple_GET_ITEM(sequence, 0); 
-          __pyx_t_14 = PyTuple_GET_ITEM(sequence, 1); 
+          __pyx_t_18 = PyTuple_GET_ITEM(sequence, 0); 
+          __pyx_t_8 = PyTuple_GET_ITEM(sequence, 1); 
         } else {
-          __pyx_t_15 = PyList_GET_ITEM(sequence, 0); 
-          __pyx_t_14 = PyList_GET_ITEM(sequence, 1); 
+          __pyx_t_18 = PyList_GET_ITEM(sequence, 0); 
+          __pyx_t_8 = PyList_GET_ITEM(sequence, 1); 
         }
-        __Pyx_INCREF(__pyx_t_15);
-        __Pyx_INCREF(__pyx_t_14);
+        __Pyx_INCREF(__pyx_t_18);
+        __Pyx_INCREF(__pyx_t_8);
         #else
-        __pyx_t_15 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 228, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_15);
-        __pyx_t_14 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 228, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_14);
+        __pyx_t_18 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_18)) __PYX_ERR(0, 268, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_18);
+        __pyx_t_8 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 268, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_8);
         #endif
       } else {
         Py_ssize_t index = -1;
-        __pyx_t_13 = PyObject_GetIter(__pyx_v_d); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 228, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_13);
-        __pyx_t_17 = __Pyx_PyObject_GetIterNextFunc(__pyx_t_13);
-        index = 0; __pyx_t_15 = __pyx_t_17(__pyx_t_13); if (unlikely(!__pyx_t_15)) goto __pyx_L21_unpacking_failed;
-        __Pyx_GOTREF(__pyx_t_15);
-        index = 1; __pyx_t_14 = __pyx_t_17(__pyx_t_13); if (unlikely(!__pyx_t_14)) goto __pyx_L21_unpacking_failed;
-        __Pyx_GOTREF(__pyx_t_14);
-        if (__Pyx_IternextUnpackEndCheck(__pyx_t_17(__pyx_t_13), 2) < 0) __PYX_ERR(0, 228, __pyx_L1_error)
-        __pyx_t_17 = NULL;
-        __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
-        goto __pyx_L22_unpacking_done;
-        __pyx_L21_unpacking_failed:;
-        __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
-        __pyx_t_17 = NULL;
+        __pyx_t_16 = PyObject_GetIter(__pyx_v_d); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 268, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_16);
+        __pyx_t_20 = __Pyx_PyObject_GetIterNextFunc(__pyx_t_16);
+        index = 0; __pyx_t_18 = __pyx_t_20(__pyx_t_16); if (unlikely(!__pyx_t_18)) goto __pyx_L29_unpacking_failed;
+        __Pyx_GOTREF(__pyx_t_18);
+        index = 1; __pyx_t_8 = __pyx_t_20(__pyx_t_16); if (unlikely(!__pyx_t_8)) goto __pyx_L29_unpacking_failed;
+        __Pyx_GOTREF(__pyx_t_8);
+        if (__Pyx_IternextUnpackEndCheck(__pyx_t_20(__pyx_t_16), 2) < 0) __PYX_ERR(0, 268, __pyx_L1_error)
+        __pyx_t_20 = NULL;
+        __Pyx_DECREF(__pyx_t_16); __pyx_t_16 = 0;
+        goto __pyx_L30_unpacking_done;
+        __pyx_L29_unpacking_failed:;
+        __Pyx_DECREF(__pyx_t_16); __pyx_t_16 = 0;
+        __pyx_t_20 = NULL;
         if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
-        __PYX_ERR(0, 228, __pyx_L1_error)
-        __pyx_L22_unpacking_done:;
+        __PYX_ERR(0, 268, __pyx_L1_error)
+        __pyx_L30_unpacking_done:;
       }
-      __Pyx_XDECREF_SET(__pyx_v_dx, __pyx_t_15);
-      __pyx_t_15 = 0;
-      __Pyx_XDECREF_SET(__pyx_v_dy, __pyx_t_14);
-      __pyx_t_14 = 0;
+      __Pyx_XDECREF_SET(__pyx_v_dx, __pyx_t_18);
+      __pyx_t_18 = 0;
+      __Pyx_XDECREF_SET(__pyx_v_dy, __pyx_t_8);
+      __pyx_t_8 = 0;
 
-      /* "a_star.pyx":229
+      /* "a_star.pyx":269
  *         for d in directions:
  *             dx, dy = d
  *             neighbor = (x + dx, y + dy)             # <<<<<<<<<<<<<<
  *             if not (in_bounds(neighbor, width, height) and is_walkable(neighbor, current, grid_vertical, grid_horizontal)):
  *                 continue
  */
-      __pyx_t_14 = PyNumber_Add(__pyx_v_x, __pyx_v_dx); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 229, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_14);
-      __pyx_t_15 = PyNumber_Add(__pyx_v_y, __pyx_v_dy); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 229, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_15);
-      __pyx_t_13 = PyTuple_New(2); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 229, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_13);
-      __Pyx_GIVEREF(__pyx_t_14);
-      if (__Pyx_PyTuple_SET_ITEM(__pyx_t_13, 0, __pyx_t_14)) __PYX_ERR(0, 229, __pyx_L1_error);
-      __Pyx_GIVEREF(__pyx_t_15);
-      if (__Pyx_PyTuple_SET_ITEM(__pyx_t_13, 1, __pyx_t_15)) __PYX_ERR(0, 229, __pyx_L1_error);
-      __pyx_t_14 = 0;
-      __pyx_t_15 = 0;
-      __Pyx_XDECREF_SET(__pyx_v_neighbor, ((PyObject*)__pyx_t_13));
-      __pyx_t_13 = 0;
-
-      /* "a_star.pyx":230
+      __pyx_t_8 = PyNumber_Add(__pyx_v_x, __pyx_v_dx); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 269, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      __pyx_t_18 = PyNumber_Add(__pyx_v_y, __pyx_v_dy); if (unlikely(!__pyx_t_18)) __PYX_ERR(0, 269, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_18);
+      __pyx_t_16 = PyTuple_New(2); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 269, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_16);
+      __Pyx_GIVEREF(__pyx_t_8);
+      if (__Pyx_PyTuple_SET_ITEM(__pyx_t_16, 0, __pyx_t_8)) __PYX_ERR(0, 269, __pyx_L1_error);
+      __Pyx_GIVEREF(__pyx_t_18);
+      if (__Pyx_PyTuple_SET_ITEM(__pyx_t_16, 1, __pyx_t_18)) __PYX_ERR(0, 269, __pyx_L1_error);
+      __pyx_t_8 = 0;
+      __pyx_t_18 = 0;
+      __Pyx_XDECREF_SET(__pyx_v_neighbor, ((PyObject*)__pyx_t_16));
+      __pyx_t_16 = 0;
+
+      /* "a_star.pyx":270
  *             dx, dy = d
  *             neighbor = (x + dx, y + dy)
  *             if not (in_bounds(neighbor, width, height) and is_walkable(neighbor, current, grid_vertical, grid_horizontal)):             # <<<<<<<<<<<<<<
  *                 continue
  * 
  */
-      __pyx_t_13 = PyInt_FromSsize_t(__pyx_v_width); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 230, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_13);
-      __pyx_t_15 = PyInt_FromSsize_t(__pyx_v_height); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 230, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_15);
-      __pyx_t_14 = __pyx_f_6a_star_in_bounds(__pyx_v_neighbor, __pyx_t_13, __pyx_t_15); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 230, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_14);
-      __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
-      __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
-      __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_14); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(0, 230, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+      __pyx_t_16 = PyInt_FromSsize_t(__pyx_v_width); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 270, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_16);
+      __pyx_t_18 = PyInt_FromSsize_t(__pyx_v_height); if (unlikely(!__pyx_t_18)) __PYX_ERR(0, 270, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_18);
+      __pyx_t_8 = __pyx_f_6a_star_in_bounds(__pyx_v_neighbor, __pyx_t_16, __pyx_t_18); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 270, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      __Pyx_DECREF(__pyx_t_16); __pyx_t_16 = 0;
+      __Pyx_DECREF(__pyx_t_18); __pyx_t_18 = 0;
+      __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_8); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(0, 270, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
       if (__pyx_t_2) {
       } else {
-        __pyx_t_10 = __pyx_t_2;
-        goto __pyx_L24_bool_binop_done;
+        __pyx_t_14 = __pyx_t_2;
+        goto __pyx_L32_bool_binop_done;
       }
-      __pyx_t_14 = __pyx_f_6a_star_is_walkable(__pyx_v_neighbor, __pyx_v_current, __pyx_v_grid_vertical, __pyx_v_grid_horizontal); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 230, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_14);
-      __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_14); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(0, 230, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
-      __pyx_t_10 = __pyx_t_2;
-      __pyx_L24_bool_binop_done:;
-      __pyx_t_2 = (!__pyx_t_10);
+      __pyx_t_8 = __pyx_f_6a_star_is_walkable(__pyx_v_neighbor, __pyx_v_current, __pyx_v_grid_vertical, __pyx_v_grid_horizontal); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 270, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_8); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(0, 270, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+      __pyx_t_14 = __pyx_t_2;
+      __pyx_L32_bool_binop_done:;
+      __pyx_t_2 = (!__pyx_t_14);
       if (__pyx_t_2) {
 
-        /* "a_star.pyx":231
+        /* "a_star.pyx":271
  *             neighbor = (x + dx, y + dy)
  *             if not (in_bounds(neighbor, width, height) and is_walkable(neighbor, current, grid_vertical, grid_horizontal)):
  *                 continue             # <<<<<<<<<<<<<<
  * 
  * 
  */
-        goto __pyx_L19_continue;
+        goto __pyx_L27_continue;
 
-        /* "a_star.pyx":230
+        /* "a_star.pyx":270
  *             dx, dy = d
  *             neighbor = (x + dx, y + dy)
  *             if not (in_bounds(neighbor, width, height) and is_walkable(neighbor, current, grid_vertical, grid_horizontal)):             # <<<<<<<<<<<<<<
@@ -8270,7 +9053,7 @@ static PyObject *__pyx_f_6a_star_a_star(PyObject *__pyx_v_grid_vertical, PyObjec
  */
       }
 
-      /* "a_star.pyx":234
+      /* "a_star.pyx":274
  * 
  * 
  *             prospective_last_dir = None             # <<<<<<<<<<<<<<
@@ -8280,7 +9063,7 @@ static PyObject *__pyx_f_6a_star_a_star(PyObject *__pyx_v_grid_vertical, PyObjec
       __Pyx_INCREF(Py_None);
       __Pyx_XDECREF_SET(__pyx_v_prospective_last_dir, Py_None);
 
-      /* "a_star.pyx":235
+      /* "a_star.pyx":275
  * 
  *             prospective_last_dir = None
  *             prospective_seg_len = 0             # <<<<<<<<<<<<<<
@@ -8290,7 +9073,7 @@ static PyObject *__pyx_f_6a_star_a_star(PyObject *__pyx_v_grid_vertical, PyObjec
       __Pyx_INCREF(__pyx_int_0);
       __Pyx_XDECREF_SET(__pyx_v_prospective_seg_len, __pyx_int_0);
 
-      /* "a_star.pyx":236
+      /* "a_star.pyx":276
  *             prospective_last_dir = None
  *             prospective_seg_len = 0
  *             prospective_last_was_reversal = False             # <<<<<<<<<<<<<<
@@ -8299,7 +9082,7 @@ static PyObject *__pyx_f_6a_star_a_star(PyObject *__pyx_v_grid_vertical, PyObjec
  */
       __pyx_v_prospective_last_was_reversal = 0;
 
-      /* "a_star.pyx":238
+      /* "a_star.pyx":278
  *             prospective_last_was_reversal = False
  * 
  *             if last_dir is None:             # <<<<<<<<<<<<<<
@@ -8309,7 +9092,7 @@ static PyObject *__pyx_f_6a_star_a_star(PyObject *__pyx_v_grid_vertical, PyObjec
       __pyx_t_2 = (__pyx_v_last_dir == Py_None);
       if (__pyx_t_2) {
 
-        /* "a_star.pyx":240
+        /* "a_star.pyx":280
  *             if last_dir is None:
  *                 # At the start: choose a direction and begin a new segment.
  *                 prospective_last_dir = d             # <<<<<<<<<<<<<<
@@ -8319,7 +9102,7 @@ static PyObject *__pyx_f_6a_star_a_star(PyObject *__pyx_v_grid_vertical, PyObjec
         __Pyx_INCREF(__pyx_v_d);
         __Pyx_DECREF_SET(__pyx_v_prospective_last_dir, __pyx_v_d);
 
-        /* "a_star.pyx":241
+        /* "a_star.pyx":281
  *                 # At the start: choose a direction and begin a new segment.
  *                 prospective_last_dir = d
  *                 prospective_seg_len = 1             # <<<<<<<<<<<<<<
@@ -8329,7 +9112,7 @@ static PyObject *__pyx_f_6a_star_a_star(PyObject *__pyx_v_grid_vertical, PyObjec
         __Pyx_INCREF(__pyx_int_1);
         __Pyx_DECREF_SET(__pyx_v_prospective_seg_len, __pyx_int_1);
 
-        /* "a_star.pyx":242
+        /* "a_star.pyx":282
  *                 prospective_last_dir = d
  *                 prospective_seg_len = 1
  *                 penalty = 0             # <<<<<<<<<<<<<<
@@ -8339,17 +9122,17 @@ static PyObject *__pyx_f_6a_star_a_star(PyObject *__pyx_v_grid_vertical, PyObjec
         __Pyx_INCREF(__pyx_int_0);
         __Pyx_XDECREF_SET(__pyx_v_penalty, __pyx_int_0);
 
-        /* "a_star.pyx":238
+        /* "a_star.pyx":278
  *             prospective_last_was_reversal = False
  * 
  *             if last_dir is None:             # <<<<<<<<<<<<<<
  *                 # At the start: choose a direction and begin a new segment.
  *                 prospective_last_dir = d
  */
-        goto __pyx_L26;
+        goto __pyx_L34;
       }
 
-      /* "a_star.pyx":244
+      /* "a_star.pyx":284
  *                 penalty = 0
  *             else:
  *                 if d == last_dir:             # <<<<<<<<<<<<<<
@@ -8357,12 +9140,12 @@ static PyObject *__pyx_f_6a_star_a_star(PyObject *__pyx_v_grid_vertical, PyObjec
  *                     prospective_last_dir = last_dir
  */
       /*else*/ {
-        __pyx_t_14 = PyObject_RichCompare(__pyx_v_d, __pyx_v_last_dir, Py_EQ); __Pyx_XGOTREF(__pyx_t_14); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 244, __pyx_L1_error)
-        __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_14); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(0, 244, __pyx_L1_error)
-        __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+        __pyx_t_8 = PyObject_RichCompare(__pyx_v_d, __pyx_v_last_dir, Py_EQ); __Pyx_XGOTREF(__pyx_t_8); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 284, __pyx_L1_error)
+        __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_8); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(0, 284, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
         if (__pyx_t_2) {
 
-          /* "a_star.pyx":245
+          /* "a_star.pyx":285
  *             else:
  *                 if d == last_dir:
  *                     penalty = 0             # <<<<<<<<<<<<<<
@@ -8372,7 +9155,7 @@ static PyObject *__pyx_f_6a_star_a_star(PyObject *__pyx_v_grid_vertical, PyObjec
           __Pyx_INCREF(__pyx_int_0);
           __Pyx_XDECREF_SET(__pyx_v_penalty, __pyx_int_0);
 
-          /* "a_star.pyx":246
+          /* "a_star.pyx":286
  *                 if d == last_dir:
  *                     penalty = 0
  *                     prospective_last_dir = last_dir             # <<<<<<<<<<<<<<
@@ -8382,61 +9165,61 @@ static PyObject *__pyx_f_6a_star_a_star(PyObject *__pyx_v_grid_vertical, PyObjec
           __Pyx_INCREF(__pyx_v_last_dir);
           __Pyx_DECREF_SET(__pyx_v_prospective_last_dir, __pyx_v_last_dir);
 
-          /* "a_star.pyx":247
+          /* "a_star.pyx":287
  *                     penalty = 0
  *                     prospective_last_dir = last_dir
  *                     edge = (current, neighbor)             # <<<<<<<<<<<<<<
  *                     edge_rev = (neighbor, current)
  * 
  */
-          __pyx_t_14 = PyTuple_New(2); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 247, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_14);
+          __pyx_t_8 = PyTuple_New(2); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 287, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_8);
           __Pyx_INCREF(__pyx_v_current);
           __Pyx_GIVEREF(__pyx_v_current);
-          if (__Pyx_PyTuple_SET_ITEM(__pyx_t_14, 0, __pyx_v_current)) __PYX_ERR(0, 247, __pyx_L1_error);
+          if (__Pyx_PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_v_current)) __PYX_ERR(0, 287, __pyx_L1_error);
           __Pyx_INCREF(__pyx_v_neighbor);
           __Pyx_GIVEREF(__pyx_v_neighbor);
-          if (__Pyx_PyTuple_SET_ITEM(__pyx_t_14, 1, __pyx_v_neighbor)) __PYX_ERR(0, 247, __pyx_L1_error);
-          __Pyx_XDECREF_SET(__pyx_v_edge, ((PyObject*)__pyx_t_14));
-          __pyx_t_14 = 0;
+          if (__Pyx_PyTuple_SET_ITEM(__pyx_t_8, 1, __pyx_v_neighbor)) __PYX_ERR(0, 287, __pyx_L1_error);
+          __Pyx_XDECREF_SET(__pyx_v_edge, ((PyObject*)__pyx_t_8));
+          __pyx_t_8 = 0;
 
-          /* "a_star.pyx":248
+          /* "a_star.pyx":288
  *                     prospective_last_dir = last_dir
  *                     edge = (current, neighbor)
  *                     edge_rev = (neighbor, current)             # <<<<<<<<<<<<<<
  * 
  *                     if edge in edge_set or edge_rev in edge_set:
  */
-          __pyx_t_14 = PyTuple_New(2); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 248, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_14);
+          __pyx_t_8 = PyTuple_New(2); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 288, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_8);
           __Pyx_INCREF(__pyx_v_neighbor);
           __Pyx_GIVEREF(__pyx_v_neighbor);
-          if (__Pyx_PyTuple_SET_ITEM(__pyx_t_14, 0, __pyx_v_neighbor)) __PYX_ERR(0, 248, __pyx_L1_error);
+          if (__Pyx_PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_v_neighbor)) __PYX_ERR(0, 288, __pyx_L1_error);
           __Pyx_INCREF(__pyx_v_current);
           __Pyx_GIVEREF(__pyx_v_current);
-          if (__Pyx_PyTuple_SET_ITEM(__pyx_t_14, 1, __pyx_v_current)) __PYX_ERR(0, 248, __pyx_L1_error);
-          __Pyx_XDECREF_SET(__pyx_v_edge_rev, ((PyObject*)__pyx_t_14));
-          __pyx_t_14 = 0;
+          if (__Pyx_PyTuple_SET_ITEM(__pyx_t_8, 1, __pyx_v_current)) __PYX_ERR(0, 288, __pyx_L1_error);
+          __Pyx_XDECREF_SET(__pyx_v_edge_rev, ((PyObject*)__pyx_t_8));
+          __pyx_t_8 = 0;
 
-          /* "a_star.pyx":250
+          /* "a_star.pyx":290
  *                     edge_rev = (neighbor, current)
  * 
  *                     if edge in edge_set or edge_rev in edge_set:             # <<<<<<<<<<<<<<
  *                         prospective_seg_len = seg_len
  * 
  */
-          __pyx_t_10 = (__Pyx_PySet_ContainsTF(__pyx_v_edge, __pyx_v_edge_set, Py_EQ)); if (unlikely((__pyx_t_10 < 0))) __PYX_ERR(0, 250, __pyx_L1_error)
-          if (!__pyx_t_10) {
+          __pyx_t_14 = (__Pyx_PySet_ContainsTF(__pyx_v_edge, __pyx_v_edge_set, Py_EQ)); if (unlikely((__pyx_t_14 < 0))) __PYX_ERR(0, 290, __pyx_L1_error)
+          if (!__pyx_t_14) {
           } else {
-            __pyx_t_2 = __pyx_t_10;
-            goto __pyx_L29_bool_binop_done;
+            __pyx_t_2 = __pyx_t_14;
+            goto __pyx_L37_bool_binop_done;
           }
-          __pyx_t_10 = (__Pyx_PySet_ContainsTF(__pyx_v_edge_rev, __pyx_v_edge_set, Py_EQ)); if (unlikely((__pyx_t_10 < 0))) __PYX_ERR(0, 250, __pyx_L1_error)
-          __pyx_t_2 = __pyx_t_10;
-          __pyx_L29_bool_binop_done:;
+          __pyx_t_14 = (__Pyx_PySet_ContainsTF(__pyx_v_edge_rev, __pyx_v_edge_set, Py_EQ)); if (unlikely((__pyx_t_14 < 0))) __PYX_ERR(0, 290, __pyx_L1_error)
+          __pyx_t_2 = __pyx_t_14;
+          __pyx_L37_bool_binop_done:;
           if (__pyx_t_2) {
 
-            /* "a_star.pyx":251
+            /* "a_star.pyx":291
  * 
  *                     if edge in edge_set or edge_rev in edge_set:
  *                         prospective_seg_len = seg_len             # <<<<<<<<<<<<<<
@@ -8446,17 +9229,17 @@ static PyObject *__pyx_f_6a_star_a_star(PyObject *__pyx_v_grid_vertical, PyObjec
             __Pyx_INCREF(__pyx_v_seg_len);
             __Pyx_DECREF_SET(__pyx_v_prospective_seg_len, __pyx_v_seg_len);
 
-            /* "a_star.pyx":250
+            /* "a_star.pyx":290
  *                     edge_rev = (neighbor, current)
  * 
  *                     if edge in edge_set or edge_rev in edge_set:             # <<<<<<<<<<<<<<
  *                         prospective_seg_len = seg_len
  * 
  */
-            goto __pyx_L28;
+            goto __pyx_L36;
           }
 
-          /* "a_star.pyx":254
+          /* "a_star.pyx":294
  * 
  *                     else:
  *                         prospective_seg_len = seg_len + 1             # <<<<<<<<<<<<<<
@@ -8464,14 +9247,14 @@ static PyObject *__pyx_f_6a_star_a_star(PyObject *__pyx_v_grid_vertical, PyObjec
  *                 elif d[0] == -last_dir[0] and d[1] == -last_dir[1]:
  */
           /*else*/ {
-            __pyx_t_14 = __Pyx_PyInt_AddObjC(__pyx_v_seg_len, __pyx_int_1, 1, 0, 0); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 254, __pyx_L1_error)
-            __Pyx_GOTREF(__pyx_t_14);
-            __Pyx_DECREF_SET(__pyx_v_prospective_seg_len, __pyx_t_14);
-            __pyx_t_14 = 0;
+            __pyx_t_8 = __Pyx_PyInt_AddObjC(__pyx_v_seg_len, __pyx_int_1, 1, 0, 0); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 294, __pyx_L1_error)
+            __Pyx_GOTREF(__pyx_t_8);
+            __Pyx_DECREF_SET(__pyx_v_prospective_seg_len, __pyx_t_8);
+            __pyx_t_8 = 0;
           }
-          __pyx_L28:;
+          __pyx_L36:;
 
-          /* "a_star.pyx":255
+          /* "a_star.pyx":295
  *                     else:
  *                         prospective_seg_len = seg_len + 1
  *                     prospective_last_was_reversal = False             # <<<<<<<<<<<<<<
@@ -8480,96 +9263,105 @@ static PyObject *__pyx_f_6a_star_a_star(PyObject *__pyx_v_grid_vertical, PyObjec
  */
           __pyx_v_prospective_last_was_reversal = 0;
 
-          /* "a_star.pyx":244
+          /* "a_star.pyx":284
  *                 penalty = 0
  *             else:
  *                 if d == last_dir:             # <<<<<<<<<<<<<<
  *                     penalty = 0
  *                     prospective_last_dir = last_dir
  */
-          goto __pyx_L27;
+          goto __pyx_L35;
         }
 
-        /* "a_star.pyx":256
+        /* "a_star.pyx":296
  *                         prospective_seg_len = seg_len + 1
  *                     prospective_last_was_reversal = False
  *                 elif d[0] == -last_dir[0] and d[1] == -last_dir[1]:             # <<<<<<<<<<<<<<
  * 
  *                     if not after_goal or seg_len < minimum_segment_length:
  */
-        __pyx_t_14 = __Pyx_GetItemInt(__pyx_v_d, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 256, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_14);
-        __pyx_t_15 = __Pyx_GetItemInt(__pyx_v_last_dir, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 256, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_15);
-        __pyx_t_13 = PyNumber_Negative(__pyx_t_15); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 256, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_13);
-        __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
-        __pyx_t_15 = PyObject_RichCompare(__pyx_t_14, __pyx_t_13, Py_EQ); __Pyx_XGOTREF(__pyx_t_15); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 256, __pyx_L1_error)
-        __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
-        __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
-        __pyx_t_10 = __Pyx_PyObject_IsTrue(__pyx_t_15); if (unlikely((__pyx_t_10 < 0))) __PYX_ERR(0, 256, __pyx_L1_error)
-        __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
-        if (__pyx_t_10) {
+        __pyx_t_8 = __Pyx_GetItemInt(__pyx_v_d, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 296, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_8);
+        __pyx_t_18 = __Pyx_GetItemInt(__pyx_v_last_dir, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_18)) __PYX_ERR(0, 296, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_18);
+        __pyx_t_16 = PyNumber_Negative(__pyx_t_18); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 296, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_16);
+        __Pyx_DECREF(__pyx_t_18); __pyx_t_18 = 0;
+        __pyx_t_18 = PyObject_RichCompare(__pyx_t_8, __pyx_t_16, Py_EQ); __Pyx_XGOTREF(__pyx_t_18); if (unlikely(!__pyx_t_18)) __PYX_ERR(0, 296, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+        __Pyx_DECREF(__pyx_t_16); __pyx_t_16 = 0;
+        __pyx_t_14 = __Pyx_PyObject_IsTrue(__pyx_t_18); if (unlikely((__pyx_t_14 < 0))) __PYX_ERR(0, 296, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_18); __pyx_t_18 = 0;
+        if (__pyx_t_14) {
         } else {
-          __pyx_t_2 = __pyx_t_10;
-          goto __pyx_L31_bool_binop_done;
+          __pyx_t_2 = __pyx_t_14;
+          goto __pyx_L39_bool_binop_done;
         }
-        __pyx_t_15 = __Pyx_GetItemInt(__pyx_v_d, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 256, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_15);
-        __pyx_t_13 = __Pyx_GetItemInt(__pyx_v_last_dir, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 256, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_13);
-        __pyx_t_14 = PyNumber_Negative(__pyx_t_13); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 256, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_14);
-        __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
-        __pyx_t_13 = PyObject_RichCompare(__pyx_t_15, __pyx_t_14, Py_EQ); __Pyx_XGOTREF(__pyx_t_13); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 256, __pyx_L1_error)
-        __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
-        __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
-        __pyx_t_10 = __Pyx_PyObject_IsTrue(__pyx_t_13); if (unlikely((__pyx_t_10 < 0))) __PYX_ERR(0, 256, __pyx_L1_error)
-        __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
-        __pyx_t_2 = __pyx_t_10;
-        __pyx_L31_bool_binop_done:;
+        __pyx_t_18 = __Pyx_GetItemInt(__pyx_v_d, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_18)) __PYX_ERR(0, 296, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_18);
+        __pyx_t_16 = __Pyx_GetItemInt(__pyx_v_last_dir, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 296, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_16);
+        __pyx_t_8 = PyNumber_Negative(__pyx_t_16); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 296, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_8);
+        __Pyx_DECREF(__pyx_t_16); __pyx_t_16 = 0;
+        __pyx_t_16 = PyObject_RichCompare(__pyx_t_18, __pyx_t_8, Py_EQ); __Pyx_XGOTREF(__pyx_t_16); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 296, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_18); __pyx_t_18 = 0;
+        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+        __pyx_t_14 = __Pyx_PyObject_IsTrue(__pyx_t_16); if (unlikely((__pyx_t_14 < 0))) __PYX_ERR(0, 296, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_16); __pyx_t_16 = 0;
+        __pyx_t_2 = __pyx_t_14;
+        __pyx_L39_bool_binop_done:;
         if (__pyx_t_2) {
 
-          /* "a_star.pyx":258
+          /* "a_star.pyx":298
  *                 elif d[0] == -last_dir[0] and d[1] == -last_dir[1]:
  * 
  *                     if not after_goal or seg_len < minimum_segment_length:             # <<<<<<<<<<<<<<
+ *                         segment_length_prunes += 1
  *                         continue
- * 
  */
-          __pyx_t_10 = __Pyx_PyObject_IsTrue(__pyx_v_after_goal); if (unlikely((__pyx_t_10 < 0))) __PYX_ERR(0, 258, __pyx_L1_error)
-          __pyx_t_19 = (!__pyx_t_10);
-          if (!__pyx_t_19) {
+          __pyx_t_14 = __Pyx_PyObject_IsTrue(__pyx_v_after_goal); if (unlikely((__pyx_t_14 < 0))) __PYX_ERR(0, 298, __pyx_L1_error)
+          __pyx_t_22 = (!__pyx_t_14);
+          if (!__pyx_t_22) {
           } else {
-            __pyx_t_2 = __pyx_t_19;
-            goto __pyx_L34_bool_binop_done;
+            __pyx_t_2 = __pyx_t_22;
+            goto __pyx_L42_bool_binop_done;
           }
-          __pyx_t_13 = PyObject_RichCompare(__pyx_v_seg_len, __pyx_v_minimum_segment_length, Py_LT); __Pyx_XGOTREF(__pyx_t_13); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 258, __pyx_L1_error)
-          __pyx_t_19 = __Pyx_PyObject_IsTrue(__pyx_t_13); if (unlikely((__pyx_t_19 < 0))) __PYX_ERR(0, 258, __pyx_L1_error)
-          __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
-          __pyx_t_2 = __pyx_t_19;
-          __pyx_L34_bool_binop_done:;
+          __pyx_t_16 = PyObject_RichCompare(__pyx_v_seg_len, __pyx_v_minimum_segment_length, Py_LT); __Pyx_XGOTREF(__pyx_t_16); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 298, __pyx_L1_error)
+          __pyx_t_22 = __Pyx_PyObject_IsTrue(__pyx_t_16); if (unlikely((__pyx_t_22 < 0))) __PYX_ERR(0, 298, __pyx_L1_error)
+          __Pyx_DECREF(__pyx_t_16); __pyx_t_16 = 0;
+          __pyx_t_2 = __pyx_t_22;
+          __pyx_L42_bool_binop_done:;
           if (__pyx_t_2) {
 
-            /* "a_star.pyx":259
+            /* "a_star.pyx":299
+ * 
+ *                     if not after_goal or seg_len < minimum_segment_length:
+ *                         segment_length_prunes += 1             # <<<<<<<<<<<<<<
+ *                         continue
  * 
+ */
+            __pyx_v_segment_length_prunes = (__pyx_v_segment_length_prunes + 1);
+
+            /* "a_star.pyx":300
  *                     if not after_goal or seg_len < minimum_segment_length:
+ *                         segment_length_prunes += 1
  *                         continue             # <<<<<<<<<<<<<<
  * 
  * 
  */
-            goto __pyx_L19_continue;
+            goto __pyx_L27_continue;
 
-            /* "a_star.pyx":258
+            /* "a_star.pyx":298
  *                 elif d[0] == -last_dir[0] and d[1] == -last_dir[1]:
  * 
  *                     if not after_goal or seg_len < minimum_segment_length:             # <<<<<<<<<<<<<<
+ *                         segment_length_prunes += 1
  *                         continue
- * 
  */
           }
 
-          /* "a_star.pyx":265
+          /* "a_star.pyx":306
  *                     # if last_was_reversal and len(path) >= 2 and neighbor == path[-2]:
  *                     #     continue
  *                     prospective_last_dir = d             # <<<<<<<<<<<<<<
@@ -8579,7 +9371,7 @@ static PyObject *__pyx_f_6a_star_a_star(PyObject *__pyx_v_grid_vertical, PyObjec
           __Pyx_INCREF(__pyx_v_d);
           __Pyx_DECREF_SET(__pyx_v_prospective_last_dir, __pyx_v_d);
 
-          /* "a_star.pyx":266
+          /* "a_star.pyx":307
  *                     #     continue
  *                     prospective_last_dir = d
  *                     prospective_seg_len = 1             # <<<<<<<<<<<<<<
@@ -8589,7 +9381,7 @@ static PyObject *__pyx_f_6a_star_a_star(PyObject *__pyx_v_grid_vertical, PyObjec
           __Pyx_INCREF(__pyx_int_1);
           __Pyx_DECREF_SET(__pyx_v_prospective_seg_len, __pyx_int_1);
 
-          /* "a_star.pyx":267
+          /* "a_star.pyx":308
  *                     prospective_last_dir = d
  *                     prospective_seg_len = 1
  *                     prospective_last_was_reversal = True             # <<<<<<<<<<<<<<
@@ -8598,7 +9390,7 @@ static PyObject *__pyx_f_6a_star_a_star(PyObject *__pyx_v_grid_vertical, PyObjec
  */
           __pyx_v_prospective_last_was_reversal = 1;
 
-          /* "a_star.pyx":268
+          /* "a_star.pyx":309
  *                     prospective_seg_len = 1
  *                     prospective_last_was_reversal = True
  *                     penalty  = 1             # <<<<<<<<<<<<<<
@@ -8608,48 +9400,57 @@ static PyObject *__pyx_f_6a_star_a_star(PyObject *__pyx_v_grid_vertical, PyObjec
           __Pyx_INCREF(__pyx_int_1);
           __Pyx_XDECREF_SET(__pyx_v_penalty, __pyx_int_1);
 
-          /* "a_star.pyx":256
+          /* "a_star.pyx":296
  *                         prospective_seg_len = seg_len + 1
  *                     prospective_last_was_reversal = False
  *                 elif d[0] == -last_dir[0] and d[1] == -last_dir[1]:             # <<<<<<<<<<<<<<
  * 
  *                     if not after_goal or seg_len < minimum_segment_length:
  */
-          goto __pyx_L27;
+          goto __pyx_L35;
         }
 
-        /* "a_star.pyx":271
+        /* "a_star.pyx":312
  *                 else:
  * 
  *                     if seg_len < minimum_segment_length:             # <<<<<<<<<<<<<<
+ *                         segment_length_prunes += 1
  *                         continue
- * 
  */
         /*else*/ {
-          __pyx_t_13 = PyObject_RichCompare(__pyx_v_seg_len, __pyx_v_minimum_segment_length, Py_LT); __Pyx_XGOTREF(__pyx_t_13); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 271, __pyx_L1_error)
-          __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_13); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(0, 271, __pyx_L1_error)
-          __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+          __pyx_t_16 = PyObject_RichCompare(__pyx_v_seg_len, __pyx_v_minimum_segment_length, Py_LT); __Pyx_XGOTREF(__pyx_t_16); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 312, __pyx_L1_error)
+          __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_16); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(0, 312, __pyx_L1_error)
+          __Pyx_DECREF(__pyx_t_16); __pyx_t_16 = 0;
           if (__pyx_t_2) {
 
-            /* "a_star.pyx":272
+            /* "a_star.pyx":313
+ * 
+ *                     if seg_len < minimum_segment_length:
+ *                         segment_length_prunes += 1             # <<<<<<<<<<<<<<
+ *                         continue
  * 
+ */
+            __pyx_v_segment_length_prunes = (__pyx_v_segment_length_prunes + 1);
+
+            /* "a_star.pyx":314
  *                     if seg_len < minimum_segment_length:
+ *                         segment_length_prunes += 1
  *                         continue             # <<<<<<<<<<<<<<
  * 
  *                     prospective_last_dir = d
  */
-            goto __pyx_L19_continue;
+            goto __pyx_L27_continue;
 
-            /* "a_star.pyx":271
+            /* "a_star.pyx":312
  *                 else:
  * 
  *                     if seg_len < minimum_segment_length:             # <<<<<<<<<<<<<<
+ *                         segment_length_prunes += 1
  *                         continue
- * 
  */
           }
 
-          /* "a_star.pyx":274
+          /* "a_star.pyx":316
  *                         continue
  * 
  *                     prospective_last_dir = d             # <<<<<<<<<<<<<<
@@ -8659,7 +9460,7 @@ static PyObject *__pyx_f_6a_star_a_star(PyObject *__pyx_v_grid_vertical, PyObjec
           __Pyx_INCREF(__pyx_v_d);
           __Pyx_DECREF_SET(__pyx_v_prospective_last_dir, __pyx_v_d);
 
-          /* "a_star.pyx":275
+          /* "a_star.pyx":317
  * 
  *                     prospective_last_dir = d
  *                     prospective_seg_len = 1             # <<<<<<<<<<<<<<
@@ -8669,7 +9470,7 @@ static PyObject *__pyx_f_6a_star_a_star(PyObject *__pyx_v_grid_vertical, PyObjec
           __Pyx_INCREF(__pyx_int_1);
           __Pyx_DECREF_SET(__pyx_v_prospective_seg_len, __pyx_int_1);
 
-          /* "a_star.pyx":276
+          /* "a_star.pyx":318
  *                     prospective_last_dir = d
  *                     prospective_seg_len = 1
  *                     prospective_last_was_reversal = False             # <<<<<<<<<<<<<<
@@ -8678,7 +9479,7 @@ static PyObject *__pyx_f_6a_star_a_star(PyObject *__pyx_v_grid_vertical, PyObjec
  */
           __pyx_v_prospective_last_was_reversal = 0;
 
-          /* "a_star.pyx":277
+          /* "a_star.pyx":319
  *                     prospective_seg_len = 1
  *                     prospective_last_was_reversal = False
  *                     penalty = 1             # <<<<<<<<<<<<<<
@@ -8688,52 +9489,70 @@ static PyObject *__pyx_f_6a_star_a_star(PyObject *__pyx_v_grid_vertical, PyObjec
           __Pyx_INCREF(__pyx_int_1);
           __Pyx_XDECREF_SET(__pyx_v_penalty, __pyx_int_1);
         }
-        __pyx_L27:;
+        __pyx_L35:;
       }
-      __pyx_L26:;
+      __pyx_L34:;
 
-      /* "a_star.pyx":280
+      /* "a_star.pyx":322
  * 
  * 
  *             if neighbor in goal_indices:             # <<<<<<<<<<<<<<
  *                 if prospective_seg_len < minimum_segment_length:
- *                     continue
+ *                     segment_length_prunes += 1
  */
-      __pyx_t_2 = (__Pyx_PyDict_ContainsTF(__pyx_v_neighbor, __pyx_v_goal_indices, Py_EQ)); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(0, 280, __pyx_L1_error)
+      __pyx_t_2 = (__Pyx_PyDict_ContainsTF(__pyx_v_neighbor, __pyx_v_goal_indices, Py_EQ)); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(0, 322, __pyx_L1_error)
       if (__pyx_t_2) {
 
-        /* "a_star.pyx":281
+        /* "a_star.pyx":323
  * 
  *             if neighbor in goal_indices:
  *                 if prospective_seg_len < minimum_segment_length:             # <<<<<<<<<<<<<<
- *                     continue
- *                 prospective_seg_len = 0
+ *                     segment_length_prunes += 1
+ *                     goal_segment_length_prunes += 1
  */
-        __pyx_t_13 = PyObject_RichCompare(__pyx_v_prospective_seg_len, __pyx_v_minimum_segment_length, Py_LT); __Pyx_XGOTREF(__pyx_t_13); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 281, __pyx_L1_error)
-        __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_13); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(0, 281, __pyx_L1_error)
-        __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+        __pyx_t_16 = PyObject_RichCompare(__pyx_v_prospective_seg_len, __pyx_v_minimum_segment_length, Py_LT); __Pyx_XGOTREF(__pyx_t_16); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 323, __pyx_L1_error)
+        __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_16); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(0, 323, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_16); __pyx_t_16 = 0;
         if (__pyx_t_2) {
 
-          /* "a_star.pyx":282
+          /* "a_star.pyx":324
  *             if neighbor in goal_indices:
  *                 if prospective_seg_len < minimum_segment_length:
+ *                     segment_length_prunes += 1             # <<<<<<<<<<<<<<
+ *                     goal_segment_length_prunes += 1
+ *                     continue
+ */
+          __pyx_v_segment_length_prunes = (__pyx_v_segment_length_prunes + 1);
+
+          /* "a_star.pyx":325
+ *                 if prospective_seg_len < minimum_segment_length:
+ *                     segment_length_prunes += 1
+ *                     goal_segment_length_prunes += 1             # <<<<<<<<<<<<<<
+ *                     continue
+ *                 prospective_seg_len = 0
+ */
+          __pyx_v_goal_segment_length_prunes = (__pyx_v_goal_segment_length_prunes + 1);
+
+          /* "a_star.pyx":326
+ *                     segment_length_prunes += 1
+ *                     goal_segment_length_prunes += 1
  *                     continue             # <<<<<<<<<<<<<<
  *                 prospective_seg_len = 0
  *                 prospective_last_dir = None
  */
-          goto __pyx_L19_continue;
+          goto __pyx_L27_continue;
 
-          /* "a_star.pyx":281
+          /* "a_star.pyx":323
  * 
  *             if neighbor in goal_indices:
  *                 if prospective_seg_len < minimum_segment_length:             # <<<<<<<<<<<<<<
- *                     continue
- *                 prospective_seg_len = 0
+ *                     segment_length_prunes += 1
+ *                     goal_segment_length_prunes += 1
  */
         }
 
-        /* "a_star.pyx":283
- *                 if prospective_seg_len < minimum_segment_length:
+        /* "a_star.pyx":327
+ *                     goal_segment_length_prunes += 1
  *                     continue
  *                 prospective_seg_len = 0             # <<<<<<<<<<<<<<
  *                 prospective_last_dir = None
@@ -8742,7 +9561,7 @@ static PyObject *__pyx_f_6a_star_a_star(PyObject *__pyx_v_grid_vertical, PyObjec
         __Pyx_INCREF(__pyx_int_0);
         __Pyx_DECREF_SET(__pyx_v_prospective_seg_len, __pyx_int_0);
 
-        /* "a_star.pyx":284
+        /* "a_star.pyx":328
  *                     continue
  *                 prospective_seg_len = 0
  *                 prospective_last_dir = None             # <<<<<<<<<<<<<<
@@ -8752,16 +9571,16 @@ static PyObject *__pyx_f_6a_star_a_star(PyObject *__pyx_v_grid_vertical, PyObjec
         __Pyx_INCREF(Py_None);
         __Pyx_DECREF_SET(__pyx_v_prospective_last_dir, Py_None);
 
-        /* "a_star.pyx":280
+        /* "a_star.pyx":322
  * 
  * 
  *             if neighbor in goal_indices:             # <<<<<<<<<<<<<<
  *                 if prospective_seg_len < minimum_segment_length:
- *                     continue
+ *                     segment_length_prunes += 1
  */
       }
 
-      /* "a_star.pyx":287
+      /* "a_star.pyx":331
  * 
  * 
  *             new_mask = mask             # <<<<<<<<<<<<<<
@@ -8771,7 +9590,7 @@ static PyObject *__pyx_f_6a_star_a_star(PyObject *__pyx_v_grid_vertical, PyObjec
       __Pyx_INCREF(__pyx_v_mask);
       __Pyx_XDECREF_SET(__pyx_v_new_mask, __pyx_v_mask);
 
-      /* "a_star.pyx":288
+      /* "a_star.pyx":332
  * 
  *             new_mask = mask
  *             new_after_goal = after_goal             # <<<<<<<<<<<<<<
@@ -8781,35 +9600,35 @@ static PyObject *__pyx_f_6a_star_a_star(PyObject *__pyx_v_grid_vertical, PyObjec
       __Pyx_INCREF(__pyx_v_after_goal);
       __Pyx_XDECREF_SET(__pyx_v_new_after_goal, __pyx_v_after_goal);
 
-      /* "a_star.pyx":289
+      /* "a_star.pyx":333
  *             new_mask = mask
  *             new_after_goal = after_goal
  *             if neighbor in goal_indices:             # <<<<<<<<<<<<<<
  *                 new_mask |= (1 << goal_indices[neighbor])
  *                 new_after_goal = True
  */
-      __pyx_t_2 = (__Pyx_PyDict_ContainsTF(__pyx_v_neighbor, __pyx_v_goal_indices, Py_EQ)); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(0, 289, __pyx_L1_error)
+      __pyx_t_2 = (__Pyx_PyDict_ContainsTF(__pyx_v_neighbor, __pyx_v_goal_indices, Py_EQ)); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(0, 333, __pyx_L1_error)
       if (__pyx_t_2) {
 
-        /* "a_star.pyx":290
+        /* "a_star.pyx":334
  *             new_after_goal = after_goal
  *             if neighbor in goal_indices:
  *                 new_mask |= (1 << goal_indices[neighbor])             # <<<<<<<<<<<<<<
  *                 new_after_goal = True
  * 
  */
-        __pyx_t_13 = __Pyx_PyDict_GetItem(__pyx_v_goal_indices, __pyx_v_neighbor); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 290, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_13);
-        __pyx_t_14 = PyNumber_Lshift(__pyx_int_1, __pyx_t_13); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 290, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_14);
-        __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
-        __pyx_t_13 = PyNumber_InPlaceOr(__pyx_v_new_mask, __pyx_t_14); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 290, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_13);
-        __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
-        __Pyx_DECREF_SET(__pyx_v_new_mask, __pyx_t_13);
-        __pyx_t_13 = 0;
+        __pyx_t_16 = __Pyx_PyDict_GetItem(__pyx_v_goal_indices, __pyx_v_neighbor); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 334, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_16);
+        __pyx_t_8 = PyNumber_Lshift(__pyx_int_1, __pyx_t_16); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 334, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_8);
+        __Pyx_DECREF(__pyx_t_16); __pyx_t_16 = 0;
+        __pyx_t_16 = PyNumber_InPlaceOr(__pyx_v_new_mask, __pyx_t_8); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 334, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_16);
+        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+        __Pyx_DECREF_SET(__pyx_v_new_mask, __pyx_t_16);
+        __pyx_t_16 = 0;
 
-        /* "a_star.pyx":291
+        /* "a_star.pyx":335
  *             if neighbor in goal_indices:
  *                 new_mask |= (1 << goal_indices[neighbor])
  *                 new_after_goal = True             # <<<<<<<<<<<<<<
@@ -8819,7 +9638,7 @@ static PyObject *__pyx_f_6a_star_a_star(PyObject *__pyx_v_grid_vertical, PyObjec
         __Pyx_INCREF(Py_True);
         __Pyx_DECREF_SET(__pyx_v_new_after_goal, Py_True);
 
-        /* "a_star.pyx":289
+        /* "a_star.pyx":333
  *             new_mask = mask
  *             new_after_goal = after_goal
  *             if neighbor in goal_indices:             # <<<<<<<<<<<<<<
@@ -8828,193 +9647,598 @@ static PyObject *__pyx_f_6a_star_a_star(PyObject *__pyx_v_grid_vertical, PyObjec
  */
       }
 
-      /* "a_star.pyx":295
+      /* "a_star.pyx":339
  * 
  * 
  *             edge = (current, neighbor)             # <<<<<<<<<<<<<<
  *             edge_rev = (neighbor, current)
  *             cost_increment = 0 if (edge in edge_set or edge_rev in edge_set) else 1
  */
-      __pyx_t_13 = PyTuple_New(2); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 295, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_13);
+      __pyx_t_16 = PyTuple_New(2); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 339, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_16);
       __Pyx_INCREF(__pyx_v_current);
       __Pyx_GIVEREF(__pyx_v_current);
-      if (__Pyx_PyTuple_SET_ITEM(__pyx_t_13, 0, __pyx_v_current)) __PYX_ERR(0, 295, __pyx_L1_error);
+      if (__Pyx_PyTuple_SET_ITEM(__pyx_t_16, 0, __pyx_v_current)) __PYX_ERR(0, 339, __pyx_L1_error);
       __Pyx_INCREF(__pyx_v_neighbor);
       __Pyx_GIVEREF(__pyx_v_neighbor);
-      if (__Pyx_PyTuple_SET_ITEM(__pyx_t_13, 1, __pyx_v_neighbor)) __PYX_ERR(0, 295, __pyx_L1_error);
-      __Pyx_XDECREF_SET(__pyx_v_edge, ((PyObject*)__pyx_t_13));
-      __pyx_t_13 = 0;
+      if (__Pyx_PyTuple_SET_ITEM(__pyx_t_16, 1, __pyx_v_neighbor)) __PYX_ERR(0, 339, __pyx_L1_error);
+      __Pyx_XDECREF_SET(__pyx_v_edge, ((PyObject*)__pyx_t_16));
+      __pyx_t_16 = 0;
 
-      /* "a_star.pyx":296
+      /* "a_star.pyx":340
  * 
  *             edge = (current, neighbor)
  *             edge_rev = (neighbor, current)             # <<<<<<<<<<<<<<
  *             cost_increment = 0 if (edge in edge_set or edge_rev in edge_set) else 1
  * 
  */
-      __pyx_t_13 = PyTuple_New(2); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 296, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_13);
+      __pyx_t_16 = PyTuple_New(2); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 340, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_16);
       __Pyx_INCREF(__pyx_v_neighbor);
       __Pyx_GIVEREF(__pyx_v_neighbor);
-      if (__Pyx_PyTuple_SET_ITEM(__pyx_t_13, 0, __pyx_v_neighbor)) __PYX_ERR(0, 296, __pyx_L1_error);
+      if (__Pyx_PyTuple_SET_ITEM(__pyx_t_16, 0, __pyx_v_neighbor)) __PYX_ERR(0, 340, __pyx_L1_error);
       __Pyx_INCREF(__pyx_v_current);
       __Pyx_GIVEREF(__pyx_v_current);
-      if (__Pyx_PyTuple_SET_ITEM(__pyx_t_13, 1, __pyx_v_current)) __PYX_ERR(0, 296, __pyx_L1_error);
-      __Pyx_XDECREF_SET(__pyx_v_edge_rev, ((PyObject*)__pyx_t_13));
-      __pyx_t_13 = 0;
+      if (__Pyx_PyTuple_SET_ITEM(__pyx_t_16, 1, __pyx_v_current)) __PYX_ERR(0, 340, __pyx_L1_error);
+      __Pyx_XDECREF_SET(__pyx_v_edge_rev, ((PyObject*)__pyx_t_16));
+      __pyx_t_16 = 0;
 
-      /* "a_star.pyx":297
+      /* "a_star.pyx":341
  *             edge = (current, neighbor)
  *             edge_rev = (neighbor, current)
  *             cost_increment = 0 if (edge in edge_set or edge_rev in edge_set) else 1             # <<<<<<<<<<<<<<
  * 
  *             new_g = g + cost_increment + penalty
  */
-      __pyx_t_19 = (__Pyx_PySet_ContainsTF(__pyx_v_edge, __pyx_v_edge_set, Py_EQ)); if (unlikely((__pyx_t_19 < 0))) __PYX_ERR(0, 297, __pyx_L1_error)
-      if (!__pyx_t_19) {
+      __pyx_t_22 = (__Pyx_PySet_ContainsTF(__pyx_v_edge, __pyx_v_edge_set, Py_EQ)); if (unlikely((__pyx_t_22 < 0))) __PYX_ERR(0, 341, __pyx_L1_error)
+      if (!__pyx_t_22) {
       } else {
-        __pyx_t_2 = __pyx_t_19;
-        goto __pyx_L40_bool_binop_done;
+        __pyx_t_2 = __pyx_t_22;
+        goto __pyx_L48_bool_binop_done;
       }
-      __pyx_t_19 = (__Pyx_PySet_ContainsTF(__pyx_v_edge_rev, __pyx_v_edge_set, Py_EQ)); if (unlikely((__pyx_t_19 < 0))) __PYX_ERR(0, 297, __pyx_L1_error)
-      __pyx_t_2 = __pyx_t_19;
-      __pyx_L40_bool_binop_done:;
+      __pyx_t_22 = (__Pyx_PySet_ContainsTF(__pyx_v_edge_rev, __pyx_v_edge_set, Py_EQ)); if (unlikely((__pyx_t_22 < 0))) __PYX_ERR(0, 341, __pyx_L1_error)
+      __pyx_t_2 = __pyx_t_22;
+      __pyx_L48_bool_binop_done:;
       if (__pyx_t_2) {
         __Pyx_INCREF(__pyx_int_0);
-        __pyx_t_13 = __pyx_int_0;
+        __pyx_t_16 = __pyx_int_0;
       } else {
         __Pyx_INCREF(__pyx_int_1);
-        __pyx_t_13 = __pyx_int_1;
+        __pyx_t_16 = __pyx_int_1;
       }
-      __Pyx_XDECREF_SET(__pyx_v_cost_increment, __pyx_t_13);
-      __pyx_t_13 = 0;
+      __Pyx_XDECREF_SET(__pyx_v_cost_increment, __pyx_t_16);
+      __pyx_t_16 = 0;
 
-      /* "a_star.pyx":299
+      /* "a_star.pyx":343
  *             cost_increment = 0 if (edge in edge_set or edge_rev in edge_set) else 1
  * 
  *             new_g = g + cost_increment + penalty             # <<<<<<<<<<<<<<
  *             new_f = new_g + _heuristic(neighbor, new_mask, goal_nodes)
  *             open_set.push(
  */
-      __pyx_t_13 = PyNumber_Add(__pyx_v_g, __pyx_v_cost_increment); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 299, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_13);
-      __pyx_t_14 = PyNumber_Add(__pyx_t_13, __pyx_v_penalty); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 299, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_14);
-      __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
-      __Pyx_XDECREF_SET(__pyx_v_new_g, __pyx_t_14);
-      __pyx_t_14 = 0;
+      __pyx_t_16 = PyNumber_Add(__pyx_v_g, __pyx_v_cost_increment); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 343, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_16);
+      __pyx_t_8 = PyNumber_Add(__pyx_t_16, __pyx_v_penalty); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 343, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      __Pyx_DECREF(__pyx_t_16); __pyx_t_16 = 0;
+      __Pyx_XDECREF_SET(__pyx_v_new_g, __pyx_t_8);
+      __pyx_t_8 = 0;
 
-      /* "a_star.pyx":300
+      /* "a_star.pyx":344
  * 
  *             new_g = g + cost_increment + penalty
  *             new_f = new_g + _heuristic(neighbor, new_mask, goal_nodes)             # <<<<<<<<<<<<<<
  *             open_set.push(
  *                 (new_g, neighbor, new_mask, path + [neighbor],
  */
-      __pyx_t_14 = __pyx_f_6a_star__heuristic(__pyx_v_neighbor, __pyx_v_new_mask, __pyx_v_goal_nodes); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 300, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_14);
-      __pyx_t_13 = PyNumber_Add(__pyx_v_new_g, __pyx_t_14); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 300, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_13);
-      __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
-      __Pyx_XDECREF_SET(__pyx_v_new_f, __pyx_t_13);
-      __pyx_t_13 = 0;
+      __pyx_t_8 = __pyx_f_6a_star__heuristic(__pyx_v_neighbor, __pyx_v_new_mask, __pyx_v_goal_nodes); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 344, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      __pyx_t_16 = PyNumber_Add(__pyx_v_new_g, __pyx_t_8); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 344, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_16);
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+      __Pyx_XDECREF_SET(__pyx_v_new_f, __pyx_t_16);
+      __pyx_t_16 = 0;
 
-      /* "a_star.pyx":302
+      /* "a_star.pyx":346
  *             new_f = new_g + _heuristic(neighbor, new_mask, goal_nodes)
  *             open_set.push(
  *                 (new_g, neighbor, new_mask, path + [neighbor],             # <<<<<<<<<<<<<<
  *                  prospective_last_dir, prospective_seg_len, new_after_goal, prospective_last_was_reversal),
  *                 new_f
  */
-      __pyx_t_13 = PyList_New(1); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 302, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_13);
+      __pyx_t_16 = PyList_New(1); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 346, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_16);
       __Pyx_INCREF(__pyx_v_neighbor);
       __Pyx_GIVEREF(__pyx_v_neighbor);
-      if (__Pyx_PyList_SET_ITEM(__pyx_t_13, 0, __pyx_v_neighbor)) __PYX_ERR(0, 302, __pyx_L1_error);
-      __pyx_t_14 = PyNumber_Add(__pyx_v_path, __pyx_t_13); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 302, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_14);
-      __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+      if (__Pyx_PyList_SET_ITEM(__pyx_t_16, 0, __pyx_v_neighbor)) __PYX_ERR(0, 346, __pyx_L1_error);
+      __pyx_t_8 = PyNumber_Add(__pyx_v_path, __pyx_t_16); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 346, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      __Pyx_DECREF(__pyx_t_16); __pyx_t_16 = 0;
 
-      /* "a_star.pyx":303
+      /* "a_star.pyx":347
  *             open_set.push(
  *                 (new_g, neighbor, new_mask, path + [neighbor],
  *                  prospective_last_dir, prospective_seg_len, new_after_goal, prospective_last_was_reversal),             # <<<<<<<<<<<<<<
  *                 new_f
  *             )
  */
-      __pyx_t_13 = __Pyx_PyBool_FromLong(__pyx_v_prospective_last_was_reversal); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 303, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_13);
+      __pyx_t_16 = __Pyx_PyBool_FromLong(__pyx_v_prospective_last_was_reversal); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 347, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_16);
 
-      /* "a_star.pyx":302
+      /* "a_star.pyx":346
  *             new_f = new_g + _heuristic(neighbor, new_mask, goal_nodes)
  *             open_set.push(
  *                 (new_g, neighbor, new_mask, path + [neighbor],             # <<<<<<<<<<<<<<
  *                  prospective_last_dir, prospective_seg_len, new_after_goal, prospective_last_was_reversal),
  *                 new_f
  */
-      __pyx_t_15 = PyTuple_New(8); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 302, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_15);
+      __pyx_t_18 = PyTuple_New(8); if (unlikely(!__pyx_t_18)) __PYX_ERR(0, 346, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_18);
       __Pyx_INCREF(__pyx_v_new_g);
       __Pyx_GIVEREF(__pyx_v_new_g);
-      if (__Pyx_PyTuple_SET_ITEM(__pyx_t_15, 0, __pyx_v_new_g)) __PYX_ERR(0, 302, __pyx_L1_error);
+      if (__Pyx_PyTuple_SET_ITEM(__pyx_t_18, 0, __pyx_v_new_g)) __PYX_ERR(0, 346, __pyx_L1_error);
       __Pyx_INCREF(__pyx_v_neighbor);
       __Pyx_GIVEREF(__pyx_v_neighbor);
-      if (__Pyx_PyTuple_SET_ITEM(__pyx_t_15, 1, __pyx_v_neighbor)) __PYX_ERR(0, 302, __pyx_L1_error);
+      if (__Pyx_PyTuple_SET_ITEM(__pyx_t_18, 1, __pyx_v_neighbor)) __PYX_ERR(0, 346, __pyx_L1_error);
       __Pyx_INCREF(__pyx_v_new_mask);
       __Pyx_GIVEREF(__pyx_v_new_mask);
-      if (__Pyx_PyTuple_SET_ITEM(__pyx_t_15, 2, __pyx_v_new_mask)) __PYX_ERR(0, 302, __pyx_L1_error);
-      __Pyx_GIVEREF(__pyx_t_14);
-      if (__Pyx_PyTuple_SET_ITEM(__pyx_t_15, 3, __pyx_t_14)) __PYX_ERR(0, 302, __pyx_L1_error);
+      if (__Pyx_PyTuple_SET_ITEM(__pyx_t_18, 2, __pyx_v_new_mask)) __PYX_ERR(0, 346, __pyx_L1_error);
+      __Pyx_GIVEREF(__pyx_t_8);
+      if (__Pyx_PyTuple_SET_ITEM(__pyx_t_18, 3, __pyx_t_8)) __PYX_ERR(0, 346, __pyx_L1_error);
       __Pyx_INCREF(__pyx_v_prospective_last_dir);
       __Pyx_GIVEREF(__pyx_v_prospective_last_dir);
-      if (__Pyx_PyTuple_SET_ITEM(__pyx_t_15, 4, __pyx_v_prospective_last_dir)) __PYX_ERR(0, 302, __pyx_L1_error);
+      if (__Pyx_PyTuple_SET_ITEM(__pyx_t_18, 4, __pyx_v_prospective_last_dir)) __PYX_ERR(0, 346, __pyx_L1_error);
       __Pyx_INCREF(__pyx_v_prospective_seg_len);
       __Pyx_GIVEREF(__pyx_v_prospective_seg_len);
-      if (__Pyx_PyTuple_SET_ITEM(__pyx_t_15, 5, __pyx_v_prospective_seg_len)) __PYX_ERR(0, 302, __pyx_L1_error);
+      if (__Pyx_PyTuple_SET_ITEM(__pyx_t_18, 5, __pyx_v_prospective_seg_len)) __PYX_ERR(0, 346, __pyx_L1_error);
       __Pyx_INCREF(__pyx_v_new_after_goal);
       __Pyx_GIVEREF(__pyx_v_new_after_goal);
-      if (__Pyx_PyTuple_SET_ITEM(__pyx_t_15, 6, __pyx_v_new_after_goal)) __PYX_ERR(0, 302, __pyx_L1_error);
-      __Pyx_GIVEREF(__pyx_t_13);
-      if (__Pyx_PyTuple_SET_ITEM(__pyx_t_15, 7, __pyx_t_13)) __PYX_ERR(0, 302, __pyx_L1_error);
-      __pyx_t_14 = 0;
-      __pyx_t_13 = 0;
+      if (__Pyx_PyTuple_SET_ITEM(__pyx_t_18, 6, __pyx_v_new_after_goal)) __PYX_ERR(0, 346, __pyx_L1_error);
+      __Pyx_GIVEREF(__pyx_t_16);
+      if (__Pyx_PyTuple_SET_ITEM(__pyx_t_18, 7, __pyx_t_16)) __PYX_ERR(0, 346, __pyx_L1_error);
+      __pyx_t_8 = 0;
+      __pyx_t_16 = 0;
 
-      /* "a_star.pyx":304
+      /* "a_star.pyx":348
  *                 (new_g, neighbor, new_mask, path + [neighbor],
  *                  prospective_last_dir, prospective_seg_len, new_after_goal, prospective_last_was_reversal),
  *                 new_f             # <<<<<<<<<<<<<<
  *             )
- * 
+ *             nodes_generated += 1
  */
-      __pyx_t_9 = __pyx_PyFloat_AsDouble(__pyx_v_new_f); if (unlikely((__pyx_t_9 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 304, __pyx_L1_error)
+      __pyx_t_9 = __pyx_PyFloat_AsDouble(__pyx_v_new_f); if (unlikely((__pyx_t_9 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 348, __pyx_L1_error)
 
-      /* "a_star.pyx":301
+      /* "a_star.pyx":345
  *             new_g = g + cost_increment + penalty
  *             new_f = new_g + _heuristic(neighbor, new_mask, goal_nodes)
  *             open_set.push(             # <<<<<<<<<<<<<<
  *                 (new_g, neighbor, new_mask, path + [neighbor],
  *                  prospective_last_dir, prospective_seg_len, new_after_goal, prospective_last_was_reversal),
  */
-      ((struct __pyx_vtabstruct_6a_star_PriorityQueue *)__pyx_v_open_set->__pyx_vtab)->push(__pyx_v_open_set, __pyx_t_15, __pyx_t_9); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 301, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
+      ((struct __pyx_vtabstruct_6a_star_PriorityQueue *)__pyx_v_open_set->__pyx_vtab)->push(__pyx_v_open_set, __pyx_t_18, __pyx_t_9); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 345, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_18); __pyx_t_18 = 0;
+
+      /* "a_star.pyx":350
+ *                 new_f
+ *             )
+ *             nodes_generated += 1             # <<<<<<<<<<<<<<
+ * 
+ *         if open_set.size() > max_open_set:
+ */
+      __pyx_v_nodes_generated = (__pyx_v_nodes_generated + 1);
 
-      /* "a_star.pyx":227
+      /* "a_star.pyx":267
  *         edge_set = set(zip(path, path[1:]))
  * 
  *         for d in directions:             # <<<<<<<<<<<<<<
  *             dx, dy = d
  *             neighbor = (x + dx, y + dy)
  */
-      __pyx_L19_continue:;
+      __pyx_L27_continue:;
+    }
+    __Pyx_DECREF(__pyx_t_17); __pyx_t_17 = 0;
+
+    /* "a_star.pyx":352
+ *             nodes_generated += 1
+ * 
+ *         if open_set.size() > max_open_set:             # <<<<<<<<<<<<<<
+ *             max_open_set = open_set.size()
+ *             if open_set_limit and max_open_set > open_set_limit:
+ */
+    __pyx_t_23 = ((struct __pyx_vtabstruct_6a_star_PriorityQueue *)__pyx_v_open_set->__pyx_vtab)->size(__pyx_v_open_set); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 352, __pyx_L1_error)
+    __pyx_t_2 = (__pyx_t_23 > __pyx_v_max_open_set);
+    if (__pyx_t_2) {
+
+      /* "a_star.pyx":353
+ * 
+ *         if open_set.size() > max_open_set:
+ *             max_open_set = open_set.size()             # <<<<<<<<<<<<<<
+ *             if open_set_limit and max_open_set > open_set_limit:
+ *                 limit = LIMIT_OPEN_SET
+ */
+      __pyx_t_23 = ((struct __pyx_vtabstruct_6a_star_PriorityQueue *)__pyx_v_open_set->__pyx_vtab)->size(__pyx_v_open_set); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 353, __pyx_L1_error)
+      __pyx_v_max_open_set = __pyx_t_23;
+
+      /* "a_star.pyx":354
+ *         if open_set.size() > max_open_set:
+ *             max_open_set = open_set.size()
+ *             if open_set_limit and max_open_set > open_set_limit:             # <<<<<<<<<<<<<<
+ *                 limit = LIMIT_OPEN_SET
+ *                 break
+ */
+      __pyx_t_22 = (__pyx_v_open_set_limit != 0);
+      if (__pyx_t_22) {
+      } else {
+        __pyx_t_2 = __pyx_t_22;
+        goto __pyx_L53_bool_binop_done;
+      }
+      __pyx_t_22 = (__pyx_v_max_open_set > __pyx_v_open_set_limit);
+      __pyx_t_2 = __pyx_t_22;
+      __pyx_L53_bool_binop_done:;
+      if (__pyx_t_2) {
+
+        /* "a_star.pyx":355
+ *             max_open_set = open_set.size()
+ *             if open_set_limit and max_open_set > open_set_limit:
+ *                 limit = LIMIT_OPEN_SET             # <<<<<<<<<<<<<<
+ *                 break
+ * 
+ */
+        __Pyx_GetModuleGlobalName(__pyx_t_17, __pyx_n_s_LIMIT_OPEN_SET); if (unlikely(!__pyx_t_17)) __PYX_ERR(0, 355, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_17);
+        __Pyx_DECREF_SET(__pyx_v_limit, __pyx_t_17);
+        __pyx_t_17 = 0;
+
+        /* "a_star.pyx":356
+ *             if open_set_limit and max_open_set > open_set_limit:
+ *                 limit = LIMIT_OPEN_SET
+ *                 break             # <<<<<<<<<<<<<<
+ * 
+ *     if stats is not None:
+ */
+        goto __pyx_L12_break;
+
+        /* "a_star.pyx":354
+ *         if open_set.size() > max_open_set:
+ *             max_open_set = open_set.size()
+ *             if open_set_limit and max_open_set > open_set_limit:             # <<<<<<<<<<<<<<
+ *                 limit = LIMIT_OPEN_SET
+ *                 break
+ */
+      }
+
+      /* "a_star.pyx":352
+ *             nodes_generated += 1
+ * 
+ *         if open_set.size() > max_open_set:             # <<<<<<<<<<<<<<
+ *             max_open_set = open_set.size()
+ *             if open_set_limit and max_open_set > open_set_limit:
+ */
     }
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __pyx_L11_continue:;
   }
+  __pyx_L12_break:;
 
-  /* "a_star.pyx":307
- *             )
+  /* "a_star.pyx":358
+ *                 break
+ * 
+ *     if stats is not None:             # <<<<<<<<<<<<<<
+ *         blocked = blocked_ports(grid_vertical, grid_horizontal, start, goal_nodes, width, height)
+ *         if limit is not None:
+ */
+  __pyx_t_2 = (__pyx_v_stats != Py_None);
+  if (__pyx_t_2) {
+
+    /* "a_star.pyx":359
+ * 
+ *     if stats is not None:
+ *         blocked = blocked_ports(grid_vertical, grid_horizontal, start, goal_nodes, width, height)             # <<<<<<<<<<<<<<
+ *         if limit is not None:
+ *             failure_reason = FAILURE_LIMIT_REACHED
+ */
+    __pyx_t_17 = PyInt_FromSsize_t(__pyx_v_width); if (unlikely(!__pyx_t_17)) __PYX_ERR(0, 359, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_17);
+    __pyx_t_18 = PyInt_FromSsize_t(__pyx_v_height); if (unlikely(!__pyx_t_18)) __PYX_ERR(0, 359, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_18);
+    __pyx_t_16 = __pyx_f_6a_star_blocked_ports(__pyx_v_grid_vertical, __pyx_v_grid_horizontal, __pyx_v_start, __pyx_v_goal_nodes, __pyx_t_17, __pyx_t_18); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 359, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_16);
+    __Pyx_DECREF(__pyx_t_17); __pyx_t_17 = 0;
+    __Pyx_DECREF(__pyx_t_18); __pyx_t_18 = 0;
+    __pyx_v_blocked = __pyx_t_16;
+    __pyx_t_16 = 0;
+
+    /* "a_star.pyx":360
+ *     if stats is not None:
+ *         blocked = blocked_ports(grid_vertical, grid_horizontal, start, goal_nodes, width, height)
+ *         if limit is not None:             # <<<<<<<<<<<<<<
+ *             failure_reason = FAILURE_LIMIT_REACHED
+ *         elif blocked:
+ */
+    __pyx_t_2 = (__pyx_v_limit != Py_None);
+    if (__pyx_t_2) {
+
+      /* "a_star.pyx":361
+ *         blocked = blocked_ports(grid_vertical, grid_horizontal, start, goal_nodes, width, height)
+ *         if limit is not None:
+ *             failure_reason = FAILURE_LIMIT_REACHED             # <<<<<<<<<<<<<<
+ *         elif blocked:
+ *             failure_reason = FAILURE_BLOCKED_PORTS
+ */
+      __Pyx_GetModuleGlobalName(__pyx_t_16, __pyx_n_s_FAILURE_LIMIT_REACHED); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 361, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_16);
+      __pyx_v_failure_reason = __pyx_t_16;
+      __pyx_t_16 = 0;
+
+      /* "a_star.pyx":360
+ *     if stats is not None:
+ *         blocked = blocked_ports(grid_vertical, grid_horizontal, start, goal_nodes, width, height)
+ *         if limit is not None:             # <<<<<<<<<<<<<<
+ *             failure_reason = FAILURE_LIMIT_REACHED
+ *         elif blocked:
+ */
+      goto __pyx_L56;
+    }
+
+    /* "a_star.pyx":362
+ *         if limit is not None:
+ *             failure_reason = FAILURE_LIMIT_REACHED
+ *         elif blocked:             # <<<<<<<<<<<<<<
+ *             failure_reason = FAILURE_BLOCKED_PORTS
+ *         elif goal_segment_length_prunes:
+ */
+    __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_v_blocked); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(0, 362, __pyx_L1_error)
+    if (__pyx_t_2) {
+
+      /* "a_star.pyx":363
+ *             failure_reason = FAILURE_LIMIT_REACHED
+ *         elif blocked:
+ *             failure_reason = FAILURE_BLOCKED_PORTS             # <<<<<<<<<<<<<<
+ *         elif goal_segment_length_prunes:
+ *             failure_reason = FAILURE_SEGMENT_LENGTH
+ */
+      __Pyx_GetModuleGlobalName(__pyx_t_16, __pyx_n_s_FAILURE_BLOCKED_PORTS); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 363, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_16);
+      __pyx_v_failure_reason = __pyx_t_16;
+      __pyx_t_16 = 0;
+
+      /* "a_star.pyx":362
+ *         if limit is not None:
+ *             failure_reason = FAILURE_LIMIT_REACHED
+ *         elif blocked:             # <<<<<<<<<<<<<<
+ *             failure_reason = FAILURE_BLOCKED_PORTS
+ *         elif goal_segment_length_prunes:
+ */
+      goto __pyx_L56;
+    }
+
+    /* "a_star.pyx":364
+ *         elif blocked:
+ *             failure_reason = FAILURE_BLOCKED_PORTS
+ *         elif goal_segment_length_prunes:             # <<<<<<<<<<<<<<
+ *             failure_reason = FAILURE_SEGMENT_LENGTH
+ *         else:
+ */
+    __pyx_t_2 = (__pyx_v_goal_segment_length_prunes != 0);
+    if (__pyx_t_2) {
+
+      /* "a_star.pyx":365
+ *             failure_reason = FAILURE_BLOCKED_PORTS
+ *         elif goal_segment_length_prunes:
+ *             failure_reason = FAILURE_SEGMENT_LENGTH             # <<<<<<<<<<<<<<
+ *         else:
+ *             failure_reason = FAILURE_EXHAUSTED
+ */
+      __Pyx_GetModuleGlobalName(__pyx_t_16, __pyx_n_s_FAILURE_SEGMENT_LENGTH); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 365, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_16);
+      __pyx_v_failure_reason = __pyx_t_16;
+      __pyx_t_16 = 0;
+
+      /* "a_star.pyx":364
+ *         elif blocked:
+ *             failure_reason = FAILURE_BLOCKED_PORTS
+ *         elif goal_segment_length_prunes:             # <<<<<<<<<<<<<<
+ *             failure_reason = FAILURE_SEGMENT_LENGTH
+ *         else:
+ */
+      goto __pyx_L56;
+    }
+
+    /* "a_star.pyx":367
+ *             failure_reason = FAILURE_SEGMENT_LENGTH
+ *         else:
+ *             failure_reason = FAILURE_EXHAUSTED             # <<<<<<<<<<<<<<
+ * 
+ *         stats.add_search(nodes_expanded=nodes_expanded, nodes_generated=nodes_generated,
+ */
+    /*else*/ {
+      __Pyx_GetModuleGlobalName(__pyx_t_16, __pyx_n_s_FAILURE_EXHAUSTED); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 367, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_16);
+      __pyx_v_failure_reason = __pyx_t_16;
+      __pyx_t_16 = 0;
+    }
+    __pyx_L56:;
+
+    /* "a_star.pyx":369
+ *             failure_reason = FAILURE_EXHAUSTED
+ * 
+ *         stats.add_search(nodes_expanded=nodes_expanded, nodes_generated=nodes_generated,             # <<<<<<<<<<<<<<
+ *                          segment_length_prunes=segment_length_prunes, max_open_set=max_open_set,
+ *                          visited_states=len(visited_states),
+ */
+    __pyx_t_16 = __Pyx_PyObject_GetAttrStr(__pyx_v_stats, __pyx_n_s_add_search); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 369, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_16);
+    __pyx_t_18 = __Pyx_PyDict_NewPresized(10); if (unlikely(!__pyx_t_18)) __PYX_ERR(0, 369, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_18);
+    __pyx_t_17 = __Pyx_PyInt_From_PY_LONG_LONG(__pyx_v_nodes_expanded); if (unlikely(!__pyx_t_17)) __PYX_ERR(0, 369, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_17);
+    if (PyDict_SetItem(__pyx_t_18, __pyx_n_s_nodes_expanded, __pyx_t_17) < 0) __PYX_ERR(0, 369, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_17); __pyx_t_17 = 0;
+    __pyx_t_17 = __Pyx_PyInt_From_PY_LONG_LONG(__pyx_v_nodes_generated); if (unlikely(!__pyx_t_17)) __PYX_ERR(0, 369, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_17);
+    if (PyDict_SetItem(__pyx_t_18, __pyx_n_s_nodes_generated, __pyx_t_17) < 0) __PYX_ERR(0, 369, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_17); __pyx_t_17 = 0;
+
+    /* "a_star.pyx":370
+ * 
+ *         stats.add_search(nodes_expanded=nodes_expanded, nodes_generated=nodes_generated,
+ *                          segment_length_prunes=segment_length_prunes, max_open_set=max_open_set,             # <<<<<<<<<<<<<<
+ *                          visited_states=len(visited_states),
+ *                          peak_memory=estimate_search_memory(visited_states, state_key, max_open_set, item,
+ */
+    __pyx_t_17 = __Pyx_PyInt_From_PY_LONG_LONG(__pyx_v_segment_length_prunes); if (unlikely(!__pyx_t_17)) __PYX_ERR(0, 370, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_17);
+    if (PyDict_SetItem(__pyx_t_18, __pyx_n_s_segment_length_prunes, __pyx_t_17) < 0) __PYX_ERR(0, 369, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_17); __pyx_t_17 = 0;
+    __pyx_t_17 = __Pyx_PyInt_From_PY_LONG_LONG(__pyx_v_max_open_set); if (unlikely(!__pyx_t_17)) __PYX_ERR(0, 370, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_17);
+    if (PyDict_SetItem(__pyx_t_18, __pyx_n_s_max_open_set, __pyx_t_17) < 0) __PYX_ERR(0, 369, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_17); __pyx_t_17 = 0;
+
+    /* "a_star.pyx":371
+ *         stats.add_search(nodes_expanded=nodes_expanded, nodes_generated=nodes_generated,
+ *                          segment_length_prunes=segment_length_prunes, max_open_set=max_open_set,
+ *                          visited_states=len(visited_states),             # <<<<<<<<<<<<<<
+ *                          peak_memory=estimate_search_memory(visited_states, state_key, max_open_set, item,
+ *                                                             item[3] if item else None),
+ */
+    __pyx_t_1 = __Pyx_PySet_GET_SIZE(__pyx_v_visited_states); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-1))) __PYX_ERR(0, 371, __pyx_L1_error)
+    __pyx_t_17 = PyInt_FromSsize_t(__pyx_t_1); if (unlikely(!__pyx_t_17)) __PYX_ERR(0, 371, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_17);
+    if (PyDict_SetItem(__pyx_t_18, __pyx_n_s_visited_states, __pyx_t_17) < 0) __PYX_ERR(0, 369, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_17); __pyx_t_17 = 0;
+
+    /* "a_star.pyx":372
+ *                          segment_length_prunes=segment_length_prunes, max_open_set=max_open_set,
+ *                          visited_states=len(visited_states),
+ *                          peak_memory=estimate_search_memory(visited_states, state_key, max_open_set, item,             # <<<<<<<<<<<<<<
+ *                                                             item[3] if item else None),
+ *                          seconds=time.perf_counter() - start_time, failure_reason=failure_reason,
+ */
+    __Pyx_GetModuleGlobalName(__pyx_t_8, __pyx_n_s_estimate_search_memory); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 372, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __pyx_t_15 = __Pyx_PyInt_From_PY_LONG_LONG(__pyx_v_max_open_set); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 372, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_15);
+
+    /* "a_star.pyx":373
+ *                          visited_states=len(visited_states),
+ *                          peak_memory=estimate_search_memory(visited_states, state_key, max_open_set, item,
+ *                                                             item[3] if item else None),             # <<<<<<<<<<<<<<
+ *                          seconds=time.perf_counter() - start_time, failure_reason=failure_reason,
+ *                          blocked_ports=blocked, limit=limit)
+ */
+    __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_v_item); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(0, 373, __pyx_L1_error)
+    if (__pyx_t_2) {
+      __pyx_t_6 = __Pyx_GetItemInt(__pyx_v_item, 3, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 373, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      __pyx_t_5 = __pyx_t_6;
+      __pyx_t_6 = 0;
+    } else {
+      __Pyx_INCREF(Py_None);
+      __pyx_t_5 = Py_None;
+    }
+    __pyx_t_6 = NULL;
+    __pyx_t_10 = 0;
+    #if CYTHON_UNPACK_METHODS
+    if (unlikely(PyMethod_Check(__pyx_t_8))) {
+      __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_8);
+      if (likely(__pyx_t_6)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_8);
+        __Pyx_INCREF(__pyx_t_6);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_8, function);
+        __pyx_t_10 = 1;
+      }
+    }
+    #endif
+    {
+      PyObject *__pyx_callargs[6] = {__pyx_t_6, __pyx_v_visited_states, __pyx_v_state_key, __pyx_t_15, __pyx_v_item, __pyx_t_5};
+      __pyx_t_17 = __Pyx_PyObject_FastCall(__pyx_t_8, __pyx_callargs+1-__pyx_t_10, 5+__pyx_t_10);
+      __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      if (unlikely(!__pyx_t_17)) __PYX_ERR(0, 372, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_17);
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    }
+    if (PyDict_SetItem(__pyx_t_18, __pyx_n_s_peak_memory, __pyx_t_17) < 0) __PYX_ERR(0, 369, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_17); __pyx_t_17 = 0;
+
+    /* "a_star.pyx":374
+ *                          peak_memory=estimate_search_memory(visited_states, state_key, max_open_set, item,
+ *                                                             item[3] if item else None),
+ *                          seconds=time.perf_counter() - start_time, failure_reason=failure_reason,             # <<<<<<<<<<<<<<
+ *                          blocked_ports=blocked, limit=limit)
+ *     return None, None
+ */
+    __Pyx_GetModuleGlobalName(__pyx_t_8, __pyx_n_s_time); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 374, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_8, __pyx_n_s_perf_counter); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 374, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __pyx_t_8 = NULL;
+    __pyx_t_10 = 0;
+    #if CYTHON_UNPACK_METHODS
+    if (unlikely(PyMethod_Check(__pyx_t_5))) {
+      __pyx_t_8 = PyMethod_GET_SELF(__pyx_t_5);
+      if (likely(__pyx_t_8)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+        __Pyx_INCREF(__pyx_t_8);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_5, function);
+        __pyx_t_10 = 1;
+      }
+    }
+    #endif
+    {
+      PyObject *__pyx_callargs[2] = {__pyx_t_8, NULL};
+      __pyx_t_17 = __Pyx_PyObject_FastCall(__pyx_t_5, __pyx_callargs+1-__pyx_t_10, 0+__pyx_t_10);
+      __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+      if (unlikely(!__pyx_t_17)) __PYX_ERR(0, 374, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_17);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    }
+    __pyx_t_5 = PyNumber_Subtract(__pyx_t_17, __pyx_v_start_time); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 374, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_17); __pyx_t_17 = 0;
+    if (PyDict_SetItem(__pyx_t_18, __pyx_n_s_seconds, __pyx_t_5) < 0) __PYX_ERR(0, 369, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (PyDict_SetItem(__pyx_t_18, __pyx_n_s_failure_reason, __pyx_v_failure_reason) < 0) __PYX_ERR(0, 369, __pyx_L1_error)
+
+    /* "a_star.pyx":375
+ *                                                             item[3] if item else None),
+ *                          seconds=time.perf_counter() - start_time, failure_reason=failure_reason,
+ *                          blocked_ports=blocked, limit=limit)             # <<<<<<<<<<<<<<
+ *     return None, None
+ * 
+ */
+    if (PyDict_SetItem(__pyx_t_18, __pyx_n_s_blocked_ports, __pyx_v_blocked) < 0) __PYX_ERR(0, 369, __pyx_L1_error)
+    if (PyDict_SetItem(__pyx_t_18, __pyx_n_s_limit, __pyx_v_limit) < 0) __PYX_ERR(0, 369, __pyx_L1_error)
+
+    /* "a_star.pyx":369
+ *             failure_reason = FAILURE_EXHAUSTED
+ * 
+ *         stats.add_search(nodes_expanded=nodes_expanded, nodes_generated=nodes_generated,             # <<<<<<<<<<<<<<
+ *                          segment_length_prunes=segment_length_prunes, max_open_set=max_open_set,
+ *                          visited_states=len(visited_states),
+ */
+    __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_16, __pyx_empty_tuple, __pyx_t_18); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 369, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_16); __pyx_t_16 = 0;
+    __Pyx_DECREF(__pyx_t_18); __pyx_t_18 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+    /* "a_star.pyx":358
+ *                 break
  * 
+ *     if stats is not None:             # <<<<<<<<<<<<<<
+ *         blocked = blocked_ports(grid_vertical, grid_horizontal, start, goal_nodes, width, height)
+ *         if limit is not None:
+ */
+  }
+
+  /* "a_star.pyx":376
+ *                          seconds=time.perf_counter() - start_time, failure_reason=failure_reason,
+ *                          blocked_ports=blocked, limit=limit)
  *     return None, None             # <<<<<<<<<<<<<<
  * 
  * 
@@ -9024,10 +10248,10 @@ static PyObject *__pyx_f_6a_star_a_star(PyObject *__pyx_v_grid_vertical, PyObjec
   __pyx_r = __pyx_tuple__2;
   goto __pyx_L0;
 
-  /* "a_star.pyx":186
+  /* "a_star.pyx":194
  *     return path, cost
  * 
- * cdef a_star(grid_vertical, grid_horizontal, start, goal_nodes, minimum_segment_length):             # <<<<<<<<<<<<<<
+ * cdef a_star(grid_vertical, grid_horizontal, start, goal_nodes, minimum_segment_length, stats=None, limits=None):             # <<<<<<<<<<<<<<
  * 
  *     #Parameters
  */
@@ -9038,12 +10262,11 @@ static PyObject *__pyx_f_6a_star_a_star(PyObject *__pyx_v_grid_vertical, PyObjec
   __Pyx_XDECREF(__pyx_t_5);
   __Pyx_XDECREF(__pyx_t_6);
   __Pyx_XDECREF(__pyx_t_8);
-  __Pyx_XDECREF(__pyx_t_11);
-  __Pyx_XDECREF(__pyx_t_12);
-  __Pyx_XDECREF(__pyx_t_13);
-  __Pyx_XDECREF(__pyx_t_14);
   __Pyx_XDECREF(__pyx_t_15);
   __Pyx_XDECREF(__pyx_t_16);
+  __Pyx_XDECREF(__pyx_t_17);
+  __Pyx_XDECREF(__pyx_t_18);
+  __Pyx_XDECREF(__pyx_t_19);
   __Pyx_AddTraceback("a_star.a_star", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = 0;
   __pyx_L0:;
@@ -9055,6 +10278,10 @@ static PyObject *__pyx_f_6a_star_a_star(PyObject *__pyx_v_grid_vertical, PyObjec
   __Pyx_XDECREF(__pyx_v_g_start);
   __Pyx_XDECREF(__pyx_v_f_start);
   __Pyx_XDECREF(__pyx_v_visited_states);
+  __Pyx_XDECREF(__pyx_v_start_time);
+  __Pyx_XDECREF(__pyx_v_limit);
+  __Pyx_XDECREF(__pyx_v_state_key);
+  __Pyx_XDECREF(__pyx_v_item);
   __Pyx_XDECREF(__pyx_v_g);
   __Pyx_XDECREF(__pyx_v_current);
   __Pyx_XDECREF(__pyx_v_mask);
@@ -9063,7 +10290,6 @@ static PyObject *__pyx_f_6a_star_a_star(PyObject *__pyx_v_grid_vertical, PyObjec
   __Pyx_XDECREF(__pyx_v_seg_len);
   __Pyx_XDECREF(__pyx_v_after_goal);
   __Pyx_XDECREF(__pyx_v_last_was_reversal);
-  __Pyx_XDECREF(__pyx_v_state_key);
   __Pyx_XDECREF(__pyx_v_x);
   __Pyx_XDECREF(__pyx_v_y);
   __Pyx_XDECREF(__pyx_v_edge_set);
@@ -9081,6 +10307,8 @@ static PyObject *__pyx_f_6a_star_a_star(PyObject *__pyx_v_grid_vertical, PyObjec
   __Pyx_XDECREF(__pyx_v_cost_increment);
   __Pyx_XDECREF(__pyx_v_new_g);
   __Pyx_XDECREF(__pyx_v_new_f);
+  __Pyx_XDECREF(__pyx_v_blocked);
+  __Pyx_XDECREF(__pyx_v_failure_reason);
   __Pyx_XDECREF(__pyx_8genexpr1__pyx_v_i);
   __Pyx_XDECREF(__pyx_8genexpr1__pyx_v_goal);
   __Pyx_XGIVEREF(__pyx_r);
@@ -9088,979 +10316,1307 @@ static PyObject *__pyx_f_6a_star_a_star(PyObject *__pyx_v_grid_vertical, PyObjec
   return __pyx_r;
 }
 
-/* "a_star.pyx":317
+/* "a_star.pyx":379
  * 
  * 
- * cdef _manhattan(a, b):             # <<<<<<<<<<<<<<
- *     return abs(a[0] - b[0]) + abs(a[1] - b[1])
- * 
+ * cdef blocked_ports(grid_vertical, grid_horizontal, start, goal_nodes, width, height):             # <<<<<<<<<<<<<<
+ *     """Returns the start node if it can not be left and the goal nodes that can not be entered from any side"""
+ *     directions = [(0, -1), (0, 1), (-1, 0), (1, 0)]
  */
 
-static PyObject *__pyx_f_6a_star__manhattan(PyObject *__pyx_v_a, PyObject *__pyx_v_b) {
+static PyObject *__pyx_f_6a_star_blocked_ports(PyObject *__pyx_v_grid_vertical, PyObject *__pyx_v_grid_horizontal, PyObject *__pyx_v_start, PyObject *__pyx_v_goal_nodes, PyObject *__pyx_v_width, PyObject *__pyx_v_height) {
+  PyObject *__pyx_v_directions = NULL;
+  PyObject *__pyx_v_blocked = NULL;
+  int __pyx_v_leavable;
+  PyObject *__pyx_v_dx = NULL;
+  PyObject *__pyx_v_dy = NULL;
+  PyObject *__pyx_v_goal = NULL;
+  int __pyx_v_enterable;
+  PyObject *__pyx_v_x = NULL;
+  PyObject *__pyx_v_y = NULL;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
+  Py_ssize_t __pyx_t_2;
   PyObject *__pyx_t_3 = NULL;
   PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *(*__pyx_t_7)(PyObject *);
+  int __pyx_t_8;
+  int __pyx_t_9;
+  int __pyx_t_10;
+  PyObject *(*__pyx_t_11)(PyObject *);
+  Py_ssize_t __pyx_t_12;
+  PyObject *__pyx_t_13 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("_manhattan", 1);
+  __Pyx_RefNannySetupContext("blocked_ports", 1);
 
-  /* "a_star.pyx":318
- * 
- * cdef _manhattan(a, b):
- *     return abs(a[0] - b[0]) + abs(a[1] - b[1])             # <<<<<<<<<<<<<<
+  /* "a_star.pyx":381
+ * cdef blocked_ports(grid_vertical, grid_horizontal, start, goal_nodes, width, height):
+ *     """Returns the start node if it can not be left and the goal nodes that can not be entered from any side"""
+ *     directions = [(0, -1), (0, 1), (-1, 0), (1, 0)]             # <<<<<<<<<<<<<<
+ *     blocked = []
  * 
+ */
+  __pyx_t_1 = PyList_New(4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 381, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_INCREF(__pyx_tuple__3);
+  __Pyx_GIVEREF(__pyx_tuple__3);
+  if (__Pyx_PyList_SET_ITEM(__pyx_t_1, 0, __pyx_tuple__3)) __PYX_ERR(0, 381, __pyx_L1_error);
+  __Pyx_INCREF(__pyx_tuple__4);
+  __Pyx_GIVEREF(__pyx_tuple__4);
+  if (__Pyx_PyList_SET_ITEM(__pyx_t_1, 1, __pyx_tuple__4)) __PYX_ERR(0, 381, __pyx_L1_error);
+  __Pyx_INCREF(__pyx_tuple__5);
+  __Pyx_GIVEREF(__pyx_tuple__5);
+  if (__Pyx_PyList_SET_ITEM(__pyx_t_1, 2, __pyx_tuple__5)) __PYX_ERR(0, 381, __pyx_L1_error);
+  __Pyx_INCREF(__pyx_tuple__6);
+  __Pyx_GIVEREF(__pyx_tuple__6);
+  if (__Pyx_PyList_SET_ITEM(__pyx_t_1, 3, __pyx_tuple__6)) __PYX_ERR(0, 381, __pyx_L1_error);
+  __pyx_v_directions = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "a_star.pyx":382
+ *     """Returns the start node if it can not be left and the goal nodes that can not be entered from any side"""
+ *     directions = [(0, -1), (0, 1), (-1, 0), (1, 0)]
+ *     blocked = []             # <<<<<<<<<<<<<<
  * 
+ *     leavable = False
  */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_GetItemInt(__pyx_v_a, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 318, __pyx_L1_error)
+  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 382, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_GetItemInt(__pyx_v_b, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 318, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = PyNumber_Subtract(__pyx_t_1, __pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 318, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_PyNumber_Absolute(__pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 318, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_3 = __Pyx_GetItemInt(__pyx_v_a, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 318, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_1 = __Pyx_GetItemInt(__pyx_v_b, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 318, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_4 = PyNumber_Subtract(__pyx_t_3, __pyx_t_1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 318, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = __Pyx_PyNumber_Absolute(__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 318, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_t_4 = PyNumber_Add(__pyx_t_2, __pyx_t_1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 318, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_r = __pyx_t_4;
-  __pyx_t_4 = 0;
-  goto __pyx_L0;
+  __pyx_v_blocked = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
 
-  /* "a_star.pyx":317
- * 
- * 
- * cdef _manhattan(a, b):             # <<<<<<<<<<<<<<
- *     return abs(a[0] - b[0]) + abs(a[1] - b[1])
+  /* "a_star.pyx":384
+ *     blocked = []
  * 
+ *     leavable = False             # <<<<<<<<<<<<<<
+ *     for dx, dy in directions:
+ *         if (in_bounds((start[0] + dx, start[1] + dy), width, height) and
  */
+  __pyx_v_leavable = 0;
 
-  /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_AddTraceback("a_star._manhattan", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-static PyObject *__pyx_gb_6a_star_10_heuristic_2generator(__pyx_CoroutineObject *__pyx_generator, CYTHON_UNUSED PyThreadState *__pyx_tstate, PyObject *__pyx_sent_value); /* proto */
-
-/* "a_star.pyx":327
- *         return 0
- * 
- *     return min(_manhattan(current, goal) for goal in unvisited)             # <<<<<<<<<<<<<<
- * 
+  /* "a_star.pyx":385
  * 
+ *     leavable = False
+ *     for dx, dy in directions:             # <<<<<<<<<<<<<<
+ *         if (in_bounds((start[0] + dx, start[1] + dy), width, height) and
+ *                 is_walkable((start[0] + dx, start[1] + dy), start, grid_vertical, grid_horizontal)):
  */
-
-static PyObject *__pyx_pf_6a_star_10_heuristic_genexpr(PyObject *__pyx_self, PyObject *__pyx_genexpr_arg_0) {
-  struct __pyx_obj_6a_star___pyx_scope_struct_1_genexpr *__pyx_cur_scope;
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("genexpr", 0);
-  __pyx_cur_scope = (struct __pyx_obj_6a_star___pyx_scope_struct_1_genexpr *)__pyx_tp_new_6a_star___pyx_scope_struct_1_genexpr(__pyx_ptype_6a_star___pyx_scope_struct_1_genexpr, __pyx_empty_tuple, NULL);
-  if (unlikely(!__pyx_cur_scope)) {
-    __pyx_cur_scope = ((struct __pyx_obj_6a_star___pyx_scope_struct_1_genexpr *)Py_None);
-    __Pyx_INCREF(Py_None);
-    __PYX_ERR(0, 327, __pyx_L1_error)
-  } else {
-    __Pyx_GOTREF((PyObject *)__pyx_cur_scope);
-  }
-  __pyx_cur_scope->__pyx_outer_scope = (struct __pyx_obj_6a_star___pyx_scope_struct____pyx_f_6a_star__heuristic *) __pyx_self;
-  __Pyx_INCREF((PyObject *)__pyx_cur_scope->__pyx_outer_scope);
-  __Pyx_GIVEREF((PyObject *)__pyx_cur_scope->__pyx_outer_scope);
-  __pyx_cur_scope->__pyx_genexpr_arg_0 = __pyx_genexpr_arg_0;
-  __Pyx_INCREF(__pyx_cur_scope->__pyx_genexpr_arg_0);
-  __Pyx_GIVEREF(__pyx_cur_scope->__pyx_genexpr_arg_0);
-  {
-    __pyx_CoroutineObject *gen = __Pyx_Generator_New((__pyx_coroutine_body_t) __pyx_gb_6a_star_10_heuristic_2generator, NULL, (PyObject *) __pyx_cur_scope, __pyx_n_s_genexpr, __pyx_n_s_heuristic_locals_genexpr, __pyx_n_s_a_star); if (unlikely(!gen)) __PYX_ERR(0, 327, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_cur_scope);
-    __Pyx_RefNannyFinishContext();
-    return (PyObject *) gen;
-  }
-
-  /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_AddTraceback("a_star._heuristic.genexpr", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __Pyx_DECREF((PyObject *)__pyx_cur_scope);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-static PyObject *__pyx_gb_6a_star_10_heuristic_2generator(__pyx_CoroutineObject *__pyx_generator, CYTHON_UNUSED PyThreadState *__pyx_tstate, PyObject *__pyx_sent_value) /* generator body */
-{
-  struct __pyx_obj_6a_star___pyx_scope_struct_1_genexpr *__pyx_cur_scope = ((struct __pyx_obj_6a_star___pyx_scope_struct_1_genexpr *)__pyx_generator->closure);
-  PyObject *__pyx_r = NULL;
-  PyObject *__pyx_t_1 = NULL;
-  Py_ssize_t __pyx_t_2;
-  PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("genexpr", 0);
-  switch (__pyx_generator->resume_label) {
-    case 0: goto __pyx_L3_first_run;
-    case 1: goto __pyx_L6_resume_from_yield;
-    default: /* CPython raises the right error here */
-    __Pyx_RefNannyFinishContext();
-    return NULL;
-  }
-  __pyx_L3_first_run:;
-  if (unlikely(!__pyx_sent_value)) __PYX_ERR(0, 327, __pyx_L1_error)
-  if (unlikely(!__pyx_cur_scope->__pyx_genexpr_arg_0)) { __Pyx_RaiseUnboundLocalError(".0"); __PYX_ERR(0, 327, __pyx_L1_error) }
-  __pyx_t_1 = __pyx_cur_scope->__pyx_genexpr_arg_0; __Pyx_INCREF(__pyx_t_1);
+  __pyx_t_1 = __pyx_v_directions; __Pyx_INCREF(__pyx_t_1);
   __pyx_t_2 = 0;
   for (;;) {
     {
       Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_1);
       #if !CYTHON_ASSUME_SAFE_MACROS
-      if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 327, __pyx_L1_error)
+      if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 385, __pyx_L1_error)
       #endif
       if (__pyx_t_2 >= __pyx_temp) break;
     }
     #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-    __pyx_t_3 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_2); __Pyx_INCREF(__pyx_t_3); __pyx_t_2++; if (unlikely((0 < 0))) __PYX_ERR(0, 327, __pyx_L1_error)
+    __pyx_t_3 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_2); __Pyx_INCREF(__pyx_t_3); __pyx_t_2++; if (unlikely((0 < 0))) __PYX_ERR(0, 385, __pyx_L1_error)
     #else
-    __pyx_t_3 = __Pyx_PySequence_ITEM(__pyx_t_1, __pyx_t_2); __pyx_t_2++; if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 327, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PySequence_ITEM(__pyx_t_1, __pyx_t_2); __pyx_t_2++; if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 385, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     #endif
-    __Pyx_XGOTREF(__pyx_cur_scope->__pyx_v_goal);
-    __Pyx_XDECREF_SET(__pyx_cur_scope->__pyx_v_goal, __pyx_t_3);
-    __Pyx_GIVEREF(__pyx_t_3);
-    __pyx_t_3 = 0;
-    if (unlikely(!__pyx_cur_scope->__pyx_outer_scope->__pyx_v_current)) { __Pyx_RaiseClosureNameError("current"); __PYX_ERR(0, 327, __pyx_L1_error) }
-    __pyx_t_3 = __pyx_cur_scope->__pyx_outer_scope->__pyx_v_current;
-    __Pyx_INCREF(__pyx_t_3);
-    __pyx_t_4 = __pyx_f_6a_star__manhattan(__pyx_t_3, __pyx_cur_scope->__pyx_v_goal); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 327, __pyx_L1_error)
+    if ((likely(PyTuple_CheckExact(__pyx_t_3))) || (PyList_CheckExact(__pyx_t_3))) {
+      PyObject* sequence = __pyx_t_3;
+      Py_ssize_t size = __Pyx_PySequence_SIZE(sequence);
+      if (unlikely(size != 2)) {
+        if (size > 2) __Pyx_RaiseTooManyValuesError(2);
+        else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
+        __PYX_ERR(0, 385, __pyx_L1_error)
+      }
+      #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+      if (likely(PyTuple_CheckExact(sequence))) {
+        __pyx_t_4 = PyTuple_GET_ITEM(sequence, 0); 
+        __pyx_t_5 = PyTuple_GET_ITEM(sequence, 1); 
+      } else {
+        __pyx_t_4 = PyList_GET_ITEM(sequence, 0); 
+        __pyx_t_5 = PyList_GET_ITEM(sequence, 1); 
+      }
+      __Pyx_INCREF(__pyx_t_4);
+      __Pyx_INCREF(__pyx_t_5);
+      #else
+      __pyx_t_4 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 385, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __pyx_t_5 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 385, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      #endif
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    } else {
+      Py_ssize_t index = -1;
+      __pyx_t_6 = PyObject_GetIter(__pyx_t_3); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 385, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __pyx_t_7 = __Pyx_PyObject_GetIterNextFunc(__pyx_t_6);
+      index = 0; __pyx_t_4 = __pyx_t_7(__pyx_t_6); if (unlikely(!__pyx_t_4)) goto __pyx_L5_unpacking_failed;
+      __Pyx_GOTREF(__pyx_t_4);
+      index = 1; __pyx_t_5 = __pyx_t_7(__pyx_t_6); if (unlikely(!__pyx_t_5)) goto __pyx_L5_unpacking_failed;
+      __Pyx_GOTREF(__pyx_t_5);
+      if (__Pyx_IternextUnpackEndCheck(__pyx_t_7(__pyx_t_6), 2) < 0) __PYX_ERR(0, 385, __pyx_L1_error)
+      __pyx_t_7 = NULL;
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+      goto __pyx_L6_unpacking_done;
+      __pyx_L5_unpacking_failed:;
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __pyx_t_7 = NULL;
+      if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
+      __PYX_ERR(0, 385, __pyx_L1_error)
+      __pyx_L6_unpacking_done:;
+    }
+    __Pyx_XDECREF_SET(__pyx_v_dx, __pyx_t_4);
+    __pyx_t_4 = 0;
+    __Pyx_XDECREF_SET(__pyx_v_dy, __pyx_t_5);
+    __pyx_t_5 = 0;
+
+    /* "a_star.pyx":386
+ *     leavable = False
+ *     for dx, dy in directions:
+ *         if (in_bounds((start[0] + dx, start[1] + dy), width, height) and             # <<<<<<<<<<<<<<
+ *                 is_walkable((start[0] + dx, start[1] + dy), start, grid_vertical, grid_horizontal)):
+ *             leavable = True
+ */
+    __pyx_t_3 = __Pyx_GetItemInt(__pyx_v_start, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 386, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_5 = PyNumber_Add(__pyx_t_3, __pyx_v_dx); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 386, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_t_3 = __Pyx_GetItemInt(__pyx_v_start, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 386, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = PyNumber_Add(__pyx_t_3, __pyx_v_dy); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 386, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __pyx_r = __pyx_t_4;
+    __pyx_t_3 = PyTuple_New(2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 386, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_GIVEREF(__pyx_t_5);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_5)) __PYX_ERR(0, 386, __pyx_L1_error);
+    __Pyx_GIVEREF(__pyx_t_4);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_t_4)) __PYX_ERR(0, 386, __pyx_L1_error);
+    __pyx_t_5 = 0;
     __pyx_t_4 = 0;
-    __Pyx_XGIVEREF(__pyx_t_1);
-    __pyx_cur_scope->__pyx_t_0 = __pyx_t_1;
-    __pyx_cur_scope->__pyx_t_1 = __pyx_t_2;
-    __Pyx_XGIVEREF(__pyx_r);
-    __Pyx_RefNannyFinishContext();
-    __Pyx_Coroutine_ResetAndClearException(__pyx_generator);
-    /* return from generator, yielding value */
-    __pyx_generator->resume_label = 1;
-    return __pyx_r;
-    __pyx_L6_resume_from_yield:;
-    __pyx_t_1 = __pyx_cur_scope->__pyx_t_0;
-    __pyx_cur_scope->__pyx_t_0 = 0;
-    __Pyx_XGOTREF(__pyx_t_1);
-    __pyx_t_2 = __pyx_cur_scope->__pyx_t_1;
-    if (unlikely(!__pyx_sent_value)) __PYX_ERR(0, 327, __pyx_L1_error)
-  }
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  CYTHON_MAYBE_UNUSED_VAR(__pyx_cur_scope);
+    __pyx_t_4 = __pyx_f_6a_star_in_bounds(__pyx_t_3, __pyx_v_width, __pyx_v_height); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 386, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_t_9 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely((__pyx_t_9 < 0))) __PYX_ERR(0, 386, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (__pyx_t_9) {
+    } else {
+      __pyx_t_8 = __pyx_t_9;
+      goto __pyx_L8_bool_binop_done;
+    }
 
-  /* function exit code */
-  PyErr_SetNone(PyExc_StopIteration);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_Generator_Replace_StopIteration(0);
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_AddTraceback("genexpr", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_L0:;
-  __Pyx_XDECREF(__pyx_r); __pyx_r = 0;
-  #if !CYTHON_USE_EXC_INFO_STACK
-  __Pyx_Coroutine_ResetAndClearException(__pyx_generator);
-  #endif
-  __pyx_generator->resume_label = -1;
-  __Pyx_Coroutine_clear((PyObject*)__pyx_generator);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
+    /* "a_star.pyx":387
+ *     for dx, dy in directions:
+ *         if (in_bounds((start[0] + dx, start[1] + dy), width, height) and
+ *                 is_walkable((start[0] + dx, start[1] + dy), start, grid_vertical, grid_horizontal)):             # <<<<<<<<<<<<<<
+ *             leavable = True
+ *             break
+ */
+    __pyx_t_4 = __Pyx_GetItemInt(__pyx_v_start, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 387, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_3 = PyNumber_Add(__pyx_t_4, __pyx_v_dx); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 387, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_4 = __Pyx_GetItemInt(__pyx_v_start, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 387, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_5 = PyNumber_Add(__pyx_t_4, __pyx_v_dy); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 387, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_4 = PyTuple_New(2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 387, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_GIVEREF(__pyx_t_3);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_3)) __PYX_ERR(0, 387, __pyx_L1_error);
+    __Pyx_GIVEREF(__pyx_t_5);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_t_5)) __PYX_ERR(0, 387, __pyx_L1_error);
+    __pyx_t_3 = 0;
+    __pyx_t_5 = 0;
+    __pyx_t_5 = __pyx_f_6a_star_is_walkable(__pyx_t_4, __pyx_v_start, __pyx_v_grid_vertical, __pyx_v_grid_horizontal); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 387, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_9 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely((__pyx_t_9 < 0))) __PYX_ERR(0, 387, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_t_8 = __pyx_t_9;
+    __pyx_L8_bool_binop_done:;
+
+    /* "a_star.pyx":386
+ *     leavable = False
+ *     for dx, dy in directions:
+ *         if (in_bounds((start[0] + dx, start[1] + dy), width, height) and             # <<<<<<<<<<<<<<
+ *                 is_walkable((start[0] + dx, start[1] + dy), start, grid_vertical, grid_horizontal)):
+ *             leavable = True
+ */
+    if (__pyx_t_8) {
+
+      /* "a_star.pyx":388
+ *         if (in_bounds((start[0] + dx, start[1] + dy), width, height) and
+ *                 is_walkable((start[0] + dx, start[1] + dy), start, grid_vertical, grid_horizontal)):
+ *             leavable = True             # <<<<<<<<<<<<<<
+ *             break
+ *     if not leavable:
+ */
+      __pyx_v_leavable = 1;
+
+      /* "a_star.pyx":389
+ *                 is_walkable((start[0] + dx, start[1] + dy), start, grid_vertical, grid_horizontal)):
+ *             leavable = True
+ *             break             # <<<<<<<<<<<<<<
+ *     if not leavable:
+ *         blocked.append(start)
+ */
+      goto __pyx_L4_break;
+
+      /* "a_star.pyx":386
+ *     leavable = False
+ *     for dx, dy in directions:
+ *         if (in_bounds((start[0] + dx, start[1] + dy), width, height) and             # <<<<<<<<<<<<<<
+ *                 is_walkable((start[0] + dx, start[1] + dy), start, grid_vertical, grid_horizontal)):
+ *             leavable = True
+ */
+    }
 
-/* "a_star.pyx":321
+    /* "a_star.pyx":385
  * 
+ *     leavable = False
+ *     for dx, dy in directions:             # <<<<<<<<<<<<<<
+ *         if (in_bounds((start[0] + dx, start[1] + dy), width, height) and
+ *                 is_walkable((start[0] + dx, start[1] + dy), start, grid_vertical, grid_horizontal)):
+ */
+  }
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  goto __pyx_L10_for_end;
+  __pyx_L4_break:;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  goto __pyx_L10_for_end;
+  __pyx_L10_for_end:;
+
+  /* "a_star.pyx":390
+ *             leavable = True
+ *             break
+ *     if not leavable:             # <<<<<<<<<<<<<<
+ *         blocked.append(start)
  * 
- * cdef _heuristic(current, mask, goals):             # <<<<<<<<<<<<<<
+ */
+  __pyx_t_8 = (!__pyx_v_leavable);
+  if (__pyx_t_8) {
+
+    /* "a_star.pyx":391
+ *             break
+ *     if not leavable:
+ *         blocked.append(start)             # <<<<<<<<<<<<<<
  * 
- *     unvisited = [goal for i, goal in enumerate(goals) if not (mask & (1 << i))]
+ *     for goal in goal_nodes:
  */
+    __pyx_t_10 = __Pyx_PyList_Append(__pyx_v_blocked, __pyx_v_start); if (unlikely(__pyx_t_10 == ((int)-1))) __PYX_ERR(0, 391, __pyx_L1_error)
 
-static PyObject *__pyx_f_6a_star__heuristic(PyObject *__pyx_v_current, PyObject *__pyx_v_mask, PyObject *__pyx_v_goals) {
-  struct __pyx_obj_6a_star___pyx_scope_struct____pyx_f_6a_star__heuristic *__pyx_cur_scope;
-  PyObject *__pyx_v_unvisited = NULL;
-  PyObject *__pyx_8genexpr2__pyx_v_i = NULL;
-  PyObject *__pyx_8genexpr2__pyx_v_goal = NULL;
-  PyObject *__pyx_gb_6a_star_10_heuristic_2generator = 0;
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  Py_ssize_t __pyx_t_4;
-  PyObject *(*__pyx_t_5)(PyObject *);
-  PyObject *__pyx_t_6 = NULL;
-  PyObject *__pyx_t_7 = NULL;
-  int __pyx_t_8;
-  int __pyx_t_9;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("_heuristic", 0);
-  __pyx_cur_scope = (struct __pyx_obj_6a_star___pyx_scope_struct____pyx_f_6a_star__heuristic *)__pyx_tp_new_6a_star___pyx_scope_struct____pyx_f_6a_star__heuristic(__pyx_ptype_6a_star___pyx_scope_struct____pyx_f_6a_star__heuristic, __pyx_empty_tuple, NULL);
-  if (unlikely(!__pyx_cur_scope)) {
-    __pyx_cur_scope = ((struct __pyx_obj_6a_star___pyx_scope_struct____pyx_f_6a_star__heuristic *)Py_None);
-    __Pyx_INCREF(Py_None);
-    __PYX_ERR(0, 321, __pyx_L1_error)
-  } else {
-    __Pyx_GOTREF((PyObject *)__pyx_cur_scope);
+    /* "a_star.pyx":390
+ *             leavable = True
+ *             break
+ *     if not leavable:             # <<<<<<<<<<<<<<
+ *         blocked.append(start)
+ * 
+ */
   }
-  __pyx_cur_scope->__pyx_v_current = __pyx_v_current;
-  __Pyx_INCREF(__pyx_cur_scope->__pyx_v_current);
-  __Pyx_GIVEREF(__pyx_cur_scope->__pyx_v_current);
 
-  /* "a_star.pyx":323
- * cdef _heuristic(current, mask, goals):
+  /* "a_star.pyx":393
+ *         blocked.append(start)
  * 
- *     unvisited = [goal for i, goal in enumerate(goals) if not (mask & (1 << i))]             # <<<<<<<<<<<<<<
- *     if not unvisited:
- *         return 0
+ *     for goal in goal_nodes:             # <<<<<<<<<<<<<<
+ *         if goal == start:
+ *             continue
  */
-  { /* enter inner scope */
-    __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 323, __pyx_L5_error)
+  if (likely(PyList_CheckExact(__pyx_v_goal_nodes)) || PyTuple_CheckExact(__pyx_v_goal_nodes)) {
+    __pyx_t_1 = __pyx_v_goal_nodes; __Pyx_INCREF(__pyx_t_1);
+    __pyx_t_2 = 0;
+    __pyx_t_11 = NULL;
+  } else {
+    __pyx_t_2 = -1; __pyx_t_1 = PyObject_GetIter(__pyx_v_goal_nodes); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 393, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_INCREF(__pyx_int_0);
-    __pyx_t_2 = __pyx_int_0;
-    if (likely(PyList_CheckExact(__pyx_v_goals)) || PyTuple_CheckExact(__pyx_v_goals)) {
-      __pyx_t_3 = __pyx_v_goals; __Pyx_INCREF(__pyx_t_3);
-      __pyx_t_4 = 0;
-      __pyx_t_5 = NULL;
+    __pyx_t_11 = __Pyx_PyObject_GetIterNextFunc(__pyx_t_1); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 393, __pyx_L1_error)
+  }
+  for (;;) {
+    if (likely(!__pyx_t_11)) {
+      if (likely(PyList_CheckExact(__pyx_t_1))) {
+        {
+          Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_1);
+          #if !CYTHON_ASSUME_SAFE_MACROS
+          if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 393, __pyx_L1_error)
+          #endif
+          if (__pyx_t_2 >= __pyx_temp) break;
+        }
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_5 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_2); __Pyx_INCREF(__pyx_t_5); __pyx_t_2++; if (unlikely((0 < 0))) __PYX_ERR(0, 393, __pyx_L1_error)
+        #else
+        __pyx_t_5 = __Pyx_PySequence_ITEM(__pyx_t_1, __pyx_t_2); __pyx_t_2++; if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 393, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_5);
+        #endif
+      } else {
+        {
+          Py_ssize_t __pyx_temp = __Pyx_PyTuple_GET_SIZE(__pyx_t_1);
+          #if !CYTHON_ASSUME_SAFE_MACROS
+          if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 393, __pyx_L1_error)
+          #endif
+          if (__pyx_t_2 >= __pyx_temp) break;
+        }
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_5 = PyTuple_GET_ITEM(__pyx_t_1, __pyx_t_2); __Pyx_INCREF(__pyx_t_5); __pyx_t_2++; if (unlikely((0 < 0))) __PYX_ERR(0, 393, __pyx_L1_error)
+        #else
+        __pyx_t_5 = __Pyx_PySequence_ITEM(__pyx_t_1, __pyx_t_2); __pyx_t_2++; if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 393, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_5);
+        #endif
+      }
     } else {
-      __pyx_t_4 = -1; __pyx_t_3 = PyObject_GetIter(__pyx_v_goals); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 323, __pyx_L5_error)
-      __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_5 = __Pyx_PyObject_GetIterNextFunc(__pyx_t_3); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 323, __pyx_L5_error)
+      __pyx_t_5 = __pyx_t_11(__pyx_t_1);
+      if (unlikely(!__pyx_t_5)) {
+        PyObject* exc_type = PyErr_Occurred();
+        if (exc_type) {
+          if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+          else __PYX_ERR(0, 393, __pyx_L1_error)
+        }
+        break;
+      }
+      __Pyx_GOTREF(__pyx_t_5);
+    }
+    __Pyx_XDECREF_SET(__pyx_v_goal, __pyx_t_5);
+    __pyx_t_5 = 0;
+
+    /* "a_star.pyx":394
+ * 
+ *     for goal in goal_nodes:
+ *         if goal == start:             # <<<<<<<<<<<<<<
+ *             continue
+ * 
+ */
+    __pyx_t_5 = PyObject_RichCompare(__pyx_v_goal, __pyx_v_start, Py_EQ); __Pyx_XGOTREF(__pyx_t_5); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 394, __pyx_L1_error)
+    __pyx_t_8 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely((__pyx_t_8 < 0))) __PYX_ERR(0, 394, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (__pyx_t_8) {
+
+      /* "a_star.pyx":395
+ *     for goal in goal_nodes:
+ *         if goal == start:
+ *             continue             # <<<<<<<<<<<<<<
+ * 
+ *         enterable = False
+ */
+      goto __pyx_L12_continue;
+
+      /* "a_star.pyx":394
+ * 
+ *     for goal in goal_nodes:
+ *         if goal == start:             # <<<<<<<<<<<<<<
+ *             continue
+ * 
+ */
     }
+
+    /* "a_star.pyx":397
+ *             continue
+ * 
+ *         enterable = False             # <<<<<<<<<<<<<<
+ *         for dx, dy in directions:
+ *             x, y = goal[0] + dx, goal[1] + dy
+ */
+    __pyx_v_enterable = 0;
+
+    /* "a_star.pyx":398
+ * 
+ *         enterable = False
+ *         for dx, dy in directions:             # <<<<<<<<<<<<<<
+ *             x, y = goal[0] + dx, goal[1] + dy
+ *             if (in_bounds((x, y), width, height) and (grid_vertical[y][x] == 0 or grid_horizontal[y][x] == 0)
+ */
+    __pyx_t_5 = __pyx_v_directions; __Pyx_INCREF(__pyx_t_5);
+    __pyx_t_12 = 0;
     for (;;) {
-      if (likely(!__pyx_t_5)) {
-        if (likely(PyList_CheckExact(__pyx_t_3))) {
-          {
-            Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_3);
-            #if !CYTHON_ASSUME_SAFE_MACROS
-            if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 323, __pyx_L5_error)
-            #endif
-            if (__pyx_t_4 >= __pyx_temp) break;
-          }
-          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-          __pyx_t_6 = PyList_GET_ITEM(__pyx_t_3, __pyx_t_4); __Pyx_INCREF(__pyx_t_6); __pyx_t_4++; if (unlikely((0 < 0))) __PYX_ERR(0, 323, __pyx_L5_error)
-          #else
-          __pyx_t_6 = __Pyx_PySequence_ITEM(__pyx_t_3, __pyx_t_4); __pyx_t_4++; if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 323, __pyx_L5_error)
-          __Pyx_GOTREF(__pyx_t_6);
-          #endif
+      {
+        Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_5);
+        #if !CYTHON_ASSUME_SAFE_MACROS
+        if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 398, __pyx_L1_error)
+        #endif
+        if (__pyx_t_12 >= __pyx_temp) break;
+      }
+      #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+      __pyx_t_4 = PyList_GET_ITEM(__pyx_t_5, __pyx_t_12); __Pyx_INCREF(__pyx_t_4); __pyx_t_12++; if (unlikely((0 < 0))) __PYX_ERR(0, 398, __pyx_L1_error)
+      #else
+      __pyx_t_4 = __Pyx_PySequence_ITEM(__pyx_t_5, __pyx_t_12); __pyx_t_12++; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 398, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      #endif
+      if ((likely(PyTuple_CheckExact(__pyx_t_4))) || (PyList_CheckExact(__pyx_t_4))) {
+        PyObject* sequence = __pyx_t_4;
+        Py_ssize_t size = __Pyx_PySequence_SIZE(sequence);
+        if (unlikely(size != 2)) {
+          if (size > 2) __Pyx_RaiseTooManyValuesError(2);
+          else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
+          __PYX_ERR(0, 398, __pyx_L1_error)
+        }
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        if (likely(PyTuple_CheckExact(sequence))) {
+          __pyx_t_3 = PyTuple_GET_ITEM(sequence, 0); 
+          __pyx_t_6 = PyTuple_GET_ITEM(sequence, 1); 
         } else {
-          {
-            Py_ssize_t __pyx_temp = __Pyx_PyTuple_GET_SIZE(__pyx_t_3);
-            #if !CYTHON_ASSUME_SAFE_MACROS
-            if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 323, __pyx_L5_error)
-            #endif
-            if (__pyx_t_4 >= __pyx_temp) break;
-          }
-          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-          __pyx_t_6 = PyTuple_GET_ITEM(__pyx_t_3, __pyx_t_4); __Pyx_INCREF(__pyx_t_6); __pyx_t_4++; if (unlikely((0 < 0))) __PYX_ERR(0, 323, __pyx_L5_error)
-          #else
-          __pyx_t_6 = __Pyx_PySequence_ITEM(__pyx_t_3, __pyx_t_4); __pyx_t_4++; if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 323, __pyx_L5_error)
-          __Pyx_GOTREF(__pyx_t_6);
-          #endif
+          __pyx_t_3 = PyList_GET_ITEM(sequence, 0); 
+          __pyx_t_6 = PyList_GET_ITEM(sequence, 1); 
         }
+        __Pyx_INCREF(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_6);
+        #else
+        __pyx_t_3 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 398, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_3);
+        __pyx_t_6 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 398, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_6);
+        #endif
+        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
       } else {
-        __pyx_t_6 = __pyx_t_5(__pyx_t_3);
-        if (unlikely(!__pyx_t_6)) {
-          PyObject* exc_type = PyErr_Occurred();
-          if (exc_type) {
-            if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
-            else __PYX_ERR(0, 323, __pyx_L5_error)
-          }
-          break;
-        }
+        Py_ssize_t index = -1;
+        __pyx_t_13 = PyObject_GetIter(__pyx_t_4); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 398, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_13);
+        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+        __pyx_t_7 = __Pyx_PyObject_GetIterNextFunc(__pyx_t_13);
+        index = 0; __pyx_t_3 = __pyx_t_7(__pyx_t_13); if (unlikely(!__pyx_t_3)) goto __pyx_L17_unpacking_failed;
+        __Pyx_GOTREF(__pyx_t_3);
+        index = 1; __pyx_t_6 = __pyx_t_7(__pyx_t_13); if (unlikely(!__pyx_t_6)) goto __pyx_L17_unpacking_failed;
         __Pyx_GOTREF(__pyx_t_6);
+        if (__Pyx_IternextUnpackEndCheck(__pyx_t_7(__pyx_t_13), 2) < 0) __PYX_ERR(0, 398, __pyx_L1_error)
+        __pyx_t_7 = NULL;
+        __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+        goto __pyx_L18_unpacking_done;
+        __pyx_L17_unpacking_failed:;
+        __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+        __pyx_t_7 = NULL;
+        if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
+        __PYX_ERR(0, 398, __pyx_L1_error)
+        __pyx_L18_unpacking_done:;
       }
-      __Pyx_XDECREF_SET(__pyx_8genexpr2__pyx_v_goal, __pyx_t_6);
+      __Pyx_XDECREF_SET(__pyx_v_dx, __pyx_t_3);
+      __pyx_t_3 = 0;
+      __Pyx_XDECREF_SET(__pyx_v_dy, __pyx_t_6);
       __pyx_t_6 = 0;
-      __Pyx_INCREF(__pyx_t_2);
-      __Pyx_XDECREF_SET(__pyx_8genexpr2__pyx_v_i, __pyx_t_2);
-      __pyx_t_6 = __Pyx_PyInt_AddObjC(__pyx_t_2, __pyx_int_1, 1, 0, 0); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 323, __pyx_L5_error)
+
+      /* "a_star.pyx":399
+ *         enterable = False
+ *         for dx, dy in directions:
+ *             x, y = goal[0] + dx, goal[1] + dy             # <<<<<<<<<<<<<<
+ *             if (in_bounds((x, y), width, height) and (grid_vertical[y][x] == 0 or grid_horizontal[y][x] == 0)
+ *                     and is_walkable(goal, (x, y), grid_vertical, grid_horizontal)):
+ */
+      __pyx_t_4 = __Pyx_GetItemInt(__pyx_v_goal, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 399, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __pyx_t_6 = PyNumber_Add(__pyx_t_4, __pyx_v_dx); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 399, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_6);
-      __Pyx_DECREF(__pyx_t_2);
-      __pyx_t_2 = __pyx_t_6;
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __pyx_t_4 = __Pyx_GetItemInt(__pyx_v_goal, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 399, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __pyx_t_3 = PyNumber_Add(__pyx_t_4, __pyx_v_dy); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 399, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __Pyx_XDECREF_SET(__pyx_v_x, __pyx_t_6);
       __pyx_t_6 = 0;
-      __pyx_t_6 = PyNumber_Lshift(__pyx_int_1, __pyx_8genexpr2__pyx_v_i); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 323, __pyx_L5_error)
+      __Pyx_XDECREF_SET(__pyx_v_y, __pyx_t_3);
+      __pyx_t_3 = 0;
+
+      /* "a_star.pyx":400
+ *         for dx, dy in directions:
+ *             x, y = goal[0] + dx, goal[1] + dy
+ *             if (in_bounds((x, y), width, height) and (grid_vertical[y][x] == 0 or grid_horizontal[y][x] == 0)             # <<<<<<<<<<<<<<
+ *                     and is_walkable(goal, (x, y), grid_vertical, grid_horizontal)):
+ *                 enterable = True
+ */
+      __pyx_t_3 = PyTuple_New(2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 400, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_INCREF(__pyx_v_x);
+      __Pyx_GIVEREF(__pyx_v_x);
+      if (__Pyx_PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_v_x)) __PYX_ERR(0, 400, __pyx_L1_error);
+      __Pyx_INCREF(__pyx_v_y);
+      __Pyx_GIVEREF(__pyx_v_y);
+      if (__Pyx_PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_v_y)) __PYX_ERR(0, 400, __pyx_L1_error);
+      __pyx_t_6 = __pyx_f_6a_star_in_bounds(__pyx_t_3, __pyx_v_width, __pyx_v_height); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 400, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_6);
-      __pyx_t_7 = PyNumber_And(__pyx_v_mask, __pyx_t_6); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 323, __pyx_L5_error)
-      __Pyx_GOTREF(__pyx_t_7);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __pyx_t_9 = __Pyx_PyObject_IsTrue(__pyx_t_6); if (unlikely((__pyx_t_9 < 0))) __PYX_ERR(0, 400, __pyx_L1_error)
       __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-      __pyx_t_8 = __Pyx_PyObject_IsTrue(__pyx_t_7); if (unlikely((__pyx_t_8 < 0))) __PYX_ERR(0, 323, __pyx_L5_error)
-      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-      __pyx_t_9 = (!__pyx_t_8);
       if (__pyx_t_9) {
-        if (unlikely(__Pyx_ListComp_Append(__pyx_t_1, (PyObject*)__pyx_8genexpr2__pyx_v_goal))) __PYX_ERR(0, 323, __pyx_L5_error)
+      } else {
+        __pyx_t_8 = __pyx_t_9;
+        goto __pyx_L20_bool_binop_done;
       }
-    }
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __Pyx_XDECREF(__pyx_8genexpr2__pyx_v_goal); __pyx_8genexpr2__pyx_v_goal = 0;
-    __Pyx_XDECREF(__pyx_8genexpr2__pyx_v_i); __pyx_8genexpr2__pyx_v_i = 0;
-    goto __pyx_L10_exit_scope;
-    __pyx_L5_error:;
-    __Pyx_XDECREF(__pyx_8genexpr2__pyx_v_goal); __pyx_8genexpr2__pyx_v_goal = 0;
-    __Pyx_XDECREF(__pyx_8genexpr2__pyx_v_i); __pyx_8genexpr2__pyx_v_i = 0;
-    goto __pyx_L1_error;
-    __pyx_L10_exit_scope:;
-  } /* exit inner scope */
-  __pyx_v_unvisited = ((PyObject*)__pyx_t_1);
-  __pyx_t_1 = 0;
 
-  /* "a_star.pyx":324
- * 
- *     unvisited = [goal for i, goal in enumerate(goals) if not (mask & (1 << i))]
- *     if not unvisited:             # <<<<<<<<<<<<<<
- *         return 0
- * 
+      /* "a_star.pyx":401
+ *             x, y = goal[0] + dx, goal[1] + dy
+ *             if (in_bounds((x, y), width, height) and (grid_vertical[y][x] == 0 or grid_horizontal[y][x] == 0)
+ *                     and is_walkable(goal, (x, y), grid_vertical, grid_horizontal)):             # <<<<<<<<<<<<<<
+ *                 enterable = True
+ *                 break
  */
-  __pyx_t_9 = (PyList_GET_SIZE(__pyx_v_unvisited) != 0);
-  __pyx_t_8 = (!__pyx_t_9);
-  if (__pyx_t_8) {
+      __pyx_t_6 = __Pyx_PyObject_GetItem(__pyx_v_grid_vertical, __pyx_v_y); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 400, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_6);
 
-    /* "a_star.pyx":325
- *     unvisited = [goal for i, goal in enumerate(goals) if not (mask & (1 << i))]
- *     if not unvisited:
- *         return 0             # <<<<<<<<<<<<<<
+      /* "a_star.pyx":400
+ *         for dx, dy in directions:
+ *             x, y = goal[0] + dx, goal[1] + dy
+ *             if (in_bounds((x, y), width, height) and (grid_vertical[y][x] == 0 or grid_horizontal[y][x] == 0)             # <<<<<<<<<<<<<<
+ *                     and is_walkable(goal, (x, y), grid_vertical, grid_horizontal)):
+ *                 enterable = True
+ */
+      __pyx_t_3 = __Pyx_PyObject_GetItem(__pyx_t_6, __pyx_v_x); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 400, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __pyx_t_9 = (__Pyx_PyInt_BoolEqObjC(__pyx_t_3, __pyx_int_0, 0, 0)); if (unlikely((__pyx_t_9 < 0))) __PYX_ERR(0, 400, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      if (!__pyx_t_9) {
+      } else {
+        goto __pyx_L22_next_and;
+      }
+      __pyx_t_3 = __Pyx_PyObject_GetItem(__pyx_v_grid_horizontal, __pyx_v_y); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 400, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_6 = __Pyx_PyObject_GetItem(__pyx_t_3, __pyx_v_x); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 400, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __pyx_t_9 = (__Pyx_PyInt_BoolEqObjC(__pyx_t_6, __pyx_int_0, 0, 0)); if (unlikely((__pyx_t_9 < 0))) __PYX_ERR(0, 400, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+      if (__pyx_t_9) {
+      } else {
+        __pyx_t_8 = __pyx_t_9;
+        goto __pyx_L20_bool_binop_done;
+      }
+      __pyx_L22_next_and:;
+
+      /* "a_star.pyx":401
+ *             x, y = goal[0] + dx, goal[1] + dy
+ *             if (in_bounds((x, y), width, height) and (grid_vertical[y][x] == 0 or grid_horizontal[y][x] == 0)
+ *                     and is_walkable(goal, (x, y), grid_vertical, grid_horizontal)):             # <<<<<<<<<<<<<<
+ *                 enterable = True
+ *                 break
+ */
+      __pyx_t_6 = PyTuple_New(2); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 401, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      __Pyx_INCREF(__pyx_v_x);
+      __Pyx_GIVEREF(__pyx_v_x);
+      if (__Pyx_PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_v_x)) __PYX_ERR(0, 401, __pyx_L1_error);
+      __Pyx_INCREF(__pyx_v_y);
+      __Pyx_GIVEREF(__pyx_v_y);
+      if (__Pyx_PyTuple_SET_ITEM(__pyx_t_6, 1, __pyx_v_y)) __PYX_ERR(0, 401, __pyx_L1_error);
+      __pyx_t_3 = __pyx_f_6a_star_is_walkable(__pyx_v_goal, __pyx_t_6, __pyx_v_grid_vertical, __pyx_v_grid_horizontal); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 401, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __pyx_t_9 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely((__pyx_t_9 < 0))) __PYX_ERR(0, 401, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __pyx_t_8 = __pyx_t_9;
+      __pyx_L20_bool_binop_done:;
+
+      /* "a_star.pyx":400
+ *         for dx, dy in directions:
+ *             x, y = goal[0] + dx, goal[1] + dy
+ *             if (in_bounds((x, y), width, height) and (grid_vertical[y][x] == 0 or grid_horizontal[y][x] == 0)             # <<<<<<<<<<<<<<
+ *                     and is_walkable(goal, (x, y), grid_vertical, grid_horizontal)):
+ *                 enterable = True
+ */
+      if (__pyx_t_8) {
+
+        /* "a_star.pyx":402
+ *             if (in_bounds((x, y), width, height) and (grid_vertical[y][x] == 0 or grid_horizontal[y][x] == 0)
+ *                     and is_walkable(goal, (x, y), grid_vertical, grid_horizontal)):
+ *                 enterable = True             # <<<<<<<<<<<<<<
+ *                 break
+ *         if not enterable:
+ */
+        __pyx_v_enterable = 1;
+
+        /* "a_star.pyx":403
+ *                     and is_walkable(goal, (x, y), grid_vertical, grid_horizontal)):
+ *                 enterable = True
+ *                 break             # <<<<<<<<<<<<<<
+ *         if not enterable:
+ *             blocked.append(goal)
+ */
+        goto __pyx_L16_break;
+
+        /* "a_star.pyx":400
+ *         for dx, dy in directions:
+ *             x, y = goal[0] + dx, goal[1] + dy
+ *             if (in_bounds((x, y), width, height) and (grid_vertical[y][x] == 0 or grid_horizontal[y][x] == 0)             # <<<<<<<<<<<<<<
+ *                     and is_walkable(goal, (x, y), grid_vertical, grid_horizontal)):
+ *                 enterable = True
+ */
+      }
+
+      /* "a_star.pyx":398
  * 
- *     return min(_manhattan(current, goal) for goal in unvisited)
+ *         enterable = False
+ *         for dx, dy in directions:             # <<<<<<<<<<<<<<
+ *             x, y = goal[0] + dx, goal[1] + dy
+ *             if (in_bounds((x, y), width, height) and (grid_vertical[y][x] == 0 or grid_horizontal[y][x] == 0)
  */
-    __Pyx_XDECREF(__pyx_r);
-    __Pyx_INCREF(__pyx_int_0);
-    __pyx_r = __pyx_int_0;
-    goto __pyx_L0;
+    }
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    goto __pyx_L24_for_end;
+    __pyx_L16_break:;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    goto __pyx_L24_for_end;
+    __pyx_L24_for_end:;
+
+    /* "a_star.pyx":404
+ *                 enterable = True
+ *                 break
+ *         if not enterable:             # <<<<<<<<<<<<<<
+ *             blocked.append(goal)
+ *     return blocked
+ */
+    __pyx_t_8 = (!__pyx_v_enterable);
+    if (__pyx_t_8) {
 
-    /* "a_star.pyx":324
+      /* "a_star.pyx":405
+ *                 break
+ *         if not enterable:
+ *             blocked.append(goal)             # <<<<<<<<<<<<<<
+ *     return blocked
  * 
- *     unvisited = [goal for i, goal in enumerate(goals) if not (mask & (1 << i))]
- *     if not unvisited:             # <<<<<<<<<<<<<<
- *         return 0
+ */
+      __pyx_t_10 = __Pyx_PyList_Append(__pyx_v_blocked, __pyx_v_goal); if (unlikely(__pyx_t_10 == ((int)-1))) __PYX_ERR(0, 405, __pyx_L1_error)
+
+      /* "a_star.pyx":404
+ *                 enterable = True
+ *                 break
+ *         if not enterable:             # <<<<<<<<<<<<<<
+ *             blocked.append(goal)
+ *     return blocked
+ */
+    }
+
+    /* "a_star.pyx":393
+ *         blocked.append(start)
  * 
+ *     for goal in goal_nodes:             # <<<<<<<<<<<<<<
+ *         if goal == start:
+ *             continue
  */
+    __pyx_L12_continue:;
   }
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "a_star.pyx":327
- *         return 0
- * 
- *     return min(_manhattan(current, goal) for goal in unvisited)             # <<<<<<<<<<<<<<
+  /* "a_star.pyx":406
+ *         if not enterable:
+ *             blocked.append(goal)
+ *     return blocked             # <<<<<<<<<<<<<<
  * 
  * 
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_pf_6a_star_10_heuristic_genexpr(((PyObject*)__pyx_cur_scope), __pyx_v_unvisited); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 327, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_builtin_min, __pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 327, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_r = __pyx_t_2;
-  __pyx_t_2 = 0;
+  __Pyx_INCREF(__pyx_v_blocked);
+  __pyx_r = __pyx_v_blocked;
   goto __pyx_L0;
 
-  /* "a_star.pyx":321
+  /* "a_star.pyx":379
  * 
  * 
- * cdef _heuristic(current, mask, goals):             # <<<<<<<<<<<<<<
- * 
- *     unvisited = [goal for i, goal in enumerate(goals) if not (mask & (1 << i))]
+ * cdef blocked_ports(grid_vertical, grid_horizontal, start, goal_nodes, width, height):             # <<<<<<<<<<<<<<
+ *     """Returns the start node if it can not be left and the goal nodes that can not be entered from any side"""
+ *     directions = [(0, -1), (0, 1), (-1, 0), (1, 0)]
  */
 
   /* function exit code */
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
   __Pyx_XDECREF(__pyx_t_6);
-  __Pyx_XDECREF(__pyx_t_7);
-  __Pyx_AddTraceback("a_star._heuristic", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_XDECREF(__pyx_t_13);
+  __Pyx_AddTraceback("a_star.blocked_ports", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = 0;
   __pyx_L0:;
-  __Pyx_XDECREF(__pyx_v_unvisited);
-  __Pyx_XDECREF(__pyx_8genexpr2__pyx_v_i);
-  __Pyx_XDECREF(__pyx_8genexpr2__pyx_v_goal);
-  __Pyx_XDECREF(__pyx_gb_6a_star_10_heuristic_2generator);
-  __Pyx_DECREF((PyObject *)__pyx_cur_scope);
-  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_XDECREF(__pyx_v_directions);
+  __Pyx_XDECREF(__pyx_v_blocked);
+  __Pyx_XDECREF(__pyx_v_dx);
+  __Pyx_XDECREF(__pyx_v_dy);
+  __Pyx_XDECREF(__pyx_v_goal);
+  __Pyx_XDECREF(__pyx_v_x);
+  __Pyx_XDECREF(__pyx_v_y);
+  __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "a_star.pyx":330
+/* "a_star.pyx":416
  * 
  * 
- * cdef lock_trace(grid_vertical, grid_horizontal, segments, trace_width_scaled):             # <<<<<<<<<<<<<<
- * 
+ * cdef _manhattan(a, b):             # <<<<<<<<<<<<<<
+ *     return abs(a[0] - b[0]) + abs(a[1] - b[1])
  * 
  */
 
-static PyObject *__pyx_f_6a_star_lock_trace(PyObject *__pyx_v_grid_vertical, PyObject *__pyx_v_grid_horizontal, PyObject *__pyx_v_segments, PyObject *__pyx_v_trace_width_scaled) {
-  PyObject *__pyx_v_segment = NULL;
-  PyObject *__pyx_v_x = NULL;
-  PyObject *__pyx_v_y = NULL;
-  PyObject *__pyx_v_i = NULL;
-  PyObject *__pyx_v_p = NULL;
+static PyObject *__pyx_f_6a_star__manhattan(PyObject *__pyx_v_a, PyObject *__pyx_v_b) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
-  Py_ssize_t __pyx_t_2;
-  PyObject *(*__pyx_t_3)(PyObject *);
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
   PyObject *__pyx_t_4 = NULL;
-  PyObject *__pyx_t_5 = NULL;
-  PyObject *__pyx_t_6 = NULL;
-  int __pyx_t_7;
-  Py_ssize_t __pyx_t_8;
-  PyObject *(*__pyx_t_9)(PyObject *);
-  PyObject *__pyx_t_10 = NULL;
-  PyObject *__pyx_t_11 = NULL;
-  PyObject *(*__pyx_t_12)(PyObject *);
-  Py_ssize_t __pyx_t_13;
-  PyObject *(*__pyx_t_14)(PyObject *);
-  Py_ssize_t __pyx_t_15;
-  PyObject *(*__pyx_t_16)(PyObject *);
-  Py_ssize_t __pyx_t_17;
-  PyObject *__pyx_t_18 = NULL;
-  int __pyx_t_19;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("lock_trace", 1);
+  __Pyx_RefNannySetupContext("_manhattan", 1);
 
-  /* "a_star.pyx":333
+  /* "a_star.pyx":417
  * 
+ * cdef _manhattan(a, b):
+ *     return abs(a[0] - b[0]) + abs(a[1] - b[1])             # <<<<<<<<<<<<<<
  * 
- *     for segment in segments:             # <<<<<<<<<<<<<<
- *         # vertical
  * 
  */
-  if (likely(PyList_CheckExact(__pyx_v_segments)) || PyTuple_CheckExact(__pyx_v_segments)) {
-    __pyx_t_1 = __pyx_v_segments; __Pyx_INCREF(__pyx_t_1);
-    __pyx_t_2 = 0;
-    __pyx_t_3 = NULL;
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_GetItemInt(__pyx_v_a, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 417, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_GetItemInt(__pyx_v_b, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 417, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = PyNumber_Subtract(__pyx_t_1, __pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 417, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_PyNumber_Absolute(__pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 417, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = __Pyx_GetItemInt(__pyx_v_a, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 417, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_1 = __Pyx_GetItemInt(__pyx_v_b, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 417, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_4 = PyNumber_Subtract(__pyx_t_3, __pyx_t_1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 417, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_PyNumber_Absolute(__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 417, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = PyNumber_Add(__pyx_t_2, __pyx_t_1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 417, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_r = __pyx_t_4;
+  __pyx_t_4 = 0;
+  goto __pyx_L0;
+
+  /* "a_star.pyx":416
+ * 
+ * 
+ * cdef _manhattan(a, b):             # <<<<<<<<<<<<<<
+ *     return abs(a[0] - b[0]) + abs(a[1] - b[1])
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("a_star._manhattan", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+static PyObject *__pyx_gb_6a_star_10_heuristic_2generator(__pyx_CoroutineObject *__pyx_generator, CYTHON_UNUSED PyThreadState *__pyx_tstate, PyObject *__pyx_sent_value); /* proto */
+
+/* "a_star.pyx":426
+ *         return 0
+ * 
+ *     return min(_manhattan(current, goal) for goal in unvisited)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+
+static PyObject *__pyx_pf_6a_star_10_heuristic_genexpr(PyObject *__pyx_self, PyObject *__pyx_genexpr_arg_0) {
+  struct __pyx_obj_6a_star___pyx_scope_struct_1_genexpr *__pyx_cur_scope;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("genexpr", 0);
+  __pyx_cur_scope = (struct __pyx_obj_6a_star___pyx_scope_struct_1_genexpr *)__pyx_tp_new_6a_star___pyx_scope_struct_1_genexpr(__pyx_ptype_6a_star___pyx_scope_struct_1_genexpr, __pyx_empty_tuple, NULL);
+  if (unlikely(!__pyx_cur_scope)) {
+    __pyx_cur_scope = ((struct __pyx_obj_6a_star___pyx_scope_struct_1_genexpr *)Py_None);
+    __Pyx_INCREF(Py_None);
+    __PYX_ERR(0, 426, __pyx_L1_error)
   } else {
-    __pyx_t_2 = -1; __pyx_t_1 = PyObject_GetIter(__pyx_v_segments); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 333, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_3 = __Pyx_PyObject_GetIterNextFunc(__pyx_t_1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 333, __pyx_L1_error)
+    __Pyx_GOTREF((PyObject *)__pyx_cur_scope);
+  }
+  __pyx_cur_scope->__pyx_outer_scope = (struct __pyx_obj_6a_star___pyx_scope_struct____pyx_f_6a_star__heuristic *) __pyx_self;
+  __Pyx_INCREF((PyObject *)__pyx_cur_scope->__pyx_outer_scope);
+  __Pyx_GIVEREF((PyObject *)__pyx_cur_scope->__pyx_outer_scope);
+  __pyx_cur_scope->__pyx_genexpr_arg_0 = __pyx_genexpr_arg_0;
+  __Pyx_INCREF(__pyx_cur_scope->__pyx_genexpr_arg_0);
+  __Pyx_GIVEREF(__pyx_cur_scope->__pyx_genexpr_arg_0);
+  {
+    __pyx_CoroutineObject *gen = __Pyx_Generator_New((__pyx_coroutine_body_t) __pyx_gb_6a_star_10_heuristic_2generator, NULL, (PyObject *) __pyx_cur_scope, __pyx_n_s_genexpr, __pyx_n_s_heuristic_locals_genexpr, __pyx_n_s_a_star); if (unlikely(!gen)) __PYX_ERR(0, 426, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_cur_scope);
+    __Pyx_RefNannyFinishContext();
+    return (PyObject *) gen;
+  }
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("a_star._heuristic.genexpr", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __Pyx_DECREF((PyObject *)__pyx_cur_scope);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_gb_6a_star_10_heuristic_2generator(__pyx_CoroutineObject *__pyx_generator, CYTHON_UNUSED PyThreadState *__pyx_tstate, PyObject *__pyx_sent_value) /* generator body */
+{
+  struct __pyx_obj_6a_star___pyx_scope_struct_1_genexpr *__pyx_cur_scope = ((struct __pyx_obj_6a_star___pyx_scope_struct_1_genexpr *)__pyx_generator->closure);
+  PyObject *__pyx_r = NULL;
+  PyObject *__pyx_t_1 = NULL;
+  Py_ssize_t __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("genexpr", 0);
+  switch (__pyx_generator->resume_label) {
+    case 0: goto __pyx_L3_first_run;
+    case 1: goto __pyx_L6_resume_from_yield;
+    default: /* CPython raises the right error here */
+    __Pyx_RefNannyFinishContext();
+    return NULL;
   }
+  __pyx_L3_first_run:;
+  if (unlikely(!__pyx_sent_value)) __PYX_ERR(0, 426, __pyx_L1_error)
+  if (unlikely(!__pyx_cur_scope->__pyx_genexpr_arg_0)) { __Pyx_RaiseUnboundLocalError(".0"); __PYX_ERR(0, 426, __pyx_L1_error) }
+  __pyx_t_1 = __pyx_cur_scope->__pyx_genexpr_arg_0; __Pyx_INCREF(__pyx_t_1);
+  __pyx_t_2 = 0;
   for (;;) {
-    if (likely(!__pyx_t_3)) {
-      if (likely(PyList_CheckExact(__pyx_t_1))) {
-        {
-          Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_1);
-          #if !CYTHON_ASSUME_SAFE_MACROS
-          if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 333, __pyx_L1_error)
-          #endif
-          if (__pyx_t_2 >= __pyx_temp) break;
-        }
-        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-        __pyx_t_4 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_2); __Pyx_INCREF(__pyx_t_4); __pyx_t_2++; if (unlikely((0 < 0))) __PYX_ERR(0, 333, __pyx_L1_error)
-        #else
-        __pyx_t_4 = __Pyx_PySequence_ITEM(__pyx_t_1, __pyx_t_2); __pyx_t_2++; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 333, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_4);
-        #endif
-      } else {
-        {
-          Py_ssize_t __pyx_temp = __Pyx_PyTuple_GET_SIZE(__pyx_t_1);
-          #if !CYTHON_ASSUME_SAFE_MACROS
-          if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 333, __pyx_L1_error)
-          #endif
-          if (__pyx_t_2 >= __pyx_temp) break;
-        }
-        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-        __pyx_t_4 = PyTuple_GET_ITEM(__pyx_t_1, __pyx_t_2); __Pyx_INCREF(__pyx_t_4); __pyx_t_2++; if (unlikely((0 < 0))) __PYX_ERR(0, 333, __pyx_L1_error)
-        #else
-        __pyx_t_4 = __Pyx_PySequence_ITEM(__pyx_t_1, __pyx_t_2); __pyx_t_2++; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 333, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_4);
-        #endif
-      }
-    } else {
-      __pyx_t_4 = __pyx_t_3(__pyx_t_1);
-      if (unlikely(!__pyx_t_4)) {
-        PyObject* exc_type = PyErr_Occurred();
-        if (exc_type) {
-          if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
-          else __PYX_ERR(0, 333, __pyx_L1_error)
-        }
-        break;
-      }
-      __Pyx_GOTREF(__pyx_t_4);
+    {
+      Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_1);
+      #if !CYTHON_ASSUME_SAFE_MACROS
+      if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 426, __pyx_L1_error)
+      #endif
+      if (__pyx_t_2 >= __pyx_temp) break;
     }
-    __Pyx_XDECREF_SET(__pyx_v_segment, __pyx_t_4);
+    #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    __pyx_t_3 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_2); __Pyx_INCREF(__pyx_t_3); __pyx_t_2++; if (unlikely((0 < 0))) __PYX_ERR(0, 426, __pyx_L1_error)
+    #else
+    __pyx_t_3 = __Pyx_PySequence_ITEM(__pyx_t_1, __pyx_t_2); __pyx_t_2++; if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 426, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    #endif
+    __Pyx_XGOTREF(__pyx_cur_scope->__pyx_v_goal);
+    __Pyx_XDECREF_SET(__pyx_cur_scope->__pyx_v_goal, __pyx_t_3);
+    __Pyx_GIVEREF(__pyx_t_3);
+    __pyx_t_3 = 0;
+    if (unlikely(!__pyx_cur_scope->__pyx_outer_scope->__pyx_v_current)) { __Pyx_RaiseClosureNameError("current"); __PYX_ERR(0, 426, __pyx_L1_error) }
+    __pyx_t_3 = __pyx_cur_scope->__pyx_outer_scope->__pyx_v_current;
+    __Pyx_INCREF(__pyx_t_3);
+    __pyx_t_4 = __pyx_f_6a_star__manhattan(__pyx_t_3, __pyx_cur_scope->__pyx_v_goal); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 426, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_r = __pyx_t_4;
     __pyx_t_4 = 0;
+    __Pyx_XGIVEREF(__pyx_t_1);
+    __pyx_cur_scope->__pyx_t_0 = __pyx_t_1;
+    __pyx_cur_scope->__pyx_t_1 = __pyx_t_2;
+    __Pyx_XGIVEREF(__pyx_r);
+    __Pyx_RefNannyFinishContext();
+    __Pyx_Coroutine_ResetAndClearException(__pyx_generator);
+    /* return from generator, yielding value */
+    __pyx_generator->resume_label = 1;
+    return __pyx_r;
+    __pyx_L6_resume_from_yield:;
+    __pyx_t_1 = __pyx_cur_scope->__pyx_t_0;
+    __pyx_cur_scope->__pyx_t_0 = 0;
+    __Pyx_XGOTREF(__pyx_t_1);
+    __pyx_t_2 = __pyx_cur_scope->__pyx_t_1;
+    if (unlikely(!__pyx_sent_value)) __PYX_ERR(0, 426, __pyx_L1_error)
+  }
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  CYTHON_MAYBE_UNUSED_VAR(__pyx_cur_scope);
 
-    /* "a_star.pyx":336
- *         # vertical
+  /* function exit code */
+  PyErr_SetNone(PyExc_StopIteration);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_Generator_Replace_StopIteration(0);
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("genexpr", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_r); __pyx_r = 0;
+  #if !CYTHON_USE_EXC_INFO_STACK
+  __Pyx_Coroutine_ResetAndClearException(__pyx_generator);
+  #endif
+  __pyx_generator->resume_label = -1;
+  __Pyx_Coroutine_clear((PyObject*)__pyx_generator);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "a_star.pyx":420
  * 
- *         if segment[0][0] - segment[-1][0] == 0:             # <<<<<<<<<<<<<<
  * 
- *             for x, y in segment:
+ * cdef _heuristic(current, mask, goals):             # <<<<<<<<<<<<<<
+ * 
+ *     unvisited = [goal for i, goal in enumerate(goals) if not (mask & (1 << i))]
  */
-    __pyx_t_4 = __Pyx_GetItemInt(__pyx_v_segment, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 336, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_5 = __Pyx_GetItemInt(__pyx_t_4, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 336, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_5);
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __pyx_t_4 = __Pyx_GetItemInt(__pyx_v_segment, -1L, long, 1, __Pyx_PyInt_From_long, 0, 1, 1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 336, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_6 = __Pyx_GetItemInt(__pyx_t_4, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 336, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_6);
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __pyx_t_4 = PyNumber_Subtract(__pyx_t_5, __pyx_t_6); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 336, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    __pyx_t_7 = (__Pyx_PyInt_BoolEqObjC(__pyx_t_4, __pyx_int_0, 0, 0)); if (unlikely((__pyx_t_7 < 0))) __PYX_ERR(0, 336, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    if (__pyx_t_7) {
 
-      /* "a_star.pyx":338
- *         if segment[0][0] - segment[-1][0] == 0:
+static PyObject *__pyx_f_6a_star__heuristic(PyObject *__pyx_v_current, PyObject *__pyx_v_mask, PyObject *__pyx_v_goals) {
+  struct __pyx_obj_6a_star___pyx_scope_struct____pyx_f_6a_star__heuristic *__pyx_cur_scope;
+  PyObject *__pyx_v_unvisited = NULL;
+  PyObject *__pyx_8genexpr2__pyx_v_i = NULL;
+  PyObject *__pyx_8genexpr2__pyx_v_goal = NULL;
+  PyObject *__pyx_gb_6a_star_10_heuristic_2generator = 0;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  Py_ssize_t __pyx_t_4;
+  PyObject *(*__pyx_t_5)(PyObject *);
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  int __pyx_t_8;
+  int __pyx_t_9;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("_heuristic", 0);
+  __pyx_cur_scope = (struct __pyx_obj_6a_star___pyx_scope_struct____pyx_f_6a_star__heuristic *)__pyx_tp_new_6a_star___pyx_scope_struct____pyx_f_6a_star__heuristic(__pyx_ptype_6a_star___pyx_scope_struct____pyx_f_6a_star__heuristic, __pyx_empty_tuple, NULL);
+  if (unlikely(!__pyx_cur_scope)) {
+    __pyx_cur_scope = ((struct __pyx_obj_6a_star___pyx_scope_struct____pyx_f_6a_star__heuristic *)Py_None);
+    __Pyx_INCREF(Py_None);
+    __PYX_ERR(0, 420, __pyx_L1_error)
+  } else {
+    __Pyx_GOTREF((PyObject *)__pyx_cur_scope);
+  }
+  __pyx_cur_scope->__pyx_v_current = __pyx_v_current;
+  __Pyx_INCREF(__pyx_cur_scope->__pyx_v_current);
+  __Pyx_GIVEREF(__pyx_cur_scope->__pyx_v_current);
+
+  /* "a_star.pyx":422
+ * cdef _heuristic(current, mask, goals):
  * 
- *             for x, y in segment:             # <<<<<<<<<<<<<<
- *                 for i in range(-trace_width_scaled, trace_width_scaled + 1):
- *                     for p in range(-trace_width_scaled, trace_width_scaled+1):
+ *     unvisited = [goal for i, goal in enumerate(goals) if not (mask & (1 << i))]             # <<<<<<<<<<<<<<
+ *     if not unvisited:
+ *         return 0
  */
-      if (likely(PyList_CheckExact(__pyx_v_segment)) || PyTuple_CheckExact(__pyx_v_segment)) {
-        __pyx_t_4 = __pyx_v_segment; __Pyx_INCREF(__pyx_t_4);
-        __pyx_t_8 = 0;
-        __pyx_t_9 = NULL;
-      } else {
-        __pyx_t_8 = -1; __pyx_t_4 = PyObject_GetIter(__pyx_v_segment); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 338, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_4);
-        __pyx_t_9 = __Pyx_PyObject_GetIterNextFunc(__pyx_t_4); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 338, __pyx_L1_error)
-      }
-      for (;;) {
-        if (likely(!__pyx_t_9)) {
-          if (likely(PyList_CheckExact(__pyx_t_4))) {
-            {
-              Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_4);
-              #if !CYTHON_ASSUME_SAFE_MACROS
-              if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 338, __pyx_L1_error)
-              #endif
-              if (__pyx_t_8 >= __pyx_temp) break;
-            }
-            #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-            __pyx_t_6 = PyList_GET_ITEM(__pyx_t_4, __pyx_t_8); __Pyx_INCREF(__pyx_t_6); __pyx_t_8++; if (unlikely((0 < 0))) __PYX_ERR(0, 338, __pyx_L1_error)
-            #else
-            __pyx_t_6 = __Pyx_PySequence_ITEM(__pyx_t_4, __pyx_t_8); __pyx_t_8++; if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 338, __pyx_L1_error)
-            __Pyx_GOTREF(__pyx_t_6);
-            #endif
-          } else {
-            {
-              Py_ssize_t __pyx_temp = __Pyx_PyTuple_GET_SIZE(__pyx_t_4);
-              #if !CYTHON_ASSUME_SAFE_MACROS
-              if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 338, __pyx_L1_error)
-              #endif
-              if (__pyx_t_8 >= __pyx_temp) break;
-            }
-            #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-            __pyx_t_6 = PyTuple_GET_ITEM(__pyx_t_4, __pyx_t_8); __Pyx_INCREF(__pyx_t_6); __pyx_t_8++; if (unlikely((0 < 0))) __PYX_ERR(0, 338, __pyx_L1_error)
-            #else
-            __pyx_t_6 = __Pyx_PySequence_ITEM(__pyx_t_4, __pyx_t_8); __pyx_t_8++; if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 338, __pyx_L1_error)
-            __Pyx_GOTREF(__pyx_t_6);
+  { /* enter inner scope */
+    __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 422, __pyx_L5_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_INCREF(__pyx_int_0);
+    __pyx_t_2 = __pyx_int_0;
+    if (likely(PyList_CheckExact(__pyx_v_goals)) || PyTuple_CheckExact(__pyx_v_goals)) {
+      __pyx_t_3 = __pyx_v_goals; __Pyx_INCREF(__pyx_t_3);
+      __pyx_t_4 = 0;
+      __pyx_t_5 = NULL;
+    } else {
+      __pyx_t_4 = -1; __pyx_t_3 = PyObject_GetIter(__pyx_v_goals); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 422, __pyx_L5_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_5 = __Pyx_PyObject_GetIterNextFunc(__pyx_t_3); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 422, __pyx_L5_error)
+    }
+    for (;;) {
+      if (likely(!__pyx_t_5)) {
+        if (likely(PyList_CheckExact(__pyx_t_3))) {
+          {
+            Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_3);
+            #if !CYTHON_ASSUME_SAFE_MACROS
+            if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 422, __pyx_L5_error)
             #endif
+            if (__pyx_t_4 >= __pyx_temp) break;
           }
-        } else {
-          __pyx_t_6 = __pyx_t_9(__pyx_t_4);
-          if (unlikely(!__pyx_t_6)) {
-            PyObject* exc_type = PyErr_Occurred();
-            if (exc_type) {
-              if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
-              else __PYX_ERR(0, 338, __pyx_L1_error)
-            }
-            break;
-          }
+          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+          __pyx_t_6 = PyList_GET_ITEM(__pyx_t_3, __pyx_t_4); __Pyx_INCREF(__pyx_t_6); __pyx_t_4++; if (unlikely((0 < 0))) __PYX_ERR(0, 422, __pyx_L5_error)
+          #else
+          __pyx_t_6 = __Pyx_PySequence_ITEM(__pyx_t_3, __pyx_t_4); __pyx_t_4++; if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 422, __pyx_L5_error)
           __Pyx_GOTREF(__pyx_t_6);
-        }
-        if ((likely(PyTuple_CheckExact(__pyx_t_6))) || (PyList_CheckExact(__pyx_t_6))) {
-          PyObject* sequence = __pyx_t_6;
-          Py_ssize_t size = __Pyx_PySequence_SIZE(sequence);
-          if (unlikely(size != 2)) {
-            if (size > 2) __Pyx_RaiseTooManyValuesError(2);
-            else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
-            __PYX_ERR(0, 338, __pyx_L1_error)
+          #endif
+        } else {
+          {
+            Py_ssize_t __pyx_temp = __Pyx_PyTuple_GET_SIZE(__pyx_t_3);
+            #if !CYTHON_ASSUME_SAFE_MACROS
+            if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 422, __pyx_L5_error)
+            #endif
+            if (__pyx_t_4 >= __pyx_temp) break;
           }
           #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-          if (likely(PyTuple_CheckExact(sequence))) {
-            __pyx_t_5 = PyTuple_GET_ITEM(sequence, 0); 
-            __pyx_t_10 = PyTuple_GET_ITEM(sequence, 1); 
-          } else {
-            __pyx_t_5 = PyList_GET_ITEM(sequence, 0); 
-            __pyx_t_10 = PyList_GET_ITEM(sequence, 1); 
-          }
-          __Pyx_INCREF(__pyx_t_5);
-          __Pyx_INCREF(__pyx_t_10);
+          __pyx_t_6 = PyTuple_GET_ITEM(__pyx_t_3, __pyx_t_4); __Pyx_INCREF(__pyx_t_6); __pyx_t_4++; if (unlikely((0 < 0))) __PYX_ERR(0, 422, __pyx_L5_error)
           #else
-          __pyx_t_5 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 338, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_5);
-          __pyx_t_10 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 338, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_10);
+          __pyx_t_6 = __Pyx_PySequence_ITEM(__pyx_t_3, __pyx_t_4); __pyx_t_4++; if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 422, __pyx_L5_error)
+          __Pyx_GOTREF(__pyx_t_6);
           #endif
-          __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-        } else {
-          Py_ssize_t index = -1;
-          __pyx_t_11 = PyObject_GetIter(__pyx_t_6); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 338, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_11);
-          __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-          __pyx_t_12 = __Pyx_PyObject_GetIterNextFunc(__pyx_t_11);
-          index = 0; __pyx_t_5 = __pyx_t_12(__pyx_t_11); if (unlikely(!__pyx_t_5)) goto __pyx_L8_unpacking_failed;
-          __Pyx_GOTREF(__pyx_t_5);
-          index = 1; __pyx_t_10 = __pyx_t_12(__pyx_t_11); if (unlikely(!__pyx_t_10)) goto __pyx_L8_unpacking_failed;
-          __Pyx_GOTREF(__pyx_t_10);
-          if (__Pyx_IternextUnpackEndCheck(__pyx_t_12(__pyx_t_11), 2) < 0) __PYX_ERR(0, 338, __pyx_L1_error)
-          __pyx_t_12 = NULL;
-          __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
-          goto __pyx_L9_unpacking_done;
-          __pyx_L8_unpacking_failed:;
-          __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
-          __pyx_t_12 = NULL;
-          if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
-          __PYX_ERR(0, 338, __pyx_L1_error)
-          __pyx_L9_unpacking_done:;
         }
-        __Pyx_XDECREF_SET(__pyx_v_x, __pyx_t_5);
-        __pyx_t_5 = 0;
-        __Pyx_XDECREF_SET(__pyx_v_y, __pyx_t_10);
-        __pyx_t_10 = 0;
+      } else {
+        __pyx_t_6 = __pyx_t_5(__pyx_t_3);
+        if (unlikely(!__pyx_t_6)) {
+          PyObject* exc_type = PyErr_Occurred();
+          if (exc_type) {
+            if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+            else __PYX_ERR(0, 422, __pyx_L5_error)
+          }
+          break;
+        }
+        __Pyx_GOTREF(__pyx_t_6);
+      }
+      __Pyx_XDECREF_SET(__pyx_8genexpr2__pyx_v_goal, __pyx_t_6);
+      __pyx_t_6 = 0;
+      __Pyx_INCREF(__pyx_t_2);
+      __Pyx_XDECREF_SET(__pyx_8genexpr2__pyx_v_i, __pyx_t_2);
+      __pyx_t_6 = __Pyx_PyInt_AddObjC(__pyx_t_2, __pyx_int_1, 1, 0, 0); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 422, __pyx_L5_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      __Pyx_DECREF(__pyx_t_2);
+      __pyx_t_2 = __pyx_t_6;
+      __pyx_t_6 = 0;
+      __pyx_t_6 = PyNumber_Lshift(__pyx_int_1, __pyx_8genexpr2__pyx_v_i); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 422, __pyx_L5_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      __pyx_t_7 = PyNumber_And(__pyx_v_mask, __pyx_t_6); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 422, __pyx_L5_error)
+      __Pyx_GOTREF(__pyx_t_7);
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __pyx_t_8 = __Pyx_PyObject_IsTrue(__pyx_t_7); if (unlikely((__pyx_t_8 < 0))) __PYX_ERR(0, 422, __pyx_L5_error)
+      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+      __pyx_t_9 = (!__pyx_t_8);
+      if (__pyx_t_9) {
+        if (unlikely(__Pyx_ListComp_Append(__pyx_t_1, (PyObject*)__pyx_8genexpr2__pyx_v_goal))) __PYX_ERR(0, 422, __pyx_L5_error)
+      }
+    }
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_XDECREF(__pyx_8genexpr2__pyx_v_goal); __pyx_8genexpr2__pyx_v_goal = 0;
+    __Pyx_XDECREF(__pyx_8genexpr2__pyx_v_i); __pyx_8genexpr2__pyx_v_i = 0;
+    goto __pyx_L10_exit_scope;
+    __pyx_L5_error:;
+    __Pyx_XDECREF(__pyx_8genexpr2__pyx_v_goal); __pyx_8genexpr2__pyx_v_goal = 0;
+    __Pyx_XDECREF(__pyx_8genexpr2__pyx_v_i); __pyx_8genexpr2__pyx_v_i = 0;
+    goto __pyx_L1_error;
+    __pyx_L10_exit_scope:;
+  } /* exit inner scope */
+  __pyx_v_unvisited = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
 
-        /* "a_star.pyx":339
+  /* "a_star.pyx":423
+ * 
+ *     unvisited = [goal for i, goal in enumerate(goals) if not (mask & (1 << i))]
+ *     if not unvisited:             # <<<<<<<<<<<<<<
+ *         return 0
  * 
- *             for x, y in segment:
- *                 for i in range(-trace_width_scaled, trace_width_scaled + 1):             # <<<<<<<<<<<<<<
- *                     for p in range(-trace_width_scaled, trace_width_scaled+1):
- *                         if y+p < len(grid_vertical)-1 and x+i < len(grid_vertical[0])-1:
  */
-        __pyx_t_6 = PyNumber_Negative(__pyx_v_trace_width_scaled); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 339, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_6);
-        __pyx_t_10 = __Pyx_PyInt_AddObjC(__pyx_v_trace_width_scaled, __pyx_int_1, 1, 0, 0); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 339, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_10);
-        __pyx_t_5 = PyTuple_New(2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 339, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_5);
-        __Pyx_GIVEREF(__pyx_t_6);
-        if (__Pyx_PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_6)) __PYX_ERR(0, 339, __pyx_L1_error);
-        __Pyx_GIVEREF(__pyx_t_10);
-        if (__Pyx_PyTuple_SET_ITEM(__pyx_t_5, 1, __pyx_t_10)) __PYX_ERR(0, 339, __pyx_L1_error);
-        __pyx_t_6 = 0;
-        __pyx_t_10 = 0;
-        __pyx_t_10 = __Pyx_PyObject_Call(__pyx_builtin_range, __pyx_t_5, NULL); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 339, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_10);
-        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-        if (likely(PyList_CheckExact(__pyx_t_10)) || PyTuple_CheckExact(__pyx_t_10)) {
-          __pyx_t_5 = __pyx_t_10; __Pyx_INCREF(__pyx_t_5);
-          __pyx_t_13 = 0;
-          __pyx_t_14 = NULL;
-        } else {
-          __pyx_t_13 = -1; __pyx_t_5 = PyObject_GetIter(__pyx_t_10); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 339, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_5);
-          __pyx_t_14 = __Pyx_PyObject_GetIterNextFunc(__pyx_t_5); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 339, __pyx_L1_error)
-        }
-        __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
-        for (;;) {
-          if (likely(!__pyx_t_14)) {
-            if (likely(PyList_CheckExact(__pyx_t_5))) {
-              {
-                Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_5);
-                #if !CYTHON_ASSUME_SAFE_MACROS
-                if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 339, __pyx_L1_error)
-                #endif
-                if (__pyx_t_13 >= __pyx_temp) break;
-              }
-              #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-              __pyx_t_10 = PyList_GET_ITEM(__pyx_t_5, __pyx_t_13); __Pyx_INCREF(__pyx_t_10); __pyx_t_13++; if (unlikely((0 < 0))) __PYX_ERR(0, 339, __pyx_L1_error)
-              #else
-              __pyx_t_10 = __Pyx_PySequence_ITEM(__pyx_t_5, __pyx_t_13); __pyx_t_13++; if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 339, __pyx_L1_error)
-              __Pyx_GOTREF(__pyx_t_10);
-              #endif
-            } else {
-              {
-                Py_ssize_t __pyx_temp = __Pyx_PyTuple_GET_SIZE(__pyx_t_5);
-                #if !CYTHON_ASSUME_SAFE_MACROS
-                if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 339, __pyx_L1_error)
-                #endif
-                if (__pyx_t_13 >= __pyx_temp) break;
-              }
-              #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-              __pyx_t_10 = PyTuple_GET_ITEM(__pyx_t_5, __pyx_t_13); __Pyx_INCREF(__pyx_t_10); __pyx_t_13++; if (unlikely((0 < 0))) __PYX_ERR(0, 339, __pyx_L1_error)
-              #else
-              __pyx_t_10 = __Pyx_PySequence_ITEM(__pyx_t_5, __pyx_t_13); __pyx_t_13++; if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 339, __pyx_L1_error)
-              __Pyx_GOTREF(__pyx_t_10);
-              #endif
-            }
-          } else {
-            __pyx_t_10 = __pyx_t_14(__pyx_t_5);
-            if (unlikely(!__pyx_t_10)) {
-              PyObject* exc_type = PyErr_Occurred();
-              if (exc_type) {
-                if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
-                else __PYX_ERR(0, 339, __pyx_L1_error)
-              }
-              break;
-            }
-            __Pyx_GOTREF(__pyx_t_10);
-          }
-          __Pyx_XDECREF_SET(__pyx_v_i, __pyx_t_10);
-          __pyx_t_10 = 0;
+  __pyx_t_9 = (PyList_GET_SIZE(__pyx_v_unvisited) != 0);
+  __pyx_t_8 = (!__pyx_t_9);
+  if (__pyx_t_8) {
 
-          /* "a_star.pyx":340
- *             for x, y in segment:
- *                 for i in range(-trace_width_scaled, trace_width_scaled + 1):
- *                     for p in range(-trace_width_scaled, trace_width_scaled+1):             # <<<<<<<<<<<<<<
- *                         if y+p < len(grid_vertical)-1 and x+i < len(grid_vertical[0])-1:
- *                             grid_vertical[y + p][x + i] = 0.9
+    /* "a_star.pyx":424
+ *     unvisited = [goal for i, goal in enumerate(goals) if not (mask & (1 << i))]
+ *     if not unvisited:
+ *         return 0             # <<<<<<<<<<<<<<
+ * 
+ *     return min(_manhattan(current, goal) for goal in unvisited)
  */
-          __pyx_t_10 = PyNumber_Negative(__pyx_v_trace_width_scaled); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 340, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_10);
-          __pyx_t_6 = __Pyx_PyInt_AddObjC(__pyx_v_trace_width_scaled, __pyx_int_1, 1, 0, 0); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 340, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_6);
-          __pyx_t_11 = PyTuple_New(2); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 340, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_11);
-          __Pyx_GIVEREF(__pyx_t_10);
-          if (__Pyx_PyTuple_SET_ITEM(__pyx_t_11, 0, __pyx_t_10)) __PYX_ERR(0, 340, __pyx_L1_error);
-          __Pyx_GIVEREF(__pyx_t_6);
-          if (__Pyx_PyTuple_SET_ITEM(__pyx_t_11, 1, __pyx_t_6)) __PYX_ERR(0, 340, __pyx_L1_error);
-          __pyx_t_10 = 0;
-          __pyx_t_6 = 0;
-          __pyx_t_6 = __Pyx_PyObject_Call(__pyx_builtin_range, __pyx_t_11, NULL); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 340, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_6);
-          __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
-          if (likely(PyList_CheckExact(__pyx_t_6)) || PyTuple_CheckExact(__pyx_t_6)) {
-            __pyx_t_11 = __pyx_t_6; __Pyx_INCREF(__pyx_t_11);
-            __pyx_t_15 = 0;
-            __pyx_t_16 = NULL;
-          } else {
-            __pyx_t_15 = -1; __pyx_t_11 = PyObject_GetIter(__pyx_t_6); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 340, __pyx_L1_error)
-            __Pyx_GOTREF(__pyx_t_11);
-            __pyx_t_16 = __Pyx_PyObject_GetIterNextFunc(__pyx_t_11); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 340, __pyx_L1_error)
-          }
-          __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-          for (;;) {
-            if (likely(!__pyx_t_16)) {
-              if (likely(PyList_CheckExact(__pyx_t_11))) {
-                {
-                  Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_11);
-                  #if !CYTHON_ASSUME_SAFE_MACROS
-                  if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 340, __pyx_L1_error)
-                  #endif
-                  if (__pyx_t_15 >= __pyx_temp) break;
-                }
-                #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-                __pyx_t_6 = PyList_GET_ITEM(__pyx_t_11, __pyx_t_15); __Pyx_INCREF(__pyx_t_6); __pyx_t_15++; if (unlikely((0 < 0))) __PYX_ERR(0, 340, __pyx_L1_error)
-                #else
-                __pyx_t_6 = __Pyx_PySequence_ITEM(__pyx_t_11, __pyx_t_15); __pyx_t_15++; if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 340, __pyx_L1_error)
-                __Pyx_GOTREF(__pyx_t_6);
-                #endif
-              } else {
-                {
-                  Py_ssize_t __pyx_temp = __Pyx_PyTuple_GET_SIZE(__pyx_t_11);
-                  #if !CYTHON_ASSUME_SAFE_MACROS
-                  if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 340, __pyx_L1_error)
-                  #endif
-                  if (__pyx_t_15 >= __pyx_temp) break;
-                }
-                #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-                __pyx_t_6 = PyTuple_GET_ITEM(__pyx_t_11, __pyx_t_15); __Pyx_INCREF(__pyx_t_6); __pyx_t_15++; if (unlikely((0 < 0))) __PYX_ERR(0, 340, __pyx_L1_error)
-                #else
-                __pyx_t_6 = __Pyx_PySequence_ITEM(__pyx_t_11, __pyx_t_15); __pyx_t_15++; if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 340, __pyx_L1_error)
-                __Pyx_GOTREF(__pyx_t_6);
-                #endif
-              }
-            } else {
-              __pyx_t_6 = __pyx_t_16(__pyx_t_11);
-              if (unlikely(!__pyx_t_6)) {
-                PyObject* exc_type = PyErr_Occurred();
-                if (exc_type) {
-                  if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
-                  else __PYX_ERR(0, 340, __pyx_L1_error)
-                }
-                break;
-              }
-              __Pyx_GOTREF(__pyx_t_6);
-            }
-            __Pyx_XDECREF_SET(__pyx_v_p, __pyx_t_6);
-            __pyx_t_6 = 0;
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(__pyx_int_0);
+    __pyx_r = __pyx_int_0;
+    goto __pyx_L0;
 
-            /* "a_star.pyx":341
- *                 for i in range(-trace_width_scaled, trace_width_scaled + 1):
- *                     for p in range(-trace_width_scaled, trace_width_scaled+1):
- *                         if y+p < len(grid_vertical)-1 and x+i < len(grid_vertical[0])-1:             # <<<<<<<<<<<<<<
- *                             grid_vertical[y + p][x + i] = 0.9
+    /* "a_star.pyx":423
+ * 
+ *     unvisited = [goal for i, goal in enumerate(goals) if not (mask & (1 << i))]
+ *     if not unvisited:             # <<<<<<<<<<<<<<
+ *         return 0
  * 
  */
-            __pyx_t_6 = PyNumber_Add(__pyx_v_y, __pyx_v_p); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 341, __pyx_L1_error)
-            __Pyx_GOTREF(__pyx_t_6);
-            __pyx_t_17 = PyObject_Length(__pyx_v_grid_vertical); if (unlikely(__pyx_t_17 == ((Py_ssize_t)-1))) __PYX_ERR(0, 341, __pyx_L1_error)
-            __pyx_t_10 = PyInt_FromSsize_t((__pyx_t_17 - 1)); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 341, __pyx_L1_error)
-            __Pyx_GOTREF(__pyx_t_10);
-            __pyx_t_18 = PyObject_RichCompare(__pyx_t_6, __pyx_t_10, Py_LT); __Pyx_XGOTREF(__pyx_t_18); if (unlikely(!__pyx_t_18)) __PYX_ERR(0, 341, __pyx_L1_error)
-            __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-            __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
-            __pyx_t_19 = __Pyx_PyObject_IsTrue(__pyx_t_18); if (unlikely((__pyx_t_19 < 0))) __PYX_ERR(0, 341, __pyx_L1_error)
-            __Pyx_DECREF(__pyx_t_18); __pyx_t_18 = 0;
-            if (__pyx_t_19) {
-            } else {
-              __pyx_t_7 = __pyx_t_19;
-              goto __pyx_L15_bool_binop_done;
-            }
-            __pyx_t_18 = PyNumber_Add(__pyx_v_x, __pyx_v_i); if (unlikely(!__pyx_t_18)) __PYX_ERR(0, 341, __pyx_L1_error)
-            __Pyx_GOTREF(__pyx_t_18);
-            __pyx_t_10 = __Pyx_GetItemInt(__pyx_v_grid_vertical, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 341, __pyx_L1_error)
-            __Pyx_GOTREF(__pyx_t_10);
-            __pyx_t_17 = PyObject_Length(__pyx_t_10); if (unlikely(__pyx_t_17 == ((Py_ssize_t)-1))) __PYX_ERR(0, 341, __pyx_L1_error)
-            __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
-            __pyx_t_10 = PyInt_FromSsize_t((__pyx_t_17 - 1)); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 341, __pyx_L1_error)
-            __Pyx_GOTREF(__pyx_t_10);
-            __pyx_t_6 = PyObject_RichCompare(__pyx_t_18, __pyx_t_10, Py_LT); __Pyx_XGOTREF(__pyx_t_6); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 341, __pyx_L1_error)
-            __Pyx_DECREF(__pyx_t_18); __pyx_t_18 = 0;
-            __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
-            __pyx_t_19 = __Pyx_PyObject_IsTrue(__pyx_t_6); if (unlikely((__pyx_t_19 < 0))) __PYX_ERR(0, 341, __pyx_L1_error)
-            __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-            __pyx_t_7 = __pyx_t_19;
-            __pyx_L15_bool_binop_done:;
-            if (__pyx_t_7) {
+  }
 
-              /* "a_star.pyx":342
- *                     for p in range(-trace_width_scaled, trace_width_scaled+1):
- *                         if y+p < len(grid_vertical)-1 and x+i < len(grid_vertical[0])-1:
- *                             grid_vertical[y + p][x + i] = 0.9             # <<<<<<<<<<<<<<
+  /* "a_star.pyx":426
+ *         return 0
+ * 
+ *     return min(_manhattan(current, goal) for goal in unvisited)             # <<<<<<<<<<<<<<
+ * 
  * 
- *         # horizontal
  */
-              __pyx_t_6 = PyNumber_Add(__pyx_v_y, __pyx_v_p); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 342, __pyx_L1_error)
-              __Pyx_GOTREF(__pyx_t_6);
-              __pyx_t_10 = __Pyx_PyObject_GetItem(__pyx_v_grid_vertical, __pyx_t_6); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 342, __pyx_L1_error)
-              __Pyx_GOTREF(__pyx_t_10);
-              __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-              __pyx_t_6 = PyNumber_Add(__pyx_v_x, __pyx_v_i); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 342, __pyx_L1_error)
-              __Pyx_GOTREF(__pyx_t_6);
-              if (unlikely((PyObject_SetItem(__pyx_t_10, __pyx_t_6, __pyx_float_0_9) < 0))) __PYX_ERR(0, 342, __pyx_L1_error)
-              __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
-              __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __pyx_pf_6a_star_10_heuristic_genexpr(((PyObject*)__pyx_cur_scope), __pyx_v_unvisited); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 426, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_builtin_min, __pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 426, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
 
-              /* "a_star.pyx":341
- *                 for i in range(-trace_width_scaled, trace_width_scaled + 1):
- *                     for p in range(-trace_width_scaled, trace_width_scaled+1):
- *                         if y+p < len(grid_vertical)-1 and x+i < len(grid_vertical[0])-1:             # <<<<<<<<<<<<<<
- *                             grid_vertical[y + p][x + i] = 0.9
+  /* "a_star.pyx":420
+ * 
  * 
+ * cdef _heuristic(current, mask, goals):             # <<<<<<<<<<<<<<
+ * 
+ *     unvisited = [goal for i, goal in enumerate(goals) if not (mask & (1 << i))]
  */
-            }
 
-            /* "a_star.pyx":340
- *             for x, y in segment:
- *                 for i in range(-trace_width_scaled, trace_width_scaled + 1):
- *                     for p in range(-trace_width_scaled, trace_width_scaled+1):             # <<<<<<<<<<<<<<
- *                         if y+p < len(grid_vertical)-1 and x+i < len(grid_vertical[0])-1:
- *                             grid_vertical[y + p][x + i] = 0.9
- */
-          }
-          __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_AddTraceback("a_star._heuristic", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_unvisited);
+  __Pyx_XDECREF(__pyx_8genexpr2__pyx_v_i);
+  __Pyx_XDECREF(__pyx_8genexpr2__pyx_v_goal);
+  __Pyx_XDECREF(__pyx_gb_6a_star_10_heuristic_2generator);
+  __Pyx_DECREF((PyObject *)__pyx_cur_scope);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
 
-          /* "a_star.pyx":339
+/* "a_star.pyx":429
+ * 
+ * 
+ * cdef lock_trace(grid_vertical, grid_horizontal, segments, trace_width_scaled):             # <<<<<<<<<<<<<<
+ * 
  * 
- *             for x, y in segment:
- *                 for i in range(-trace_width_scaled, trace_width_scaled + 1):             # <<<<<<<<<<<<<<
- *                     for p in range(-trace_width_scaled, trace_width_scaled+1):
- *                         if y+p < len(grid_vertical)-1 and x+i < len(grid_vertical[0])-1:
  */
-        }
-        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
 
-        /* "a_star.pyx":338
- *         if segment[0][0] - segment[-1][0] == 0:
+static PyObject *__pyx_f_6a_star_lock_trace(PyObject *__pyx_v_grid_vertical, PyObject *__pyx_v_grid_horizontal, PyObject *__pyx_v_segments, PyObject *__pyx_v_trace_width_scaled) {
+  PyObject *__pyx_v_segment = NULL;
+  PyObject *__pyx_v_x = NULL;
+  PyObject *__pyx_v_y = NULL;
+  PyObject *__pyx_v_i = NULL;
+  PyObject *__pyx_v_p = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  Py_ssize_t __pyx_t_2;
+  PyObject *(*__pyx_t_3)(PyObject *);
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  int __pyx_t_7;
+  Py_ssize_t __pyx_t_8;
+  PyObject *(*__pyx_t_9)(PyObject *);
+  PyObject *__pyx_t_10 = NULL;
+  PyObject *__pyx_t_11 = NULL;
+  PyObject *(*__pyx_t_12)(PyObject *);
+  Py_ssize_t __pyx_t_13;
+  PyObject *(*__pyx_t_14)(PyObject *);
+  Py_ssize_t __pyx_t_15;
+  PyObject *(*__pyx_t_16)(PyObject *);
+  Py_ssize_t __pyx_t_17;
+  PyObject *__pyx_t_18 = NULL;
+  int __pyx_t_19;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("lock_trace", 1);
+
+  /* "a_star.pyx":432
+ * 
+ * 
+ *     for segment in segments:             # <<<<<<<<<<<<<<
+ *         # vertical
  * 
- *             for x, y in segment:             # <<<<<<<<<<<<<<
- *                 for i in range(-trace_width_scaled, trace_width_scaled + 1):
- *                     for p in range(-trace_width_scaled, trace_width_scaled+1):
  */
+  if (likely(PyList_CheckExact(__pyx_v_segments)) || PyTuple_CheckExact(__pyx_v_segments)) {
+    __pyx_t_1 = __pyx_v_segments; __Pyx_INCREF(__pyx_t_1);
+    __pyx_t_2 = 0;
+    __pyx_t_3 = NULL;
+  } else {
+    __pyx_t_2 = -1; __pyx_t_1 = PyObject_GetIter(__pyx_v_segments); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 432, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_3 = __Pyx_PyObject_GetIterNextFunc(__pyx_t_1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 432, __pyx_L1_error)
+  }
+  for (;;) {
+    if (likely(!__pyx_t_3)) {
+      if (likely(PyList_CheckExact(__pyx_t_1))) {
+        {
+          Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_1);
+          #if !CYTHON_ASSUME_SAFE_MACROS
+          if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 432, __pyx_L1_error)
+          #endif
+          if (__pyx_t_2 >= __pyx_temp) break;
+        }
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_4 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_2); __Pyx_INCREF(__pyx_t_4); __pyx_t_2++; if (unlikely((0 < 0))) __PYX_ERR(0, 432, __pyx_L1_error)
+        #else
+        __pyx_t_4 = __Pyx_PySequence_ITEM(__pyx_t_1, __pyx_t_2); __pyx_t_2++; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 432, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_4);
+        #endif
+      } else {
+        {
+          Py_ssize_t __pyx_temp = __Pyx_PyTuple_GET_SIZE(__pyx_t_1);
+          #if !CYTHON_ASSUME_SAFE_MACROS
+          if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 432, __pyx_L1_error)
+          #endif
+          if (__pyx_t_2 >= __pyx_temp) break;
+        }
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_4 = PyTuple_GET_ITEM(__pyx_t_1, __pyx_t_2); __Pyx_INCREF(__pyx_t_4); __pyx_t_2++; if (unlikely((0 < 0))) __PYX_ERR(0, 432, __pyx_L1_error)
+        #else
+        __pyx_t_4 = __Pyx_PySequence_ITEM(__pyx_t_1, __pyx_t_2); __pyx_t_2++; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 432, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_4);
+        #endif
       }
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    } else {
+      __pyx_t_4 = __pyx_t_3(__pyx_t_1);
+      if (unlikely(!__pyx_t_4)) {
+        PyObject* exc_type = PyErr_Occurred();
+        if (exc_type) {
+          if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+          else __PYX_ERR(0, 432, __pyx_L1_error)
+        }
+        break;
+      }
+      __Pyx_GOTREF(__pyx_t_4);
+    }
+    __Pyx_XDECREF_SET(__pyx_v_segment, __pyx_t_4);
+    __pyx_t_4 = 0;
 
-      /* "a_star.pyx":336
+    /* "a_star.pyx":435
  *         # vertical
  * 
  *         if segment[0][0] - segment[-1][0] == 0:             # <<<<<<<<<<<<<<
  * 
  *             for x, y in segment:
  */
-    }
-
-    /* "a_star.pyx":346
- *         # horizontal
- * 
- *         if segment[0][1] - segment[-1][1] == 0:             # <<<<<<<<<<<<<<
- * 
- *             for x, y in segment:
- */
-    __pyx_t_4 = __Pyx_GetItemInt(__pyx_v_segment, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 346, __pyx_L1_error)
+    __pyx_t_4 = __Pyx_GetItemInt(__pyx_v_segment, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 435, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_5 = __Pyx_GetItemInt(__pyx_t_4, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 346, __pyx_L1_error)
+    __pyx_t_5 = __Pyx_GetItemInt(__pyx_t_4, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 435, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __pyx_t_4 = __Pyx_GetItemInt(__pyx_v_segment, -1L, long, 1, __Pyx_PyInt_From_long, 0, 1, 1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 346, __pyx_L1_error)
+    __pyx_t_4 = __Pyx_GetItemInt(__pyx_v_segment, -1L, long, 1, __Pyx_PyInt_From_long, 0, 1, 1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 435, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_11 = __Pyx_GetItemInt(__pyx_t_4, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 346, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_11);
+    __pyx_t_6 = __Pyx_GetItemInt(__pyx_t_4, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 435, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __pyx_t_4 = PyNumber_Subtract(__pyx_t_5, __pyx_t_11); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 346, __pyx_L1_error)
+    __pyx_t_4 = PyNumber_Subtract(__pyx_t_5, __pyx_t_6); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 435, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
-    __pyx_t_7 = (__Pyx_PyInt_BoolEqObjC(__pyx_t_4, __pyx_int_0, 0, 0)); if (unlikely((__pyx_t_7 < 0))) __PYX_ERR(0, 346, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __pyx_t_7 = (__Pyx_PyInt_BoolEqObjC(__pyx_t_4, __pyx_int_0, 0, 0)); if (unlikely((__pyx_t_7 < 0))) __PYX_ERR(0, 435, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     if (__pyx_t_7) {
 
-      /* "a_star.pyx":348
- *         if segment[0][1] - segment[-1][1] == 0:
+      /* "a_star.pyx":437
+ *         if segment[0][0] - segment[-1][0] == 0:
  * 
  *             for x, y in segment:             # <<<<<<<<<<<<<<
- * 
  *                 for i in range(-trace_width_scaled, trace_width_scaled + 1):
+ *                     for p in range(-trace_width_scaled, trace_width_scaled+1):
  */
       if (likely(PyList_CheckExact(__pyx_v_segment)) || PyTuple_CheckExact(__pyx_v_segment)) {
         __pyx_t_4 = __pyx_v_segment; __Pyx_INCREF(__pyx_t_4);
         __pyx_t_8 = 0;
         __pyx_t_9 = NULL;
       } else {
-        __pyx_t_8 = -1; __pyx_t_4 = PyObject_GetIter(__pyx_v_segment); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 348, __pyx_L1_error)
+        __pyx_t_8 = -1; __pyx_t_4 = PyObject_GetIter(__pyx_v_segment); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 437, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_4);
-        __pyx_t_9 = __Pyx_PyObject_GetIterNextFunc(__pyx_t_4); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 348, __pyx_L1_error)
+        __pyx_t_9 = __Pyx_PyObject_GetIterNextFunc(__pyx_t_4); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 437, __pyx_L1_error)
       }
       for (;;) {
         if (likely(!__pyx_t_9)) {
@@ -10068,473 +11624,869 @@ static PyObject *__pyx_f_6a_star_lock_trace(PyObject *__pyx_v_grid_vertical, PyO
             {
               Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_4);
               #if !CYTHON_ASSUME_SAFE_MACROS
-              if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 348, __pyx_L1_error)
+              if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 437, __pyx_L1_error)
               #endif
               if (__pyx_t_8 >= __pyx_temp) break;
             }
             #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-            __pyx_t_11 = PyList_GET_ITEM(__pyx_t_4, __pyx_t_8); __Pyx_INCREF(__pyx_t_11); __pyx_t_8++; if (unlikely((0 < 0))) __PYX_ERR(0, 348, __pyx_L1_error)
+            __pyx_t_6 = PyList_GET_ITEM(__pyx_t_4, __pyx_t_8); __Pyx_INCREF(__pyx_t_6); __pyx_t_8++; if (unlikely((0 < 0))) __PYX_ERR(0, 437, __pyx_L1_error)
             #else
-            __pyx_t_11 = __Pyx_PySequence_ITEM(__pyx_t_4, __pyx_t_8); __pyx_t_8++; if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 348, __pyx_L1_error)
-            __Pyx_GOTREF(__pyx_t_11);
+            __pyx_t_6 = __Pyx_PySequence_ITEM(__pyx_t_4, __pyx_t_8); __pyx_t_8++; if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 437, __pyx_L1_error)
+            __Pyx_GOTREF(__pyx_t_6);
             #endif
           } else {
             {
               Py_ssize_t __pyx_temp = __Pyx_PyTuple_GET_SIZE(__pyx_t_4);
               #if !CYTHON_ASSUME_SAFE_MACROS
-              if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 348, __pyx_L1_error)
+              if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 437, __pyx_L1_error)
               #endif
               if (__pyx_t_8 >= __pyx_temp) break;
             }
             #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-            __pyx_t_11 = PyTuple_GET_ITEM(__pyx_t_4, __pyx_t_8); __Pyx_INCREF(__pyx_t_11); __pyx_t_8++; if (unlikely((0 < 0))) __PYX_ERR(0, 348, __pyx_L1_error)
+            __pyx_t_6 = PyTuple_GET_ITEM(__pyx_t_4, __pyx_t_8); __Pyx_INCREF(__pyx_t_6); __pyx_t_8++; if (unlikely((0 < 0))) __PYX_ERR(0, 437, __pyx_L1_error)
             #else
-            __pyx_t_11 = __Pyx_PySequence_ITEM(__pyx_t_4, __pyx_t_8); __pyx_t_8++; if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 348, __pyx_L1_error)
-            __Pyx_GOTREF(__pyx_t_11);
+            __pyx_t_6 = __Pyx_PySequence_ITEM(__pyx_t_4, __pyx_t_8); __pyx_t_8++; if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 437, __pyx_L1_error)
+            __Pyx_GOTREF(__pyx_t_6);
             #endif
           }
         } else {
-          __pyx_t_11 = __pyx_t_9(__pyx_t_4);
-          if (unlikely(!__pyx_t_11)) {
+          __pyx_t_6 = __pyx_t_9(__pyx_t_4);
+          if (unlikely(!__pyx_t_6)) {
             PyObject* exc_type = PyErr_Occurred();
             if (exc_type) {
               if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
-              else __PYX_ERR(0, 348, __pyx_L1_error)
+              else __PYX_ERR(0, 437, __pyx_L1_error)
             }
             break;
           }
-          __Pyx_GOTREF(__pyx_t_11);
+          __Pyx_GOTREF(__pyx_t_6);
         }
-        if ((likely(PyTuple_CheckExact(__pyx_t_11))) || (PyList_CheckExact(__pyx_t_11))) {
-          PyObject* sequence = __pyx_t_11;
+        if ((likely(PyTuple_CheckExact(__pyx_t_6))) || (PyList_CheckExact(__pyx_t_6))) {
+          PyObject* sequence = __pyx_t_6;
           Py_ssize_t size = __Pyx_PySequence_SIZE(sequence);
           if (unlikely(size != 2)) {
             if (size > 2) __Pyx_RaiseTooManyValuesError(2);
             else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
-            __PYX_ERR(0, 348, __pyx_L1_error)
+            __PYX_ERR(0, 437, __pyx_L1_error)
           }
           #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
           if (likely(PyTuple_CheckExact(sequence))) {
             __pyx_t_5 = PyTuple_GET_ITEM(sequence, 0); 
-            __pyx_t_6 = PyTuple_GET_ITEM(sequence, 1); 
+            __pyx_t_10 = PyTuple_GET_ITEM(sequence, 1); 
           } else {
             __pyx_t_5 = PyList_GET_ITEM(sequence, 0); 
-            __pyx_t_6 = PyList_GET_ITEM(sequence, 1); 
+            __pyx_t_10 = PyList_GET_ITEM(sequence, 1); 
           }
           __Pyx_INCREF(__pyx_t_5);
-          __Pyx_INCREF(__pyx_t_6);
+          __Pyx_INCREF(__pyx_t_10);
           #else
-          __pyx_t_5 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 348, __pyx_L1_error)
+          __pyx_t_5 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 437, __pyx_L1_error)
           __Pyx_GOTREF(__pyx_t_5);
-          __pyx_t_6 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 348, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_6);
+          __pyx_t_10 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 437, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_10);
           #endif
-          __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+          __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
         } else {
           Py_ssize_t index = -1;
-          __pyx_t_10 = PyObject_GetIter(__pyx_t_11); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 348, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_10);
-          __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
-          __pyx_t_12 = __Pyx_PyObject_GetIterNextFunc(__pyx_t_10);
-          index = 0; __pyx_t_5 = __pyx_t_12(__pyx_t_10); if (unlikely(!__pyx_t_5)) goto __pyx_L23_unpacking_failed;
+          __pyx_t_11 = PyObject_GetIter(__pyx_t_6); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 437, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_11);
+          __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+          __pyx_t_12 = __Pyx_PyObject_GetIterNextFunc(__pyx_t_11);
+          index = 0; __pyx_t_5 = __pyx_t_12(__pyx_t_11); if (unlikely(!__pyx_t_5)) goto __pyx_L8_unpacking_failed;
           __Pyx_GOTREF(__pyx_t_5);
-          index = 1; __pyx_t_6 = __pyx_t_12(__pyx_t_10); if (unlikely(!__pyx_t_6)) goto __pyx_L23_unpacking_failed;
-          __Pyx_GOTREF(__pyx_t_6);
-          if (__Pyx_IternextUnpackEndCheck(__pyx_t_12(__pyx_t_10), 2) < 0) __PYX_ERR(0, 348, __pyx_L1_error)
+          index = 1; __pyx_t_10 = __pyx_t_12(__pyx_t_11); if (unlikely(!__pyx_t_10)) goto __pyx_L8_unpacking_failed;
+          __Pyx_GOTREF(__pyx_t_10);
+          if (__Pyx_IternextUnpackEndCheck(__pyx_t_12(__pyx_t_11), 2) < 0) __PYX_ERR(0, 437, __pyx_L1_error)
           __pyx_t_12 = NULL;
-          __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
-          goto __pyx_L24_unpacking_done;
-          __pyx_L23_unpacking_failed:;
-          __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+          __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+          goto __pyx_L9_unpacking_done;
+          __pyx_L8_unpacking_failed:;
+          __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
           __pyx_t_12 = NULL;
           if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
-          __PYX_ERR(0, 348, __pyx_L1_error)
-          __pyx_L24_unpacking_done:;
+          __PYX_ERR(0, 437, __pyx_L1_error)
+          __pyx_L9_unpacking_done:;
         }
         __Pyx_XDECREF_SET(__pyx_v_x, __pyx_t_5);
         __pyx_t_5 = 0;
-        __Pyx_XDECREF_SET(__pyx_v_y, __pyx_t_6);
-        __pyx_t_6 = 0;
+        __Pyx_XDECREF_SET(__pyx_v_y, __pyx_t_10);
+        __pyx_t_10 = 0;
 
-        /* "a_star.pyx":350
- *             for x, y in segment:
+        /* "a_star.pyx":438
  * 
+ *             for x, y in segment:
  *                 for i in range(-trace_width_scaled, trace_width_scaled + 1):             # <<<<<<<<<<<<<<
  *                     for p in range(-trace_width_scaled, trace_width_scaled+1):
- *                         if y + i < len(grid_horizontal)-1 and x + p < len(grid_horizontal[0])-1:
+ *                         if y+p < len(grid_vertical)-1 and x+i < len(grid_vertical[0])-1:
  */
-        __pyx_t_11 = PyNumber_Negative(__pyx_v_trace_width_scaled); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 350, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_11);
-        __pyx_t_6 = __Pyx_PyInt_AddObjC(__pyx_v_trace_width_scaled, __pyx_int_1, 1, 0, 0); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 350, __pyx_L1_error)
+        __pyx_t_6 = PyNumber_Negative(__pyx_v_trace_width_scaled); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 438, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_6);
-        __pyx_t_5 = PyTuple_New(2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 350, __pyx_L1_error)
+        __pyx_t_10 = __Pyx_PyInt_AddObjC(__pyx_v_trace_width_scaled, __pyx_int_1, 1, 0, 0); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 438, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_10);
+        __pyx_t_5 = PyTuple_New(2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 438, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_5);
-        __Pyx_GIVEREF(__pyx_t_11);
-        if (__Pyx_PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_11)) __PYX_ERR(0, 350, __pyx_L1_error);
         __Pyx_GIVEREF(__pyx_t_6);
-        if (__Pyx_PyTuple_SET_ITEM(__pyx_t_5, 1, __pyx_t_6)) __PYX_ERR(0, 350, __pyx_L1_error);
-        __pyx_t_11 = 0;
+        if (__Pyx_PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_6)) __PYX_ERR(0, 438, __pyx_L1_error);
+        __Pyx_GIVEREF(__pyx_t_10);
+        if (__Pyx_PyTuple_SET_ITEM(__pyx_t_5, 1, __pyx_t_10)) __PYX_ERR(0, 438, __pyx_L1_error);
         __pyx_t_6 = 0;
-        __pyx_t_6 = __Pyx_PyObject_Call(__pyx_builtin_range, __pyx_t_5, NULL); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 350, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_6);
+        __pyx_t_10 = 0;
+        __pyx_t_10 = __Pyx_PyObject_Call(__pyx_builtin_range, __pyx_t_5, NULL); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 438, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_10);
         __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-        if (likely(PyList_CheckExact(__pyx_t_6)) || PyTuple_CheckExact(__pyx_t_6)) {
-          __pyx_t_5 = __pyx_t_6; __Pyx_INCREF(__pyx_t_5);
+        if (likely(PyList_CheckExact(__pyx_t_10)) || PyTuple_CheckExact(__pyx_t_10)) {
+          __pyx_t_5 = __pyx_t_10; __Pyx_INCREF(__pyx_t_5);
           __pyx_t_13 = 0;
           __pyx_t_14 = NULL;
         } else {
-          __pyx_t_13 = -1; __pyx_t_5 = PyObject_GetIter(__pyx_t_6); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 350, __pyx_L1_error)
+          __pyx_t_13 = -1; __pyx_t_5 = PyObject_GetIter(__pyx_t_10); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 438, __pyx_L1_error)
           __Pyx_GOTREF(__pyx_t_5);
-          __pyx_t_14 = __Pyx_PyObject_GetIterNextFunc(__pyx_t_5); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 350, __pyx_L1_error)
+          __pyx_t_14 = __Pyx_PyObject_GetIterNextFunc(__pyx_t_5); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 438, __pyx_L1_error)
         }
-        __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+        __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
         for (;;) {
           if (likely(!__pyx_t_14)) {
             if (likely(PyList_CheckExact(__pyx_t_5))) {
               {
                 Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_5);
                 #if !CYTHON_ASSUME_SAFE_MACROS
-                if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 350, __pyx_L1_error)
+                if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 438, __pyx_L1_error)
                 #endif
                 if (__pyx_t_13 >= __pyx_temp) break;
               }
               #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-              __pyx_t_6 = PyList_GET_ITEM(__pyx_t_5, __pyx_t_13); __Pyx_INCREF(__pyx_t_6); __pyx_t_13++; if (unlikely((0 < 0))) __PYX_ERR(0, 350, __pyx_L1_error)
+              __pyx_t_10 = PyList_GET_ITEM(__pyx_t_5, __pyx_t_13); __Pyx_INCREF(__pyx_t_10); __pyx_t_13++; if (unlikely((0 < 0))) __PYX_ERR(0, 438, __pyx_L1_error)
               #else
-              __pyx_t_6 = __Pyx_PySequence_ITEM(__pyx_t_5, __pyx_t_13); __pyx_t_13++; if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 350, __pyx_L1_error)
-              __Pyx_GOTREF(__pyx_t_6);
+              __pyx_t_10 = __Pyx_PySequence_ITEM(__pyx_t_5, __pyx_t_13); __pyx_t_13++; if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 438, __pyx_L1_error)
+              __Pyx_GOTREF(__pyx_t_10);
               #endif
             } else {
               {
                 Py_ssize_t __pyx_temp = __Pyx_PyTuple_GET_SIZE(__pyx_t_5);
                 #if !CYTHON_ASSUME_SAFE_MACROS
-                if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 350, __pyx_L1_error)
+                if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 438, __pyx_L1_error)
                 #endif
                 if (__pyx_t_13 >= __pyx_temp) break;
               }
               #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-              __pyx_t_6 = PyTuple_GET_ITEM(__pyx_t_5, __pyx_t_13); __Pyx_INCREF(__pyx_t_6); __pyx_t_13++; if (unlikely((0 < 0))) __PYX_ERR(0, 350, __pyx_L1_error)
+              __pyx_t_10 = PyTuple_GET_ITEM(__pyx_t_5, __pyx_t_13); __Pyx_INCREF(__pyx_t_10); __pyx_t_13++; if (unlikely((0 < 0))) __PYX_ERR(0, 438, __pyx_L1_error)
               #else
-              __pyx_t_6 = __Pyx_PySequence_ITEM(__pyx_t_5, __pyx_t_13); __pyx_t_13++; if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 350, __pyx_L1_error)
-              __Pyx_GOTREF(__pyx_t_6);
+              __pyx_t_10 = __Pyx_PySequence_ITEM(__pyx_t_5, __pyx_t_13); __pyx_t_13++; if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 438, __pyx_L1_error)
+              __Pyx_GOTREF(__pyx_t_10);
               #endif
             }
           } else {
-            __pyx_t_6 = __pyx_t_14(__pyx_t_5);
-            if (unlikely(!__pyx_t_6)) {
+            __pyx_t_10 = __pyx_t_14(__pyx_t_5);
+            if (unlikely(!__pyx_t_10)) {
               PyObject* exc_type = PyErr_Occurred();
               if (exc_type) {
                 if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
-                else __PYX_ERR(0, 350, __pyx_L1_error)
+                else __PYX_ERR(0, 438, __pyx_L1_error)
               }
               break;
             }
-            __Pyx_GOTREF(__pyx_t_6);
+            __Pyx_GOTREF(__pyx_t_10);
           }
-          __Pyx_XDECREF_SET(__pyx_v_i, __pyx_t_6);
-          __pyx_t_6 = 0;
+          __Pyx_XDECREF_SET(__pyx_v_i, __pyx_t_10);
+          __pyx_t_10 = 0;
 
-          /* "a_star.pyx":351
- * 
+          /* "a_star.pyx":439
+ *             for x, y in segment:
  *                 for i in range(-trace_width_scaled, trace_width_scaled + 1):
  *                     for p in range(-trace_width_scaled, trace_width_scaled+1):             # <<<<<<<<<<<<<<
- *                         if y + i < len(grid_horizontal)-1 and x + p < len(grid_horizontal[0])-1:
- *                             grid_horizontal[y + i][x + p] = 0.9
+ *                         if y+p < len(grid_vertical)-1 and x+i < len(grid_vertical[0])-1:
+ *                             grid_vertical[y + p][x + i] = 0.9
  */
-          __pyx_t_6 = PyNumber_Negative(__pyx_v_trace_width_scaled); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 351, __pyx_L1_error)
+          __pyx_t_10 = PyNumber_Negative(__pyx_v_trace_width_scaled); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 439, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_10);
+          __pyx_t_6 = __Pyx_PyInt_AddObjC(__pyx_v_trace_width_scaled, __pyx_int_1, 1, 0, 0); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 439, __pyx_L1_error)
           __Pyx_GOTREF(__pyx_t_6);
-          __pyx_t_11 = __Pyx_PyInt_AddObjC(__pyx_v_trace_width_scaled, __pyx_int_1, 1, 0, 0); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 351, __pyx_L1_error)
+          __pyx_t_11 = PyTuple_New(2); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 439, __pyx_L1_error)
           __Pyx_GOTREF(__pyx_t_11);
-          __pyx_t_10 = PyTuple_New(2); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 351, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_10);
+          __Pyx_GIVEREF(__pyx_t_10);
+          if (__Pyx_PyTuple_SET_ITEM(__pyx_t_11, 0, __pyx_t_10)) __PYX_ERR(0, 439, __pyx_L1_error);
           __Pyx_GIVEREF(__pyx_t_6);
-          if (__Pyx_PyTuple_SET_ITEM(__pyx_t_10, 0, __pyx_t_6)) __PYX_ERR(0, 351, __pyx_L1_error);
-          __Pyx_GIVEREF(__pyx_t_11);
-          if (__Pyx_PyTuple_SET_ITEM(__pyx_t_10, 1, __pyx_t_11)) __PYX_ERR(0, 351, __pyx_L1_error);
+          if (__Pyx_PyTuple_SET_ITEM(__pyx_t_11, 1, __pyx_t_6)) __PYX_ERR(0, 439, __pyx_L1_error);
+          __pyx_t_10 = 0;
           __pyx_t_6 = 0;
-          __pyx_t_11 = 0;
-          __pyx_t_11 = __Pyx_PyObject_Call(__pyx_builtin_range, __pyx_t_10, NULL); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 351, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_11);
-          __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
-          if (likely(PyList_CheckExact(__pyx_t_11)) || PyTuple_CheckExact(__pyx_t_11)) {
-            __pyx_t_10 = __pyx_t_11; __Pyx_INCREF(__pyx_t_10);
+          __pyx_t_6 = __Pyx_PyObject_Call(__pyx_builtin_range, __pyx_t_11, NULL); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 439, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_6);
+          __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+          if (likely(PyList_CheckExact(__pyx_t_6)) || PyTuple_CheckExact(__pyx_t_6)) {
+            __pyx_t_11 = __pyx_t_6; __Pyx_INCREF(__pyx_t_11);
             __pyx_t_15 = 0;
             __pyx_t_16 = NULL;
           } else {
-            __pyx_t_15 = -1; __pyx_t_10 = PyObject_GetIter(__pyx_t_11); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 351, __pyx_L1_error)
-            __Pyx_GOTREF(__pyx_t_10);
-            __pyx_t_16 = __Pyx_PyObject_GetIterNextFunc(__pyx_t_10); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 351, __pyx_L1_error)
+            __pyx_t_15 = -1; __pyx_t_11 = PyObject_GetIter(__pyx_t_6); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 439, __pyx_L1_error)
+            __Pyx_GOTREF(__pyx_t_11);
+            __pyx_t_16 = __Pyx_PyObject_GetIterNextFunc(__pyx_t_11); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 439, __pyx_L1_error)
           }
-          __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+          __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
           for (;;) {
             if (likely(!__pyx_t_16)) {
-              if (likely(PyList_CheckExact(__pyx_t_10))) {
+              if (likely(PyList_CheckExact(__pyx_t_11))) {
                 {
-                  Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_10);
+                  Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_11);
                   #if !CYTHON_ASSUME_SAFE_MACROS
-                  if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 351, __pyx_L1_error)
+                  if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 439, __pyx_L1_error)
                   #endif
                   if (__pyx_t_15 >= __pyx_temp) break;
                 }
                 #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-                __pyx_t_11 = PyList_GET_ITEM(__pyx_t_10, __pyx_t_15); __Pyx_INCREF(__pyx_t_11); __pyx_t_15++; if (unlikely((0 < 0))) __PYX_ERR(0, 351, __pyx_L1_error)
+                __pyx_t_6 = PyList_GET_ITEM(__pyx_t_11, __pyx_t_15); __Pyx_INCREF(__pyx_t_6); __pyx_t_15++; if (unlikely((0 < 0))) __PYX_ERR(0, 439, __pyx_L1_error)
                 #else
-                __pyx_t_11 = __Pyx_PySequence_ITEM(__pyx_t_10, __pyx_t_15); __pyx_t_15++; if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 351, __pyx_L1_error)
-                __Pyx_GOTREF(__pyx_t_11);
+                __pyx_t_6 = __Pyx_PySequence_ITEM(__pyx_t_11, __pyx_t_15); __pyx_t_15++; if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 439, __pyx_L1_error)
+                __Pyx_GOTREF(__pyx_t_6);
                 #endif
               } else {
                 {
-                  Py_ssize_t __pyx_temp = __Pyx_PyTuple_GET_SIZE(__pyx_t_10);
+                  Py_ssize_t __pyx_temp = __Pyx_PyTuple_GET_SIZE(__pyx_t_11);
                   #if !CYTHON_ASSUME_SAFE_MACROS
-                  if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 351, __pyx_L1_error)
+                  if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 439, __pyx_L1_error)
                   #endif
                   if (__pyx_t_15 >= __pyx_temp) break;
                 }
                 #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-                __pyx_t_11 = PyTuple_GET_ITEM(__pyx_t_10, __pyx_t_15); __Pyx_INCREF(__pyx_t_11); __pyx_t_15++; if (unlikely((0 < 0))) __PYX_ERR(0, 351, __pyx_L1_error)
+                __pyx_t_6 = PyTuple_GET_ITEM(__pyx_t_11, __pyx_t_15); __Pyx_INCREF(__pyx_t_6); __pyx_t_15++; if (unlikely((0 < 0))) __PYX_ERR(0, 439, __pyx_L1_error)
                 #else
-                __pyx_t_11 = __Pyx_PySequence_ITEM(__pyx_t_10, __pyx_t_15); __pyx_t_15++; if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 351, __pyx_L1_error)
-                __Pyx_GOTREF(__pyx_t_11);
+                __pyx_t_6 = __Pyx_PySequence_ITEM(__pyx_t_11, __pyx_t_15); __pyx_t_15++; if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 439, __pyx_L1_error)
+                __Pyx_GOTREF(__pyx_t_6);
                 #endif
               }
             } else {
-              __pyx_t_11 = __pyx_t_16(__pyx_t_10);
-              if (unlikely(!__pyx_t_11)) {
+              __pyx_t_6 = __pyx_t_16(__pyx_t_11);
+              if (unlikely(!__pyx_t_6)) {
                 PyObject* exc_type = PyErr_Occurred();
                 if (exc_type) {
                   if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
-                  else __PYX_ERR(0, 351, __pyx_L1_error)
+                  else __PYX_ERR(0, 439, __pyx_L1_error)
                 }
                 break;
               }
-              __Pyx_GOTREF(__pyx_t_11);
+              __Pyx_GOTREF(__pyx_t_6);
             }
-            __Pyx_XDECREF_SET(__pyx_v_p, __pyx_t_11);
-            __pyx_t_11 = 0;
+            __Pyx_XDECREF_SET(__pyx_v_p, __pyx_t_6);
+            __pyx_t_6 = 0;
 
-            /* "a_star.pyx":352
+            /* "a_star.pyx":440
  *                 for i in range(-trace_width_scaled, trace_width_scaled + 1):
  *                     for p in range(-trace_width_scaled, trace_width_scaled+1):
- *                         if y + i < len(grid_horizontal)-1 and x + p < len(grid_horizontal[0])-1:             # <<<<<<<<<<<<<<
- *                             grid_horizontal[y + i][x + p] = 0.9
+ *                         if y+p < len(grid_vertical)-1 and x+i < len(grid_vertical[0])-1:             # <<<<<<<<<<<<<<
+ *                             grid_vertical[y + p][x + i] = 0.9
  * 
  */
-            __pyx_t_11 = PyNumber_Add(__pyx_v_y, __pyx_v_i); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 352, __pyx_L1_error)
-            __Pyx_GOTREF(__pyx_t_11);
-            __pyx_t_17 = PyObject_Length(__pyx_v_grid_horizontal); if (unlikely(__pyx_t_17 == ((Py_ssize_t)-1))) __PYX_ERR(0, 352, __pyx_L1_error)
-            __pyx_t_6 = PyInt_FromSsize_t((__pyx_t_17 - 1)); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 352, __pyx_L1_error)
+            __pyx_t_6 = PyNumber_Add(__pyx_v_y, __pyx_v_p); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 440, __pyx_L1_error)
             __Pyx_GOTREF(__pyx_t_6);
-            __pyx_t_18 = PyObject_RichCompare(__pyx_t_11, __pyx_t_6, Py_LT); __Pyx_XGOTREF(__pyx_t_18); if (unlikely(!__pyx_t_18)) __PYX_ERR(0, 352, __pyx_L1_error)
-            __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+            __pyx_t_17 = PyObject_Length(__pyx_v_grid_vertical); if (unlikely(__pyx_t_17 == ((Py_ssize_t)-1))) __PYX_ERR(0, 440, __pyx_L1_error)
+            __pyx_t_10 = PyInt_FromSsize_t((__pyx_t_17 - 1)); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 440, __pyx_L1_error)
+            __Pyx_GOTREF(__pyx_t_10);
+            __pyx_t_18 = PyObject_RichCompare(__pyx_t_6, __pyx_t_10, Py_LT); __Pyx_XGOTREF(__pyx_t_18); if (unlikely(!__pyx_t_18)) __PYX_ERR(0, 440, __pyx_L1_error)
             __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-            __pyx_t_19 = __Pyx_PyObject_IsTrue(__pyx_t_18); if (unlikely((__pyx_t_19 < 0))) __PYX_ERR(0, 352, __pyx_L1_error)
+            __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+            __pyx_t_19 = __Pyx_PyObject_IsTrue(__pyx_t_18); if (unlikely((__pyx_t_19 < 0))) __PYX_ERR(0, 440, __pyx_L1_error)
             __Pyx_DECREF(__pyx_t_18); __pyx_t_18 = 0;
             if (__pyx_t_19) {
             } else {
               __pyx_t_7 = __pyx_t_19;
-              goto __pyx_L30_bool_binop_done;
+              goto __pyx_L15_bool_binop_done;
             }
-            __pyx_t_18 = PyNumber_Add(__pyx_v_x, __pyx_v_p); if (unlikely(!__pyx_t_18)) __PYX_ERR(0, 352, __pyx_L1_error)
+            __pyx_t_18 = PyNumber_Add(__pyx_v_x, __pyx_v_i); if (unlikely(!__pyx_t_18)) __PYX_ERR(0, 440, __pyx_L1_error)
             __Pyx_GOTREF(__pyx_t_18);
-            __pyx_t_6 = __Pyx_GetItemInt(__pyx_v_grid_horizontal, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 352, __pyx_L1_error)
-            __Pyx_GOTREF(__pyx_t_6);
-            __pyx_t_17 = PyObject_Length(__pyx_t_6); if (unlikely(__pyx_t_17 == ((Py_ssize_t)-1))) __PYX_ERR(0, 352, __pyx_L1_error)
-            __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-            __pyx_t_6 = PyInt_FromSsize_t((__pyx_t_17 - 1)); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 352, __pyx_L1_error)
-            __Pyx_GOTREF(__pyx_t_6);
-            __pyx_t_11 = PyObject_RichCompare(__pyx_t_18, __pyx_t_6, Py_LT); __Pyx_XGOTREF(__pyx_t_11); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 352, __pyx_L1_error)
+            __pyx_t_10 = __Pyx_GetItemInt(__pyx_v_grid_vertical, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 440, __pyx_L1_error)
+            __Pyx_GOTREF(__pyx_t_10);
+            __pyx_t_17 = PyObject_Length(__pyx_t_10); if (unlikely(__pyx_t_17 == ((Py_ssize_t)-1))) __PYX_ERR(0, 440, __pyx_L1_error)
+            __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+            __pyx_t_10 = PyInt_FromSsize_t((__pyx_t_17 - 1)); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 440, __pyx_L1_error)
+            __Pyx_GOTREF(__pyx_t_10);
+            __pyx_t_6 = PyObject_RichCompare(__pyx_t_18, __pyx_t_10, Py_LT); __Pyx_XGOTREF(__pyx_t_6); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 440, __pyx_L1_error)
             __Pyx_DECREF(__pyx_t_18); __pyx_t_18 = 0;
+            __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+            __pyx_t_19 = __Pyx_PyObject_IsTrue(__pyx_t_6); if (unlikely((__pyx_t_19 < 0))) __PYX_ERR(0, 440, __pyx_L1_error)
             __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-            __pyx_t_19 = __Pyx_PyObject_IsTrue(__pyx_t_11); if (unlikely((__pyx_t_19 < 0))) __PYX_ERR(0, 352, __pyx_L1_error)
-            __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
             __pyx_t_7 = __pyx_t_19;
-            __pyx_L30_bool_binop_done:;
+            __pyx_L15_bool_binop_done:;
             if (__pyx_t_7) {
 
-              /* "a_star.pyx":353
+              /* "a_star.pyx":441
  *                     for p in range(-trace_width_scaled, trace_width_scaled+1):
- *                         if y + i < len(grid_horizontal)-1 and x + p < len(grid_horizontal[0])-1:
- *                             grid_horizontal[y + i][x + p] = 0.9             # <<<<<<<<<<<<<<
+ *                         if y+p < len(grid_vertical)-1 and x+i < len(grid_vertical[0])-1:
+ *                             grid_vertical[y + p][x + i] = 0.9             # <<<<<<<<<<<<<<
  * 
- *     return grid_vertical, grid_horizontal
+ *         # horizontal
  */
-              __pyx_t_11 = PyNumber_Add(__pyx_v_y, __pyx_v_i); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 353, __pyx_L1_error)
-              __Pyx_GOTREF(__pyx_t_11);
-              __pyx_t_6 = __Pyx_PyObject_GetItem(__pyx_v_grid_horizontal, __pyx_t_11); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 353, __pyx_L1_error)
+              __pyx_t_6 = PyNumber_Add(__pyx_v_y, __pyx_v_p); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 441, __pyx_L1_error)
               __Pyx_GOTREF(__pyx_t_6);
-              __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
-              __pyx_t_11 = PyNumber_Add(__pyx_v_x, __pyx_v_p); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 353, __pyx_L1_error)
-              __Pyx_GOTREF(__pyx_t_11);
-              if (unlikely((PyObject_SetItem(__pyx_t_6, __pyx_t_11, __pyx_float_0_9) < 0))) __PYX_ERR(0, 353, __pyx_L1_error)
+              __pyx_t_10 = __Pyx_PyObject_GetItem(__pyx_v_grid_vertical, __pyx_t_6); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 441, __pyx_L1_error)
+              __Pyx_GOTREF(__pyx_t_10);
+              __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+              __pyx_t_6 = PyNumber_Add(__pyx_v_x, __pyx_v_i); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 441, __pyx_L1_error)
+              __Pyx_GOTREF(__pyx_t_6);
+              if (unlikely((PyObject_SetItem(__pyx_t_10, __pyx_t_6, __pyx_float_0_9) < 0))) __PYX_ERR(0, 441, __pyx_L1_error)
+              __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
               __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-              __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
 
-              /* "a_star.pyx":352
+              /* "a_star.pyx":440
  *                 for i in range(-trace_width_scaled, trace_width_scaled + 1):
  *                     for p in range(-trace_width_scaled, trace_width_scaled+1):
- *                         if y + i < len(grid_horizontal)-1 and x + p < len(grid_horizontal[0])-1:             # <<<<<<<<<<<<<<
- *                             grid_horizontal[y + i][x + p] = 0.9
+ *                         if y+p < len(grid_vertical)-1 and x+i < len(grid_vertical[0])-1:             # <<<<<<<<<<<<<<
+ *                             grid_vertical[y + p][x + i] = 0.9
  * 
  */
             }
 
-            /* "a_star.pyx":351
- * 
+            /* "a_star.pyx":439
+ *             for x, y in segment:
  *                 for i in range(-trace_width_scaled, trace_width_scaled + 1):
  *                     for p in range(-trace_width_scaled, trace_width_scaled+1):             # <<<<<<<<<<<<<<
- *                         if y + i < len(grid_horizontal)-1 and x + p < len(grid_horizontal[0])-1:
- *                             grid_horizontal[y + i][x + p] = 0.9
+ *                         if y+p < len(grid_vertical)-1 and x+i < len(grid_vertical[0])-1:
+ *                             grid_vertical[y + p][x + i] = 0.9
  */
           }
-          __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+          __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
 
-          /* "a_star.pyx":350
- *             for x, y in segment:
+          /* "a_star.pyx":438
  * 
+ *             for x, y in segment:
  *                 for i in range(-trace_width_scaled, trace_width_scaled + 1):             # <<<<<<<<<<<<<<
  *                     for p in range(-trace_width_scaled, trace_width_scaled+1):
- *                         if y + i < len(grid_horizontal)-1 and x + p < len(grid_horizontal[0])-1:
+ *                         if y+p < len(grid_vertical)-1 and x+i < len(grid_vertical[0])-1:
  */
         }
         __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
 
-        /* "a_star.pyx":348
- *         if segment[0][1] - segment[-1][1] == 0:
+        /* "a_star.pyx":437
+ *         if segment[0][0] - segment[-1][0] == 0:
  * 
  *             for x, y in segment:             # <<<<<<<<<<<<<<
- * 
  *                 for i in range(-trace_width_scaled, trace_width_scaled + 1):
+ *                     for p in range(-trace_width_scaled, trace_width_scaled+1):
  */
       }
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
 
-      /* "a_star.pyx":346
- *         # horizontal
+      /* "a_star.pyx":435
+ *         # vertical
  * 
- *         if segment[0][1] - segment[-1][1] == 0:             # <<<<<<<<<<<<<<
+ *         if segment[0][0] - segment[-1][0] == 0:             # <<<<<<<<<<<<<<
  * 
  *             for x, y in segment:
  */
     }
 
-    /* "a_star.pyx":333
- * 
- * 
- *     for segment in segments:             # <<<<<<<<<<<<<<
- *         # vertical
- * 
- */
-  }
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  /* "a_star.pyx":355
- *                             grid_horizontal[y + i][x + p] = 0.9
+    /* "a_star.pyx":445
+ *         # horizontal
  * 
- *     return grid_vertical, grid_horizontal             # <<<<<<<<<<<<<<
+ *         if segment[0][1] - segment[-1][1] == 0:             # <<<<<<<<<<<<<<
  * 
- * cdef direction(p1, p2):
+ *             for x, y in segment:
  */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 355, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_INCREF(__pyx_v_grid_vertical);
-  __Pyx_GIVEREF(__pyx_v_grid_vertical);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_grid_vertical)) __PYX_ERR(0, 355, __pyx_L1_error);
-  __Pyx_INCREF(__pyx_v_grid_horizontal);
-  __Pyx_GIVEREF(__pyx_v_grid_horizontal);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_v_grid_horizontal)) __PYX_ERR(0, 355, __pyx_L1_error);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
+    __pyx_t_4 = __Pyx_GetItemInt(__pyx_v_segment, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 445, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_5 = __Pyx_GetItemInt(__pyx_t_4, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 445, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_4 = __Pyx_GetItemInt(__pyx_v_segment, -1L, long, 1, __Pyx_PyInt_From_long, 0, 1, 1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 445, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_11 = __Pyx_GetItemInt(__pyx_t_4, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 445, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_11);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_4 = PyNumber_Subtract(__pyx_t_5, __pyx_t_11); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 445, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+    __pyx_t_7 = (__Pyx_PyInt_BoolEqObjC(__pyx_t_4, __pyx_int_0, 0, 0)); if (unlikely((__pyx_t_7 < 0))) __PYX_ERR(0, 445, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (__pyx_t_7) {
 
-  /* "a_star.pyx":330
- * 
- * 
- * cdef lock_trace(grid_vertical, grid_horizontal, segments, trace_width_scaled):             # <<<<<<<<<<<<<<
+      /* "a_star.pyx":447
+ *         if segment[0][1] - segment[-1][1] == 0:
  * 
+ *             for x, y in segment:             # <<<<<<<<<<<<<<
  * 
+ *                 for i in range(-trace_width_scaled, trace_width_scaled + 1):
  */
+      if (likely(PyList_CheckExact(__pyx_v_segment)) || PyTuple_CheckExact(__pyx_v_segment)) {
+        __pyx_t_4 = __pyx_v_segment; __Pyx_INCREF(__pyx_t_4);
+        __pyx_t_8 = 0;
+        __pyx_t_9 = NULL;
+      } else {
+        __pyx_t_8 = -1; __pyx_t_4 = PyObject_GetIter(__pyx_v_segment); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 447, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_4);
+        __pyx_t_9 = __Pyx_PyObject_GetIterNextFunc(__pyx_t_4); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 447, __pyx_L1_error)
+      }
+      for (;;) {
+        if (likely(!__pyx_t_9)) {
+          if (likely(PyList_CheckExact(__pyx_t_4))) {
+            {
+              Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_4);
+              #if !CYTHON_ASSUME_SAFE_MACROS
+              if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 447, __pyx_L1_error)
+              #endif
+              if (__pyx_t_8 >= __pyx_temp) break;
+            }
+            #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+            __pyx_t_11 = PyList_GET_ITEM(__pyx_t_4, __pyx_t_8); __Pyx_INCREF(__pyx_t_11); __pyx_t_8++; if (unlikely((0 < 0))) __PYX_ERR(0, 447, __pyx_L1_error)
+            #else
+            __pyx_t_11 = __Pyx_PySequence_ITEM(__pyx_t_4, __pyx_t_8); __pyx_t_8++; if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 447, __pyx_L1_error)
+            __Pyx_GOTREF(__pyx_t_11);
+            #endif
+          } else {
+            {
+              Py_ssize_t __pyx_temp = __Pyx_PyTuple_GET_SIZE(__pyx_t_4);
+              #if !CYTHON_ASSUME_SAFE_MACROS
+              if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 447, __pyx_L1_error)
+              #endif
+              if (__pyx_t_8 >= __pyx_temp) break;
+            }
+            #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+            __pyx_t_11 = PyTuple_GET_ITEM(__pyx_t_4, __pyx_t_8); __Pyx_INCREF(__pyx_t_11); __pyx_t_8++; if (unlikely((0 < 0))) __PYX_ERR(0, 447, __pyx_L1_error)
+            #else
+            __pyx_t_11 = __Pyx_PySequence_ITEM(__pyx_t_4, __pyx_t_8); __pyx_t_8++; if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 447, __pyx_L1_error)
+            __Pyx_GOTREF(__pyx_t_11);
+            #endif
+          }
+        } else {
+          __pyx_t_11 = __pyx_t_9(__pyx_t_4);
+          if (unlikely(!__pyx_t_11)) {
+            PyObject* exc_type = PyErr_Occurred();
+            if (exc_type) {
+              if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+              else __PYX_ERR(0, 447, __pyx_L1_error)
+            }
+            break;
+          }
+          __Pyx_GOTREF(__pyx_t_11);
+        }
+        if ((likely(PyTuple_CheckExact(__pyx_t_11))) || (PyList_CheckExact(__pyx_t_11))) {
+          PyObject* sequence = __pyx_t_11;
+          Py_ssize_t size = __Pyx_PySequence_SIZE(sequence);
+          if (unlikely(size != 2)) {
+            if (size > 2) __Pyx_RaiseTooManyValuesError(2);
+            else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
+            __PYX_ERR(0, 447, __pyx_L1_error)
+          }
+          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+          if (likely(PyTuple_CheckExact(sequence))) {
+            __pyx_t_5 = PyTuple_GET_ITEM(sequence, 0); 
+            __pyx_t_6 = PyTuple_GET_ITEM(sequence, 1); 
+          } else {
+            __pyx_t_5 = PyList_GET_ITEM(sequence, 0); 
+            __pyx_t_6 = PyList_GET_ITEM(sequence, 1); 
+          }
+          __Pyx_INCREF(__pyx_t_5);
+          __Pyx_INCREF(__pyx_t_6);
+          #else
+          __pyx_t_5 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 447, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_5);
+          __pyx_t_6 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 447, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_6);
+          #endif
+          __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+        } else {
+          Py_ssize_t index = -1;
+          __pyx_t_10 = PyObject_GetIter(__pyx_t_11); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 447, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_10);
+          __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+          __pyx_t_12 = __Pyx_PyObject_GetIterNextFunc(__pyx_t_10);
+          index = 0; __pyx_t_5 = __pyx_t_12(__pyx_t_10); if (unlikely(!__pyx_t_5)) goto __pyx_L23_unpacking_failed;
+          __Pyx_GOTREF(__pyx_t_5);
+          index = 1; __pyx_t_6 = __pyx_t_12(__pyx_t_10); if (unlikely(!__pyx_t_6)) goto __pyx_L23_unpacking_failed;
+          __Pyx_GOTREF(__pyx_t_6);
+          if (__Pyx_IternextUnpackEndCheck(__pyx_t_12(__pyx_t_10), 2) < 0) __PYX_ERR(0, 447, __pyx_L1_error)
+          __pyx_t_12 = NULL;
+          __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+          goto __pyx_L24_unpacking_done;
+          __pyx_L23_unpacking_failed:;
+          __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+          __pyx_t_12 = NULL;
+          if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
+          __PYX_ERR(0, 447, __pyx_L1_error)
+          __pyx_L24_unpacking_done:;
+        }
+        __Pyx_XDECREF_SET(__pyx_v_x, __pyx_t_5);
+        __pyx_t_5 = 0;
+        __Pyx_XDECREF_SET(__pyx_v_y, __pyx_t_6);
+        __pyx_t_6 = 0;
 
-  /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_XDECREF(__pyx_t_6);
-  __Pyx_XDECREF(__pyx_t_10);
-  __Pyx_XDECREF(__pyx_t_11);
-  __Pyx_XDECREF(__pyx_t_18);
-  __Pyx_AddTraceback("a_star.lock_trace", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_XDECREF(__pyx_v_segment);
-  __Pyx_XDECREF(__pyx_v_x);
-  __Pyx_XDECREF(__pyx_v_y);
-  __Pyx_XDECREF(__pyx_v_i);
-  __Pyx_XDECREF(__pyx_v_p);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "a_star.pyx":357
- *     return grid_vertical, grid_horizontal
+        /* "a_star.pyx":449
+ *             for x, y in segment:
  * 
- * cdef direction(p1, p2):             # <<<<<<<<<<<<<<
- *     dx = p2[0] - p1[0]
- *     dy = p2[1] - p1[1]
+ *                 for i in range(-trace_width_scaled, trace_width_scaled + 1):             # <<<<<<<<<<<<<<
+ *                     for p in range(-trace_width_scaled, trace_width_scaled+1):
+ *                         if y + i < len(grid_horizontal)-1 and x + p < len(grid_horizontal[0])-1:
  */
+        __pyx_t_11 = PyNumber_Negative(__pyx_v_trace_width_scaled); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 449, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_11);
+        __pyx_t_6 = __Pyx_PyInt_AddObjC(__pyx_v_trace_width_scaled, __pyx_int_1, 1, 0, 0); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 449, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_6);
+        __pyx_t_5 = PyTuple_New(2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 449, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_5);
+        __Pyx_GIVEREF(__pyx_t_11);
+        if (__Pyx_PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_11)) __PYX_ERR(0, 449, __pyx_L1_error);
+        __Pyx_GIVEREF(__pyx_t_6);
+        if (__Pyx_PyTuple_SET_ITEM(__pyx_t_5, 1, __pyx_t_6)) __PYX_ERR(0, 449, __pyx_L1_error);
+        __pyx_t_11 = 0;
+        __pyx_t_6 = 0;
+        __pyx_t_6 = __Pyx_PyObject_Call(__pyx_builtin_range, __pyx_t_5, NULL); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 449, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_6);
+        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+        if (likely(PyList_CheckExact(__pyx_t_6)) || PyTuple_CheckExact(__pyx_t_6)) {
+          __pyx_t_5 = __pyx_t_6; __Pyx_INCREF(__pyx_t_5);
+          __pyx_t_13 = 0;
+          __pyx_t_14 = NULL;
+        } else {
+          __pyx_t_13 = -1; __pyx_t_5 = PyObject_GetIter(__pyx_t_6); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 449, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_5);
+          __pyx_t_14 = __Pyx_PyObject_GetIterNextFunc(__pyx_t_5); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 449, __pyx_L1_error)
+        }
+        __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+        for (;;) {
+          if (likely(!__pyx_t_14)) {
+            if (likely(PyList_CheckExact(__pyx_t_5))) {
+              {
+                Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_5);
+                #if !CYTHON_ASSUME_SAFE_MACROS
+                if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 449, __pyx_L1_error)
+                #endif
+                if (__pyx_t_13 >= __pyx_temp) break;
+              }
+              #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+              __pyx_t_6 = PyList_GET_ITEM(__pyx_t_5, __pyx_t_13); __Pyx_INCREF(__pyx_t_6); __pyx_t_13++; if (unlikely((0 < 0))) __PYX_ERR(0, 449, __pyx_L1_error)
+              #else
+              __pyx_t_6 = __Pyx_PySequence_ITEM(__pyx_t_5, __pyx_t_13); __pyx_t_13++; if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 449, __pyx_L1_error)
+              __Pyx_GOTREF(__pyx_t_6);
+              #endif
+            } else {
+              {
+                Py_ssize_t __pyx_temp = __Pyx_PyTuple_GET_SIZE(__pyx_t_5);
+                #if !CYTHON_ASSUME_SAFE_MACROS
+                if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 449, __pyx_L1_error)
+                #endif
+                if (__pyx_t_13 >= __pyx_temp) break;
+              }
+              #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+              __pyx_t_6 = PyTuple_GET_ITEM(__pyx_t_5, __pyx_t_13); __Pyx_INCREF(__pyx_t_6); __pyx_t_13++; if (unlikely((0 < 0))) __PYX_ERR(0, 449, __pyx_L1_error)
+              #else
+              __pyx_t_6 = __Pyx_PySequence_ITEM(__pyx_t_5, __pyx_t_13); __pyx_t_13++; if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 449, __pyx_L1_error)
+              __Pyx_GOTREF(__pyx_t_6);
+              #endif
+            }
+          } else {
+            __pyx_t_6 = __pyx_t_14(__pyx_t_5);
+            if (unlikely(!__pyx_t_6)) {
+              PyObject* exc_type = PyErr_Occurred();
+              if (exc_type) {
+                if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+                else __PYX_ERR(0, 449, __pyx_L1_error)
+              }
+              break;
+            }
+            __Pyx_GOTREF(__pyx_t_6);
+          }
+          __Pyx_XDECREF_SET(__pyx_v_i, __pyx_t_6);
+          __pyx_t_6 = 0;
 
-static PyObject *__pyx_f_6a_star_direction(PyObject *__pyx_v_p1, PyObject *__pyx_v_p2) {
-  PyObject *__pyx_v_dx = NULL;
-  PyObject *__pyx_v_dy = NULL;
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("direction", 1);
-
-  /* "a_star.pyx":358
+          /* "a_star.pyx":450
  * 
- * cdef direction(p1, p2):
- *     dx = p2[0] - p1[0]             # <<<<<<<<<<<<<<
- *     dy = p2[1] - p1[1]
- *     return dx, dy
+ *                 for i in range(-trace_width_scaled, trace_width_scaled + 1):
+ *                     for p in range(-trace_width_scaled, trace_width_scaled+1):             # <<<<<<<<<<<<<<
+ *                         if y + i < len(grid_horizontal)-1 and x + p < len(grid_horizontal[0])-1:
+ *                             grid_horizontal[y + i][x + p] = 0.9
  */
-  __pyx_t_1 = __Pyx_GetItemInt(__pyx_v_p2, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 358, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_GetItemInt(__pyx_v_p1, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 358, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = PyNumber_Subtract(__pyx_t_1, __pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 358, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_v_dx = __pyx_t_3;
-  __pyx_t_3 = 0;
+          __pyx_t_6 = PyNumber_Negative(__pyx_v_trace_width_scaled); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 450, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_6);
+          __pyx_t_11 = __Pyx_PyInt_AddObjC(__pyx_v_trace_width_scaled, __pyx_int_1, 1, 0, 0); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 450, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_11);
+          __pyx_t_10 = PyTuple_New(2); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 450, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_10);
+          __Pyx_GIVEREF(__pyx_t_6);
+          if (__Pyx_PyTuple_SET_ITEM(__pyx_t_10, 0, __pyx_t_6)) __PYX_ERR(0, 450, __pyx_L1_error);
+          __Pyx_GIVEREF(__pyx_t_11);
+          if (__Pyx_PyTuple_SET_ITEM(__pyx_t_10, 1, __pyx_t_11)) __PYX_ERR(0, 450, __pyx_L1_error);
+          __pyx_t_6 = 0;
+          __pyx_t_11 = 0;
+          __pyx_t_11 = __Pyx_PyObject_Call(__pyx_builtin_range, __pyx_t_10, NULL); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 450, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_11);
+          __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+          if (likely(PyList_CheckExact(__pyx_t_11)) || PyTuple_CheckExact(__pyx_t_11)) {
+            __pyx_t_10 = __pyx_t_11; __Pyx_INCREF(__pyx_t_10);
+            __pyx_t_15 = 0;
+            __pyx_t_16 = NULL;
+          } else {
+            __pyx_t_15 = -1; __pyx_t_10 = PyObject_GetIter(__pyx_t_11); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 450, __pyx_L1_error)
+            __Pyx_GOTREF(__pyx_t_10);
+            __pyx_t_16 = __Pyx_PyObject_GetIterNextFunc(__pyx_t_10); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 450, __pyx_L1_error)
+          }
+          __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+          for (;;) {
+            if (likely(!__pyx_t_16)) {
+              if (likely(PyList_CheckExact(__pyx_t_10))) {
+                {
+                  Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_10);
+                  #if !CYTHON_ASSUME_SAFE_MACROS
+                  if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 450, __pyx_L1_error)
+                  #endif
+                  if (__pyx_t_15 >= __pyx_temp) break;
+                }
+                #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+                __pyx_t_11 = PyList_GET_ITEM(__pyx_t_10, __pyx_t_15); __Pyx_INCREF(__pyx_t_11); __pyx_t_15++; if (unlikely((0 < 0))) __PYX_ERR(0, 450, __pyx_L1_error)
+                #else
+                __pyx_t_11 = __Pyx_PySequence_ITEM(__pyx_t_10, __pyx_t_15); __pyx_t_15++; if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 450, __pyx_L1_error)
+                __Pyx_GOTREF(__pyx_t_11);
+                #endif
+              } else {
+                {
+                  Py_ssize_t __pyx_temp = __Pyx_PyTuple_GET_SIZE(__pyx_t_10);
+                  #if !CYTHON_ASSUME_SAFE_MACROS
+                  if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 450, __pyx_L1_error)
+                  #endif
+                  if (__pyx_t_15 >= __pyx_temp) break;
+                }
+                #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+                __pyx_t_11 = PyTuple_GET_ITEM(__pyx_t_10, __pyx_t_15); __Pyx_INCREF(__pyx_t_11); __pyx_t_15++; if (unlikely((0 < 0))) __PYX_ERR(0, 450, __pyx_L1_error)
+                #else
+                __pyx_t_11 = __Pyx_PySequence_ITEM(__pyx_t_10, __pyx_t_15); __pyx_t_15++; if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 450, __pyx_L1_error)
+                __Pyx_GOTREF(__pyx_t_11);
+                #endif
+              }
+            } else {
+              __pyx_t_11 = __pyx_t_16(__pyx_t_10);
+              if (unlikely(!__pyx_t_11)) {
+                PyObject* exc_type = PyErr_Occurred();
+                if (exc_type) {
+                  if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+                  else __PYX_ERR(0, 450, __pyx_L1_error)
+                }
+                break;
+              }
+              __Pyx_GOTREF(__pyx_t_11);
+            }
+            __Pyx_XDECREF_SET(__pyx_v_p, __pyx_t_11);
+            __pyx_t_11 = 0;
 
-  /* "a_star.pyx":359
- * cdef direction(p1, p2):
- *     dx = p2[0] - p1[0]
- *     dy = p2[1] - p1[1]             # <<<<<<<<<<<<<<
- *     return dx, dy
+            /* "a_star.pyx":451
+ *                 for i in range(-trace_width_scaled, trace_width_scaled + 1):
+ *                     for p in range(-trace_width_scaled, trace_width_scaled+1):
+ *                         if y + i < len(grid_horizontal)-1 and x + p < len(grid_horizontal[0])-1:             # <<<<<<<<<<<<<<
+ *                             grid_horizontal[y + i][x + p] = 0.9
  * 
  */
-  __pyx_t_3 = __Pyx_GetItemInt(__pyx_v_p2, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 359, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_2 = __Pyx_GetItemInt(__pyx_v_p1, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 359, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_1 = PyNumber_Subtract(__pyx_t_3, __pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 359, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_v_dy = __pyx_t_1;
-  __pyx_t_1 = 0;
+            __pyx_t_11 = PyNumber_Add(__pyx_v_y, __pyx_v_i); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 451, __pyx_L1_error)
+            __Pyx_GOTREF(__pyx_t_11);
+            __pyx_t_17 = PyObject_Length(__pyx_v_grid_horizontal); if (unlikely(__pyx_t_17 == ((Py_ssize_t)-1))) __PYX_ERR(0, 451, __pyx_L1_error)
+            __pyx_t_6 = PyInt_FromSsize_t((__pyx_t_17 - 1)); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 451, __pyx_L1_error)
+            __Pyx_GOTREF(__pyx_t_6);
+            __pyx_t_18 = PyObject_RichCompare(__pyx_t_11, __pyx_t_6, Py_LT); __Pyx_XGOTREF(__pyx_t_18); if (unlikely(!__pyx_t_18)) __PYX_ERR(0, 451, __pyx_L1_error)
+            __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+            __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+            __pyx_t_19 = __Pyx_PyObject_IsTrue(__pyx_t_18); if (unlikely((__pyx_t_19 < 0))) __PYX_ERR(0, 451, __pyx_L1_error)
+            __Pyx_DECREF(__pyx_t_18); __pyx_t_18 = 0;
+            if (__pyx_t_19) {
+            } else {
+              __pyx_t_7 = __pyx_t_19;
+              goto __pyx_L30_bool_binop_done;
+            }
+            __pyx_t_18 = PyNumber_Add(__pyx_v_x, __pyx_v_p); if (unlikely(!__pyx_t_18)) __PYX_ERR(0, 451, __pyx_L1_error)
+            __Pyx_GOTREF(__pyx_t_18);
+            __pyx_t_6 = __Pyx_GetItemInt(__pyx_v_grid_horizontal, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 451, __pyx_L1_error)
+            __Pyx_GOTREF(__pyx_t_6);
+            __pyx_t_17 = PyObject_Length(__pyx_t_6); if (unlikely(__pyx_t_17 == ((Py_ssize_t)-1))) __PYX_ERR(0, 451, __pyx_L1_error)
+            __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+            __pyx_t_6 = PyInt_FromSsize_t((__pyx_t_17 - 1)); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 451, __pyx_L1_error)
+            __Pyx_GOTREF(__pyx_t_6);
+            __pyx_t_11 = PyObject_RichCompare(__pyx_t_18, __pyx_t_6, Py_LT); __Pyx_XGOTREF(__pyx_t_11); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 451, __pyx_L1_error)
+            __Pyx_DECREF(__pyx_t_18); __pyx_t_18 = 0;
+            __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+            __pyx_t_19 = __Pyx_PyObject_IsTrue(__pyx_t_11); if (unlikely((__pyx_t_19 < 0))) __PYX_ERR(0, 451, __pyx_L1_error)
+            __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+            __pyx_t_7 = __pyx_t_19;
+            __pyx_L30_bool_binop_done:;
+            if (__pyx_t_7) {
+
+              /* "a_star.pyx":452
+ *                     for p in range(-trace_width_scaled, trace_width_scaled+1):
+ *                         if y + i < len(grid_horizontal)-1 and x + p < len(grid_horizontal[0])-1:
+ *                             grid_horizontal[y + i][x + p] = 0.9             # <<<<<<<<<<<<<<
+ * 
+ *     return grid_vertical, grid_horizontal
+ */
+              __pyx_t_11 = PyNumber_Add(__pyx_v_y, __pyx_v_i); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 452, __pyx_L1_error)
+              __Pyx_GOTREF(__pyx_t_11);
+              __pyx_t_6 = __Pyx_PyObject_GetItem(__pyx_v_grid_horizontal, __pyx_t_11); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 452, __pyx_L1_error)
+              __Pyx_GOTREF(__pyx_t_6);
+              __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+              __pyx_t_11 = PyNumber_Add(__pyx_v_x, __pyx_v_p); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 452, __pyx_L1_error)
+              __Pyx_GOTREF(__pyx_t_11);
+              if (unlikely((PyObject_SetItem(__pyx_t_6, __pyx_t_11, __pyx_float_0_9) < 0))) __PYX_ERR(0, 452, __pyx_L1_error)
+              __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+              __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+
+              /* "a_star.pyx":451
+ *                 for i in range(-trace_width_scaled, trace_width_scaled + 1):
+ *                     for p in range(-trace_width_scaled, trace_width_scaled+1):
+ *                         if y + i < len(grid_horizontal)-1 and x + p < len(grid_horizontal[0])-1:             # <<<<<<<<<<<<<<
+ *                             grid_horizontal[y + i][x + p] = 0.9
+ * 
+ */
+            }
+
+            /* "a_star.pyx":450
+ * 
+ *                 for i in range(-trace_width_scaled, trace_width_scaled + 1):
+ *                     for p in range(-trace_width_scaled, trace_width_scaled+1):             # <<<<<<<<<<<<<<
+ *                         if y + i < len(grid_horizontal)-1 and x + p < len(grid_horizontal[0])-1:
+ *                             grid_horizontal[y + i][x + p] = 0.9
+ */
+          }
+          __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+
+          /* "a_star.pyx":449
+ *             for x, y in segment:
+ * 
+ *                 for i in range(-trace_width_scaled, trace_width_scaled + 1):             # <<<<<<<<<<<<<<
+ *                     for p in range(-trace_width_scaled, trace_width_scaled+1):
+ *                         if y + i < len(grid_horizontal)-1 and x + p < len(grid_horizontal[0])-1:
+ */
+        }
+        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+        /* "a_star.pyx":447
+ *         if segment[0][1] - segment[-1][1] == 0:
+ * 
+ *             for x, y in segment:             # <<<<<<<<<<<<<<
+ * 
+ *                 for i in range(-trace_width_scaled, trace_width_scaled + 1):
+ */
+      }
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+      /* "a_star.pyx":445
+ *         # horizontal
+ * 
+ *         if segment[0][1] - segment[-1][1] == 0:             # <<<<<<<<<<<<<<
+ * 
+ *             for x, y in segment:
+ */
+    }
+
+    /* "a_star.pyx":432
+ * 
+ * 
+ *     for segment in segments:             # <<<<<<<<<<<<<<
+ *         # vertical
+ * 
+ */
+  }
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "a_star.pyx":454
+ *                             grid_horizontal[y + i][x + p] = 0.9
+ * 
+ *     return grid_vertical, grid_horizontal             # <<<<<<<<<<<<<<
+ * 
+ * cdef direction(p1, p2):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 454, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_INCREF(__pyx_v_grid_vertical);
+  __Pyx_GIVEREF(__pyx_v_grid_vertical);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_grid_vertical)) __PYX_ERR(0, 454, __pyx_L1_error);
+  __Pyx_INCREF(__pyx_v_grid_horizontal);
+  __Pyx_GIVEREF(__pyx_v_grid_horizontal);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_v_grid_horizontal)) __PYX_ERR(0, 454, __pyx_L1_error);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "a_star.pyx":429
+ * 
+ * 
+ * cdef lock_trace(grid_vertical, grid_horizontal, segments, trace_width_scaled):             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_10);
+  __Pyx_XDECREF(__pyx_t_11);
+  __Pyx_XDECREF(__pyx_t_18);
+  __Pyx_AddTraceback("a_star.lock_trace", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_segment);
+  __Pyx_XDECREF(__pyx_v_x);
+  __Pyx_XDECREF(__pyx_v_y);
+  __Pyx_XDECREF(__pyx_v_i);
+  __Pyx_XDECREF(__pyx_v_p);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "a_star.pyx":456
+ *     return grid_vertical, grid_horizontal
+ * 
+ * cdef direction(p1, p2):             # <<<<<<<<<<<<<<
+ *     dx = p2[0] - p1[0]
+ *     dy = p2[1] - p1[1]
+ */
+
+static PyObject *__pyx_f_6a_star_direction(PyObject *__pyx_v_p1, PyObject *__pyx_v_p2) {
+  PyObject *__pyx_v_dx = NULL;
+  PyObject *__pyx_v_dy = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("direction", 1);
+
+  /* "a_star.pyx":457
+ * 
+ * cdef direction(p1, p2):
+ *     dx = p2[0] - p1[0]             # <<<<<<<<<<<<<<
+ *     dy = p2[1] - p1[1]
+ *     return dx, dy
+ */
+  __pyx_t_1 = __Pyx_GetItemInt(__pyx_v_p2, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 457, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_GetItemInt(__pyx_v_p1, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 457, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = PyNumber_Subtract(__pyx_t_1, __pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 457, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_v_dx = __pyx_t_3;
+  __pyx_t_3 = 0;
+
+  /* "a_star.pyx":458
+ * cdef direction(p1, p2):
+ *     dx = p2[0] - p1[0]
+ *     dy = p2[1] - p1[1]             # <<<<<<<<<<<<<<
+ *     return dx, dy
+ * 
+ */
+  __pyx_t_3 = __Pyx_GetItemInt(__pyx_v_p2, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 458, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_2 = __Pyx_GetItemInt(__pyx_v_p1, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 458, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_1 = PyNumber_Subtract(__pyx_t_3, __pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 458, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_v_dy = __pyx_t_1;
+  __pyx_t_1 = 0;
 
-  /* "a_star.pyx":360
+  /* "a_star.pyx":459
  *     dx = p2[0] - p1[0]
  *     dy = p2[1] - p1[1]
  *     return dx, dy             # <<<<<<<<<<<<<<
@@ -10542,19 +12494,19 @@ static PyObject *__pyx_f_6a_star_direction(PyObject *__pyx_v_p1, PyObject *__pyx
  * cdef segmentation(path):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 360, __pyx_L1_error)
+  __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 459, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_INCREF(__pyx_v_dx);
   __Pyx_GIVEREF(__pyx_v_dx);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_dx)) __PYX_ERR(0, 360, __pyx_L1_error);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_dx)) __PYX_ERR(0, 459, __pyx_L1_error);
   __Pyx_INCREF(__pyx_v_dy);
   __Pyx_GIVEREF(__pyx_v_dy);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_v_dy)) __PYX_ERR(0, 360, __pyx_L1_error);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_v_dy)) __PYX_ERR(0, 459, __pyx_L1_error);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "a_star.pyx":357
+  /* "a_star.pyx":456
  *     return grid_vertical, grid_horizontal
  * 
  * cdef direction(p1, p2):             # <<<<<<<<<<<<<<
@@ -10577,7 +12529,7 @@ static PyObject *__pyx_f_6a_star_direction(PyObject *__pyx_v_p1, PyObject *__pyx
   return __pyx_r;
 }
 
-/* "a_star.pyx":362
+/* "a_star.pyx":461
  *     return dx, dy
  * 
  * cdef segmentation(path):             # <<<<<<<<<<<<<<
@@ -10607,7 +12559,7 @@ static PyObject *__pyx_f_6a_star_segmentation(PyObject *__pyx_v_path) {
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("segmentation", 1);
 
-  /* "a_star.pyx":363
+  /* "a_star.pyx":462
  * 
  * cdef segmentation(path):
  *     if path is None or len(path) < 2:             # <<<<<<<<<<<<<<
@@ -10620,13 +12572,13 @@ static PyObject *__pyx_f_6a_star_segmentation(PyObject *__pyx_v_path) {
     __pyx_t_1 = __pyx_t_2;
     goto __pyx_L4_bool_binop_done;
   }
-  __pyx_t_3 = PyObject_Length(__pyx_v_path); if (unlikely(__pyx_t_3 == ((Py_ssize_t)-1))) __PYX_ERR(0, 363, __pyx_L1_error)
+  __pyx_t_3 = PyObject_Length(__pyx_v_path); if (unlikely(__pyx_t_3 == ((Py_ssize_t)-1))) __PYX_ERR(0, 462, __pyx_L1_error)
   __pyx_t_2 = (__pyx_t_3 < 2);
   __pyx_t_1 = __pyx_t_2;
   __pyx_L4_bool_binop_done:;
   if (__pyx_t_1) {
 
-    /* "a_star.pyx":364
+    /* "a_star.pyx":463
  * cdef segmentation(path):
  *     if path is None or len(path) < 2:
  *         return []  # No segments for a path with less than 2 points             # <<<<<<<<<<<<<<
@@ -10634,13 +12586,13 @@ static PyObject *__pyx_f_6a_star_segmentation(PyObject *__pyx_v_path) {
  *     segments = []
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_4 = PyList_New(0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 364, __pyx_L1_error)
+    __pyx_t_4 = PyList_New(0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 463, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
     __pyx_r = __pyx_t_4;
     __pyx_t_4 = 0;
     goto __pyx_L0;
 
-    /* "a_star.pyx":363
+    /* "a_star.pyx":462
  * 
  * cdef segmentation(path):
  *     if path is None or len(path) < 2:             # <<<<<<<<<<<<<<
@@ -10649,72 +12601,72 @@ static PyObject *__pyx_f_6a_star_segmentation(PyObject *__pyx_v_path) {
  */
   }
 
-  /* "a_star.pyx":366
+  /* "a_star.pyx":465
  *         return []  # No segments for a path with less than 2 points
  * 
  *     segments = []             # <<<<<<<<<<<<<<
  *     current_segment = [path[0]]  # Start with the first point
  *     # Track the initial direction
  */
-  __pyx_t_4 = PyList_New(0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 366, __pyx_L1_error)
+  __pyx_t_4 = PyList_New(0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 465, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __pyx_v_segments = ((PyObject*)__pyx_t_4);
   __pyx_t_4 = 0;
 
-  /* "a_star.pyx":367
+  /* "a_star.pyx":466
  * 
  *     segments = []
  *     current_segment = [path[0]]  # Start with the first point             # <<<<<<<<<<<<<<
  *     # Track the initial direction
  *     current_direction = direction(path[0], path[1])
  */
-  __pyx_t_4 = __Pyx_GetItemInt(__pyx_v_path, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 367, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_GetItemInt(__pyx_v_path, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 466, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_5 = PyList_New(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 367, __pyx_L1_error)
+  __pyx_t_5 = PyList_New(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 466, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_GIVEREF(__pyx_t_4);
-  if (__Pyx_PyList_SET_ITEM(__pyx_t_5, 0, __pyx_t_4)) __PYX_ERR(0, 367, __pyx_L1_error);
+  if (__Pyx_PyList_SET_ITEM(__pyx_t_5, 0, __pyx_t_4)) __PYX_ERR(0, 466, __pyx_L1_error);
   __pyx_t_4 = 0;
   __pyx_v_current_segment = ((PyObject*)__pyx_t_5);
   __pyx_t_5 = 0;
 
-  /* "a_star.pyx":369
+  /* "a_star.pyx":468
  *     current_segment = [path[0]]  # Start with the first point
  *     # Track the initial direction
  *     current_direction = direction(path[0], path[1])             # <<<<<<<<<<<<<<
  * 
  *     for i in range(1, len(path)):
  */
-  __pyx_t_5 = __Pyx_GetItemInt(__pyx_v_path, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 369, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_GetItemInt(__pyx_v_path, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 468, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_4 = __Pyx_GetItemInt(__pyx_v_path, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 369, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_GetItemInt(__pyx_v_path, 1, long, 1, __Pyx_PyInt_From_long, 0, 0, 1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 468, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_6 = __pyx_f_6a_star_direction(__pyx_t_5, __pyx_t_4); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 369, __pyx_L1_error)
+  __pyx_t_6 = __pyx_f_6a_star_direction(__pyx_t_5, __pyx_t_4); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 468, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
   __pyx_v_current_direction = __pyx_t_6;
   __pyx_t_6 = 0;
 
-  /* "a_star.pyx":371
+  /* "a_star.pyx":470
  *     current_direction = direction(path[0], path[1])
  * 
  *     for i in range(1, len(path)):             # <<<<<<<<<<<<<<
  *         next_direction = direction(path[i - 1], path[i])
  *         if next_direction != current_direction:
  */
-  __pyx_t_3 = PyObject_Length(__pyx_v_path); if (unlikely(__pyx_t_3 == ((Py_ssize_t)-1))) __PYX_ERR(0, 371, __pyx_L1_error)
-  __pyx_t_6 = PyInt_FromSsize_t(__pyx_t_3); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 371, __pyx_L1_error)
+  __pyx_t_3 = PyObject_Length(__pyx_v_path); if (unlikely(__pyx_t_3 == ((Py_ssize_t)-1))) __PYX_ERR(0, 470, __pyx_L1_error)
+  __pyx_t_6 = PyInt_FromSsize_t(__pyx_t_3); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 470, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
-  __pyx_t_4 = PyTuple_New(2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 371, __pyx_L1_error)
+  __pyx_t_4 = PyTuple_New(2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 470, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_INCREF(__pyx_int_1);
   __Pyx_GIVEREF(__pyx_int_1);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_int_1)) __PYX_ERR(0, 371, __pyx_L1_error);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_int_1)) __PYX_ERR(0, 470, __pyx_L1_error);
   __Pyx_GIVEREF(__pyx_t_6);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_t_6)) __PYX_ERR(0, 371, __pyx_L1_error);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_t_6)) __PYX_ERR(0, 470, __pyx_L1_error);
   __pyx_t_6 = 0;
-  __pyx_t_6 = __Pyx_PyObject_Call(__pyx_builtin_range, __pyx_t_4, NULL); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 371, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_PyObject_Call(__pyx_builtin_range, __pyx_t_4, NULL); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 470, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
   if (likely(PyList_CheckExact(__pyx_t_6)) || PyTuple_CheckExact(__pyx_t_6)) {
@@ -10722,9 +12674,9 @@ static PyObject *__pyx_f_6a_star_segmentation(PyObject *__pyx_v_path) {
     __pyx_t_3 = 0;
     __pyx_t_7 = NULL;
   } else {
-    __pyx_t_3 = -1; __pyx_t_4 = PyObject_GetIter(__pyx_t_6); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 371, __pyx_L1_error)
+    __pyx_t_3 = -1; __pyx_t_4 = PyObject_GetIter(__pyx_t_6); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 470, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_7 = __Pyx_PyObject_GetIterNextFunc(__pyx_t_4); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 371, __pyx_L1_error)
+    __pyx_t_7 = __Pyx_PyObject_GetIterNextFunc(__pyx_t_4); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 470, __pyx_L1_error)
   }
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
   for (;;) {
@@ -10733,28 +12685,28 @@ static PyObject *__pyx_f_6a_star_segmentation(PyObject *__pyx_v_path) {
         {
           Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_4);
           #if !CYTHON_ASSUME_SAFE_MACROS
-          if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 371, __pyx_L1_error)
+          if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 470, __pyx_L1_error)
           #endif
           if (__pyx_t_3 >= __pyx_temp) break;
         }
         #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-        __pyx_t_6 = PyList_GET_ITEM(__pyx_t_4, __pyx_t_3); __Pyx_INCREF(__pyx_t_6); __pyx_t_3++; if (unlikely((0 < 0))) __PYX_ERR(0, 371, __pyx_L1_error)
+        __pyx_t_6 = PyList_GET_ITEM(__pyx_t_4, __pyx_t_3); __Pyx_INCREF(__pyx_t_6); __pyx_t_3++; if (unlikely((0 < 0))) __PYX_ERR(0, 470, __pyx_L1_error)
         #else
-        __pyx_t_6 = __Pyx_PySequence_ITEM(__pyx_t_4, __pyx_t_3); __pyx_t_3++; if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 371, __pyx_L1_error)
+        __pyx_t_6 = __Pyx_PySequence_ITEM(__pyx_t_4, __pyx_t_3); __pyx_t_3++; if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 470, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_6);
         #endif
       } else {
         {
           Py_ssize_t __pyx_temp = __Pyx_PyTuple_GET_SIZE(__pyx_t_4);
           #if !CYTHON_ASSUME_SAFE_MACROS
-          if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 371, __pyx_L1_error)
+          if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 470, __pyx_L1_error)
           #endif
           if (__pyx_t_3 >= __pyx_temp) break;
         }
         #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-        __pyx_t_6 = PyTuple_GET_ITEM(__pyx_t_4, __pyx_t_3); __Pyx_INCREF(__pyx_t_6); __pyx_t_3++; if (unlikely((0 < 0))) __PYX_ERR(0, 371, __pyx_L1_error)
+        __pyx_t_6 = PyTuple_GET_ITEM(__pyx_t_4, __pyx_t_3); __Pyx_INCREF(__pyx_t_6); __pyx_t_3++; if (unlikely((0 < 0))) __PYX_ERR(0, 470, __pyx_L1_error)
         #else
-        __pyx_t_6 = __Pyx_PySequence_ITEM(__pyx_t_4, __pyx_t_3); __pyx_t_3++; if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 371, __pyx_L1_error)
+        __pyx_t_6 = __Pyx_PySequence_ITEM(__pyx_t_4, __pyx_t_3); __pyx_t_3++; if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 470, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_6);
         #endif
       }
@@ -10764,7 +12716,7 @@ static PyObject *__pyx_f_6a_star_segmentation(PyObject *__pyx_v_path) {
         PyObject* exc_type = PyErr_Occurred();
         if (exc_type) {
           if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
-          else __PYX_ERR(0, 371, __pyx_L1_error)
+          else __PYX_ERR(0, 470, __pyx_L1_error)
         }
         break;
       }
@@ -10773,84 +12725,84 @@ static PyObject *__pyx_f_6a_star_segmentation(PyObject *__pyx_v_path) {
     __Pyx_XDECREF_SET(__pyx_v_i, __pyx_t_6);
     __pyx_t_6 = 0;
 
-    /* "a_star.pyx":372
+    /* "a_star.pyx":471
  * 
  *     for i in range(1, len(path)):
  *         next_direction = direction(path[i - 1], path[i])             # <<<<<<<<<<<<<<
  *         if next_direction != current_direction:
  *             # Direction changed, end the current segment
  */
-    __pyx_t_6 = __Pyx_PyInt_SubtractObjC(__pyx_v_i, __pyx_int_1, 1, 0, 0); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 372, __pyx_L1_error)
+    __pyx_t_6 = __Pyx_PyInt_SubtractObjC(__pyx_v_i, __pyx_int_1, 1, 0, 0); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 471, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_6);
-    __pyx_t_5 = __Pyx_PyObject_GetItem(__pyx_v_path, __pyx_t_6); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 372, __pyx_L1_error)
+    __pyx_t_5 = __Pyx_PyObject_GetItem(__pyx_v_path, __pyx_t_6); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 471, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
     __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    __pyx_t_6 = __Pyx_PyObject_GetItem(__pyx_v_path, __pyx_v_i); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 372, __pyx_L1_error)
+    __pyx_t_6 = __Pyx_PyObject_GetItem(__pyx_v_path, __pyx_v_i); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 471, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_6);
-    __pyx_t_8 = __pyx_f_6a_star_direction(__pyx_t_5, __pyx_t_6); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 372, __pyx_L1_error)
+    __pyx_t_8 = __pyx_f_6a_star_direction(__pyx_t_5, __pyx_t_6); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 471, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_8);
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
     __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
     __Pyx_XDECREF_SET(__pyx_v_next_direction, __pyx_t_8);
     __pyx_t_8 = 0;
 
-    /* "a_star.pyx":373
+    /* "a_star.pyx":472
  *     for i in range(1, len(path)):
  *         next_direction = direction(path[i - 1], path[i])
  *         if next_direction != current_direction:             # <<<<<<<<<<<<<<
  *             # Direction changed, end the current segment
  *             current_segment.append(path[i - 1])
  */
-    __pyx_t_8 = PyObject_RichCompare(__pyx_v_next_direction, __pyx_v_current_direction, Py_NE); __Pyx_XGOTREF(__pyx_t_8); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 373, __pyx_L1_error)
-    __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_t_8); if (unlikely((__pyx_t_1 < 0))) __PYX_ERR(0, 373, __pyx_L1_error)
+    __pyx_t_8 = PyObject_RichCompare(__pyx_v_next_direction, __pyx_v_current_direction, Py_NE); __Pyx_XGOTREF(__pyx_t_8); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 472, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_t_8); if (unlikely((__pyx_t_1 < 0))) __PYX_ERR(0, 472, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
     if (__pyx_t_1) {
 
-      /* "a_star.pyx":375
+      /* "a_star.pyx":474
  *         if next_direction != current_direction:
  *             # Direction changed, end the current segment
  *             current_segment.append(path[i - 1])             # <<<<<<<<<<<<<<
  *             segments.append(current_segment)
  *             # Start a new segment
  */
-      __pyx_t_8 = __Pyx_PyInt_SubtractObjC(__pyx_v_i, __pyx_int_1, 1, 0, 0); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 375, __pyx_L1_error)
+      __pyx_t_8 = __Pyx_PyInt_SubtractObjC(__pyx_v_i, __pyx_int_1, 1, 0, 0); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 474, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_8);
-      __pyx_t_6 = __Pyx_PyObject_GetItem(__pyx_v_path, __pyx_t_8); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 375, __pyx_L1_error)
+      __pyx_t_6 = __Pyx_PyObject_GetItem(__pyx_v_path, __pyx_t_8); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 474, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_6);
       __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-      __pyx_t_9 = __Pyx_PyList_Append(__pyx_v_current_segment, __pyx_t_6); if (unlikely(__pyx_t_9 == ((int)-1))) __PYX_ERR(0, 375, __pyx_L1_error)
+      __pyx_t_9 = __Pyx_PyList_Append(__pyx_v_current_segment, __pyx_t_6); if (unlikely(__pyx_t_9 == ((int)-1))) __PYX_ERR(0, 474, __pyx_L1_error)
       __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
 
-      /* "a_star.pyx":376
+      /* "a_star.pyx":475
  *             # Direction changed, end the current segment
  *             current_segment.append(path[i - 1])
  *             segments.append(current_segment)             # <<<<<<<<<<<<<<
  *             # Start a new segment
  *             current_segment = [path[i - 1]]
  */
-      __pyx_t_9 = __Pyx_PyList_Append(__pyx_v_segments, __pyx_v_current_segment); if (unlikely(__pyx_t_9 == ((int)-1))) __PYX_ERR(0, 376, __pyx_L1_error)
+      __pyx_t_9 = __Pyx_PyList_Append(__pyx_v_segments, __pyx_v_current_segment); if (unlikely(__pyx_t_9 == ((int)-1))) __PYX_ERR(0, 475, __pyx_L1_error)
 
-      /* "a_star.pyx":378
+      /* "a_star.pyx":477
  *             segments.append(current_segment)
  *             # Start a new segment
  *             current_segment = [path[i - 1]]             # <<<<<<<<<<<<<<
  *             current_direction = next_direction
  * 
  */
-      __pyx_t_6 = __Pyx_PyInt_SubtractObjC(__pyx_v_i, __pyx_int_1, 1, 0, 0); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 378, __pyx_L1_error)
+      __pyx_t_6 = __Pyx_PyInt_SubtractObjC(__pyx_v_i, __pyx_int_1, 1, 0, 0); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 477, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_6);
-      __pyx_t_8 = __Pyx_PyObject_GetItem(__pyx_v_path, __pyx_t_6); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 378, __pyx_L1_error)
+      __pyx_t_8 = __Pyx_PyObject_GetItem(__pyx_v_path, __pyx_t_6); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 477, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_8);
       __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-      __pyx_t_6 = PyList_New(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 378, __pyx_L1_error)
+      __pyx_t_6 = PyList_New(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 477, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_6);
       __Pyx_GIVEREF(__pyx_t_8);
-      if (__Pyx_PyList_SET_ITEM(__pyx_t_6, 0, __pyx_t_8)) __PYX_ERR(0, 378, __pyx_L1_error);
+      if (__Pyx_PyList_SET_ITEM(__pyx_t_6, 0, __pyx_t_8)) __PYX_ERR(0, 477, __pyx_L1_error);
       __pyx_t_8 = 0;
       __Pyx_DECREF_SET(__pyx_v_current_segment, ((PyObject*)__pyx_t_6));
       __pyx_t_6 = 0;
 
-      /* "a_star.pyx":379
+      /* "a_star.pyx":478
  *             # Start a new segment
  *             current_segment = [path[i - 1]]
  *             current_direction = next_direction             # <<<<<<<<<<<<<<
@@ -10860,7 +12812,7 @@ static PyObject *__pyx_f_6a_star_segmentation(PyObject *__pyx_v_path) {
       __Pyx_INCREF(__pyx_v_next_direction);
       __Pyx_DECREF_SET(__pyx_v_current_direction, __pyx_v_next_direction);
 
-      /* "a_star.pyx":373
+      /* "a_star.pyx":472
  *     for i in range(1, len(path)):
  *         next_direction = direction(path[i - 1], path[i])
  *         if next_direction != current_direction:             # <<<<<<<<<<<<<<
@@ -10869,19 +12821,19 @@ static PyObject *__pyx_f_6a_star_segmentation(PyObject *__pyx_v_path) {
  */
     }
 
-    /* "a_star.pyx":382
+    /* "a_star.pyx":481
  * 
  *         # Add the current point to the segment
  *         current_segment.append(path[i])             # <<<<<<<<<<<<<<
  * 
  *     # Add the final segment
  */
-    __pyx_t_6 = __Pyx_PyObject_GetItem(__pyx_v_path, __pyx_v_i); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 382, __pyx_L1_error)
+    __pyx_t_6 = __Pyx_PyObject_GetItem(__pyx_v_path, __pyx_v_i); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 481, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_6);
-    __pyx_t_9 = __Pyx_PyList_Append(__pyx_v_current_segment, __pyx_t_6); if (unlikely(__pyx_t_9 == ((int)-1))) __PYX_ERR(0, 382, __pyx_L1_error)
+    __pyx_t_9 = __Pyx_PyList_Append(__pyx_v_current_segment, __pyx_t_6); if (unlikely(__pyx_t_9 == ((int)-1))) __PYX_ERR(0, 481, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
 
-    /* "a_star.pyx":371
+    /* "a_star.pyx":470
  *     current_direction = direction(path[0], path[1])
  * 
  *     for i in range(1, len(path)):             # <<<<<<<<<<<<<<
@@ -10891,7 +12843,7 @@ static PyObject *__pyx_f_6a_star_segmentation(PyObject *__pyx_v_path) {
   }
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
 
-  /* "a_star.pyx":385
+  /* "a_star.pyx":484
  * 
  *     # Add the final segment
  *     if current_segment:             # <<<<<<<<<<<<<<
@@ -10901,16 +12853,16 @@ static PyObject *__pyx_f_6a_star_segmentation(PyObject *__pyx_v_path) {
   __pyx_t_1 = (PyList_GET_SIZE(__pyx_v_current_segment) != 0);
   if (__pyx_t_1) {
 
-    /* "a_star.pyx":386
+    /* "a_star.pyx":485
  *     # Add the final segment
  *     if current_segment:
  *         segments.append(current_segment)             # <<<<<<<<<<<<<<
  * 
  *     return segments
  */
-    __pyx_t_9 = __Pyx_PyList_Append(__pyx_v_segments, __pyx_v_current_segment); if (unlikely(__pyx_t_9 == ((int)-1))) __PYX_ERR(0, 386, __pyx_L1_error)
+    __pyx_t_9 = __Pyx_PyList_Append(__pyx_v_segments, __pyx_v_current_segment); if (unlikely(__pyx_t_9 == ((int)-1))) __PYX_ERR(0, 485, __pyx_L1_error)
 
-    /* "a_star.pyx":385
+    /* "a_star.pyx":484
  * 
  *     # Add the final segment
  *     if current_segment:             # <<<<<<<<<<<<<<
@@ -10919,7 +12871,7 @@ static PyObject *__pyx_f_6a_star_segmentation(PyObject *__pyx_v_path) {
  */
   }
 
-  /* "a_star.pyx":388
+  /* "a_star.pyx":487
  *         segments.append(current_segment)
  * 
  *     return segments             # <<<<<<<<<<<<<<
@@ -10929,7 +12881,7 @@ static PyObject *__pyx_f_6a_star_segmentation(PyObject *__pyx_v_path) {
   __pyx_r = __pyx_v_segments;
   goto __pyx_L0;
 
-  /* "a_star.pyx":362
+  /* "a_star.pyx":461
  *     return dx, dy
  * 
  * cdef segmentation(path):             # <<<<<<<<<<<<<<
@@ -11935,8 +13887,15 @@ static PyMethodDef __pyx_methods[] = {
 
 static int __Pyx_CreateStringTabAndInitStrings(void) {
   __Pyx_StringTabEntry __pyx_string_tab[] = {
+    {&__pyx_n_s_FAILURE_BLOCKED_PORTS, __pyx_k_FAILURE_BLOCKED_PORTS, sizeof(__pyx_k_FAILURE_BLOCKED_PORTS), 0, 0, 1, 1},
+    {&__pyx_n_s_FAILURE_EXHAUSTED, __pyx_k_FAILURE_EXHAUSTED, sizeof(__pyx_k_FAILURE_EXHAUSTED), 0, 0, 1, 1},
+    {&__pyx_n_s_FAILURE_LIMIT_REACHED, __pyx_k_FAILURE_LIMIT_REACHED, sizeof(__pyx_k_FAILURE_LIMIT_REACHED), 0, 0, 1, 1},
+    {&__pyx_n_s_FAILURE_SEGMENT_LENGTH, __pyx_k_FAILURE_SEGMENT_LENGTH, sizeof(__pyx_k_FAILURE_SEGMENT_LENGTH), 0, 0, 1, 1},
     {&__pyx_kp_s_Incompatible_checksums_0x_x_vs_0, __pyx_k_Incompatible_checksums_0x_x_vs_0, sizeof(__pyx_k_Incompatible_checksums_0x_x_vs_0), 0, 0, 1, 0},
     {&__pyx_n_s_IndexError, __pyx_k_IndexError, sizeof(__pyx_k_IndexError), 0, 0, 1, 1},
+    {&__pyx_n_s_LIMIT_EXPANSIONS, __pyx_k_LIMIT_EXPANSIONS, sizeof(__pyx_k_LIMIT_EXPANSIONS), 0, 0, 1, 1},
+    {&__pyx_n_s_LIMIT_OPEN_SET, __pyx_k_LIMIT_OPEN_SET, sizeof(__pyx_k_LIMIT_OPEN_SET), 0, 0, 1, 1},
+    {&__pyx_n_s_LIMIT_TIME, __pyx_k_LIMIT_TIME, sizeof(__pyx_k_LIMIT_TIME), 0, 0, 1, 1},
     {&__pyx_n_s_PickleError, __pyx_k_PickleError, sizeof(__pyx_k_PickleError), 0, 0, 1, 1},
     {&__pyx_n_s_PriorityQueue, __pyx_k_PriorityQueue, sizeof(__pyx_k_PriorityQueue), 0, 0, 1, 1},
     {&__pyx_n_s_PriorityQueue___reduce_cython, __pyx_k_PriorityQueue___reduce_cython, sizeof(__pyx_k_PriorityQueue___reduce_cython), 0, 0, 1, 1},
@@ -11946,21 +13905,27 @@ static int __Pyx_CreateStringTabAndInitStrings(void) {
     {&__pyx_kp_u__9, __pyx_k__9, sizeof(__pyx_k__9), 0, 1, 0, 0},
     {&__pyx_n_s_a_star, __pyx_k_a_star, sizeof(__pyx_k_a_star), 0, 0, 1, 1},
     {&__pyx_kp_s_a_star_pyx, __pyx_k_a_star_pyx, sizeof(__pyx_k_a_star_pyx), 0, 0, 1, 0},
+    {&__pyx_n_s_add_search, __pyx_k_add_search, sizeof(__pyx_k_add_search), 0, 0, 1, 1},
     {&__pyx_n_s_args, __pyx_k_args, sizeof(__pyx_k_args), 0, 0, 1, 1},
+    {&__pyx_n_s_astar_a_star_stats, __pyx_k_astar_a_star_stats, sizeof(__pyx_k_astar_a_star_stats), 0, 0, 1, 1},
     {&__pyx_n_s_astar_start, __pyx_k_astar_start, sizeof(__pyx_k_astar_start), 0, 0, 1, 1},
     {&__pyx_n_s_asyncio_coroutines, __pyx_k_asyncio_coroutines, sizeof(__pyx_k_asyncio_coroutines), 0, 0, 1, 1},
+    {&__pyx_n_s_blocked_ports, __pyx_k_blocked_ports, sizeof(__pyx_k_blocked_ports), 0, 0, 1, 1},
     {&__pyx_n_s_class_getitem, __pyx_k_class_getitem, sizeof(__pyx_k_class_getitem), 0, 0, 1, 1},
     {&__pyx_n_s_cline_in_traceback, __pyx_k_cline_in_traceback, sizeof(__pyx_k_cline_in_traceback), 0, 0, 1, 1},
     {&__pyx_n_s_close, __pyx_k_close, sizeof(__pyx_k_close), 0, 0, 1, 1},
     {&__pyx_n_s_combinations, __pyx_k_combinations, sizeof(__pyx_k_combinations), 0, 0, 1, 1},
     {&__pyx_n_s_cost, __pyx_k_cost, sizeof(__pyx_k_cost), 0, 0, 1, 1},
+    {&__pyx_n_s_deadline, __pyx_k_deadline, sizeof(__pyx_k_deadline), 0, 0, 1, 1},
     {&__pyx_n_s_dict, __pyx_k_dict, sizeof(__pyx_k_dict), 0, 0, 1, 1},
     {&__pyx_n_s_dict_2, __pyx_k_dict_2, sizeof(__pyx_k_dict_2), 0, 0, 1, 1},
     {&__pyx_kp_u_disable, __pyx_k_disable, sizeof(__pyx_k_disable), 0, 1, 0, 0},
     {&__pyx_kp_u_enable, __pyx_k_enable, sizeof(__pyx_k_enable), 0, 1, 0, 0},
     {&__pyx_n_s_enumerate, __pyx_k_enumerate, sizeof(__pyx_k_enumerate), 0, 0, 1, 1},
+    {&__pyx_n_s_estimate_search_memory, __pyx_k_estimate_search_memory, sizeof(__pyx_k_estimate_search_memory), 0, 0, 1, 1},
     {&__pyx_n_s_extend, __pyx_k_extend, sizeof(__pyx_k_extend), 0, 0, 1, 1},
     {&__pyx_n_s_failed_nodes, __pyx_k_failed_nodes, sizeof(__pyx_k_failed_nodes), 0, 0, 1, 1},
+    {&__pyx_n_s_failure_reason, __pyx_k_failure_reason, sizeof(__pyx_k_failure_reason), 0, 0, 1, 1},
     {&__pyx_kp_u_gc, __pyx_k_gc, sizeof(__pyx_k_gc), 0, 1, 0, 0},
     {&__pyx_n_s_genexpr, __pyx_k_genexpr, sizeof(__pyx_k_genexpr), 0, 0, 1, 1},
     {&__pyx_n_s_get, __pyx_k_get, sizeof(__pyx_k_get), 0, 0, 1, 1},
@@ -11977,16 +13942,24 @@ static int __Pyx_CreateStringTabAndInitStrings(void) {
     {&__pyx_n_s_is_coroutine, __pyx_k_is_coroutine, sizeof(__pyx_k_is_coroutine), 0, 0, 1, 1},
     {&__pyx_kp_u_isenabled, __pyx_k_isenabled, sizeof(__pyx_k_isenabled), 0, 1, 0, 0},
     {&__pyx_n_s_itertools, __pyx_k_itertools, sizeof(__pyx_k_itertools), 0, 0, 1, 1},
+    {&__pyx_n_s_limit, __pyx_k_limit, sizeof(__pyx_k_limit), 0, 0, 1, 1},
+    {&__pyx_n_s_limits, __pyx_k_limits, sizeof(__pyx_k_limits), 0, 0, 1, 1},
     {&__pyx_n_s_logger_logger, __pyx_k_logger_logger, sizeof(__pyx_k_logger_logger), 0, 0, 1, 1},
     {&__pyx_n_s_main, __pyx_k_main, sizeof(__pyx_k_main), 0, 0, 1, 1},
+    {&__pyx_n_s_max_expansions, __pyx_k_max_expansions, sizeof(__pyx_k_max_expansions), 0, 0, 1, 1},
+    {&__pyx_n_s_max_open_set, __pyx_k_max_open_set, sizeof(__pyx_k_max_open_set), 0, 0, 1, 1},
     {&__pyx_n_s_min, __pyx_k_min, sizeof(__pyx_k_min), 0, 0, 1, 1},
     {&__pyx_n_s_minimum_segment_length, __pyx_k_minimum_segment_length, sizeof(__pyx_k_minimum_segment_length), 0, 0, 1, 1},
     {&__pyx_n_s_name, __pyx_k_name, sizeof(__pyx_k_name), 0, 0, 1, 1},
     {&__pyx_n_s_new, __pyx_k_new, sizeof(__pyx_k_new), 0, 0, 1, 1},
+    {&__pyx_n_s_nodes_expanded, __pyx_k_nodes_expanded, sizeof(__pyx_k_nodes_expanded), 0, 0, 1, 1},
+    {&__pyx_n_s_nodes_generated, __pyx_k_nodes_generated, sizeof(__pyx_k_nodes_generated), 0, 0, 1, 1},
     {&__pyx_n_s_order, __pyx_k_order, sizeof(__pyx_k_order), 0, 0, 1, 1},
     {&__pyx_n_s_partial_cost, __pyx_k_partial_cost, sizeof(__pyx_k_partial_cost), 0, 0, 1, 1},
     {&__pyx_n_s_partial_path, __pyx_k_partial_path, sizeof(__pyx_k_partial_path), 0, 0, 1, 1},
     {&__pyx_n_s_path, __pyx_k_path, sizeof(__pyx_k_path), 0, 0, 1, 1},
+    {&__pyx_n_s_peak_memory, __pyx_k_peak_memory, sizeof(__pyx_k_peak_memory), 0, 0, 1, 1},
+    {&__pyx_n_s_perf_counter, __pyx_k_perf_counter, sizeof(__pyx_k_perf_counter), 0, 0, 1, 1},
     {&__pyx_n_s_pickle, __pyx_k_pickle, sizeof(__pyx_k_pickle), 0, 0, 1, 1},
     {&__pyx_n_s_pop, __pyx_k_pop, sizeof(__pyx_k_pop), 0, 0, 1, 1},
     {&__pyx_kp_s_pop_from_empty_priority_queue, __pyx_k_pop_from_empty_priority_queue, sizeof(__pyx_k_pop_from_empty_priority_queue), 0, 0, 1, 0},
@@ -12001,6 +13974,8 @@ static int __Pyx_CreateStringTabAndInitStrings(void) {
     {&__pyx_n_s_reduce, __pyx_k_reduce, sizeof(__pyx_k_reduce), 0, 0, 1, 1},
     {&__pyx_n_s_reduce_cython, __pyx_k_reduce_cython, sizeof(__pyx_k_reduce_cython), 0, 0, 1, 1},
     {&__pyx_n_s_reduce_ex, __pyx_k_reduce_ex, sizeof(__pyx_k_reduce_ex), 0, 0, 1, 1},
+    {&__pyx_n_s_seconds, __pyx_k_seconds, sizeof(__pyx_k_seconds), 0, 0, 1, 1},
+    {&__pyx_n_s_segment_length_prunes, __pyx_k_segment_length_prunes, sizeof(__pyx_k_segment_length_prunes), 0, 0, 1, 1},
     {&__pyx_n_s_segments, __pyx_k_segments, sizeof(__pyx_k_segments), 0, 0, 1, 1},
     {&__pyx_n_s_self, __pyx_k_self, sizeof(__pyx_k_self), 0, 0, 1, 1},
     {&__pyx_n_s_send, __pyx_k_send, sizeof(__pyx_k_send), 0, 0, 1, 1},
@@ -12009,14 +13984,17 @@ static int __Pyx_CreateStringTabAndInitStrings(void) {
     {&__pyx_n_s_spec, __pyx_k_spec, sizeof(__pyx_k_spec), 0, 0, 1, 1},
     {&__pyx_n_s_start, __pyx_k_start, sizeof(__pyx_k_start), 0, 0, 1, 1},
     {&__pyx_n_s_state, __pyx_k_state, sizeof(__pyx_k_state), 0, 0, 1, 1},
+    {&__pyx_n_s_stats, __pyx_k_stats, sizeof(__pyx_k_stats), 0, 0, 1, 1},
     {&__pyx_kp_s_stringsource, __pyx_k_stringsource, sizeof(__pyx_k_stringsource), 0, 0, 1, 0},
     {&__pyx_n_s_sys, __pyx_k_sys, sizeof(__pyx_k_sys), 0, 0, 1, 1},
     {&__pyx_n_s_test, __pyx_k_test, sizeof(__pyx_k_test), 0, 0, 1, 1},
     {&__pyx_n_s_throw, __pyx_k_throw, sizeof(__pyx_k_throw), 0, 0, 1, 1},
+    {&__pyx_n_s_time, __pyx_k_time, sizeof(__pyx_k_time), 0, 0, 1, 1},
     {&__pyx_n_s_trace_width_scaled, __pyx_k_trace_width_scaled, sizeof(__pyx_k_trace_width_scaled), 0, 0, 1, 1},
     {&__pyx_n_s_tsp, __pyx_k_tsp, sizeof(__pyx_k_tsp), 0, 0, 1, 1},
     {&__pyx_n_s_update, __pyx_k_update, sizeof(__pyx_k_update), 0, 0, 1, 1},
     {&__pyx_n_s_use_setstate, __pyx_k_use_setstate, sizeof(__pyx_k_use_setstate), 0, 0, 1, 1},
+    {&__pyx_n_s_visited_states, __pyx_k_visited_states, sizeof(__pyx_k_visited_states), 0, 0, 1, 1},
     {&__pyx_n_s_zip, __pyx_k_zip, sizeof(__pyx_k_zip), 0, 0, 1, 1},
     {0, 0, 0, 0, 0, 0, 0}
   };
@@ -12024,11 +14002,11 @@ static int __Pyx_CreateStringTabAndInitStrings(void) {
 }
 /* #### Code section: cached_builtins ### */
 static CYTHON_SMALL_CODE int __Pyx_InitCachedBuiltins(void) {
-  __pyx_builtin_IndexError = __Pyx_GetBuiltinName(__pyx_n_s_IndexError); if (!__pyx_builtin_IndexError) __PYX_ERR(0, 28, __pyx_L1_error)
-  __pyx_builtin_range = __Pyx_GetBuiltinName(__pyx_n_s_range); if (!__pyx_builtin_range) __PYX_ERR(0, 80, __pyx_L1_error)
-  __pyx_builtin_zip = __Pyx_GetBuiltinName(__pyx_n_s_zip); if (!__pyx_builtin_zip) __PYX_ERR(0, 225, __pyx_L1_error)
-  __pyx_builtin_enumerate = __Pyx_GetBuiltinName(__pyx_n_s_enumerate); if (!__pyx_builtin_enumerate) __PYX_ERR(0, 193, __pyx_L1_error)
-  __pyx_builtin_min = __Pyx_GetBuiltinName(__pyx_n_s_min); if (!__pyx_builtin_min) __PYX_ERR(0, 327, __pyx_L1_error)
+  __pyx_builtin_IndexError = __Pyx_GetBuiltinName(__pyx_n_s_IndexError); if (!__pyx_builtin_IndexError) __PYX_ERR(0, 35, __pyx_L1_error)
+  __pyx_builtin_range = __Pyx_GetBuiltinName(__pyx_n_s_range); if (!__pyx_builtin_range) __PYX_ERR(0, 87, __pyx_L1_error)
+  __pyx_builtin_zip = __Pyx_GetBuiltinName(__pyx_n_s_zip); if (!__pyx_builtin_zip) __PYX_ERR(0, 265, __pyx_L1_error)
+  __pyx_builtin_enumerate = __Pyx_GetBuiltinName(__pyx_n_s_enumerate); if (!__pyx_builtin_enumerate) __PYX_ERR(0, 201, __pyx_L1_error)
+  __pyx_builtin_min = __Pyx_GetBuiltinName(__pyx_n_s_min); if (!__pyx_builtin_min) __PYX_ERR(0, 426, __pyx_L1_error)
   return 0;
   __pyx_L1_error:;
   return -1;
@@ -12039,56 +14017,56 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__Pyx_InitCachedConstants", 0);
 
-  /* "a_star.pyx":28
+  /* "a_star.pyx":35
  *     cdef object pop(self):
  *         if not self.elements:
  *             raise IndexError("pop from empty priority queue")             # <<<<<<<<<<<<<<
  * 
  *         cdef object last_item = self.elements.pop()
  */
-  __pyx_tuple_ = PyTuple_Pack(1, __pyx_kp_s_pop_from_empty_priority_queue); if (unlikely(!__pyx_tuple_)) __PYX_ERR(0, 28, __pyx_L1_error)
+  __pyx_tuple_ = PyTuple_Pack(1, __pyx_kp_s_pop_from_empty_priority_queue); if (unlikely(!__pyx_tuple_)) __PYX_ERR(0, 35, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple_);
   __Pyx_GIVEREF(__pyx_tuple_);
 
-  /* "a_star.pyx":172
+  /* "a_star.pyx":180
  *                 else:
  * 
  *                     return None, None             # <<<<<<<<<<<<<<
  * 
  * 
  */
-  __pyx_tuple__2 = PyTuple_Pack(2, Py_None, Py_None); if (unlikely(!__pyx_tuple__2)) __PYX_ERR(0, 172, __pyx_L1_error)
+  __pyx_tuple__2 = PyTuple_Pack(2, Py_None, Py_None); if (unlikely(!__pyx_tuple__2)) __PYX_ERR(0, 180, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__2);
   __Pyx_GIVEREF(__pyx_tuple__2);
 
-  /* "a_star.pyx":198
+  /* "a_star.pyx":206
  * 
  * 
  *     directions = [(0, -1), (0, 1), (-1, 0), (1, 0)]             # <<<<<<<<<<<<<<
  * 
  *     open_set = PriorityQueue()
  */
-  __pyx_tuple__3 = PyTuple_Pack(2, __pyx_int_0, __pyx_int_neg_1); if (unlikely(!__pyx_tuple__3)) __PYX_ERR(0, 198, __pyx_L1_error)
+  __pyx_tuple__3 = PyTuple_Pack(2, __pyx_int_0, __pyx_int_neg_1); if (unlikely(!__pyx_tuple__3)) __PYX_ERR(0, 206, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__3);
   __Pyx_GIVEREF(__pyx_tuple__3);
-  __pyx_tuple__4 = PyTuple_Pack(2, __pyx_int_0, __pyx_int_1); if (unlikely(!__pyx_tuple__4)) __PYX_ERR(0, 198, __pyx_L1_error)
+  __pyx_tuple__4 = PyTuple_Pack(2, __pyx_int_0, __pyx_int_1); if (unlikely(!__pyx_tuple__4)) __PYX_ERR(0, 206, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__4);
   __Pyx_GIVEREF(__pyx_tuple__4);
-  __pyx_tuple__5 = PyTuple_Pack(2, __pyx_int_neg_1, __pyx_int_0); if (unlikely(!__pyx_tuple__5)) __PYX_ERR(0, 198, __pyx_L1_error)
+  __pyx_tuple__5 = PyTuple_Pack(2, __pyx_int_neg_1, __pyx_int_0); if (unlikely(!__pyx_tuple__5)) __PYX_ERR(0, 206, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__5);
   __Pyx_GIVEREF(__pyx_tuple__5);
-  __pyx_tuple__6 = PyTuple_Pack(2, __pyx_int_1, __pyx_int_0); if (unlikely(!__pyx_tuple__6)) __PYX_ERR(0, 198, __pyx_L1_error)
+  __pyx_tuple__6 = PyTuple_Pack(2, __pyx_int_1, __pyx_int_0); if (unlikely(!__pyx_tuple__6)) __PYX_ERR(0, 206, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__6);
   __Pyx_GIVEREF(__pyx_tuple__6);
 
-  /* "a_star.pyx":225
+  /* "a_star.pyx":265
  *         x, y = current
  *         # Determine edges traversed so far.
  *         edge_set = set(zip(path, path[1:]))             # <<<<<<<<<<<<<<
  * 
  *         for d in directions:
  */
-  __pyx_slice__7 = PySlice_New(__pyx_int_1, Py_None, Py_None); if (unlikely(!__pyx_slice__7)) __PYX_ERR(0, 225, __pyx_L1_error)
+  __pyx_slice__7 = PySlice_New(__pyx_int_1, Py_None, Py_None); if (unlikely(!__pyx_slice__7)) __PYX_ERR(0, 265, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_slice__7);
   __Pyx_GIVEREF(__pyx_slice__7);
 
@@ -12124,17 +14102,17 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
   __Pyx_GIVEREF(__pyx_tuple__13);
   __pyx_codeobj__14 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__13, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_setstate_cython, 16, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__14)) __PYX_ERR(1, 16, __pyx_L1_error)
 
-  /* "a_star.pyx":140
+  /* "a_star.pyx":147
  *     return seg if seg < minimum_segment_length else minimum_segment_length
  * 
- * def astar_start(grid_vertical, grid_horizontal, start, goal_nodes, minimum_segment_length, tsp, trace_width_scaled):             # <<<<<<<<<<<<<<
+ * def astar_start(grid_vertical, grid_horizontal, start, goal_nodes, minimum_segment_length, tsp, trace_width_scaled,             # <<<<<<<<<<<<<<
+ *                 stats=None, limits=None):
  * 
- *     path = []
  */
-  __pyx_tuple__15 = PyTuple_Pack(15, __pyx_n_s_grid_vertical, __pyx_n_s_grid_horizontal, __pyx_n_s_start, __pyx_n_s_goal_nodes, __pyx_n_s_minimum_segment_length, __pyx_n_s_tsp, __pyx_n_s_trace_width_scaled, __pyx_n_s_path, __pyx_n_s_cost, __pyx_n_s_failed_nodes, __pyx_n_s_order, __pyx_n_s_i, __pyx_n_s_partial_path, __pyx_n_s_partial_cost, __pyx_n_s_segments); if (unlikely(!__pyx_tuple__15)) __PYX_ERR(0, 140, __pyx_L1_error)
+  __pyx_tuple__15 = PyTuple_Pack(17, __pyx_n_s_grid_vertical, __pyx_n_s_grid_horizontal, __pyx_n_s_start, __pyx_n_s_goal_nodes, __pyx_n_s_minimum_segment_length, __pyx_n_s_tsp, __pyx_n_s_trace_width_scaled, __pyx_n_s_stats, __pyx_n_s_limits, __pyx_n_s_path, __pyx_n_s_cost, __pyx_n_s_failed_nodes, __pyx_n_s_order, __pyx_n_s_i, __pyx_n_s_partial_path, __pyx_n_s_partial_cost, __pyx_n_s_segments); if (unlikely(!__pyx_tuple__15)) __PYX_ERR(0, 147, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__15);
   __Pyx_GIVEREF(__pyx_tuple__15);
-  __pyx_codeobj__16 = (PyObject*)__Pyx_PyCode_New(7, 0, 0, 15, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__15, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_a_star_pyx, __pyx_n_s_astar_start, 140, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__16)) __PYX_ERR(0, 140, __pyx_L1_error)
+  __pyx_codeobj__16 = (PyObject*)__Pyx_PyCode_New(9, 0, 0, 17, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__15, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_a_star_pyx, __pyx_n_s_astar_start, 147, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__16)) __PYX_ERR(0, 147, __pyx_L1_error)
 
   /* "(tree fragment)":1
  * def __pyx_unpickle_PriorityQueue(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
@@ -12221,20 +14199,21 @@ static int __Pyx_modinit_type_init_code(void) {
   /*--- Type init code ---*/
   __pyx_vtabptr_6a_star_PriorityQueue = &__pyx_vtable_6a_star_PriorityQueue;
   __pyx_vtable_6a_star_PriorityQueue.is_empty = (int (*)(struct __pyx_obj_6a_star_PriorityQueue *))__pyx_f_6a_star_13PriorityQueue_is_empty;
+  __pyx_vtable_6a_star_PriorityQueue.size = (int (*)(struct __pyx_obj_6a_star_PriorityQueue *))__pyx_f_6a_star_13PriorityQueue_size;
   __pyx_vtable_6a_star_PriorityQueue.push = (void (*)(struct __pyx_obj_6a_star_PriorityQueue *, PyObject *, double))__pyx_f_6a_star_13PriorityQueue_push;
   __pyx_vtable_6a_star_PriorityQueue.pop = (PyObject *(*)(struct __pyx_obj_6a_star_PriorityQueue *))__pyx_f_6a_star_13PriorityQueue_pop;
   __pyx_vtable_6a_star_PriorityQueue._sift_up = (void (*)(struct __pyx_obj_6a_star_PriorityQueue *, int))__pyx_f_6a_star_13PriorityQueue__sift_up;
   __pyx_vtable_6a_star_PriorityQueue._sift_down = (void (*)(struct __pyx_obj_6a_star_PriorityQueue *, int))__pyx_f_6a_star_13PriorityQueue__sift_down;
   #if CYTHON_USE_TYPE_SPECS
-  __pyx_ptype_6a_star_PriorityQueue = (PyTypeObject *) __Pyx_PyType_FromModuleAndSpec(__pyx_m, &__pyx_type_6a_star_PriorityQueue_spec, NULL); if (unlikely(!__pyx_ptype_6a_star_PriorityQueue)) __PYX_ERR(0, 11, __pyx_L1_error)
-  if (__Pyx_fix_up_extension_type_from_spec(&__pyx_type_6a_star_PriorityQueue_spec, __pyx_ptype_6a_star_PriorityQueue) < 0) __PYX_ERR(0, 11, __pyx_L1_error)
+  __pyx_ptype_6a_star_PriorityQueue = (PyTypeObject *) __Pyx_PyType_FromModuleAndSpec(__pyx_m, &__pyx_type_6a_star_PriorityQueue_spec, NULL); if (unlikely(!__pyx_ptype_6a_star_PriorityQueue)) __PYX_ERR(0, 15, __pyx_L1_error)
+  if (__Pyx_fix_up_extension_type_from_spec(&__pyx_type_6a_star_PriorityQueue_spec, __pyx_ptype_6a_star_PriorityQueue) < 0) __PYX_ERR(0, 15, __pyx_L1_error)
   #else
   __pyx_ptype_6a_star_PriorityQueue = &__pyx_type_6a_star_PriorityQueue;
   #endif
   #if !CYTHON_COMPILING_IN_LIMITED_API
   #endif
   #if !CYTHON_USE_TYPE_SPECS
-  if (__Pyx_PyType_Ready(__pyx_ptype_6a_star_PriorityQueue) < 0) __PYX_ERR(0, 11, __pyx_L1_error)
+  if (__Pyx_PyType_Ready(__pyx_ptype_6a_star_PriorityQueue) < 0) __PYX_ERR(0, 15, __pyx_L1_error)
   #endif
   #if PY_MAJOR_VERSION < 3
   __pyx_ptype_6a_star_PriorityQueue->tp_print = 0;
@@ -12244,24 +14223,24 @@ static int __Pyx_modinit_type_init_code(void) {
     __pyx_ptype_6a_star_PriorityQueue->tp_getattro = __Pyx_PyObject_GenericGetAttr;
   }
   #endif
-  if (__Pyx_SetVtable(__pyx_ptype_6a_star_PriorityQueue, __pyx_vtabptr_6a_star_PriorityQueue) < 0) __PYX_ERR(0, 11, __pyx_L1_error)
+  if (__Pyx_SetVtable(__pyx_ptype_6a_star_PriorityQueue, __pyx_vtabptr_6a_star_PriorityQueue) < 0) __PYX_ERR(0, 15, __pyx_L1_error)
   #if !CYTHON_COMPILING_IN_LIMITED_API
-  if (__Pyx_MergeVtables(__pyx_ptype_6a_star_PriorityQueue) < 0) __PYX_ERR(0, 11, __pyx_L1_error)
+  if (__Pyx_MergeVtables(__pyx_ptype_6a_star_PriorityQueue) < 0) __PYX_ERR(0, 15, __pyx_L1_error)
   #endif
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_PriorityQueue, (PyObject *) __pyx_ptype_6a_star_PriorityQueue) < 0) __PYX_ERR(0, 11, __pyx_L1_error)
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_PriorityQueue, (PyObject *) __pyx_ptype_6a_star_PriorityQueue) < 0) __PYX_ERR(0, 15, __pyx_L1_error)
   #if !CYTHON_COMPILING_IN_LIMITED_API
-  if (__Pyx_setup_reduce((PyObject *) __pyx_ptype_6a_star_PriorityQueue) < 0) __PYX_ERR(0, 11, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject *) __pyx_ptype_6a_star_PriorityQueue) < 0) __PYX_ERR(0, 15, __pyx_L1_error)
   #endif
   #if CYTHON_USE_TYPE_SPECS
-  __pyx_ptype_6a_star___pyx_scope_struct____pyx_f_6a_star__heuristic = (PyTypeObject *) __Pyx_PyType_FromModuleAndSpec(__pyx_m, &__pyx_type_6a_star___pyx_scope_struct____pyx_f_6a_star__heuristic_spec, NULL); if (unlikely(!__pyx_ptype_6a_star___pyx_scope_struct____pyx_f_6a_star__heuristic)) __PYX_ERR(0, 321, __pyx_L1_error)
-  if (__Pyx_fix_up_extension_type_from_spec(&__pyx_type_6a_star___pyx_scope_struct____pyx_f_6a_star__heuristic_spec, __pyx_ptype_6a_star___pyx_scope_struct____pyx_f_6a_star__heuristic) < 0) __PYX_ERR(0, 321, __pyx_L1_error)
+  __pyx_ptype_6a_star___pyx_scope_struct____pyx_f_6a_star__heuristic = (PyTypeObject *) __Pyx_PyType_FromModuleAndSpec(__pyx_m, &__pyx_type_6a_star___pyx_scope_struct____pyx_f_6a_star__heuristic_spec, NULL); if (unlikely(!__pyx_ptype_6a_star___pyx_scope_struct____pyx_f_6a_star__heuristic)) __PYX_ERR(0, 420, __pyx_L1_error)
+  if (__Pyx_fix_up_extension_type_from_spec(&__pyx_type_6a_star___pyx_scope_struct____pyx_f_6a_star__heuristic_spec, __pyx_ptype_6a_star___pyx_scope_struct____pyx_f_6a_star__heuristic) < 0) __PYX_ERR(0, 420, __pyx_L1_error)
   #else
   __pyx_ptype_6a_star___pyx_scope_struct____pyx_f_6a_star__heuristic = &__pyx_type_6a_star___pyx_scope_struct____pyx_f_6a_star__heuristic;
   #endif
   #if !CYTHON_COMPILING_IN_LIMITED_API
   #endif
   #if !CYTHON_USE_TYPE_SPECS
-  if (__Pyx_PyType_Ready(__pyx_ptype_6a_star___pyx_scope_struct____pyx_f_6a_star__heuristic) < 0) __PYX_ERR(0, 321, __pyx_L1_error)
+  if (__Pyx_PyType_Ready(__pyx_ptype_6a_star___pyx_scope_struct____pyx_f_6a_star__heuristic) < 0) __PYX_ERR(0, 420, __pyx_L1_error)
   #endif
   #if PY_MAJOR_VERSION < 3
   __pyx_ptype_6a_star___pyx_scope_struct____pyx_f_6a_star__heuristic->tp_print = 0;
@@ -12272,15 +14251,15 @@ static int __Pyx_modinit_type_init_code(void) {
   }
   #endif
   #if CYTHON_USE_TYPE_SPECS
-  __pyx_ptype_6a_star___pyx_scope_struct_1_genexpr = (PyTypeObject *) __Pyx_PyType_FromModuleAndSpec(__pyx_m, &__pyx_type_6a_star___pyx_scope_struct_1_genexpr_spec, NULL); if (unlikely(!__pyx_ptype_6a_star___pyx_scope_struct_1_genexpr)) __PYX_ERR(0, 327, __pyx_L1_error)
-  if (__Pyx_fix_up_extension_type_from_spec(&__pyx_type_6a_star___pyx_scope_struct_1_genexpr_spec, __pyx_ptype_6a_star___pyx_scope_struct_1_genexpr) < 0) __PYX_ERR(0, 327, __pyx_L1_error)
+  __pyx_ptype_6a_star___pyx_scope_struct_1_genexpr = (PyTypeObject *) __Pyx_PyType_FromModuleAndSpec(__pyx_m, &__pyx_type_6a_star___pyx_scope_struct_1_genexpr_spec, NULL); if (unlikely(!__pyx_ptype_6a_star___pyx_scope_struct_1_genexpr)) __PYX_ERR(0, 426, __pyx_L1_error)
+  if (__Pyx_fix_up_extension_type_from_spec(&__pyx_type_6a_star___pyx_scope_struct_1_genexpr_spec, __pyx_ptype_6a_star___pyx_scope_struct_1_genexpr) < 0) __PYX_ERR(0, 426, __pyx_L1_error)
   #else
   __pyx_ptype_6a_star___pyx_scope_struct_1_genexpr = &__pyx_type_6a_star___pyx_scope_struct_1_genexpr;
   #endif
   #if !CYTHON_COMPILING_IN_LIMITED_API
   #endif
   #if !CYTHON_USE_TYPE_SPECS
-  if (__Pyx_PyType_Ready(__pyx_ptype_6a_star___pyx_scope_struct_1_genexpr) < 0) __PYX_ERR(0, 327, __pyx_L1_error)
+  if (__Pyx_PyType_Ready(__pyx_ptype_6a_star___pyx_scope_struct_1_genexpr) < 0) __PYX_ERR(0, 426, __pyx_L1_error)
   #endif
   #if PY_MAJOR_VERSION < 3
   __pyx_ptype_6a_star___pyx_scope_struct_1_genexpr->tp_print = 0;
@@ -12644,23 +14623,105 @@ if (!__Pyx_RefNanny) {
  * from logger.logger import get_a_logger
  * 
  * import sys             # <<<<<<<<<<<<<<
- * 
- * 
+ * import time
+ * from astar.a_star_stats import (FAILURE_BLOCKED_PORTS, FAILURE_SEGMENT_LENGTH, FAILURE_EXHAUSTED,
  */
   __pyx_t_2 = __Pyx_ImportDottedModule(__pyx_n_s_sys, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 6, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   if (PyDict_SetItem(__pyx_d, __pyx_n_s_sys, __pyx_t_2) < 0) __PYX_ERR(0, 6, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
+  /* "a_star.pyx":7
+ * 
+ * import sys
+ * import time             # <<<<<<<<<<<<<<
+ * from astar.a_star_stats import (FAILURE_BLOCKED_PORTS, FAILURE_SEGMENT_LENGTH, FAILURE_EXHAUSTED,
+ *                                 FAILURE_LIMIT_REACHED, LIMIT_EXPANSIONS, LIMIT_OPEN_SET, LIMIT_TIME,
+ */
+  __pyx_t_2 = __Pyx_ImportDottedModule(__pyx_n_s_time, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 7, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_time, __pyx_t_2) < 0) __PYX_ERR(0, 7, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "a_star.pyx":8
+ * import sys
+ * import time
+ * from astar.a_star_stats import (FAILURE_BLOCKED_PORTS, FAILURE_SEGMENT_LENGTH, FAILURE_EXHAUSTED,             # <<<<<<<<<<<<<<
+ *                                 FAILURE_LIMIT_REACHED, LIMIT_EXPANSIONS, LIMIT_OPEN_SET, LIMIT_TIME,
+ *                                 estimate_search_memory)
+ */
+  __pyx_t_2 = PyList_New(8); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 8, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_INCREF(__pyx_n_s_FAILURE_BLOCKED_PORTS);
+  __Pyx_GIVEREF(__pyx_n_s_FAILURE_BLOCKED_PORTS);
+  if (__Pyx_PyList_SET_ITEM(__pyx_t_2, 0, __pyx_n_s_FAILURE_BLOCKED_PORTS)) __PYX_ERR(0, 8, __pyx_L1_error);
+  __Pyx_INCREF(__pyx_n_s_FAILURE_SEGMENT_LENGTH);
+  __Pyx_GIVEREF(__pyx_n_s_FAILURE_SEGMENT_LENGTH);
+  if (__Pyx_PyList_SET_ITEM(__pyx_t_2, 1, __pyx_n_s_FAILURE_SEGMENT_LENGTH)) __PYX_ERR(0, 8, __pyx_L1_error);
+  __Pyx_INCREF(__pyx_n_s_FAILURE_EXHAUSTED);
+  __Pyx_GIVEREF(__pyx_n_s_FAILURE_EXHAUSTED);
+  if (__Pyx_PyList_SET_ITEM(__pyx_t_2, 2, __pyx_n_s_FAILURE_EXHAUSTED)) __PYX_ERR(0, 8, __pyx_L1_error);
+  __Pyx_INCREF(__pyx_n_s_FAILURE_LIMIT_REACHED);
+  __Pyx_GIVEREF(__pyx_n_s_FAILURE_LIMIT_REACHED);
+  if (__Pyx_PyList_SET_ITEM(__pyx_t_2, 3, __pyx_n_s_FAILURE_LIMIT_REACHED)) __PYX_ERR(0, 8, __pyx_L1_error);
+  __Pyx_INCREF(__pyx_n_s_LIMIT_EXPANSIONS);
+  __Pyx_GIVEREF(__pyx_n_s_LIMIT_EXPANSIONS);
+  if (__Pyx_PyList_SET_ITEM(__pyx_t_2, 4, __pyx_n_s_LIMIT_EXPANSIONS)) __PYX_ERR(0, 8, __pyx_L1_error);
+  __Pyx_INCREF(__pyx_n_s_LIMIT_OPEN_SET);
+  __Pyx_GIVEREF(__pyx_n_s_LIMIT_OPEN_SET);
+  if (__Pyx_PyList_SET_ITEM(__pyx_t_2, 5, __pyx_n_s_LIMIT_OPEN_SET)) __PYX_ERR(0, 8, __pyx_L1_error);
+  __Pyx_INCREF(__pyx_n_s_LIMIT_TIME);
+  __Pyx_GIVEREF(__pyx_n_s_LIMIT_TIME);
+  if (__Pyx_PyList_SET_ITEM(__pyx_t_2, 6, __pyx_n_s_LIMIT_TIME)) __PYX_ERR(0, 8, __pyx_L1_error);
+  __Pyx_INCREF(__pyx_n_s_estimate_search_memory);
+  __Pyx_GIVEREF(__pyx_n_s_estimate_search_memory);
+  if (__Pyx_PyList_SET_ITEM(__pyx_t_2, 7, __pyx_n_s_estimate_search_memory)) __PYX_ERR(0, 8, __pyx_L1_error);
+  __pyx_t_3 = __Pyx_Import(__pyx_n_s_astar_a_star_stats, __pyx_t_2, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 8, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_ImportFrom(__pyx_t_3, __pyx_n_s_FAILURE_BLOCKED_PORTS); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 8, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_FAILURE_BLOCKED_PORTS, __pyx_t_2) < 0) __PYX_ERR(0, 8, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_ImportFrom(__pyx_t_3, __pyx_n_s_FAILURE_SEGMENT_LENGTH); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 8, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_FAILURE_SEGMENT_LENGTH, __pyx_t_2) < 0) __PYX_ERR(0, 8, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_ImportFrom(__pyx_t_3, __pyx_n_s_FAILURE_EXHAUSTED); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 8, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_FAILURE_EXHAUSTED, __pyx_t_2) < 0) __PYX_ERR(0, 8, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_ImportFrom(__pyx_t_3, __pyx_n_s_FAILURE_LIMIT_REACHED); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 8, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_FAILURE_LIMIT_REACHED, __pyx_t_2) < 0) __PYX_ERR(0, 9, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_ImportFrom(__pyx_t_3, __pyx_n_s_LIMIT_EXPANSIONS); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 8, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_LIMIT_EXPANSIONS, __pyx_t_2) < 0) __PYX_ERR(0, 9, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_ImportFrom(__pyx_t_3, __pyx_n_s_LIMIT_OPEN_SET); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 8, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_LIMIT_OPEN_SET, __pyx_t_2) < 0) __PYX_ERR(0, 9, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_ImportFrom(__pyx_t_3, __pyx_n_s_LIMIT_TIME); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 8, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_LIMIT_TIME, __pyx_t_2) < 0) __PYX_ERR(0, 9, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_ImportFrom(__pyx_t_3, __pyx_n_s_estimate_search_memory); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 8, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_estimate_search_memory, __pyx_t_2) < 0) __PYX_ERR(0, 10, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
   /* "(tree fragment)":1
  * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
  *     cdef tuple state
  *     cdef object _dict
  */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_6a_star_13PriorityQueue_3__reduce_cython__, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_PriorityQueue___reduce_cython, NULL, __pyx_n_s_a_star, __pyx_d, ((PyObject *)__pyx_codeobj__12)); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 1, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_6a_star_PriorityQueue, __pyx_n_s_reduce_cython, __pyx_t_2) < 0) __PYX_ERR(1, 1, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_6a_star_13PriorityQueue_3__reduce_cython__, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_PriorityQueue___reduce_cython, NULL, __pyx_n_s_a_star, __pyx_d, ((PyObject *)__pyx_codeobj__12)); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_6a_star_PriorityQueue, __pyx_n_s_reduce_cython, __pyx_t_3) < 0) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   PyType_Modified(__pyx_ptype_6a_star_PriorityQueue);
 
   /* "(tree fragment)":16
@@ -12669,43 +14730,44 @@ if (!__Pyx_RefNanny) {
  * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
  *     __pyx_unpickle_PriorityQueue__set_state(self, __pyx_state)
  */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_6a_star_13PriorityQueue_5__setstate_cython__, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_PriorityQueue___setstate_cython, NULL, __pyx_n_s_a_star, __pyx_d, ((PyObject *)__pyx_codeobj__14)); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 16, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_6a_star_PriorityQueue, __pyx_n_s_setstate_cython, __pyx_t_2) < 0) __PYX_ERR(1, 16, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_6a_star_13PriorityQueue_5__setstate_cython__, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_PriorityQueue___setstate_cython, NULL, __pyx_n_s_a_star, __pyx_d, ((PyObject *)__pyx_codeobj__14)); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 16, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_6a_star_PriorityQueue, __pyx_n_s_setstate_cython, __pyx_t_3) < 0) __PYX_ERR(1, 16, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   PyType_Modified(__pyx_ptype_6a_star_PriorityQueue);
 
-  /* "a_star.pyx":140
+  /* "a_star.pyx":147
  *     return seg if seg < minimum_segment_length else minimum_segment_length
  * 
- * def astar_start(grid_vertical, grid_horizontal, start, goal_nodes, minimum_segment_length, tsp, trace_width_scaled):             # <<<<<<<<<<<<<<
+ * def astar_start(grid_vertical, grid_horizontal, start, goal_nodes, minimum_segment_length, tsp, trace_width_scaled,             # <<<<<<<<<<<<<<
+ *                 stats=None, limits=None):
  * 
- *     path = []
  */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_6a_star_1astar_start, 0, __pyx_n_s_astar_start, NULL, __pyx_n_s_a_star, __pyx_d, ((PyObject *)__pyx_codeobj__16)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 140, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_astar_start, __pyx_t_2) < 0) __PYX_ERR(0, 140, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_6a_star_1astar_start, 0, __pyx_n_s_astar_start, NULL, __pyx_n_s_a_star, __pyx_d, ((PyObject *)__pyx_codeobj__16)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 147, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_3, __pyx_tuple__2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_astar_start, __pyx_t_3) < 0) __PYX_ERR(0, 147, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
   /* "(tree fragment)":1
  * def __pyx_unpickle_PriorityQueue(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
  *     cdef object __pyx_PickleError
  *     cdef object __pyx_result
  */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_6a_star_3__pyx_unpickle_PriorityQueue, 0, __pyx_n_s_pyx_unpickle_PriorityQueue, NULL, __pyx_n_s_a_star, __pyx_d, ((PyObject *)__pyx_codeobj__18)); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 1, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pyx_unpickle_PriorityQueue, __pyx_t_2) < 0) __PYX_ERR(1, 1, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_3 = __Pyx_CyFunction_New(&__pyx_mdef_6a_star_3__pyx_unpickle_PriorityQueue, 0, __pyx_n_s_pyx_unpickle_PriorityQueue, NULL, __pyx_n_s_a_star, __pyx_d, ((PyObject *)__pyx_codeobj__18)); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_pyx_unpickle_PriorityQueue, __pyx_t_3) < 0) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
   /* "a_star.pyx":1
  * from itertools import combinations             # <<<<<<<<<<<<<<
  * 
  * 
  */
-  __pyx_t_2 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_test, __pyx_t_2) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_3 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_test, __pyx_t_3) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
   /*--- Wrapped vars code ---*/
 
@@ -17669,72 +19731,481 @@ static void __Pyx_AddTraceback(const char *funcname, int c_line,
         __Pyx_ErrRestoreInState(tstate, ptype, pvalue, ptraceback);
         __pyx_insert_code_object(c_line ? -c_line : py_line, py_code);
     }
-    py_frame = PyFrame_New(
-        tstate,            /*PyThreadState *tstate,*/
-        py_code,           /*PyCodeObject *code,*/
-        __pyx_d,    /*PyObject *globals,*/
-        0                  /*PyObject *locals*/
-    );
-    if (!py_frame) goto bad;
-    __Pyx_PyFrame_SetLineNumber(py_frame, py_line);
-    PyTraceBack_Here(py_frame);
-bad:
-    Py_XDECREF(py_code);
-    Py_XDECREF(py_frame);
+    py_frame = PyFrame_New(
+        tstate,            /*PyThreadState *tstate,*/
+        py_code,           /*PyCodeObject *code,*/
+        __pyx_d,    /*PyObject *globals,*/
+        0                  /*PyObject *locals*/
+    );
+    if (!py_frame) goto bad;
+    __Pyx_PyFrame_SetLineNumber(py_frame, py_line);
+    PyTraceBack_Here(py_frame);
+bad:
+    Py_XDECREF(py_code);
+    Py_XDECREF(py_frame);
+}
+#endif
+
+/* CIntFromPyVerify */
+#define __PYX_VERIFY_RETURN_INT(target_type, func_type, func_value)\
+    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 0)
+#define __PYX_VERIFY_RETURN_INT_EXC(target_type, func_type, func_value)\
+    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 1)
+#define __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, exc)\
+    {\
+        func_type value = func_value;\
+        if (sizeof(target_type) < sizeof(func_type)) {\
+            if (unlikely(value != (func_type) (target_type) value)) {\
+                func_type zero = 0;\
+                if (exc && unlikely(value == (func_type)-1 && PyErr_Occurred()))\
+                    return (target_type) -1;\
+                if (is_unsigned && unlikely(value < zero))\
+                    goto raise_neg_overflow;\
+                else\
+                    goto raise_overflow;\
+            }\
+        }\
+        return (target_type) value;\
+    }
+
+/* CIntFromPy */
+static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const long neg_one = (long) -1, const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+#if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_Check(x))) {
+        if ((sizeof(long) < sizeof(long))) {
+            __PYX_VERIFY_RETURN_INT(long, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (long) val;
+        }
+    }
+#endif
+    if (unlikely(!PyLong_Check(x))) {
+        long val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (long) -1;
+        val = __Pyx_PyInt_As_long(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+    if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+        if (unlikely(__Pyx_PyLong_IsNeg(x))) {
+            goto raise_neg_overflow;
+        } else if (__Pyx_PyLong_IsCompact(x)) {
+            __PYX_VERIFY_RETURN_INT(long, __Pyx_compact_upylong, __Pyx_PyLong_CompactValueUnsigned(x))
+        } else {
+            const digit* digits = __Pyx_PyLong_Digits(x);
+            assert(__Pyx_PyLong_DigitCount(x) > 1);
+            switch (__Pyx_PyLong_DigitCount(x)) {
+                case 2:
+                    if ((8 * sizeof(long) > 1 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(long) >= 2 * PyLong_SHIFT)) {
+                            return (long) (((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if ((8 * sizeof(long) > 2 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(long) >= 3 * PyLong_SHIFT)) {
+                            return (long) (((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if ((8 * sizeof(long) > 3 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(long) >= 4 * PyLong_SHIFT)) {
+                            return (long) (((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                        }
+                    }
+                    break;
+            }
+        }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+        if (unlikely(Py_SIZE(x) < 0)) {
+            goto raise_neg_overflow;
+        }
+#else
+        {
+            int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+            if (unlikely(result < 0))
+                return (long) -1;
+            if (unlikely(result == 1))
+                goto raise_neg_overflow;
+        }
+#endif
+        if ((sizeof(long) <= sizeof(unsigned long))) {
+            __PYX_VERIFY_RETURN_INT_EXC(long, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+        } else if ((sizeof(long) <= sizeof(unsigned PY_LONG_LONG))) {
+            __PYX_VERIFY_RETURN_INT_EXC(long, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
+        }
+    } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+        if (__Pyx_PyLong_IsCompact(x)) {
+            __PYX_VERIFY_RETURN_INT(long, __Pyx_compact_pylong, __Pyx_PyLong_CompactValue(x))
+        } else {
+            const digit* digits = __Pyx_PyLong_Digits(x);
+            assert(__Pyx_PyLong_DigitCount(x) > 1);
+            switch (__Pyx_PyLong_SignedDigitCount(x)) {
+                case -2:
+                    if ((8 * sizeof(long) - 1 > 1 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(long) - 1 > 2 * PyLong_SHIFT)) {
+                            return (long) (((long)-1)*(((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if ((8 * sizeof(long) > 1 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(long) - 1 > 2 * PyLong_SHIFT)) {
+                            return (long) ((((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if ((8 * sizeof(long) - 1 > 2 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(long) - 1 > 3 * PyLong_SHIFT)) {
+                            return (long) (((long)-1)*(((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if ((8 * sizeof(long) > 2 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(long) - 1 > 3 * PyLong_SHIFT)) {
+                            return (long) ((((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if ((8 * sizeof(long) - 1 > 3 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(long) - 1 > 4 * PyLong_SHIFT)) {
+                            return (long) (((long)-1)*(((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if ((8 * sizeof(long) > 3 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(long) - 1 > 4 * PyLong_SHIFT)) {
+                            return (long) ((((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+            }
+        }
+#endif
+        if ((sizeof(long) <= sizeof(long))) {
+            __PYX_VERIFY_RETURN_INT_EXC(long, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+        } else if ((sizeof(long) <= sizeof(PY_LONG_LONG))) {
+            __PYX_VERIFY_RETURN_INT_EXC(long, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+        }
+    }
+    {
+        long val;
+        int ret = -1;
+#if PY_VERSION_HEX >= 0x030d00A6 && !CYTHON_COMPILING_IN_LIMITED_API
+        Py_ssize_t bytes_copied = PyLong_AsNativeBytes(
+            x, &val, sizeof(val), Py_ASNATIVEBYTES_NATIVE_ENDIAN | (is_unsigned ? Py_ASNATIVEBYTES_UNSIGNED_BUFFER | Py_ASNATIVEBYTES_REJECT_NEGATIVE : 0));
+        if (unlikely(bytes_copied == -1)) {
+        } else if (unlikely(bytes_copied > (Py_ssize_t) sizeof(val))) {
+            goto raise_overflow;
+        } else {
+            ret = 0;
+        }
+#elif PY_VERSION_HEX < 0x030d0000 && !(CYTHON_COMPILING_IN_PYPY || CYTHON_COMPILING_IN_LIMITED_API) || defined(_PyLong_AsByteArray)
+        int one = 1; int is_little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&val;
+        ret = _PyLong_AsByteArray((PyLongObject *)x,
+                                    bytes, sizeof(val),
+                                    is_little, !is_unsigned);
+#else
+        PyObject *v;
+        PyObject *stepval = NULL, *mask = NULL, *shift = NULL;
+        int bits, remaining_bits, is_negative = 0;
+        int chunk_size = (sizeof(long) < 8) ? 30 : 62;
+        if (likely(PyLong_CheckExact(x))) {
+            v = __Pyx_NewRef(x);
+        } else {
+            v = PyNumber_Long(x);
+            if (unlikely(!v)) return (long) -1;
+            assert(PyLong_CheckExact(v));
+        }
+        {
+            int result = PyObject_RichCompareBool(v, Py_False, Py_LT);
+            if (unlikely(result < 0)) {
+                Py_DECREF(v);
+                return (long) -1;
+            }
+            is_negative = result == 1;
+        }
+        if (is_unsigned && unlikely(is_negative)) {
+            Py_DECREF(v);
+            goto raise_neg_overflow;
+        } else if (is_negative) {
+            stepval = PyNumber_Invert(v);
+            Py_DECREF(v);
+            if (unlikely(!stepval))
+                return (long) -1;
+        } else {
+            stepval = v;
+        }
+        v = NULL;
+        val = (long) 0;
+        mask = PyLong_FromLong((1L << chunk_size) - 1); if (unlikely(!mask)) goto done;
+        shift = PyLong_FromLong(chunk_size); if (unlikely(!shift)) goto done;
+        for (bits = 0; bits < (int) sizeof(long) * 8 - chunk_size; bits += chunk_size) {
+            PyObject *tmp, *digit;
+            long idigit;
+            digit = PyNumber_And(stepval, mask);
+            if (unlikely(!digit)) goto done;
+            idigit = PyLong_AsLong(digit);
+            Py_DECREF(digit);
+            if (unlikely(idigit < 0)) goto done;
+            val |= ((long) idigit) << bits;
+            tmp = PyNumber_Rshift(stepval, shift);
+            if (unlikely(!tmp)) goto done;
+            Py_DECREF(stepval); stepval = tmp;
+        }
+        Py_DECREF(shift); shift = NULL;
+        Py_DECREF(mask); mask = NULL;
+        {
+            long idigit = PyLong_AsLong(stepval);
+            if (unlikely(idigit < 0)) goto done;
+            remaining_bits = ((int) sizeof(long) * 8) - bits - (is_unsigned ? 0 : 1);
+            if (unlikely(idigit >= (1L << remaining_bits)))
+                goto raise_overflow;
+            val |= ((long) idigit) << bits;
+        }
+        if (!is_unsigned) {
+            if (unlikely(val & (((long) 1) << (sizeof(long) * 8 - 1))))
+                goto raise_overflow;
+            if (is_negative)
+                val = ~val;
+        }
+        ret = 0;
+    done:
+        Py_XDECREF(shift);
+        Py_XDECREF(mask);
+        Py_XDECREF(stepval);
+#endif
+        if (unlikely(ret))
+            return (long) -1;
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to long");
+    return (long) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to long");
+    return (long) -1;
+}
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const long neg_one = (long) -1, const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(long) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(long) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(long) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(long) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(long) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        unsigned char *bytes = (unsigned char *)&value;
+#if !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX >= 0x030d00A4
+        if (is_unsigned) {
+            return PyLong_FromUnsignedNativeBytes(bytes, sizeof(value), -1);
+        } else {
+            return PyLong_FromNativeBytes(bytes, sizeof(value), -1);
+        }
+#elif !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX < 0x030d0000
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        return _PyLong_FromByteArray(bytes, sizeof(long),
+                                     little, !is_unsigned);
+#else
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        PyObject *from_bytes, *result = NULL;
+        PyObject *py_bytes = NULL, *arg_tuple = NULL, *kwds = NULL, *order_str = NULL;
+        from_bytes = PyObject_GetAttrString((PyObject*)&PyLong_Type, "from_bytes");
+        if (!from_bytes) return NULL;
+        py_bytes = PyBytes_FromStringAndSize((char*)bytes, sizeof(long));
+        if (!py_bytes) goto limited_bad;
+        order_str = PyUnicode_FromString(little ? "little" : "big");
+        if (!order_str) goto limited_bad;
+        arg_tuple = PyTuple_Pack(2, py_bytes, order_str);
+        if (!arg_tuple) goto limited_bad;
+        if (!is_unsigned) {
+            kwds = PyDict_New();
+            if (!kwds) goto limited_bad;
+            if (PyDict_SetItemString(kwds, "signed", __Pyx_NewRef(Py_True))) goto limited_bad;
+        }
+        result = PyObject_Call(from_bytes, arg_tuple, kwds);
+        limited_bad:
+        Py_XDECREF(kwds);
+        Py_XDECREF(arg_tuple);
+        Py_XDECREF(order_str);
+        Py_XDECREF(py_bytes);
+        Py_XDECREF(from_bytes);
+        return result;
+#endif
+    }
 }
-#endif
 
-/* CIntFromPyVerify */
-#define __PYX_VERIFY_RETURN_INT(target_type, func_type, func_value)\
-    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 0)
-#define __PYX_VERIFY_RETURN_INT_EXC(target_type, func_type, func_value)\
-    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 1)
-#define __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, exc)\
-    {\
-        func_type value = func_value;\
-        if (sizeof(target_type) < sizeof(func_type)) {\
-            if (unlikely(value != (func_type) (target_type) value)) {\
-                func_type zero = 0;\
-                if (exc && unlikely(value == (func_type)-1 && PyErr_Occurred()))\
-                    return (target_type) -1;\
-                if (is_unsigned && unlikely(value < zero))\
-                    goto raise_neg_overflow;\
-                else\
-                    goto raise_overflow;\
-            }\
-        }\
-        return (target_type) value;\
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(int) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(int) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(int) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(int) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(int) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        unsigned char *bytes = (unsigned char *)&value;
+#if !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX >= 0x030d00A4
+        if (is_unsigned) {
+            return PyLong_FromUnsignedNativeBytes(bytes, sizeof(value), -1);
+        } else {
+            return PyLong_FromNativeBytes(bytes, sizeof(value), -1);
+        }
+#elif !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX < 0x030d0000
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        return _PyLong_FromByteArray(bytes, sizeof(int),
+                                     little, !is_unsigned);
+#else
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        PyObject *from_bytes, *result = NULL;
+        PyObject *py_bytes = NULL, *arg_tuple = NULL, *kwds = NULL, *order_str = NULL;
+        from_bytes = PyObject_GetAttrString((PyObject*)&PyLong_Type, "from_bytes");
+        if (!from_bytes) return NULL;
+        py_bytes = PyBytes_FromStringAndSize((char*)bytes, sizeof(int));
+        if (!py_bytes) goto limited_bad;
+        order_str = PyUnicode_FromString(little ? "little" : "big");
+        if (!order_str) goto limited_bad;
+        arg_tuple = PyTuple_Pack(2, py_bytes, order_str);
+        if (!arg_tuple) goto limited_bad;
+        if (!is_unsigned) {
+            kwds = PyDict_New();
+            if (!kwds) goto limited_bad;
+            if (PyDict_SetItemString(kwds, "signed", __Pyx_NewRef(Py_True))) goto limited_bad;
+        }
+        result = PyObject_Call(from_bytes, arg_tuple, kwds);
+        limited_bad:
+        Py_XDECREF(kwds);
+        Py_XDECREF(arg_tuple);
+        Py_XDECREF(order_str);
+        Py_XDECREF(py_bytes);
+        Py_XDECREF(from_bytes);
+        return result;
+#endif
     }
+}
 
 /* CIntFromPy */
-static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
+static CYTHON_INLINE PY_LONG_LONG __Pyx_PyInt_As_PY_LONG_LONG(PyObject *x) {
 #ifdef __Pyx_HAS_GCC_DIAGNOSTIC
 #pragma GCC diagnostic push
 #pragma GCC diagnostic ignored "-Wconversion"
 #endif
-    const long neg_one = (long) -1, const_zero = (long) 0;
+    const PY_LONG_LONG neg_one = (PY_LONG_LONG) -1, const_zero = (PY_LONG_LONG) 0;
 #ifdef __Pyx_HAS_GCC_DIAGNOSTIC
 #pragma GCC diagnostic pop
 #endif
     const int is_unsigned = neg_one > const_zero;
 #if PY_MAJOR_VERSION < 3
     if (likely(PyInt_Check(x))) {
-        if ((sizeof(long) < sizeof(long))) {
-            __PYX_VERIFY_RETURN_INT(long, long, PyInt_AS_LONG(x))
+        if ((sizeof(PY_LONG_LONG) < sizeof(long))) {
+            __PYX_VERIFY_RETURN_INT(PY_LONG_LONG, long, PyInt_AS_LONG(x))
         } else {
             long val = PyInt_AS_LONG(x);
             if (is_unsigned && unlikely(val < 0)) {
                 goto raise_neg_overflow;
             }
-            return (long) val;
+            return (PY_LONG_LONG) val;
         }
     }
 #endif
     if (unlikely(!PyLong_Check(x))) {
-        long val;
+        PY_LONG_LONG val;
         PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
-        if (!tmp) return (long) -1;
-        val = __Pyx_PyInt_As_long(tmp);
+        if (!tmp) return (PY_LONG_LONG) -1;
+        val = __Pyx_PyInt_As_PY_LONG_LONG(tmp);
         Py_DECREF(tmp);
         return val;
     }
@@ -17743,35 +20214,35 @@ static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
         if (unlikely(__Pyx_PyLong_IsNeg(x))) {
             goto raise_neg_overflow;
         } else if (__Pyx_PyLong_IsCompact(x)) {
-            __PYX_VERIFY_RETURN_INT(long, __Pyx_compact_upylong, __Pyx_PyLong_CompactValueUnsigned(x))
+            __PYX_VERIFY_RETURN_INT(PY_LONG_LONG, __Pyx_compact_upylong, __Pyx_PyLong_CompactValueUnsigned(x))
         } else {
             const digit* digits = __Pyx_PyLong_Digits(x);
             assert(__Pyx_PyLong_DigitCount(x) > 1);
             switch (__Pyx_PyLong_DigitCount(x)) {
                 case 2:
-                    if ((8 * sizeof(long) > 1 * PyLong_SHIFT)) {
+                    if ((8 * sizeof(PY_LONG_LONG) > 1 * PyLong_SHIFT)) {
                         if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
-                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if ((8 * sizeof(long) >= 2 * PyLong_SHIFT)) {
-                            return (long) (((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                            __PYX_VERIFY_RETURN_INT(PY_LONG_LONG, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(PY_LONG_LONG) >= 2 * PyLong_SHIFT)) {
+                            return (PY_LONG_LONG) (((((PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (PY_LONG_LONG)digits[0]));
                         }
                     }
                     break;
                 case 3:
-                    if ((8 * sizeof(long) > 2 * PyLong_SHIFT)) {
+                    if ((8 * sizeof(PY_LONG_LONG) > 2 * PyLong_SHIFT)) {
                         if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
-                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if ((8 * sizeof(long) >= 3 * PyLong_SHIFT)) {
-                            return (long) (((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                            __PYX_VERIFY_RETURN_INT(PY_LONG_LONG, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(PY_LONG_LONG) >= 3 * PyLong_SHIFT)) {
+                            return (PY_LONG_LONG) (((((((PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (PY_LONG_LONG)digits[0]));
                         }
                     }
                     break;
                 case 4:
-                    if ((8 * sizeof(long) > 3 * PyLong_SHIFT)) {
+                    if ((8 * sizeof(PY_LONG_LONG) > 3 * PyLong_SHIFT)) {
                         if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
-                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if ((8 * sizeof(long) >= 4 * PyLong_SHIFT)) {
-                            return (long) (((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                            __PYX_VERIFY_RETURN_INT(PY_LONG_LONG, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(PY_LONG_LONG) >= 4 * PyLong_SHIFT)) {
+                            return (PY_LONG_LONG) (((((((((PY_LONG_LONG)digits[3]) << PyLong_SHIFT) | (PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (PY_LONG_LONG)digits[0]));
                         }
                     }
                     break;
@@ -17786,93 +20257,93 @@ static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
         {
             int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
             if (unlikely(result < 0))
-                return (long) -1;
+                return (PY_LONG_LONG) -1;
             if (unlikely(result == 1))
                 goto raise_neg_overflow;
         }
 #endif
-        if ((sizeof(long) <= sizeof(unsigned long))) {
-            __PYX_VERIFY_RETURN_INT_EXC(long, unsigned long, PyLong_AsUnsignedLong(x))
+        if ((sizeof(PY_LONG_LONG) <= sizeof(unsigned long))) {
+            __PYX_VERIFY_RETURN_INT_EXC(PY_LONG_LONG, unsigned long, PyLong_AsUnsignedLong(x))
 #ifdef HAVE_LONG_LONG
-        } else if ((sizeof(long) <= sizeof(unsigned PY_LONG_LONG))) {
-            __PYX_VERIFY_RETURN_INT_EXC(long, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+        } else if ((sizeof(PY_LONG_LONG) <= sizeof(unsigned PY_LONG_LONG))) {
+            __PYX_VERIFY_RETURN_INT_EXC(PY_LONG_LONG, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
 #endif
         }
     } else {
 #if CYTHON_USE_PYLONG_INTERNALS
         if (__Pyx_PyLong_IsCompact(x)) {
-            __PYX_VERIFY_RETURN_INT(long, __Pyx_compact_pylong, __Pyx_PyLong_CompactValue(x))
+            __PYX_VERIFY_RETURN_INT(PY_LONG_LONG, __Pyx_compact_pylong, __Pyx_PyLong_CompactValue(x))
         } else {
             const digit* digits = __Pyx_PyLong_Digits(x);
             assert(__Pyx_PyLong_DigitCount(x) > 1);
             switch (__Pyx_PyLong_SignedDigitCount(x)) {
                 case -2:
-                    if ((8 * sizeof(long) - 1 > 1 * PyLong_SHIFT)) {
+                    if ((8 * sizeof(PY_LONG_LONG) - 1 > 1 * PyLong_SHIFT)) {
                         if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
-                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if ((8 * sizeof(long) - 1 > 2 * PyLong_SHIFT)) {
-                            return (long) (((long)-1)*(((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                            __PYX_VERIFY_RETURN_INT(PY_LONG_LONG, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(PY_LONG_LONG) - 1 > 2 * PyLong_SHIFT)) {
+                            return (PY_LONG_LONG) (((PY_LONG_LONG)-1)*(((((PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (PY_LONG_LONG)digits[0])));
                         }
                     }
                     break;
                 case 2:
-                    if ((8 * sizeof(long) > 1 * PyLong_SHIFT)) {
+                    if ((8 * sizeof(PY_LONG_LONG) > 1 * PyLong_SHIFT)) {
                         if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
-                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if ((8 * sizeof(long) - 1 > 2 * PyLong_SHIFT)) {
-                            return (long) ((((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                            __PYX_VERIFY_RETURN_INT(PY_LONG_LONG, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(PY_LONG_LONG) - 1 > 2 * PyLong_SHIFT)) {
+                            return (PY_LONG_LONG) ((((((PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (PY_LONG_LONG)digits[0])));
                         }
                     }
                     break;
                 case -3:
-                    if ((8 * sizeof(long) - 1 > 2 * PyLong_SHIFT)) {
+                    if ((8 * sizeof(PY_LONG_LONG) - 1 > 2 * PyLong_SHIFT)) {
                         if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
-                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if ((8 * sizeof(long) - 1 > 3 * PyLong_SHIFT)) {
-                            return (long) (((long)-1)*(((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                            __PYX_VERIFY_RETURN_INT(PY_LONG_LONG, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(PY_LONG_LONG) - 1 > 3 * PyLong_SHIFT)) {
+                            return (PY_LONG_LONG) (((PY_LONG_LONG)-1)*(((((((PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (PY_LONG_LONG)digits[0])));
                         }
                     }
                     break;
                 case 3:
-                    if ((8 * sizeof(long) > 2 * PyLong_SHIFT)) {
+                    if ((8 * sizeof(PY_LONG_LONG) > 2 * PyLong_SHIFT)) {
                         if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
-                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if ((8 * sizeof(long) - 1 > 3 * PyLong_SHIFT)) {
-                            return (long) ((((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                            __PYX_VERIFY_RETURN_INT(PY_LONG_LONG, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(PY_LONG_LONG) - 1 > 3 * PyLong_SHIFT)) {
+                            return (PY_LONG_LONG) ((((((((PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (PY_LONG_LONG)digits[0])));
                         }
                     }
                     break;
                 case -4:
-                    if ((8 * sizeof(long) - 1 > 3 * PyLong_SHIFT)) {
+                    if ((8 * sizeof(PY_LONG_LONG) - 1 > 3 * PyLong_SHIFT)) {
                         if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
-                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if ((8 * sizeof(long) - 1 > 4 * PyLong_SHIFT)) {
-                            return (long) (((long)-1)*(((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                            __PYX_VERIFY_RETURN_INT(PY_LONG_LONG, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(PY_LONG_LONG) - 1 > 4 * PyLong_SHIFT)) {
+                            return (PY_LONG_LONG) (((PY_LONG_LONG)-1)*(((((((((PY_LONG_LONG)digits[3]) << PyLong_SHIFT) | (PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (PY_LONG_LONG)digits[0])));
                         }
                     }
                     break;
                 case 4:
-                    if ((8 * sizeof(long) > 3 * PyLong_SHIFT)) {
+                    if ((8 * sizeof(PY_LONG_LONG) > 3 * PyLong_SHIFT)) {
                         if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
-                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if ((8 * sizeof(long) - 1 > 4 * PyLong_SHIFT)) {
-                            return (long) ((((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                            __PYX_VERIFY_RETURN_INT(PY_LONG_LONG, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(PY_LONG_LONG) - 1 > 4 * PyLong_SHIFT)) {
+                            return (PY_LONG_LONG) ((((((((((PY_LONG_LONG)digits[3]) << PyLong_SHIFT) | (PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (PY_LONG_LONG)digits[0])));
                         }
                     }
                     break;
             }
         }
 #endif
-        if ((sizeof(long) <= sizeof(long))) {
-            __PYX_VERIFY_RETURN_INT_EXC(long, long, PyLong_AsLong(x))
+        if ((sizeof(PY_LONG_LONG) <= sizeof(long))) {
+            __PYX_VERIFY_RETURN_INT_EXC(PY_LONG_LONG, long, PyLong_AsLong(x))
 #ifdef HAVE_LONG_LONG
-        } else if ((sizeof(long) <= sizeof(PY_LONG_LONG))) {
-            __PYX_VERIFY_RETURN_INT_EXC(long, PY_LONG_LONG, PyLong_AsLongLong(x))
+        } else if ((sizeof(PY_LONG_LONG) <= sizeof(PY_LONG_LONG))) {
+            __PYX_VERIFY_RETURN_INT_EXC(PY_LONG_LONG, PY_LONG_LONG, PyLong_AsLongLong(x))
 #endif
         }
     }
     {
-        long val;
+        PY_LONG_LONG val;
         int ret = -1;
 #if PY_VERSION_HEX >= 0x030d00A6 && !CYTHON_COMPILING_IN_LIMITED_API
         Py_ssize_t bytes_copied = PyLong_AsNativeBytes(
@@ -17898,14 +20369,14 @@ static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
             v = __Pyx_NewRef(x);
         } else {
             v = PyNumber_Long(x);
-            if (unlikely(!v)) return (long) -1;
+            if (unlikely(!v)) return (PY_LONG_LONG) -1;
             assert(PyLong_CheckExact(v));
         }
         {
             int result = PyObject_RichCompareBool(v, Py_False, Py_LT);
             if (unlikely(result < 0)) {
                 Py_DECREF(v);
-                return (long) -1;
+                return (PY_LONG_LONG) -1;
             }
             is_negative = result == 1;
         }
@@ -17916,15 +20387,15 @@ static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
             stepval = PyNumber_Invert(v);
             Py_DECREF(v);
             if (unlikely(!stepval))
-                return (long) -1;
+                return (PY_LONG_LONG) -1;
         } else {
             stepval = v;
         }
         v = NULL;
-        val = (long) 0;
+        val = (PY_LONG_LONG) 0;
         mask = PyLong_FromLong((1L << chunk_size) - 1); if (unlikely(!mask)) goto done;
         shift = PyLong_FromLong(chunk_size); if (unlikely(!shift)) goto done;
-        for (bits = 0; bits < (int) sizeof(long) * 8 - chunk_size; bits += chunk_size) {
+        for (bits = 0; bits < (int) sizeof(PY_LONG_LONG) * 8 - chunk_size; bits += chunk_size) {
             PyObject *tmp, *digit;
             long idigit;
             digit = PyNumber_And(stepval, mask);
@@ -17932,7 +20403,7 @@ static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
             idigit = PyLong_AsLong(digit);
             Py_DECREF(digit);
             if (unlikely(idigit < 0)) goto done;
-            val |= ((long) idigit) << bits;
+            val |= ((PY_LONG_LONG) idigit) << bits;
             tmp = PyNumber_Rshift(stepval, shift);
             if (unlikely(!tmp)) goto done;
             Py_DECREF(stepval); stepval = tmp;
@@ -17942,13 +20413,13 @@ static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
         {
             long idigit = PyLong_AsLong(stepval);
             if (unlikely(idigit < 0)) goto done;
-            remaining_bits = ((int) sizeof(long) * 8) - bits - (is_unsigned ? 0 : 1);
+            remaining_bits = ((int) sizeof(PY_LONG_LONG) * 8) - bits - (is_unsigned ? 0 : 1);
             if (unlikely(idigit >= (1L << remaining_bits)))
                 goto raise_overflow;
-            val |= ((long) idigit) << bits;
+            val |= ((PY_LONG_LONG) idigit) << bits;
         }
         if (!is_unsigned) {
-            if (unlikely(val & (((long) 1) << (sizeof(long) * 8 - 1))))
+            if (unlikely(val & (((PY_LONG_LONG) 1) << (sizeof(PY_LONG_LONG) * 8 - 1))))
                 goto raise_overflow;
             if (is_negative)
                 val = ~val;
@@ -17960,116 +20431,45 @@ static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
         Py_XDECREF(stepval);
 #endif
         if (unlikely(ret))
-            return (long) -1;
+            return (PY_LONG_LONG) -1;
         return val;
     }
 raise_overflow:
     PyErr_SetString(PyExc_OverflowError,
-        "value too large to convert to long");
-    return (long) -1;
+        "value too large to convert to PY_LONG_LONG");
+    return (PY_LONG_LONG) -1;
 raise_neg_overflow:
     PyErr_SetString(PyExc_OverflowError,
-        "can't convert negative value to long");
-    return (long) -1;
-}
-
-/* CIntToPy */
-static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value) {
-#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
-#pragma GCC diagnostic push
-#pragma GCC diagnostic ignored "-Wconversion"
-#endif
-    const long neg_one = (long) -1, const_zero = (long) 0;
-#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
-#pragma GCC diagnostic pop
-#endif
-    const int is_unsigned = neg_one > const_zero;
-    if (is_unsigned) {
-        if (sizeof(long) < sizeof(long)) {
-            return PyInt_FromLong((long) value);
-        } else if (sizeof(long) <= sizeof(unsigned long)) {
-            return PyLong_FromUnsignedLong((unsigned long) value);
-#ifdef HAVE_LONG_LONG
-        } else if (sizeof(long) <= sizeof(unsigned PY_LONG_LONG)) {
-            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
-#endif
-        }
-    } else {
-        if (sizeof(long) <= sizeof(long)) {
-            return PyInt_FromLong((long) value);
-#ifdef HAVE_LONG_LONG
-        } else if (sizeof(long) <= sizeof(PY_LONG_LONG)) {
-            return PyLong_FromLongLong((PY_LONG_LONG) value);
-#endif
-        }
-    }
-    {
-        unsigned char *bytes = (unsigned char *)&value;
-#if !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX >= 0x030d00A4
-        if (is_unsigned) {
-            return PyLong_FromUnsignedNativeBytes(bytes, sizeof(value), -1);
-        } else {
-            return PyLong_FromNativeBytes(bytes, sizeof(value), -1);
-        }
-#elif !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX < 0x030d0000
-        int one = 1; int little = (int)*(unsigned char *)&one;
-        return _PyLong_FromByteArray(bytes, sizeof(long),
-                                     little, !is_unsigned);
-#else
-        int one = 1; int little = (int)*(unsigned char *)&one;
-        PyObject *from_bytes, *result = NULL;
-        PyObject *py_bytes = NULL, *arg_tuple = NULL, *kwds = NULL, *order_str = NULL;
-        from_bytes = PyObject_GetAttrString((PyObject*)&PyLong_Type, "from_bytes");
-        if (!from_bytes) return NULL;
-        py_bytes = PyBytes_FromStringAndSize((char*)bytes, sizeof(long));
-        if (!py_bytes) goto limited_bad;
-        order_str = PyUnicode_FromString(little ? "little" : "big");
-        if (!order_str) goto limited_bad;
-        arg_tuple = PyTuple_Pack(2, py_bytes, order_str);
-        if (!arg_tuple) goto limited_bad;
-        if (!is_unsigned) {
-            kwds = PyDict_New();
-            if (!kwds) goto limited_bad;
-            if (PyDict_SetItemString(kwds, "signed", __Pyx_NewRef(Py_True))) goto limited_bad;
-        }
-        result = PyObject_Call(from_bytes, arg_tuple, kwds);
-        limited_bad:
-        Py_XDECREF(kwds);
-        Py_XDECREF(arg_tuple);
-        Py_XDECREF(order_str);
-        Py_XDECREF(py_bytes);
-        Py_XDECREF(from_bytes);
-        return result;
-#endif
-    }
+        "can't convert negative value to PY_LONG_LONG");
+    return (PY_LONG_LONG) -1;
 }
 
 /* CIntToPy */
-static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value) {
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_PY_LONG_LONG(PY_LONG_LONG value) {
 #ifdef __Pyx_HAS_GCC_DIAGNOSTIC
 #pragma GCC diagnostic push
 #pragma GCC diagnostic ignored "-Wconversion"
 #endif
-    const int neg_one = (int) -1, const_zero = (int) 0;
+    const PY_LONG_LONG neg_one = (PY_LONG_LONG) -1, const_zero = (PY_LONG_LONG) 0;
 #ifdef __Pyx_HAS_GCC_DIAGNOSTIC
 #pragma GCC diagnostic pop
 #endif
     const int is_unsigned = neg_one > const_zero;
     if (is_unsigned) {
-        if (sizeof(int) < sizeof(long)) {
+        if (sizeof(PY_LONG_LONG) < sizeof(long)) {
             return PyInt_FromLong((long) value);
-        } else if (sizeof(int) <= sizeof(unsigned long)) {
+        } else if (sizeof(PY_LONG_LONG) <= sizeof(unsigned long)) {
             return PyLong_FromUnsignedLong((unsigned long) value);
 #ifdef HAVE_LONG_LONG
-        } else if (sizeof(int) <= sizeof(unsigned PY_LONG_LONG)) {
+        } else if (sizeof(PY_LONG_LONG) <= sizeof(unsigned PY_LONG_LONG)) {
             return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
 #endif
         }
     } else {
-        if (sizeof(int) <= sizeof(long)) {
+        if (sizeof(PY_LONG_LONG) <= sizeof(long)) {
             return PyInt_FromLong((long) value);
 #ifdef HAVE_LONG_LONG
-        } else if (sizeof(int) <= sizeof(PY_LONG_LONG)) {
+        } else if (sizeof(PY_LONG_LONG) <= sizeof(PY_LONG_LONG)) {
             return PyLong_FromLongLong((PY_LONG_LONG) value);
 #endif
         }
@@ -18084,7 +20484,7 @@ static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value) {
         }
 #elif !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX < 0x030d0000
         int one = 1; int little = (int)*(unsigned char *)&one;
-        return _PyLong_FromByteArray(bytes, sizeof(int),
+        return _PyLong_FromByteArray(bytes, sizeof(PY_LONG_LONG),
                                      little, !is_unsigned);
 #else
         int one = 1; int little = (int)*(unsigned char *)&one;
@@ -18092,7 +20492,7 @@ static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value) {
         PyObject *py_bytes = NULL, *arg_tuple = NULL, *kwds = NULL, *order_str = NULL;
         from_bytes = PyObject_GetAttrString((PyObject*)&PyLong_Type, "from_bytes");
         if (!from_bytes) return NULL;
-        py_bytes = PyBytes_FromStringAndSize((char*)bytes, sizeof(int));
+        py_bytes = PyBytes_FromStringAndSize((char*)bytes, sizeof(PY_LONG_LONG));
         if (!py_bytes) goto limited_bad;
         order_str = PyUnicode_FromString(little ? "little" : "big");
         if (!order_str) goto limited_bad;
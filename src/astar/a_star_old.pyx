@@ -4,6 +4,10 @@ from itertools import combinations
 from logger.logger import get_a_logger
 
 import sys
+import time
+from astar.a_star_stats import (FAILURE_BLOCKED_PORTS, FAILURE_SEGMENT_LENGTH, FAILURE_EXHAUSTED,
+                                FAILURE_LIMIT_REACHED, LIMIT_EXPANSIONS, LIMIT_OPEN_SET, LIMIT_TIME,
+                                estimate_search_memory)
 
 
 
@@ -17,6 +21,9 @@ cdef class PriorityQueue:
     cdef bint is_empty(self):
         return not self.elements
 
+    cdef int size(self):
+        return len(self.elements)
+
     cdef void push(self, object item, double priority):
         cdef int idx
         self.elements.append((priority, item))
@@ -137,7 +144,8 @@ cdef is_walkable( pos, current_position, grid_vertical, grid_horizontal):
 cdef cap_seg(seg, minimum_segment_length):
     return seg if seg < minimum_segment_length else minimum_segment_length
 
-def astar_start(grid_vertical, grid_horizontal, start, goal_nodes, minimum_segment_length, tsp, trace_width_scaled):
+def astar_start(grid_vertical, grid_horizontal, start, goal_nodes, minimum_segment_length, tsp, trace_width_scaled,
+                stats=None, limits=None):
 
     path = []
     cost = 0
@@ -148,20 +156,20 @@ def astar_start(grid_vertical, grid_horizontal, start, goal_nodes, minimum_segme
 
 
         if len(goal_nodes) <= 2:
-            path, cost = a_star(grid_vertical, grid_horizontal, goal_nodes[0], goal_nodes, minimum_segment_length)
+            path, cost = a_star(grid_vertical, grid_horizontal, goal_nodes[0], goal_nodes, minimum_segment_length, stats, limits)
         else:
             order = tsp_ordering(goal_nodes)
             for i in range(1, len(order)):
 
-                partial_path, partial_cost = a_star(grid_vertical, grid_horizontal, goal_nodes[order[i-1]], [goal_nodes[order[i]]], minimum_segment_length)
+                partial_path, partial_cost = a_star(grid_vertical, grid_horizontal, goal_nodes[order[i-1]], [goal_nodes[order[i]]], minimum_segment_length, stats, limits)
                 segments = segmentation(partial_path)
 
                 if partial_path == None  and i>1:
-                    partial_path, partial_cost = a_star(grid_vertical, grid_horizontal, goal_nodes[order[i-2]], [goal_nodes[order[i]]], minimum_segment_length)
+                    partial_path, partial_cost = a_star(grid_vertical, grid_horizontal, goal_nodes[order[i-2]], [goal_nodes[order[i]]], minimum_segment_length, stats, limits)
 
                 if partial_path == None and i < len(order)-1:
 
-                    partial_path, partial_cost = a_star(grid_vertical, grid_horizontal, goal_nodes[order[i-1]], [goal_nodes[order[i+1]]], minimum_segment_length)
+                    partial_path, partial_cost = a_star(grid_vertical, grid_horizontal, goal_nodes[order[i-1]], [goal_nodes[order[i+1]]], minimum_segment_length, stats, limits)
 
                 if partial_path :
                    # grid_vertical, grid_horizontal = lock_trace(grid_vertical, grid_horizontal, segments, trace_width_scaled)
@@ -177,13 +185,13 @@ def astar_start(grid_vertical, grid_horizontal, start, goal_nodes, minimum_segme
     else:
 
 
-        path, cost = a_star(grid_vertical, grid_horizontal, start, goal_nodes, minimum_segment_length)
+        path, cost = a_star(grid_vertical, grid_horizontal, start, goal_nodes, minimum_segment_length, stats, limits)
 
 
 
     return path, cost
 
-cdef a_star(grid_vertical, grid_horizontal, start, goal_nodes, minimum_segment_length):
+cdef a_star(grid_vertical, grid_horizontal, start, goal_nodes, minimum_segment_length, stats=None, limits=None):
 
     #Parameters
     height = len(grid_vertical)
@@ -209,8 +217,23 @@ cdef a_star(grid_vertical, grid_horizontal, start, goal_nodes, minimum_segment_l
 
     visited_states = set()
 
+    # Search statistics, only handed over when a stats object is given
+    start_time = time.perf_counter()
+    cdef long long nodes_expanded = 0
+    cdef long long nodes_generated = 0
+    cdef long long segment_length_prunes = 0
+    cdef long long goal_segment_length_prunes = 0
+    cdef long long max_open_set = 1
+    cdef long long max_expansions = limits.max_expansions if limits is not None else 0
+    cdef long long open_set_limit = limits.max_open_set if limits is not None else 0
+    cdef double deadline = limits.deadline if limits is not None else 0
+    limit = None
+    state_key = None
+    item = None
+
     while not open_set.is_empty():
-        g, current, mask, path, last_dir, seg_len, after_goal, last_was_reversal = open_set.pop()
+        item = open_set.pop()
+        g, current, mask, path, last_dir, seg_len, after_goal, last_was_reversal = item
         state_key = (current, mask, last_dir, cap_seg(seg_len, minimum_segment_length), after_goal, last_was_reversal)
         if state_key in visited_states:
             continue
@@ -218,8 +241,25 @@ cdef a_star(grid_vertical, grid_horizontal, start, goal_nodes, minimum_segment_l
 
         # If all goals have been visited, return the path.
         if mask == all_visited:
+            if stats is not None:
+                stats.add_search(nodes_expanded=nodes_expanded, nodes_generated=nodes_generated,
+                                 segment_length_prunes=segment_length_prunes, max_open_set=max_open_set,
+                                 visited_states=len(visited_states),
+                                 peak_memory=estimate_search_memory(visited_states, state_key, max_open_set, item,
+                                                                    path),
+                                 seconds=time.perf_counter() - start_time)
             return path, g
 
+        # Stop before the search grows any further, only looking at the clock every 1024 expansions
+        if max_expansions and nodes_expanded >= max_expansions:
+            limit = LIMIT_EXPANSIONS
+            break
+        if deadline and not nodes_expanded & 1023 and time.perf_counter() > deadline:
+            limit = LIMIT_TIME
+            break
+
+        nodes_expanded += 1
+
         x, y = current
         # Determine edges traversed so far.
         edge_set = set(zip(path, path[1:]))
@@ -256,6 +296,7 @@ cdef a_star(grid_vertical, grid_horizontal, start, goal_nodes, minimum_segment_l
                 elif d[0] == -last_dir[0] and d[1] == -last_dir[1]:
 
                     if not after_goal or seg_len < minimum_segment_length:
+                        segment_length_prunes += 1
                         continue
 
 
@@ -269,6 +310,7 @@ cdef a_star(grid_vertical, grid_horizontal, start, goal_nodes, minimum_segment_l
                 else:
 
                     if seg_len < minimum_segment_length:
+                        segment_length_prunes += 1
                         continue
 
                     prospective_last_dir = d
@@ -279,6 +321,8 @@ cdef a_star(grid_vertical, grid_horizontal, start, goal_nodes, minimum_segment_l
 
             if neighbor in goal_indices:
                 if prospective_seg_len < minimum_segment_length:
+                    segment_length_prunes += 1
+                    goal_segment_length_prunes += 1
                     continue
                 prospective_seg_len = 0
                 prospective_last_dir = None
@@ -303,10 +347,65 @@ cdef a_star(grid_vertical, grid_horizontal, start, goal_nodes, minimum_segment_l
                  prospective_last_dir, prospective_seg_len, new_after_goal, prospective_last_was_reversal),
                 new_f
             )
+            nodes_generated += 1
 
+        if open_set.size() > max_open_set:
+            max_open_set = open_set.size()
+            if open_set_limit and max_open_set > open_set_limit:
+                limit = LIMIT_OPEN_SET
+                break
+
+    if stats is not None:
+        blocked = blocked_ports(grid_vertical, grid_horizontal, start, goal_nodes, width, height)
+        if limit is not None:
+            failure_reason = FAILURE_LIMIT_REACHED
+        elif blocked:
+            failure_reason = FAILURE_BLOCKED_PORTS
+        elif goal_segment_length_prunes:
+            failure_reason = FAILURE_SEGMENT_LENGTH
+        else:
+            failure_reason = FAILURE_EXHAUSTED
+
+        stats.add_search(nodes_expanded=nodes_expanded, nodes_generated=nodes_generated,
+                         segment_length_prunes=segment_length_prunes, max_open_set=max_open_set,
+                         visited_states=len(visited_states),
+                         peak_memory=estimate_search_memory(visited_states, state_key, max_open_set, item,
+                                                            item[3] if item else None),
+                         seconds=time.perf_counter() - start_time, failure_reason=failure_reason,
+                         blocked_ports=blocked, limit=limit)
     return None, None
 
 
+cdef blocked_ports(grid_vertical, grid_horizontal, start, goal_nodes, width, height):
+    """Returns the start node if it can not be left and the goal nodes that can not be entered from any side"""
+    directions = [(0, -1), (0, 1), (-1, 0), (1, 0)]
+    blocked = []
+
+    leavable = False
+    for dx, dy in directions:
+        if (in_bounds((start[0] + dx, start[1] + dy), width, height) and
+                is_walkable((start[0] + dx, start[1] + dy), start, grid_vertical, grid_horizontal)):
+            leavable = True
+            break
+    if not leavable:
+        blocked.append(start)
+
+    for goal in goal_nodes:
+        if goal == start:
+            continue
+
+        enterable = False
+        for dx, dy in directions:
+            x, y = goal[0] + dx, goal[1] + dy
+            if (in_bounds((x, y), width, height) and (grid_vertical[y][x] == 0 or grid_horizontal[y][x] == 0)
+                    and is_walkable(goal, (x, y), grid_vertical, grid_horizontal)):
+                enterable = True
+                break
+        if not enterable:
+            blocked.append(goal)
+    return blocked
+
+
 
 
 
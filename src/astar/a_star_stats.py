@@ -0,0 +1,125 @@
+# ==================================================================================================================== #
+# Copyright (C) 2025 Bjørn K.T. Solheim, Leidulv Tønnesland
+# ==================================================================================================================== #
+# This program is free software: you can redistribute it and/or modify it under the terms of
+# the GNU General Public License as published by the Free Software Foundation, version 2.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <https://www.gnu.org/licenses/>.
+# ==================================================================================================================== #
+
+
+# ==================================================== Notes ===========================================================
+"""
+    Routing statistics of a net, filled in by A* when a stats object is passed to it. A net can take several
+    searches, like one per pair of goal nodes with TSP node order or one per start node, so work done is summed over
+    the searches while sizes are the largest seen in one search.
+
+    When a search finds no path, the reason is kept as one of:
+        - blocked ports: the start node can not be left, or a goal node can not be entered from any side
+        - segment length constraints: goal nodes were reached, but only with segments shorter than the minimum
+          segment length
+        - exhausted: every reachable state was expanded without connecting all goal nodes
+        - limit reached: the search was stopped by one of its limits, which is kept as well
+
+    Limits bound a single search by expanded states and by open set size, which together bound the size of the
+    visited set and the memory of the search. The deadline is a point in time given by the caller, so it can cover
+    all searches of a net. A limit of 0 turns it off.
+
+    Peak memory is measured with tracemalloc when turned on by the A* initiator. Otherwise it is estimated from the
+    sizes of the visited set and the open set, where every open set entry holds its own copy of the path.
+"""
+
+# ================================================== Libraries =========================================================
+import sys
+from dataclasses import dataclass, field, asdict
+
+# ================================================== A* stats ==========================================================
+
+FAILURE_BLOCKED_PORTS = "blocked ports"
+FAILURE_SEGMENT_LENGTH = "segment length constraints"
+FAILURE_EXHAUSTED = "exhausted"
+FAILURE_LIMIT_REACHED = "limit reached"
+
+LIMIT_EXPANSIONS = "expansions"
+LIMIT_OPEN_SET = "open set"
+LIMIT_TIME = "time"
+
+
+@dataclass(frozen=True, slots=True)
+class AstarLimits:
+    max_expansions: int = 0
+    max_open_set: int = 0
+    deadline: float = 0.0  # time.perf_counter() value
+
+
+@dataclass
+class AstarStats:
+    net: str = ""
+    routed: bool = False
+    relaxed: bool = False  # Routed with a smaller minimum segment length than configured
+    searches: int = 0
+    failed_searches: int = 0
+    nodes_expanded: int = 0
+    nodes_generated: int = 0
+    segment_length_prunes: int = 0
+    max_open_set: int = 0
+    max_visited_states: int = 0
+    peak_memory: int = 0
+    memory_source: str = "estimate"
+    seconds: float = 0.0
+    failure_reason: str | None = None
+    limits_reached: int = 0
+    limit: str | None = None
+    minimum_segment_length: int | None = None
+    blocked_ports: list = field(default_factory=list)
+
+    def add_search(self, nodes_expanded: int, nodes_generated: int, segment_length_prunes: int, max_open_set: int,
+                   visited_states: int, peak_memory: int, seconds: float, failure_reason: str | None = None,
+                   blocked_ports: list | None = None, limit: str | None = None):
+        self.searches += 1
+        self.nodes_expanded += nodes_expanded
+        self.nodes_generated += nodes_generated
+        self.segment_length_prunes += segment_length_prunes
+        self.max_open_set = max(self.max_open_set, max_open_set)
+        self.max_visited_states = max(self.max_visited_states, visited_states)
+        self.seconds += seconds
+
+        if self.memory_source == "estimate":
+            self.peak_memory = max(self.peak_memory, peak_memory)
+
+        if failure_reason is not None:
+            self.failed_searches += 1
+            self.failure_reason = failure_reason
+            if limit is not None:
+                self.limits_reached += 1
+                self.limit = limit
+            for port in blocked_ports or ():
+                if list(port) not in self.blocked_ports:
+                    self.blocked_ports.append(list(port))
+
+    def set_traced_memory(self, peak_memory: int):
+        self.peak_memory = peak_memory
+        self.memory_source = "tracemalloc"
+
+    def summary(self) -> str:
+        reason = f"{self.limit} limit reached" if self.failure_reason == FAILURE_LIMIT_REACHED else self.failure_reason
+        result = "routed" if self.routed else f"NOT routed ({reason})"
+        return (f"A* net '{self.net}': {result} | Searches: {self.searches} | Expanded: {self.nodes_expanded} | "
+                f"Max open set: {self.max_open_set} | Max visited: {self.max_visited_states} | "
+                f"Peak memory: {self.peak_memory / 1e6:.1f}MB ({self.memory_source}) | Time: {self.seconds:.3f}s")
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def estimate_search_memory(visited_states, state_key, max_open_set: int, open_set_entry, path) -> int:
+    """Estimated bytes of the visited set and the open set at its largest, from the size of one entry of each"""
+    if state_key is None:
+        return sys.getsizeof(visited_states)
+    return (sys.getsizeof(visited_states) + len(visited_states) * sys.getsizeof(state_key)
+            + max_open_set * (sys.getsizeof(open_set_entry) + sys.getsizeof(path)))
@@ -1,6 +1,10 @@
 from itertools import combinations
 from logger.logger import get_a_logger  # Remove if not needed
 import sys
+import time
+from astar.a_star_stats import (FAILURE_BLOCKED_PORTS, FAILURE_SEGMENT_LENGTH, FAILURE_EXHAUSTED,
+                                FAILURE_LIMIT_REACHED, LIMIT_EXPANSIONS, LIMIT_OPEN_SET, LIMIT_TIME,
+                                estimate_search_memory)
 
 
 class PriorityQueue:
@@ -11,6 +15,9 @@ class PriorityQueue:
     def is_empty(self):
         return not self.elements
 
+    def size(self):
+        return len(self.elements)
+
     def push(self, item, priority):
         self.elements.append((priority, item))
         idx = len(self.elements) - 1
@@ -122,30 +129,32 @@ def cap_seg(seg, minimum_segment_length):
     return seg if seg < minimum_segment_length else minimum_segment_length
 
 
-def astar_start(grid_vertical, grid_horizontal, start, goal_nodes, minimum_segment_length, tsp, trace_width_scaled):
+def astar_start(grid_vertical, grid_horizontal, start, goal_nodes, minimum_segment_length, tsp, trace_width_scaled,
+                stats=None, limits=None):
     print("no cython")
     path = []
     cost = 0
 
     if tsp:
         if len(goal_nodes) <= 2:
-            path, cost = a_star(grid_vertical, grid_horizontal, goal_nodes[0], goal_nodes, minimum_segment_length)
+            path, cost = a_star(grid_vertical, grid_horizontal, goal_nodes[0], goal_nodes, minimum_segment_length,
+                                stats, limits)
         else:
             order = tsp_ordering(goal_nodes)
             for i in range(1, len(order)):
                 partial_path, partial_cost = a_star(
                     grid_vertical, grid_horizontal,
-                    goal_nodes[order[i-1]], [goal_nodes[order[i]]], minimum_segment_length)
+                    goal_nodes[order[i-1]], [goal_nodes[order[i]]], minimum_segment_length, stats, limits)
                 segments = segmentation(partial_path)
 
                 if partial_path is None and i > 1:
                     partial_path, partial_cost = a_star(
                         grid_vertical, grid_horizontal,
-                        goal_nodes[order[i-2]], [goal_nodes[order[i]]], minimum_segment_length)
+                        goal_nodes[order[i-2]], [goal_nodes[order[i]]], minimum_segment_length, stats, limits)
                 if partial_path is None and i < len(order) - 1:
                     partial_path, partial_cost = a_star(
                         grid_vertical, grid_horizontal,
-                        goal_nodes[order[i-1]], [goal_nodes[order[i+1]]], minimum_segment_length)
+                        goal_nodes[order[i-1]], [goal_nodes[order[i+1]]], minimum_segment_length, stats, limits)
 
                 if partial_path:
                     # grid_vertical, grid_horizontal = lock_trace(grid_vertical, grid_horizontal, segments, trace_width_scaled)
@@ -154,11 +163,11 @@ def astar_start(grid_vertical, grid_horizontal, start, goal_nodes, minimum_segme
                 else:
                     return None, None
     else:
-        path, cost = a_star(grid_vertical, grid_horizontal, start, goal_nodes, minimum_segment_length)
+        path, cost = a_star(grid_vertical, grid_horizontal, start, goal_nodes, minimum_segment_length, stats, limits)
 
     return path, cost
 
-def a_star(grid_vertical, grid_horizontal, start, goal_nodes, minimum_segment_length):
+def a_star(grid_vertical, grid_horizontal, start, goal_nodes, minimum_segment_length, stats=None, limits=None):
     height = len(grid_vertical)
     width = len(grid_vertical[0]) if height > 0 else 0
 
@@ -179,16 +188,48 @@ def a_star(grid_vertical, grid_horizontal, start, goal_nodes, minimum_segment_le
 
     visited_states = set()
 
+    # Search statistics, only handed over when a stats object is given
+    start_time = time.perf_counter()
+    nodes_expanded = 0
+    nodes_generated = 0
+    segment_length_prunes = 0
+    goal_segment_length_prunes = 0
+    max_open_set = 1
+    max_expansions = limits.max_expansions if limits is not None else 0
+    open_set_limit = limits.max_open_set if limits is not None else 0
+    deadline = limits.deadline if limits is not None else 0
+    limit = None
+    state_key = None
+    item = None
+
     while not open_set.is_empty():
-        g, current, mask, path, last_dir, seg_len, after_goal, last_was_reversal = open_set.pop()
+        item = open_set.pop()
+        g, current, mask, path, last_dir, seg_len, after_goal, last_was_reversal = item
         state_key = (current, mask, last_dir, cap_seg(seg_len, minimum_segment_length), after_goal, last_was_reversal)
         if state_key in visited_states:
             continue
         visited_states.add(state_key)
 
         if mask == all_visited:
+            if stats is not None:
+                stats.add_search(nodes_expanded=nodes_expanded, nodes_generated=nodes_generated,
+                                 segment_length_prunes=segment_length_prunes, max_open_set=max_open_set,
+                                 visited_states=len(visited_states),
+                                 peak_memory=estimate_search_memory(visited_states, state_key, max_open_set, item,
+                                                                    path),
+                                 seconds=time.perf_counter() - start_time)
             return path, g
 
+        # Stop before the search grows any further, only looking at the clock every 1024 expansions
+        if max_expansions and nodes_expanded >= max_expansions:
+            limit = LIMIT_EXPANSIONS
+            break
+        if deadline and not nodes_expanded & 1023 and time.perf_counter() > deadline:
+            limit = LIMIT_TIME
+            break
+
+        nodes_expanded += 1
+
         x, y = current
         edge_set = set(zip(path, path[1:]))
 
@@ -219,6 +260,7 @@ def a_star(grid_vertical, grid_horizontal, start, goal_nodes, minimum_segment_le
                     prospective_last_was_reversal = False
                 elif d[0] == -last_dir[0] and d[1] == -last_dir[1]:
                     if not after_goal or seg_len < minimum_segment_length:
+                        segment_length_prunes += 1
                         continue
                     prospective_last_dir = d
                     prospective_seg_len = 1
@@ -226,6 +268,7 @@ def a_star(grid_vertical, grid_horizontal, start, goal_nodes, minimum_segment_le
                     penalty = 1
                 else:
                     if seg_len < minimum_segment_length:
+                        segment_length_prunes += 1
                         continue
                     prospective_last_dir = d
                     prospective_seg_len = 1
@@ -234,6 +277,8 @@ def a_star(grid_vertical, grid_horizontal, start, goal_nodes, minimum_segment_le
 
             if neighbor in goal_indices:
                 if prospective_seg_len < minimum_segment_length:
+                    segment_length_prunes += 1
+                    goal_segment_length_prunes += 1
                     continue
                 prospective_seg_len = 0
                 prospective_last_dir = None
@@ -255,10 +300,65 @@ def a_star(grid_vertical, grid_horizontal, start, goal_nodes, minimum_segment_le
                  prospective_last_dir, prospective_seg_len, new_after_goal, prospective_last_was_reversal),
                 new_f
             )
+            nodes_generated += 1
 
+        if open_set.size() > max_open_set:
+            max_open_set = open_set.size()
+            if open_set_limit and max_open_set > open_set_limit:
+                limit = LIMIT_OPEN_SET
+                break
+
+    if stats is not None:
+        blocked = blocked_ports(grid_vertical, grid_horizontal, start, goal_nodes, width, height)
+        if limit is not None:
+            failure_reason = FAILURE_LIMIT_REACHED
+        elif blocked:
+            failure_reason = FAILURE_BLOCKED_PORTS
+        elif goal_segment_length_prunes:
+            failure_reason = FAILURE_SEGMENT_LENGTH
+        else:
+            failure_reason = FAILURE_EXHAUSTED
+
+        stats.add_search(nodes_expanded=nodes_expanded, nodes_generated=nodes_generated,
+                         segment_length_prunes=segment_length_prunes, max_open_set=max_open_set,
+                         visited_states=len(visited_states),
+                         peak_memory=estimate_search_memory(visited_states, state_key, max_open_set, item,
+                                                            item[3] if item else None),
+                         seconds=time.perf_counter() - start_time, failure_reason=failure_reason,
+                         blocked_ports=blocked, limit=limit)
     return None, None
 
 
+def blocked_ports(grid_vertical, grid_horizontal, start, goal_nodes, width, height):
+    """Returns the start node if it can not be left and the goal nodes that can not be entered from any side"""
+    directions = [(0, -1), (0, 1), (-1, 0), (1, 0)]
+    blocked = []
+
+    leavable = False
+    for dx, dy in directions:
+        if (in_bounds((start[0] + dx, start[1] + dy), width, height) and
+                is_walkable((start[0] + dx, start[1] + dy), start, grid_vertical, grid_horizontal)):
+            leavable = True
+            break
+    if not leavable:
+        blocked.append(start)
+
+    for goal in goal_nodes:
+        if goal == start:
+            continue
+
+        enterable = False
+        for dx, dy in directions:
+            x, y = goal[0] + dx, goal[1] + dy
+            if (in_bounds((x, y), width, height) and (grid_vertical[y][x] == 0 or grid_horizontal[y][x] == 0)
+                    and is_walkable(goal, (x, y), grid_vertical, grid_horizontal)):
+                enterable = True
+                break
+        if not enterable:
+            blocked.append(goal)
+    return blocked
+
+
 def _manhattan(a, b):
     return abs(a[0] - b[0]) + abs(a[1] - b[1])
 
@@ -24,7 +24,6 @@ from dataclasses import dataclass, field
 from typing import List, Dict
 from collections import defaultdict
 import copy
-import tomllib
 
 from astar.a_star_initiator import AstarInitiator
 from connections.connections import ConnectionLists
@@ -32,12 +31,15 @@ from grid.generate_grid import GridGeneration
 from linear_optimization.initiator_lp import LPInitiator
 from linear_optimization.linear_optimization import LinearOptimizationSolver
 from logger.logger import get_a_logger
+from config.config_loader import get_config
+from instrumentation.instrumentation import timer
 from circuit.circuit_components import (RectArea, RectAreaLayer, Transistor, Capacitor, Resistor, Pin, CircuitCell,
                                         TraceNet, RectAreaLayer, DigitalBlock)
 from traces.generate_astar_path_traces import GenerateAstarPathTraces
 from traces.generate_rail_traces import GenerateRailTraces
 from astar.a_star import astar_start
 from libraries.library_handling import LibraryHandling
+from drc.drc_trace_checker import DRCTraceChecking
 
 
 # =================================================== Cell Creator =====================================================
@@ -58,7 +60,7 @@ class CellCreator:
         self.functional_component_order = []
 
         # Load config
-        self.config = self.__load_config()
+        self.config = get_config()
         self.CELLS_PER_ROW_IN_TOP_CELL = self.config["cell_creator"]["CELLS_PER_ROW_IN_TOP_CELL"]
 
         self.__create_cells()
@@ -66,13 +68,6 @@ class CellCreator:
         self.__add_root_cell_rails()
         # self.__add_top_cell_rail_to_rail_connections()
 
-    def __load_config(self, path="pyproject.toml"):
-        try:
-            with open(path, "rb") as f:
-                return tomllib.load(f)
-        except (FileNotFoundError, tomllib.TOMLDecodeError) as e:
-            self.logger.error(f"Error loading config: {e}")
-
     def __use_earlier_solution_for_cell(self, cell, solved_circuit_cells,
                                         components_grouped_by_circuit_cell, grouped_components):
 
@@ -146,89 +141,105 @@ class CellCreator:
                 )
                 continue
 
-            # Step 2: Perform placement of functional components
-            connections, overlap_dict, net_list = ConnectionLists(
-                input_components=components_grouped_by_circuit_cell[grouped_components]).get()
-
-            components = components_grouped_by_circuit_cell[grouped_components]
-            if any(isinstance(c, self.FUNCTIONAL_TYPES) for c
-                   in components_grouped_by_circuit_cell[grouped_components]):
-                components, self.functional_component_order = (
-                    LPInitiator(components, connections, overlap_dict).initiate_linear_optimization())
-
-            # Step 3: Library specific handling pre trace generation
-            components = (
-                LibraryHandling(project_properties=self.project_properties, components=components,
-                                functional_component_order=self.functional_component_order).pre_trace_generation())
-
-            # Step 4: Move all components to the origin
-            origin_scaled_used_area = RectArea()
-            used_area = RectArea()
-            predefined_area_offset = RectArea()
-            if any(isinstance(c, self.FUNCTIONAL_TYPES) for c
-                   in components_grouped_by_circuit_cell[grouped_components]):
-                used_area = GridGeneration(components=components).get_used_area()
-
+            with timer("cell", cell=cell):
+                # Step 2: Perform placement of functional components
+                with timer("placement", cell=cell):
+                    connections, overlap_dict, net_list = ConnectionLists(
+                        input_components=components_grouped_by_circuit_cell[grouped_components]).get()
+
+                    components = components_grouped_by_circuit_cell[grouped_components]
+                    if any(isinstance(c, self.FUNCTIONAL_TYPES) for c
+                           in components_grouped_by_circuit_cell[grouped_components]):
+                        components, self.functional_component_order = (
+                            LPInitiator(components, connections, overlap_dict).initiate_linear_optimization())
+
+                # Step 3: Library specific handling pre trace generation
+                with timer("library pre trace generation", cell=cell):
+                    components = (
+                        LibraryHandling(project_properties=self.project_properties, components=components,
+                                        functional_component_order=self.functional_component_order
+                                        ).pre_trace_generation())
+
+                # Step 4: Move all components to the origin
+                with timer("grid generation", cell=cell):
+                    origin_scaled_used_area = RectArea()
+                    used_area = RectArea()
+                    predefined_area_offset = RectArea()
+                    if any(isinstance(c, self.FUNCTIONAL_TYPES) for c
+                           in components_grouped_by_circuit_cell[grouped_components]):
+                        used_area = GridGeneration(components=components).get_used_area()
+
+                        for component in components:
+                            if isinstance(component, CircuitCell):
+                                # Takes into account any predefined offset
+                                predefined_area_offset = RectArea(
+                                    x1=component.bounding_box.x1,
+                                    y1=component.bounding_box.y1,
+                                    x2=component.bounding_box.x2,
+                                    y2=component.bounding_box.y2)
+
+                                origin_scaled_used_area = RectArea(
+                                    x1=0,
+                                    y1=0,
+                                    x2=abs(used_area.x2 - used_area.x1) + abs(predefined_area_offset.x2
+                                                                              - predefined_area_offset.x1),
+                                    y2=abs(used_area.y2 - used_area.y1) + abs(predefined_area_offset.y2
+                                                                              - predefined_area_offset.y1))
+
+                    for component in components:
+                        if isinstance(component, CircuitCell):
+                            component.bounding_box = origin_scaled_used_area
+                        elif isinstance(component, self.FUNCTIONAL_TYPES):
+                            component.transform_matrix.c -= used_area.x1 + predefined_area_offset.x1
+                            component.transform_matrix.f -= used_area.y1 + predefined_area_offset.y1
+
+                    # Step 5: Grid generation
+                    grid, scaled_port_coordinates, used_area, port_coordinates, routing_parameters, component_ports \
+                        = GridGeneration(components=components).initialize_grid_generation()
+
+                # Step 6: A star path routing between component ports
+                with timer("astar", cell=cell):
+                    paths, grid_vertical, grid_horizontal = (
+                        AstarInitiator(grid=grid,
+                                       connections=connections,
+                                       components=components,
+                                       scaled_port_coordinates=scaled_port_coordinates,
+                                       port_coordinates=port_coordinates,
+                                       net_list=net_list,
+                                       routing_parameters=routing_parameters,
+                                       component_ports=component_ports
+                                       ).get())
+
+                # Step 7: Generate A* traces
+                with timer("astar traces", cell=cell):
+                    components = GenerateAstarPathTraces(components=components, paths=paths, net_list=net_list,
+                                                         used_area=used_area).get()
+
+                # Step 7.1: Check the generated traces against basic design rules ahead of the full DRC in Magic
+                with timer("trace drc", cell=cell):
+                    DRCTraceChecking(components=components).get()
+
+                # Step 8: Generate rail traces
+                with timer("rail traces", cell=cell):
+                    components = GenerateRailTraces(project_properties=self.project_properties,
+                                                    components=components).get()
+
+                # Step 9: Library specific handling post rail generation
+                with timer("library post rail generation", cell=cell):
+                    components = (
+                        LibraryHandling(project_properties=self.project_properties, components=components,
+                                        functional_component_order=self.functional_component_order
+                                        ).post_rail_generation())
+
+                # Step 10: Move all components to the origin based on the updated cell bounding box from rail
+                # generation
+                components = self.__move_all_components_to_origin_based_on_rail_offsets(components=components)
+
+                # Step 11: Create an updated list of components
                 for component in components:
-                    if isinstance(component, CircuitCell):
-                        # Takes into account any predefined offset
-                        predefined_area_offset = RectArea(
-                            x1=component.bounding_box.x1,
-                            y1=component.bounding_box.y1,
-                            x2=component.bounding_box.x2,
-                            y2=component.bounding_box.y2)
-
-                        origin_scaled_used_area = RectArea(
-                            x1=0,
-                            y1=0,
-                            x2=abs(used_area.x2 - used_area.x1) + abs(predefined_area_offset.x2
-                                                                      - predefined_area_offset.x1),
-                            y2=abs(used_area.y2 - used_area.y1) + abs(predefined_area_offset.y2
-                                                                      - predefined_area_offset.y1))
-
-            for component in components:
-                if isinstance(component, CircuitCell):
-                    component.bounding_box = origin_scaled_used_area
-                elif isinstance(component, self.FUNCTIONAL_TYPES):
-                    component.transform_matrix.c -= used_area.x1 + predefined_area_offset.x1
-                    component.transform_matrix.f -= used_area.y1 + predefined_area_offset.y1
-
-            # Step 5: Grid generation
-            grid, scaled_port_coordinates, used_area, port_coordinates, routing_parameters, component_ports \
-                = GridGeneration(components=components).initialize_grid_generation()
-
-            # Step 6: A star path routing between component ports
-            paths, grid_vertical, grid_horizontal = (
-                AstarInitiator(grid=grid,
-                               connections=connections,
-                               components=components,
-                               scaled_port_coordinates=scaled_port_coordinates,
-                               port_coordinates=port_coordinates,
-                               net_list=net_list,
-                               routing_parameters=routing_parameters,
-                               component_ports=component_ports
-                               ).get())
-
-            # Step 7: Generate A* traces
-            components = GenerateAstarPathTraces(components=components, paths=paths, net_list=net_list,
-                                                 used_area=used_area).get()
-
-            # Step 8: Generate rail traces
-            components = GenerateRailTraces(project_properties=self.project_properties, components=components).get()
-
-            # Step 9: Library specific handling post rail generation
-            components = (
-                LibraryHandling(project_properties=self.project_properties, components=components,
-                                functional_component_order=self.functional_component_order).post_rail_generation())
-
-            # Step 10: Move all components to the origin based on the updated cell bounding box from rail generation
-            components = self.__move_all_components_to_origin_based_on_rail_offsets(components=components)
-
-            # Step 11: Create an updated list of components
-            for component in components:
-                self.updated_components.append(component)
-                solved_circuit_cells[cell].append(component)
-            components.clear()
+                    self.updated_components.append(component)
+                    solved_circuit_cells[cell].append(component)
+                components.clear()
 
     def __move_all_components_to_origin_based_on_rail_offsets(self, components):
         rails_offset_x = 0
@@ -32,7 +32,7 @@ class TransformMatrix:
         self.a, self.b, self.c, self.d, self.e, self.f = params
 
 
-@dataclass
+@dataclass(slots=True)
 class RectArea:
     x1: int = field(default_factory=int)
     y1: int = field(default_factory=int)
@@ -43,7 +43,7 @@ class RectArea:
         self.x1, self.y1, self.x2, self.y2 = params
 
 
-@dataclass
+@dataclass(slots=True)
 class RectAreaLayer:
     layer: str = field(default_factory=str)
     area: RectArea = field(default_factory=RectArea)
@@ -67,6 +67,13 @@ class SubCircuit:
 
 
 @dataclass
+class CellDefinition:
+    cell: str
+    components: List = field(default_factory=list)  # Components of the cell, without any instance information
+    circuit_cells: List = field(default_factory=list)  # Circuit cells instantiated inside the cell
+
+
+@dataclass(slots=True)
 class LayoutPort:
     type: str = field(default_factory=str)
     layer: str = field(default_factory=str)
@@ -183,6 +190,7 @@ class TraceNet:
     cell_chain: str = field(default_factory=str)
     segments: List[RectAreaLayer] | dict = field(default_factory=list)
     vias: List[RectAreaLayer] | dict = field(default_factory=list)
+    relaxed_minimum_segment_length: int = field(default_factory=int)  # 0 when routed with the configured minimum
 
     # Handling of JSON file input
     def __post_init__(self):
@@ -25,14 +25,29 @@
 
 # ================================================== Libraries =========================================================
 import os
+import glob
+import json
+import hashlib
 import subprocess
 import re
 import sys
 from collections import Counter
 from circuit.circuit_components import *
 from logger.logger import get_a_logger
+from config.config_loader import get_config
 import copy
 
+# =============================================== Precompiled patterns =================================================
+
+MISSING_SYMBOL_PATTERN = re.compile(r'\bIS MISSING\b')
+SUBCIRCUIT_PATTERN = re.compile(r'\*\*\.subckt|.subckt')
+COMPONENT_PATTERN = re.compile(r'^[^*.]')
+PIN_PATTERN = re.compile(r'^\*\.')
+PIN_TYPE_PATTERN = re.compile(r'[a-zA-Z]+')
+FILTERED_NAME_PATTERN = re.compile(r'_(.*)')
+FILTERED_GROUP_PATTERN = re.compile(r'^[^_]+(?=_)')
+PATH_BASE_NAME_PATTERN = re.compile(r'[^/]+$')
+
 # ================================================== SPICE Parser ======================================================
 
 
@@ -41,6 +56,7 @@ class SPICEparser:
 
     def __init__(self, project_properties):
         self.project_top_cell_name = project_properties.top_cell_name
+        self.project_top_lib_name = project_properties.top_lib_name
         self.project_directory = project_properties.directory
         self.component_libraries = project_properties.component_libraries
         self.spice_file_content = list()
@@ -51,35 +67,123 @@ class SPICEparser:
         self.visited_cells = list()
         self.cell_chain_list = list()
 
+        # Load config
+        self.config = get_config()
+        self.ALWAYS_GENERATE_SPICE_FILE = self.config["circuit_spice_parser"]["ALWAYS_GENERATE_SPICE_FILE"]
+
+        self.spice_file_path = os.path.expanduser(f"{self.project_directory}/work/xsch/"
+                                                  f"{self.project_top_cell_name}.spice")
+        self.schematic_hashes_file_path = os.path.expanduser(f"{self.project_directory}/work/xsch/"
+                                                             f"{self.project_top_cell_name}_schematic_hashes.json")
+
+        # Lookup tables built once per parse
+        self.library_subcircuit_pattern = re.compile(
+            rf"^\.subckt (?:{'|'.join(re.escape(library.name) for library in self.component_libraries)})"
+            if self.component_libraries else r"(?!)")
+        self.library_name_patterns = [(re.compile(library.name), PATH_BASE_NAME_PATTERN.search(library.path).group())
+                                      for library in self.component_libraries]
+        self.component_library_lookup = dict()
+        self.port_definitions_lookup = dict()
+        self.cell_body_lines = dict()
+        self.cell_definitions = dict()
+        self.flattened = False
+
         self.__parse()
 
+    def __get_schematic_files(self) -> list:
+        """Schematics and symbols of the top library and all component libraries the SPICE file is generated from"""
+        library_directories = [os.path.expanduser(f"{self.project_directory}/design/{self.project_top_lib_name}")]
+        library_directories.extend(os.path.expanduser(library.path) for library in self.component_libraries)
+
+        schematic_files = []
+        for library_directory in library_directories:
+            for extension in ("sch", "sym"):
+                schematic_files.extend(glob.glob(f"{library_directory}/*.{extension}"))
+
+        return sorted(schematic_files)
+
+    @staticmethod
+    def __get_file_hash(file_path: str) -> str:
+        with open(file_path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+
+    def __load_schematic_hashes(self) -> dict:
+        try:
+            with open(self.schematic_hashes_file_path, "r") as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def __save_schematic_hashes(self, schematic_files: list):
+        try:
+            with open(self.schematic_hashes_file_path, "w") as f:
+                json.dump({file_path: self.__get_file_hash(file_path) for file_path in schematic_files}, f, indent=4)
+        except OSError as e:
+            self.logger.warning(f"Schematic hashes could not be saved: {e}")
+
+    def __is_spice_file_up_to_date(self, schematic_files: list) -> bool:
+        """The SPICE file is up to date when the schematics are the same files as at the last generation and none of
+        them is newer than it. Schematics with newer timestamps are checked against the hashes recorded at the last
+        generation, so that only content changes count"""
+
+        if not os.path.exists(self.spice_file_path):
+            self.logger.info(f"SPICE file '{self.spice_file_path}' does not exist")
+            return False
+
+        # Added or deleted files are found by name, as copied or checked out files can keep older timestamps
+        schematic_hashes = self.__load_schematic_hashes()
+        if set(schematic_hashes) != set(schematic_files):
+            self.logger.info(f"Schematics added since SPICE file was generated: "
+                             f"{sorted(set(schematic_files) - set(schematic_hashes))} | Deleted: "
+                             f"{sorted(set(schematic_hashes) - set(schematic_files))}")
+            return False
+
+        spice_file_modification_time = os.path.getmtime(self.spice_file_path)
+        newer_schematic_files = [file_path for file_path in schematic_files
+                                 if os.path.getmtime(file_path) > spice_file_modification_time]
+
+        if not newer_schematic_files:
+            return True
+
+        changed_schematic_files = [file_path for file_path in newer_schematic_files
+                                   if schematic_hashes[file_path] != self.__get_file_hash(file_path)]
+
+        if changed_schematic_files:
+            self.logger.info(f"Schematics changed since SPICE file was generated: {changed_schematic_files}")
+            return False
+
+        return True
+
     def __generate_spice_file_for_schematic(self):
         work_directory = os.path.expanduser(f"{self.project_directory}/work/")
+        schematic_files = self.__get_schematic_files()
+
+        # Only generate the SPICE file when any of the schematics have changed
+        if not self.ALWAYS_GENERATE_SPICE_FILE and self.__is_spice_file_up_to_date(schematic_files=schematic_files):
+            self.logger.info("SPICE file is up to date with schematics. Skipping 'make xsch'")
+            return
 
         # Run SPICE generation command from work directory of project
         try:
             subprocess.run(['make xsch'], stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
                            check=True, shell=True, cwd=work_directory)
             self.logger.info("SPICE file generated from schematic")
+            self.__save_schematic_hashes(schematic_files=schematic_files)
 
         except subprocess.CalledProcessError as e:
             self.logger.error(f"'make xsch' command failed with: {e.stderr}")
 
-    def __read_spice_file(self):
-
+    def __read_spice_file_lines(self):
+        """Yields the lines of the SPICE file, leaving out lines with missing symbols"""
         try:
-            spice_file_path = os.path.expanduser(f"{self.project_directory}/work/xsch/"
-                                                 f"{self.project_top_cell_name}.spice")
-
-            # Copy each line of the file into a list
-            with open(spice_file_path, "r") as spice_file:
+            with open(self.spice_file_path, "r") as spice_file:
 
                 for line in spice_file:
                     # Check for missing symbols
-                    if re.search(r'\bIS MISSING\b', line):
+                    if MISSING_SYMBOL_PATTERN.search(line):
                         self.logger.error(f"Component '{line.split()[1]}' is missing the symbol '{line.split()[3]}'")
                     else:
-                        self.spice_file_content.append(line)
+                        yield line
 
                 self.logger.info(f"SPICE content copied into program")
 
@@ -87,95 +191,80 @@ class SPICEparser:
             self.logger.error(f"The file {self.project_directory}/work/xsch/"
                               f"{self.project_top_cell_name}.spice' was not found.")
 
-    def __rebuild_spice_lines_with_plus_symbol(self):
-        # Removes added "+" symbols to long lines in the SPICE file
-        updated_spice_lines = []
+    def __rebuild_spice_lines_with_plus_symbol(self, spice_file_lines):
+        """Yields complete lines where long lines split with "+" symbols are joined back together"""
         previous_line = ""
 
-        for line in self.spice_file_content:
+        for line in spice_file_lines:
 
-            if re.match(r'^\+', line):
+            if line.startswith('+'):
                 # Removes "+", any trailing/leading space and '\n' from previous line
                 previous_line = previous_line.strip() + " " + line[1:].strip()
 
             else:
-                # Append when previous line has content
+                # Yield when previous line has content
                 if previous_line:
-                    updated_spice_lines.append(previous_line.strip())
+                    yield previous_line.strip()
 
                 previous_line = line
 
         if previous_line:
-            updated_spice_lines.append(previous_line.strip())
+            yield previous_line.strip()
 
-        self.spice_file_content = updated_spice_lines
-        self.logger.info("SPICE lines with '+' symbols rebuilt")
-
-    def __get_subcircuit_port_info_for_component_libraries(self, line: str):
-        line_words = line.split()
-        subcircuit = SubCircuit(layout_name=line_words[1], ports=line_words[2:])
-        self.subcircuits.append(subcircuit)
-
-        self.logger.info(f"SPICE sub-circuit port info found for '{subcircuit.layout_name}'")
-
-    def __remove_expanded_subcircuits_for_component_libraries(self):
+    def __tokenize_spice_file(self):
+        """Single pass over the SPICE file that joins split lines, removes expanded subcircuits of component
+        libraries and collects port information of all subcircuits"""
         in_expanded_symbol = False
-        updated_spice_lines = []
-        library_names = []
+        library_subcircuits = []
+        circuit_cell_subcircuits = []
 
-        # Create list of library names
-        for item in self.component_libraries:
-            library_names.append(item.name)
+        for line in self.__rebuild_spice_lines_with_plus_symbol(self.__read_spice_file_lines()):
 
-        for line in self.spice_file_content:
-
-            # Iterate over library names and remove specific subcircuit contents
-            if any(re.match(rf'^\.subckt {library_name}', line.strip()) for library_name in library_names):
+            # Remove specific subcircuit contents of component libraries
+            if self.library_subcircuit_pattern.match(line):
 
                 # Retrieve specific subcircuit port information before deletions
-                self.__get_subcircuit_port_info_for_component_libraries(line)
+                line_words = line.split()
+                library_subcircuits.append(SubCircuit(layout_name=line_words[1], ports=line_words[2:]))
+                self.logger.info(f"SPICE sub-circuit port info found for '{line_words[1]}'")
                 in_expanded_symbol = True
 
             # Check for end of expanded subcircuit
-            elif re.match(r'^\.ends', line.strip()) and in_expanded_symbol:
+            elif in_expanded_symbol and line.startswith('.ends'):
                 in_expanded_symbol = False
 
-            elif not in_expanded_symbol and line.strip():
-                updated_spice_lines.append(line.strip())
+            elif not in_expanded_symbol and line:
+                self.spice_file_content.append(line)
 
-        self.spice_file_content = updated_spice_lines
+                # The only possible subcircuits left in the spice file are cells
+                if SUBCIRCUIT_PATTERN.match(line):
+                    line_words = line.split()
+                    circuit_cell_subcircuits.append(SubCircuit(layout_name=line_words[1], ports=line_words[2:]))
 
+        self.logger.info("SPICE lines with '+' symbols rebuilt")
         self.logger.info("SPICE expanded subcircuits for component libraries removed")
 
-    def __get_current_component_library(self, line: str):
-        library_names = []
-
-        # Create list of library names
-        for item in self.component_libraries:
-            library_names.append(item.name)
-
-        for index, library in enumerate(library_names):
+        # Component library subcircuits take precedence when looking up port definitions
+        self.subcircuits = library_subcircuits + circuit_cell_subcircuits
 
-            # Check for match between library name and layout name
-            if re.search(rf"{library}", line.split()[-1]):
+        for subcircuit in circuit_cell_subcircuits:
+            self.logger.info(f"SPICE sub-circuit port info found for '{subcircuit.layout_name}'")
 
-                # Return library name from path name
-                return re.search(r'[^/]+$', self.component_libraries[index].path).group()
-
-    def __get_port_info_for_circuit_cells(self, spice_file_content: list):
-        for line in spice_file_content:
-            if re.match(r'\*\*\.subckt', line) or re.match(r'.subckt', line):
-                line_words = line.split()
+    def __get_current_component_library(self, line: str):
+        layout_name = line.split()[-1]
 
-                subcircuit = SubCircuit(layout_name=line_words[1], ports=line_words[2:])
-                self.subcircuits.append(subcircuit)
+        if layout_name not in self.component_library_lookup:
+            # Check for match between library name and layout name, and use library name from path name
+            self.component_library_lookup[layout_name] = next(
+                (library_path_name for library_pattern, library_path_name in self.library_name_patterns
+                 if library_pattern.search(layout_name)), None)
 
-                self.logger.info(f"SPICE sub-circuit port info found for '{subcircuit.layout_name}'")
+        return self.component_library_lookup[layout_name]
 
     def __get_current_circuit_cell_name(self, spice_file_line: str):
         # Update cell information (Any symbol or the schematic itself)
 
-        if re.match(r'\*\*\.subckt', spice_file_line) or re.match(r'.subckt', spice_file_line):
+        if SUBCIRCUIT_PATTERN.match(spice_file_line):
 
             self.logger.info(f"Found circuit cell '{spice_file_line.split()[1]}'")
             self.last_cell_found = spice_file_line.split()[1]
@@ -184,11 +273,16 @@ class SPICEparser:
             return self.last_cell_found
 
     def __get_layout_port_definitions(self, line_word: str, subcircuits: list):
-        for subcircuit in subcircuits:
-            if re.match(line_word, subcircuit.layout_name):
-                return subcircuit.ports
+        if line_word not in self.port_definitions_lookup:
+            line_word_pattern = re.compile(line_word)
+            self.port_definitions_lookup[line_word] = next(
+                (subcircuit.ports for subcircuit in subcircuits if line_word_pattern.match(subcircuit.layout_name)),
+                None)
+
+        if self.port_definitions_lookup[line_word] is None:
+            self.logger.error(f"Port definition not found for '{line_word}'")
 
-        self.logger.error(f"Port definition not found for '{line_word}'")
+        return self.port_definitions_lookup[line_word]
 
     @staticmethod
     def __get_component_category_and_type(filtered_name):
@@ -212,24 +306,22 @@ class SPICEparser:
 
         return component_category, component_type
 
-    def __get_component(self, spice_line: str, cell: str, named_cell: str, parent_cell: str, named_parent_cell: str,
-                        cell_chain: str,
-                        current_library: str):
+    def __get_component(self, spice_line: str, cell: str, current_library: str, cell_components: list):
 
         # Check SPICE line for circuit component identifier
-        if re.match(r'^[^*.]', spice_line):
+        if COMPONENT_PATTERN.match(spice_line):
             line_words = spice_line.split()
 
             # Remove first letter of string containing group + name as a general rule
             line_words[0] = line_words[0][1:]
 
             # Component name = characters after underscore if underscore is present
-            filtered_name = (lambda x: re.search(r'_(.*)', x).group(1) if re.search(
-                r'_(.*)', x) else x)(line_words[0])
+            filtered_name = (lambda x: FILTERED_NAME_PATTERN.search(x).group(1) if FILTERED_NAME_PATTERN.search(
+                x) else x)(line_words[0])
 
             # Component group = characters until underscore if underscore is present. First char is skipped
-            filtered_group = (lambda x: re.search(r'^[^_]+(?=_)', x[:]).group() if re.search(
-                r'^[^_]+(?=_)', x[1:]) else None)(line_words[0])
+            filtered_group = (lambda x: FILTERED_GROUP_PATTERN.search(x[:]).group() if FILTERED_GROUP_PATTERN.search(
+                x[1:]) else None)(line_words[0])
 
             # Error handling incase component category or component type is invalid
             try:
@@ -254,12 +346,7 @@ class SPICEparser:
                 # Create transistor component and add extracted parameters
                 transistor = Transistor(name=filtered_name,
                                         type=component_type,
-                                        number_id=len(self.components),
                                         cell=cell,
-                                        named_cell=named_cell,
-                                        parent_cell=parent_cell,
-                                        named_parent_cell=named_parent_cell,
-                                        cell_chain=cell_chain,
                                         group=filtered_group,
                                         schematic_connections={port_definitions[i]: line_words[i + 1] for i in
                                                                range(min(len(port_definitions), len(line_words) - 1))},
@@ -267,7 +354,7 @@ class SPICEparser:
                                         layout_library=current_library)
 
                 transistor.instance = transistor.__class__.__name__  # add instance type
-                self.components.append(transistor)
+                cell_components.append(transistor)
 
             # --- Resistor ---
             elif component_category == 'R':
@@ -278,12 +365,7 @@ class SPICEparser:
                 # Create resistor component and add extracted parameters
                 resistor = Resistor(name=filtered_name,
                                     type=component_type,
-                                    number_id=len(self.components),
                                     cell=cell,
-                                    named_cell=named_cell,
-                                    parent_cell=parent_cell,
-                                    named_parent_cell=named_parent_cell,
-                                    cell_chain=cell_chain,
                                     group=filtered_group,
                                     schematic_connections={port_definitions[i]: line_words[i + 1] for i in
                                                            range(min(len(port_definitions), len(line_words) - 1))},
@@ -291,7 +373,7 @@ class SPICEparser:
                                     layout_library=current_library)
 
                 resistor.instance = resistor.__class__.__name__  # add instance type
-                self.components.append(resistor)
+                cell_components.append(resistor)
 
             #  --- Capacitor ---
             elif component_category == 'C':
@@ -302,12 +384,7 @@ class SPICEparser:
                 # Create capacitor component and add extracted parameters
                 capacitor = Capacitor(name=filtered_name,
                                       type=component_type,
-                                      number_id=len(self.components),
                                       cell=cell,
-                                      named_cell=named_cell,
-                                      parent_cell=parent_cell,
-                                      named_parent_cell=named_parent_cell,
-                                      cell_chain=cell_chain,
                                       group=filtered_group,
                                       schematic_connections={port_definitions[i]: line_words[i + 1] for i in
                                                              range(min(len(port_definitions), len(line_words) - 1))},
@@ -315,7 +392,7 @@ class SPICEparser:
                                       layout_library=current_library)
 
                 capacitor.instance = capacitor.__class__.__name__  # add instance type
-                self.components.append(capacitor)
+                cell_components.append(capacitor)
 
             #  --- Digital Blocks ---
             elif component_category == 'D':
@@ -326,12 +403,7 @@ class SPICEparser:
                 # Create digital block component and add extracted parameters
                 digital_block = DigitalBlock(name=filtered_name,
                                              type="digital",
-                                             number_id=len(self.components),
                                              cell=cell,
-                                             named_cell=named_cell,
-                                             parent_cell=parent_cell,
-                                             named_parent_cell=named_parent_cell,
-                                             cell_chain=cell_chain,
                                              group=filtered_group,
                                              schematic_connections={port_definitions[i]: line_words[i + 1] for i in
                                                                     range(min(len(port_definitions),
@@ -340,33 +412,32 @@ class SPICEparser:
                                              layout_library=current_library)
 
                 digital_block.instance = digital_block.__class__.__name__  # add instance type
-                self.components.append(digital_block)
+                cell_components.append(digital_block)
 
         # Check SPICE line for pin identifier
-        if re.match(r'^\*\.', spice_line):
+        if PIN_PATTERN.match(spice_line):
             line_words = spice_line.split()
 
-            pin_type = ''.join(re.findall(r'[a-zA-Z]+', line_words[0]))
-            pin = Pin(type=pin_type, cell=cell, named_cell=named_cell, parent_cell=parent_cell,
-                      named_parent_cell=named_parent_cell, cell_chain=cell_chain, name=line_words[1], number_id=len(self.components))
+            pin_type = ''.join(PIN_TYPE_PATTERN.findall(line_words[0]))
+            pin = Pin(type=pin_type, cell=cell, name=line_words[1])
             pin.instance = pin.__class__.__name__  # add instance type
-            self.components.append(pin)
+            cell_components.append(pin)
 
     def __build_list_of_circuit_cells(self, spice_line, current_cell: str):
         # Check SPICE line for circuit component identifier
-        if re.match(r'^[^*.]', spice_line):
+        if COMPONENT_PATTERN.match(spice_line):
             line_words = spice_line.split()
 
             # Remove first letter of string containing group + name as a general rule
             line_words[0] = line_words[0][1:]
 
             # Component name = characters after underscore if underscore is present
-            filtered_name = (lambda x: re.search(r'_(.*)', x).group(1) if re.search(
-                r'_(.*)', x) else x)(line_words[0])
+            filtered_name = (lambda x: FILTERED_NAME_PATTERN.search(x).group(1) if FILTERED_NAME_PATTERN.search(
+                x) else x)(line_words[0])
 
             # Component group = characters until underscore if underscore is present. First char is skipped
-            filtered_group = (lambda x: re.search(r'^[^_]+(?=_)', x[:]).group() if re.search(
-                r'^[^_]+(?=_)', x[1:]) else None)(line_words[0])
+            filtered_group = (lambda x: FILTERED_GROUP_PATTERN.search(x[:]).group() if FILTERED_GROUP_PATTERN.search(
+                x[1:]) else None)(line_words[0])
 
             # Error handling incase component category or component type is invalid
             try:
@@ -402,13 +473,67 @@ class SPICEparser:
                 circuit_cell.instance = circuit_cell.__class__.__name__  # add instance type
                 self.circuit_cells.append(circuit_cell)
 
+    def __index_cell_body_lines(self):
+        """Maps every circuit cell to the lines inside of it in a single pass. A cell body starts after any line where
+        the second word is the cell name and ends at the next '.ends'"""
+        cell_names = {circuit_cell.cell for circuit_cell in self.circuit_cells}
+        active_cells = []
+
+        for line in self.spice_file_content:
+            line_words = line.split()
+            key_word = line_words[1] if len(line_words) > 1 else None
+
+            if line_words[0] == '.ends':
+                active_cells = [cell for cell in active_cells if cell == key_word]
+            else:
+                for cell in active_cells:
+                    if cell != key_word:
+                        self.cell_body_lines[cell].append(line)
+
+            if key_word in cell_names and key_word not in active_cells:
+                self.cell_body_lines.setdefault(key_word, [])
+                active_cells.append(key_word)
+
+    def __build_cell_definitions(self):
+        """Parses the components of each distinct circuit cell once, no matter how many instances there are of it"""
+        for circuit_cell in self.circuit_cells:
+
+            if circuit_cell.cell not in self.cell_definitions:
+                cell_definition = CellDefinition(cell=circuit_cell.cell)
+
+                # Extract components inside current cell
+                for line in self.cell_body_lines.get(circuit_cell.cell, []):
+                    current_library = self.__get_current_component_library(line)
+                    self.__get_component(spice_line=line, cell=circuit_cell.cell, current_library=current_library,
+                                         cell_components=cell_definition.components)
+
+                cell_definition.circuit_cells = [child_circuit_cell for child_circuit_cell in self.circuit_cells
+                                                 if child_circuit_cell.parent_cell == circuit_cell.cell]
+                self.cell_definitions[circuit_cell.cell] = cell_definition
+
+        self.cell_body_lines.clear()
+        self.logger.info(f"Distinct circuit cells parsed: {len(self.cell_definitions)} | "
+                         f"Circuit cell instances: {len(self.circuit_cells)}")
+
+    @staticmethod
+    def __instantiate_component(cell_component, **instance_fields):
+        """Creates a new component from a component of a cell definition. Only immutable parsed values are shared,
+        every container gets created anew since later stages modify them in place"""
+        component_fields = {name: value for name, value in vars(cell_component).items()
+                            if isinstance(value, (str, int, type(None)))}
+        component_fields.update(instance_fields)
+
+        if hasattr(cell_component, "schematic_connections"):
+            component_fields["schematic_connections"] = dict(cell_component.schematic_connections)
+
+        return cell_component.__class__(**component_fields)
+
     def __add_components_for_each_circuit_cell(self, current_parent_cell):
         """Recursive adding of components within each circuit cell"""
 
         for circuit_cell in self.circuit_cells:
 
             if circuit_cell.parent_cell == current_parent_cell:
-                inside_cell = False
 
                 # Cell chain algorithm
                 self.visited_cells.append(circuit_cell.cell)
@@ -444,49 +569,41 @@ class SPICEparser:
                 circuit_cell.number_id = len(self.components)
                 self.components.append(copy.deepcopy(circuit_cell))
 
-                # Extract components inside current cell
-                for line in self.spice_file_content:
-                    line_words = line.split()
-
-                    if len(line_words) > 1 and line_words[1] == circuit_cell.cell:
-                        inside_cell = True
-                    elif line_words[0] == '.ends':
-                        inside_cell = False
-                    elif inside_cell:
-                        current_library = self.__get_current_component_library(line)
-                        self.__get_component(spice_line=line,
-                                             cell=circuit_cell.cell,
-                                             named_cell=f"{circuit_cell.name}_{circuit_cell.cell}",
-                                             parent_cell=circuit_cell.parent_cell,
-                                             named_parent_cell="UROOT_ROOT_CELL" if
-                                             circuit_cell.parent_cell == "ROOT_CELL" else self.cell_chain_list[-2],
-                                             cell_chain='--'.join(self.cell_chain_list),
-                                             current_library=current_library)
+                # Add instances of the components inside current cell
+                for cell_component in self.cell_definitions[circuit_cell.cell].components:
+                    self.components.append(self.__instantiate_component(
+                        cell_component=cell_component,
+                        number_id=len(self.components),
+                        named_cell=f"{circuit_cell.name}_{circuit_cell.cell}",
+                        parent_cell=circuit_cell.parent_cell,
+                        named_parent_cell=circuit_cell.named_parent_cell,
+                        cell_chain=circuit_cell.cell_chain))
 
                 self.__add_components_for_each_circuit_cell(current_parent_cell=circuit_cell.cell)
 
     def __parse(self):
         self.__generate_spice_file_for_schematic()
-        self.__read_spice_file()
-        self.__rebuild_spice_lines_with_plus_symbol()
-        self.__remove_expanded_subcircuits_for_component_libraries()
-        # The only possible subcircuits left in the spice file now are cells.
-
-        self.__get_port_info_for_circuit_cells(self.spice_file_content)
+        self.__tokenize_spice_file()
 
         for line in self.spice_file_content:
             current_cell = self.__get_current_circuit_cell_name(line)
             # Append the highest hierarchical circuit cell to the list of circuit cells
             # "ROOT_CELL" is not a real cell and is taught of as one level above the highest defined cell
             if current_cell == self.project_top_cell_name:
-                if re.match(r'\*\*\.subckt', line) or re.match(r'.subckt', line):
+                if SUBCIRCUIT_PATTERN.match(line):
                     if line.split()[1] == self.project_top_cell_name:
                         self.__build_list_of_circuit_cells(spice_line=f"xUTOP " + f" ".join(line.split()[2:])
                                                            + f" {line.split()[1]}", current_cell="ROOT_CELL")
 
             self.__build_list_of_circuit_cells(spice_line=line, current_cell=current_cell)
 
+        self.__index_cell_body_lines()
+        self.__build_cell_definitions()
+
+    def __flatten(self):
+        """Expands the hierarchy into one component per instance, as needed by the cell creator"""
         self.__add_components_for_each_circuit_cell(current_parent_cell="ROOT_CELL")
+        self.flattened = True
 
         # Summary of parsing
         for component in self.components:
@@ -497,5 +614,12 @@ class SPICEparser:
         self.logger.info("Process complete! Components extracted from SPICE file: "
                          f"{len(self.components)}")
 
+    def get_hierarchy(self) -> dict:
+        """Returns every distinct circuit cell with its components and the circuit cells instantiated inside of it"""
+        return self.cell_definitions
+
     def get(self) -> list:
+        if not self.flattened:
+            self.__flatten()
+
         return self.components
@@ -0,0 +1,187 @@
+# ==================================================================================================================== #
+# Copyright (C) 2025 Bjørn K.T. Solheim, Leidulv Tønnesland
+# ==================================================================================================================== #
+# This program is free software: you can redistribute it and/or modify it under the terms of
+# the GNU General Public License as published by the Free Software Foundation, version 2.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <https://www.gnu.org/licenses/>.
+# ==================================================================================================================== #
+
+# ==================================================== Notes ===========================================================
+"""
+    Process wide configuration from pyproject.toml. The file is parsed once per path, no matter how many objects read
+    their options from it. The config is immutable: tables are read only mappings and arrays are tuples, so one
+    object can not change the options seen by another.
+
+    The file itself is checked when options are read: an option or table missing from the file is reported with its
+    full name, e.g. 'lvs_checker.CDL_COMMAND', instead of a bare key.
+
+    Options can be changed for a run with override layers, given as nested tables with the same layout as the file.
+    Layers are laid on top of the file in the order they were pushed, and are checked against the file so misspelled
+    options or values of another type are reported instead of silently ignored.
+
+    The config hash covers the whole config or a set of tables. Caches of results depending on options keep the hash
+    of the tables they read, so changed options make their entries unusable.
+"""
+
+# ================================================== Libraries =========================================================
+import json
+import hashlib
+import tomllib
+import threading
+from collections.abc import Mapping
+from contextlib import contextmanager
+from functools import lru_cache
+from logger.logger import get_a_logger
+
+# ================================================ Config loader =======================================================
+
+CONFIG_PATH = "pyproject.toml"
+
+logger = get_a_logger(__name__)
+override_layers = []
+override_layers_lock = threading.Lock()
+
+
+class ConfigTable(Mapping):
+    """Read only table of the config, reporting options missing from it with their full name"""
+
+    def __init__(self, options: dict, location: str = ""):
+        self.options = options
+        self.location = location
+
+    def __getitem__(self, key):
+        try:
+            return self.options[key]
+        except KeyError:
+            option = f"{self.location}.{key}" if self.location else key
+            raise KeyError(f"Config option '{option}' is missing in the config file") from None
+
+    def get(self, key, default=None):
+        return self.options.get(key, default)
+
+    def __iter__(self):
+        return iter(self.options)
+
+    def __len__(self):
+        return len(self.options)
+
+    def __repr__(self):
+        return f"ConfigTable({self.location!r}, {list(self.options)})"
+
+
+def freeze(value, location: str = ""):
+    """Returns an immutable copy of parsed TOML data"""
+    if isinstance(value, Mapping):
+        return ConfigTable({key: freeze(item, f"{location}.{key}" if location else key)
+                            for key, item in value.items()}, location)
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item, location) for item in value)
+    return value
+
+
+def thaw(value):
+    """Returns a plain copy of frozen config data, usable with json"""
+    if isinstance(value, Mapping):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [thaw(item) for item in value]
+    return value
+
+
+class Config(Mapping):
+    """Immutable config with the tables of the file as keys"""
+
+    def __init__(self, tables: Mapping):
+        self.tables = freeze(tables)
+
+    def __getitem__(self, key):
+        return self.tables[key]
+
+    def __iter__(self):
+        return iter(self.tables)
+
+    def __len__(self):
+        return len(self.tables)
+
+    def __repr__(self):
+        return f"Config({list(self.tables)})"
+
+    def config_hash(self, *tables: str) -> str:
+        """Hash of the given tables, or of the whole config if no tables are given"""
+        content = thaw(self.tables) if not tables else {table: thaw(self.tables.get(table)) for table in tables}
+        return hashlib.sha256(json.dumps(content, sort_keys=True, default=str).encode()).hexdigest()
+
+
+@lru_cache(maxsize=None)
+def load_file(path: str = CONFIG_PATH) -> Config:
+    try:
+        with open(path, "rb") as f:
+            return Config(tomllib.load(f))
+    except (FileNotFoundError, tomllib.TOMLDecodeError) as e:
+        logger.error(f"Error loading config: {e}")
+        return Config({})
+
+
+def merge_layer(base, layer, location: str = ""):
+    """Returns base with the options of the layer laid on top, reporting options not in base"""
+    merged = dict(base)
+    for key, value in layer.items():
+        option = f"{location}.{key}" if location else key
+
+        if key not in base:
+            logger.error(f"Config override '{option}' does not exist and is ignored")
+        elif isinstance(base[key], Mapping):
+            if isinstance(value, Mapping):
+                merged[key] = merge_layer(base[key], value, option)
+            else:
+                logger.error(f"Config override '{option}' must be a table and is ignored")
+        elif isinstance(value, bool) != isinstance(base[key], bool) or not isinstance(
+                value, (int, float) if isinstance(base[key], (int, float)) else type(base[key])):
+            logger.error(f"Config override '{option}' of type '{type(value).__name__}' does not match type "
+                         f"'{type(base[key]).__name__}' and is ignored")
+        else:
+            merged[key] = value
+    return merged
+
+
+@lru_cache(maxsize=32)
+def merge_layers(path: str, layers: tuple[str, ...]) -> Config:
+    """Returns the config of a file with override layers given as json, which makes them usable as cache key"""
+    tables = load_file(path).tables
+    for layer in layers:
+        tables = merge_layer(tables, freeze(json.loads(layer)))
+    return Config(tables)
+
+
+def get_config(path: str = CONFIG_PATH) -> Config:
+    """Returns the config with all override layers applied, parsing the file only the first time"""
+    with override_layers_lock:
+        layers = tuple(json.dumps(thaw(layer), sort_keys=True) for layer in override_layers)
+    return merge_layers(path, layers) if layers else load_file(path)
+
+
+def push_config_overrides(overrides: Mapping):
+    """Adds an override layer on top of the config for everything created from now on"""
+    with override_layers_lock:
+        override_layers.append(freeze(overrides))
+
+
+def pop_config_overrides():
+    with override_layers_lock:
+        override_layers.pop()
+
+
+@contextmanager
+def config_overrides(overrides: Mapping):
+    """Applies an override layer within a with block, e.g. config_overrides({"generate_grid": {"SCALE_FACTOR": 4}})"""
+    push_config_overrides(overrides)
+    try:
+        yield get_config()
+    finally:
+        pop_config_overrides()
@@ -34,31 +34,28 @@ class Overlap:
     component_ids: list
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Connection:
-    start_comp_id: str
+    start_comp_id: int | str
     start_comp_type: str
     start_area: str
     start_comp_name: str
-    end_comp_id: str
+    end_comp_id: int | str
     end_comp_type: str
     end_area: str
     end_comp_name: str
     cell: str
     net: str
 
-    def __init__(self, start_comp_id: int|str, start_comp_type: str, start_area: str, start_comp_name: str,
-                 end_comp_id: int | str, end_comp_type: str, end_area: str, end_comp_name: str, cell: str, net: str):
-        self.start_comp_id = str(start_comp_id)
-        self.start_comp_type = start_comp_type
-        self.start_area = start_area
-        self.start_comp_name = start_comp_name
-        self.end_comp_id = str(end_comp_id)
-        self.end_comp_type = end_comp_type
-        self.end_area = end_area
-        self.end_comp_name = end_comp_name
-        self.cell = cell
-        self.net = net
+    def __post_init__(self):
+        object.__setattr__(self, "start_comp_id", str(self.start_comp_id))
+        object.__setattr__(self, "end_comp_id", str(self.end_comp_id))
+
+    def canonical_key(self):
+        """Key that is equal for a connection and the same connection in the opposite direction"""
+        return (frozenset({(self.start_comp_id, self.start_comp_type, self.start_area, self.start_comp_name),
+                           (self.end_comp_id, self.end_comp_type, self.end_area, self.end_comp_name)}),
+                self.cell, self.net)
 
 
 class ConnectionLists:
@@ -85,107 +82,104 @@ class ConnectionLists:
         self.local_con_area = {}
         self.net_list = Nets(applicable_nets=[], pin_nets=[])
 
+    @staticmethod
+    def __is_mos_bulk_port(component, port) -> bool:
+        return port == "B" and isinstance(component, Transistor) and (component.type == "nmos" or
+                                                                       component.type == "pmos")
+
     def __local_connection_list(self):
 
         for obj in self.components:
 
-            ports = obj.schematic_connections
+            ports = list(obj.schematic_connections)
+
+            # Every pair of ports on the same net is added once, with the later port as start
+            for index, key in enumerate(ports):
+                for key1 in ports[index + 1:]:
+
+                    if obj.schematic_connections[key] == obj.schematic_connections[key1]:
+                        self.connections["local_connections"].append(Connection(obj.number_id, obj.type,
+                                                                                key1, obj.name,
+                                                                                obj.number_id, obj.type, key,
+                                                                                obj.name, obj.cell,
+                                                                                obj.schematic_connections[key]))
 
-            for key in ports:
-                for key1 in ports:
+        # Index of the first applicable local connection area of each component port
+        for connection in self.connections["local_connections"]:
 
-                    if key != key1:
-                        entry = [Connection(obj.number_id, obj.type, key, obj.name,
-                                            obj.number_id, obj.type, key1, obj.name, obj.cell, ports[key]),
-                                 Connection(obj.number_id, obj.type, key1, obj.name,
-                                            obj.number_id, obj.type, key, obj.name, obj.cell, ports[key])]
-                        if ports[key] == ports[key1] and not any(isinstance(obj, Connection) and obj == target
-                                                                 for target in entry
-                                                                 for obj in self.connections["local_connections"]):
+            if ((connection.start_comp_type == "nmos" or connection.start_comp_type == "pmos")
+                    and (connection.start_area == "B" or connection.end_area == "B")):
+                continue
 
-                            self.connections["local_connections"].append(Connection(obj.number_id, obj.type,
-                                                                                    key1, obj.name,
-                                                                                    obj.number_id, obj.type, key,
-                                                                                    obj.name,  obj.cell, ports[key]))
+            for port in (connection.start_area, connection.end_area):
+                self.local_con_area.setdefault((connection.start_comp_id, port),
+                                               connection.start_area + connection.end_area)
 
     def __get_local_connection_area(self, object_id, port):
+        return self.local_con_area.get((str(object_id), port), port)
 
-        for connection in self.connections["local_connections"]:
+    def __connection_list(self):
 
-            if connection.start_comp_id == str(object_id) and (port == connection.start_area or
-                                                               port == connection.end_area):
-                if connection.start_comp_type == "nmos" or connection.start_comp_type == "pmos":
-                    if connection.start_area != "B" and connection.end_area != "B":
-                        return connection.start_area + connection.end_area
-                else:
-                    return connection.start_area + connection.end_area
+        # Inverted index from net to all component ports on it, per cell
+        net_ports = {}
+        for index, component in enumerate(self.components):
+            for port_index, (port, net) in enumerate(component.schematic_connections.items()):
+                if not self.__is_mos_bulk_port(component, port):
+                    net_ports.setdefault((component.cell, net), []).append((index, port_index, port))
 
-        return port
+        added_connections = set()
 
-    def __connection_list(self):
+        for index_1, component_1 in enumerate(self.components):
 
-        object_list = self.components[:]
-
-        for component_1 in object_list:
-            for component_2 in object_list:
-                conditions = [
-                            component_1 != component_2,
-                            component_1.cell == component_2.cell
-                            ]
-
-                if all(conditions):
-                    for port_1 in component_1.schematic_connections:
-                        if (port_1 == "B" and isinstance(component_1, Transistor)
-                                and (component_1.type == "nmos" or component_1.type == "pmos")):
-                            continue
-
-                        for port_2 in component_2.schematic_connections:
-                            if (port_2 == "B" and isinstance(component_2, Transistor)
-                                    and (component_2.type == "nmos" or component_2.type == "pmos")):
-                                continue
-
-                            if component_1.schematic_connections[port_1] == component_2.schematic_connections[port_2]:
-                                net = component_1.schematic_connections[port_1]
-                                cell = component_1.cell
-
-                                port_1_area = self.__get_local_connection_area(component_1.number_id, port_1)
-                                port_2_area = self.__get_local_connection_area(component_2.number_id, port_2)
-                                # port_1_area = port_1
-                                # port_2_area = port_2
-                                entry = [Connection(component_1.number_id, component_1.type, port_1_area,
-                                                    component_1.name, component_2.number_id, component_2.type,
-                                                    port_2_area, component_2.name, cell, net),
-                                         Connection(component_2.number_id, component_2.type, port_2_area,
-                                                    component_2.name, component_1.number_id, component_1.type,
-                                                    port_1_area, component_1.name, cell, net)]
-
-                                if not any(isinstance(obj, Connection) and obj == target for target in entry
-                                           for obj in self.connections["component_connections"]):
-
-                                    self.connections["component_connections"].append(entry[0])
+            # Ports of other components sharing a net, in the same order as a full pairwise comparison
+            candidates = []
+            for port_index_1, (port_1, net) in enumerate(component_1.schematic_connections.items()):
+                if self.__is_mos_bulk_port(component_1, port_1):
+                    continue
+
+                for index_2, port_index_2, port_2 in net_ports[(component_1.cell, net)]:
+                    if index_2 != index_1:
+                        candidates.append((index_2, port_index_1, port_index_2, port_1, port_2, net))
+
+            candidates.sort(key=lambda candidate: candidate[:3])
+
+            for index_2, _, _, port_1, port_2, net in candidates:
+                component_2 = self.components[index_2]
+
+                port_1_area = self.__get_local_connection_area(component_1.number_id, port_1)
+                port_2_area = self.__get_local_connection_area(component_2.number_id, port_2)
+
+                connection = Connection(component_1.number_id, component_1.type, port_1_area, component_1.name,
+                                        component_2.number_id, component_2.type, port_2_area, component_2.name,
+                                        component_1.cell, net)
+
+                # The same connection in opposite direction has the same key
+                connection_key = connection.canonical_key()
+
+                if connection_key not in added_connections:
+                    added_connections.add(connection_key)
+                    self.connections["component_connections"].append(connection)
 
     def __single_connection_list(self):
 
+        # Connected areas of each component
+        connected_areas = {}
+        for con in self.connections["component_connections"]:
+            connected_areas.setdefault(con.start_comp_id, []).append(con.start_area)
+            connected_areas.setdefault(con.end_comp_id, []).append(con.end_area)
+
         for component in self.components:
             for port in component.schematic_connections:
-                if (port == "B" and isinstance(component, Transistor)
-                        and (component.type == "nmos" or component.type == "pmos")):
+                if self.__is_mos_bulk_port(component, port):
                     continue
-                in_connection_list = False
-                for con in self.connections["component_connections"]:
-
-                    if ((con.start_comp_id == str(component.number_id) and port in con.start_area)
-                            or (con.end_comp_id == str(component.number_id) and port in con.end_area)):
-                        in_connection_list = True
-                        break
-                if not in_connection_list:
+
+                if not any(port in area for area in connected_areas.get(str(component.number_id), [])):
                     self.connections["single_connections"].append(Connection(component.number_id, component.type, port,
                                                                              component.name, "",
                                                                              "", "",
                                                                              "",
                                                                              component.cell,
                                                                              component.schematic_connections[port]))
-                    in_connection_list = False
 
     def __overlap_transistors(self):
         nmos = []
@@ -234,16 +228,17 @@ class ConnectionLists:
 
     def __get_net_list(self):
         self.logger.info("Getting net list")
+        found_nets = set()
         for obj in self.pins:
-            if obj.name not in self.net_list.pin_nets:
+            if obj.name not in found_nets:
+                found_nets.add(obj.name)
                 self.net_list.pin_nets.append(obj.name)
 
         for obj in self.components:
             for port_net in obj.schematic_connections.values():
-                if port_net not in self.net_list.applicable_nets + self.net_list.pin_nets:
+                if port_net not in found_nets:
+                    found_nets.add(port_net)
                     self.net_list.applicable_nets.append(port_net)
-        self.net_list.applicable_nets = [item for item in self.net_list.applicable_nets
-                                         if item not in self.net_list.pin_nets]
 
     def get(self):
 
@@ -0,0 +1,266 @@
+# ==================================================================================================================== #
+# Copyright (C) 2025 Bjørn K.T. Solheim, Leidulv Tønnesland
+# ==================================================================================================================== #
+# This program is free software: you can redistribute it and/or modify it under the terms of
+# the GNU General Public License as published by the Free Software Foundation, version 2.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <https://www.gnu.org/licenses/>.
+# ==================================================================================================================== #
+
+# ==================================================== Notes ===========================================================
+"""
+    Runs the custom DRC Tcl script on every generated cell in the top library, instead of only on the top cell.
+    Cells are checked concurrently by a pool of Magic processes, each writing its own log through the AAL_DRC_OUTPUT
+    environment variable.
+
+    Parsed logs are cached by a hash of the cell and everything it uses, so a cell is only checked again when it or
+    one of its sub cells changed. The hashes of the DRC script and of the drc_checker config table are part of the
+    cache key too. The cache keeps the error coordinates per rule, not the log.
+
+    Errors are reported by Magic in the coordinates of the checked cell. They are mapped to top cell coordinates using
+    the transforms of every instance path from the top cell, and errors of sub cells found in both their own check and
+    the check of a parent cell are only counted once.
+"""
+
+# ================================================== Libraries =========================================================
+import os
+import re
+import json
+import hashlib
+import threading
+import subprocess
+from dataclasses import dataclass, field
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from drc.drc_errors import Area, RuleErrors, read_custom_drc_log
+from logger.logger import get_a_logger
+from config.config_loader import get_config
+
+# ============================================= DRC cell orchestrator ==================================================
+
+USE_PATTERN = re.compile(r"^use\s+(\S+)\s+\S+(?:\s+(\S+))?")
+TRANSFORM_PATTERN = re.compile(r"^transform\s+(-?\d+)\s+(-?\d+)\s+(-?\d+)\s+(-?\d+)\s+(-?\d+)\s+(-?\d+)")
+
+
+@dataclass
+class MagicCell:
+    name: str
+    path: str
+    content_hash: str
+    uses: list = field(default_factory=list)  # (cell path, transform (a, b, c, d, e, f))
+
+
+class DRCCellOrchestrator:
+    logger = get_a_logger(__name__)
+    CACHE_VERSION = 2
+    cache_lock = threading.Lock()
+
+    def __init__(self, project_properties, tcl_script_path: str, magic_executable: str = "magic", workers: int = 4):
+        self.project_directory = project_properties.directory
+        self.project_top_lib_name = project_properties.top_lib_name
+        self.project_top_cell_name = project_properties.top_cell_name
+        self.tcl_script_path = tcl_script_path
+        self.magic_executable = magic_executable
+        self.workers = workers
+        self.config_hash = get_config().config_hash("drc_checker")
+
+        self.work_directory = os.path.expanduser(f"{self.project_directory}/work")
+        self.design_directory = os.path.expanduser(f"{self.project_directory}/design/{self.project_top_lib_name}")
+        self.cell_log_directory = f"{self.work_directory}/drc/cells"
+        self.cache_path = f"{self.cell_log_directory}/AAL_DRC_CACHE.json"
+
+        self.cells = {}
+        self.total_cells_checked = 0
+        self.total_cells_cached = 0
+
+    # ---------------------------------------------- Cell hierarchy ---------------------------------------------------
+
+    def __read_cell(self, path: str) -> MagicCell | None:
+        """Reads a magic file and all cells it uses. The hash covers the cell and all cells below it"""
+        path = os.path.normpath(path)
+        if path in self.cells:
+            return self.cells[path]
+
+        try:
+            with open(path, "rb") as magic_file:
+                content = magic_file.read()
+        except OSError:
+            self.cells[path] = None
+            return None
+
+        uses = []
+        cell_path = None
+        for line in content.decode(errors="replace").splitlines():
+            use = USE_PATTERN.match(line)
+            if use:
+                name, library = use.groups()
+                cell_directory = os.path.dirname(path) if library is None else os.path.join(os.path.dirname(path),
+                                                                                           library)
+                cell_path = os.path.normpath(os.path.join(cell_directory, f"{name}.mag"))
+                continue
+
+            transform = TRANSFORM_PATTERN.match(line)
+            if transform and cell_path is not None:
+                uses.append((cell_path, tuple(map(int, transform.groups()))))
+                cell_path = None
+
+        content_hash = hashlib.sha256(content)
+        for use_path, _ in uses:
+            used_cell = self.__read_cell(path=use_path)
+            content_hash.update(used_cell.content_hash.encode() if used_cell else use_path.encode())
+
+        cell = MagicCell(name=os.path.splitext(os.path.basename(path))[0], path=path,
+                         content_hash=content_hash.hexdigest(), uses=uses)
+        self.cells[path] = cell
+        return cell
+
+    def __get_cell_instances(self, top_cell: MagicCell) -> dict[str, list[tuple]]:
+        """Returns the transforms to top cell coordinates of every instance of the generated cells"""
+        instances = defaultdict(list)
+        stack = [(top_cell, (1, 0, 0, 0, 1, 0))]
+
+        while stack:
+            cell, (a, b, c, d, e, f) = stack.pop()
+            instances[cell.path].append((a, b, c, d, e, f))
+
+            for use_path, (ua, ub, uc, ud, ue, uf) in cell.uses:
+                used_cell = self.cells.get(use_path)
+
+                # Only generated cells are checked on their own. Errors in library cells show up in their parents
+                if used_cell is None or os.path.dirname(use_path) != os.path.normpath(self.design_directory):
+                    continue
+
+                stack.append((used_cell, (a * ua + b * ud, a * ub + b * ue, a * uc + b * uf + c,
+                                          d * ua + e * ud, d * ub + e * ue, d * uc + e * uf + f)))
+        return instances
+
+    # ------------------------------------------------ DRC runs -------------------------------------------------------
+
+    def __load_cache(self) -> dict:
+        try:
+            with open(self.cache_path, "r") as cache_file:
+                cache = json.load(cache_file)
+            if cache.get("version") == self.CACHE_VERSION:
+                return cache["cells"]
+        except (OSError, ValueError, KeyError, AttributeError):
+            pass
+        return {}
+
+    def __save_cache(self, cache: dict):
+        temporary_path = f"{self.cache_path}.tmp"
+        with open(temporary_path, "w") as cache_file:
+            json.dump({"version": self.CACHE_VERSION, "cells": cache}, cache_file)
+        os.replace(temporary_path, self.cache_path)
+
+    def __update_cache(self, entries: dict):
+        """Adds entries to the cache file, which is read again first since cells can be checked at the same time"""
+        with self.cache_lock:
+            cache = self.__load_cache()
+            cache.update(entries)
+            self.__save_cache(cache=cache)
+
+    def __get_script_hash(self) -> str:
+        # The script and the config are part of the cache key, so changes to them cause all cells to be checked again
+        with open(self.tcl_script_path, "rb") as tcl_script:
+            return hashlib.sha256(tcl_script.read() + self.config_hash.encode()).hexdigest()
+
+    def __run_cell_drc(self, cell: MagicCell) -> RuleErrors | None:
+        """Runs the custom DRC script on a single cell and returns the errors of its log"""
+        log_path = f"{self.cell_log_directory}/{cell.name}.log"
+        command = [self.magic_executable, os.path.relpath(cell.path, self.work_directory), "-dnull", "-noconsole"]
+
+        try:
+            with open(self.tcl_script_path, "r") as tcl_script:
+                subprocess.run(command, stdin=tcl_script, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
+                               check=True, cwd=self.work_directory, env={**os.environ, "AAL_DRC_OUTPUT": log_path})
+
+            _, cell_errors = read_custom_drc_log(path=log_path)
+            return cell_errors
+
+        except (subprocess.CalledProcessError, OSError) as e:
+            self.logger.error(f"DRC of cell '{cell.name}' with '{' '.join(command)}' failed with "
+                              f"{getattr(e, 'stderr', None) or e}")
+            return None
+
+    def check_cell(self, path: str) -> bool:
+        """Checks a single cell right away and caches the result for a later get(). Returns if a result is cached"""
+        os.makedirs(self.cell_log_directory, exist_ok=True)
+
+        cell = self.__read_cell(path=path)
+        if cell is None:
+            self.logger.error(f"Cell '{path}' was not found")
+            return False
+
+        script_hash = self.__get_script_hash()
+        cached = self.__load_cache().get(cell.path)
+        if cached and cached["hash"] == cell.content_hash and cached["script_hash"] == script_hash:
+            return True
+
+        cell_errors = self.__run_cell_drc(cell=cell)
+        if cell_errors is None:
+            return False
+
+        self.__update_cache(entries={cell.path: {"hash": cell.content_hash, "script_hash": script_hash,
+                                                 "rules": cell_errors.to_dict()}})
+        self.logger.info(f"DRC of cell '{cell.name}' done. | DRC Errors: {sum(cell_errors.counts().values())}")
+        return True
+
+    def get(self) -> RuleErrors:
+        os.makedirs(self.cell_log_directory, exist_ok=True)
+
+        top_cell = self.__read_cell(path=f"{self.design_directory}/{self.project_top_cell_name}.mag")
+        if top_cell is None:
+            self.logger.error(f"Top cell '{self.design_directory}/{self.project_top_cell_name}.mag' was not found")
+            return RuleErrors()
+
+        instances = self.__get_cell_instances(top_cell=top_cell)
+        cells = [self.cells[path] for path in instances]
+
+        script_hash = self.__get_script_hash()
+        cache = self.__load_cache()
+        cell_errors = {}
+        new_entries = {}
+        cells_to_check = []
+        for cell in cells:
+            cached = cache.get(cell.path)
+            if cached and cached["hash"] == cell.content_hash and cached["script_hash"] == script_hash:
+                cell_errors[cell.path] = RuleErrors.from_dict(cached["rules"])
+            else:
+                cells_to_check.append(cell)
+
+        with ThreadPoolExecutor(max_workers=max(1, self.workers)) as executor:
+            for cell, result in zip(cells_to_check, executor.map(self.__run_cell_drc, cells_to_check)):
+                if result is not None:
+                    cell_errors[cell.path] = result
+                    new_entries[cell.path] = {"hash": cell.content_hash, "script_hash": script_hash,
+                                              "rules": result.to_dict()}
+
+        self.__update_cache(entries=new_entries)
+        self.total_cells_checked = sum(cell.path in cell_errors for cell in cells_to_check)
+        self.total_cells_cached = len(cells) - len(cells_to_check)
+
+        # Map errors of all cells to top cell coordinates
+        rule_errors = RuleErrors()
+        found_errors = set()
+        for cell in cells:
+            if cell.path not in cell_errors:
+                continue
+
+            for rule, areas in cell_errors[cell.path].rule.items():
+                for area in areas:
+                    for a, b, c, d, e, f in instances[cell.path]:
+                        x1, x2 = sorted((a * area.x1 + b * area.y1 + c, a * area.x2 + b * area.y2 + c))
+                        y1, y2 = sorted((d * area.x1 + e * area.y1 + f, d * area.x2 + e * area.y2 + f))
+
+                        if (rule, x1, y1, x2, y2) not in found_errors:
+                            found_errors.add((rule, x1, y1, x2, y2))
+                            rule_errors.rule[rule].append(Area(x1=x1, y1=y1, x2=x2, y2=y2))
+
+        self.logger.info(f"Per cell DRC done. | Cells: {len(cells)} | Checked: {self.total_cells_checked} | "
+                         f"Cached: {self.total_cells_cached} | Total DRC Errors: {len(found_errors)}")
+        return rule_errors
@@ -15,32 +15,16 @@
 
 # ================================================== Libraries =========================================================
 import os
-import re
 import subprocess
-import itertools
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
-from dataclasses import dataclass, field
-from typing import List, Dict
-from collections import defaultdict
 from logger.logger import get_a_logger
+from config.config_loader import get_config
+from drc.drc_errors import RuleErrors, read_custom_drc_log
+from drc.drc_cell_orchestrator import DRCCellOrchestrator
+from drc.drc_error_heatmap import DRCErrorHeatmap
 
 # ================================================= DRC checker ========================================================
 
 
-@dataclass
-class Area:
-    x1: int
-    y1: int
-    x2: int
-    y2: int
-
-
-@dataclass
-class RuleErrors:
-    rule: Dict[str, List[Area]] = field(default_factory=list)
-
-
 class DRCchecking:
     logger = get_a_logger(__name__)
 
@@ -49,17 +33,42 @@ class DRCchecking:
         self.project_directory = project_properties.directory
         self.project_top_lib_name = project_properties.top_lib_name
         self.project_top_cell_name = project_properties.top_cell_name
-
-        self.__create_standard_drc_logs()
-        self.__create_custom_drc_log()
-        raw_drc_log = self.__read_custom_drc_log()
-
-        # Item nr. 2 = detailed violations
-        drc_errors = self.__parse_out_custom_detailed_drc_errors(raw_data_log=raw_drc_log[2])
-
-        self.__plot_custom_drc_errors(drc_errors=drc_errors)
-        self.logger.info(f"{raw_drc_log[0].rstrip()}")
-        self.logger.info(f"{raw_drc_log[1].rstrip()}")
+        self.project_properties = project_properties
+
+        self.config = get_config()
+        self.PER_CELL_DRC = self.config["drc_checker"]["PER_CELL_DRC"]
+        self.STANDARD_DRC_LOGS = self.config["drc_checker"]["STANDARD_DRC_LOGS"]
+        self.DRC_WORKERS = self.config["drc_checker"]["DRC_WORKERS"]
+        self.MAGIC_EXECUTABLE = self.config["drc_checker"]["MAGIC_EXECUTABLE"]
+        self.PLOT_DRC_ERRORS = self.config["drc_checker"]["PLOT_DRC_ERRORS"]
+        self.DRC_PLOT_RESOLUTION = self.config["drc_checker"]["DRC_PLOT_RESOLUTION"]
+
+        # The standard project DRC does not use the per cell cache. It always runs without per cell DRC, and with per
+        # cell DRC unless turned off
+        if not self.PER_CELL_DRC or self.STANDARD_DRC_LOGS:
+            self.__create_standard_drc_logs()
+
+        if self.PER_CELL_DRC:
+            drc_errors = self.__create_per_cell_drc_errors()
+            self.__plot_custom_drc_errors(drc_errors=drc_errors)
+            self.logger.info(f"Total DRC Errors: {sum(len(areas) for areas in drc_errors.rule.values())}")
+            self.logger.info(f"DRC Error Descriptions: {list(drc_errors.rule) if drc_errors.rule else 'None'}")
+        else:
+            self.__create_custom_drc_log()
+            drc_log_summary, drc_errors = self.__read_custom_drc_log()
+
+            self.__plot_custom_drc_errors(drc_errors=drc_errors)
+            for text_line in drc_log_summary:
+                self.logger.info(f"{text_line.rstrip()}")
+
+        self.logger.info(f"DRC errors per rule: {drc_errors.counts()}")
+
+    def __create_per_cell_drc_errors(self) -> RuleErrors:
+        """Runs the custom DRC script on every generated cell concurrently, reusing results of unchanged cells"""
+        return DRCCellOrchestrator(project_properties=self.project_properties,
+                                   tcl_script_path=os.path.join(self.current_file_directory, 'log_drc_info.tcl'),
+                                   magic_executable=self.MAGIC_EXECUTABLE,
+                                   workers=self.DRC_WORKERS).get()
 
     def __create_standard_drc_logs(self):
         work_directory = os.path.expanduser(f"{self.project_directory}/work/")
@@ -92,67 +101,23 @@ class DRCchecking:
             self.logger.error(f"'magic ../design/{self.project_top_lib_name}/{self.project_top_cell_name}.mag "
                               f"-dnull -noconsole < {tcl_script_path}' failed with {e.stderr}")
 
-    def __read_custom_drc_log(self) -> list:
+    def __read_custom_drc_log(self) -> tuple[list, RuleErrors]:
+        """Reads the summary lines of the custom log and streams the detailed DRC errors from it"""
         work_drc_directory = os.path.expanduser(f"{self.project_directory}/work/drc")
-        drc_log = []
         try:
-            with open(f"{work_drc_directory}/AAL_DRC_OUTPUT.log", "r") as drc_output_log:
-                for text_line in drc_output_log:
-                    drc_log.append(text_line)
-                self.logger.info(f"Custom DRC log '{work_drc_directory}/AAL_DRC_OUTPUT.log' read")
-                return drc_log
+            drc_log_summary, drc_errors = read_custom_drc_log(path=f"{work_drc_directory}/AAL_DRC_OUTPUT.log")
+            self.logger.info(f"Custom DRC log '{work_drc_directory}/AAL_DRC_OUTPUT.log' read and detailed DRC "
+                             f"errors parsed")
+            return drc_log_summary, drc_errors
 
         except FileNotFoundError:
             self.logger.error(f"The file {work_drc_directory}/AAL_DRC_OUTPUT.log was not found.")
-
-    def __parse_out_custom_detailed_drc_errors(self, raw_data_log) -> RuleErrors:
-        general_info_pattern = r"\{([^{}]*)\}"
-        all_data_listed = re.findall(general_info_pattern, raw_data_log)
-
-        rule_errors = RuleErrors(rule=defaultdict(list))
-        current_rule = None
-
-        for item in all_data_listed:
-            # New rule
-            if any(char.isalpha() for char in item):
-                current_rule = item
-
-            # Coordinates
-            else:
-                x1, y1, x2, y2 = map(int, item.split())
-                area = Area(x1=x1, y1=y1, x2=x2, y2=y2)
-                rule_errors.rule[current_rule].append(area)
-
-        self.logger.info("Detailed DRC errors parsed from custom log")
-        return rule_errors
+            return [], RuleErrors()
 
     def __plot_custom_drc_errors(self, drc_errors: RuleErrors):
-        fig, ax = plt.subplots()
-
-        # Add rectangles
-        for rule, areas in drc_errors.rule.items():
-            for area in areas:
-                rect = patches.Rectangle((area.x1, area.y1), area.x2 - area.x1, area.y2 - area.y1,
-                                         linewidth=0.1, edgecolor='black', facecolor='red')
-                ax.add_patch(rect)
-
-        # Set plot limits
-        areas = list(itertools.chain.from_iterable(drc_errors.rule.values()))
-        if areas:
-            ax.set_xlim([min(area.x1 for area in areas), max(area.x2 for area in areas)])
-            ax.set_ylim([min(area.y1 for area in areas), max(area.y2 for area in areas)])
-
-        ax.set_xlabel('X-axis')
-        ax.set_ylabel('Y-axis')
-        ax.set_title('DRC Errors')
-        self.logger.info(f"Detailed DRC errors plotted from custom log and saved to "
-                         f"'{self.current_file_directory}/drc_errors_plot.png'")
-        plt.savefig(f"{self.current_file_directory}/drc_errors_plot.png", dpi=500)
-
-
-
-
-
-
-
+        """Saves a heatmap of the DRC errors per rule, only when turned on in the config"""
+        if not self.PLOT_DRC_ERRORS:
+            return
 
+        DRCErrorHeatmap(rule_errors=drc_errors, resolution=self.DRC_PLOT_RESOLUTION).save(
+            path=f"{self.current_file_directory}/drc_errors_plot.png")
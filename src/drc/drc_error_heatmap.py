@@ -0,0 +1,105 @@
+# ==================================================================================================================== #
+# Copyright (C) 2025 Bjørn K.T. Solheim, Leidulv Tønnesland
+# ==================================================================================================================== #
+# This program is free software: you can redistribute it and/or modify it under the terms of
+# the GNU General Public License as published by the Free Software Foundation, version 2.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <https://www.gnu.org/licenses/>.
+# ==================================================================================================================== #
+
+# ==================================================== Notes ===========================================================
+"""
+    Renders DRC errors as a density image instead of one plot patch per error. The error areas of each rule are
+    rasterized into their own layer, counting how many errors cover each pixel. A layer is built from a difference
+    array with +1/-1 at the corners of every area followed by a cumulative sum along both axes, so the cost per error
+    does not depend on its size.
+
+    Layers are blended on a white background with one color per rule, where the color strength follows the
+    logarithm of the density. Every area covers at least one pixel, so small errors in large layouts stay visible.
+    The image is written directly as a PNG, with the rule colors listed in the log.
+"""
+
+# ================================================== Libraries =========================================================
+from typing import Iterator
+import numpy as np
+import matplotlib.pyplot as plt
+from drc.drc_errors import RuleErrors
+from logger.logger import get_a_logger
+
+# ============================================== DRC error heatmap =====================================================
+
+
+class DRCErrorHeatmap:
+    logger = get_a_logger(__name__)
+
+    def __init__(self, rule_errors: RuleErrors, resolution: int = 2048):
+        self.rule_errors = rule_errors
+        self.resolution = resolution
+
+        # Areas per rule as rows of x1, y1, x2, y2 with the lowest coordinates first
+        self.rule_areas = {}
+        for rule, areas in rule_errors.rule.items():
+            if len(areas):
+                coordinates = np.frombuffer(areas.coordinates, dtype=np.int64).reshape(-1, 4)
+                self.rule_areas[rule] = np.column_stack((
+                    np.minimum(coordinates[:, 0], coordinates[:, 2]), np.minimum(coordinates[:, 1], coordinates[:, 3]),
+                    np.maximum(coordinates[:, 0], coordinates[:, 2]), np.maximum(coordinates[:, 1], coordinates[:, 3])))
+
+    def __get_bounds(self) -> tuple[int, int, int, int]:
+        all_areas = np.concatenate(list(self.rule_areas.values()))
+        return (int(all_areas[:, 0].min()), int(all_areas[:, 1].min()),
+                int(all_areas[:, 2].max()), int(all_areas[:, 3].max()))
+
+    def iter_layers(self) -> Iterator[tuple[str, np.ndarray]]:
+        """Yields the number of errors covering each pixel per rule, with row 0 at the lowest y coordinate. Layers
+        are created one at a time, so only one of them is kept in memory"""
+        if not self.rule_areas:
+            return
+
+        x_min, y_min, x_max, y_max = self.__get_bounds()
+        scale = (self.resolution - 1) / max(x_max - x_min, y_max - y_min, 1)
+        width = int((x_max - x_min) * scale) + 1
+        height = int((y_max - y_min) * scale) + 1
+
+        for rule, areas in self.rule_areas.items():
+            x1 = ((areas[:, 0] - x_min) * scale).astype(np.intp)
+            y1 = ((areas[:, 1] - y_min) * scale).astype(np.intp)
+            x2 = ((areas[:, 2] - x_min) * scale).astype(np.intp) + 1
+            y2 = ((areas[:, 3] - y_min) * scale).astype(np.intp) + 1
+
+            # Corner counts of the flattened difference array
+            size = (height + 1) * (width + 1)
+            difference = (np.bincount(y1 * (width + 1) + x1, minlength=size)
+                          - np.bincount(y1 * (width + 1) + x2, minlength=size)
+                          - np.bincount(y2 * (width + 1) + x1, minlength=size)
+                          + np.bincount(y2 * (width + 1) + x2, minlength=size)).reshape(height + 1, width + 1)
+            yield rule, difference.cumsum(axis=0, dtype=np.int32).cumsum(axis=1, dtype=np.int32)[:height, :width]
+
+    def save(self, path: str) -> bool:
+        if not self.rule_areas:
+            self.logger.info("No DRC errors to plot")
+            return False
+
+        color_map = plt.get_cmap("tab20")
+        image = None
+        for rule_index, (rule, density) in enumerate(self.iter_layers()):
+            if image is None:
+                image = np.ones((*density.shape, 3), dtype=np.float32)
+
+            color = np.array(color_map(rule_index % color_map.N)[:3], dtype=np.float32)
+            strength = np.log1p(density, dtype=np.float32) / np.float32(np.log1p(max(int(density.max()), 1)))
+            alpha = np.where(density > 0, 0.35 + 0.65 * strength, 0.0).astype(np.float32)[..., np.newaxis]
+            image = image * (1 - alpha) + color * alpha
+
+            self.logger.info(f"DRC heatmap color {tuple(round(float(value), 2) for value in color)} is rule "
+                             f"'{rule}' with {len(self.rule_areas[rule])} errors")
+
+        plt.imsave(path, np.clip(image, 0.0, 1.0), origin="lower")
+        self.logger.info(f"DRC error heatmap of {len(self.rule_areas)} rules with size "
+                         f"{image.shape[1]}x{image.shape[0]} saved to '{path}'")
+        return True
@@ -0,0 +1,141 @@
+# ==================================================================================================================== #
+# Copyright (C) 2025 Bjørn K.T. Solheim, Leidulv Tønnesland
+# ==================================================================================================================== #
+# This program is free software: you can redistribute it and/or modify it under the terms of
+# the GNU General Public License as published by the Free Software Foundation, version 2.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <https://www.gnu.org/licenses/>.
+# ==================================================================================================================== #
+
+# ==================================================== Notes ===========================================================
+"""
+    DRC errors per rule, and reading of the custom DRC log written by log_drc_info.tcl.
+
+    The detailed error descriptions are a single line of '{rule} {{x1 y1 x2 y2} ...}' groups, which gets very long
+    for designs with many violations. The log is therefore read in chunks, and the innermost '{...}' groups are
+    handed out one by one as they are found. Areas are stored per rule as a flat array of coordinates, so counting
+    violations per rule does not require an object per area.
+"""
+
+# ================================================== Libraries =========================================================
+from array import array
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, TextIO
+from collections import defaultdict
+import io
+import re
+
+# ================================================== DRC errors ========================================================
+
+CHUNK_SIZE = 1 << 16
+BRACE_GROUP_PATTERN = re.compile(r"\{([^{}]*)\}")
+RULE_PATTERN = re.compile(r"[^\W\d_]")  # Any letter
+
+
+@dataclass
+class Area:
+    x1: int
+    y1: int
+    x2: int
+    y2: int
+
+
+class RuleAreas:
+    """Areas of a single rule stored as a flat array of x1, y1, x2, y2 values"""
+    __slots__ = ("coordinates",)
+
+    def __init__(self, coordinates=()):
+        self.coordinates = array("q", coordinates)
+
+    def __len__(self):
+        return len(self.coordinates) // 4
+
+    def __iter__(self) -> Iterator[Area]:
+        coordinates = self.coordinates
+        for index in range(0, len(coordinates), 4):
+            yield Area(x1=coordinates[index], y1=coordinates[index + 1],
+                       x2=coordinates[index + 2], y2=coordinates[index + 3])
+
+    def __repr__(self):
+        return f"RuleAreas({list(self)})"
+
+    def append(self, area: Area):
+        self.coordinates.extend((area.x1, area.y1, area.x2, area.y2))
+
+
+@dataclass
+class RuleErrors:
+    rule: Dict[str, RuleAreas] = field(default_factory=lambda: defaultdict(RuleAreas))
+
+    def counts(self) -> dict[str, int]:
+        return {rule: len(areas) for rule, areas in self.rule.items()}
+
+    def to_dict(self) -> dict[str, list[int]]:
+        return {rule: areas.coordinates.tolist() for rule, areas in self.rule.items()}
+
+    @classmethod
+    def from_dict(cls, rules: dict[str, list[int]]):
+        rule_errors = cls()
+        for rule, coordinates in rules.items():
+            rule_errors.rule[rule] = RuleAreas(coordinates)
+        return rule_errors
+
+
+def iter_brace_groups(text_stream: TextIO, chunk_size: int = CHUNK_SIZE) -> Iterator[str]:
+    """Yields the content of every innermost '{...}' group up to the end of the current line, reading the stream
+    in chunks"""
+    pending = ""
+
+    while True:
+        chunk = text_stream.read(chunk_size)
+        end_of_line = chunk.find("\n")
+        if end_of_line != -1:
+            chunk = chunk[:end_of_line]
+
+        pending += chunk
+        group_end = 0
+        for group in BRACE_GROUP_PATTERN.finditer(pending):
+            yield group.group(1)
+            group_end = group.end()
+
+        # Keep an unfinished group for the next chunk
+        open_brace = pending.rfind("{", group_end)
+        pending = pending[open_brace:] if open_brace != -1 else ""
+
+        if end_of_line != -1 or not chunk:
+            return
+
+
+def parse_detailed_drc_errors(text_stream: TextIO | str) -> RuleErrors:
+    """Parses detailed DRC error descriptions of a custom DRC log into areas per rule"""
+    if isinstance(text_stream, str):
+        text_stream = io.StringIO(text_stream)
+
+    rule_errors = RuleErrors()
+    current_areas = None
+
+    for item in iter_brace_groups(text_stream=text_stream):
+        # New rule
+        if RULE_PATTERN.search(item):
+            current_areas = rule_errors.rule[item]
+
+        # Coordinates
+        else:
+            x1, y1, x2, y2 = item.split()
+            if current_areas is None:
+                current_areas = rule_errors.rule[None]
+            current_areas.coordinates.extend((int(x1), int(y1), int(x2), int(y2)))
+
+    return rule_errors
+
+
+def read_custom_drc_log(path: str) -> tuple[list[str], RuleErrors]:
+    """Returns the summary lines and the detailed errors of a custom DRC log, streaming the detailed errors"""
+    with open(path, "r") as drc_output_log:
+        summary = [drc_output_log.readline(), drc_output_log.readline()]
+        return summary, parse_detailed_drc_errors(text_stream=drc_output_log)
@@ -0,0 +1,213 @@
+# ==================================================================================================================== #
+# Copyright (C) 2025 Bjørn K.T. Solheim, Leidulv Tønnesland
+# ==================================================================================================================== #
+# This program is free software: you can redistribute it and/or modify it under the terms of
+# the GNU General Public License as published by the Free Software Foundation, version 2.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <https://www.gnu.org/licenses/>.
+# ==================================================================================================================== #
+
+# ==================================================== Notes ===========================================================
+"""
+    In-process design rule check of generated trace nets, meant to catch problems before the full DRC in Magic.
+    The geometry checked is the same as what the magic layout creator will write for the trace nets: the segments,
+    the vias (both predefined ones and those created where consecutive segments change layer), and the metal pads
+    around vias.
+
+    Rules are read from a table in the config:
+        - Width: every rectangle in a layer must be at least the minimum width in both directions
+        - Spacing: rectangles of different nets in a layer must be at least the minimum spacing apart, measured
+          the same way as Magic does by default, where corners are treated as squares
+        - Short: rectangles of different nets in a layer can not overlap or touch
+        - Via enclosure: the metal of the net must cover the via plus the enclosure on both sides of the via
+
+    Spacing and shorts are checked with a sweep line over the rectangles of each layer sorted by x1.
+"""
+
+# ================================================== Libraries =========================================================
+from collections import defaultdict
+from dataclasses import dataclass
+from circuit.circuit_components import TraceNet
+from drc.drc_errors import Area, RuleErrors
+from logger.logger import get_a_logger
+from config.config_loader import get_config
+from magic.magic_rectangle_merger import MagicRectangleMerger
+
+# ============================================== DRC trace checker =====================================================
+
+
+@dataclass(slots=True)
+class TraceShape:
+    layer: str
+    net: str
+    x1: int
+    y1: int
+    x2: int
+    y2: int
+
+
+class DRCTraceChecking:
+    logger = get_a_logger(__name__)
+
+    def __init__(self, components):
+        self.components = components
+
+        self.config = get_config()
+        self.RUN = self.config["drc_trace_checker"]["RUN"]
+        self.MIN_WIDTH = self.config["drc_trace_checker"]["MIN_WIDTH"]
+        self.MIN_SPACING = self.config["drc_trace_checker"]["MIN_SPACING"]
+        self.VIA_ENCLOSURE = self.config["drc_trace_checker"]["VIA_ENCLOSURE"]
+        self.METAL_LAYERS = self.config["magic_layout_creator"]["METAL_LAYERS"]
+        self.VIA_MAP = self.config["magic_layout_creator"]["VIA_MAP"]
+        self.VIA_PADDING = self.config["magic_layout_creator"]["VIA_PADDING"]
+
+        self.shapes = []
+        self.vias = []
+        self.rule_errors = RuleErrors()
+
+    def __add_violation(self, rule: str, x1: int, y1: int, x2: int, y2: int, nets: str):
+        self.rule_errors.rule[rule].append(Area(x1=x1, y1=y1, x2=x2, y2=y2))
+        self.logger.debug(f"DRC violation '{rule}' at ({x1}, {y1}, {x2}, {y2}) for {nets}")
+
+    def __get_via_stack(self, start_layer: str, end_layer: str) -> tuple[list, list]:
+        """Returns the metal layers and via layers between two metal layers"""
+        try:
+            start, end = sorted((self.METAL_LAYERS.index(start_layer), self.METAL_LAYERS.index(end_layer)))
+        except ValueError:
+            self.logger.error(f"Could not get layers inbetween '{start_layer}' to '{end_layer}'")
+            return [], []
+
+        metal_layers = self.METAL_LAYERS[start:end + 1]
+        via_layers = [self.VIA_MAP[f"{lower}-{upper}"] for lower, upper in zip(metal_layers, metal_layers[1:])
+                      if f"{lower}-{upper}" in self.VIA_MAP]
+        return metal_layers, via_layers
+
+    def __add_via(self, net: str, start_layer: str, end_layer: str, x1: int, y1: int, x2: int, y2: int):
+        """Adds a via with its metal pads, the same way they are placed by the magic layout creator"""
+        metal_layers, via_layers = self.__get_via_stack(start_layer=start_layer, end_layer=end_layer)
+        padding = self.VIA_PADDING if via_layers else 0
+
+        for metal_layer in metal_layers:
+            self.shapes.append(TraceShape(layer=metal_layer, net=net, x1=x1 - padding, y1=y1 - padding,
+                                          x2=x2 + padding, y2=y2 + padding))
+
+        for lower_layer, upper_layer, via_layer in zip(metal_layers, metal_layers[1:], via_layers):
+            via = TraceShape(layer=via_layer, net=net, x1=x1, y1=y1, x2=x2, y2=y2)
+            self.shapes.append(via)
+            self.vias.append((via, lower_layer, upper_layer))
+
+    def __collect_trace_shapes(self):
+        for trace_net in (component for component in self.components if isinstance(component, TraceNet)):
+            previous_segment = None
+
+            for segment in trace_net.segments:
+                area = segment.area
+                self.shapes.append(TraceShape(layer=segment.layer, net=trace_net.name,
+                                              x1=area.x1, y1=area.y1, x2=area.x2, y2=area.y2))
+
+                # Vias are created where consecutive segments overlap in different layers
+                if previous_segment is not None and previous_segment.layer != segment.layer:
+                    overlap_x1 = max(previous_segment.area.x1, area.x1)
+                    overlap_y1 = max(previous_segment.area.y1, area.y1)
+                    overlap_x2 = min(previous_segment.area.x2, area.x2)
+                    overlap_y2 = min(previous_segment.area.y2, area.y2)
+
+                    if overlap_x1 < overlap_x2 and overlap_y1 < overlap_y2:
+                        self.__add_via(net=trace_net.name, start_layer=previous_segment.layer, end_layer=segment.layer,
+                                       x1=overlap_x1, y1=overlap_y1, x2=overlap_x2, y2=overlap_y2)
+                previous_segment = segment
+
+            for via in trace_net.vias:
+                start_layer, _, end_layer = via.layer.partition("-")
+                self.__add_via(net=trace_net.name, start_layer=start_layer, end_layer=end_layer,
+                               x1=via.area.x1, y1=via.area.y1, x2=via.area.x2, y2=via.area.y2)
+
+    def __check_width(self):
+        for shape in self.shapes:
+            min_width = self.MIN_WIDTH.get(shape.layer)
+
+            if min_width is not None and min(shape.x2 - shape.x1, shape.y2 - shape.y1) < min_width:
+                self.__add_violation(rule=f"{shape.layer} width < {min_width}", x1=shape.x1, y1=shape.y1,
+                                     x2=shape.x2, y2=shape.y2, nets=f"net '{shape.net}'")
+
+    def __check_spacing_and_shorts(self):
+        shapes_by_layer = defaultdict(list)
+        for shape in self.shapes:
+            if shape.layer in self.METAL_LAYERS:
+                shapes_by_layer[shape.layer].append(shape)
+
+        for layer, shapes in shapes_by_layer.items():
+            min_spacing = self.MIN_SPACING.get(layer, 0)
+            active = []
+
+            # Sweep from left to right, only keeping shapes that can still be within spacing of the current shape
+            for shape in sorted(shapes, key=lambda s: s.x1):
+                active = [other for other in active if other.x2 + min_spacing > shape.x1 or other.x2 >= shape.x1]
+
+                for other in active:
+                    if other.net == shape.net:
+                        continue
+
+                    gap_x = max(0, shape.x1 - other.x2, other.x1 - shape.x2)
+                    gap_y = max(0, shape.y1 - other.y2, other.y1 - shape.y2)
+                    touching = (shape.x1 <= other.x2 and other.x1 <= shape.x2 and
+                                shape.y1 <= other.y2 and other.y1 <= shape.y2)
+
+                    if not touching and (gap_x >= min_spacing or gap_y >= min_spacing):
+                        continue
+
+                    # Region between the shapes, or their overlap for shorts
+                    x1, x2 = sorted((max(shape.x1, other.x1), min(shape.x2, other.x2)))
+                    y1, y2 = sorted((max(shape.y1, other.y1), min(shape.y2, other.y2)))
+                    rule = f"{layer} short between nets" if touching else f"{layer} spacing < {min_spacing}"
+                    self.__add_violation(rule=rule, x1=x1, y1=y1, x2=x2, y2=y2,
+                                         nets=f"nets '{other.net}' and '{shape.net}'")
+
+                active.append(shape)
+
+    def __check_via_enclosure(self):
+        metal_by_layer_and_net = defaultdict(list)
+        for shape in self.shapes:
+            if shape.layer in self.METAL_LAYERS:
+                metal_by_layer_and_net[(shape.layer, shape.net)].append(shape)
+
+        for via, lower_layer, upper_layer in self.vias:
+            enclosure = self.VIA_ENCLOSURE.get(via.layer, 0)
+            x1, y1, x2, y2 = via.x1 - enclosure, via.y1 - enclosure, via.x2 + enclosure, via.y2 + enclosure
+
+            for metal_layer in (lower_layer, upper_layer):
+
+                # Metal of the net clipped to the required area, where overlapping pieces only count once
+                clipped = [(max(x1, metal.x1), max(y1, metal.y1), min(x2, metal.x2), min(y2, metal.y2))
+                           for metal in metal_by_layer_and_net[(metal_layer, via.net)]
+                           if metal.x1 < x2 and x1 < metal.x2 and metal.y1 < y2 and y1 < metal.y2]
+                covered_area = sum((cx2 - cx1) * (cy2 - cy1) for cx1, cy1, cx2, cy2 in
+                                   MagicRectangleMerger.merge_rectangles(clipped))
+
+                if covered_area < (x2 - x1) * (y2 - y1):
+                    self.__add_violation(rule=f"{via.layer} enclosure by {metal_layer} < {enclosure}",
+                                         x1=via.x1, y1=via.y1, x2=via.x2, y2=via.y2, nets=f"net '{via.net}'")
+
+    def get(self) -> RuleErrors:
+        if not self.RUN:
+            return self.rule_errors
+
+        self.__collect_trace_shapes()
+        self.__check_width()
+        self.__check_spacing_and_shorts()
+        self.__check_via_enclosure()
+
+        cell = next((component.cell for component in self.components if isinstance(component, TraceNet)), None)
+        if self.rule_errors.rule:
+            violation_counts = self.rule_errors.counts()
+            self.logger.warning(f"Trace DRC of cell '{cell}' found {sum(violation_counts.values())} violations "
+                                f"in {len(self.shapes)} shapes: {violation_counts}")
+        else:
+            self.logger.info(f"Trace DRC of cell '{cell}' found no violations in {len(self.shapes)} shapes")
+
+        return self.rule_errors
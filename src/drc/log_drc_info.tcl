@@ -1,5 +1,9 @@
-# Initialize
-set log_file [open "drc/AAL_DRC_OUTPUT.log" "w"]
+# Initialize. The log path can be changed with the AAL_DRC_OUTPUT environment variable
+if {[info exists ::env(AAL_DRC_OUTPUT)]} {
+    set log_file [open $::env(AAL_DRC_OUTPUT) "w"]
+} else {
+    set log_file [open "drc/AAL_DRC_OUTPUT.log" "w"]
+}
 drc catchup
 select top cell
 
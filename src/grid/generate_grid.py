@@ -18,11 +18,11 @@ from dataclasses import dataclass
 from circuit.circuit_components import Pin, CircuitCell, RectArea, Transistor, Resistor, Capacitor
 from connections.connections import Connection
 from logger.logger import get_a_logger
+from config.config_loader import get_config
 import math
 import numpy as np
 import matplotlib.pyplot as plt
 from dataclasses import dataclass, field
-import tomllib
 
 
 @dataclass
@@ -91,7 +91,7 @@ class GridGeneration:
     def __init__(self, components):
 
         # LOAD CONFIG
-        self.config = self.__load_config()
+        self.config = get_config()
         self.SCALE_FACTOR = self.config["generate_grid"]["SCALE_FACTOR"]
         self.TRACE_WIDTH = self.config["generate_grid"]["TRACE_WIDTH"]
         self.VIA_MINIMUM_DISTANCE = self.config["generate_grid"]["VIA_MINIMUM_DISTANCE"]
@@ -118,13 +118,6 @@ class GridGeneration:
         self.used_area = RectArea(x1=sys.maxsize, y1=sys.maxsize, x2=0, y2=0)
         self.grid = None
 
-    def __load_config(self, path="pyproject.toml"):
-        try:
-            with open(path, "rb") as f:
-                return tomllib.load(f)
-        except (FileNotFoundError, tomllib.TOMLDecodeError) as e:
-            self.logger.error(f"Error loading config: {e}")
-
     def get_used_area(self):
         for obj in self.components:
             if not check_instance(obj):  # Skip components of these types
@@ -0,0 +1,161 @@
+# ==================================================================================================================== #
+# Copyright (C) 2025 Bjørn K.T. Solheim, Leidulv Tønnesland
+# ==================================================================================================================== #
+# This program is free software: you can redistribute it and/or modify it under the terms of
+# the GNU General Public License as published by the Free Software Foundation, version 2.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <https://www.gnu.org/licenses/>.
+# ==================================================================================================================== #
+
+# ==================================================== Notes ===========================================================
+"""
+    Timers and counters for the steps of a run, exported as a Chrome trace file that can be opened in
+    chrome://tracing or https://ui.perfetto.dev. Timers can be nested, and every timer becomes a complete event on the
+    thread it ran on. Counters are kept as totals and as counter events over time.
+
+    When turned off, timer() returns one shared context manager doing nothing and count() returns right away, so
+    hooks can stay in hot code. Totals per timer path, like 'cell creator/cell/astar', are logged when the run is done.
+"""
+
+# ================================================== Libraries =========================================================
+import os
+import json
+import time
+import threading
+from contextlib import nullcontext
+from collections import defaultdict
+from logger.logger import get_a_logger
+from config.config_loader import get_config
+
+# =============================================== Instrumentation ======================================================
+
+NULL_TIMER = nullcontext()
+
+
+class Timer:
+    __slots__ = ("instrumentation", "name", "args", "start")
+
+    def __init__(self, instrumentation, name: str, args: dict):
+        self.instrumentation = instrumentation
+        self.name = name
+        self.args = args
+        self.start = 0
+
+    def __enter__(self):
+        self.instrumentation.local_stack().append(self.name)
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        end = time.perf_counter_ns()
+        stack = self.instrumentation.local_stack()
+        path = "/".join(stack)
+        stack.pop()
+        self.instrumentation.add_timer_event(name=self.name, path=path, start=self.start, end=end, args=self.args)
+        return False
+
+
+class Instrumentation:
+    logger = get_a_logger(__name__)
+
+    def __init__(self):
+        self.enabled = False
+        self.trace_path = None
+        self.start_time = time.perf_counter_ns()
+        self.lock = threading.Lock()
+        self.local = threading.local()
+        self.events = []
+        self.counters = defaultdict(int)
+        self.timer_totals = defaultdict(lambda: [0, 0])  # timer path -> [calls, nanoseconds]
+
+    def local_stack(self) -> list:
+        stack = getattr(self.local, "stack", None)
+        if stack is None:
+            stack = self.local.stack = []
+        return stack
+
+    def __timestamp(self, nanoseconds: int) -> float:
+        # Chrome trace timestamps are in microseconds
+        return (nanoseconds - self.start_time) / 1000
+
+    def add_timer_event(self, name: str, path: str, start: int, end: int, args: dict):
+        event = {"name": name, "cat": path.partition("/")[0], "ph": "X", "ts": self.__timestamp(start),
+                 "dur": (end - start) / 1000, "pid": os.getpid(), "tid": threading.get_ident(),
+                 "args": {key: str(value) for key, value in args.items()}}
+        with self.lock:
+            self.events.append(event)
+            totals = self.timer_totals[path]
+            totals[0] += 1
+            totals[1] += end - start
+
+    def start(self, trace_path: str):
+        self.enabled = True
+        self.trace_path = trace_path
+        self.start_time = time.perf_counter_ns()
+
+    def timer(self, name: str, **args):
+        """Returns a context manager timing the code inside it"""
+        if not self.enabled:
+            return NULL_TIMER
+        return Timer(instrumentation=self, name=name, args=args)
+
+    def count(self, name: str, value: int = 1):
+        if not self.enabled:
+            return
+
+        with self.lock:
+            self.counters[name] += value
+            self.events.append({"name": name, "ph": "C", "ts": self.__timestamp(time.perf_counter_ns()),
+                                "pid": os.getpid(), "args": {name: self.counters[name]}})
+
+    def finish(self):
+        """Writes the trace file and logs totals per timer and counter"""
+        if not self.enabled:
+            return
+
+        with self.lock:
+            trace = {"traceEvents": list(self.events), "displayTimeUnit": "ms",
+                     "otherData": {"counters": dict(self.counters),
+                                   "timers": {path: {"calls": calls, "seconds": nanoseconds / 1e9}
+                                              for path, (calls, nanoseconds) in self.timer_totals.items()}}}
+        try:
+            os.makedirs(os.path.dirname(self.trace_path) or ".", exist_ok=True)
+            with open(self.trace_path, "w") as trace_file:
+                json.dump(trace, trace_file)
+            self.logger.info(f"Instrumentation trace with {len(trace['traceEvents'])} events saved to "
+                             f"'{self.trace_path}'")
+        except OSError as e:
+            self.logger.error(f"Could not save instrumentation trace '{self.trace_path}': {e}")
+
+        for path, totals in sorted(trace["otherData"]["timers"].items(), key=lambda item: -item[1]["seconds"]):
+            self.logger.info(f"Timer '{path}' | Calls: {totals['calls']} | Total: {totals['seconds']:.3f}s")
+        for name, value in sorted(trace["otherData"]["counters"].items()):
+            self.logger.info(f"Counter '{name}' | Total: {value}")
+        self.enabled = False
+
+
+instrumentation = Instrumentation()
+
+
+def start_instrumentation():
+    """Turns on instrumentation for the run when enabled in the config"""
+    config = get_config()["instrumentation"]
+    if config["RUN"]:
+        instrumentation.start(trace_path=config["TRACE_FILE"])
+
+
+def finish_instrumentation():
+    instrumentation.finish()
+
+
+def timer(name: str, **args):
+    return instrumentation.timer(name, **args)
+
+
+def count(name: str, value: int = 1):
+    instrumentation.count(name, value)
@@ -39,13 +39,9 @@ def get_component_bounding_box_for_aal_misc_lib(self, text_line: str, component)
         self.found_bounding_box = True
 
 
-def magic_component_parsing_for_aal_misc_lib(self, layout_file_path: str, component):
-    try:
-        with open(layout_file_path, "r") as magic_file:
-            for text_line in magic_file:
-                get_component_bounding_box_for_aal_misc_lib(text_line=text_line, component=component, self=self)
-    except FileNotFoundError:
-        self.logger.error(f"The file {layout_file_path} was not found.")
+def magic_component_parsing_for_aal_misc_lib(self, magic_file_lines: list, component):
+    for text_line in magic_file_lines:
+        get_component_bounding_box_for_aal_misc_lib(text_line=text_line, component=component, self=self)
 
 
 # ========================================= Bipolar PNP trace generation functions =====================================
@@ -22,7 +22,6 @@ from itertools import groupby
 from dataclasses import dataclass, field
 from typing import List, Dict, Tuple
 from collections import defaultdict
-import time
 
 from logger.logger import get_a_logger
 from circuit.circuit_components import (RectArea, RectAreaLayer, Transistor, Capacitor, Resistor, Pin, CircuitCell,
@@ -665,7 +664,7 @@ def place_transistor_endpoints_for_atr_lib(self, component: Transistor):
             self.magic_file_lines.extend([
                 f"use {layout_name_top}  {component.group}_{component.name}_TAPTOP "
                 f"../{re.search(r'[^/]+$', self.current_component_library_path).group()}",
-                f"timestamp {int(time.time())}",
+                f"timestamp {self.get_cell_timestamp(layout_name=layout_name_top)}",
                 f"transform {component.transform_matrix.a} {component.transform_matrix.b} "
                 f"{component.transform_matrix.c} {component.transform_matrix.d} {component.transform_matrix.e} "
                 f"{component.transform_matrix.f + component.bounding_box.y2}",
@@ -678,7 +677,7 @@ def place_transistor_endpoints_for_atr_lib(self, component: Transistor):
             self.magic_file_lines.extend([
                 f"use {layout_name_bot}  {component.group}_{component.name}_TAPBOT "
                 f"../{re.search(r'[^/]+$', self.current_component_library_path).group()}",
-                f"timestamp {int(time.time())}",
+                f"timestamp {self.get_cell_timestamp(layout_name=layout_name_bot)}",
                 f"transform {component.transform_matrix.a} {component.transform_matrix.b}"
                 f" {component.transform_matrix.c} {component.transform_matrix.d} {component.transform_matrix.e} "
                 f"{component.transform_matrix.f - component.group_endpoint_bounding_box.y2}",
@@ -729,23 +728,17 @@ def get_component_endpoint_bounding_box_for_atr_lib(self, text_line: str, compon
         component.group_endpoint_bounding_box.set([int(val) // self.scale_factor for val in text_line_words[2:6]])
 
 
-def magic_component_parsing_for_atr_lib(self, layout_file_path: str, component):
-    try:
-        with open(layout_file_path, "r") as magic_file:
-            for text_line in magic_file:
-                get_overlap_difference_for_atr_lib(text_line=text_line, component=component, self=self)
-                get_component_bounding_box_for_atr_lib(text_line=text_line, component=component, self=self)
-    except FileNotFoundError:
-        self.logger.error(f"The file {layout_file_path} was not found.")
+def magic_component_parsing_for_atr_lib(self, magic_file_lines: list, component):
+    for text_line in magic_file_lines:
+        get_overlap_difference_for_atr_lib(text_line=text_line, component=component, self=self)
+        get_component_bounding_box_for_atr_lib(text_line=text_line, component=component, self=self)
 
     # It's safe to assumes that top and bottom taps have equal bounding boxes.
     transistor_endpoint_layout_name = re.sub(r".{3}$", "TAPTOP", component.layout_name)
     layout_file_path = os.path.expanduser(f"{self.current_component_library_path}/"
                                           f"{transistor_endpoint_layout_name}.mag")
-    try:
-        with open(layout_file_path, "r") as magic_file:
-            for text_line in magic_file:
-                get_component_endpoint_bounding_box_for_atr_lib(self=self, text_line=text_line, component=component)
 
-    except FileNotFoundError:
-        self.logger.error(f"The file {layout_file_path} was not found.")
+    transistor_endpoint_file_lines = self.read_layout_file(layout_file_path=layout_file_path)
+    if transistor_endpoint_file_lines is not None:
+        for text_line in transistor_endpoint_file_lines:
+            get_component_endpoint_bounding_box_for_atr_lib(self=self, text_line=text_line, component=component)
@@ -16,7 +16,7 @@
 from circuit.circuit_components import RectArea, Transistor, Capacitor, Resistor, Pin, CircuitCell, TraceNet, \
     RectAreaLayer
 from logger.logger import get_a_logger
-import tomllib
+from config.config_loader import get_config
 import re
 import libraries.atr_lib as atr
 import libraries.tr_lib as tr
@@ -42,7 +42,7 @@ class LibraryHandling:
         self.functional_component_order = functional_component_order
 
         # Load config
-        self.config = self.__load_config()
+        self.config = get_config()
         self.INIT_RAIL_RING_OFFSET_X = self.config["generate_rail_traces"]["INIT_RAIL_RING_OFFSET_X"]
         self.INIT_RAIL_RING_OFFSET_Y = self.config["generate_rail_traces"]["INIT_RAIL_RING_OFFSET_Y"]
         self.RAIL_RING_OFFSET = self.config["generate_rail_traces"]["RAIL_RING_OFFSET"]
@@ -81,12 +81,5 @@ class LibraryHandling:
         aal_misc.generate_local_traces_for_aal_misc_lib_mim_capacitors(self=self)
         return self.components
 
-    def __load_config(self, path="pyproject.toml"):
-        try:
-            with open(path, "rb") as f:
-                return tomllib.load(f)
-        except (FileNotFoundError, tomllib.TOMLDecodeError) as e:
-            self.logger.error(f"Error loading config: {e}")
-
 
 
@@ -40,13 +40,9 @@ def get_component_bounding_box_for_tr_lib(self, text_line: str, component):
         self.found_bounding_box = True
 
 
-def magic_component_parsing_for_tr_lib(self, layout_file_path: str, component):
-    try:
-        with open(layout_file_path, "r") as magic_file:
-            for text_line in magic_file:
-                get_component_bounding_box_for_tr_lib(text_line=text_line, component=component, self=self)
-    except FileNotFoundError:
-        self.logger.error(f"The file {layout_file_path} was not found.")
+def magic_component_parsing_for_tr_lib(self, magic_file_lines: list, component):
+    for text_line in magic_file_lines:
+        get_component_bounding_box_for_tr_lib(text_line=text_line, component=component, self=self)
 
 
 def generate_local_traces_for_tr_lib_resistors(self):
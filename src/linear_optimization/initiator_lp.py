@@ -14,12 +14,12 @@
 
 import os
 import re
-import tomllib
 import pulp
 from circuit.circuit_components import Pin, CircuitCell, Transistor, TraceNet, Resistor, Capacitor, RectArea
 from connections.connections import overlap_pairs
 from linear_optimization.linear_optimization import LinearOptimizationSolver
 from logger.logger import get_a_logger
+from config.config_loader import get_config
 import sys
 
 
@@ -31,7 +31,7 @@ class LPInitiator:
         self.current_file_directory = os.path.dirname(os.path.abspath(__file__))
 
         #load config
-        self.config = self.__load_config()
+        self.config = get_config()
         self.SUB_CELL_OFFSET_1 = self.config["initiator_lp"]["SUB_CELL_OFFSET_1"]
         self.SUB_CELL_OFFSET_2 = self.config["initiator_lp"]["SUB_CELL_OFFSET_2"]
         self.SUB_CELL_OFFSET_3 = self.config["initiator_lp"]["SUB_CELL_OFFSET_3"]
@@ -61,13 +61,6 @@ class LPInitiator:
         self.coordinates_x = []
         self.coordinates_y = []
 
-    def __load_config(self, path="pyproject.toml"):
-        try:
-            with open(path, "rb") as f:
-                return tomllib.load(f)
-        except (FileNotFoundError, tomllib.TOMLDecodeError) as e:
-            self.logger.error(f"Error loading config: {e}")
-
     @staticmethod
     def __check_vdd_vss(net):
         return re.search(".*VSS.*", net, re.IGNORECASE) or re.search(".*VDD.*", net, re.IGNORECASE)
@@ -17,9 +17,10 @@ import time
 import pickle
 import pyscipopt
 import os
-import tomllib
 from circuit.circuit_components import Pin, CircuitCell, Transistor, TraceNet
 from logger.logger import get_a_logger
+from config.config_loader import get_config
+from instrumentation.instrumentation import timer
 
 
 class LinearOptimizationSolver:
@@ -30,7 +31,7 @@ class LinearOptimizationSolver:
         self.current_file_directory = os.path.dirname(os.path.abspath(__file__))
 
         # Load config
-        self.config = self.__load_config()
+        self.config = get_config()
         self.CUSTOM_PARAMETERS = self.config["linear_optimization"]["CUSTOM_PARAMETERS"]
         self.RUN = self.config["linear_optimization"]["RUN"]
         self.SOLVER_MSG = self.config["linear_optimization"]["SOLVER_MSG"]
@@ -119,13 +120,6 @@ class LinearOptimizationSolver:
 
 
 
-    def __load_config(self, path="pyproject.toml"):
-        try:
-            with open(path, "rb") as f:
-                return tomllib.load(f)
-        except (FileNotFoundError, tomllib.TOMLDecodeError) as e:
-            self.logger.error(f"Error loading config: {e}")
-
     def __check_mirrored_components(self) -> list:
         mirrored_objects = []
         components2 = self.functional_components[:]  # shallow copy
@@ -290,6 +284,8 @@ class LinearOptimizationSolver:
 
     def __constraint_overlap(self):
         component_list = self.component_ids[:]
+        top_overlap_pairs = {tuple(obj_pair.component_ids) for obj_pair in self.overlap_components["top"]}
+        side_overlap_pairs = {tuple(obj_pair.component_ids) for obj_pair in self.overlap_components["side"]}
         for c1 in self.component_ids:
             self.problem_space += pulp.lpSum([self.x[c1, xv] for xv in self.x_possible]) == 1
             self.problem_space += pulp.lpSum([self.y[c1, yv] for yv in self.y_possible]) == 1
@@ -315,8 +311,8 @@ class LinearOptimizationSolver:
                     z4 = pulp.LpVariable(f"z4_{c1}_{c2}", cat='Binary')
 
                     self.problem_space += z1 + z2 + z3 + z4 == 1, f"NonOverlap_{c1}_{c2}"
-                    if (any(obj_pair.component_ids == [c1, c2] for obj_pair in self.overlap_components["top"])
-                            and any(obj_pair.component_ids == [c1, c2] for obj_pair in self.overlap_components["side"])
+                    if ((c1, c2) in top_overlap_pairs
+                            and (c1, c2) in side_overlap_pairs
                             and self.overlap):
                         self.problem_space += (self.coordinates_x[c1] + self.width[c1] <= self.coordinates_x[c2]
                                                + self.GRID_SIZE * (1 - z1), f"LeftOf_{c1}_{c2}")
@@ -327,7 +323,7 @@ class LinearOptimizationSolver:
                         self.problem_space += (self.coordinates_y[c2] + self.height[c2] <= self.coordinates_y[c1]
                                                + self.GRID_SIZE * (1 - z4), f"Above_{c1}_{c2}")
 
-                    elif (any(obj_pair.component_ids == [c1, c2] for obj_pair in self.overlap_components["side"])
+                    elif ((c1, c2) in side_overlap_pairs
                           and self.overlap):
                         self.problem_space += (self.coordinates_x[c1] + self.width[c1] <= self.coordinates_x[c2]
                                                + self.GRID_SIZE * (1 - z1), f"LeftOf_{c1}_{c2}")
@@ -340,7 +336,7 @@ class LinearOptimizationSolver:
                                                <= self.coordinates_y[c1] + self.GRID_SIZE * (1 - z4),
                                                f"Above_{c1}_{c2}")
 
-                    elif (any(obj_pair.component_ids == [c1, c2] for obj_pair in self.overlap_components["top"])
+                    elif ((c1, c2) in top_overlap_pairs
                           and self.overlap):
                         self.problem_space += (self.coordinates_x[c1] + self.width[c1] + self.OFFSET_X
                                                <= self.coordinates_x[c2] + self.GRID_SIZE * (1 - z1),
@@ -384,7 +380,8 @@ class LinearOptimizationSolver:
 
         # Solving
         start_solving_time = time.time()
-        self.problem_space.solve(self.solver)
+        with timer("lp solve"):
+            self.problem_space.solve(self.solver)
         self.logger.info(f"Solving time: {round(time.time() - start_solving_time, 2)}s")
 
         # Save variables for found solution
@@ -428,11 +425,12 @@ class LinearOptimizationSolver:
     def solve_placement(self):
         self.logger.info("Starting Linear Optimization")
 
-        self.__constraint_overlap()
-        self.__constraint_minimize_manhattan_distance()
+        with timer("lp build"):
+            self.__constraint_overlap()
+            self.__constraint_minimize_manhattan_distance()
 
-        if self.MIRROR:
-            self.__constrain_mirror()
+            if self.MIRROR:
+                self.__constrain_mirror()
 
         if self.RUN:
             self.__solve_linear_optimization_problem()
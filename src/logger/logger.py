@@ -13,10 +13,24 @@
 # ==================================================================================================================== #
 
 
+# ==================================================== Notes ===========================================================
+"""
+    Logging is set up once per process. The log level override is read from the command line the first time a logger
+    is created, and every logger gets a single handler no matter how many times it is requested.
+
+    Records are passed through a queue to a listener thread, which formats them and writes them to the terminal, so
+    code logging in loops never waits on terminal output. The listener is stopped at exit, which writes all records
+    still in the queue. Logging directly to the terminal is done with --log-sync.
+"""
+
 # ================================================== Libraries =========================================================
+import queue
+import atexit
 import logging
 import logging.config
+import logging.handlers
 import argparse
+import threading
 # ============================================ Custom Color constants ==================================================
 WHITE = "\033[0m"
 GREY = "\033[38;2;128;128;128m"
@@ -37,81 +51,110 @@ CYAN = "\033[38;2;0;204;204m"
 DARK_CYAN = "\033[38;2;0;153;153m"
 # =================================================== Logging ==========================================================
 
+COLOR_TABLE = {
+    "__main__": RED,
+    "circuit.circuit_spice_parser": LIGHT_GREEN,
+    "magic.magic_component_parser": LIGHT_BLUE,
+    "json_converter.json_converter": ORANGE,
+    "magic.magic_layout_creator": LIGHT_YELLOW,
+    "linear_optimization.linear_optimization": VERY_LIGHT_BLUE,
+    "connections.connections": CYAN,
+    "astar.a_star_initiator": BLUE,
+    "grid.generate_grid": LIGHT_PURPLE,
+    "drc.drc_checker": DARK_CYAN,
+    "lvs.lvs_checker": DARK_GREEN,
+    "libraries.library_handling": LIGHT_ORANGE
+}
+
+log_setup = None
+log_setup_lock = threading.Lock()
+
+
+class LogSetup:
+    """Log level and handler shared by all loggers"""
+
+    def __init__(self):
+        # Get log-level options in command line, leaving other arguments to the program
+        parser = argparse.ArgumentParser(description="Set log level from command line", add_help=False)
+        parser.add_argument(
+            '--log-level',
+            choices=['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'],
+            help='Log-level override'
+        )
+        parser.add_argument('--log-sync', action='store_true', help='Write log records without a queue')
+        args, _ = parser.parse_known_args()
+
+        # Override if log level argument is provided
+        self.log_level = getattr(logging, args.log_level) if args.log_level else logging.DEBUG
+
+        console_handler = logging.StreamHandler()
+        console_handler.setLevel(logging.DEBUG)
+        console_handler.setFormatter(CustomFormatter())
+
+        if args.log_sync:
+            self.handler = console_handler
+            self.listener = None
+        else:
+            self.handler = logging.handlers.QueueHandler(queue.SimpleQueue())
+            self.listener = logging.handlers.QueueListener(self.handler.queue, console_handler)
+            self.listener.start()
+            atexit.register(self.listener.stop)
+
+
+def get_log_setup() -> LogSetup:
+    global log_setup
+
+    with log_setup_lock:
+        if log_setup is None:
+            log_setup = LogSetup()
+        return log_setup
+
 
 def get_a_logger(name):
     """Returns a custom dynamic logger with the given file name"""
-
-    color_table = {
-        "__main__": RED,
-        "circuit.circuit_spice_parser": LIGHT_GREEN,
-        "magic.magic_component_parser": LIGHT_BLUE,
-        "json_converter.json_converter": ORANGE,
-        "magic.magic_layout_creator": LIGHT_YELLOW,
-        "linear_optimization.linear_optimization": VERY_LIGHT_BLUE,
-        "connections.connections": CYAN,
-        "astar.a_star_initiator": BLUE,
-        "grid.generate_grid": LIGHT_PURPLE,
-        "drc.drc_checker": DARK_CYAN,
-        "lvs.lvs_checker": DARK_GREEN,
-        "libraries.library_handling": LIGHT_ORANGE
-    }
-
-    file_specific_color = color_table.get(name, WHITE)
+    setup = get_log_setup()
 
     # Create a logger and set default level
     logger = logging.getLogger(name)
-    logger.setLevel(logging.DEBUG)
-
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(logging.DEBUG)
-
-    # Create a custom formatter with the dynamic file color
-    formatter = CustomFormatter(file_color=file_specific_color)
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
-
-    # Get log-level options in command line
-    parser = argparse.ArgumentParser(description="Set log level from command line")
-    parser.add_argument(
-        '--log-level',
-        choices=['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'],
-        help='Log-level override'
-    )
-    args = parser.parse_args()
-
-    # Override if log level argument is provided
-    if args.log_level:
-        log_level = getattr(logging, args.log_level)
-        logger.setLevel(log_level)
+    logger.setLevel(setup.log_level)
+
+    if setup.handler not in logger.handlers:
+        logger.addHandler(setup.handler)
 
     return logger
 
 
 class CustomFormatter(logging.Formatter):
+    """Formats records with the color of the file they are logged from. Formatters are created once per level and
+    file"""
 
-    def __init__(self, file_color):
+    def __init__(self, color_table: dict | None = None):
         super().__init__()
-        self.file_color = file_color
+        self.color_table = COLOR_TABLE if color_table is None else color_table
+        self.formatters = {}
 
-        self.FORMATS = {
-            logging.DEBUG: f"{GREY}[%(asctime)s] {BLUE}[%(levelname)s] {self.file_color}[%(name)s]:{WHITE} %(message)s",
+    def get_formats(self, file_color: str) -> dict:
+        return {
+            logging.DEBUG: f"{GREY}[%(asctime)s] {BLUE}[%(levelname)s] {file_color}[%(name)s]:{WHITE} %(message)s",
 
-            logging.INFO: f"{GREY}[%(asctime)s] {GREEN}[%(levelname)s] {self.file_color}[%(name)s]:{WHITE} %(message)s",
+            logging.INFO: f"{GREY}[%(asctime)s] {GREEN}[%(levelname)s] {file_color}[%(name)s]:{WHITE} %(message)s",
 
             logging.WARNING: f"{GREY}[%(asctime)s] {YELLOW}[%(levelname)s] "
-                             f"{self.file_color}[%(name)s]:{WHITE} %(message)s",
+                             f"{file_color}[%(name)s]:{WHITE} %(message)s",
 
-            logging.ERROR: f"{GREY}[%(asctime)s] {RED}[%(levelname)s] {self.file_color}[%(name)s]:{WHITE} %(message)s",
+            logging.ERROR: f"{GREY}[%(asctime)s] {RED}[%(levelname)s] {file_color}[%(name)s]:{WHITE} %(message)s",
 
             logging.CRITICAL: f"{GREY}[%(asctime)s] {RED}[%(levelname)s] "
-                              f"{self.file_color}[%(name)s]:{WHITE} %(message)s"
+                              f"{file_color}[%(name)s]:{WHITE} %(message)s"
         }
 
     def format(self, log_record):
-        log_format = self.FORMATS.get(log_record.levelno, self.FORMATS[logging.DEBUG])
-
-        # Create a formatter using the selected format
-        formatter = logging.Formatter(log_format)
-        return formatter.format(log_record)
+        key = (log_record.levelno, log_record.name)
+        formatter = self.formatters.get(key)
 
+        if formatter is None:
+            formats = self.get_formats(file_color=self.color_table.get(log_record.name, WHITE))
+            formatter = logging.Formatter(formats.get(log_record.levelno, formats[logging.DEBUG]))
+            self.formatters[key] = formatter
 
+        return formatter.format(log_record)
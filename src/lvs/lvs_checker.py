@@ -12,33 +12,257 @@
 # If not, see <https://www.gnu.org/licenses/>.
 # ==================================================================================================================== #
 
+# ==================================================== Notes ===========================================================
+"""
+    Runs LVS from the work directory of the project and parses the netgen output into a report per cell.
+
+    Clean results are cached by a hash of the .mag and .sch files of the checked cells, including the cells and
+    symbols they use, and of the lvs_checker config table. LVS is skipped when nothing changed since the last clean
+    result. With per cell LVS, every cell having both a layout and a schematic in the top library is checked on its
+    own by a pool of make processes, so only changed cells are checked again. The cells to check can then also be
+    limited to a given list, which is used to check cells as soon as their layout is written.
+
+    All per cell jobs read the same CDL netlist in the work directory. It is generated once before the jobs start,
+    and only again when a schematic changed, holding a lock shared by all checkers of the process, so no job reads
+    the netlist while it is written.
+"""
 
 # ================================================== Libraries =========================================================
 import os
+import re
+import json
+import hashlib
+import threading
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from logger.logger import get_a_logger
+from config.config_loader import get_config
+from lvs.lvs_report import LVSReport, LVSCellResult, parse_netgen_output
 
 # ================================================= LVS checker ========================================================
 
+USE_PATTERN = re.compile(r"^use\s+(\S+)\s+\S+(?:\s+(\S+))?", re.MULTILINE)
+SYMBOL_PATTERN = re.compile(r"^C\s+\{([^}]+)\.sym\}", re.MULTILINE)
+
 
 class LVSchecking:
     logger = get_a_logger(__name__)
+    CACHE_VERSION = 1
+    ALL_CELLS_KEY = "lvsall"
+    cache_lock = threading.Lock()
+    cdl_lock = threading.Lock()
+    cdl_hash = None  # Hash of the schematics the CDL netlist was last generated from
 
-    def __init__(self, project_properties):
+    def __init__(self, project_properties, cells: list[str] | None = None):
         self.current_file_directory = os.path.dirname(os.path.abspath(__file__))
         self.project_directory = project_properties.directory
         self.project_top_lib_name = project_properties.top_lib_name
         self.project_cell_name = project_properties.top_cell_name
-        self.__run_lvs_checker()
+        self.only_cells = cells
+
+        self.config = get_config()
+        self.SKIP_UNCHANGED = self.config["lvs_checker"]["SKIP_UNCHANGED"]
+        self.PER_CELL_LVS = self.config["lvs_checker"]["PER_CELL_LVS"]
+        self.LVS_WORKERS = self.config["lvs_checker"]["LVS_WORKERS"]
+        self.LVS_COMMAND = self.config["lvs_checker"]["LVS_COMMAND"]
+        self.CDL_COMMAND = self.config["lvs_checker"]["CDL_COMMAND"]
+        self.CELL_LVS_COMMAND = self.config["lvs_checker"]["CELL_LVS_COMMAND"]
+        self.config_hash = self.config.config_hash("lvs_checker")
+
+        self.work_directory = os.path.expanduser(f"{self.project_directory}/work/")
+        self.design_root_directory = os.path.expanduser(f"{self.project_directory}/design")
+        self.design_directory = f"{self.design_root_directory}/{self.project_top_lib_name}"
+        self.cache_path = os.path.expanduser(f"{self.project_directory}/work/lvs/AAL_LVS_CACHE.json")
+        self.file_hashes = {}
+
+        self.report = self.__run_lvs_checker()
+
+    # ------------------------------------------------- Hashing -------------------------------------------------------
+
+    def __get_dependencies(self, path: str, content: str) -> list[str]:
+        """Returns the files a layout or schematic uses, being sub cell layouts or symbols with their schematics"""
+        dependencies = []
+        if path.endswith(".mag"):
+            for name, library in USE_PATTERN.findall(content):
+                dependencies.append(os.path.join(os.path.dirname(path), library, f"{name}.mag"))
+
+        elif path.endswith(".sch"):
+            for symbol in SYMBOL_PATTERN.findall(content):
+                for directory in (os.path.dirname(path), self.design_root_directory):
+                    dependencies.extend((os.path.join(directory, f"{symbol}.sym"),
+                                         os.path.join(directory, f"{symbol}.sch")))
+        return dependencies
+
+    def __get_file_hash(self, path: str) -> str:
+        """Hash of a file and all files it uses. Files that do not exist, like symbols of PDK devices, get a fixed
+        hash"""
+        path = os.path.normpath(path)
+        if path in self.file_hashes:
+            return self.file_hashes[path]
+
+        # Guard against cells using each other
+        self.file_hashes[path] = ""
+        try:
+            with open(path, "rb") as file:
+                content = file.read()
+        except OSError:
+            self.file_hashes[path] = "missing"
+            return self.file_hashes[path]
+
+        file_hash = hashlib.sha256(content)
+        for dependency in self.__get_dependencies(path=path, content=content.decode(errors="replace")):
+            file_hash.update(self.__get_file_hash(path=dependency).encode())
+
+        self.file_hashes[path] = file_hash.hexdigest()
+        return self.file_hashes[path]
+
+    def __get_cell_hash(self, cell: str, command: str) -> str:
+        cell_hash = hashlib.sha256(f"{command}{self.config_hash}".encode())
+        for extension in ("mag", "sch"):
+            cell_hash.update(self.__get_file_hash(path=f"{self.design_directory}/{cell}.{extension}").encode())
+        return cell_hash.hexdigest()
+
+    def __get_cells(self) -> list[str]:
+        """Returns all cells of the top library having both a layout and a schematic"""
+        try:
+            file_names = os.listdir(self.design_directory)
+        except OSError:
+            self.logger.error(f"The design directory '{self.design_directory}' was not found")
+            return []
+
+        return sorted(os.path.splitext(name)[0] for name in file_names if name.endswith(".mag")
+                      and os.path.isfile(f"{self.design_directory}/{os.path.splitext(name)[0]}.sch"))
+
+    # ------------------------------------------------- Caching -------------------------------------------------------
+
+    def __load_cache(self) -> dict:
+        try:
+            with open(self.cache_path, "r") as cache_file:
+                cache = json.load(cache_file)
+            if cache.get("version") == self.CACHE_VERSION:
+                return cache["entries"]
+        except (OSError, ValueError, KeyError, AttributeError):
+            pass
+        return {}
 
-    def __run_lvs_checker(self):
-        work_directory = os.path.expanduser(f"{self.project_directory}/work/")
+    def __update_cache(self, entries: dict, removed_keys: list):
+        """Updates the cache file, which is read again first since cells can be checked at the same time"""
+        with self.cache_lock:
+            cache = self.__load_cache()
+            for key in removed_keys:
+                cache.pop(key, None)
+            cache.update(entries)
+            self.__save_cache(cache=cache)
 
-        # Runs LVS command from work directory of project
+    def __save_cache(self, cache: dict):
         try:
-            output = subprocess.run(['make cdl lvsall'], stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
-                                    check=True, shell=True, cwd=work_directory)
-            self.logger.info(output.stdout)
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            temporary_path = f"{self.cache_path}.tmp"
+            with open(temporary_path, "w") as cache_file:
+                json.dump({"version": self.CACHE_VERSION, "entries": cache}, cache_file)
+            os.replace(temporary_path, self.cache_path)
+        except OSError as e:
+            self.logger.error(f"Could not save LVS cache '{self.cache_path}': {e}")
+
+    # -------------------------------------------------- LVS runs -----------------------------------------------------
+
+    def __run_command(self, command: str) -> LVSReport:
+        try:
+            output = subprocess.run([command], stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
+                                    check=True, shell=True, cwd=self.work_directory)
+            self.logger.debug(output.stdout)
+            return parse_netgen_output(text=output.stdout)
 
         except subprocess.CalledProcessError as e:
-            self.logger.error(f"'make cdl lvsall' command had problems: {e.stderr}")
+            self.logger.error(f"'{command}' command had problems: {e.stderr}")
+            report = parse_netgen_output(text=e.stdout or "")
+            report.command_failed = True
+            return report
+
+    def __generate_cdl(self, cells: list[str]) -> bool:
+        """Generates the CDL netlist read by the per cell LVS jobs, unless it was already generated from the same
+        schematics. Returns if the netlist is up to date"""
+        schematics_hash = hashlib.sha256(self.CDL_COMMAND.encode())
+        for cell in cells:
+            schematics_hash.update(self.__get_file_hash(path=f"{self.design_directory}/{cell}.sch").encode())
+
+        with self.cdl_lock:
+            if LVSchecking.cdl_hash == schematics_hash.hexdigest():
+                return True
+
+            if self.__run_command(command=self.CDL_COMMAND).command_failed:
+                return False
+
+            LVSchecking.cdl_hash = schematics_hash.hexdigest()
+            self.logger.info(f"CDL netlist for per cell LVS generated with '{self.CDL_COMMAND}'")
+            return True
+
+    def __run_cell_lvs(self, cell: str) -> LVSReport:
+        report = self.__run_command(command=self.CELL_LVS_COMMAND.format(cell=cell))
+        report.cells.setdefault(cell, LVSCellResult(cell=cell))
+        return report
+
+    def __run_lvs_checker(self) -> LVSReport:
+        cache = self.__load_cache() if self.SKIP_UNCHANGED else {}
+        report = LVSReport()
+
+        all_cells = cells = self.__get_cells()
+        if self.PER_CELL_LVS:
+            if self.only_cells is not None:
+                cells = [cell for cell in cells if cell in self.only_cells]
+            jobs = {cell: self.__get_cell_hash(cell=cell, command=self.CELL_LVS_COMMAND) for cell in cells}
+        else:
+            all_cells_hash = hashlib.sha256(self.LVS_COMMAND.encode())
+            for cell in cells:
+                all_cells_hash.update(self.__get_cell_hash(cell=cell, command=self.LVS_COMMAND).encode())
+            jobs = {self.ALL_CELLS_KEY: all_cells_hash.hexdigest()}
+
+        # Reuse clean results of unchanged cells
+        jobs_to_run = []
+        for key, job_hash in jobs.items():
+            cached = cache.get(key)
+            if cached and cached["hash"] == job_hash:
+                report.merge(LVSReport.from_dict(cached["report"]))
+            else:
+                jobs_to_run.append(key)
+
+        if self.PER_CELL_LVS and jobs_to_run and not self.__generate_cdl(cells=all_cells):
+            job_reports = [LVSReport(cells={cell: LVSCellResult(cell=cell)}, command_failed=True)
+                           for cell in jobs_to_run]
+        elif self.PER_CELL_LVS:
+            with ThreadPoolExecutor(max_workers=max(1, self.LVS_WORKERS)) as executor:
+                job_reports = list(executor.map(self.__run_cell_lvs, jobs_to_run))
+        else:
+            job_reports = [self.__run_command(command=self.LVS_COMMAND) for _ in jobs_to_run]
+
+        new_entries = {}
+        failed_keys = []
+        for key, job_report in zip(jobs_to_run, job_reports):
+            report.merge(job_report)
+            if job_report.clean:
+                new_entries[key] = {"hash": jobs[key], "report": job_report.to_dict()}
+            else:
+                failed_keys.append(key)
+
+        if self.SKIP_UNCHANGED:
+            self.__update_cache(entries=new_entries, removed_keys=failed_keys)
+
+        self.__log_report(report=report, total_jobs=len(jobs), cached_jobs=len(jobs) - len(jobs_to_run))
+        return report
+
+    def __log_report(self, report: LVSReport, total_jobs: int, cached_jobs: int):
+        for result in report.cells.values():
+            if result.matched:
+                self.logger.info(result.summary())
+            else:
+                self.logger.warning(result.summary())
+
+        if not report.cells:
+            self.logger.warning("No netgen results found in the LVS output")
+
+        matched = sum(bool(result.matched) for result in report.cells.values())
+        self.logger.info(f"LVS done. | Jobs: {total_jobs} | Skipped unchanged: {cached_jobs} | "
+                         f"Cells: {len(report.cells)} | Matched: {matched} | Clean: {report.clean}")
+
+    def get(self) -> LVSReport:
+        return self.report
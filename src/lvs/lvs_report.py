@@ -0,0 +1,134 @@
+# ==================================================================================================================== #
+# Copyright (C) 2025 Bjørn K.T. Solheim, Leidulv Tønnesland
+# ==================================================================================================================== #
+# This program is free software: you can redistribute it and/or modify it under the terms of
+# the GNU General Public License as published by the Free Software Foundation, version 2.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <https://www.gnu.org/licenses/>.
+# ==================================================================================================================== #
+
+# ==================================================== Notes ===========================================================
+"""
+    Parsing of netgen LVS output into a report per cell. Netgen prints a side by side summary for every compared
+    cell, with the layout as circuit 1 and the schematic as circuit 2:
+
+        Circuit 1: CELL                            |Circuit 2: CELL
+        Number of devices: 10                      |Number of devices: 10
+        Number of nets: 8                          |Number of nets: 9 **Mismatch**
+        Net: VDD                                   |(no matching net)
+        Netlists do not match.
+
+    Lines that are not recognized are ignored, so the output of make around the netgen runs can be parsed as is.
+"""
+
+# ================================================== Libraries =========================================================
+import re
+from dataclasses import dataclass, field, asdict
+
+# ================================================== LVS report ========================================================
+
+CIRCUIT_PATTERN = re.compile(r"^\s*Circuit 1:\s*(\S+)\s*\|\s*Circuit 2:\s*(\S+)")
+COUNT_PATTERN = re.compile(r"^\s*Number of (devices|nets):\s*(\d+)[^|]*\|\s*Number of \1:\s*(\d+)")
+UNMATCHED_LAYOUT_PATTERN = re.compile(r"^\s*(Net|Instance):\s*(\S+)\s*\|\s*\(no matching (?:net|instance)\)")
+UNMATCHED_SCHEMATIC_PATTERN = re.compile(r"^\s*\(no matching (?:net|instance)\)\s*\|\s*(Net|Instance):\s*(\S+)")
+MATCH_PATTERN = re.compile(r"(Netlists|Circuits) match")
+MISMATCH_PATTERN = re.compile(r"Netlists do not match|failed pin matching|\*\*\* MISMATCH \*\*\*")
+
+
+@dataclass
+class LVSCellResult:
+    cell: str
+    matched: bool | None = None
+    layout_devices: int | None = None
+    schematic_devices: int | None = None
+    layout_nets: int | None = None
+    schematic_nets: int | None = None
+    unmatched_layout_nets: list = field(default_factory=list)
+    unmatched_schematic_nets: list = field(default_factory=list)
+    unmatched_layout_instances: list = field(default_factory=list)
+    unmatched_schematic_instances: list = field(default_factory=list)
+
+    def summary(self) -> str:
+        result = {True: "match", False: "MISMATCH", None: "no result"}[self.matched]
+        text = (f"LVS '{self.cell}': {result} | Devices: {self.layout_devices}/{self.schematic_devices} | "
+                f"Nets: {self.layout_nets}/{self.schematic_nets}")
+        if self.unmatched_layout_nets or self.unmatched_schematic_nets:
+            text += (f" | Unmatched nets layout: {self.unmatched_layout_nets} "
+                     f"schematic: {self.unmatched_schematic_nets}")
+        if self.unmatched_layout_instances or self.unmatched_schematic_instances:
+            text += (f" | Unmatched instances layout: {self.unmatched_layout_instances} "
+                     f"schematic: {self.unmatched_schematic_instances}")
+        return text
+
+
+@dataclass
+class LVSReport:
+    cells: dict = field(default_factory=dict)  # cell name -> LVSCellResult
+    command_failed: bool = False
+
+    @property
+    def clean(self) -> bool:
+        return (not self.command_failed and bool(self.cells)
+                and all(result.matched for result in self.cells.values()))
+
+    def merge(self, other):
+        self.cells.update(other.cells)
+        self.command_failed |= other.command_failed
+
+    def to_dict(self) -> dict:
+        return {"cells": {cell: asdict(result) for cell, result in self.cells.items()},
+                "command_failed": self.command_failed}
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        return cls(cells={cell: LVSCellResult(**result) for cell, result in data["cells"].items()},
+                   command_failed=data["command_failed"])
+
+
+def parse_netgen_output(text: str) -> LVSReport:
+    """Parses netgen LVS output into results per compared cell"""
+    report = LVSReport()
+    current = None
+
+    for line in text.splitlines():
+        circuit = CIRCUIT_PATTERN.match(line)
+        if circuit:
+            cell = circuit.group(1)
+            current = report.cells.setdefault(cell, LVSCellResult(cell=cell))
+            continue
+
+        if current is None:
+            continue
+
+        count = COUNT_PATTERN.match(line)
+        if count:
+            kind, layout_count, schematic_count = count.groups()
+            setattr(current, f"layout_{kind}", int(layout_count))
+            setattr(current, f"schematic_{kind}", int(schematic_count))
+            continue
+
+        unmatched = UNMATCHED_LAYOUT_PATTERN.match(line)
+        if unmatched:
+            kind, name = unmatched.groups()
+            getattr(current, "unmatched_layout_nets" if kind == "Net" else "unmatched_layout_instances").append(name)
+            continue
+
+        unmatched = UNMATCHED_SCHEMATIC_PATTERN.match(line)
+        if unmatched:
+            kind, name = unmatched.groups()
+            getattr(current, "unmatched_schematic_nets" if kind == "Net"
+                    else "unmatched_schematic_instances").append(name)
+            continue
+
+        # A mismatch found anywhere in the comparison of a cell decides the result
+        if MISMATCH_PATTERN.search(line):
+            current.matched = False
+        elif MATCH_PATTERN.search(line) and current.matched is None:
+            current.matched = True
+
+    return report
@@ -15,14 +15,36 @@
 # ================================================== Libraries =========================================================
 import os
 import re
-from circuit.circuit_components import LayoutPort, RectArea, Transistor, Capacitor, Resistor, DigitalBlock
+import copy
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+from circuit.circuit_components import (LayoutPort, RectArea, Transistor, Capacitor, Resistor, DigitalBlock,
+                                        OverlapDistance)
 from logger.logger import get_a_logger
-from dataclasses import fields
+from config.config_loader import get_config
+from dataclasses import dataclass, field, fields
+from typing import List, Dict
 import math
 import libraries.atr_lib as atr
 import libraries.tr_lib as tr
 import libraries.aal_misc_lib as aal_misc
 
+# ================================================== Parsed cell =======================================================
+
+# Increase when the layout of the cached classes changes, which makes older caches unusable
+PARSED_CELL_CACHE_VERSION = 1
+
+
+@dataclass
+class ParsedCell:
+    """Layout information of a library cell shared by every component instance using it"""
+    dependencies: Dict[str, int] = field(default_factory=dict)  # Layout file path -> modification time in ns
+    scale_factor: int = field(default_factory=int)
+    layout_ports: List[LayoutPort] = field(default_factory=list)
+    bounding_box: RectArea = field(default_factory=RectArea)
+    overlap_distance: OverlapDistance = field(default_factory=OverlapDistance)
+    group_endpoint_bounding_box: RectArea = field(default_factory=RectArea)
+
 # ============================================= Magic component parser =================================================
 
 
@@ -35,59 +57,226 @@ class MagicComponentsParser:
         self.current_component_library_path = None
         self.components = components
 
-        # Component specific (gets reset for every component)
+        # Load config
+        self.config = get_config()
+        self.USE_PARSED_CELL_CACHE = self.config["magic_component_parser"]["USE_PARSED_CELL_CACHE"]
+        self.READ_WORKERS = self.config["magic_component_parser"]["READ_WORKERS"]
+
+        # Parsed library cells keyed by layout file path
+        self.parsed_cell_cache_file = os.path.expanduser(f"{self.project_directory}/work/magic/"
+                                                         f"AAL_PARSED_CELL_CACHE.pkl")
+        self.parsed_cells = {}
+        self.current_dependencies = {}
+        self.preloaded_layout_files = {}
+
+        # Component specific (gets reset for every parsed layout file)
         self.found_transistor_well_line_label = False
         self.found_bounding_box = False
         self.transistor_well_size = RectArea()
-        self.scale_factor = 0
+        self.scale_factor = 1
 
     def get(self):
         return self.__read_magic_files()
 
+    def __load_parsed_cell_cache(self):
+        try:
+            with open(self.parsed_cell_cache_file, "rb") as f:
+                cache_version, parsed_cells = pickle.load(f)
+
+            if cache_version != PARSED_CELL_CACHE_VERSION:
+                self.logger.info(f"Parsed cell cache '{self.parsed_cell_cache_file}' is outdated and will be rebuilt")
+                return
+
+            self.parsed_cells = parsed_cells
+            self.logger.info(f"Parsed cell cache '{self.parsed_cell_cache_file}' loaded with "
+                             f"{len(self.parsed_cells)} cells")
+
+        except FileNotFoundError:
+            self.logger.info(f"No parsed cell cache found at '{self.parsed_cell_cache_file}'")
+
+        except (pickle.UnpicklingError, EOFError, AttributeError, TypeError, ValueError) as e:
+            self.logger.warning(f"Parsed cell cache '{self.parsed_cell_cache_file}' could not be used: {e}")
+            self.parsed_cells = {}
+
+    def __save_parsed_cell_cache(self):
+        try:
+            os.makedirs(os.path.dirname(self.parsed_cell_cache_file), exist_ok=True)
+            with open(self.parsed_cell_cache_file, "wb") as f:
+                pickle.dump((PARSED_CELL_CACHE_VERSION, self.parsed_cells), f)
+            self.logger.info(f"Parsed cell cache saved to '{self.parsed_cell_cache_file}'")
+
+        except OSError as e:
+            self.logger.warning(f"Parsed cell cache could not be saved: {e}")
+
+    @staticmethod
+    def __get_modification_time(file_path: str):
+        try:
+            return os.stat(file_path).st_mtime_ns
+        except OSError:
+            return None
+
+    def __is_parsed_cell_valid(self, parsed_cell: ParsedCell) -> bool:
+        """A parsed cell stays valid as long as none of the layout files it was created from have changed"""
+        return all(self.__get_modification_time(file_path) == modification_time
+                   for file_path, modification_time in parsed_cell.dependencies.items())
+
+    def read_layout_file(self, layout_file_path: str):
+        """Returns all lines of a layout file and registers it as a dependency of the cell currently being parsed"""
+        self.current_dependencies[layout_file_path] = self.__get_modification_time(layout_file_path)
+
+        if layout_file_path in self.preloaded_layout_files:
+            return self.preloaded_layout_files.pop(layout_file_path)
+
+        try:
+            with open(layout_file_path, "r") as magic_file:
+                return magic_file.readlines()
+
+        except FileNotFoundError:
+            self.logger.error(f"The file {layout_file_path} was not found.")
+
+    @staticmethod
+    def __read_lines(layout_file_path: str):
+        try:
+            with open(layout_file_path, "r") as magic_file:
+                return layout_file_path, magic_file.readlines()
+        except FileNotFoundError:
+            return layout_file_path, None
+
+    def __get_layout_file_path(self, component) -> str:
+        # Find library of current component
+        self.current_component_library_path = next(
+            (lib.path for lib in self.component_libraries if component.layout_library in lib.path), None)
+
+        return os.path.expanduser(f"{self.current_component_library_path}/{component.layout_name}.mag")
+
+    def __preload_layout_files(self):
+        """Reads all layout files that need to be parsed concurrently, since the libraries often are located on
+        network storage. Parsing itself still happens in component order"""
+        layout_file_paths = []
+
+        for component in self.components:
+            if isinstance(component, (Transistor, Capacitor, Resistor, DigitalBlock)):
+                layout_file_path = self.__get_layout_file_path(component=component)
+                parsed_cell = self.parsed_cells.get(layout_file_path)
+
+                if parsed_cell is not None and self.__is_parsed_cell_valid(parsed_cell=parsed_cell):
+                    continue
+
+                layout_file_paths.append(layout_file_path)
+
+                # ATR transistors also need their endpoint layout file
+                if re.search(r'_ATR_', component.layout_library):
+                    transistor_endpoint_layout_name = re.sub(r".{3}$", "TAPTOP", component.layout_name)
+                    layout_file_paths.append(os.path.expanduser(f"{self.current_component_library_path}/"
+                                                                f"{transistor_endpoint_layout_name}.mag"))
+
+        layout_file_paths = list(dict.fromkeys(layout_file_paths))
+
+        if len(layout_file_paths) < 2 or self.READ_WORKERS < 2:
+            return
+
+        with ThreadPoolExecutor(max_workers=self.READ_WORKERS) as executor:
+            for layout_file_path, magic_file_lines in executor.map(self.__read_lines, layout_file_paths):
+                if magic_file_lines is not None:
+                    self.preloaded_layout_files[layout_file_path] = magic_file_lines
+
+        self.logger.info(f"Read {len(self.preloaded_layout_files)} layout files using {self.READ_WORKERS} workers")
+
     def __read_magic_files(self):
         updated_components = 0
+        parsed_layout_files = 0
+        reused_layout_files = 0
+
+        if self.USE_PARSED_CELL_CACHE:
+            self.__load_parsed_cell_cache()
+
+        self.__preload_layout_files()
 
         # Iterate over all components
         for component in self.components:
 
             if isinstance(component, (Transistor, Capacitor, Resistor, DigitalBlock)):
                 updated_components += 1
+                layout_file_path = self.__get_layout_file_path(component=component)
 
-                # Find library of current component
-                self.current_component_library_path = next(
-                    (lib.path for lib in self.component_libraries if component.layout_library in lib.path), None)
-
-                layout_file_path = os.path.expanduser(f"{self.current_component_library_path}/"
-                                                      f"{component.layout_name}.mag")
+                # Only parse a layout file if it has not been parsed before or has changed since
+                parsed_cell = self.parsed_cells.get(layout_file_path)
 
-                # General component handling
-                try:
-                    with open(layout_file_path, "r") as magic_file:
-                        for text_line in magic_file:
-                            self.__get_scale_factor(text_line=text_line)
-                            self.__get_component_port_info(text_line=text_line, component=component)
-                except FileNotFoundError:
-                    self.logger.error(f"The file {layout_file_path} was not found.")
+                if parsed_cell is None or not self.__is_parsed_cell_valid(parsed_cell=parsed_cell):
+                    parsed_cell = self.__parse_layout_file(layout_file_path=layout_file_path, component=component)
+                    self.parsed_cells[layout_file_path] = parsed_cell
+                    parsed_layout_files += 1
+                else:
+                    reused_layout_files += 1
 
-                # ATR LIB component handling
-                if re.search(r'_ATR_', component.layout_library):
-                    atr.magic_component_parsing_for_atr_lib(self=self, layout_file_path=layout_file_path,
-                                                            component=component)
-                # TR LIB component handling
-                if re.search(r'_TR_', component.layout_library):
-                    tr.magic_component_parsing_for_tr_lib(self=self, layout_file_path=layout_file_path,
-                                                          component=component)
-                # AAL MISC LIB component handling
-                if re.search(r'AAL_MISC', component.layout_library):
-                    aal_misc.magic_component_parsing_for_aal_misc_lib(self=self, layout_file_path=layout_file_path,
-                                                                      component=component)
+                self.__apply_parsed_cell(parsed_cell=parsed_cell, component=component)
                 self.__check_component_is_valid(component=component)
 
+        if self.USE_PARSED_CELL_CACHE and parsed_layout_files:
+            self.__save_parsed_cell_cache()
+
+        self.preloaded_layout_files.clear()
+
         # Process complete
-        self.logger.info(f"Process complete! Functional components updated: {updated_components}")
+        self.logger.info(f"Process complete! Functional components updated: {updated_components} | "
+                         f"Layout files parsed: {parsed_layout_files} | Parsed cells reused: {reused_layout_files}")
 
         return self.components
 
+    def __parse_layout_file(self, layout_file_path: str, component) -> ParsedCell:
+        """Parses a layout file into a template component, which then becomes a parsed cell"""
+
+        template_component = copy.deepcopy(component)
+        self.current_dependencies = {}
+        self.found_transistor_well_line_label = False
+        self.found_bounding_box = False
+        self.transistor_well_size = RectArea()
+        self.scale_factor = 1
+
+        magic_file_lines = self.read_layout_file(layout_file_path=layout_file_path)
+
+        if magic_file_lines is not None:
+
+            # General component handling
+            for text_line in magic_file_lines:
+                self.__get_scale_factor(text_line=text_line)
+                self.__get_component_port_info(text_line=text_line, component=template_component)
+
+            # ATR LIB component handling
+            if re.search(r'_ATR_', component.layout_library):
+                atr.magic_component_parsing_for_atr_lib(self=self, magic_file_lines=magic_file_lines,
+                                                        component=template_component)
+            # TR LIB component handling
+            if re.search(r'_TR_', component.layout_library):
+                tr.magic_component_parsing_for_tr_lib(self=self, magic_file_lines=magic_file_lines,
+                                                      component=template_component)
+            # AAL MISC LIB component handling
+            if re.search(r'AAL_MISC', component.layout_library):
+                aal_misc.magic_component_parsing_for_aal_misc_lib(self=self, magic_file_lines=magic_file_lines,
+                                                                  component=template_component)
+
+        parsed_cell = ParsedCell(dependencies=self.current_dependencies,
+                                 scale_factor=self.scale_factor,
+                                 layout_ports=template_component.layout_ports,
+                                 bounding_box=template_component.bounding_box)
+
+        if isinstance(template_component, (Transistor, DigitalBlock)):
+            parsed_cell.overlap_distance = template_component.overlap_distance
+            parsed_cell.group_endpoint_bounding_box = template_component.group_endpoint_bounding_box
+
+        return parsed_cell
+
+    @staticmethod
+    def __apply_parsed_cell(parsed_cell: ParsedCell, component):
+        """Every component gets its own copy, since later stages modify ports and bounding boxes in place"""
+
+        component.layout_ports.extend(copy.deepcopy(parsed_cell.layout_ports))
+        component.bounding_box = copy.deepcopy(parsed_cell.bounding_box)
+
+        if isinstance(component, (Transistor, DigitalBlock)):
+            component.overlap_distance = copy.deepcopy(parsed_cell.overlap_distance)
+            component.group_endpoint_bounding_box = copy.deepcopy(parsed_cell.group_endpoint_bounding_box)
+
     def __get_scale_factor(self, text_line: str):
         if re.search(r'magscale', text_line):
             text_line_words = text_line.split()
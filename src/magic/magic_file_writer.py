@@ -0,0 +1,159 @@
+# ==================================================================================================================== #
+# Copyright (C) 2025 Bjørn K.T. Solheim, Leidulv Tønnesland
+# ==================================================================================================================== #
+# This program is free software: you can redistribute it and/or modify it under the terms of
+# the GNU General Public License as published by the Free Software Foundation, version 2.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <https://www.gnu.org/licenses/>.
+# ==================================================================================================================== #
+
+# ==================================================== Notes ===========================================================
+"""
+    Streaming writer of magic files. Lines are written through a buffered file as they are produced instead of being
+    collected and joined at the end. The writer has the append and extend methods of a list, so library hooks
+    extending the magic file lines keep working when given a writer.
+
+    Paint rectangles are written right away, unless a rectangle merger is given. They are then kept per layer as
+    coordinate tuples until flush_rectangles is called, and written as one section per layer. Rectangles the merger
+    does not handle are written after the merged sections in the order they were added.
+
+    Lines go to a temporary file next to the magic file, which replaces the magic file when the writer is closed.
+    A run that stops part way never leaves a partly written cell. When skipping unchanged files, an existing magic
+    file is kept if its content hash equals the hash of the new content. The timestamp of the cell itself is left out
+    of the hash, since it is the only line that differs between runs creating the same layout.
+"""
+
+# ================================================== Libraries =========================================================
+import os
+import hashlib
+import threading
+from circuit.circuit_components import RectArea
+
+# ============================================== Magic file writer =====================================================
+
+
+class MagicFileHash:
+    """Hash of the lines of a magic file, not including the first timestamp line"""
+
+    def __init__(self):
+        self.hash = hashlib.sha256()
+        self.timestamp_skipped = False
+
+    def update(self, line: str):
+        if not self.timestamp_skipped and line.startswith("timestamp "):
+            self.timestamp_skipped = True
+            return
+        self.hash.update(line.encode())
+        self.hash.update(b"\n")
+
+    def hexdigest(self) -> str:
+        return self.hash.hexdigest()
+
+    @classmethod
+    def of_file(cls, path: str) -> str | None:
+        try:
+            with open(path, "r") as file:
+                file_hash = cls()
+                for line in file.read().split("\n"):
+                    file_hash.update(line)
+                return file_hash.hexdigest()
+        except (OSError, UnicodeDecodeError):
+            return None
+
+
+class MagicFileWriter:
+    BUFFER_SIZE = 1 << 20
+
+    def __init__(self, path: str | None, rectangle_merger=None, skip_unchanged: bool = False):
+        self.path = path
+        self.skip_unchanged = skip_unchanged
+        self.content_hash = MagicFileHash()
+        self.changed = path is not None
+
+        # Without a path the content is created, but not written anywhere
+        self.temporary_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp" if path is not None else None
+        self.file = open(self.temporary_path or os.devnull, "w", buffering=self.BUFFER_SIZE)
+        self.rectangle_merger = rectangle_merger
+        self.deferred_rectangles = {}
+        self.deferred_lines = []
+        self.line_count = 0
+        self.unmerged_line_count = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
+
+    def __len__(self):
+        return self.line_count
+
+    def append(self, line: str):
+        # Lines are separated, not terminated, by newlines
+        self.file.write(f"\n{line}" if self.line_count else line)
+        self.content_hash.update(line)
+        self.line_count += 1
+        self.unmerged_line_count += 1
+
+    def extend(self, lines):
+        for line in lines:
+            self.append(line)
+
+    def add_rect(self, layer: str, area: RectArea):
+        rect_lines = [f"<< {layer} >>", f"rect {area.x1} {area.y1} {area.x2} {area.y2}"]
+
+        if self.rectangle_merger is None:
+            self.extend(rect_lines)
+            return
+
+        # Only valid integer rectangles of layers handled by the merger are merged, the rest is written after them
+        rectangle = (area.x1, area.y1, area.x2, area.y2)
+        if (self.rectangle_merger.handles(layer) and all(isinstance(value, int) for value in rectangle)
+                and rectangle[0] < rectangle[2] and rectangle[1] < rectangle[3]):
+            self.deferred_rectangles.setdefault(layer, []).append(rectangle)
+        else:
+            self.deferred_lines.extend(rect_lines)
+        self.unmerged_line_count += 2
+
+    def flush_rectangles(self):
+        """Writes all deferred rectangles with one section per layer"""
+        for layer, rectangles in self.deferred_rectangles.items():
+            rectangles = self.rectangle_merger.merge_layer(layer=layer, rectangles=rectangles)
+
+            self.append(f"<< {layer} >>")
+            self.extend(f"rect {x1} {y1} {x2} {y2}" for x1, y1, x2, y2 in rectangles)
+            self.unmerged_line_count -= len(rectangles) + 1
+
+        self.extend(self.deferred_lines)
+        self.unmerged_line_count -= len(self.deferred_lines)
+
+        self.deferred_rectangles = {}
+        self.deferred_lines = []
+
+    def close(self):
+        """Writes remaining rectangles and replaces the magic file in one step"""
+        self.flush_rectangles()
+        self.file.close()
+
+        if self.path is None:
+            return
+
+        if self.skip_unchanged and MagicFileHash.of_file(self.path) == self.content_hash.hexdigest():
+            self.changed = False
+            os.remove(self.temporary_path)
+        else:
+            os.replace(self.temporary_path, self.path)
+
+    def discard(self):
+        """Removes the partly written file and leaves the existing magic file untouched"""
+        self.file.close()
+        if self.temporary_path is not None and os.path.exists(self.temporary_path):
+            os.remove(self.temporary_path)
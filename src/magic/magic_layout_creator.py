@@ -15,79 +15,171 @@
 # ================================================== Libraries =========================================================
 import os
 import time
+import multiprocessing
+from dataclasses import dataclass, field, replace
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from circuit.circuit_components import (RectArea, Transistor, Capacitor, Resistor, Pin, CircuitCell, TraceNet,
                                         RectAreaLayer)
 from logger.logger import get_a_logger
+from config.config_loader import get_config, config_overrides, thaw
+from instrumentation.instrumentation import timer
 from collections import deque
-import tomllib
 import re
 import libraries.atr_lib as atr
 import copy
+from magic.magic_rectangle_merger import MagicRectangleMerger
+from magic.magic_port_index import LayoutPortIndex
+from magic.magic_file_writer import MagicFileWriter
 
 # ============================================== Magic layout creator ==================================================
 
 
+class CellTimestamps:
+    """Timestamps of library cells taken from the timestamp line of their .mag files, so that 'use' entries are the
+    same between runs and match what Magic expects. Falls back to the modification time of the file"""
+    logger = get_a_logger(__name__)
+
+    def __init__(self):
+        self.timestamps = {}
+
+    def get(self, layout_file_path: str) -> int:
+        if layout_file_path not in self.timestamps:
+            self.timestamps[layout_file_path] = self.__read_timestamp(layout_file_path=layout_file_path)
+        return self.timestamps[layout_file_path]
+
+    def __read_timestamp(self, layout_file_path: str) -> int:
+        try:
+            with open(layout_file_path, "r") as file:
+                for line in file:
+                    if line.startswith("timestamp "):
+                        return int(line.split()[1])
+                    if line.startswith("<<"):
+                        break
+            return int(os.path.getmtime(layout_file_path))
+
+        except (OSError, ValueError, IndexError) as e:
+            self.logger.warning(f"Could not get timestamp of '{layout_file_path}': {e}")
+            return 0
+
+
+@dataclass
+class MagicFile:
+    """State of a magic file being created. Given as self to library hooks adding lines to the file"""
+    name: str
+    magic_file_lines: MagicFileWriter | list = field(default_factory=list)
+    cell_timestamps: CellTimestamps = field(default_factory=CellTimestamps)
+    current_component_library_path: str | None = None
+    path: str | None = None
+    changed: bool = False
+    trace_net_vias: list = field(default_factory=list)  # Vias of every trace net, only set by worker processes
+    total_functional_components_added: int = 0
+    total_connection_points_added: int = 0
+    total_trace_nets_added: int = 0
+    total_vias_added: int = 0
+    total_circuit_cells_added: int = 0
+
+    def get_cell_timestamp(self, layout_name: str) -> int:
+        """Returns the timestamp of a cell in the current component library"""
+        return self.cell_timestamps.get(
+            os.path.expanduser(f"{self.current_component_library_path}/{layout_name}.mag"))
+
+
 class MagicLayoutCreator:
     logger = get_a_logger(__name__)
 
-    def __init__(self, project_properties, components):
+    def __init__(self, project_properties, components, on_cell_written=None):
+        self.__set_up(project_properties=project_properties, components=components, on_cell_written=on_cell_written)
+        self.__generate_magic_files()
+
+    @classmethod
+    def create_magic_file_in_worker(cls, project_properties, file_name: str, components: list,
+                                    config: dict) -> MagicFile:
+        """Creates the magic file of one cell in a worker process, using the config of the parent process. The trace
+        nets of the worker are copies, so the vias added to them are returned with the file"""
+        with config_overrides(config):
+            creator = cls.__new__(cls)
+            creator.__set_up(project_properties=project_properties, components=components, on_cell_written=None)
+            magic_file = creator.__magic_file_creator(components=components, file_name=file_name)
+
+        trace_net_vias = [component.vias for component in components if isinstance(component, TraceNet)]
+        return replace(magic_file, magic_file_lines=[], trace_net_vias=trace_net_vias)
+
+    def __set_up(self, project_properties, components, on_cell_written):
         self.project_properties = project_properties
+        self.on_cell_written = on_cell_written
         self.project_top_cell_name = project_properties.top_cell_name
         self.project_top_lib_name = project_properties.top_lib_name
         self.project_directory = project_properties.directory
         self.component_libraries = project_properties.component_libraries
-        self.current_component_library_path = None
         self.components = components
-        self.magic_file_lines = []
         self.total_functional_components_added = 0
         self.total_connection_points_added = 0
         self.total_trace_nets_added = 0
         self.total_vias_added = 0
         self.total_circuit_cells_added = 0
 
-        self.config = self.__load_config()
+        self.config = get_config()
         self.TECHNOLOGY = self.config["magic_layout_creator"]["TECHNOLOGY"]
         self.VIA_PADDING = self.config["magic_layout_creator"]["VIA_PADDING"]
         self.METAL_LAYERS = self.config["magic_layout_creator"]["METAL_LAYERS"]
         self.VIA_MAP = self.config["magic_layout_creator"]["VIA_MAP"]
+        self.MERGE_LAYER_RECTANGLES = self.config["magic_layout_creator"]["MERGE_LAYER_RECTANGLES"]
+        self.WRITE_WORKERS = self.config["magic_layout_creator"]["WRITE_WORKERS"]
+        self.SKIP_UNCHANGED_FILES = self.config["magic_layout_creator"]["SKIP_UNCHANGED_FILES"]
         self.TRACE_WIDTH = self.config["generate_grid"]["TRACE_WIDTH"]
 
-        self.__generate_magic_files()
+        self.via_map = self.__build_via_map()
+        self.via_stacks = self.__build_via_stack_table()
+        self.cell_timestamps = CellTimestamps()
+        self.rectangle_merger = MagicRectangleMerger(merge_layers=self.METAL_LAYERS,
+                                                     deduplicate_layers=list(self.VIA_MAP.values()))
 
-    def __load_config(self, path="pyproject.toml"):
-        try:
-            with open(path, "rb") as f:
-                return tomllib.load(f)
-        except (FileNotFoundError, tomllib.TOMLDecodeError) as e:
-            self.logger.error(f"Error loading config: {e}")
+    def __build_via_map(self) -> dict:
+        via_map = {}
+        for key, value in self.VIA_MAP.items():
+            key_tuple = tuple(key.split("-"))
+
+            # Add both the original and swapped key-value pairs to the map since traversal can go both directions
+            via_map[key_tuple] = value
+            via_map[key_tuple[::-1]] = value
+
+        return via_map
+
+    def __build_via_stack_table(self) -> dict:
+        """Returns the metal layers and via layers between every pair of different metal layers of the technology"""
+        via_stacks = {}
 
-    def __place_rect_in_layer(self, layer: str, area: RectArea):
+        for start_layer in self.METAL_LAYERS:
+            for end_layer in self.METAL_LAYERS:
+                if start_layer != end_layer:
+                    via_stacks[(start_layer, end_layer)] = (
+                        self.__get_inbetween_metal_layers(start_layer=start_layer, end_layer=end_layer,
+                                                          metal_layer_list=self.METAL_LAYERS),
+                        self.__get_inbetween_via_layers(start_layer=start_layer, end_layer=end_layer,
+                                                        via_map=self.via_map))
+        return via_stacks
+
+    def __place_rect_in_layer(self, magic_file: MagicFile, layer: str, area: RectArea):
         """Adds a rectangle in a specified layer to the list of magic file lines"""
 
-        self.magic_file_lines.extend([
-            f"<< {layer} >>",
-            f"rect {area.x1} {area.y1} {area.x2} {area.y2}"
-        ])
+        magic_file.magic_file_lines.add_rect(layer=layer, area=area)
 
-    def __via_placer(self, start_layer: str, end_layer: str, area: RectArea, trace_net: TraceNet):
+    def __via_placer(self, magic_file: MagicFile, start_layer: str, end_layer: str, area: RectArea,
+                     trace_net: TraceNet):
         """Adds via(s) and potentially necessary metal layers between a top layer and a bottom layer"""
 
         if start_layer == end_layer:
             self.logger.error(f"Can't place via between {start_layer} and {end_layer}")
             return
 
-        # Build the complete via map
-        via_map = {}
-        for key, value in self.VIA_MAP.items():
-            key_tuple = tuple(key.split("-"))
-
-            # Add both the original and swapped key-value pairs to the map since traversal can go both directions
-            via_map[key_tuple] = value
-            via_map[key_tuple[::-1]] = value
-
-        metal_layers = self.__get_inbetween_metal_layers(start_layer=start_layer, end_layer=end_layer,
-                                                         metal_layer_list=self.METAL_LAYERS)
-        via_layers = self.__get_inbetween_via_layers(start_layer=start_layer, end_layer=end_layer, via_map=via_map)
+        # Get metal and via layers from the via stack table, or search for them if the layers are not routing layers
+        if (start_layer, end_layer) in self.via_stacks:
+            metal_layers, via_layers = self.via_stacks[(start_layer, end_layer)]
+        else:
+            metal_layers = self.__get_inbetween_metal_layers(start_layer=start_layer, end_layer=end_layer,
+                                                             metal_layer_list=self.METAL_LAYERS)
+            via_layers = self.__get_inbetween_via_layers(start_layer=start_layer, end_layer=end_layer,
+                                                         via_map=self.via_map)
 
         # Metal area is increased with an offset to compensate for the via if via is present
         metal_area = RectArea(x1=area.x1, y1=area.y1, x2=area.x2, y2=area.y2)
@@ -101,14 +193,14 @@ class MagicLayoutCreator:
         # Place all required metal(s)
         if metal_layers is not None:
             for metal_layer in metal_layers:
-                self.__place_rect_in_layer(layer=metal_layer, area=metal_area)
+                self.__place_rect_in_layer(magic_file=magic_file, layer=metal_layer, area=metal_area)
 
         # Place all required via(s)
         if via_layers is not None:
             for via_layer in via_layers:
-                self.__place_rect_in_layer(layer=via_layer, area=area)
+                self.__place_rect_in_layer(magic_file=magic_file, layer=via_layer, area=area)
 
-    def __add_trace_net_vias(self, trace_net: TraceNet) -> int:
+    def __add_trace_net_vias(self, magic_file: MagicFile, trace_net: TraceNet) -> int:
         """Checks for overlap between segments of a trace net in different layers and adds vias.
            Vias only get added when layer changes occur."""
         previous_segment = None
@@ -135,6 +227,7 @@ class MagicLayoutCreator:
                     )
                     # Place the via
                     self.__via_placer(
+                        magic_file=magic_file,
                         start_layer=previous_segment.layer,
                         end_layer=segment.layer,
                         area=via_area,
@@ -147,43 +240,37 @@ class MagicLayoutCreator:
 
         return via_count
 
-    def __add_trace_net_connection_point(self, trace_net: TraceNet, components):
+    def __add_trace_net_connection_point(self, magic_file: MagicFile, trace_net: TraceNet,
+                                         port_index: LayoutPortIndex):
         """Creates a connection point based on which layer a trace segment wants to connect to a port.
         Multiple connections to a port will show as the connection point being added multiple times"""
+        connections = []
 
-        # Iterate over all components and filter out things that does not have ports
-        for component in components:
-            if not isinstance(component, (Pin, CircuitCell, TraceNet)):
-
-                # Iterate over all ports for every segment of the current trace net
-                for port in component.layout_ports:
-                    for segment in trace_net.segments:
+        for segment_index, segment in enumerate(trace_net.segments):
 
-                        # Get port position in finished layout by adding transform matrix coordinates
-                        port_pos = RectArea(x1=port.area.x1 + component.transform_matrix.c,
-                                            x2=port.area.x2 + component.transform_matrix.c,
-                                            y1=port.area.y1 + component.transform_matrix.f,
-                                            y2=port.area.y2 + component.transform_matrix.f)
+            # Hinder connections to metal 4 since that reserved for cell to cell routing. Bulks are not in the index
+            # since they are always connected in the lowest metal
+            if segment.layer == self.METAL_LAYERS[0] or segment.layer == self.METAL_LAYERS[4]:
+                continue
 
-                        # Hinder placement of connection points to bulks since they are always connected in the
-                        # lowest metal. Also hinder connections to metal 4 since that reserved for cell to cell routing
-                        if (port.type == "B" or segment.layer == self.METAL_LAYERS[0]
-                                or segment.layer == self.METAL_LAYERS[4]):
-                            continue
+            # Check for overlap between the port and the segment and add vias accordingly
+            for indexed_port in port_index.query(area=segment.area):
+                if segment.layer != indexed_port.port.layer:
+                    connections.append((indexed_port.order, segment_index, segment, indexed_port))
 
-                        # Check for overlap between the port and the segment and add vias accordingly
-                        if (not (segment.area.x2 < port_pos.x1 or segment.area.x1 > port_pos.x2 or
-                                 segment.area.y2 < port_pos.y1 or segment.area.y1 > port_pos.y2)
-                                and segment.layer != port.layer):
+        # Place connection points ordered by component, then port, then segment
+        for _, _, segment, indexed_port in sorted(connections, key=lambda connection: connection[:2]):
+            port, component = indexed_port.port, indexed_port.component
 
-                            self.__via_placer(start_layer=segment.layer, end_layer=port.layer, area=port_pos,
-                                              trace_net=trace_net)
+            # Every via gets its own area, as the indexed port area is shared by all connections to the port
+            self.__via_placer(magic_file=magic_file, start_layer=segment.layer, end_layer=port.layer,
+                              area=copy.copy(indexed_port.area), trace_net=trace_net)
 
-                            self.total_connection_points_added += 1
+            magic_file.total_connection_points_added += 1
 
-                            self.logger.info(f"Connection placed on port '{port.type}' of '{component.name}' "
-                                             f"between layer '{port.layer}' and '{segment.layer}' "
-                                             f"for trace net '{trace_net.name}' of '{trace_net.named_cell}'")
+            self.logger.info(f"Connection placed on port '{port.type}' of '{component.name}' "
+                             f"between layer '{port.layer}' and '{segment.layer}' "
+                             f"for trace net '{trace_net.name}' of '{trace_net.named_cell}'")
 
     def __get_inbetween_metal_layers(self, start_layer: str, end_layer: str, metal_layer_list: list):
         """Gets all metal layers, including start and end layer, and deals with if their positions are
@@ -228,7 +315,7 @@ class MagicLayoutCreator:
         except ValueError:
             self.logger.error(f"Could not get layers inbetween '{start_layer}' to '{end_layer}'")
 
-    def __trace_net_creator(self, trace_net: TraceNet):
+    def __trace_net_creator(self, magic_file: MagicFile, trace_net: TraceNet):
         via_count = 0
         segment_count = 0
 
@@ -239,7 +326,7 @@ class MagicLayoutCreator:
 
         # Add predefined trace segments
         for segment in trace_net.segments:
-            self.__place_rect_in_layer(layer=segment.layer, area=segment.area)
+            self.__place_rect_in_layer(magic_file=magic_file, layer=segment.layer, area=segment.area)
             segment_count += 1
 
         # Add predefined trace vias
@@ -247,48 +334,48 @@ class MagicLayoutCreator:
         trace_net.vias.clear()
 
         for via in current_trace_net_vias:
-            self.__via_placer(start_layer=re.search(r'^[^-]+', via.layer).group(0),
+            self.__via_placer(magic_file=magic_file, start_layer=re.search(r'^[^-]+', via.layer).group(0),
                               end_layer=re.search(r'[^-]*$', via.layer).group(0),
                               area=via.area,
                               trace_net=trace_net)
             via_count += 1
 
         # Automatically create vias at intersection points between trace segments that move up/down in layers
-        via_count += self.__add_trace_net_vias(trace_net=trace_net)
+        via_count += self.__add_trace_net_vias(magic_file=magic_file, trace_net=trace_net)
 
         self.logger.info(f"Trace net '{trace_net.name}' placed with segments: {segment_count} vias: {via_count}")
-        self.total_vias_added += via_count
-        self.total_trace_nets_added += 1
+        magic_file.total_vias_added += via_count
+        magic_file.total_trace_nets_added += 1
 
-    def __functional_component_creator(self, component):
+    def __functional_component_creator(self, magic_file: MagicFile, component):
 
         # Find library of current functional component
-        self.current_component_library_path = next(
+        magic_file.current_component_library_path = next(
             (lib.path for lib in self.component_libraries if component.layout_library in lib.path), None)
 
-        self.magic_file_lines.extend([
+        magic_file.magic_file_lines.extend([
             f"use {component.layout_name}  {component.group}_{component.name} "
-            f"../{re.search(r'[^/]+$', self.current_component_library_path).group()}",
-            f"timestamp {int(time.time())}",
+            f"../{re.search(r'[^/]+$', magic_file.current_component_library_path).group()}",
+            f"timestamp {magic_file.get_cell_timestamp(layout_name=component.layout_name)}",
             f"transform {component.transform_matrix.a} {component.transform_matrix.b}"
             f" {component.transform_matrix.c} {component.transform_matrix.d}"
             f" {component.transform_matrix.e} {component.transform_matrix.f}",
             f"box {component.bounding_box.x1} {component.bounding_box.y1} {component.bounding_box.x2}"
             f" {component.bounding_box.y2}"
         ])
-        self.total_functional_components_added += 1
+        magic_file.total_functional_components_added += 1
 
         self.logger.info(f"{component.instance} '{component.name} {component.layout_name}' "
                          f"placed with {component.transform_matrix}")
 
         # ATR SKY130A LIB component handling
         if any(lib for lib in self.component_libraries if re.search(r"ATR", lib.name)):
-            atr.place_transistor_endpoints_for_atr_lib(self=self, component=component)
+            atr.place_transistor_endpoints_for_atr_lib(self=magic_file, component=component)
 
-    def __pin_component_creator(self, component):
+    def __pin_component_creator(self, magic_file: MagicFile, component):
         # Check that layout type is valid
         if isinstance(component.layout, RectAreaLayer):
-            self.magic_file_lines.extend([
+            magic_file.magic_file_lines.extend([
                 f"flabel {component.layout.layer} s {component.layout.area.x1} {component.layout.area.y1} "
                 f"{component.layout.area.x2} {component.layout.area.y2} 0 FreeSans 400 0 0 0 {component.name}",
                 f"port {component.number_id} nsew signal bidirectional"
@@ -296,9 +383,9 @@ class MagicLayoutCreator:
             self.logger.info(f"{component.instance} '{component.name}' placed in layer '{component.layout.layer}' "
                              f"with {component.layout.area}")
 
-    def __circuit_cell_component_creator(self, component):
+    def __circuit_cell_component_creator(self, magic_file: MagicFile, component):
 
-        self.magic_file_lines.extend([
+        magic_file.magic_file_lines.extend([
             f"use {component.cell} {component.named_cell} ",
             f"transform {component.transform_matrix.a} {component.transform_matrix.b}"
             f" {component.transform_matrix.c} {component.transform_matrix.d}"
@@ -309,10 +396,10 @@ class MagicLayoutCreator:
         self.logger.info(f"{component.instance} '{component.named_cell}' of parent cell '{component.parent_cell}' "
                          f"placed with {component.transform_matrix}")
 
-        self.total_circuit_cells_added += 1
+        magic_file.total_circuit_cells_added += 1
 
-    def __magic_file_top_template(self):
-        self.magic_file_lines.extend([
+    def __magic_file_top_template(self, magic_file: MagicFile):
+        magic_file.magic_file_lines.extend([
             "magic",
             f"tech {self.TECHNOLOGY}",
             "magscale 1 1",
@@ -321,99 +408,130 @@ class MagicLayoutCreator:
             "rect 0 0 1 1"  # Rectangle completely covering everything in the cell. TBD!
         ])
 
-    def __magic_file_creator(self, components, file_name):
-        self.__magic_file_top_template()
+    def __magic_file_creator(self, components, file_name) -> MagicFile:
+        functional_components = []
+        trace_nets = []
+        circuit_cells = []
+        pins = []
 
-        # Place functional components
         for component in components:
             if isinstance(component, (Transistor, Resistor, Capacitor)):
-                self.__functional_component_creator(component=component)
-
-        # Place trace nets
-        for component in components:
-            if isinstance(component, TraceNet):
-                self.__trace_net_creator(trace_net=component)
-
-        # Place connection points
-        for component in components:
-            if isinstance(component, TraceNet):
-                self.__add_trace_net_connection_point(trace_net=component, components=components)
-
-        # Place circuit cells
-        for component in components:
-            if isinstance(component, CircuitCell):
-                self.__circuit_cell_component_creator(component=component)
+                functional_components.append(component)
+            elif isinstance(component, TraceNet):
+                trace_nets.append(component)
+            elif isinstance(component, CircuitCell):
+                circuit_cells.append(component)
+            elif isinstance(component, Pin):
+                pins.append(component)
+
+        # Lines are written to file as they are created
+        magic_file = MagicFile(name=file_name, cell_timestamps=self.cell_timestamps, magic_file_lines=MagicFileWriter(
+            path=self.__get_magic_file_path(file_name=file_name),
+            rectangle_merger=self.rectangle_merger if self.MERGE_LAYER_RECTANGLES else None,
+            skip_unchanged=self.SKIP_UNCHANGED_FILES))
+
+        with timer("mag write", cell=file_name), magic_file.magic_file_lines:
+            self.__magic_file_top_template(magic_file=magic_file)
+
+            # Place functional components
+            for component in functional_components:
+                self.__functional_component_creator(magic_file=magic_file, component=component)
+
+            # Place trace nets
+            for trace_net in trace_nets:
+                self.__trace_net_creator(magic_file=magic_file, trace_net=trace_net)
+
+            # Place connection points
+            port_index = LayoutPortIndex(components=[component for component in components
+                                                     if not isinstance(component, (Pin, CircuitCell, TraceNet))],
+                                         skip_port_types=("B",))
+            for trace_net in trace_nets:
+                self.__add_trace_net_connection_point(magic_file=magic_file, trace_net=trace_net,
+                                                      port_index=port_index)
+
+            # Write all paint, with rectangles in the same layer merged when enabled
+            magic_file.magic_file_lines.flush_rectangles()
+
+            # Place circuit cells
+            for component in circuit_cells:
+                self.__circuit_cell_component_creator(magic_file=magic_file, component=component)
+
+            # Place pins
+            magic_file.magic_file_lines.append("<< labels >>")
+            for component in pins:
+                self.__pin_component_creator(magic_file=magic_file, component=component)
+
+            # Properties
+            magic_file.magic_file_lines.extend([
+                "<< properties >>",
+            ])
 
-        # Place pins
-        self.magic_file_lines.append("<< labels >>")
-        for component in components:
-            if isinstance(component, Pin):
-                self.__pin_component_creator(component=component)
+            # Bottom of magic file template
+            magic_file.magic_file_lines.append("<< end >>")
 
-        # Properties
-        self.magic_file_lines.extend([
-            "<< properties >>",
-        ])
+        magic_file.path = magic_file.magic_file_lines.path
+        magic_file.changed = magic_file.magic_file_lines.changed
+        self.__log_magic_file_created(magic_file=magic_file)
+        return magic_file
 
-        # Bottom of magic file template
-        self.magic_file_lines.append("<< end >>")
+    def __get_magic_file_path(self, file_name) -> str:
+        return os.path.expanduser(f"{self.project_directory}/design/{self.project_top_lib_name}/{file_name}.mag")
 
-        # Write everything to file
-        self.__write_magic_file(file_name=file_name)
+    def __log_magic_file_created(self, magic_file: MagicFile):
+        if self.MERGE_LAYER_RECTANGLES:
+            lines_before = magic_file.magic_file_lines.unmerged_line_count
+            lines_after = magic_file.magic_file_lines.line_count
 
-    def __write_magic_file(self, file_name):
-        magic_file_path = os.path.expanduser(f"{self.project_directory}/design/"
-                                             f"{self.project_top_lib_name}/{file_name}.mag")
+            self.logger.info(f"Rectangles of '{magic_file.name}.mag' merged. | Lines before: {lines_before} | "
+                             f"Lines after: {lines_after} | Reduction: "
+                             f"{100 * (lines_before - lines_after) / max(lines_before, 1):.1f}%")
 
-        with open(magic_file_path, "w") as file:
-            file.write("\n".join(self.magic_file_lines))
+        file_status = "created" if magic_file.changed else "unchanged"
 
-        self.logger.info(f"File '{file_name}.mag' was created. "
-                         f"| Functional Components: {self.total_functional_components_added} | "
-                         f"Connection Points: {self.total_connection_points_added} | "
-                         f"Trace nets: {self.total_trace_nets_added} | Vias: {self.total_vias_added} | "
-                         f"Circuit cells: {self.total_circuit_cells_added}")
+        self.logger.info(f"File '{magic_file.name}.mag' was {file_status}. "
+                         f"| Functional Components: {magic_file.total_functional_components_added} | "
+                         f"Connection Points: {magic_file.total_connection_points_added} | "
+                         f"Trace nets: {magic_file.total_trace_nets_added} | Vias: {magic_file.total_vias_added} | "
+                         f"Circuit cells: {magic_file.total_circuit_cells_added}")
         self.logger.info(f"============================================================================================"
                          f"============================================")
 
-    def __generate_magic_files(self):
+    def __get_cell_files(self) -> list[tuple[str, list]]:
+        """Returns the file name and components of every cell chain, using a single pass over all components"""
+        components_by_cell_chain = {}
+        circuit_cells_by_parent_cell = {}
         cell_chains = []
+        cell_files = []
 
-        # Retrieve all sub cells
+        # Group components by cell chain and circuit cells by parent cell
         for component in self.components:
             if isinstance(component, CircuitCell):
                 cell_chains.append(component.cell_chain)
+                circuit_cells_by_parent_cell.setdefault(component.parent_cell, []).append(component)
+
+            if component.cell_chain == "":
+                self.logger.error(f"{component.name} is missing a cell chain")
+
+                # Cells without a cell chain still name the file of an empty cell chain
+                if not isinstance(component, CircuitCell):
+                    continue
+
+            components_by_cell_chain.setdefault(component.cell_chain, []).append(component)
 
-        # Iterate over found cells and generate .mag files for each one
         for cell_chain in cell_chains:
             cell = None
             cell_components = []
 
-            self.magic_file_lines = []
-            self.total_functional_components_added = 0
-            self.total_connection_points_added = 0
-            self.total_trace_nets_added = 0
-            self.total_vias_added = 0
-            self.total_circuit_cells_added = 0
-
-            for component in self.components:
+            for component in components_by_cell_chain.get(cell_chain, []):
 
+                # Assign new cell name on change
                 if isinstance(component, CircuitCell):
-                    # Assign new cell name on change
-                    if component.cell_chain == cell_chain:
-                        cell = component.cell
-
-                if component.cell_chain == "":
-                    self.logger.error(f"{component.name} is missing a cell chain")
-                    continue
-
-                if component.cell_chain != cell_chain:
-                    continue
+                    cell = component.cell
 
                 if cell is None:
                     cell = component.cell
 
-                if not isinstance(component, CircuitCell):
+                if not isinstance(component, CircuitCell) and cell_chain != "":
                     cell_components.append(component)
 
             # Top cell handling
@@ -421,12 +539,94 @@ class MagicLayoutCreator:
                 cell = self.project_top_cell_name
 
             # Add circuit cells that has the current cell as parent and do not have the same name
-            for comp in self.components:
-                if (isinstance(comp, CircuitCell) and comp.parent_cell == cell and
-                        all(existing_comp.named_cell != comp.named_cell for existing_comp in cell_components)):
+            named_cells = {component.named_cell for component in cell_components}
+            for comp in circuit_cells_by_parent_cell.get(cell, []):
+                if comp.named_cell not in named_cells:
                     cell_components.append(comp)
+                    named_cells.add(comp.named_cell)
+
+            cell_files.append((cell, cell_components))
+
+        return cell_files
+
+    def __create_magic_files_in_processes(self, cell_files: list[tuple[str, list]]) -> list[MagicFile]:
+        """Creates the magic files of different cells in worker processes, as creating them is pure Python work that
+        threads can not run in parallel. Cells are reported as written in the order the workers finish them"""
+        config = thaw(self.config.tables)
+        magic_files = []
+
+        with ProcessPoolExecutor(max_workers=min(self.WRITE_WORKERS, len(cell_files)),
+                                 mp_context=multiprocessing.get_context("spawn")) as executor:
+            futures = {executor.submit(MagicLayoutCreator.create_magic_file_in_worker, self.project_properties, cell,
+                                       cell_components, config): cell_components
+                       for cell, cell_components in cell_files}
+
+            for future in as_completed(futures):
+                magic_file = future.result()
 
-            # Create file if component list is not empty
-            self.__magic_file_creator(components=cell_components, file_name=cell)
+                # Hand the vias added by the worker over to the trace nets of this process
+                trace_nets = [component for component in futures[future] if isinstance(component, TraceNet)]
+                for trace_net, vias in zip(trace_nets, magic_file.trace_net_vias):
+                    trace_net.vias = vias
+                magic_file.trace_net_vias = []
 
-        self.logger.info("Process complete!")
+                self.__cell_file_written(magic_file=magic_file)
+                magic_files.append(magic_file)
+
+        return magic_files
+
+    def __cell_file_written(self, magic_file: MagicFile):
+        # The file of the cell is final, so checks of it can start while other cells are still being written
+        if self.on_cell_written is not None:
+            self.on_cell_written(magic_file.name, magic_file.path)
+
+    @staticmethod
+    def __copy_vias_to_other_instances(cell_files: list[tuple[str, list]], created_cell_files: dict):
+        """Gives the trace nets of cell instances that were not created the vias of the created instance of the cell.
+        All instances of a cell are copies of the same solved cell"""
+        for cell, cell_components in cell_files:
+            if cell_components is created_cell_files[cell]:
+                continue
+
+            vias = {component.name: component.vias for component in created_cell_files[cell]
+                    if isinstance(component, TraceNet)}
+            for component in cell_components:
+                if isinstance(component, TraceNet) and component.name in vias:
+                    component.vias = copy.deepcopy(vias[component.name])
+
+    def __generate_magic_files(self):
+        cell_files = self.__get_cell_files()
+
+        # Cell chains that are instances of the same cell write the same file. Only the last instance is created, since
+        # it would overwrite the files of the previous ones
+        created_cell_files = {cell: cell_components for cell, cell_components in cell_files}
+
+        if self.WRITE_WORKERS < 2 or len(created_cell_files) < 2:
+            magic_files = []
+            for cell, cell_components in created_cell_files.items():
+                magic_files.append(self.__magic_file_creator(components=cell_components, file_name=cell))
+                self.__cell_file_written(magic_file=magic_files[-1])
+        else:
+            magic_files = self.__create_magic_files_in_processes(cell_files=list(created_cell_files.items()))
+
+        self.__copy_vias_to_other_instances(cell_files=cell_files, created_cell_files=created_cell_files)
+
+        # Sum up counters of all files after the workers are done
+        for magic_file in magic_files:
+            self.total_functional_components_added += magic_file.total_functional_components_added
+            self.total_connection_points_added += magic_file.total_connection_points_added
+            self.total_trace_nets_added += magic_file.total_trace_nets_added
+            self.total_vias_added += magic_file.total_vias_added
+            self.total_circuit_cells_added += magic_file.total_circuit_cells_added
+
+        # Report which files were touched, so that only those have to be checked again
+        changed_cells = sorted({magic_file.name for magic_file in magic_files if magic_file.changed})
+        unchanged_cells = sorted({magic_file.name for magic_file in magic_files} - set(changed_cells))
+        self.logger.info(f"Changed cells: {changed_cells if changed_cells else 'none'} | "
+                         f"Unchanged cells: {unchanged_cells if unchanged_cells else 'none'}")
+
+        self.logger.info(f"Process complete! Files: {len(magic_files)} | "
+                         f"Functional Components: {self.total_functional_components_added} | "
+                         f"Connection Points: {self.total_connection_points_added} | "
+                         f"Trace nets: {self.total_trace_nets_added} | Vias: {self.total_vias_added} | "
+                         f"Circuit cells: {self.total_circuit_cells_added}")
@@ -0,0 +1,99 @@
+# ==================================================================================================================== #
+# Copyright (C) 2025 Bjørn K.T. Solheim, Leidulv Tønnesland
+# ==================================================================================================================== #
+# This program is free software: you can redistribute it and/or modify it under the terms of
+# the GNU General Public License as published by the Free Software Foundation, version 2.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <https://www.gnu.org/licenses/>.
+# ==================================================================================================================== #
+
+# ==================================================== Notes ===========================================================
+"""
+    Uniform grid bucket index of the layout ports of a cell, positioned in the finished layout. Every port is stored
+    in all grid buckets its area touches, so a query only has to look at the buckets covered by the queried area.
+
+    Query results are returned in the order of the components and ports the index was built from, which keeps
+    the order of generated connection points the same as when looping over all components and ports.
+"""
+
+# ================================================== Libraries =========================================================
+from dataclasses import dataclass
+from circuit.circuit_components import RectArea, LayoutPort
+
+# ================================================== Port index ========================================================
+
+
+@dataclass(slots=True)
+class IndexedPort:
+    order: tuple
+    component: object
+    port: LayoutPort
+    area: RectArea
+
+
+class LayoutPortIndex:
+
+    def __init__(self, components: list, skip_port_types: tuple = ()):
+        self.entries = []
+
+        for component_index, component in enumerate(components):
+            for port_index, port in enumerate(component.layout_ports):
+                if port.type in skip_port_types:
+                    continue
+
+                # Get port position in finished layout by adding transform matrix coordinates
+                area = RectArea(x1=port.area.x1 + component.transform_matrix.c,
+                                x2=port.area.x2 + component.transform_matrix.c,
+                                y1=port.area.y1 + component.transform_matrix.f,
+                                y2=port.area.y2 + component.transform_matrix.f)
+                self.entries.append(IndexedPort(order=(component_index, port_index), component=component,
+                                                port=port, area=area))
+
+        # Buckets a few ports wide keep both the number of buckets per port and the ports per bucket low
+        port_sizes = [max(entry.area.x2 - entry.area.x1, entry.area.y2 - entry.area.y1) for entry in self.entries]
+        self.bucket_size = max(1, 4 * sum(port_sizes) / len(port_sizes)) if port_sizes else 1
+        self.buckets = {}
+
+        for entry_index, entry in enumerate(self.entries):
+            for bucket in self.__get_buckets(area=entry.area):
+                self.buckets.setdefault(bucket, []).append(entry_index)
+
+        # Bucket range holding ports, which limits the buckets visited by queries with large areas
+        self.bucket_bounds = RectArea(x1=min((x for x, _ in self.buckets), default=0),
+                                      y1=min((y for _, y in self.buckets), default=0),
+                                      x2=max((x for x, _ in self.buckets), default=-1),
+                                      y2=max((y for _, y in self.buckets), default=-1))
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __get_buckets(self, area: RectArea, bounds: RectArea | None = None):
+        x1, x2 = sorted((int(area.x1 // self.bucket_size), int(area.x2 // self.bucket_size)))
+        y1, y2 = sorted((int(area.y1 // self.bucket_size), int(area.y2 // self.bucket_size)))
+
+        if bounds is not None:
+            x1, x2 = max(x1, bounds.x1), min(x2, bounds.x2)
+            y1, y2 = max(y1, bounds.y1), min(y2, bounds.y2)
+
+        for x in range(x1, x2 + 1):
+            for y in range(y1, y2 + 1):
+                yield x, y
+
+    def query(self, area: RectArea) -> list[IndexedPort]:
+        """Returns all ports overlapping or touching the given area, in build order"""
+        entry_indices = set()
+        for bucket in self.__get_buckets(area=area, bounds=self.bucket_bounds):
+            entry_indices.update(self.buckets.get(bucket, ()))
+
+        result = []
+        for entry_index in sorted(entry_indices):
+            entry = self.entries[entry_index]
+            if not (area.x2 < entry.area.x1 or area.x1 > entry.area.x2 or
+                    area.y2 < entry.area.y1 or area.y1 > entry.area.y2):
+                result.append(entry)
+        return result
@@ -0,0 +1,89 @@
+# ==================================================================================================================== #
+# Copyright (C) 2025 Bjørn K.T. Solheim, Leidulv Tønnesland
+# ==================================================================================================================== #
+# This program is free software: you can redistribute it and/or modify it under the terms of
+# the GNU General Public License as published by the Free Software Foundation, version 2.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <https://www.gnu.org/licenses/>.
+# ==================================================================================================================== #
+
+# ==================================================== Notes ===========================================================
+"""
+    Post-processing of paint rectangles that reduces the number of magic file lines. Rectangles are collected per
+    layer by the magic file writer and written back as one section per layer.
+
+    Rectangles in metal layers are unioned and split into maximal horizontal strips using a sweep line over the
+    y-coordinates, where strips with equal x-intervals in abutting rows are merged vertically. This is the same
+    representation Magic uses internally, so the painted geometry is unchanged. Rectangles in via layers are only
+    deduplicated, since merging neighbouring vias would change their cut pattern.
+"""
+
+# ================================================== Libraries =========================================================
+from logger.logger import get_a_logger
+
+# ============================================== Rectangle merger ======================================================
+
+
+class MagicRectangleMerger:
+    logger = get_a_logger(__name__)
+
+    def __init__(self, merge_layers: list, deduplicate_layers: list):
+        self.merge_layers = set(merge_layers)
+        self.deduplicate_layers = set(deduplicate_layers)
+
+    @staticmethod
+    def merge_rectangles(rectangles: list) -> list:
+        """Returns the union of rectangles (x1, y1, x2, y2) as maximal horizontal strips, where touching
+        rectangles are merged into one"""
+        y_coordinates = sorted({y for rectangle in rectangles for y in (rectangle[1], rectangle[3])})
+        rectangles_by_y1 = sorted(rectangles, key=lambda rectangle: rectangle[1])
+
+        merged = []
+        open_strips = {}  # (x1, x2) -> y1 of strips still growing upwards
+        active = []
+        next_rectangle = 0
+
+        # Every row starts at a y-coordinate and ends at the next one, so the last y-coordinate only closes strips
+        for y_bottom in y_coordinates[:-1]:
+
+            # Update rectangles covering the current row
+            while next_rectangle < len(rectangles_by_y1) and rectangles_by_y1[next_rectangle][1] <= y_bottom:
+                active.append(rectangles_by_y1[next_rectangle])
+                next_rectangle += 1
+            active = [rectangle for rectangle in active if rectangle[3] > y_bottom]
+
+            # Union of x-intervals in the current row
+            intervals = []
+            for x1, _, x2, _ in sorted(active):
+                if intervals and x1 <= intervals[-1][1]:
+                    intervals[-1][1] = max(intervals[-1][1], x2)
+                else:
+                    intervals.append([x1, x2])
+            row_strips = {(x1, x2) for x1, x2 in intervals}
+
+            # Close strips that do not continue in the current row
+            for strip in [strip for strip in open_strips if strip not in row_strips]:
+                merged.append((strip[0], open_strips.pop(strip), strip[1], y_bottom))
+
+            for strip in intervals:
+                open_strips.setdefault(tuple(strip), y_bottom)
+
+        if y_coordinates:
+            for strip, y1 in open_strips.items():
+                merged.append((strip[0], y1, strip[1], y_coordinates[-1]))
+
+        return sorted(merged, key=lambda rectangle: (rectangle[1], rectangle[0]))
+
+    def handles(self, layer: str) -> bool:
+        return layer in self.merge_layers or layer in self.deduplicate_layers
+
+    def merge_layer(self, layer: str, rectangles: list) -> list:
+        """Returns the rectangles of a layer merged if it is a metal layer, otherwise only deduplicated"""
+        if layer in self.merge_layers:
+            return self.merge_rectangles(rectangles)
+        return list(dict.fromkeys(rectangles))
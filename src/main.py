@@ -20,11 +20,11 @@ from magic.magic_layout_creator import MagicLayoutCreator
 from dataclasses import dataclass, asdict
 from magic.magic_component_parser import MagicComponentsParser
 from json_converter.json_converter import save_to_json, load_from_json
-from drc.drc_checker import DRCchecking
-from lvs.lvs_checker import LVSchecking
 from traces.generate_astar_path_traces import *
 from utils.layout_to_svg import LayoutToSVG
 from cell.cell_creator import CellCreator
+from verification.verification_scheduler import VerificationScheduler
+from instrumentation.instrumentation import start_instrumentation, finish_instrumentation, timer
 
 
 # ========================================== Set-up classes and constants ==============================================
@@ -74,15 +74,28 @@ project_properties = ProjectProperties(directory="~/aicex/ip/jnw_bkle_sky130a",
 
 
 def main():
-    components = SPICEparser(project_properties=project_properties).get()
-    components = MagicComponentsParser(project_properties=project_properties, components=components).get()
+    start_instrumentation()
+
+    with timer("spice parser"):
+        components = SPICEparser(project_properties=project_properties).get()
+    with timer("magic component parser"):
+        components = MagicComponentsParser(project_properties=project_properties, components=components).get()
     save_to_json(components, file_name="src/results/components_before_cell_creator.json")
-    components = CellCreator(project_properties=project_properties, components=components).get()
-    MagicLayoutCreator(project_properties=project_properties, components=components)
+    with timer("cell creator"):
+        components = CellCreator(project_properties=project_properties, components=components).get()
+
+    # DRC and LVS of cells start as soon as their magic files are written
+    verification = VerificationScheduler(project_properties=project_properties)
+    with timer("magic layout creator"):
+        MagicLayoutCreator(project_properties=project_properties, components=components,
+                           on_cell_written=verification.cell_written)
     save_to_json(components, file_name="src/results/complete_component_info.json")
 
-    DRCchecking(project_properties=project_properties)
-    LVSchecking(project_properties=project_properties)
+    # Full DRC and LVS at the same time
+    with timer("verification"):
+        verification.finish()
+
+    finish_instrumentation()
 
 
 if __name__ == '__main__':
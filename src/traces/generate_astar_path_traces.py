@@ -18,7 +18,7 @@ from dataclasses import dataclass
 from circuit.circuit_components import RectArea, Transistor, Capacitor, Resistor, Pin, CircuitCell, TraceNet, \
     RectAreaLayer
 from logger.logger import get_a_logger
-import tomllib
+from config.config_loader import get_config
 import re
 import libraries.atr_lib as atr
 
@@ -45,7 +45,7 @@ class GenerateAstarPathTraces:
         self.used_area = used_area
 
         # Load config
-        self.config = self.__load_config()
+        self.config = get_config()
         self.TRACE_WIDTH = self.config["generate_grid"]["TRACE_WIDTH"]
         self.SCALE_FACTOR = self.config["generate_grid"]["SCALE_FACTOR"]
         self.GRID_LEEWAY_X = self.config["generate_grid"]["GRID_LEEWAY_X"]
@@ -65,13 +65,6 @@ class GenerateAstarPathTraces:
 
         self.__generate_traces()
 
-    def __load_config(self, path="pyproject.toml"):
-        try:
-            with open(path, "rb") as f:
-                return tomllib.load(f)
-        except (FileNotFoundError, tomllib.TOMLDecodeError) as e:
-            self.logger.error(f"Error loading config: {e}")
-
     def __calculate_offset(self, goal_nodes, real_nodes,):
         self.scale_offset_x, self.scale_offset_y = 0, 0
         for index in range(len(goal_nodes)-1):
@@ -131,6 +124,7 @@ class GenerateAstarPathTraces:
         trace.parent_cell = self.circuit_cell.parent_cell
         trace.named_parent_cell = self.circuit_cell.named_parent_cell
         trace.name = net
+        trace.relaxed_minimum_segment_length = self.paths[net].get("relaxed_minimum_segment_length", 0)
 
         for index, rectangle in enumerate(self.mapped_rectangles):
             if rectangle.area.x1 == rectangle.area.x2 and rectangle.area.y1 == rectangle.area.y2:
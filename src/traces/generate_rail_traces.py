@@ -16,7 +16,7 @@
 from circuit.circuit_components import RectArea, Transistor, Capacitor, Resistor, Pin, CircuitCell, TraceNet, \
     RectAreaLayer
 from logger.logger import get_a_logger
-import tomllib
+from config.config_loader import get_config
 import re
 import libraries.atr_lib as atr
 
@@ -36,7 +36,7 @@ class GenerateRailTraces:
         self.components = components
 
         # Load config
-        self.config = self.__load_config()
+        self.config = get_config()
         self.INIT_RAIL_RING_OFFSET_X = self.config["generate_rail_traces"]["INIT_RAIL_RING_OFFSET_X"]
         self.INIT_RAIL_RING_OFFSET_Y = self.config["generate_rail_traces"]["INIT_RAIL_RING_OFFSET_Y"]
         self.RAIL_RING_OFFSET = self.config["generate_rail_traces"]["RAIL_RING_OFFSET"]
@@ -59,13 +59,6 @@ class GenerateRailTraces:
 
         self.__generate_rails()
 
-    def __load_config(self, path="pyproject.toml"):
-        try:
-            with open(path, "rb") as f:
-                return tomllib.load(f)
-        except (FileNotFoundError, tomllib.TOMLDecodeError) as e:
-            self.logger.error(f"Error loading config: {e}")
-
     def __generate_trace_box_around_cell(self, pin, offset_x: int, offset_y: int, width: int):
         """Width extends outwards from offset"""
 
@@ -0,0 +1,113 @@
+# ==================================================================================================================== #
+# Copyright (C) 2025 Bjørn K.T. Solheim, Leidulv Tønnesland
+# ==================================================================================================================== #
+# This program is free software: you can redistribute it and/or modify it under the terms of
+# the GNU General Public License as published by the Free Software Foundation, version 2.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <https://www.gnu.org/licenses/>.
+# ==================================================================================================================== #
+
+# ==================================================== Notes ===========================================================
+"""
+    Check of the A* search limits and the fallback retries of the A* initiator. A single net between two capacitor
+    ports is routed on a small grid split by a wall with a one node gap. Reaching the gap takes a short jog, so with
+    the minimum segment length of the check the search grows past the expansion limit, while the search with half
+    the minimum segment length finds a path well within it.
+
+    The check covers a limit reached without retries, a limit reached followed by a relaxed retry that routes the
+    net, and a net running out of time, which is not retried since the deadline covers all retries of the net.
+
+    Run from the project root directory:
+    PYTHONPATH=src python src/utils/astar_fallback_check.py --log-level WARNING
+"""
+
+# ================================================== Libraries =========================================================
+from astar.a_star_initiator import AstarInitiator
+from astar.a_star_stats import LIMIT_EXPANSIONS, LIMIT_TIME
+from circuit.circuit_components import Capacitor
+from connections.connections import Connection, Nets
+from grid.generate_grid import Coordinates, RoutingParameters, ComponentPorts
+from config.config_loader import config_overrides
+
+# ================================================== Constants =========================================================
+
+CELL = "CHECK"
+NET = "CHECK_NET"
+GRID_SIZE = 30
+WALL_X = 15
+GAP_Y = 16
+START = (12, 15)
+END = (18, 15)
+MINIMUM_SEGMENT_LENGTH = 4
+MAX_EXPANSIONS = 1000  # Minimum segment length 4 takes about 5800 expansions, half of it about 300
+
+# ===================================================== Checks =========================================================
+
+
+def route(max_expansions: int = 0, max_seconds_per_net: float = 0, fallback_retries: int = 0):
+    """Routes the net of the check and returns its stats and path"""
+    grid = [[1 if x == WALL_X and y != GAP_Y else 0 for x in range(GRID_SIZE)] for y in range(GRID_SIZE)]
+
+    components = [Capacitor(number_id=1, name="C1", type="mim", cell=CELL),
+                  Capacitor(number_id=2, name="C2", type="mim", cell=CELL)]
+    connection = Connection(start_comp_id=1, start_comp_type="mim", start_area="B", start_comp_name="C1",
+                            end_comp_id=2, end_comp_type="mim", end_area="B", end_comp_name="C2", cell=CELL, net=NET)
+    port_coordinates = {"1mimB": Coordinates(*START), "2mimB": Coordinates(*END)}
+
+    with config_overrides({"a_star_initiator": {"RUN_MULTIPLE_ASTAR": False, "CUSTOM_NET_ORDER": False,
+                                                "SAVE_STATS": False, "MAX_EXPANSIONS": max_expansions,
+                                                "MAX_SECONDS_PER_NET": max_seconds_per_net,
+                                                "LIMIT_FALLBACK_RETRIES": fallback_retries}}):
+        initiator = AstarInitiator(components=components, grid=grid,
+                                   connections={"component_connections": [connection], "single_connections": []},
+                                   scaled_port_coordinates=port_coordinates, port_coordinates=port_coordinates,
+                                   net_list=Nets(applicable_nets=[NET], pin_nets=[]),
+                                   routing_parameters=RoutingParameters(trace_width_scaled=0,
+                                                                        minimum_segment_length=MINIMUM_SEGMENT_LENGTH),
+                                   component_ports=ComponentPorts())
+        paths, _, _ = initiator.get()
+
+    return initiator.stats[NET], paths[NET]
+
+
+def check(name: str, stats, path: dict, routed: bool, limit: str | None, minimum_segment_length: int):
+    assert stats.routed == routed, f"{name}: routed {stats.routed}, expected {routed}"
+    assert stats.limit == limit, f"{name}: limit {stats.limit}, expected {limit}"
+    assert stats.minimum_segment_length == minimum_segment_length, \
+        f"{name}: minimum segment length {stats.minimum_segment_length}, expected {minimum_segment_length}"
+
+    relaxed = routed and minimum_segment_length < MINIMUM_SEGMENT_LENGTH
+    assert stats.relaxed == relaxed, f"{name}: relaxed {stats.relaxed}, expected {relaxed}"
+    assert path["relaxed_minimum_segment_length"] == (minimum_segment_length if relaxed else 0), \
+        f"{name}: relaxed minimum segment length {path['relaxed_minimum_segment_length']} on the path"
+    assert bool(path["segments"]) == routed, f"{name}: {len(path['segments'])} segments"
+
+    print(f"{name}: OK | {stats.summary()}")
+
+# ===================================================== Main ===========================================================
+
+
+def main():
+    # Without a limit the net is routed with the configured minimum segment length
+    check("No limit", *route(), routed=True, limit=None, minimum_segment_length=MINIMUM_SEGMENT_LENGTH)
+
+    # The limit stops every search, and nothing is retried
+    check("Limit without retries", *route(max_expansions=MAX_EXPANSIONS), routed=False, limit=LIMIT_EXPANSIONS,
+          minimum_segment_length=MINIMUM_SEGMENT_LENGTH)
+
+    # The first retry with half the minimum segment length routes the net within the limit
+    check("Limit with retries", *route(max_expansions=MAX_EXPANSIONS, fallback_retries=3), routed=True,
+          limit=LIMIT_EXPANSIONS, minimum_segment_length=MINIMUM_SEGMENT_LENGTH // 2)
+
+    # The deadline has passed before the first search starts, so the net is not retried
+    check("Out of time", *route(max_seconds_per_net=1e-9, fallback_retries=3), routed=False, limit=LIMIT_TIME,
+          minimum_segment_length=MINIMUM_SEGMENT_LENGTH)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,211 @@
+# ==================================================================================================================== #
+# Copyright (C) 2025 Bjørn K.T. Solheim, Leidulv Tønnesland
+# ==================================================================================================================== #
+# This program is free software: you can redistribute it and/or modify it under the terms of
+# the GNU General Public License as published by the Free Software Foundation, version 2.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <https://www.gnu.org/licenses/>.
+# ==================================================================================================================== #
+
+# ==================================================== Notes ===========================================================
+"""
+    Check of the per cell DRC orchestrator without Magic. A stub executable takes the place of Magic: it flattens the
+    checked cell and reports every metal rectangle narrower than the minimum width, writing the log the same way as
+    log_drc_info.tcl, and records which cells it was run on.
+
+    A temporary project with a top cell, two generated sub cells and a library cell is checked several times, changing
+    one file or option between the runs. The check covers the cached results, the cells checked again after a change
+    and the mapping of errors from cell coordinates to top cell coordinates, including a rotated instance.
+
+    Run from the project root directory:
+    PYTHONPATH=src python src/utils/drc_cell_orchestrator_check.py --log-level WARNING
+"""
+
+# ================================================== Libraries =========================================================
+import os
+import sys
+import shutil
+import tempfile
+from dataclasses import dataclass
+from drc.drc_cell_orchestrator import DRCCellOrchestrator
+from config.config_loader import config_overrides
+
+# ================================================== Constants =========================================================
+
+TOP_CELL_NAME = "CHECK_TOP"
+TOP_LIB_NAME = "CHECK_LIB"
+RULE = "Metal1 width < 0.14um"
+CALLS_VARIABLE = "AAL_STUB_MAGIC_CALLS"
+
+STUB_MAGIC = f'''#!{sys.executable}
+import os
+import sys
+
+MINIMUM_WIDTH = 3
+
+
+def flatten(path, transform, rectangles):
+    a, b, c, d, e, f = transform
+    layer = None
+    use_path = None
+    with open(path) as magic_file:
+        for line in magic_file:
+            words = line.split()
+            if line.startswith("<< "):
+                layer = words[1]
+            elif words[:1] == ["rect"] and layer == "m1":
+                x1, y1, x2, y2 = map(int, words[1:5])
+                xs = sorted((a * x1 + b * y1 + c, a * x2 + b * y2 + c))
+                ys = sorted((d * x1 + e * y1 + f, d * x2 + e * y2 + f))
+                rectangles.append((xs[0], ys[0], xs[1], ys[1]))
+            elif words[:1] == ["use"]:
+                directory = os.path.dirname(path) if len(words) < 4 else os.path.join(os.path.dirname(path), words[3])
+                use_path = os.path.join(directory, words[1] + ".mag")
+            elif words[:1] == ["transform"] and use_path is not None:
+                ua, ub, uc, ud, ue, uf = map(int, words[1:7])
+                flatten(use_path, (a * ua + b * ud, a * ub + b * ue, a * uc + b * uf + c,
+                                   d * ua + e * ud, d * ub + e * ue, d * uc + e * uf + f), rectangles)
+                use_path = None
+
+
+sys.stdin.read()
+rectangles = []
+flatten(sys.argv[1], (1, 0, 0, 0, 1, 0), rectangles)
+errors = [r for r in rectangles if min(r[2] - r[0], r[3] - r[1]) < MINIMUM_WIDTH]
+
+with open(os.environ["AAL_DRC_OUTPUT"], "w") as log_file:
+    log_file.write(f"Total DRC Errors: {{len(errors)}}\\n")
+    log_file.write(f"DRC Error Descriptions: {{'{RULE}' if errors else 'None'}}\\n")
+    detailed = " ".join("{{" + " ".join(map(str, error)) + "}}" for error in errors)
+    log_file.write(f"Detailed DRC Error Descriptions: {{{{{RULE}}}}} {{{{{{detailed}}}}}}\\n" if errors else
+                   "Detailed DRC Error Descriptions: None\\n")
+
+with open(os.environ["{CALLS_VARIABLE}"], "a") as calls_file:
+    calls_file.write(os.path.splitext(os.path.basename(sys.argv[1]))[0] + "\\n")
+'''
+
+# Sub cell B has a too narrow rectangle, and so has the library cell used by sub cell A
+CELLS = {
+    f"design/{TOP_LIB_NAME}/B.mag": ["magic", "tech sky130A", "<< m1 >>", "rect 0 0 2 10", "rect 10 0 20 10",
+                                     "<< end >>"],
+    f"design/{TOP_LIB_NAME}/A.mag": ["magic", "tech sky130A", "<< m1 >>", "rect 0 20 30 30",
+                                     "use B B_0", "transform 1 0 10 0 1 0", "box 0 0 20 10",
+                                     "use NCH NCH_0 ../LIB", "transform 1 0 50 0 1 50", "box 0 0 1 5", "<< end >>"],
+    f"design/{TOP_LIB_NAME}/{TOP_CELL_NAME}.mag": ["magic", "tech sky130A",
+                                                   "use A A_0", "transform 1 0 100 0 1 0", "box 0 0 60 60",
+                                                   "use A A_1", "transform 0 -1 300 1 0 0", "box 0 0 60 60",
+                                                   "use B B_0", "transform 1 0 0 0 1 50", "box 0 0 20 10",
+                                                   "<< end >>"],
+    "design/LIB/NCH.mag": ["magic", "tech sky130A", "<< m1 >>", "rect 0 0 1 5", "<< end >>"],
+}
+
+# Errors of B and NCH in top cell coordinates, for both instances of A and the instance of B in the top cell
+EXPECTED_ERRORS = {(110, 0, 112, 10), (290, 10, 300, 12), (0, 50, 2, 60), (150, 50, 151, 55), (245, 50, 250, 51)}
+
+# ========================================== Set-up classes and constants ==============================================
+
+
+@dataclass
+class ProjectProperties:
+    directory: str
+    top_cell_name: str
+    top_lib_name: str
+
+# ===================================================== Checks =========================================================
+
+
+def write_cell(project_directory: str, path: str, lines: list):
+    with open(f"{project_directory}/{path}", "w") as magic_file:
+        magic_file.write("\n".join(lines) + "\n")
+
+
+def run_orchestrator(project_directory: str, tcl_script_path: str, stub_path: str) -> tuple[set, list]:
+    """Returns the errors found in top cell coordinates and the cells the stub was run on"""
+    calls_path = os.environ[CALLS_VARIABLE]
+    open(calls_path, "w").close()
+
+    rule_errors = DRCCellOrchestrator(project_properties=ProjectProperties(directory=project_directory,
+                                                                           top_cell_name=TOP_CELL_NAME,
+                                                                           top_lib_name=TOP_LIB_NAME),
+                                      tcl_script_path=tcl_script_path, magic_executable=stub_path, workers=2).get()
+
+    with open(calls_path) as calls_file:
+        calls = sorted(calls_file.read().split())
+
+    assert set(rule_errors.rule) <= {RULE}, f"Unexpected rules {list(rule_errors.rule)}"
+    errors = [(area.x1, area.y1, area.x2, area.y2) for area in rule_errors.rule.get(RULE, [])]
+    assert len(errors) == len(set(errors)), f"Errors counted more than once: {errors}"
+    return set(errors), calls
+
+
+def check(name: str, errors: set, calls: list, expected_errors: set, expected_calls: list):
+    assert errors == expected_errors, f"{name}: errors {sorted(errors)}, expected {sorted(expected_errors)}"
+    assert calls == sorted(expected_calls), f"{name}: cells checked {calls}, expected {sorted(expected_calls)}"
+    print(f"{name}: OK | Cells checked: {calls if calls else 'none'} | Errors: {len(errors)}")
+
+# ===================================================== Main ===========================================================
+
+
+def main():
+    with tempfile.TemporaryDirectory() as project_directory:
+        os.makedirs(f"{project_directory}/work")
+        os.makedirs(f"{project_directory}/design/{TOP_LIB_NAME}")
+        os.makedirs(f"{project_directory}/design/LIB")
+        for path, lines in CELLS.items():
+            write_cell(project_directory=project_directory, path=path, lines=lines)
+
+        stub_path = f"{project_directory}/magic_stub.py"
+        with open(stub_path, "w") as stub_file:
+            stub_file.write(STUB_MAGIC)
+        os.chmod(stub_path, 0o755)
+
+        tcl_script_path = f"{project_directory}/log_drc_info.tcl"
+        shutil.copy(os.path.join(os.path.dirname(os.path.abspath(__file__)), "../drc/log_drc_info.tcl"),
+                    tcl_script_path)
+        os.environ[CALLS_VARIABLE] = f"{project_directory}/stub_calls.txt"
+
+        def run():
+            return run_orchestrator(project_directory=project_directory, tcl_script_path=tcl_script_path,
+                                    stub_path=stub_path)
+
+        # Every generated cell is checked on its own, library cells only through their parents
+        check("First run", *run(), expected_errors=EXPECTED_ERRORS, expected_calls=["A", "B", TOP_CELL_NAME])
+
+        # Nothing changed, so all results come from the cache
+        check("Unchanged run", *run(), expected_errors=EXPECTED_ERRORS, expected_calls=[])
+
+        # A changed sub cell changes the hash of every cell using it
+        write_cell(project_directory=project_directory, path=f"design/{TOP_LIB_NAME}/B.mag",
+                   lines=["magic", "tech sky130A", "<< m1 >>", "rect 0 0 5 10", "<< end >>"])
+        check("Changed sub cell", *run(), expected_errors={(150, 50, 151, 55), (245, 50, 250, 51)},
+              expected_calls=["A", "B", TOP_CELL_NAME])
+
+        # A changed library cell is found through the cells using it
+        write_cell(project_directory=project_directory, path="design/LIB/NCH.mag",
+                   lines=["magic", "tech sky130A", "<< m1 >>", "rect 0 0 4 5", "<< end >>"])
+        check("Changed library cell", *run(), expected_errors=set(), expected_calls=["A", TOP_CELL_NAME])
+
+        # A changed top cell is the only cell checked again
+        write_cell(project_directory=project_directory, path=f"design/{TOP_LIB_NAME}/{TOP_CELL_NAME}.mag",
+                   lines=CELLS[f"design/{TOP_LIB_NAME}/{TOP_CELL_NAME}.mag"][:-1] + ["<< m1 >>", "rect 0 0 1 1",
+                                                                                     "<< end >>"])
+        check("Changed top cell", *run(), expected_errors={(0, 0, 1, 1)}, expected_calls=[TOP_CELL_NAME])
+
+        # A changed DRC script makes all cached results unusable
+        with open(tcl_script_path, "a") as tcl_script:
+            tcl_script.write("\n")
+        check("Changed DRC script", *run(), expected_errors={(0, 0, 1, 1)}, expected_calls=["A", "B", TOP_CELL_NAME])
+
+        # A changed option of the drc_checker config table makes all cached results unusable too
+        with config_overrides({"drc_checker": {"MAGIC_EXECUTABLE": stub_path}}):
+            check("Changed DRC config", *run(), expected_errors={(0, 0, 1, 1)},
+                  expected_calls=["A", "B", TOP_CELL_NAME])
+
+
+if __name__ == '__main__':
+    main()
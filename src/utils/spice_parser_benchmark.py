@@ -0,0 +1,161 @@
+# ==================================================================================================================== #
+# Copyright (C) 2025 Bjørn K.T. Solheim, Leidulv Tønnesland
+# ==================================================================================================================== #
+# This program is free software: you can redistribute it and/or modify it under the terms of
+# the GNU General Public License as published by the Free Software Foundation, version 2.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <https://www.gnu.org/licenses/>.
+# ==================================================================================================================== #
+
+# ==================================================== Notes ===========================================================
+"""
+    Benchmark of the SPICE parser on a large synthetic netlist in the same format as produced by 'make xsch'.
+    A temporary project is created with a top cell containing many sub cells, where each sub cell holds
+    transistors, resistors, capacitors and pins, and all library symbols are expanded as subcircuits.
+
+    Run from the project root directory:
+    PYTHONPATH=src python src/utils/spice_parser_benchmark.py --log-level WARNING
+"""
+
+# ================================================== Libraries =========================================================
+import os
+import tempfile
+import time
+from dataclasses import dataclass
+from circuit.circuit_spice_parser import SPICEparser
+from circuit.circuit_components import Transistor, Resistor, Capacitor, Pin, CircuitCell
+
+# ================================================== Constants =========================================================
+
+TOP_CELL_NAME = "BENCH_TOP"
+SUB_CELLS = 40
+INSTANCES_PER_SUB_CELL = 4
+TRANSISTORS_PER_CELL = 60
+RESISTORS_PER_CELL = 20
+CAPACITORS_PER_CELL = 20
+PINS_PER_CELL = 8
+RUNS = 3
+
+# ========================================== Set-up classes and constants ==============================================
+
+
+@dataclass
+class ComponentLibrary:
+    name: str
+    path: str
+
+
+@dataclass
+class ProjectProperties:
+    directory: str
+    top_cell_name: str
+    top_lib_name: str
+    component_libraries: list[ComponentLibrary]
+
+
+LIBRARY_SUBCIRCUITS = {
+    "JNWATR_NCH_4C5F0": "D G S B",
+    "JNWATR_PCH_4C5F0": "D G S B",
+    "JNWTR_RPPO4": "N P B",
+    "JNWTR_CAPX1": "A B",
+}
+
+# ============================================== Netlist generation ====================================================
+
+
+def write_long_line(lines: list, words: list, words_per_line: int = 8):
+    """Splits long lines with '+' symbols the same way xschem does"""
+    lines.append(" ".join(words[:words_per_line]))
+    for index in range(words_per_line, len(words), words_per_line):
+        lines.append("+ " + " ".join(words[index:index + words_per_line]))
+
+
+def generate_netlist() -> str:
+    lines = [f"** sch_path: /bench/design/{TOP_CELL_NAME}.sch"]
+
+    # Top cell
+    top_ports = [f"P{pin}" for pin in range(PINS_PER_CELL)]
+    write_long_line(lines, [f".subckt {TOP_CELL_NAME}"] + top_ports)
+    for pin in range(PINS_PER_CELL):
+        lines.append(f"*.ipin P{pin}")
+    for cell in range(SUB_CELLS):
+        for instance in range(INSTANCES_PER_SUB_CELL):
+            write_long_line(lines, [f"xU{cell}I{instance}"] + [f"N{cell}_{pin}" for pin in range(PINS_PER_CELL)]
+                            + [f"SUB{cell}"])
+    lines.append(".ends")
+
+    # Sub cells
+    for cell in range(SUB_CELLS):
+        lines.append("")
+        lines.append(f"* expanding   symbol:  SUB{cell}.sym # of pins={PINS_PER_CELL}")
+        write_long_line(lines, [f".subckt SUB{cell}"] + [f"A{pin}" for pin in range(PINS_PER_CELL)])
+        for pin in range(PINS_PER_CELL):
+            lines.append(f"*.iopin A{pin}")
+        for transistor in range(TRANSISTORS_PER_CELL):
+            layout_name = "JNWATR_NCH_4C5F0" if transistor % 2 else "JNWATR_PCH_4C5F0"
+            lines.append(f"xMN{transistor} D{transistor} G{transistor} A0 A1 {layout_name}")
+        for resistor in range(RESISTORS_PER_CELL):
+            lines.append(f"xRH{resistor} R{resistor} A2 A1 JNWTR_RPPO4")
+        for capacitor in range(CAPACITORS_PER_CELL):
+            lines.append(f"xCM{capacitor} C{capacitor} A3 JNWTR_CAPX1")
+        lines.append(".ends")
+
+    # Expanded library symbols
+    for layout_name, ports in LIBRARY_SUBCIRCUITS.items():
+        lines.append("")
+        lines.append(f"* expanding   symbol:  {layout_name}.sym # of pins={len(ports.split())}")
+        lines.append(f".subckt {layout_name} {ports}")
+        lines.extend(f"*.iopin {port}" for port in ports.split())
+        lines.append(".ends")
+
+    lines.append(".end")
+    return "\n".join(lines) + "\n"
+
+# ===================================================== Main ===========================================================
+
+
+def main():
+    with tempfile.TemporaryDirectory() as project_directory:
+        os.makedirs(f"{project_directory}/work/xsch")
+
+        # Keep the SPICE file generation step a no-op
+        with open(f"{project_directory}/work/Makefile", "w") as makefile:
+            makefile.write("xsch:\n\t@true\n")
+
+        netlist = generate_netlist()
+        with open(f"{project_directory}/work/xsch/{TOP_CELL_NAME}.spice", "w") as spice_file:
+            spice_file.write(netlist)
+
+        project_properties = ProjectProperties(
+            directory=project_directory,
+            top_cell_name=TOP_CELL_NAME,
+            top_lib_name="BENCH_LIB",
+            component_libraries=[ComponentLibrary(name="JNWATR", path="/bench/design/JNW_ATR_SKY130A"),
+                                 ComponentLibrary(name="JNWTR", path="/bench/design/JNW_TR_SKY130A")])
+
+        run_times = []
+        parse_times = []
+        components = []
+        for _ in range(RUNS):
+            start_time = time.perf_counter()
+            spice_parser = SPICEparser(project_properties=project_properties)
+            parse_times.append(time.perf_counter() - start_time)
+            components = spice_parser.get()
+            run_times.append(time.perf_counter() - start_time)
+
+        component_counts = {component_type.__name__: sum(isinstance(component, component_type)
+                                                         for component in components)
+                            for component_type in (CircuitCell, Transistor, Resistor, Capacitor, Pin)}
+
+        print(f"Netlist lines: {netlist.count(chr(10))} | Components: {len(components)} | {component_counts}")
+        print(f"Distinct cells: {len(spice_parser.get_hierarchy())} | Best hierarchical parse: {min(parse_times):.3f} s")
+        print(f"Runs: {RUNS} | Best: {min(run_times):.3f} s | Mean: {sum(run_times) / len(run_times):.3f} s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,187 @@
+# ==================================================================================================================== #
+# Copyright (C) 2025 Bjørn K.T. Solheim, Leidulv Tønnesland
+# ==================================================================================================================== #
+# This program is free software: you can redistribute it and/or modify it under the terms of
+# the GNU General Public License as published by the Free Software Foundation, version 2.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with this program.
+# If not, see <https://www.gnu.org/licenses/>.
+# ==================================================================================================================== #
+
+# ==================================================== Notes ===========================================================
+"""
+    Schedules DRC and LVS so they overlap with writing the magic files, the last step of layout generation after
+    placement and routing. An asyncio event loop runs on a background thread. Each cell is checked once the magic
+    layout creator reports its file and the files of all top library cells it uses as final, while other cells are
+    still being written. Cells are written top cell first, so a cell waits for its sub cells instead of being checked
+    against missing or old ones. Cells using top library cells that are not written in this run are checked when the
+    layout creator is done. Per cell DRC and per cell LVS store their results in their caches, so the full DRC and
+    LVS at the end only have to check cells that changed after their early check.
+
+    The full DRC and LVS run at the same time when the DRC only runs Magic per cell, which writes nothing but its own
+    logs. The standard project DRC 'make drc' and 'make cdl lvsall' both run in the work directory, so they run one
+    after the other. Cell checks only run when per cell DRC or per cell LVS is turned on, as the top cell checks can
+    not be split up otherwise.
+"""
+
+# ================================================== Libraries =========================================================
+import os
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import drc.drc_checker as drc_checker
+from drc.drc_checker import DRCchecking
+from drc.drc_cell_orchestrator import DRCCellOrchestrator, USE_PATTERN
+from lvs.lvs_checker import LVSchecking
+from logger.logger import get_a_logger
+from config.config_loader import get_config
+
+# ============================================ Verification scheduler ==================================================
+
+
+class VerificationScheduler:
+    logger = get_a_logger(__name__)
+
+    def __init__(self, project_properties):
+        self.project_properties = project_properties
+
+        self.config = get_config()
+        self.CHECK_CELLS_DURING_LAYOUT = self.config["verification_scheduler"]["CHECK_CELLS_DURING_LAYOUT"]
+        self.WORKERS = self.config["verification_scheduler"]["WORKERS"]
+        self.PER_CELL_DRC = self.config["drc_checker"]["PER_CELL_DRC"]
+        self.STANDARD_DRC_LOGS = self.config["drc_checker"]["STANDARD_DRC_LOGS"]
+        self.MAGIC_EXECUTABLE = self.config["drc_checker"]["MAGIC_EXECUTABLE"]
+        self.PER_CELL_LVS = self.config["lvs_checker"]["PER_CELL_LVS"]
+
+        self.tcl_script_path = os.path.join(os.path.dirname(os.path.abspath(drc_checker.__file__)), "log_drc_info.tcl")
+        self.design_directory = os.path.normpath(os.path.expanduser(f"{project_properties.directory}/design/"
+                                                                    f"{project_properties.top_lib_name}"))
+        self.written_cell_paths = set()
+        self.waiting_cells = {}  # Cell path: (cell name, paths of the top library cells it uses)
+        self.cell_futures = []
+        self.cell_futures_lock = threading.Lock()
+        self.total_cells_checked = 0
+
+        # Blocking checks run on the default executor of the event loop, which limits the number of checks at once
+        self.loop = asyncio.new_event_loop()
+        self.loop.set_default_executor(ThreadPoolExecutor(max_workers=max(1, self.WORKERS)))
+        self.thread = threading.Thread(target=self.loop.run_forever, name="verification", daemon=True)
+        self.thread.start()
+
+    # ------------------------------------------------ Cell checks ----------------------------------------------------
+
+    def __get_used_cell_paths(self, path: str) -> set[str]:
+        """Returns the paths of the top library cells used by a magic file"""
+        used_cell_paths = set()
+        try:
+            with open(path, "r", errors="replace") as magic_file:
+                for line in magic_file:
+                    use = USE_PATTERN.match(line)
+                    if not use:
+                        continue
+
+                    name, library = use.groups()
+                    cell_directory = os.path.normpath(os.path.join(os.path.dirname(path), library or ""))
+                    if cell_directory == self.design_directory:
+                        used_cell_paths.add(os.path.join(cell_directory, f"{name}.mag"))
+        except OSError as e:
+            self.logger.warning(f"Cells used by '{path}' could not be read: {e}")
+        return used_cell_paths
+
+    def __start_cell_check(self, cell: str, path: str):
+        future = asyncio.run_coroutine_threadsafe(self.__check_cell(cell=cell, path=path), self.loop)
+        self.cell_futures.append(future)
+
+    def cell_written(self, cell: str, path: str):
+        """Starts the checks of a cell with a final magic file once all top library cells it uses are written too.
+        Safe to call from any thread"""
+        if not self.CHECK_CELLS_DURING_LAYOUT or not (self.PER_CELL_DRC or self.PER_CELL_LVS):
+            return
+
+        path = os.path.normpath(path)
+        used_cell_paths = self.__get_used_cell_paths(path=path)
+
+        with self.cell_futures_lock:
+            self.written_cell_paths.add(path)
+            self.waiting_cells[path] = (cell, used_cell_paths)
+
+            # A cell is ready when the cells it uses are written and ready too, so starting one can make its parents
+            # ready
+            ready_paths = [path]
+            while ready_paths:
+                ready_paths = [waiting_path for waiting_path, (_, waiting_used_cell_paths) in self.waiting_cells.items()
+                               if waiting_used_cell_paths <= self.written_cell_paths
+                               and waiting_used_cell_paths.isdisjoint(self.waiting_cells)]
+                for ready_path in ready_paths:
+                    ready_cell, _ = self.waiting_cells.pop(ready_path)
+                    self.__start_cell_check(cell=ready_cell, path=ready_path)
+
+    def __check_cell_drc(self, path: str) -> bool:
+        return DRCCellOrchestrator(project_properties=self.project_properties, tcl_script_path=self.tcl_script_path,
+                                   magic_executable=self.MAGIC_EXECUTABLE, workers=1).check_cell(path=path)
+
+    def __check_cell_lvs(self, cell: str) -> bool:
+        return LVSchecking(project_properties=self.project_properties, cells=[cell]).get().clean
+
+    async def __check_cell(self, cell: str, path: str):
+        checks = []
+        if self.PER_CELL_DRC:
+            checks.append(asyncio.to_thread(self.__check_cell_drc, path))
+        if self.PER_CELL_LVS:
+            checks.append(asyncio.to_thread(self.__check_cell_lvs, cell))
+
+        results = await asyncio.gather(*checks, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                self.logger.error(f"Check of cell '{cell}' during layout generation failed with {result!r}")
+
+        self.total_cells_checked += 1
+
+    # ------------------------------------------------- Top checks ----------------------------------------------------
+
+    async def __check_top_cell(self) -> tuple:
+        run_standard_drc = not self.PER_CELL_DRC or self.STANDARD_DRC_LOGS
+
+        def run_drc():
+            return DRCchecking(project_properties=self.project_properties)
+
+        def run_lvs():
+            return LVSchecking(project_properties=self.project_properties)
+
+        if run_standard_drc:
+            self.logger.info("Full DRC runs 'make drc', so it runs before LVS instead of at the same time")
+            drc, = await asyncio.gather(self.loop.run_in_executor(None, run_drc), return_exceptions=True)
+            lvs, = await asyncio.gather(self.loop.run_in_executor(None, run_lvs), return_exceptions=True)
+        else:
+            drc, lvs = await asyncio.gather(self.loop.run_in_executor(None, run_drc),
+                                            self.loop.run_in_executor(None, run_lvs), return_exceptions=True)
+
+        for name, result in (("DRC", drc), ("LVS", lvs)):
+            if isinstance(result, Exception):
+                self.logger.error(f"{name} of top cell failed with {result!r}")
+        return drc, lvs
+
+    def finish(self) -> tuple:
+        """Waits for all cell checks, runs the full DRC and LVS and stops the event loop"""
+        with self.cell_futures_lock:
+            # Top library cells still waited for were not written in this run, so the files on disk are final
+            for path, (cell, _) in self.waiting_cells.items():
+                self.__start_cell_check(cell=cell, path=path)
+            self.waiting_cells.clear()
+            cell_futures = list(self.cell_futures)
+        for future in cell_futures:
+            future.result()
+
+        self.logger.info(f"Cell checks during layout generation done. | Cells checked: {self.total_cells_checked}")
+
+        try:
+            return asyncio.run_coroutine_threadsafe(self.__check_top_cell(), self.loop).result()
+        finally:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self.thread.join()
+            self.loop.run_until_complete(self.loop.shutdown_default_executor())
+            self.loop.close()